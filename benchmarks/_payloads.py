@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Synthetic API payloads for the benchmarks and the tests."""
+
+import collections.abc
+import dataclasses
+import datetime
+import random
+import typing
+
+from typing import Any, Dict
+
+from omegaup import _decoder
+
+
+def sample(tp: Any,
+           rnd: random.Random,
+           list_size: int = 3,
+           none_probability: float = 0.0) -> Any:
+    """Returns a random JSON value that decodes into type `tp`.
+
+    Optional fields are `None` with probability `none_probability`, and
+    sequences and mappings have `list_size` entries.
+    """
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Union:
+        if _decoder._NoneType in args and rnd.random() < none_probability:
+            return None
+        non_null = [arg for arg in args if arg is not _decoder._NoneType]
+        return sample(rnd.choice(non_null), rnd, list_size, none_probability)
+    if origin is collections.abc.Sequence:
+        return [
+            sample(args[0], rnd, list_size, none_probability)
+            for _ in range(list_size)
+        ]
+    if origin is dict:
+        return {
+            str(i): sample(args[1], rnd, list_size, none_probability)
+            for i in range(list_size)
+        }
+    if dataclasses.is_dataclass(tp):
+        return payload(typing.cast(type, tp), rnd, list_size,
+                       none_probability)
+    if tp is datetime.datetime:
+        return rnd.randint(1500000000, 1700000000)
+    if tp is int:
+        return rnd.randint(0, 1000)
+    if tp is float:
+        return rnd.random()
+    if tp is bool:
+        return rnd.random() < 0.5
+    return rnd.choice(('MX', 'AC', 'cpp17-gcc', 'user-rank-unranked'))
+
+
+def payload(cls: type,
+            rnd: random.Random,
+            list_size: int = 3,
+            none_probability: float = 0.0) -> Dict[str, Any]:
+    """Returns a random JSON object that decodes into `cls`."""
+    hints = typing.get_type_hints(cls)
+    return {
+        _decoder._json_key(field.name): sample(hints[field.name], rnd,
+                                               list_size, none_probability)
+        for field in dataclasses.fields(cls)
+    }
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Compares omegaup.codec against pickle and JSON."""
+
+import argparse
+import json
+import pickle
+import random
+import timeit
+
+from typing import Any, Callable, Tuple
+
+import omegaup.api
+import omegaup.codec
+from omegaup import _decoder
+
+import _payloads
+
+_TYPES = (
+    omegaup.api._Scoreboard,
+    omegaup.api._ProblemDetails,
+    omegaup.api._CourseDetails,
+)
+
+
+def _time(fn: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--list-size', type=int, default=10)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    print(f'{"type":<20} {"method":<16} {"encode":>10} {"decode":>10} '
+          f'{"size":>10}')
+    for cls in _TYPES:
+        value = _payloads.payload(cls, rnd, args.list_size)
+        obj: Any = _decoder.decode(cls, value)
+        methods: Tuple[Tuple[str, Callable[[], bytes],
+                             Callable[[bytes], Any]], ...] = (
+            ('json', lambda: json.dumps(value).encode('utf-8'),
+             lambda data: _decoder.decode(cls, json.loads(data))),
+            ('pickle', lambda: pickle.dumps(obj, protocol=5), pickle.loads),
+            ('codec[pickle]',
+             lambda: omegaup.codec.to_bytes(obj, format='pickle'),
+             lambda data: omegaup.codec.from_bytes(cls, data)),
+        )
+        if 'msgpack' in omegaup.codec.FORMATS:
+            methods += (('codec[msgpack]',
+                         lambda: omegaup.codec.to_bytes(obj, format='msgpack'),
+                         lambda data: omegaup.codec.from_bytes(cls, data)), )
+        for name, encode, decode in methods:
+            data = encode()
+            assert decode(data) == obj
+            print(f'{cls.__name__:<20} {name:<16} '
+                  f'{_time(encode, args.number) * 1e6:>8.1f}us '
+                  f'{_time(lambda: decode(data), args.number) * 1e6:>8.1f}us '
+                  f'{len(data):>10}')
+
+
+if __name__ == '__main__':
+    main()
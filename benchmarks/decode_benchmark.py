@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Compares the generated constructors against the compiled decoders."""
+
+import argparse
+import random
+import timeit
+
+from typing import Any, Callable
+
+import omegaup.api
+from omegaup import _decoder
+
+import _payloads
+
+_TYPES = (
+    omegaup.api._ProblemDetails,
+    omegaup.api._Scoreboard,
+    omegaup.api._CourseDetails,
+    omegaup.api._ContestAdminDetails,
+)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--list-size', type=int, default=10)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    print(f'{"type":<32} {"constructor":>12} {"decoder":>12} {"speedup":>8}')
+    for cls in _TYPES:
+        value = _payloads.payload(cls, rnd, args.list_size)
+        assert cls(**value) == _decoder.decode(cls, value)
+        decode: Callable[..., Any] = _decoder.decoder(cls)
+        constructor = min(
+            timeit.repeat(lambda: cls(**value), number=args.number,
+                          repeat=5)) / args.number
+        compiled = min(
+            timeit.repeat(lambda: decode(value), number=args.number,
+                          repeat=5)) / args.number
+        print(f'{cls.__name__:<32} {constructor * 1e6:>10.1f}us '
+              f'{compiled * 1e6:>10.1f}us {constructor / compiled:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
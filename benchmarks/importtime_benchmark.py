@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Measures how long `import omegaup.api` takes with `python -X importtime`.
+
+Exits with a non-zero status if the median self time of the `omegaup.api`
+modules that are loaded on import exceeds `--max-ms`, which makes it usable
+as a regression guard.
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+from typing import Dict
+
+_IMPORTTIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)$')
+
+
+def _measure(module: str) -> Dict[str, int]:
+    """Returns the self time of each omegaup module, in microseconds."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stderr
+    result: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match and match.group(3).startswith('omegaup'):
+            result[match.group(3)] = int(match.group(1))
+    return result
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--module', default='omegaup.api')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=50.0)
+    args = parser.parse_args()
+
+    samples = [_measure(args.module) for _ in range(args.repeat)]
+    total = statistics.median(sum(sample.values()) for sample in samples)
+    for module in sorted(samples[0]):
+        median = statistics.median(sample.get(module, 0) for sample in samples)
+        print(f'{module:<32} {median / 1000:>8.2f}ms')
+    print(f'{"total":<32} {total / 1000:>8.2f}ms')
+    if total / 1000 > args.max_ms:
+        print(f'import time exceeds {args.max_ms}ms', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
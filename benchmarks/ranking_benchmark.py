@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Measures omegaup.scoreboard.ranking on large scoreboards."""
+
+import argparse
+import timeit
+
+import numpy  # type: ignore
+
+from omegaup.scoreboard import ranking
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contestants', type=int, default=50000)
+    parser.add_argument('--problems', type=int, default=15)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = numpy.random.default_rng(0)
+    shape = (args.contestants, args.problems)
+    scores = rng.choice([0.0, 0.25, 0.5, 1.0], size=shape)
+    points = numpy.full(args.problems, 100.0)
+    times = rng.uniform(0, 5 * 60 * 60, size=shape)
+    wrong = rng.integers(0, 5, size=shape)
+    print(f'{"rules":<40} {"time":>10}')
+    for rules in (
+            ranking.Rules(),
+            ranking.Rules(score_mode='all_or_nothing', penalty=20),
+            ranking.Rules(penalty_calc_policy='max'),
+            ranking.Rules(points_decay_factor=0.7, duration=5 * 60 * 60),
+    ):
+        elapsed = min(
+            timeit.repeat(lambda: ranking.rank(scores,
+                                               points=points,
+                                               times=times,
+                                               wrong=wrong,
+                                               rules=rules),
+                          number=args.number,
+                          repeat=5)) / args.number
+        description = (f'{rules.score_mode}/{rules.penalty_calc_policy}/'
+                       f'{rules.points_decay_factor}')
+        print(f'{description:<40} {elapsed * 1e3:>8.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Measures omegaup.scoreboard.resolver on large frozen scoreboards."""
+
+import argparse
+import random
+import timeit
+
+from typing import Any, Dict, List
+
+import omegaup.api
+from omegaup import _decoder
+from omegaup.scoreboard import resolver
+
+
+def _entry(username: str, cells: List[float]) -> Dict[str, Any]:
+    return {
+        'classname': 'user-rank-unranked',
+        'country': 'MX',
+        'is_invited': True,
+        'name': None,
+        'problems': [{
+            'alias': f'p{column}',
+            'penalty': 0,
+            'percent': points,
+            'points': points,
+            'runs': 1 if points else 0,
+        } for column, points in enumerate(cells)],
+        'total': {
+            'penalty': 0,
+            'points': sum(cells),
+        },
+        'username': username,
+    }
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contestants', type=int, default=1000)
+    parser.add_argument('--problems', type=int, default=15)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    ranking: List[Dict[str, Any]] = []
+    events: List[Dict[str, Any]] = []
+    for i in range(args.contestants):
+        username = f'user{i}'
+        cells = [rng.choice([0.0, 100.0]) for _ in range(args.problems)]
+        ranking.append(_entry(username, cells))
+        total = sum(cells)
+        for column, points in enumerate(cells):
+            # Every cell without points is solved during the freeze.
+            if points:
+                continue
+            total += 100.0
+            events.append({
+                'classname': 'user-rank-unranked',
+                'country': 'MX',
+                'delta': 240 + rng.random() * 60,
+                'is_invited': True,
+                'problem': {
+                    'alias': f'p{column}',
+                    'penalty': 0,
+                    'points': 100.0,
+                },
+                'total': {
+                    'penalty': 0,
+                    'points': total,
+                },
+                'username': username,
+            })
+    frozen = _decoder.decode(
+        omegaup.api._Scoreboard, {
+            'problems': [{
+                'alias': f'p{column}',
+                'order': column + 1
+            } for column in range(args.problems)],
+            'ranking': ranking,
+            'start_time': 1600000000,
+            'time': 1600018000,
+            'title': 'Contest',
+        })
+    decoded_events = [
+        _decoder.decode(omegaup.api._ScoreboardEvent, event)
+        for event in events
+    ]
+
+    def _resolve() -> resolver.Resolver:
+        # The last hour is frozen.
+        return resolver.Resolver(frozen,
+                                 decoded_events,
+                                 freeze_time=1600014400)
+
+    elapsed = min(timeit.repeat(_resolve, number=args.number,
+                                repeat=3)) / args.number
+    print(f'{args.contestants}x{args.problems}, {len(events)} hidden cells: '
+          f'{elapsed * 1e3:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,6 @@
 """A library to help interacting with omegaUp.
 
-This is composed of two modules:
+This is composed of the following modules:
 
 - [**`omegaup.api`**](./omegaup/api/) helps interacting with [omegaUp's
   API](https://github.com/omegaup/omegaup/blob/master/frontend/server/src/Controllers/README.md)
@@ -8,4 +8,24 @@ This is composed of two modules:
   code.
 - [**`omegaup.validator`**](./omegaup/validator/) has runtime helper functions
   to aid in problem validation.
+- [**`omegaup.export`**](./omegaup/export/) writes API responses to
+  Parquet or Feather files. Requires the optional `pyarrow` dependency.
+- [**`omegaup.codec`**](./omegaup/codec/) serializes API responses into a
+  compact binary format for caching.
+- [**`omegaup.catalog`**](./omegaup/catalog/) fetches the whole problem
+  catalog with concurrent requests.
+- [**`omegaup.runsync`**](./omegaup/runsync/) incrementally synchronizes the
+  runs of contests and courses into a local SQLite database.
+- [**`omegaup.mirror`**](./omegaup/mirror/) keeps an indexed local SQLite
+  mirror of the contest catalog.
+- [**`omegaup.problemindex`**](./omegaup/problemindex/) answers problem
+  search and typeahead queries from an in-memory index of the catalog.
+- [**`omegaup.userindex`**](./omegaup/userindex/) answers user typeahead
+  queries from a local prefix index of contest, course and group members.
+- [**`omegaup.clarifications`**](./omegaup/clarifications/) notifies
+  subscribers of new and updated clarifications of a contest or course.
+- [**`omegaup.notifications`**](./omegaup/notifications/) polls and
+  acknowledges the notifications of many identities from one process.
+- [**`omegaup.scoreboard`**](./omegaup/scoreboard/) computes and updates
+  scoreboards locally.
 """
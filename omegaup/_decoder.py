@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""Specialized decoders for the generated `omegaup.api` response types.
+
+The generated types have keyword-only constructors that accept (and ignore)
+arbitrary extra arguments, which makes decoding a response pay for building
+a `**kwargs` dictionary, an unknown-key dictionary and one `is not None`
+branch per field, for every single object.
+
+This module compiles, on first use, a straight-line decoding function for
+each type from its type annotations. The function reads the fields straight
+out of the JSON object into the instance attributes, and it calls the compiled
+decoders of the nested types directly.
+
+Timestamps are converted according to one of the `TIMESTAMP_POLICIES`, which
+is chosen per `omegaup.api.Client`:
+
+- `'local'` (the default) produces naive `datetime.datetime` objects in local
+  time, the same as the constructors of the generated types.
+- `'utc'` produces timezone-aware `datetime.datetime` objects in UTC. These
+  are built by a cached converter and shared between objects, which is
+  cheaper when many objects carry the same timestamps.
+- `'epoch'` keeps the timestamps as the integer number of seconds since the
+  epoch that the API returned, which skips the conversion altogether.
+
+Strings that repeat across the objects of a response are shared. The values
+of the low-cardinality `INTERNED_FIELDS` (verdicts, statuses, languages...)
+are interned with `sys.intern`. The values of the `DEDUPED_FIELDS`
+(usernames, aliases...) are unbounded, and interned strings are never freed
+on recent Python versions, so those are only shared within a response
+through a dictionary that is dropped along with the decoding call. Streamed
+responses clear that dictionary every `_STREAM_MEMO_SIZE` strings, so their
+memory use does not grow with the length of the stream.
+"""
+
+import collections.abc
+import dataclasses
+import datetime
+import functools
+import keyword
+import sys
+import threading
+import typing
+
+from typing import (Any, Callable, Dict, Iterable, Iterator, Mapping,
+                    Optional, Tuple, Type, TypeVar)
+
+T = TypeVar('T')
+
+_NoneType = type(None)
+"""The type of `None`, as it appears in the arguments of `Optional`."""
+
+Decoder = Callable[..., Any]
+"""A function that converts a decoded JSON object into a generated type.
+
+It takes the object and, optionally, the dictionary that is used to share
+the `DEDUPED_FIELDS` strings between the objects of the same response.
+"""
+
+INTERNED_FIELDS = frozenset((
+    'classname',
+    'country',
+    'country_id',
+    'language',
+    'status',
+    'verdict',
+))
+"""The names of the string fields whose values are interned when decoded."""
+
+DEDUPED_FIELDS = frozenset((
+    'alias',
+    'contest_alias',
+    'problem_alias',
+    'username',
+))
+"""The names of the string fields whose values are shared per response."""
+
+TIMESTAMP_POLICIES = ('local', 'utc', 'epoch')
+"""The supported ways of decoding timestamps."""
+
+_STREAM_MEMO_SIZE = 4096
+"""The number of `DEDUPED_FIELDS` strings shared while decoding a stream."""
+
+_DECODERS: Dict[Tuple[type, str], Decoder] = {}
+_LOCK = threading.RLock()
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _utcfromtimestamp(value: int) -> datetime.datetime:
+    """Returns a timezone-aware UTC datetime for a timestamp."""
+    return datetime.datetime.fromtimestamp(value, datetime.timezone.utc)
+
+
+def epoch(value: Any) -> int:
+    """Returns the number of seconds since the epoch for a timestamp.
+
+    Accepts timestamps decoded under any of the `TIMESTAMP_POLICIES`.
+    """
+    if isinstance(value, datetime.datetime):
+        return int(value.timestamp())
+    return int(value)
+
+
+def advance(value: Any, seconds: float) -> Any:
+    """Returns the timestamp `seconds` after `value`.
+
+    The result is decoded under the same policy as `value`.
+    """
+    if isinstance(value, datetime.datetime):
+        return value + datetime.timedelta(seconds=seconds)
+    return int(value + seconds)
+
+
+def timestamp_converter(timestamps: str) -> Optional[Callable[[Any], Any]]:
+    """Returns the function that converts timestamps under a policy.
+
+    Returns `None` if timestamps are kept as-is.
+    """
+    if timestamps == 'local':
+        return datetime.datetime.fromtimestamp
+    if timestamps == 'utc':
+        return _utcfromtimestamp
+    if timestamps == 'epoch':
+        return None
+    raise ValueError(f'Unsupported timestamp policy: {timestamps!r}')
+
+
+def decoder(cls: Type[T],
+            timestamps: str = 'local') -> Callable[..., T]:
+    """Returns the compiled decoder for `cls`, compiling it if needed.
+
+    Args:
+        cls: The generated type.
+        timestamps: One of `TIMESTAMP_POLICIES`.
+
+    Returns:
+        A function that converts a decoded JSON object into a `cls`. See
+        `Decoder`.
+    """
+    try:
+        return _DECODERS[cls, timestamps]
+    except KeyError:
+        pass
+    with _LOCK:
+        if (cls, timestamps) not in _DECODERS:
+            _DECODERS[cls, timestamps] = _compile(cls, timestamps)
+        return _DECODERS[cls, timestamps]
+
+
+def decode(cls: Type[T],
+           value: Mapping[str, Any],
+           *,
+           timestamps: str = 'local') -> T:
+    """Decodes a JSON object into an instance of `cls`."""
+    return decoder(cls, timestamps)(value)
+
+
+def decode_each(cls: Type[T],
+                values: Iterable[Mapping[str, Any]],
+                *,
+                timestamps: str = 'local') -> Iterator[T]:
+    """Decodes the JSON objects of one response into instances of `cls`.
+
+    Unlike mapping `decoder()` over `values`, the `DEDUPED_FIELDS` strings
+    are shared between all the objects.
+    """
+    decode_one = decoder(cls, timestamps)
+    memo: Dict[str, str] = {}
+    for value in values:
+        yield decode_one(value, memo)
+
+
+def decode_stream(cls: Type[T],
+                  values: Iterable[Mapping[str, Any]],
+                  *,
+                  timestamps: str = 'local') -> Iterator[T]:
+    """Decodes the JSON objects of a streamed response into instances of `cls`.
+
+    Like `decode_each()`, but the `DEDUPED_FIELDS` strings are only shared
+    until `_STREAM_MEMO_SIZE` of them have been seen, so the memory used does
+    not grow with the length of the stream.
+    """
+    decode_one = decoder(cls, timestamps)
+    memo: Dict[str, str] = {}
+    for value in values:
+        if len(memo) >= _STREAM_MEMO_SIZE:
+            memo.clear()
+        yield decode_one(value, memo)
+
+
+def _json_key(name: str) -> str:
+    """Returns the JSON key of a field.
+
+    Fields whose name is a Python keyword have an underscore appended.
+    """
+    if name.endswith('_') and keyword.iskeyword(name[:-1]):
+        return name[:-1]
+    return name
+
+
+class _Compiler:
+    """Generates the source code of a single decoder."""
+    def __init__(self, timestamps: str) -> None:
+        self.namespace: Dict[str, Any] = {
+            '_fromtimestamp': timestamp_converter(timestamps),
+            '_intern': sys.intern,
+        }
+        self.timestamps = timestamps
+        self._counter = 0
+        # Whether the decoder reads or passes on the dictionary of shared
+        # strings, which is only created when it does.
+        self._uses_memo = False
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f'{prefix}{self._counter}'
+
+    def expression(self,
+                   tp: Any,
+                   var: str,
+                   convert_str: Optional[str] = None) -> Optional[str]:
+        """Returns an expression that converts `var` into type `tp`.
+
+        If `convert_str` is provided, it is the format of the expression that
+        is applied to `str` values, with `{0}` standing for the value.
+        Returns `None` if the value can be used as-is.
+        """
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if origin is typing.Union:
+            non_null = [arg for arg in args if arg is not _NoneType]
+            if len(non_null) != 1:
+                return None
+            inner = self.expression(non_null[0], var, convert_str)
+            if inner is None:
+                return None
+            return f'(None if {var} is None else {inner})'
+        if origin is collections.abc.Sequence:
+            item = self._name('v')
+            inner = self.expression(args[0], item)
+            if inner is None:
+                return None
+            return f'[{inner} for {item} in {var}]'
+        if origin is dict:
+            key = self._name('k')
+            item = self._name('v')
+            inner = self.expression(args[1], item)
+            if inner is None:
+                return None
+            return f'{{{key}: {inner} for {key}, {item} in {var}.items()}}'
+        if dataclasses.is_dataclass(tp):
+            name = self._name('_decode')
+            self.namespace[name] = decoder(typing.cast(type, tp),
+                                           self.timestamps)
+            self._uses_memo = True
+            return f'{name}({var}, m)'
+        if tp is datetime.datetime:
+            if self.namespace['_fromtimestamp'] is None:
+                return None
+            return f'_fromtimestamp({var})'
+        if tp is str and convert_str is not None:
+            return convert_str.format(var)
+        return None
+
+    def compile(self, cls: type) -> Decoder:
+        """Compiles the decoder for `cls`."""
+        hints = typing.get_type_hints(cls)
+        self.namespace['_new'] = object.__new__
+        self.namespace['_cls'] = cls
+        lines = [
+            'def _decode(d, m=None):',
+            '    o = _new(_cls)',
+            '    get = d.get',
+        ]
+        for field in dataclasses.fields(cls):
+            tp = hints[field.name]
+            key = _json_key(field.name)
+            optional = _NoneType in typing.get_args(tp)
+            getter = f'get({key!r})' if optional else f'd[{key!r}]'
+            var = self._name('f')
+            convert_str: Optional[str] = None
+            if field.name in INTERNED_FIELDS:
+                convert_str = '_intern({0})'
+            elif field.name in DEDUPED_FIELDS:
+                convert_str = 'm.setdefault({0}, {0})'
+                self._uses_memo = True
+            converted = self.expression(tp, var, convert_str)
+            if converted is None:
+                lines.append(f'    o.{field.name} = {getter}')
+            else:
+                lines.append(f'    {var} = {getter}')
+                lines.append(f'    o.{field.name} = {converted}')
+        lines.append('    return o')
+        if self._uses_memo:
+            lines[1:1] = ['    if m is None:', '        m = {}']
+        source = '\n'.join(lines)
+        exec(compile(source, f'<decoder {cls.__qualname__}>', 'exec'),
+             self.namespace)
+        result: Decoder = self.namespace['_decode']
+        return result
+
+
+def _compile(cls: type, timestamps: str) -> Decoder:
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f'{cls!r} is not a generated type')
+    return _Compiler(timestamps).compile(cls)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Incremental decoding of large JSON API responses.
+
+omegaUp list endpoints return a single JSON object with one large array
+member (e.g. `{"runs": [...], "totalRuns": 12345}`). `iter_array()` reads such
+a response one chunk at a time and yields every element of the array as soon
+as its closing delimiter arrives, so only the current element and the unread
+part of the current chunk are ever held in memory.
+
+Each element (and every other top-level member) is still decoded by the C
+scanner of the standard `json` module; this module only finds where values
+start and gives up when a value has not been fully received yet.
+"""
+
+import codecs
+import json
+import re
+
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# The characters that can follow a complete value.
+_DELIMITERS = frozenset(',:]} \t\n\r')
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    """A buffered reader over an iterable of byte chunks."""
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Reads the next chunk into the buffer.
+
+        Returns False if there was no more data to be read.
+        """
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._decoder.decode(b'', final=True)
+        self._eof = True
+        return True
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it.
+
+        Returns the empty string at the end of the input.
+        """
+        while True:
+            match = _WHITESPACE.match(self._buffer, self._pos)
+            assert match is not None  # The pattern matches the empty string.
+            self._pos = match.end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, token: str) -> None:
+        """Consumes `token`, which must be the next non-whitespace character."""
+        found = self.peek()
+        if found != token:
+            raise json.JSONDecodeError(f'Expecting {token!r}', self._buffer,
+                                       self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decodes and consumes the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                result, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            if (end == len(self._buffer)
+                    or self._buffer[end] not in _DELIMITERS):
+                # Numbers and literals can be split across chunks (e.g.
+                # `1.` and `5`), so a value is only complete once the
+                # delimiter that follows it has been read.
+                if self._fill():
+                    continue
+            self._pos = end
+            return result
+
+
+def iter_array(chunks: Iterable[bytes],
+               key: str,
+               members: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """Yields the elements of one array member of a JSON object.
+
+    Args:
+        chunks: The response body, as an iterable of byte chunks.
+        key: The name of the top-level member that holds the array.
+        members: If provided, every other top-level member of the object is
+            stored in this dictionary as it is decoded.
+
+    Yields:
+        The decoded elements of the array, in order.
+    """
+    reader = _Reader(chunks)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        name = reader.value()
+        reader.expect(':')
+        if name == key:
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.peek() == ']':
+                        reader.expect(']')
+                        break
+                    reader.expect(',')
+        else:
+            value = reader.value()
+            if members is not None:
+                members[name] = value
+        if reader.peek() == '}':
+            reader.expect('}')
+            return
+        reader.expect(',')
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Automatic pagination of list endpoints.
+
+Many omegaUp endpoints return one page of results at a time, selected by a
+page index parameter (`offset` or `page`) and a page size parameter
+(`rowcount`, `page_size` or `pageSize`). `pages()` walks all of them and, while
+the caller is busy with one page, requests the next one from a background
+thread so that the network round trip overlaps with the processing.
+
+Iteration stops after a page that is shorter than the page size, that is
+empty, or that brings the number of items seen up to the total reported by
+the response.
+"""
+
+import concurrent.futures
+import contextlib
+
+from typing import Any, Callable, Generator, Iterator, Optional, Sequence
+
+DEFAULT_PAGE_SIZE = 100
+"""The default number of items requested per page.
+
+Larger pages mean fewer round trips at the cost of higher latency for the
+first item, which prefetching mostly hides for the rest of them.
+"""
+
+
+def pages(fetch: Callable[..., Any],
+          *,
+          items: str,
+          page: str,
+          page_size: str,
+          first_page: int,
+          size: int = DEFAULT_PAGE_SIZE,
+          total: Optional[str] = None,
+          prefetch: bool = True) -> Generator[Sequence[Any], None, None]:
+    """Yields every page of a paginated endpoint.
+
+    Args:
+        fetch: The API function. It is called with the page index and the
+            page size as keyword arguments.
+        items: The name of the field of the response that holds the items.
+        page: The name of the page index parameter.
+        page_size: The name of the page size parameter.
+        first_page: The index of the first page.
+        size: The number of items requested per page.
+        total: The name of the field of the response that holds the total
+            number of items, if there is one.
+        prefetch: Whether the next page is requested in the background while
+            the current one is being consumed.
+
+    Yields:
+        The items of each page, as returned by the API.
+    """
+    if size <= 0:
+        raise ValueError(f'Invalid page size: {size}')
+
+    def _fetch(index: int) -> Any:
+        return fetch(**{page: index, page_size: size})
+
+    executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    if prefetch:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='omegaup-prefetch')
+    pending: Optional['concurrent.futures.Future[Any]'] = None
+    try:
+        index = first_page
+        seen = 0
+        while True:
+            if pending is None:
+                response = _fetch(index)
+            else:
+                response = pending.result()
+                pending = None
+            current: Sequence[Any] = getattr(response, items)
+            seen += len(current)
+            done = len(current) < size
+            if total is not None and seen >= getattr(response, total):
+                done = True
+            index += 1
+            if not done and executor is not None:
+                pending = executor.submit(_fetch, index)
+            if current:
+                yield current
+            if done:
+                return
+    finally:
+        if executor is not None:
+            # If the caller stopped early, do not wait for the prefetched
+            # page to arrive.
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+
+def items(fetch: Callable[..., Any], **kwargs: Any) -> Iterator[Any]:
+    """Yields every item of a paginated endpoint.
+
+    This takes the same arguments as `pages()`.
+    """
+    with contextlib.closing(pages(fetch, **kwargs)) as it:
+        for page in it:
+            yield from page
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Text normalization for the local search indices."""
+
+import functools
+import re
+import unicodedata
+
+from typing import List
+
+_SEPARATORS = re.compile(r'[\W_]+')
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def normalize(text: str) -> str:
+    """Returns `text` casefolded and without accents or other diacritics."""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits the normalized `text` into words."""
+    return [token for token in _SEPARATORS.split(normalize(text)) if token]
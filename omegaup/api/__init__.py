@@ -0,0 +1,1743 @@
+"""A Python implementation of an omegaUp API client.
+
+The [omegaUp
+API](https://github.com/omegaup/omegaup/blob/master/frontend/server/src/Controllers/README.md)
+allows calling it using an API token (see the docs for `User.createAPIToken`)
+that does not expire.  This API token can then be provided to the `Client`
+constructor, which will then allow accessing the rest of the API functions.
+
+Sample usage:
+
+```python
+import pprint
+
+import omegaup.api
+
+client = omegaup.api.Client(api_token='my API token')
+session = client.session.currentSession()
+pprint.pprint(session)
+```
+
+The controllers and their response types live in private per-controller
+modules that are only imported the first time they are used (e.g. by accessing
+`client.contest` or `omegaup.api.Contest`), so importing this module is cheap.
+
+These modules are generated by `tools/generate_api.py` from the single
+`api.py` emitted by the omegaUp API client generator, which also adds the
+paginated `iter_*` and streaming `stream_*` variants. Do not edit them by
+hand: regenerate them whenever the omegaUp API changes.
+
+The `timestamps` argument of `Client` controls how the timestamps in the
+responses are decoded: `'local'` (the default) produces naive local-time
+`datetime.datetime` objects, `'utc'` produces timezone-aware UTC ones, and
+`'epoch'` keeps the integer number of seconds since the epoch, which is the
+cheapest option when most timestamps are never looked at.
+"""
+import datetime
+import importlib
+import logging
+import urllib.parse
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, List, Mapping, Optional
+
+import requests
+
+from omegaup import _decoder, _jsonstream
+from omegaup.api._base import _DEFAULT_TIMEOUT, _STREAM_CHUNK_SIZE, _filterKeys
+from omegaup.api._base import ApiReturnType as ApiReturnType
+
+if TYPE_CHECKING:
+    from omegaup.api._admin import (  # noqa: F401
+        Admin as Admin,
+        AdminPlatformReportStatsResponse as AdminPlatformReportStatsResponse,
+        _OmegaUp_Controllers_Admin__apiPlatformReportStats as _OmegaUp_Controllers_Admin__apiPlatformReportStats,
+        _OmegaUp_Controllers_Admin__apiPlatformReportStats_report as _OmegaUp_Controllers_Admin__apiPlatformReportStats_report,
+        _OmegaUp_Controllers_Admin__apiPlatformReportStats_report_omiCourse as _OmegaUp_Controllers_Admin__apiPlatformReportStats_report_omiCourse,
+    )
+    from omegaup.api._authorization import (  # noqa: F401
+        Authorization as Authorization,
+        AuthorizationProblemResponse as AuthorizationProblemResponse,
+        _OmegaUp_Controllers_Authorization__apiProblem as _OmegaUp_Controllers_Authorization__apiProblem,
+    )
+    from omegaup.api._badge import (  # noqa: F401
+        Badge as Badge,
+        BadgeBadgeDetailsResponse as BadgeBadgeDetailsResponse,
+        BadgeListResponse as BadgeListResponse,
+        BadgeMyBadgeAssignationTimeResponse as BadgeMyBadgeAssignationTimeResponse,
+        BadgeMyListResponse as BadgeMyListResponse,
+        BadgeUserListResponse as BadgeUserListResponse,
+        _Badge as _Badge,
+        _OmegaUp_Controllers_Badge__apiMyBadgeAssignationTime as _OmegaUp_Controllers_Badge__apiMyBadgeAssignationTime,
+        _OmegaUp_Controllers_Badge__apiMyList as _OmegaUp_Controllers_Badge__apiMyList,
+        _OmegaUp_Controllers_Badge__apiUserList as _OmegaUp_Controllers_Badge__apiUserList,
+    )
+    from omegaup.api._certificate import (  # noqa: F401
+        Certificate as Certificate,
+        CertificateGetCertificatePdfResponse as CertificateGetCertificatePdfResponse,
+        CertificateGetUserCertificatesResponse as CertificateGetUserCertificatesResponse,
+        CertificateValidateCertificateResponse as CertificateValidateCertificateResponse,
+        _CertificateListItem as _CertificateListItem,
+        _OmegaUp_Controllers_Certificate__apiGetCertificatePdf as _OmegaUp_Controllers_Certificate__apiGetCertificatePdf,
+        _OmegaUp_Controllers_Certificate__apiGetUserCertificates as _OmegaUp_Controllers_Certificate__apiGetUserCertificates,
+        _OmegaUp_Controllers_Certificate__apiValidateCertificate as _OmegaUp_Controllers_Certificate__apiValidateCertificate,
+    )
+    from omegaup.api._clarification import (  # noqa: F401
+        Clarification as Clarification,
+        ClarificationCreateResponse as ClarificationCreateResponse,
+        ClarificationDetailsResponse as ClarificationDetailsResponse,
+        _OmegaUp_Controllers_Clarification__apiDetails as _OmegaUp_Controllers_Clarification__apiDetails,
+    )
+    from omegaup.api._contest import (  # noqa: F401
+        Contest as Contest,
+        ContestActivityReportResponse as ContestActivityReportResponse,
+        ContestAddProblemResponse as ContestAddProblemResponse,
+        ContestAdminDetailsResponse as ContestAdminDetailsResponse,
+        ContestAdminListResponse as ContestAdminListResponse,
+        ContestAdminsResponse as ContestAdminsResponse,
+        ContestClarificationsResponse as ContestClarificationsResponse,
+        ContestCloneResponse as ContestCloneResponse,
+        ContestContestantsResponse as ContestContestantsResponse,
+        ContestCreateVirtualResponse as ContestCreateVirtualResponse,
+        ContestDetailsResponse as ContestDetailsResponse,
+        ContestGetNumberOfContestantsResponse as ContestGetNumberOfContestantsResponse,
+        ContestListParticipatingResponse as ContestListParticipatingResponse,
+        ContestListResponse as ContestListResponse,
+        ContestMyListResponse as ContestMyListResponse,
+        ContestProblemClarificationsResponse as ContestProblemClarificationsResponse,
+        ContestProblemsResponse as ContestProblemsResponse,
+        ContestPublicDetailsResponse as ContestPublicDetailsResponse,
+        ContestReportResponse as ContestReportResponse,
+        ContestRequestsResponse as ContestRequestsResponse,
+        ContestRoleResponse as ContestRoleResponse,
+        ContestRunsDiffResponse as ContestRunsDiffResponse,
+        ContestRunsResponse as ContestRunsResponse,
+        ContestScoreboardEventsResponse as ContestScoreboardEventsResponse,
+        ContestScoreboardMergeResponse as ContestScoreboardMergeResponse,
+        ContestScoreboardResponse as ContestScoreboardResponse,
+        ContestSearchUsersResponse as ContestSearchUsersResponse,
+        ContestStatsResponse as ContestStatsResponse,
+        ContestUpdateResponse as ContestUpdateResponse,
+        ContestUsersResponse as ContestUsersResponse,
+        _Contest as _Contest,
+        _ContestAdminDetails as _ContestAdminDetails,
+        _ContestDetails as _ContestDetails,
+        _ContestListItem as _ContestListItem,
+        _ContestPublicDetails as _ContestPublicDetails,
+        _ContestReport as _ContestReport,
+        _ContestReport_total as _ContestReport_total,
+        _ContestUser as _ContestUser,
+        _Contestant as _Contestant,
+        _MergedScoreboardEntry as _MergedScoreboardEntry,
+        _MergedScoreboardEntry_contests_value as _MergedScoreboardEntry_contests_value,
+        _MergedScoreboardEntry_total as _MergedScoreboardEntry_total,
+        _OmegaUp_Controllers_Contest__apiActivityReport as _OmegaUp_Controllers_Contest__apiActivityReport,
+        _OmegaUp_Controllers_Contest__apiAddProblem as _OmegaUp_Controllers_Contest__apiAddProblem,
+        _OmegaUp_Controllers_Contest__apiAdminList as _OmegaUp_Controllers_Contest__apiAdminList,
+        _OmegaUp_Controllers_Contest__apiAdmins as _OmegaUp_Controllers_Contest__apiAdmins,
+        _OmegaUp_Controllers_Contest__apiAdmins_admins_entry as _OmegaUp_Controllers_Contest__apiAdmins_admins_entry,
+        _OmegaUp_Controllers_Contest__apiAdmins_group_admins_entry as _OmegaUp_Controllers_Contest__apiAdmins_group_admins_entry,
+        _OmegaUp_Controllers_Contest__apiClarifications as _OmegaUp_Controllers_Contest__apiClarifications,
+        _OmegaUp_Controllers_Contest__apiClone as _OmegaUp_Controllers_Contest__apiClone,
+        _OmegaUp_Controllers_Contest__apiContestants as _OmegaUp_Controllers_Contest__apiContestants,
+        _OmegaUp_Controllers_Contest__apiCreateVirtual as _OmegaUp_Controllers_Contest__apiCreateVirtual,
+        _OmegaUp_Controllers_Contest__apiGetNumberOfContestants as _OmegaUp_Controllers_Contest__apiGetNumberOfContestants,
+        _OmegaUp_Controllers_Contest__apiList as _OmegaUp_Controllers_Contest__apiList,
+        _OmegaUp_Controllers_Contest__apiListParticipating as _OmegaUp_Controllers_Contest__apiListParticipating,
+        _OmegaUp_Controllers_Contest__apiMyList as _OmegaUp_Controllers_Contest__apiMyList,
+        _OmegaUp_Controllers_Contest__apiProblemClarifications as _OmegaUp_Controllers_Contest__apiProblemClarifications,
+        _OmegaUp_Controllers_Contest__apiProblems as _OmegaUp_Controllers_Contest__apiProblems,
+        _OmegaUp_Controllers_Contest__apiReport as _OmegaUp_Controllers_Contest__apiReport,
+        _OmegaUp_Controllers_Contest__apiReport_problems_entry as _OmegaUp_Controllers_Contest__apiReport_problems_entry,
+        _OmegaUp_Controllers_Contest__apiRequests as _OmegaUp_Controllers_Contest__apiRequests,
+        _OmegaUp_Controllers_Contest__apiRequests_users_entry as _OmegaUp_Controllers_Contest__apiRequests_users_entry,
+        _OmegaUp_Controllers_Contest__apiRequests_users_entry_admin as _OmegaUp_Controllers_Contest__apiRequests_users_entry_admin,
+        _OmegaUp_Controllers_Contest__apiRole as _OmegaUp_Controllers_Contest__apiRole,
+        _OmegaUp_Controllers_Contest__apiRuns as _OmegaUp_Controllers_Contest__apiRuns,
+        _OmegaUp_Controllers_Contest__apiRunsDiff as _OmegaUp_Controllers_Contest__apiRunsDiff,
+        _OmegaUp_Controllers_Contest__apiRunsDiff_diff_entry as _OmegaUp_Controllers_Contest__apiRunsDiff_diff_entry,
+        _OmegaUp_Controllers_Contest__apiScoreboardEvents as _OmegaUp_Controllers_Contest__apiScoreboardEvents,
+        _OmegaUp_Controllers_Contest__apiScoreboardMerge as _OmegaUp_Controllers_Contest__apiScoreboardMerge,
+        _OmegaUp_Controllers_Contest__apiSearchUsers as _OmegaUp_Controllers_Contest__apiSearchUsers,
+        _OmegaUp_Controllers_Contest__apiStats as _OmegaUp_Controllers_Contest__apiStats,
+        _OmegaUp_Controllers_Contest__apiUpdate as _OmegaUp_Controllers_Contest__apiUpdate,
+        _OmegaUp_Controllers_Contest__apiUsers as _OmegaUp_Controllers_Contest__apiUsers,
+        _OmegaUp_Controllers_Contest__apiUsers_groups_entry as _OmegaUp_Controllers_Contest__apiUsers_groups_entry,
+        _ProblemsetProblemWithVersions as _ProblemsetProblemWithVersions,
+        _ProblemsetProblemWithVersions_versions as _ProblemsetProblemWithVersions_versions,
+    )
+    from omegaup.api._course import (  # noqa: F401
+        Course as Course,
+        CourseActivityReportResponse as CourseActivityReportResponse,
+        CourseAddProblemResponse as CourseAddProblemResponse,
+        CourseAdminDetailsResponse as CourseAdminDetailsResponse,
+        CourseAdminsResponse as CourseAdminsResponse,
+        CourseAssignmentDetailsResponse as CourseAssignmentDetailsResponse,
+        CourseAssignmentScoreboardEventsResponse as CourseAssignmentScoreboardEventsResponse,
+        CourseAssignmentScoreboardResponse as CourseAssignmentScoreboardResponse,
+        CourseClarificationsResponse as CourseClarificationsResponse,
+        CourseCloneResponse as CourseCloneResponse,
+        CourseDetailsResponse as CourseDetailsResponse,
+        CourseGenerateTokenForCloneCourseResponse as CourseGenerateTokenForCloneCourseResponse,
+        CourseGetProblemUsersResponse as CourseGetProblemUsersResponse,
+        CourseIntroDetailsResponse as CourseIntroDetailsResponse,
+        CourseListAssignmentsResponse as CourseListAssignmentsResponse,
+        CourseListSolvedProblemsResponse as CourseListSolvedProblemsResponse,
+        CourseListStudentsResponse as CourseListStudentsResponse,
+        CourseListUnsolvedProblemsResponse as CourseListUnsolvedProblemsResponse,
+        CourseMyProgressResponse as CourseMyProgressResponse,
+        CourseProblemClarificationsResponse as CourseProblemClarificationsResponse,
+        CourseRequestsResponse as CourseRequestsResponse,
+        CourseRunsResponse as CourseRunsResponse,
+        CourseSearchUsersResponse as CourseSearchUsersResponse,
+        CourseStudentProgressResponse as CourseStudentProgressResponse,
+        CourseStudentsProgressResponse as CourseStudentsProgressResponse,
+        _CourseDetails as _CourseDetails,
+        _CourseProblem as _CourseProblem,
+        _CourseRun as _CourseRun,
+        _CourseRun_feedback as _CourseRun_feedback,
+        _CourseStudent as _CourseStudent,
+        _IdentityRequest as _IdentityRequest,
+        _IdentityRequest_admin as _IdentityRequest_admin,
+        _IntroDetailsPayload as _IntroDetailsPayload,
+        _IntroDetailsPayload_statements as _IntroDetailsPayload_statements,
+        _OmegaUp_Controllers_Course__apiActivityReport as _OmegaUp_Controllers_Course__apiActivityReport,
+        _OmegaUp_Controllers_Course__apiAddProblem as _OmegaUp_Controllers_Course__apiAddProblem,
+        _OmegaUp_Controllers_Course__apiAdmins as _OmegaUp_Controllers_Course__apiAdmins,
+        _OmegaUp_Controllers_Course__apiAdmins_admins_entry as _OmegaUp_Controllers_Course__apiAdmins_admins_entry,
+        _OmegaUp_Controllers_Course__apiAdmins_group_admins_entry as _OmegaUp_Controllers_Course__apiAdmins_group_admins_entry,
+        _OmegaUp_Controllers_Course__apiAdmins_group_teaching_assistants_entry as _OmegaUp_Controllers_Course__apiAdmins_group_teaching_assistants_entry,
+        _OmegaUp_Controllers_Course__apiAdmins_teaching_assistants_entry as _OmegaUp_Controllers_Course__apiAdmins_teaching_assistants_entry,
+        _OmegaUp_Controllers_Course__apiAssignmentDetails as _OmegaUp_Controllers_Course__apiAssignmentDetails,
+        _OmegaUp_Controllers_Course__apiAssignmentScoreboardEvents as _OmegaUp_Controllers_Course__apiAssignmentScoreboardEvents,
+        _OmegaUp_Controllers_Course__apiClarifications as _OmegaUp_Controllers_Course__apiClarifications,
+        _OmegaUp_Controllers_Course__apiClone as _OmegaUp_Controllers_Course__apiClone,
+        _OmegaUp_Controllers_Course__apiGenerateTokenForCloneCourse as _OmegaUp_Controllers_Course__apiGenerateTokenForCloneCourse,
+        _OmegaUp_Controllers_Course__apiGetProblemUsers as _OmegaUp_Controllers_Course__apiGetProblemUsers,
+        _OmegaUp_Controllers_Course__apiListAssignments as _OmegaUp_Controllers_Course__apiListAssignments,
+        _OmegaUp_Controllers_Course__apiListSolvedProblems as _OmegaUp_Controllers_Course__apiListSolvedProblems,
+        _OmegaUp_Controllers_Course__apiListSolvedProblems_user_problems_value_entry as _OmegaUp_Controllers_Course__apiListSolvedProblems_user_problems_value_entry,
+        _OmegaUp_Controllers_Course__apiListStudents as _OmegaUp_Controllers_Course__apiListStudents,
+        _OmegaUp_Controllers_Course__apiListUnsolvedProblems as _OmegaUp_Controllers_Course__apiListUnsolvedProblems,
+        _OmegaUp_Controllers_Course__apiListUnsolvedProblems_user_problems_value_entry as _OmegaUp_Controllers_Course__apiListUnsolvedProblems_user_problems_value_entry,
+        _OmegaUp_Controllers_Course__apiMyProgress as _OmegaUp_Controllers_Course__apiMyProgress,
+        _OmegaUp_Controllers_Course__apiProblemClarifications as _OmegaUp_Controllers_Course__apiProblemClarifications,
+        _OmegaUp_Controllers_Course__apiRequests as _OmegaUp_Controllers_Course__apiRequests,
+        _OmegaUp_Controllers_Course__apiRuns as _OmegaUp_Controllers_Course__apiRuns,
+        _OmegaUp_Controllers_Course__apiSearchUsers as _OmegaUp_Controllers_Course__apiSearchUsers,
+        _OmegaUp_Controllers_Course__apiStudentProgress as _OmegaUp_Controllers_Course__apiStudentProgress,
+        _OmegaUp_Controllers_Course__apiStudentsProgress as _OmegaUp_Controllers_Course__apiStudentsProgress,
+        _PrivacyStatement as _PrivacyStatement,
+        _Progress as _Progress,
+        _StudentProgressInCourse as _StudentProgressInCourse,
+        _StudentProgressInCourse_assignments_value as _StudentProgressInCourse_assignments_value,
+        _StudentProgressInCourse_assignments_value_problems_value as _StudentProgressInCourse_assignments_value_problems_value,
+    )
+    from omegaup.api._grader import (  # noqa: F401
+        Grader as Grader,
+        GraderStatusResponse as GraderStatusResponse,
+        _GraderStatus as _GraderStatus,
+        _GraderStatus_queue as _GraderStatus_queue,
+        _GraderStatus_queue_running_entry as _GraderStatus_queue_running_entry,
+        _OmegaUp_Controllers_Grader__apiStatus as _OmegaUp_Controllers_Grader__apiStatus,
+    )
+    from omegaup.api._group import (  # noqa: F401
+        Group as Group,
+        GroupDetailsResponse as GroupDetailsResponse,
+        GroupListResponse as GroupListResponse,
+        GroupMembersResponse as GroupMembersResponse,
+        GroupMyListResponse as GroupMyListResponse,
+        _GroupListItem as _GroupListItem,
+        _GroupScoreboard as _GroupScoreboard,
+        _OmegaUp_Controllers_Group__apiDetails as _OmegaUp_Controllers_Group__apiDetails,
+        _OmegaUp_Controllers_Group__apiDetails_group as _OmegaUp_Controllers_Group__apiDetails_group,
+        _OmegaUp_Controllers_Group__apiMembers as _OmegaUp_Controllers_Group__apiMembers,
+        _OmegaUp_Controllers_Group__apiMyList as _OmegaUp_Controllers_Group__apiMyList,
+        _OmegaUp_Controllers_Group__apiMyList_groups_entry as _OmegaUp_Controllers_Group__apiMyList_groups_entry,
+    )
+    from omegaup.api._group_scoreboard import (  # noqa: F401
+        GroupScoreboard as GroupScoreboard,
+        GroupScoreboardDetailsResponse as GroupScoreboardDetailsResponse,
+        GroupScoreboardListResponse as GroupScoreboardListResponse,
+        _GroupScoreboardDetails as _GroupScoreboardDetails,
+        _OmegaUp_Controllers_GroupScoreboard__apiList as _OmegaUp_Controllers_GroupScoreboard__apiList,
+        _OmegaUp_Controllers_GroupScoreboard__apiList_scoreboards_entry as _OmegaUp_Controllers_GroupScoreboard__apiList_scoreboards_entry,
+        _ScoreboardContest as _ScoreboardContest,
+        _ScoreboardDetails as _ScoreboardDetails,
+        _ScoreboardRanking as _ScoreboardRanking,
+        _ScoreboardRanking_contests_value as _ScoreboardRanking_contests_value,
+        _ScoreboardRanking_total as _ScoreboardRanking_total,
+    )
+    from omegaup.api._identity import (  # noqa: F401
+        Identity as Identity,
+        IdentityCreateResponse as IdentityCreateResponse,
+        _OmegaUp_Controllers_Identity__apiCreate as _OmegaUp_Controllers_Identity__apiCreate,
+    )
+    from omegaup.api._notification import (  # noqa: F401
+        Notification as Notification,
+        NotificationMyListResponse as NotificationMyListResponse,
+        _Notification as _Notification,
+        _NotificationContents as _NotificationContents,
+        _NotificationContents_body as _NotificationContents_body,
+        _OmegaUp_Controllers_Notification__apiMyList as _OmegaUp_Controllers_Notification__apiMyList,
+    )
+    from omegaup.api._payloads import (  # noqa: F401
+        _ActivityFeedPayload as _ActivityFeedPayload,
+        _AddedProblem as _AddedProblem,
+        _AdminCourses as _AdminCourses,
+        _AdminCourses_admin as _AdminCourses_admin,
+        _AdminCourses_admin_filteredCourses as _AdminCourses_admin_filteredCourses,
+        _ArenaAssignment as _ArenaAssignment,
+        _ArenaContest as _ArenaContest,
+        _ArenaCourseAssignment as _ArenaCourseAssignment,
+        _ArenaCourseDetails as _ArenaCourseDetails,
+        _ArenaCoursePayload as _ArenaCoursePayload,
+        _ArenaCourseProblem as _ArenaCourseProblem,
+        _ArenaProblemDetails as _ArenaProblemDetails,
+        _ArenaProblemset as _ArenaProblemset,
+        _AssignmentDetails as _AssignmentDetails,
+        _AssignmentDetailsPayload as _AssignmentDetailsPayload,
+        _AssignmentsProblemsPoints as _AssignmentsProblemsPoints,
+        _AssignmentsProblemsPoints_problems_entry as _AssignmentsProblemsPoints_problems_entry,
+        _AuthIdentityExt as _AuthIdentityExt,
+        _AuthorRankTablePayload as _AuthorRankTablePayload,
+        _AuthorsRank as _AuthorsRank,
+        _AuthorsRank_ranking_entry as _AuthorsRank_ranking_entry,
+        _BadgeDetailsPayload as _BadgeDetailsPayload,
+        _BadgeListPayload as _BadgeListPayload,
+        _CachedExtraProfileDetails as _CachedExtraProfileDetails,
+        _CertificateDetailsPayload as _CertificateDetailsPayload,
+        _CertificateListMinePayload as _CertificateListMinePayload,
+        _CertificateValidationPayload as _CertificateValidationPayload,
+        _CoderOfTheMonth as _CoderOfTheMonth,
+        _CoderOfTheMonthPayload as _CoderOfTheMonthPayload,
+        _CoderOfTheMonthPayload_options as _CoderOfTheMonthPayload_options,
+        _CollectionDetailsByAuthorPayload as _CollectionDetailsByAuthorPayload,
+        _CollectionDetailsByAuthorPayload_tagData_entry as _CollectionDetailsByAuthorPayload_tagData_entry,
+        _CollectionDetailsByLevelPayload as _CollectionDetailsByLevelPayload,
+        _CollectionDetailsByLevelPayload_tagData_entry as _CollectionDetailsByLevelPayload_tagData_entry,
+        _CommonPayload as _CommonPayload,
+        _ConsentStatement as _ConsentStatement,
+        _ContestAdmin as _ContestAdmin,
+        _ContestCertificatesAdminDetails as _ContestCertificatesAdminDetails,
+        _ContestDetailsPayload as _ContestDetailsPayload,
+        _ContestDetailsPayload_adminPayload as _ContestDetailsPayload_adminPayload,
+        _ContestDetailsPayload_original as _ContestDetailsPayload_original,
+        _ContestEditPayload as _ContestEditPayload,
+        _ContestGroup as _ContestGroup,
+        _ContestGroupAdmin as _ContestGroupAdmin,
+        _ContestIntroPayload as _ContestIntroPayload,
+        _ContestList as _ContestList,
+        _ContestListMinePayload as _ContestListMinePayload,
+        _ContestListPayload as _ContestListPayload,
+        _ContestListv2Payload as _ContestListv2Payload,
+        _ContestListv2Payload_countContests as _ContestListv2Payload_countContests,
+        _ContestNewPayload as _ContestNewPayload,
+        _ContestPracticeDetailsPayload as _ContestPracticeDetailsPayload,
+        _ContestPracticeDetailsPayload_adminPayload as _ContestPracticeDetailsPayload_adminPayload,
+        _ContestPracticeDetailsPayload_original as _ContestPracticeDetailsPayload_original,
+        _ContestPrintDetailsPayload as _ContestPrintDetailsPayload,
+        _ContestReportDetailsPayload as _ContestReportDetailsPayload,
+        _ContestRequest as _ContestRequest,
+        _ContestRequest_admin as _ContestRequest_admin,
+        _ContestScoreboardPayload as _ContestScoreboardPayload,
+        _ContestVirtualDetailsPayload as _ContestVirtualDetailsPayload,
+        _Course as _Course,
+        _CourseAdmin as _CourseAdmin,
+        _CourseCardEnrolled as _CourseCardEnrolled,
+        _CourseCardFinished as _CourseCardFinished,
+        _CourseCardPublic as _CourseCardPublic,
+        _CourseClarificationsPayload as _CourseClarificationsPayload,
+        _CourseCloneDetailsPayload as _CourseCloneDetailsPayload,
+        _CourseCloneDetailsPayload_creator as _CourseCloneDetailsPayload_creator,
+        _CourseDetailsPayload as _CourseDetailsPayload,
+        _CourseEditPayload as _CourseEditPayload,
+        _CourseGroupAdmin as _CourseGroupAdmin,
+        _CourseListMinePayload as _CourseListMinePayload,
+        _CourseNewPayload as _CourseNewPayload,
+        _CourseProblemStatistics as _CourseProblemStatistics,
+        _CourseProblemTried as _CourseProblemTried,
+        _CourseProblemVerdict as _CourseProblemVerdict,
+        _CourseScoreboardPayload as _CourseScoreboardPayload,
+        _CourseStatisticsPayload as _CourseStatisticsPayload,
+        _CourseSubmissionsListPayload as _CourseSubmissionsListPayload,
+        _CourseTabsPayload as _CourseTabsPayload,
+        _CourseTabsPayload_courses as _CourseTabsPayload_courses,
+        _CoursesByAccessMode as _CoursesByAccessMode,
+        _CoursesByAccessMode_filteredCourses as _CoursesByAccessMode_filteredCourses,
+        _CoursesByTimeType as _CoursesByTimeType,
+        _CoursesList as _CoursesList,
+        _EmailEditDetailsPayload as _EmailEditDetailsPayload,
+        _Experiment as _Experiment,
+        _ExtraProfileDetails as _ExtraProfileDetails,
+        _FilteredCourse as _FilteredCourse,
+        _FullIDEPayload as _FullIDEPayload,
+        _Group as _Group,
+        _GroupEditPayload as _GroupEditPayload,
+        _GroupListPayload as _GroupListPayload,
+        _GroupScoreboardContestsPayload as _GroupScoreboardContestsPayload,
+        _GroupScoreboardDetailsPayload as _GroupScoreboardDetailsPayload,
+        _Histogram as _Histogram,
+        _IdentityExt as _IdentityExt,
+        _IndexPayload as _IndexPayload,
+        _IndexPayload_coderOfTheMonthData as _IndexPayload_coderOfTheMonthData,
+        _IndexPayload_currentUserInfo as _IndexPayload_currentUserInfo,
+        _IndexPayload_schoolOfTheMonthData as _IndexPayload_schoolOfTheMonthData,
+        _IndexPayload_schoolRank_entry as _IndexPayload_schoolRank_entry,
+        _InteractiveInterface as _InteractiveInterface,
+        _InteractiveInterface_ExecutableDescription as _InteractiveInterface_ExecutableDescription,
+        _InteractiveInterface_MakefileRules_entry as _InteractiveInterface_MakefileRules_entry,
+        _IntroCourseDetails as _IntroCourseDetails,
+        _LibinteractiveError as _LibinteractiveError,
+        _LibinteractiveGenPayload as _LibinteractiveGenPayload,
+        _LoginDetailsPayload as _LoginDetailsPayload,
+        _NavbarProblemsetProblem as _NavbarProblemsetProblem,
+        _OmegaUp_DAO_VO_Contests as _OmegaUp_DAO_VO_Contests,
+        _OmegaUp_DAO_VO_Countries as _OmegaUp_DAO_VO_Countries,
+        _Participant as _Participant,
+        _PrivacyPolicyDetailsPayload as _PrivacyPolicyDetailsPayload,
+        _ProblemDetailsPayload as _ProblemDetailsPayload,
+        _ProblemEditPayload as _ProblemEditPayload,
+        _ProblemFormPayload as _ProblemFormPayload,
+        _ProblemFormPayload_tags_entry as _ProblemFormPayload_tags_entry,
+        _ProblemInfo as _ProblemInfo,
+        _ProblemListCollectionPayload as _ProblemListCollectionPayload,
+        _ProblemListCollectionPayload_problemCount_entry as _ProblemListCollectionPayload_problemCount_entry,
+        _ProblemListPayload as _ProblemListPayload,
+        _ProblemListPayload_tagData_entry as _ProblemListPayload_tagData_entry,
+        _ProblemPrintDetailsPayload as _ProblemPrintDetailsPayload,
+        _ProblemSettings as _ProblemSettings,
+        _ProblemSettings_Cases_entry as _ProblemSettings_Cases_entry,
+        _ProblemSettings_Cases_entry_Cases_entry as _ProblemSettings_Cases_entry_Cases_entry,
+        _ProblemSettings_Interactive as _ProblemSettings_Interactive,
+        _ProblemSettings_Validator as _ProblemSettings_Validator,
+        _ProblemsMineInfoPayload as _ProblemsMineInfoPayload,
+        _School as _School,
+        _SchoolCoderOfTheMonth as _SchoolCoderOfTheMonth,
+        _SchoolOfTheMonthPayload as _SchoolOfTheMonthPayload,
+        _SchoolOfTheMonthPayload_candidatesToSchoolOfTheMonth_entry as _SchoolOfTheMonthPayload_candidatesToSchoolOfTheMonth_entry,
+        _SchoolOfTheMonthPayload_options as _SchoolOfTheMonthPayload_options,
+        _SchoolOfTheMonthPayload_schoolsOfPreviousMonth_entry as _SchoolOfTheMonthPayload_schoolsOfPreviousMonth_entry,
+        _SchoolOfTheMonthPayload_schoolsOfPreviousMonths_entry as _SchoolOfTheMonthPayload_schoolsOfPreviousMonths_entry,
+        _SchoolProblemsSolved as _SchoolProblemsSolved,
+        _SchoolProfileDetailsPayload as _SchoolProfileDetailsPayload,
+        _SchoolProfileDetailsPayload_country as _SchoolProfileDetailsPayload_country,
+        _SchoolRankPayload as _SchoolRankPayload,
+        _SchoolUser as _SchoolUser,
+        _ScoreboardMergePayload as _ScoreboardMergePayload,
+        _SelectedTag as _SelectedTag,
+        _StatsPayload as _StatsPayload,
+        _StudentProgress as _StudentProgress,
+        _StudentProgressByAssignmentPayload as _StudentProgressByAssignmentPayload,
+        _StudentProgressPayload as _StudentProgressPayload,
+        _StudentsProgressPayload as _StudentsProgressPayload,
+        _SubmissionsListPayload as _SubmissionsListPayload,
+        _SupportDetailsPayload as _SupportDetailsPayload,
+        _Tag as _Tag,
+        _TeamGroupEditPayload as _TeamGroupEditPayload,
+        _TeamGroupEditPayload_teamGroup as _TeamGroupEditPayload_teamGroup,
+        _TeamGroupNewPayload as _TeamGroupNewPayload,
+        _TeamsGroup as _TeamsGroup,
+        _TeamsGroupListPayload as _TeamsGroupListPayload,
+        _UserDependent as _UserDependent,
+        _UserDependentsPayload as _UserDependentsPayload,
+        _UserDetailsPayload as _UserDetailsPayload,
+        _UserInfoForProblem as _UserInfoForProblem,
+        _UserProfileDetailsPayload as _UserProfileDetailsPayload,
+        _UserRank as _UserRank,
+        _UserRankInfo as _UserRankInfo,
+        _UserRankTablePayload as _UserRankTablePayload,
+        _UserRankTablePayload_availableFilters as _UserRankTablePayload_availableFilters,
+        _UserRank_rank_entry as _UserRank_rank_entry,
+        _UserRole as _UserRole,
+        _UserRolesPayload as _UserRolesPayload,
+        _UserRolesPayload_userSystemGroups_value as _UserRolesPayload_userSystemGroups_value,
+        _UserRolesPayload_userSystemRoles_value as _UserRolesPayload_userSystemRoles_value,
+        _VerificationParentalTokenDetailsPayload as _VerificationParentalTokenDetailsPayload,
+    )
+    from omegaup.api._problem import (  # noqa: F401
+        Problem as Problem,
+        ProblemAddTagResponse as ProblemAddTagResponse,
+        ProblemAdminListResponse as ProblemAdminListResponse,
+        ProblemAdminsResponse as ProblemAdminsResponse,
+        ProblemBestScoreResponse as ProblemBestScoreResponse,
+        ProblemClarificationsResponse as ProblemClarificationsResponse,
+        ProblemDetailsResponse as ProblemDetailsResponse,
+        ProblemListForTypeaheadResponse as ProblemListForTypeaheadResponse,
+        ProblemListResponse as ProblemListResponse,
+        ProblemMyListResponse as ProblemMyListResponse,
+        ProblemRandomKarelProblemResponse as ProblemRandomKarelProblemResponse,
+        ProblemRandomLanguageProblemResponse as ProblemRandomLanguageProblemResponse,
+        ProblemRunsDiffResponse as ProblemRunsDiffResponse,
+        ProblemRunsResponse as ProblemRunsResponse,
+        ProblemSolutionResponse as ProblemSolutionResponse,
+        ProblemStatsResponse as ProblemStatsResponse,
+        ProblemTagsResponse as ProblemTagsResponse,
+        ProblemUpdateResponse as ProblemUpdateResponse,
+        ProblemVersionsResponse as ProblemVersionsResponse,
+        _BestSolvers as _BestSolvers,
+        _InteractiveSettingsDistrib as _InteractiveSettingsDistrib,
+        _LimitsSettings as _LimitsSettings,
+        _NominationStatus as _NominationStatus,
+        _OmegaUp_Controllers_Problem__apiAddTag as _OmegaUp_Controllers_Problem__apiAddTag,
+        _OmegaUp_Controllers_Problem__apiAdminList as _OmegaUp_Controllers_Problem__apiAdminList,
+        _OmegaUp_Controllers_Problem__apiAdmins as _OmegaUp_Controllers_Problem__apiAdmins,
+        _OmegaUp_Controllers_Problem__apiBestScore as _OmegaUp_Controllers_Problem__apiBestScore,
+        _OmegaUp_Controllers_Problem__apiClarifications as _OmegaUp_Controllers_Problem__apiClarifications,
+        _OmegaUp_Controllers_Problem__apiList as _OmegaUp_Controllers_Problem__apiList,
+        _OmegaUp_Controllers_Problem__apiListForTypeahead as _OmegaUp_Controllers_Problem__apiListForTypeahead,
+        _OmegaUp_Controllers_Problem__apiMyList as _OmegaUp_Controllers_Problem__apiMyList,
+        _OmegaUp_Controllers_Problem__apiRandomKarelProblem as _OmegaUp_Controllers_Problem__apiRandomKarelProblem,
+        _OmegaUp_Controllers_Problem__apiRandomLanguageProblem as _OmegaUp_Controllers_Problem__apiRandomLanguageProblem,
+        _OmegaUp_Controllers_Problem__apiRuns as _OmegaUp_Controllers_Problem__apiRuns,
+        _OmegaUp_Controllers_Problem__apiRunsDiff as _OmegaUp_Controllers_Problem__apiRunsDiff,
+        _OmegaUp_Controllers_Problem__apiSolution as _OmegaUp_Controllers_Problem__apiSolution,
+        _OmegaUp_Controllers_Problem__apiStats as _OmegaUp_Controllers_Problem__apiStats,
+        _OmegaUp_Controllers_Problem__apiTags as _OmegaUp_Controllers_Problem__apiTags,
+        _OmegaUp_Controllers_Problem__apiTags_tags_entry as _OmegaUp_Controllers_Problem__apiTags_tags_entry,
+        _OmegaUp_Controllers_Problem__apiUpdate as _OmegaUp_Controllers_Problem__apiUpdate,
+        _OmegaUp_Controllers_Problem__apiVersions as _OmegaUp_Controllers_Problem__apiVersions,
+        _ProblemAdmin as _ProblemAdmin,
+        _ProblemDetails as _ProblemDetails,
+        _ProblemGroupAdmin as _ProblemGroupAdmin,
+        _ProblemListItem as _ProblemListItem,
+        _ProblemListItem_tags_entry as _ProblemListItem_tags_entry,
+        _ProblemSettingsDistrib as _ProblemSettingsDistrib,
+        _ProblemSettingsDistrib_cases_value as _ProblemSettingsDistrib_cases_value,
+        _ProblemSettingsDistrib_validator as _ProblemSettingsDistrib_validator,
+        _ProblemSettingsDistrib_validator_custom_validator as _ProblemSettingsDistrib_validator_custom_validator,
+        _ProblemsetterInfo as _ProblemsetterInfo,
+        _RunDetailsV2 as _RunDetailsV2,
+        _RunDetailsV2_details as _RunDetailsV2_details,
+        _RunWithDetails as _RunWithDetails,
+        _RunsDiff as _RunsDiff,
+        _SettingLimits as _SettingLimits,
+    )
+    from omegaup.api._problem_forfeited import (  # noqa: F401
+        ProblemForfeited as ProblemForfeited,
+        ProblemForfeitedGetCountsResponse as ProblemForfeitedGetCountsResponse,
+        _OmegaUp_Controllers_ProblemForfeited__apiGetCounts as _OmegaUp_Controllers_ProblemForfeited__apiGetCounts,
+    )
+    from omegaup.api._problemset import (  # noqa: F401
+        Problemset as Problemset,
+        ProblemsetDetailsResponse as ProblemsetDetailsResponse,
+        ProblemsetScoreboardEventsResponse as ProblemsetScoreboardEventsResponse,
+        ProblemsetScoreboardResponse as ProblemsetScoreboardResponse,
+        _OmegaUp_Controllers_Problemset__apiScoreboardEvents as _OmegaUp_Controllers_Problemset__apiScoreboardEvents,
+        _Problemset as _Problemset,
+        _Problemset_users_entry as _Problemset_users_entry,
+    )
+    from omegaup.api._quality_nomination import (  # noqa: F401
+        QualityNomination as QualityNomination,
+        QualityNominationCreateResponse as QualityNominationCreateResponse,
+        QualityNominationDetailsResponse as QualityNominationDetailsResponse,
+        QualityNominationListResponse as QualityNominationListResponse,
+        QualityNominationMyAssignedListResponse as QualityNominationMyAssignedListResponse,
+        QualityNominationMyListResponse as QualityNominationMyListResponse,
+        _NominationListItem as _NominationListItem,
+        _NominationListItem_author as _NominationListItem_author,
+        _NominationListItem_contents as _NominationListItem_contents,
+        _NominationListItem_nominator as _NominationListItem_nominator,
+        _NominationListItem_problem as _NominationListItem_problem,
+        _NominationListItem_votes_entry as _NominationListItem_votes_entry,
+        _NominationListItem_votes_entry_user as _NominationListItem_votes_entry_user,
+        _OmegaUp_Controllers_QualityNomination__apiCreate as _OmegaUp_Controllers_QualityNomination__apiCreate,
+        _OmegaUp_Controllers_QualityNomination__apiDetails as _OmegaUp_Controllers_QualityNomination__apiDetails,
+        _OmegaUp_Controllers_QualityNomination__apiDetails_author as _OmegaUp_Controllers_QualityNomination__apiDetails_author,
+        _OmegaUp_Controllers_QualityNomination__apiDetails_contents as _OmegaUp_Controllers_QualityNomination__apiDetails_contents,
+        _OmegaUp_Controllers_QualityNomination__apiDetails_nominator as _OmegaUp_Controllers_QualityNomination__apiDetails_nominator,
+        _OmegaUp_Controllers_QualityNomination__apiDetails_original_contents as _OmegaUp_Controllers_QualityNomination__apiDetails_original_contents,
+        _OmegaUp_Controllers_QualityNomination__apiDetails_original_contents_tags_entry as _OmegaUp_Controllers_QualityNomination__apiDetails_original_contents_tags_entry,
+        _OmegaUp_Controllers_QualityNomination__apiDetails_problem as _OmegaUp_Controllers_QualityNomination__apiDetails_problem,
+        _OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry as _OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry,
+        _OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry_user as _OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry_user,
+        _OmegaUp_Controllers_QualityNomination__apiList as _OmegaUp_Controllers_QualityNomination__apiList,
+        _OmegaUp_Controllers_QualityNomination__apiMyAssignedList as _OmegaUp_Controllers_QualityNomination__apiMyAssignedList,
+        _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry as _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry,
+        _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_author as _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_author,
+        _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_contents as _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_contents,
+        _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_nominator as _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_nominator,
+        _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_problem as _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_problem,
+        _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry as _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry,
+        _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry_user as _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry_user,
+        _OmegaUp_Controllers_QualityNomination__apiMyList as _OmegaUp_Controllers_QualityNomination__apiMyList,
+    )
+    from omegaup.api._reset import (  # noqa: F401
+        Reset as Reset,
+        ResetCreateResponse as ResetCreateResponse,
+        ResetGenerateTokenResponse as ResetGenerateTokenResponse,
+        ResetUpdateResponse as ResetUpdateResponse,
+        _OmegaUp_Controllers_Reset__apiCreate as _OmegaUp_Controllers_Reset__apiCreate,
+        _OmegaUp_Controllers_Reset__apiGenerateToken as _OmegaUp_Controllers_Reset__apiGenerateToken,
+        _OmegaUp_Controllers_Reset__apiUpdate as _OmegaUp_Controllers_Reset__apiUpdate,
+    )
+    from omegaup.api._run import (  # noqa: F401
+        Run as Run,
+        RunCountsResponse as RunCountsResponse,
+        RunCreateResponse as RunCreateResponse,
+        RunDetailsResponse as RunDetailsResponse,
+        RunDisqualifyResponse as RunDisqualifyResponse,
+        RunGetSubmissionFeedbackResponse as RunGetSubmissionFeedbackResponse,
+        RunListResponse as RunListResponse,
+        RunSourceResponse as RunSourceResponse,
+        RunStatusResponse as RunStatusResponse,
+        _OmegaUp_Controllers_Run__apiCounts as _OmegaUp_Controllers_Run__apiCounts,
+        _OmegaUp_Controllers_Run__apiCreate as _OmegaUp_Controllers_Run__apiCreate,
+        _OmegaUp_Controllers_Run__apiDisqualify as _OmegaUp_Controllers_Run__apiDisqualify,
+        _OmegaUp_Controllers_Run__apiDisqualify_runs_entry as _OmegaUp_Controllers_Run__apiDisqualify_runs_entry,
+        _OmegaUp_Controllers_Run__apiList as _OmegaUp_Controllers_Run__apiList,
+        _OmegaUp_Controllers_Run__apiSource as _OmegaUp_Controllers_Run__apiSource,
+        _OmegaUp_Controllers_Run__apiSource_details as _OmegaUp_Controllers_Run__apiSource_details,
+        _OmegaUp_Controllers_Run__apiSource_details_groups_entry as _OmegaUp_Controllers_Run__apiSource_details_groups_entry,
+        _RunDetails as _RunDetails,
+        _RunDetails_details as _RunDetails_details,
+    )
+    from omegaup.api._school import (  # noqa: F401
+        School as School,
+        SchoolCreateResponse as SchoolCreateResponse,
+        SchoolListResponse as SchoolListResponse,
+        _OmegaUp_Controllers_School__apiCreate as _OmegaUp_Controllers_School__apiCreate,
+        _OmegaUp_Controllers_School__apiList as _OmegaUp_Controllers_School__apiList,
+        _SchoolListItem as _SchoolListItem,
+    )
+    from omegaup.api._scoreboard import (  # noqa: F401
+        Scoreboard as Scoreboard,
+    )
+    from omegaup.api._session import (  # noqa: F401
+        Session as Session,
+        SessionCurrentSessionResponse as SessionCurrentSessionResponse,
+        _CurrentSession as _CurrentSession,
+        _OmegaUp_Controllers_Session__apiCurrentSession as _OmegaUp_Controllers_Session__apiCurrentSession,
+        _OmegaUp_DAO_VO_Identities as _OmegaUp_DAO_VO_Identities,
+        _OmegaUp_DAO_VO_Users as _OmegaUp_DAO_VO_Users,
+    )
+    from omegaup.api._submission import (  # noqa: F401
+        Submission as Submission,
+        SubmissionListResponse as SubmissionListResponse,
+        SubmissionSetFeedbackResponse as SubmissionSetFeedbackResponse,
+        _OmegaUp_Controllers_Submission__apiList as _OmegaUp_Controllers_Submission__apiList,
+        _OmegaUp_Controllers_Submission__apiSetFeedback as _OmegaUp_Controllers_Submission__apiSetFeedback,
+        _OmegaUp_DAO_VO_SubmissionFeedback as _OmegaUp_DAO_VO_SubmissionFeedback,
+        _OmegaUp_DAO_VO_SubmissionFeedbackThread as _OmegaUp_DAO_VO_SubmissionFeedbackThread,
+        _Submission as _Submission,
+    )
+    from omegaup.api._tag import (  # noqa: F401
+        Tag as Tag,
+        TagFrequentTagsResponse as TagFrequentTagsResponse,
+        TagListResponse as TagListResponse,
+        _OmegaUp_Controllers_Tag__apiFrequentTags as _OmegaUp_Controllers_Tag__apiFrequentTags,
+        _OmegaUp_Controllers_Tag__apiList_entry as _OmegaUp_Controllers_Tag__apiList_entry,
+        _TagWithProblemCount as _TagWithProblemCount,
+    )
+    from omegaup.api._teams_group import (  # noqa: F401
+        TeamsGroup as TeamsGroup,
+        TeamsGroupDetailsResponse as TeamsGroupDetailsResponse,
+        TeamsGroupListResponse as TeamsGroupListResponse,
+        TeamsGroupTeamsMembersResponse as TeamsGroupTeamsMembersResponse,
+        TeamsGroupTeamsResponse as TeamsGroupTeamsResponse,
+        _OmegaUp_Controllers_TeamsGroup__apiDetails as _OmegaUp_Controllers_TeamsGroup__apiDetails,
+        _OmegaUp_Controllers_TeamsGroup__apiDetails_team_group as _OmegaUp_Controllers_TeamsGroup__apiDetails_team_group,
+        _OmegaUp_Controllers_TeamsGroup__apiTeams as _OmegaUp_Controllers_TeamsGroup__apiTeams,
+        _OmegaUp_Controllers_TeamsGroup__apiTeamsMembers as _OmegaUp_Controllers_TeamsGroup__apiTeamsMembers,
+        _TeamMember as _TeamMember,
+    )
+    from omegaup.api._time import (  # noqa: F401
+        Time as Time,
+        TimeGetResponse as TimeGetResponse,
+        _OmegaUp_Controllers_Time__apiGet as _OmegaUp_Controllers_Time__apiGet,
+    )
+    from omegaup.api._types import (  # noqa: F401
+        _ActivityEvent as _ActivityEvent,
+        _ApiToken as _ApiToken,
+        _ApiToken_rate_limit as _ApiToken_rate_limit,
+        _AssociatedIdentity as _AssociatedIdentity,
+        _CaseResult as _CaseResult,
+        _Clarification as _Clarification,
+        _CourseAssignment as _CourseAssignment,
+        _Event as _Event,
+        _Identity as _Identity,
+        _ListItem as _ListItem,
+        _PageItem as _PageItem,
+        _ProblemCasesContents_value as _ProblemCasesContents_value,
+        _ProblemQualityPayload as _ProblemQualityPayload,
+        _ProblemStatement as _ProblemStatement,
+        _ProblemVersion as _ProblemVersion,
+        _ProblemsetProblem as _ProblemsetProblem,
+        _Run as _Run,
+        _RunDetailsGroup as _RunDetailsGroup,
+        _RunMetadata as _RunMetadata,
+        _Scoreboard as _Scoreboard,
+        _ScoreboardEvent as _ScoreboardEvent,
+        _ScoreboardEvent_problem as _ScoreboardEvent_problem,
+        _ScoreboardEvent_total as _ScoreboardEvent_total,
+        _ScoreboardRankingEntry as _ScoreboardRankingEntry,
+        _ScoreboardRankingEntry_total as _ScoreboardRankingEntry_total,
+        _ScoreboardRankingProblem as _ScoreboardRankingProblem,
+        _ScoreboardRankingProblemDetailsGroup as _ScoreboardRankingProblemDetailsGroup,
+        _ScoreboardRankingProblemDetailsGroup_cases_entry as _ScoreboardRankingProblemDetailsGroup_cases_entry,
+        _ScoreboardRankingProblem_run_details as _ScoreboardRankingProblem_run_details,
+        _ScoreboardRankingProblem_run_details_details as _ScoreboardRankingProblem_run_details_details,
+        _Scoreboard_problems_entry as _Scoreboard_problems_entry,
+        _Signature as _Signature,
+        _SubmissionFeedback as _SubmissionFeedback,
+        _SubmissionFeedbackThread as _SubmissionFeedbackThread,
+    )
+    from omegaup.api._user import (  # noqa: F401
+        User as User,
+        UserCoderOfTheMonthListResponse as UserCoderOfTheMonthListResponse,
+        UserCoderOfTheMonthResponse as UserCoderOfTheMonthResponse,
+        UserContestStatsResponse as UserContestStatsResponse,
+        UserCreateAPITokenResponse as UserCreateAPITokenResponse,
+        UserCreateResponse as UserCreateResponse,
+        UserDeleteRequestResponse as UserDeleteRequestResponse,
+        UserExtraInformationResponse as UserExtraInformationResponse,
+        UserGenerateGitTokenResponse as UserGenerateGitTokenResponse,
+        UserGenerateOmiUsersResponse as UserGenerateOmiUsersResponse,
+        UserLastPrivacyPolicyAcceptedResponse as UserLastPrivacyPolicyAcceptedResponse,
+        UserListAPITokensResponse as UserListAPITokensResponse,
+        UserListAssociatedIdentitiesResponse as UserListAssociatedIdentitiesResponse,
+        UserListResponse as UserListResponse,
+        UserListUnsolvedProblemsResponse as UserListUnsolvedProblemsResponse,
+        UserLoginResponse as UserLoginResponse,
+        UserMailingListBackfillResponse as UserMailingListBackfillResponse,
+        UserProblemsCreatedResponse as UserProblemsCreatedResponse,
+        UserProblemsSolvedResponse as UserProblemsSolvedResponse,
+        UserProfileResponse as UserProfileResponse,
+        UserStatsResponse as UserStatsResponse,
+        UserStatusVerifiedResponse as UserStatusVerifiedResponse,
+        UserValidateFilterResponse as UserValidateFilterResponse,
+        _CoderOfTheMonthList_entry as _CoderOfTheMonthList_entry,
+        _ContestParticipated as _ContestParticipated,
+        _OmegaUp_Controllers_User__apiCoderOfTheMonth as _OmegaUp_Controllers_User__apiCoderOfTheMonth,
+        _OmegaUp_Controllers_User__apiCoderOfTheMonthList as _OmegaUp_Controllers_User__apiCoderOfTheMonthList,
+        _OmegaUp_Controllers_User__apiContestStats as _OmegaUp_Controllers_User__apiContestStats,
+        _OmegaUp_Controllers_User__apiCreate as _OmegaUp_Controllers_User__apiCreate,
+        _OmegaUp_Controllers_User__apiCreateAPIToken as _OmegaUp_Controllers_User__apiCreateAPIToken,
+        _OmegaUp_Controllers_User__apiDeleteRequest as _OmegaUp_Controllers_User__apiDeleteRequest,
+        _OmegaUp_Controllers_User__apiExtraInformation as _OmegaUp_Controllers_User__apiExtraInformation,
+        _OmegaUp_Controllers_User__apiGenerateGitToken as _OmegaUp_Controllers_User__apiGenerateGitToken,
+        _OmegaUp_Controllers_User__apiLastPrivacyPolicyAccepted as _OmegaUp_Controllers_User__apiLastPrivacyPolicyAccepted,
+        _OmegaUp_Controllers_User__apiList as _OmegaUp_Controllers_User__apiList,
+        _OmegaUp_Controllers_User__apiListAPITokens as _OmegaUp_Controllers_User__apiListAPITokens,
+        _OmegaUp_Controllers_User__apiListAssociatedIdentities as _OmegaUp_Controllers_User__apiListAssociatedIdentities,
+        _OmegaUp_Controllers_User__apiListUnsolvedProblems as _OmegaUp_Controllers_User__apiListUnsolvedProblems,
+        _OmegaUp_Controllers_User__apiLogin as _OmegaUp_Controllers_User__apiLogin,
+        _OmegaUp_Controllers_User__apiMailingListBackfill as _OmegaUp_Controllers_User__apiMailingListBackfill,
+        _OmegaUp_Controllers_User__apiProblemsCreated as _OmegaUp_Controllers_User__apiProblemsCreated,
+        _OmegaUp_Controllers_User__apiProblemsSolved as _OmegaUp_Controllers_User__apiProblemsSolved,
+        _OmegaUp_Controllers_User__apiStats as _OmegaUp_Controllers_User__apiStats,
+        _OmegaUp_Controllers_User__apiStatusVerified as _OmegaUp_Controllers_User__apiStatusVerified,
+        _OmegaUp_Controllers_User__apiValidateFilter as _OmegaUp_Controllers_User__apiValidateFilter,
+        _Problem as _Problem,
+        _UserProfile as _UserProfile,
+        _UserProfileContests_value as _UserProfileContests_value,
+        _UserProfileInfo as _UserProfileInfo,
+        _UserProfileInfo_rankinfo as _UserProfileInfo_rankinfo,
+        _UserProfileStats as _UserProfileStats,
+    )
+
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    'Admin': '_admin',
+    'AdminPlatformReportStatsResponse': '_admin',
+    'Authorization': '_authorization',
+    'AuthorizationProblemResponse': '_authorization',
+    'Badge': '_badge',
+    'BadgeBadgeDetailsResponse': '_badge',
+    'BadgeListResponse': '_badge',
+    'BadgeMyBadgeAssignationTimeResponse': '_badge',
+    'BadgeMyListResponse': '_badge',
+    'BadgeUserListResponse': '_badge',
+    'Certificate': '_certificate',
+    'CertificateGetCertificatePdfResponse': '_certificate',
+    'CertificateGetUserCertificatesResponse': '_certificate',
+    'CertificateValidateCertificateResponse': '_certificate',
+    'Clarification': '_clarification',
+    'ClarificationCreateResponse': '_clarification',
+    'ClarificationDetailsResponse': '_clarification',
+    'Contest': '_contest',
+    'ContestActivityReportResponse': '_contest',
+    'ContestAddProblemResponse': '_contest',
+    'ContestAdminDetailsResponse': '_contest',
+    'ContestAdminListResponse': '_contest',
+    'ContestAdminsResponse': '_contest',
+    'ContestClarificationsResponse': '_contest',
+    'ContestCloneResponse': '_contest',
+    'ContestContestantsResponse': '_contest',
+    'ContestCreateVirtualResponse': '_contest',
+    'ContestDetailsResponse': '_contest',
+    'ContestGetNumberOfContestantsResponse': '_contest',
+    'ContestListParticipatingResponse': '_contest',
+    'ContestListResponse': '_contest',
+    'ContestMyListResponse': '_contest',
+    'ContestProblemClarificationsResponse': '_contest',
+    'ContestProblemsResponse': '_contest',
+    'ContestPublicDetailsResponse': '_contest',
+    'ContestReportResponse': '_contest',
+    'ContestRequestsResponse': '_contest',
+    'ContestRoleResponse': '_contest',
+    'ContestRunsDiffResponse': '_contest',
+    'ContestRunsResponse': '_contest',
+    'ContestScoreboardEventsResponse': '_contest',
+    'ContestScoreboardMergeResponse': '_contest',
+    'ContestScoreboardResponse': '_contest',
+    'ContestSearchUsersResponse': '_contest',
+    'ContestStatsResponse': '_contest',
+    'ContestUpdateResponse': '_contest',
+    'ContestUsersResponse': '_contest',
+    'Course': '_course',
+    'CourseActivityReportResponse': '_course',
+    'CourseAddProblemResponse': '_course',
+    'CourseAdminDetailsResponse': '_course',
+    'CourseAdminsResponse': '_course',
+    'CourseAssignmentDetailsResponse': '_course',
+    'CourseAssignmentScoreboardEventsResponse': '_course',
+    'CourseAssignmentScoreboardResponse': '_course',
+    'CourseClarificationsResponse': '_course',
+    'CourseCloneResponse': '_course',
+    'CourseDetailsResponse': '_course',
+    'CourseGenerateTokenForCloneCourseResponse': '_course',
+    'CourseGetProblemUsersResponse': '_course',
+    'CourseIntroDetailsResponse': '_course',
+    'CourseListAssignmentsResponse': '_course',
+    'CourseListSolvedProblemsResponse': '_course',
+    'CourseListStudentsResponse': '_course',
+    'CourseListUnsolvedProblemsResponse': '_course',
+    'CourseMyProgressResponse': '_course',
+    'CourseProblemClarificationsResponse': '_course',
+    'CourseRequestsResponse': '_course',
+    'CourseRunsResponse': '_course',
+    'CourseSearchUsersResponse': '_course',
+    'CourseStudentProgressResponse': '_course',
+    'CourseStudentsProgressResponse': '_course',
+    'Grader': '_grader',
+    'GraderStatusResponse': '_grader',
+    'Group': '_group',
+    'GroupDetailsResponse': '_group',
+    'GroupListResponse': '_group',
+    'GroupMembersResponse': '_group',
+    'GroupMyListResponse': '_group',
+    'GroupScoreboard': '_group_scoreboard',
+    'GroupScoreboardDetailsResponse': '_group_scoreboard',
+    'GroupScoreboardListResponse': '_group_scoreboard',
+    'Identity': '_identity',
+    'IdentityCreateResponse': '_identity',
+    'Notification': '_notification',
+    'NotificationMyListResponse': '_notification',
+    'Problem': '_problem',
+    'ProblemAddTagResponse': '_problem',
+    'ProblemAdminListResponse': '_problem',
+    'ProblemAdminsResponse': '_problem',
+    'ProblemBestScoreResponse': '_problem',
+    'ProblemClarificationsResponse': '_problem',
+    'ProblemDetailsResponse': '_problem',
+    'ProblemForfeited': '_problem_forfeited',
+    'ProblemForfeitedGetCountsResponse': '_problem_forfeited',
+    'ProblemListForTypeaheadResponse': '_problem',
+    'ProblemListResponse': '_problem',
+    'ProblemMyListResponse': '_problem',
+    'ProblemRandomKarelProblemResponse': '_problem',
+    'ProblemRandomLanguageProblemResponse': '_problem',
+    'ProblemRunsDiffResponse': '_problem',
+    'ProblemRunsResponse': '_problem',
+    'ProblemSolutionResponse': '_problem',
+    'ProblemStatsResponse': '_problem',
+    'ProblemTagsResponse': '_problem',
+    'ProblemUpdateResponse': '_problem',
+    'ProblemVersionsResponse': '_problem',
+    'Problemset': '_problemset',
+    'ProblemsetDetailsResponse': '_problemset',
+    'ProblemsetScoreboardEventsResponse': '_problemset',
+    'ProblemsetScoreboardResponse': '_problemset',
+    'QualityNomination': '_quality_nomination',
+    'QualityNominationCreateResponse': '_quality_nomination',
+    'QualityNominationDetailsResponse': '_quality_nomination',
+    'QualityNominationListResponse': '_quality_nomination',
+    'QualityNominationMyAssignedListResponse': '_quality_nomination',
+    'QualityNominationMyListResponse': '_quality_nomination',
+    'Reset': '_reset',
+    'ResetCreateResponse': '_reset',
+    'ResetGenerateTokenResponse': '_reset',
+    'ResetUpdateResponse': '_reset',
+    'Run': '_run',
+    'RunCountsResponse': '_run',
+    'RunCreateResponse': '_run',
+    'RunDetailsResponse': '_run',
+    'RunDisqualifyResponse': '_run',
+    'RunGetSubmissionFeedbackResponse': '_run',
+    'RunListResponse': '_run',
+    'RunSourceResponse': '_run',
+    'RunStatusResponse': '_run',
+    'School': '_school',
+    'SchoolCreateResponse': '_school',
+    'SchoolListResponse': '_school',
+    'Scoreboard': '_scoreboard',
+    'Session': '_session',
+    'SessionCurrentSessionResponse': '_session',
+    'Submission': '_submission',
+    'SubmissionListResponse': '_submission',
+    'SubmissionSetFeedbackResponse': '_submission',
+    'Tag': '_tag',
+    'TagFrequentTagsResponse': '_tag',
+    'TagListResponse': '_tag',
+    'TeamsGroup': '_teams_group',
+    'TeamsGroupDetailsResponse': '_teams_group',
+    'TeamsGroupListResponse': '_teams_group',
+    'TeamsGroupTeamsMembersResponse': '_teams_group',
+    'TeamsGroupTeamsResponse': '_teams_group',
+    'Time': '_time',
+    'TimeGetResponse': '_time',
+    'User': '_user',
+    'UserCoderOfTheMonthListResponse': '_user',
+    'UserCoderOfTheMonthResponse': '_user',
+    'UserContestStatsResponse': '_user',
+    'UserCreateAPITokenResponse': '_user',
+    'UserCreateResponse': '_user',
+    'UserDeleteRequestResponse': '_user',
+    'UserExtraInformationResponse': '_user',
+    'UserGenerateGitTokenResponse': '_user',
+    'UserGenerateOmiUsersResponse': '_user',
+    'UserLastPrivacyPolicyAcceptedResponse': '_user',
+    'UserListAPITokensResponse': '_user',
+    'UserListAssociatedIdentitiesResponse': '_user',
+    'UserListResponse': '_user',
+    'UserListUnsolvedProblemsResponse': '_user',
+    'UserLoginResponse': '_user',
+    'UserMailingListBackfillResponse': '_user',
+    'UserProblemsCreatedResponse': '_user',
+    'UserProblemsSolvedResponse': '_user',
+    'UserProfileResponse': '_user',
+    'UserStatsResponse': '_user',
+    'UserStatusVerifiedResponse': '_user',
+    'UserValidateFilterResponse': '_user',
+    '_ActivityEvent': '_types',
+    '_ActivityFeedPayload': '_payloads',
+    '_AddedProblem': '_payloads',
+    '_AdminCourses': '_payloads',
+    '_AdminCourses_admin': '_payloads',
+    '_AdminCourses_admin_filteredCourses': '_payloads',
+    '_ApiToken': '_types',
+    '_ApiToken_rate_limit': '_types',
+    '_ArenaAssignment': '_payloads',
+    '_ArenaContest': '_payloads',
+    '_ArenaCourseAssignment': '_payloads',
+    '_ArenaCourseDetails': '_payloads',
+    '_ArenaCoursePayload': '_payloads',
+    '_ArenaCourseProblem': '_payloads',
+    '_ArenaProblemDetails': '_payloads',
+    '_ArenaProblemset': '_payloads',
+    '_AssignmentDetails': '_payloads',
+    '_AssignmentDetailsPayload': '_payloads',
+    '_AssignmentsProblemsPoints': '_payloads',
+    '_AssignmentsProblemsPoints_problems_entry': '_payloads',
+    '_AssociatedIdentity': '_types',
+    '_AuthIdentityExt': '_payloads',
+    '_AuthorRankTablePayload': '_payloads',
+    '_AuthorsRank': '_payloads',
+    '_AuthorsRank_ranking_entry': '_payloads',
+    '_Badge': '_badge',
+    '_BadgeDetailsPayload': '_payloads',
+    '_BadgeListPayload': '_payloads',
+    '_BestSolvers': '_problem',
+    '_CachedExtraProfileDetails': '_payloads',
+    '_CaseResult': '_types',
+    '_CertificateDetailsPayload': '_payloads',
+    '_CertificateListItem': '_certificate',
+    '_CertificateListMinePayload': '_payloads',
+    '_CertificateValidationPayload': '_payloads',
+    '_Clarification': '_types',
+    '_CoderOfTheMonth': '_payloads',
+    '_CoderOfTheMonthList_entry': '_user',
+    '_CoderOfTheMonthPayload': '_payloads',
+    '_CoderOfTheMonthPayload_options': '_payloads',
+    '_CollectionDetailsByAuthorPayload': '_payloads',
+    '_CollectionDetailsByAuthorPayload_tagData_entry': '_payloads',
+    '_CollectionDetailsByLevelPayload': '_payloads',
+    '_CollectionDetailsByLevelPayload_tagData_entry': '_payloads',
+    '_CommonPayload': '_payloads',
+    '_ConsentStatement': '_payloads',
+    '_Contest': '_contest',
+    '_ContestAdmin': '_payloads',
+    '_ContestAdminDetails': '_contest',
+    '_ContestCertificatesAdminDetails': '_payloads',
+    '_ContestDetails': '_contest',
+    '_ContestDetailsPayload': '_payloads',
+    '_ContestDetailsPayload_adminPayload': '_payloads',
+    '_ContestDetailsPayload_original': '_payloads',
+    '_ContestEditPayload': '_payloads',
+    '_ContestGroup': '_payloads',
+    '_ContestGroupAdmin': '_payloads',
+    '_ContestIntroPayload': '_payloads',
+    '_ContestList': '_payloads',
+    '_ContestListItem': '_contest',
+    '_ContestListMinePayload': '_payloads',
+    '_ContestListPayload': '_payloads',
+    '_ContestListv2Payload': '_payloads',
+    '_ContestListv2Payload_countContests': '_payloads',
+    '_ContestNewPayload': '_payloads',
+    '_ContestParticipated': '_user',
+    '_ContestPracticeDetailsPayload': '_payloads',
+    '_ContestPracticeDetailsPayload_adminPayload': '_payloads',
+    '_ContestPracticeDetailsPayload_original': '_payloads',
+    '_ContestPrintDetailsPayload': '_payloads',
+    '_ContestPublicDetails': '_contest',
+    '_ContestReport': '_contest',
+    '_ContestReportDetailsPayload': '_payloads',
+    '_ContestReport_total': '_contest',
+    '_ContestRequest': '_payloads',
+    '_ContestRequest_admin': '_payloads',
+    '_ContestScoreboardPayload': '_payloads',
+    '_ContestUser': '_contest',
+    '_ContestVirtualDetailsPayload': '_payloads',
+    '_Contestant': '_contest',
+    '_Course': '_payloads',
+    '_CourseAdmin': '_payloads',
+    '_CourseAssignment': '_types',
+    '_CourseCardEnrolled': '_payloads',
+    '_CourseCardFinished': '_payloads',
+    '_CourseCardPublic': '_payloads',
+    '_CourseClarificationsPayload': '_payloads',
+    '_CourseCloneDetailsPayload': '_payloads',
+    '_CourseCloneDetailsPayload_creator': '_payloads',
+    '_CourseDetails': '_course',
+    '_CourseDetailsPayload': '_payloads',
+    '_CourseEditPayload': '_payloads',
+    '_CourseGroupAdmin': '_payloads',
+    '_CourseListMinePayload': '_payloads',
+    '_CourseNewPayload': '_payloads',
+    '_CourseProblem': '_course',
+    '_CourseProblemStatistics': '_payloads',
+    '_CourseProblemTried': '_payloads',
+    '_CourseProblemVerdict': '_payloads',
+    '_CourseRun': '_course',
+    '_CourseRun_feedback': '_course',
+    '_CourseScoreboardPayload': '_payloads',
+    '_CourseStatisticsPayload': '_payloads',
+    '_CourseStudent': '_course',
+    '_CourseSubmissionsListPayload': '_payloads',
+    '_CourseTabsPayload': '_payloads',
+    '_CourseTabsPayload_courses': '_payloads',
+    '_CoursesByAccessMode': '_payloads',
+    '_CoursesByAccessMode_filteredCourses': '_payloads',
+    '_CoursesByTimeType': '_payloads',
+    '_CoursesList': '_payloads',
+    '_CurrentSession': '_session',
+    '_EmailEditDetailsPayload': '_payloads',
+    '_Event': '_types',
+    '_Experiment': '_payloads',
+    '_ExtraProfileDetails': '_payloads',
+    '_FilteredCourse': '_payloads',
+    '_FullIDEPayload': '_payloads',
+    '_GraderStatus': '_grader',
+    '_GraderStatus_queue': '_grader',
+    '_GraderStatus_queue_running_entry': '_grader',
+    '_Group': '_payloads',
+    '_GroupEditPayload': '_payloads',
+    '_GroupListItem': '_group',
+    '_GroupListPayload': '_payloads',
+    '_GroupScoreboard': '_group',
+    '_GroupScoreboardContestsPayload': '_payloads',
+    '_GroupScoreboardDetails': '_group_scoreboard',
+    '_GroupScoreboardDetailsPayload': '_payloads',
+    '_Histogram': '_payloads',
+    '_Identity': '_types',
+    '_IdentityExt': '_payloads',
+    '_IdentityRequest': '_course',
+    '_IdentityRequest_admin': '_course',
+    '_IndexPayload': '_payloads',
+    '_IndexPayload_coderOfTheMonthData': '_payloads',
+    '_IndexPayload_currentUserInfo': '_payloads',
+    '_IndexPayload_schoolOfTheMonthData': '_payloads',
+    '_IndexPayload_schoolRank_entry': '_payloads',
+    '_InteractiveInterface': '_payloads',
+    '_InteractiveInterface_ExecutableDescription': '_payloads',
+    '_InteractiveInterface_MakefileRules_entry': '_payloads',
+    '_InteractiveSettingsDistrib': '_problem',
+    '_IntroCourseDetails': '_payloads',
+    '_IntroDetailsPayload': '_course',
+    '_IntroDetailsPayload_statements': '_course',
+    '_LibinteractiveError': '_payloads',
+    '_LibinteractiveGenPayload': '_payloads',
+    '_LimitsSettings': '_problem',
+    '_ListItem': '_types',
+    '_LoginDetailsPayload': '_payloads',
+    '_MergedScoreboardEntry': '_contest',
+    '_MergedScoreboardEntry_contests_value': '_contest',
+    '_MergedScoreboardEntry_total': '_contest',
+    '_NavbarProblemsetProblem': '_payloads',
+    '_NominationListItem': '_quality_nomination',
+    '_NominationListItem_author': '_quality_nomination',
+    '_NominationListItem_contents': '_quality_nomination',
+    '_NominationListItem_nominator': '_quality_nomination',
+    '_NominationListItem_problem': '_quality_nomination',
+    '_NominationListItem_votes_entry': '_quality_nomination',
+    '_NominationListItem_votes_entry_user': '_quality_nomination',
+    '_NominationStatus': '_problem',
+    '_Notification': '_notification',
+    '_NotificationContents': '_notification',
+    '_NotificationContents_body': '_notification',
+    '_OmegaUp_Controllers_Admin__apiPlatformReportStats': '_admin',
+    '_OmegaUp_Controllers_Admin__apiPlatformReportStats_report': '_admin',
+    '_OmegaUp_Controllers_Admin__apiPlatformReportStats_report_omiCourse': '_admin',
+    '_OmegaUp_Controllers_Authorization__apiProblem': '_authorization',
+    '_OmegaUp_Controllers_Badge__apiMyBadgeAssignationTime': '_badge',
+    '_OmegaUp_Controllers_Badge__apiMyList': '_badge',
+    '_OmegaUp_Controllers_Badge__apiUserList': '_badge',
+    '_OmegaUp_Controllers_Certificate__apiGetCertificatePdf': '_certificate',
+    '_OmegaUp_Controllers_Certificate__apiGetUserCertificates': '_certificate',
+    '_OmegaUp_Controllers_Certificate__apiValidateCertificate': '_certificate',
+    '_OmegaUp_Controllers_Clarification__apiDetails': '_clarification',
+    '_OmegaUp_Controllers_Contest__apiActivityReport': '_contest',
+    '_OmegaUp_Controllers_Contest__apiAddProblem': '_contest',
+    '_OmegaUp_Controllers_Contest__apiAdminList': '_contest',
+    '_OmegaUp_Controllers_Contest__apiAdmins': '_contest',
+    '_OmegaUp_Controllers_Contest__apiAdmins_admins_entry': '_contest',
+    '_OmegaUp_Controllers_Contest__apiAdmins_group_admins_entry': '_contest',
+    '_OmegaUp_Controllers_Contest__apiClarifications': '_contest',
+    '_OmegaUp_Controllers_Contest__apiClone': '_contest',
+    '_OmegaUp_Controllers_Contest__apiContestants': '_contest',
+    '_OmegaUp_Controllers_Contest__apiCreateVirtual': '_contest',
+    '_OmegaUp_Controllers_Contest__apiGetNumberOfContestants': '_contest',
+    '_OmegaUp_Controllers_Contest__apiList': '_contest',
+    '_OmegaUp_Controllers_Contest__apiListParticipating': '_contest',
+    '_OmegaUp_Controllers_Contest__apiMyList': '_contest',
+    '_OmegaUp_Controllers_Contest__apiProblemClarifications': '_contest',
+    '_OmegaUp_Controllers_Contest__apiProblems': '_contest',
+    '_OmegaUp_Controllers_Contest__apiReport': '_contest',
+    '_OmegaUp_Controllers_Contest__apiReport_problems_entry': '_contest',
+    '_OmegaUp_Controllers_Contest__apiRequests': '_contest',
+    '_OmegaUp_Controllers_Contest__apiRequests_users_entry': '_contest',
+    '_OmegaUp_Controllers_Contest__apiRequests_users_entry_admin': '_contest',
+    '_OmegaUp_Controllers_Contest__apiRole': '_contest',
+    '_OmegaUp_Controllers_Contest__apiRuns': '_contest',
+    '_OmegaUp_Controllers_Contest__apiRunsDiff': '_contest',
+    '_OmegaUp_Controllers_Contest__apiRunsDiff_diff_entry': '_contest',
+    '_OmegaUp_Controllers_Contest__apiScoreboardEvents': '_contest',
+    '_OmegaUp_Controllers_Contest__apiScoreboardMerge': '_contest',
+    '_OmegaUp_Controllers_Contest__apiSearchUsers': '_contest',
+    '_OmegaUp_Controllers_Contest__apiStats': '_contest',
+    '_OmegaUp_Controllers_Contest__apiUpdate': '_contest',
+    '_OmegaUp_Controllers_Contest__apiUsers': '_contest',
+    '_OmegaUp_Controllers_Contest__apiUsers_groups_entry': '_contest',
+    '_OmegaUp_Controllers_Course__apiActivityReport': '_course',
+    '_OmegaUp_Controllers_Course__apiAddProblem': '_course',
+    '_OmegaUp_Controllers_Course__apiAdmins': '_course',
+    '_OmegaUp_Controllers_Course__apiAdmins_admins_entry': '_course',
+    '_OmegaUp_Controllers_Course__apiAdmins_group_admins_entry': '_course',
+    '_OmegaUp_Controllers_Course__apiAdmins_group_teaching_assistants_entry': '_course',
+    '_OmegaUp_Controllers_Course__apiAdmins_teaching_assistants_entry': '_course',
+    '_OmegaUp_Controllers_Course__apiAssignmentDetails': '_course',
+    '_OmegaUp_Controllers_Course__apiAssignmentScoreboardEvents': '_course',
+    '_OmegaUp_Controllers_Course__apiClarifications': '_course',
+    '_OmegaUp_Controllers_Course__apiClone': '_course',
+    '_OmegaUp_Controllers_Course__apiGenerateTokenForCloneCourse': '_course',
+    '_OmegaUp_Controllers_Course__apiGetProblemUsers': '_course',
+    '_OmegaUp_Controllers_Course__apiListAssignments': '_course',
+    '_OmegaUp_Controllers_Course__apiListSolvedProblems': '_course',
+    '_OmegaUp_Controllers_Course__apiListSolvedProblems_user_problems_value_entry': '_course',
+    '_OmegaUp_Controllers_Course__apiListStudents': '_course',
+    '_OmegaUp_Controllers_Course__apiListUnsolvedProblems': '_course',
+    '_OmegaUp_Controllers_Course__apiListUnsolvedProblems_user_problems_value_entry': '_course',
+    '_OmegaUp_Controllers_Course__apiMyProgress': '_course',
+    '_OmegaUp_Controllers_Course__apiProblemClarifications': '_course',
+    '_OmegaUp_Controllers_Course__apiRequests': '_course',
+    '_OmegaUp_Controllers_Course__apiRuns': '_course',
+    '_OmegaUp_Controllers_Course__apiSearchUsers': '_course',
+    '_OmegaUp_Controllers_Course__apiStudentProgress': '_course',
+    '_OmegaUp_Controllers_Course__apiStudentsProgress': '_course',
+    '_OmegaUp_Controllers_Grader__apiStatus': '_grader',
+    '_OmegaUp_Controllers_GroupScoreboard__apiList': '_group_scoreboard',
+    '_OmegaUp_Controllers_GroupScoreboard__apiList_scoreboards_entry': '_group_scoreboard',
+    '_OmegaUp_Controllers_Group__apiDetails': '_group',
+    '_OmegaUp_Controllers_Group__apiDetails_group': '_group',
+    '_OmegaUp_Controllers_Group__apiMembers': '_group',
+    '_OmegaUp_Controllers_Group__apiMyList': '_group',
+    '_OmegaUp_Controllers_Group__apiMyList_groups_entry': '_group',
+    '_OmegaUp_Controllers_Identity__apiCreate': '_identity',
+    '_OmegaUp_Controllers_Notification__apiMyList': '_notification',
+    '_OmegaUp_Controllers_ProblemForfeited__apiGetCounts': '_problem_forfeited',
+    '_OmegaUp_Controllers_Problem__apiAddTag': '_problem',
+    '_OmegaUp_Controllers_Problem__apiAdminList': '_problem',
+    '_OmegaUp_Controllers_Problem__apiAdmins': '_problem',
+    '_OmegaUp_Controllers_Problem__apiBestScore': '_problem',
+    '_OmegaUp_Controllers_Problem__apiClarifications': '_problem',
+    '_OmegaUp_Controllers_Problem__apiList': '_problem',
+    '_OmegaUp_Controllers_Problem__apiListForTypeahead': '_problem',
+    '_OmegaUp_Controllers_Problem__apiMyList': '_problem',
+    '_OmegaUp_Controllers_Problem__apiRandomKarelProblem': '_problem',
+    '_OmegaUp_Controllers_Problem__apiRandomLanguageProblem': '_problem',
+    '_OmegaUp_Controllers_Problem__apiRuns': '_problem',
+    '_OmegaUp_Controllers_Problem__apiRunsDiff': '_problem',
+    '_OmegaUp_Controllers_Problem__apiSolution': '_problem',
+    '_OmegaUp_Controllers_Problem__apiStats': '_problem',
+    '_OmegaUp_Controllers_Problem__apiTags': '_problem',
+    '_OmegaUp_Controllers_Problem__apiTags_tags_entry': '_problem',
+    '_OmegaUp_Controllers_Problem__apiUpdate': '_problem',
+    '_OmegaUp_Controllers_Problem__apiVersions': '_problem',
+    '_OmegaUp_Controllers_Problemset__apiScoreboardEvents': '_problemset',
+    '_OmegaUp_Controllers_QualityNomination__apiCreate': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails_author': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails_contents': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails_nominator': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails_original_contents': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails_original_contents_tags_entry': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails_problem': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry_user': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiList': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_author': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_contents': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_nominator': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_problem': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry_user': '_quality_nomination',
+    '_OmegaUp_Controllers_QualityNomination__apiMyList': '_quality_nomination',
+    '_OmegaUp_Controllers_Reset__apiCreate': '_reset',
+    '_OmegaUp_Controllers_Reset__apiGenerateToken': '_reset',
+    '_OmegaUp_Controllers_Reset__apiUpdate': '_reset',
+    '_OmegaUp_Controllers_Run__apiCounts': '_run',
+    '_OmegaUp_Controllers_Run__apiCreate': '_run',
+    '_OmegaUp_Controllers_Run__apiDisqualify': '_run',
+    '_OmegaUp_Controllers_Run__apiDisqualify_runs_entry': '_run',
+    '_OmegaUp_Controllers_Run__apiList': '_run',
+    '_OmegaUp_Controllers_Run__apiSource': '_run',
+    '_OmegaUp_Controllers_Run__apiSource_details': '_run',
+    '_OmegaUp_Controllers_Run__apiSource_details_groups_entry': '_run',
+    '_OmegaUp_Controllers_School__apiCreate': '_school',
+    '_OmegaUp_Controllers_School__apiList': '_school',
+    '_OmegaUp_Controllers_Session__apiCurrentSession': '_session',
+    '_OmegaUp_Controllers_Submission__apiList': '_submission',
+    '_OmegaUp_Controllers_Submission__apiSetFeedback': '_submission',
+    '_OmegaUp_Controllers_Tag__apiFrequentTags': '_tag',
+    '_OmegaUp_Controllers_Tag__apiList_entry': '_tag',
+    '_OmegaUp_Controllers_TeamsGroup__apiDetails': '_teams_group',
+    '_OmegaUp_Controllers_TeamsGroup__apiDetails_team_group': '_teams_group',
+    '_OmegaUp_Controllers_TeamsGroup__apiTeams': '_teams_group',
+    '_OmegaUp_Controllers_TeamsGroup__apiTeamsMembers': '_teams_group',
+    '_OmegaUp_Controllers_Time__apiGet': '_time',
+    '_OmegaUp_Controllers_User__apiCoderOfTheMonth': '_user',
+    '_OmegaUp_Controllers_User__apiCoderOfTheMonthList': '_user',
+    '_OmegaUp_Controllers_User__apiContestStats': '_user',
+    '_OmegaUp_Controllers_User__apiCreate': '_user',
+    '_OmegaUp_Controllers_User__apiCreateAPIToken': '_user',
+    '_OmegaUp_Controllers_User__apiDeleteRequest': '_user',
+    '_OmegaUp_Controllers_User__apiExtraInformation': '_user',
+    '_OmegaUp_Controllers_User__apiGenerateGitToken': '_user',
+    '_OmegaUp_Controllers_User__apiLastPrivacyPolicyAccepted': '_user',
+    '_OmegaUp_Controllers_User__apiList': '_user',
+    '_OmegaUp_Controllers_User__apiListAPITokens': '_user',
+    '_OmegaUp_Controllers_User__apiListAssociatedIdentities': '_user',
+    '_OmegaUp_Controllers_User__apiListUnsolvedProblems': '_user',
+    '_OmegaUp_Controllers_User__apiLogin': '_user',
+    '_OmegaUp_Controllers_User__apiMailingListBackfill': '_user',
+    '_OmegaUp_Controllers_User__apiProblemsCreated': '_user',
+    '_OmegaUp_Controllers_User__apiProblemsSolved': '_user',
+    '_OmegaUp_Controllers_User__apiStats': '_user',
+    '_OmegaUp_Controllers_User__apiStatusVerified': '_user',
+    '_OmegaUp_Controllers_User__apiValidateFilter': '_user',
+    '_OmegaUp_DAO_VO_Contests': '_payloads',
+    '_OmegaUp_DAO_VO_Countries': '_payloads',
+    '_OmegaUp_DAO_VO_Identities': '_session',
+    '_OmegaUp_DAO_VO_SubmissionFeedback': '_submission',
+    '_OmegaUp_DAO_VO_SubmissionFeedbackThread': '_submission',
+    '_OmegaUp_DAO_VO_Users': '_session',
+    '_PageItem': '_types',
+    '_Participant': '_payloads',
+    '_PrivacyPolicyDetailsPayload': '_payloads',
+    '_PrivacyStatement': '_course',
+    '_Problem': '_user',
+    '_ProblemAdmin': '_problem',
+    '_ProblemCasesContents_value': '_types',
+    '_ProblemDetails': '_problem',
+    '_ProblemDetailsPayload': '_payloads',
+    '_ProblemEditPayload': '_payloads',
+    '_ProblemFormPayload': '_payloads',
+    '_ProblemFormPayload_tags_entry': '_payloads',
+    '_ProblemGroupAdmin': '_problem',
+    '_ProblemInfo': '_payloads',
+    '_ProblemListCollectionPayload': '_payloads',
+    '_ProblemListCollectionPayload_problemCount_entry': '_payloads',
+    '_ProblemListItem': '_problem',
+    '_ProblemListItem_tags_entry': '_problem',
+    '_ProblemListPayload': '_payloads',
+    '_ProblemListPayload_tagData_entry': '_payloads',
+    '_ProblemPrintDetailsPayload': '_payloads',
+    '_ProblemQualityPayload': '_types',
+    '_ProblemSettings': '_payloads',
+    '_ProblemSettingsDistrib': '_problem',
+    '_ProblemSettingsDistrib_cases_value': '_problem',
+    '_ProblemSettingsDistrib_validator': '_problem',
+    '_ProblemSettingsDistrib_validator_custom_validator': '_problem',
+    '_ProblemSettings_Cases_entry': '_payloads',
+    '_ProblemSettings_Cases_entry_Cases_entry': '_payloads',
+    '_ProblemSettings_Interactive': '_payloads',
+    '_ProblemSettings_Validator': '_payloads',
+    '_ProblemStatement': '_types',
+    '_ProblemVersion': '_types',
+    '_ProblemsMineInfoPayload': '_payloads',
+    '_Problemset': '_problemset',
+    '_ProblemsetProblem': '_types',
+    '_ProblemsetProblemWithVersions': '_contest',
+    '_ProblemsetProblemWithVersions_versions': '_contest',
+    '_Problemset_users_entry': '_problemset',
+    '_ProblemsetterInfo': '_problem',
+    '_Progress': '_course',
+    '_Run': '_types',
+    '_RunDetails': '_run',
+    '_RunDetailsGroup': '_types',
+    '_RunDetailsV2': '_problem',
+    '_RunDetailsV2_details': '_problem',
+    '_RunDetails_details': '_run',
+    '_RunMetadata': '_types',
+    '_RunWithDetails': '_problem',
+    '_RunsDiff': '_problem',
+    '_School': '_payloads',
+    '_SchoolCoderOfTheMonth': '_payloads',
+    '_SchoolListItem': '_school',
+    '_SchoolOfTheMonthPayload': '_payloads',
+    '_SchoolOfTheMonthPayload_candidatesToSchoolOfTheMonth_entry': '_payloads',
+    '_SchoolOfTheMonthPayload_options': '_payloads',
+    '_SchoolOfTheMonthPayload_schoolsOfPreviousMonth_entry': '_payloads',
+    '_SchoolOfTheMonthPayload_schoolsOfPreviousMonths_entry': '_payloads',
+    '_SchoolProblemsSolved': '_payloads',
+    '_SchoolProfileDetailsPayload': '_payloads',
+    '_SchoolProfileDetailsPayload_country': '_payloads',
+    '_SchoolRankPayload': '_payloads',
+    '_SchoolUser': '_payloads',
+    '_Scoreboard': '_types',
+    '_ScoreboardContest': '_group_scoreboard',
+    '_ScoreboardDetails': '_group_scoreboard',
+    '_ScoreboardEvent': '_types',
+    '_ScoreboardEvent_problem': '_types',
+    '_ScoreboardEvent_total': '_types',
+    '_ScoreboardMergePayload': '_payloads',
+    '_ScoreboardRanking': '_group_scoreboard',
+    '_ScoreboardRankingEntry': '_types',
+    '_ScoreboardRankingEntry_total': '_types',
+    '_ScoreboardRankingProblem': '_types',
+    '_ScoreboardRankingProblemDetailsGroup': '_types',
+    '_ScoreboardRankingProblemDetailsGroup_cases_entry': '_types',
+    '_ScoreboardRankingProblem_run_details': '_types',
+    '_ScoreboardRankingProblem_run_details_details': '_types',
+    '_ScoreboardRanking_contests_value': '_group_scoreboard',
+    '_ScoreboardRanking_total': '_group_scoreboard',
+    '_Scoreboard_problems_entry': '_types',
+    '_SelectedTag': '_payloads',
+    '_SettingLimits': '_problem',
+    '_Signature': '_types',
+    '_StatsPayload': '_payloads',
+    '_StudentProgress': '_payloads',
+    '_StudentProgressByAssignmentPayload': '_payloads',
+    '_StudentProgressInCourse': '_course',
+    '_StudentProgressInCourse_assignments_value': '_course',
+    '_StudentProgressInCourse_assignments_value_problems_value': '_course',
+    '_StudentProgressPayload': '_payloads',
+    '_StudentsProgressPayload': '_payloads',
+    '_Submission': '_submission',
+    '_SubmissionFeedback': '_types',
+    '_SubmissionFeedbackThread': '_types',
+    '_SubmissionsListPayload': '_payloads',
+    '_SupportDetailsPayload': '_payloads',
+    '_Tag': '_payloads',
+    '_TagWithProblemCount': '_tag',
+    '_TeamGroupEditPayload': '_payloads',
+    '_TeamGroupEditPayload_teamGroup': '_payloads',
+    '_TeamGroupNewPayload': '_payloads',
+    '_TeamMember': '_teams_group',
+    '_TeamsGroup': '_payloads',
+    '_TeamsGroupListPayload': '_payloads',
+    '_UserDependent': '_payloads',
+    '_UserDependentsPayload': '_payloads',
+    '_UserDetailsPayload': '_payloads',
+    '_UserInfoForProblem': '_payloads',
+    '_UserProfile': '_user',
+    '_UserProfileContests_value': '_user',
+    '_UserProfileDetailsPayload': '_payloads',
+    '_UserProfileInfo': '_user',
+    '_UserProfileInfo_rankinfo': '_user',
+    '_UserProfileStats': '_user',
+    '_UserRank': '_payloads',
+    '_UserRankInfo': '_payloads',
+    '_UserRankTablePayload': '_payloads',
+    '_UserRankTablePayload_availableFilters': '_payloads',
+    '_UserRank_rank_entry': '_payloads',
+    '_UserRole': '_payloads',
+    '_UserRolesPayload': '_payloads',
+    '_UserRolesPayload_userSystemGroups_value': '_payloads',
+    '_UserRolesPayload_userSystemRoles_value': '_payloads',
+    '_VerificationParentalTokenDetailsPayload': '_payloads',
+}
+"""Maps the lazily-loaded attributes of this module to their submodule."""
+
+
+def __getattr__(name: str) -> Any:
+    """Loads the controllers and response types on first access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(f'{__name__}.{module_name}'),
+                    name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Lists the lazily-loaded attributes alongside the loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+class Client:
+    """.""",
+
+    def __init__(self,
+                 *,
+                 username: Optional[str] = None,
+                 password: Optional[str] = None,
+                 api_token: Optional[str] = None,
+                 auth_token: Optional[str] = None,
+                 url: str = 'https://omegaup.com',
+                 timestamps: str = 'local') -> None:
+        if timestamps not in _decoder.TIMESTAMP_POLICIES:
+            raise ValueError(f'Unsupported timestamp policy: {timestamps!r}')
+        self._url = url
+        self.timestamps = timestamps
+        self.username: Optional[str] = username
+        self.api_token: Optional[str] = api_token
+        self.auth_token: Optional[str] = None
+        if api_token is None:
+            if username is None:
+                raise ValueError(
+                    'username cannot be None if api_token is not provided', )
+            if auth_token is not None:
+                self.auth_token = auth_token
+            elif password is not None:
+                self.auth_token = self.query('/api/user/login/',
+                                             payload={
+                                                 'usernameOrEmail': username,
+                                                 'password': password,
+                                             })['auth_token']
+        self._admin: Optional[Admin] = None
+        self._authorization: Optional[Authorization] = None
+        self._badge: Optional[Badge] = None
+        self._certificate: Optional[Certificate] = None
+        self._clarification: Optional[Clarification] = None
+        self._contest: Optional[Contest] = None
+        self._course: Optional[Course] = None
+        self._grader: Optional[Grader] = None
+        self._group: Optional[Group] = None
+        self._groupScoreboard: Optional[GroupScoreboard] = None
+        self._identity: Optional[Identity] = None
+        self._notification: Optional[Notification] = None
+        self._problem: Optional[Problem] = None
+        self._problemForfeited: Optional[ProblemForfeited] = None
+        self._problemset: Optional[Problemset] = None
+        self._qualityNomination: Optional[QualityNomination] = None
+        self._reset: Optional[Reset] = None
+        self._run: Optional[Run] = None
+        self._school: Optional[School] = None
+        self._scoreboard: Optional[Scoreboard] = None
+        self._session: Optional[Session] = None
+        self._submission: Optional[Submission] = None
+        self._tag: Optional[Tag] = None
+        self._teamsGroup: Optional[TeamsGroup] = None
+        self._time: Optional[Time] = None
+        self._user: Optional[User] = None
+
+    def _post(self, endpoint: str, payload: Optional[Mapping[str, str]],
+              files_: Optional[Mapping[str, BinaryIO]],
+              timeout_: datetime.timedelta,
+              stream: bool) -> requests.Response:
+        """Sends an authenticated request to the omegaUp API."""
+        logger = logging.getLogger('omegaup')
+        if payload is None:
+            payload = {}
+        else:
+            payload = dict(payload)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Calling endpoint: %s', endpoint)
+            logger.debug('Payload: %s', _filterKeys(payload, {'password'}))
+
+        headers = {}
+        if self.api_token is not None:
+            if self.username is not None:
+                headers['Authorization'] = ','.join((
+                    f'Credential={self.api_token}',
+                    f'Username={self.username}',
+                ))
+            else:
+                headers['Authorization'] = f'token {self.api_token}'
+        elif self.auth_token is not None:
+            payload['ouat'] = self.auth_token
+
+        return requests.post(urllib.parse.urljoin(self._url, endpoint),
+                             data=payload,
+                             headers=headers,
+                             files=files_,
+                             timeout=timeout_.total_seconds(),
+                             stream=stream)
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              files_: Optional[Mapping[str, BinaryIO]] = None,
+              timeout_: datetime.timedelta = _DEFAULT_TIMEOUT,
+              check_: bool = True) -> ApiReturnType:
+        """Issues a raw query to the omegaUp API."""
+        logger = logging.getLogger('omegaup')
+        r = self._post(endpoint, payload, files_, timeout_, stream=False)
+
+        try:
+            response: ApiReturnType = r.json()
+        except:  # noqa: bare-except Re-raised below
+            logger.exception(r.text)
+            raise
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.info('Response: %s', _filterKeys(response, {'auth_token'}))
+
+        if check_ and r.status_code != 200:
+            raise Exception(response)
+
+        return response
+
+    def query_stream(self,
+                     endpoint: str,
+                     key: str,
+                     payload: Optional[Mapping[str, str]] = None,
+                     files_: Optional[Mapping[str, BinaryIO]] = None,
+                     timeout_: datetime.timedelta = _DEFAULT_TIMEOUT,
+                     check_: bool = True,
+                     chunk_size_: int = _STREAM_CHUNK_SIZE) -> Iterator[Any]:
+        """Issues a raw query to the omegaUp API, streaming the response.
+
+        The response is parsed incrementally, and the elements of the array
+        in the top-level `key` member are yielded as soon as each one has
+        been fully received. The request is not sent until the first element
+        is requested.
+        """
+        logger = logging.getLogger('omegaup')
+        with self._post(endpoint, payload, files_, timeout_,
+                        stream=True) as r:
+            if r.status_code != 200:
+                try:
+                    response: ApiReturnType = r.json()
+                except:  # noqa: bare-except Re-raised below
+                    logger.exception(r.text)
+                    raise
+                if check_:
+                    raise Exception(response)
+                return
+            yield from _jsonstream.iter_array(
+                r.iter_content(chunk_size=chunk_size_), key)
+
+    @property
+    def admin(self) -> 'Admin':
+        """Returns the Admin API."""
+        if self._admin is None:
+            from omegaup.api import _admin
+            self._admin = _admin.Admin(self)
+        return self._admin
+
+    @property
+    def authorization(self) -> 'Authorization':
+        """Returns the Authorization API."""
+        if self._authorization is None:
+            from omegaup.api import _authorization
+            self._authorization = _authorization.Authorization(self)
+        return self._authorization
+
+    @property
+    def badge(self) -> 'Badge':
+        """Returns the Badge API."""
+        if self._badge is None:
+            from omegaup.api import _badge
+            self._badge = _badge.Badge(self)
+        return self._badge
+
+    @property
+    def certificate(self) -> 'Certificate':
+        """Returns the Certificate API."""
+        if self._certificate is None:
+            from omegaup.api import _certificate
+            self._certificate = _certificate.Certificate(self)
+        return self._certificate
+
+    @property
+    def clarification(self) -> 'Clarification':
+        """Returns the Clarification API."""
+        if self._clarification is None:
+            from omegaup.api import _clarification
+            self._clarification = _clarification.Clarification(self)
+        return self._clarification
+
+    @property
+    def contest(self) -> 'Contest':
+        """Returns the Contest API."""
+        if self._contest is None:
+            from omegaup.api import _contest
+            self._contest = _contest.Contest(self)
+        return self._contest
+
+    @property
+    def course(self) -> 'Course':
+        """Returns the Course API."""
+        if self._course is None:
+            from omegaup.api import _course
+            self._course = _course.Course(self)
+        return self._course
+
+    @property
+    def grader(self) -> 'Grader':
+        """Returns the Grader API."""
+        if self._grader is None:
+            from omegaup.api import _grader
+            self._grader = _grader.Grader(self)
+        return self._grader
+
+    @property
+    def group(self) -> 'Group':
+        """Returns the Group API."""
+        if self._group is None:
+            from omegaup.api import _group
+            self._group = _group.Group(self)
+        return self._group
+
+    @property
+    def groupScoreboard(self) -> 'GroupScoreboard':
+        """Returns the GroupScoreboard API."""
+        if self._groupScoreboard is None:
+            from omegaup.api import _group_scoreboard
+            self._groupScoreboard = _group_scoreboard.GroupScoreboard(self)
+        return self._groupScoreboard
+
+    @property
+    def identity(self) -> 'Identity':
+        """Returns the Identity API."""
+        if self._identity is None:
+            from omegaup.api import _identity
+            self._identity = _identity.Identity(self)
+        return self._identity
+
+    @property
+    def notification(self) -> 'Notification':
+        """Returns the Notification API."""
+        if self._notification is None:
+            from omegaup.api import _notification
+            self._notification = _notification.Notification(self)
+        return self._notification
+
+    @property
+    def problem(self) -> 'Problem':
+        """Returns the Problem API."""
+        if self._problem is None:
+            from omegaup.api import _problem
+            self._problem = _problem.Problem(self)
+        return self._problem
+
+    @property
+    def problemForfeited(self) -> 'ProblemForfeited':
+        """Returns the ProblemForfeited API."""
+        if self._problemForfeited is None:
+            from omegaup.api import _problem_forfeited
+            self._problemForfeited = _problem_forfeited.ProblemForfeited(self)
+        return self._problemForfeited
+
+    @property
+    def problemset(self) -> 'Problemset':
+        """Returns the Problemset API."""
+        if self._problemset is None:
+            from omegaup.api import _problemset
+            self._problemset = _problemset.Problemset(self)
+        return self._problemset
+
+    @property
+    def qualityNomination(self) -> 'QualityNomination':
+        """Returns the QualityNomination API."""
+        if self._qualityNomination is None:
+            from omegaup.api import _quality_nomination
+            self._qualityNomination = _quality_nomination.QualityNomination(self)
+        return self._qualityNomination
+
+    @property
+    def reset(self) -> 'Reset':
+        """Returns the Reset API."""
+        if self._reset is None:
+            from omegaup.api import _reset
+            self._reset = _reset.Reset(self)
+        return self._reset
+
+    @property
+    def run(self) -> 'Run':
+        """Returns the Run API."""
+        if self._run is None:
+            from omegaup.api import _run
+            self._run = _run.Run(self)
+        return self._run
+
+    @property
+    def school(self) -> 'School':
+        """Returns the School API."""
+        if self._school is None:
+            from omegaup.api import _school
+            self._school = _school.School(self)
+        return self._school
+
+    @property
+    def scoreboard(self) -> 'Scoreboard':
+        """Returns the Scoreboard API."""
+        if self._scoreboard is None:
+            from omegaup.api import _scoreboard
+            self._scoreboard = _scoreboard.Scoreboard(self)
+        return self._scoreboard
+
+    @property
+    def session(self) -> 'Session':
+        """Returns the Session API."""
+        if self._session is None:
+            from omegaup.api import _session
+            self._session = _session.Session(self)
+        return self._session
+
+    @property
+    def submission(self) -> 'Submission':
+        """Returns the Submission API."""
+        if self._submission is None:
+            from omegaup.api import _submission
+            self._submission = _submission.Submission(self)
+        return self._submission
+
+    @property
+    def tag(self) -> 'Tag':
+        """Returns the Tag API."""
+        if self._tag is None:
+            from omegaup.api import _tag
+            self._tag = _tag.Tag(self)
+        return self._tag
+
+    @property
+    def teamsGroup(self) -> 'TeamsGroup':
+        """Returns the TeamsGroup API."""
+        if self._teamsGroup is None:
+            from omegaup.api import _teams_group
+            self._teamsGroup = _teams_group.TeamsGroup(self)
+        return self._teamsGroup
+
+    @property
+    def time(self) -> 'Time':
+        """Returns the Time API."""
+        if self._time is None:
+            from omegaup.api import _time
+            self._time = _time.Time(self)
+        return self._time
+
+    @property
+    def user(self) -> 'User':
+        """Returns the User API."""
+        if self._user is None:
+            from omegaup.api import _user
+            self._user = _user.User(self)
+        return self._user
@@ -0,0 +1,121 @@
+"""The omegaUp Admin API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Admin__apiPlatformReportStats:
+    """_OmegaUp_Controllers_Admin__apiPlatformReportStats"""
+    report: '_OmegaUp_Controllers_Admin__apiPlatformReportStats_report'
+
+    def __init__(
+        self,
+        *,
+        report: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.report = _OmegaUp_Controllers_Admin__apiPlatformReportStats_report(
+            **report)
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Admin__apiPlatformReportStats_report:
+    """_OmegaUp_Controllers_Admin__apiPlatformReportStats_report"""
+    acceptedSubmissions: int
+    activeSchools: int
+    activeUsers: Dict[str, int]
+    courses: int
+    omiCourse: '_OmegaUp_Controllers_Admin__apiPlatformReportStats_report_omiCourse'
+
+    def __init__(
+        self,
+        *,
+        acceptedSubmissions: int,
+        activeSchools: int,
+        activeUsers: Dict[str, int],
+        courses: int,
+        omiCourse: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.acceptedSubmissions = acceptedSubmissions
+        self.activeSchools = activeSchools
+        self.activeUsers = {k: v for k, v in activeUsers.items()}
+        self.courses = courses
+        self.omiCourse = _OmegaUp_Controllers_Admin__apiPlatformReportStats_report_omiCourse(
+            **omiCourse)
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Admin__apiPlatformReportStats_report_omiCourse:
+    """_OmegaUp_Controllers_Admin__apiPlatformReportStats_report_omiCourse"""
+    attemptedUsers: int
+    completedUsers: int
+    passedUsers: int
+
+    def __init__(
+        self,
+        *,
+        attemptedUsers: int,
+        completedUsers: int,
+        passedUsers: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.attemptedUsers = attemptedUsers
+        self.completedUsers = completedUsers
+        self.passedUsers = passedUsers
+
+
+AdminPlatformReportStatsResponse = _OmegaUp_Controllers_Admin__apiPlatformReportStats
+"""The return type of the AdminPlatformReportStats API."""
+
+
+class Admin:
+    r"""
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def platformReportStats(
+        self,
+        *,
+        end_time: Optional[int] = None,
+        start_time: Optional[int] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> AdminPlatformReportStatsResponse:
+        r"""Get stats for an overall platform report.
+
+        Args:
+            end_time:
+            start_time:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if end_time is not None:
+            parameters['end_time'] = str(end_time)
+        if start_time is not None:
+            parameters['start_time'] = str(start_time)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Admin__apiPlatformReportStats,
+            self._client.query('/api/admin/platformReportStats/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
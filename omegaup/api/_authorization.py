@@ -0,0 +1,83 @@
+"""The omegaUp Authorization API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Authorization__apiProblem:
+    """_OmegaUp_Controllers_Authorization__apiProblem"""
+    can_edit: bool
+    can_view: bool
+    has_solved: bool
+    is_admin: bool
+
+    def __init__(
+        self,
+        *,
+        can_edit: bool,
+        can_view: bool,
+        has_solved: bool,
+        is_admin: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.can_edit = can_edit
+        self.can_view = can_view
+        self.has_solved = has_solved
+        self.is_admin = is_admin
+
+
+AuthorizationProblemResponse = _OmegaUp_Controllers_Authorization__apiProblem
+"""The return type of the AuthorizationProblem API."""
+
+
+class Authorization:
+    r"""AuthorizationController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def problem(
+        self,
+        *,
+        problem_alias: str,
+        token: str,
+        username: Optional[Any] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> AuthorizationProblemResponse:
+        r"""
+
+        Args:
+            problem_alias:
+            token:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+            'token': token,
+        }
+        if username is not None:
+            parameters['username'] = str(username)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Authorization__apiProblem,
+            self._client.query('/api/authorization/problem/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
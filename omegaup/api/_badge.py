@@ -0,0 +1,253 @@
+"""The omegaUp Badge API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _Badge:
+    """_Badge"""
+    assignation_time: Optional[datetime.datetime]
+    badge_alias: str
+    first_assignation: Optional[datetime.datetime]
+    owners_count: int
+    total_users: int
+
+    def __init__(
+        self,
+        *,
+        badge_alias: str,
+        owners_count: int,
+        total_users: int,
+        assignation_time: Optional[int] = None,
+        first_assignation: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if assignation_time is not None:
+            self.assignation_time = datetime.datetime.fromtimestamp(
+                assignation_time)
+        else:
+            self.assignation_time = None
+        self.badge_alias = badge_alias
+        if first_assignation is not None:
+            self.first_assignation = datetime.datetime.fromtimestamp(
+                first_assignation)
+        else:
+            self.first_assignation = None
+        self.owners_count = owners_count
+        self.total_users = total_users
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Badge__apiMyBadgeAssignationTime:
+    """_OmegaUp_Controllers_Badge__apiMyBadgeAssignationTime"""
+    assignation_time: Optional[datetime.datetime]
+
+    def __init__(
+        self,
+        *,
+        assignation_time: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if assignation_time is not None:
+            self.assignation_time = datetime.datetime.fromtimestamp(
+                assignation_time)
+        else:
+            self.assignation_time = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Badge__apiMyList:
+    """_OmegaUp_Controllers_Badge__apiMyList"""
+    badges: Sequence['_Badge']
+
+    def __init__(
+        self,
+        *,
+        badges: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.badges = [_Badge(**v) for v in badges]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Badge__apiUserList:
+    """_OmegaUp_Controllers_Badge__apiUserList"""
+    badges: Sequence['_Badge']
+
+    def __init__(
+        self,
+        *,
+        badges: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.badges = [_Badge(**v) for v in badges]
+
+
+BadgeListResponse = Sequence[str]
+"""The return type of the BadgeList API."""
+
+BadgeMyListResponse = _OmegaUp_Controllers_Badge__apiMyList
+"""The return type of the BadgeMyList API."""
+
+BadgeUserListResponse = _OmegaUp_Controllers_Badge__apiUserList
+"""The return type of the BadgeUserList API."""
+
+BadgeMyBadgeAssignationTimeResponse = _OmegaUp_Controllers_Badge__apiMyBadgeAssignationTime
+"""The return type of the BadgeMyBadgeAssignationTime API."""
+
+BadgeBadgeDetailsResponse = _Badge
+"""The return type of the BadgeBadgeDetails API."""
+
+
+class Badge:
+    r"""BadgesController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def list(
+            self,
+            *,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> BadgeListResponse:
+        r"""Returns a list of existing badges
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return [
+            v for v in self._client.query('/api/badge/list/',
+                                          payload=parameters,
+                                          files_=files_,
+                                          timeout_=timeout_,
+                                          check_=check_)
+        ]
+
+    def myList(
+        self,
+        *,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> BadgeMyListResponse:
+        r"""Returns a list of badges owned by current user
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_Badge__apiMyList,
+            self._client.query('/api/badge/myList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def userList(
+        self,
+        *,
+        target_username: Optional[Any] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> BadgeUserListResponse:
+        r"""Returns a list of badges owned by a certain user
+
+        Args:
+            target_username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if target_username is not None:
+            parameters['target_username'] = str(target_username)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Badge__apiUserList,
+            self._client.query('/api/badge/userList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def myBadgeAssignationTime(
+        self,
+        *,
+        badge_alias: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> BadgeMyBadgeAssignationTimeResponse:
+        r"""Returns a the assignation timestamp of a badge
+        for current user.
+
+        Args:
+            badge_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if badge_alias is not None:
+            parameters['badge_alias'] = badge_alias
+        return _decoder.decode(
+            _OmegaUp_Controllers_Badge__apiMyBadgeAssignationTime,
+            self._client.query('/api/badge/myBadgeAssignationTime/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def badgeDetails(
+        self,
+        *,
+        badge_alias: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> BadgeBadgeDetailsResponse:
+        r"""Returns the number of owners and the first
+        assignation timestamp for a certain badge
+
+        Args:
+            badge_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if badge_alias is not None:
+            parameters['badge_alias'] = badge_alias
+        return _decoder.decode(
+            _Badge,
+            self._client.query('/api/badge/badgeDetails/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
@@ -0,0 +1,25 @@
+"""Definitions shared by all the omegaUp API modules."""
+
+import datetime
+
+from typing import Any, Dict, Iterable, Mapping
+
+_DEFAULT_TIMEOUT = datetime.timedelta(minutes=1)
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _filterKeys(d: Mapping[str, Any], keys: Iterable[str]) -> Dict[str, Any]:
+    """Returns a copy of the mapping with certain values redacted.
+
+    Any of values mapped to the keys in the `keys` iterable will be replaced
+    with the string '[REDACTED]'.
+    """
+    result: Dict[str, Any] = dict(d)
+    for key in keys:
+        if key in result:
+            result[key] = '[REDACTED]'
+    return result
+
+
+ApiReturnType = Any
+"""The return type of any of the API requests."""
@@ -0,0 +1,220 @@
+"""The omegaUp Certificate API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _CertificateListItem:
+    """_CertificateListItem"""
+    certificate_type: str
+    date: datetime.datetime
+    name: Optional[str]
+    verification_code: str
+
+    def __init__(
+        self,
+        *,
+        certificate_type: str,
+        date: int,
+        verification_code: str,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.certificate_type = certificate_type
+        self.date = datetime.datetime.fromtimestamp(date)
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.verification_code = verification_code
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Certificate__apiGetCertificatePdf:
+    """_OmegaUp_Controllers_Certificate__apiGetCertificatePdf"""
+    certificate: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        certificate: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if certificate is not None:
+            self.certificate = certificate
+        else:
+            self.certificate = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Certificate__apiGetUserCertificates:
+    """_OmegaUp_Controllers_Certificate__apiGetUserCertificates"""
+    certificates: Sequence['_CertificateListItem']
+
+    def __init__(
+        self,
+        *,
+        certificates: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.certificates = [_CertificateListItem(**v) for v in certificates]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Certificate__apiValidateCertificate:
+    """_OmegaUp_Controllers_Certificate__apiValidateCertificate"""
+    valid: bool
+
+    def __init__(
+        self,
+        *,
+        valid: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.valid = valid
+
+
+CertificateGetCertificatePdfResponse = _OmegaUp_Controllers_Certificate__apiGetCertificatePdf
+"""The return type of the CertificateGetCertificatePdf API."""
+
+CertificateGetUserCertificatesResponse = _OmegaUp_Controllers_Certificate__apiGetUserCertificates
+"""The return type of the CertificateGetUserCertificates API."""
+
+CertificateValidateCertificateResponse = _OmegaUp_Controllers_Certificate__apiValidateCertificate
+"""The return type of the CertificateValidateCertificate API."""
+
+
+class Certificate:
+    r"""CertificateController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def generateContestCertificates(
+            self,
+            *,
+            certificates_cutoff: Optional[int] = None,
+            contest_alias: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Generates all the certificates for a contest given its contest alias.
+
+        Args:
+            certificates_cutoff:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if certificates_cutoff is not None:
+            parameters['certificates_cutoff'] = str(certificates_cutoff)
+        if contest_alias is not None:
+            parameters['contest_alias'] = contest_alias
+        self._client.query('/api/certificate/generateContestCertificates/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def getCertificatePdf(
+        self,
+        *,
+        verification_code: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CertificateGetCertificatePdfResponse:
+        r"""API to generate the certificate PDF
+
+        Args:
+            verification_code:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'verification_code': verification_code,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Certificate__apiGetCertificatePdf,
+            self._client.query('/api/certificate/getCertificatePdf/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def getUserCertificates(
+        self,
+        *,
+        user_id: Optional[int] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CertificateGetUserCertificatesResponse:
+        r"""Get all the certificates belonging to a user
+
+        Args:
+            user_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if user_id is not None:
+            parameters['user_id'] = str(user_id)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Certificate__apiGetUserCertificates,
+            self._client.query('/api/certificate/getUserCertificates/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def validateCertificate(
+        self,
+        *,
+        verification_code: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CertificateValidateCertificateResponse:
+        r"""API to validate a certificate
+
+        Args:
+            verification_code:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'verification_code': verification_code,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Certificate__apiValidateCertificate,
+            self._client.query('/api/certificate/validateCertificate/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
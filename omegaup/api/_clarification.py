@@ -0,0 +1,174 @@
+"""The omegaUp Clarification API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import _Clarification
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Clarification__apiDetails:
+    """_OmegaUp_Controllers_Clarification__apiDetails"""
+    answer: Optional[str]
+    message: str
+    problem_id: int
+    problemset_id: Optional[int]
+    time: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        message: str,
+        problem_id: int,
+        time: int,
+        answer: Optional[str] = None,
+        problemset_id: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if answer is not None:
+            self.answer = answer
+        else:
+            self.answer = None
+        self.message = message
+        self.problem_id = problem_id
+        if problemset_id is not None:
+            self.problemset_id = problemset_id
+        else:
+            self.problemset_id = None
+        self.time = datetime.datetime.fromtimestamp(time)
+
+
+ClarificationCreateResponse = _Clarification
+"""The return type of the ClarificationCreate API."""
+
+ClarificationDetailsResponse = _OmegaUp_Controllers_Clarification__apiDetails
+"""The return type of the ClarificationDetails API."""
+
+
+class Clarification:
+    r"""Description of ClarificationController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def create(
+        self,
+        *,
+        message: str,
+        problem_alias: str,
+        assignment_alias: Optional[str] = None,
+        contest_alias: Optional[str] = None,
+        course_alias: Optional[str] = None,
+        username: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ClarificationCreateResponse:
+        r"""Creates a Clarification for a contest or an assignment of a course
+
+        Args:
+            message:
+            problem_alias:
+            assignment_alias:
+            contest_alias:
+            course_alias:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'message': message,
+            'problem_alias': problem_alias,
+        }
+        if assignment_alias is not None:
+            parameters['assignment_alias'] = assignment_alias
+        if contest_alias is not None:
+            parameters['contest_alias'] = contest_alias
+        if course_alias is not None:
+            parameters['course_alias'] = course_alias
+        if username is not None:
+            parameters['username'] = username
+        return _decoder.decode(
+            _Clarification,
+            self._client.query('/api/clarification/create/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def details(
+        self,
+        *,
+        clarification_id: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ClarificationDetailsResponse:
+        r"""API for getting a clarification
+
+        Args:
+            clarification_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'clarification_id': str(clarification_id),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Clarification__apiDetails,
+            self._client.query('/api/clarification/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def update(
+            self,
+            *,
+            clarification_id: int,
+            answer: Optional[str] = None,
+            message: Optional[str] = None,
+            public: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Update a clarification
+
+        Args:
+            clarification_id:
+            answer:
+            message:
+            public:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'clarification_id': str(clarification_id),
+        }
+        if answer is not None:
+            parameters['answer'] = answer
+        if message is not None:
+            parameters['message'] = message
+        if public is not None:
+            parameters['public'] = str(public)
+        self._client.query('/api/clarification/update/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
@@ -0,0 +1,3622 @@
+"""The omegaUp Contest API and its response types."""
+
+import dataclasses
+import datetime
+import functools
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, Mapping, Optional, Sequence
+
+from omegaup import _decoder, _paginate
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import (
+    _ActivityEvent,
+    _Clarification,
+    _ListItem,
+    _PageItem,
+    _ProblemQualityPayload,
+    _ProblemVersion,
+    _ProblemsetProblem,
+    _Run,
+    _Scoreboard,
+    _ScoreboardEvent,
+    _ScoreboardRankingProblem,
+)
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _Contest:
+    """_Contest"""
+    acl_id: Optional[int]
+    admission_mode: str
+    alias: str
+    contest_id: int
+    description: str
+    feedback: Optional[str]
+    finish_time: datetime.datetime
+    languages: Optional[str]
+    last_updated: datetime.datetime
+    original_finish_time: Optional[datetime.datetime]
+    penalty: Optional[int]
+    penalty_calc_policy: Optional[str]
+    penalty_type: Optional[str]
+    points_decay_factor: Optional[float]
+    problemset_id: int
+    recommended: bool
+    rerun_id: Optional[int]
+    score_mode: str
+    scoreboard: Optional[int]
+    scoreboard_url: str
+    scoreboard_url_admin: str
+    show_scoreboard_after: Optional[int]
+    start_time: datetime.datetime
+    submissions_gap: Optional[int]
+    title: str
+    urgent: Optional[int]
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        admission_mode: str,
+        alias: str,
+        contest_id: int,
+        description: str,
+        finish_time: int,
+        last_updated: int,
+        problemset_id: int,
+        recommended: bool,
+        score_mode: str,
+        scoreboard_url: str,
+        scoreboard_url_admin: str,
+        start_time: int,
+        title: str,
+        acl_id: Optional[int] = None,
+        feedback: Optional[str] = None,
+        languages: Optional[str] = None,
+        original_finish_time: Optional[int] = None,
+        penalty: Optional[int] = None,
+        penalty_calc_policy: Optional[str] = None,
+        penalty_type: Optional[str] = None,
+        points_decay_factor: Optional[float] = None,
+        rerun_id: Optional[int] = None,
+        scoreboard: Optional[int] = None,
+        show_scoreboard_after: Optional[int] = None,
+        submissions_gap: Optional[int] = None,
+        urgent: Optional[int] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if acl_id is not None:
+            self.acl_id = acl_id
+        else:
+            self.acl_id = None
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.contest_id = contest_id
+        self.description = description
+        if feedback is not None:
+            self.feedback = feedback
+        else:
+            self.feedback = None
+        self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        if languages is not None:
+            self.languages = languages
+        else:
+            self.languages = None
+        self.last_updated = datetime.datetime.fromtimestamp(last_updated)
+        if original_finish_time is not None:
+            self.original_finish_time = datetime.datetime.fromtimestamp(
+                original_finish_time)
+        else:
+            self.original_finish_time = None
+        if penalty is not None:
+            self.penalty = penalty
+        else:
+            self.penalty = None
+        if penalty_calc_policy is not None:
+            self.penalty_calc_policy = penalty_calc_policy
+        else:
+            self.penalty_calc_policy = None
+        if penalty_type is not None:
+            self.penalty_type = penalty_type
+        else:
+            self.penalty_type = None
+        if points_decay_factor is not None:
+            self.points_decay_factor = points_decay_factor
+        else:
+            self.points_decay_factor = None
+        self.problemset_id = problemset_id
+        self.recommended = recommended
+        if rerun_id is not None:
+            self.rerun_id = rerun_id
+        else:
+            self.rerun_id = None
+        self.score_mode = score_mode
+        if scoreboard is not None:
+            self.scoreboard = scoreboard
+        else:
+            self.scoreboard = None
+        self.scoreboard_url = scoreboard_url
+        self.scoreboard_url_admin = scoreboard_url_admin
+        if show_scoreboard_after is not None:
+            self.show_scoreboard_after = show_scoreboard_after
+        else:
+            self.show_scoreboard_after = None
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        if submissions_gap is not None:
+            self.submissions_gap = submissions_gap
+        else:
+            self.submissions_gap = None
+        self.title = title
+        if urgent is not None:
+            self.urgent = urgent
+        else:
+            self.urgent = None
+        if window_length is not None:
+            self.window_length = window_length
+        else:
+            self.window_length = None
+
+
+@dataclasses.dataclass
+class _ContestAdminDetails:
+    """_ContestAdminDetails"""
+    admin: bool
+    admission_mode: str
+    alias: str
+    archived: bool
+    available_languages: Dict[str, str]
+    contest_for_teams: bool
+    default_show_all_contestants_in_scoreboard: bool
+    description: str
+    director: str
+    feedback: str
+    finish_time: datetime.datetime
+    has_submissions: bool
+    languages: Sequence[str]
+    needs_basic_information: bool
+    opened: bool
+    original_contest_alias: Optional[str]
+    original_problemset_id: Optional[int]
+    penalty: int
+    penalty_calc_policy: str
+    penalty_type: str
+    points_decay_factor: float
+    problems: Optional[Sequence['_ProblemsetProblem']]
+    problemset_id: int
+    requests_user_information: str
+    rerun_id: Optional[int]
+    score_mode: str
+    scoreboard: int
+    scoreboard_url: Optional[str]
+    scoreboard_url_admin: Optional[str]
+    show_penalty: bool
+    show_scoreboard_after: bool
+    start_time: datetime.datetime
+    submission_deadline: Optional[datetime.datetime]
+    submissions_gap: int
+    title: str
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        admin: bool,
+        admission_mode: str,
+        alias: str,
+        archived: bool,
+        available_languages: Dict[str, str],
+        contest_for_teams: bool,
+        default_show_all_contestants_in_scoreboard: bool,
+        description: str,
+        director: str,
+        feedback: str,
+        finish_time: int,
+        has_submissions: bool,
+        languages: Sequence[str],
+        needs_basic_information: bool,
+        opened: bool,
+        penalty: int,
+        penalty_calc_policy: str,
+        penalty_type: str,
+        points_decay_factor: float,
+        problemset_id: int,
+        requests_user_information: str,
+        score_mode: str,
+        scoreboard: int,
+        show_penalty: bool,
+        show_scoreboard_after: bool,
+        start_time: int,
+        submissions_gap: int,
+        title: str,
+        original_contest_alias: Optional[str] = None,
+        original_problemset_id: Optional[int] = None,
+        problems: Optional[Sequence[Dict[str, Any]]] = None,
+        rerun_id: Optional[int] = None,
+        scoreboard_url: Optional[str] = None,
+        scoreboard_url_admin: Optional[str] = None,
+        submission_deadline: Optional[int] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = admin
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.archived = archived
+        self.available_languages = {
+            k: v
+            for k, v in available_languages.items()
+        }
+        self.contest_for_teams = contest_for_teams
+        self.default_show_all_contestants_in_scoreboard = default_show_all_contestants_in_scoreboard
+        self.description = description
+        self.director = director
+        self.feedback = feedback
+        self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        self.has_submissions = has_submissions
+        self.languages = [v for v in languages]
+        self.needs_basic_information = needs_basic_information
+        self.opened = opened
+        if original_contest_alias is not None:
+            self.original_contest_alias = original_contest_alias
+        else:
+            self.original_contest_alias = None
+        if original_problemset_id is not None:
+            self.original_problemset_id = original_problemset_id
+        else:
+            self.original_problemset_id = None
+        self.penalty = penalty
+        self.penalty_calc_policy = penalty_calc_policy
+        self.penalty_type = penalty_type
+        self.points_decay_factor = points_decay_factor
+        if problems is not None:
+            self.problems = [_ProblemsetProblem(**v) for v in problems]
+        else:
+            self.problems = None
+        self.problemset_id = problemset_id
+        self.requests_user_information = requests_user_information
+        if rerun_id is not None:
+            self.rerun_id = rerun_id
+        else:
+            self.rerun_id = None
+        self.score_mode = score_mode
+        self.scoreboard = scoreboard
+        if scoreboard_url is not None:
+            self.scoreboard_url = scoreboard_url
+        else:
+            self.scoreboard_url = None
+        if scoreboard_url_admin is not None:
+            self.scoreboard_url_admin = scoreboard_url_admin
+        else:
+            self.scoreboard_url_admin = None
+        self.show_penalty = show_penalty
+        self.show_scoreboard_after = show_scoreboard_after
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        if submission_deadline is not None:
+            self.submission_deadline = datetime.datetime.fromtimestamp(
+                submission_deadline)
+        else:
+            self.submission_deadline = None
+        self.submissions_gap = submissions_gap
+        self.title = title
+        if window_length is not None:
+            self.window_length = window_length
+        else:
+            self.window_length = None
+
+
+@dataclasses.dataclass
+class _ContestDetails:
+    """_ContestDetails"""
+    admin: bool
+    admission_mode: str
+    alias: str
+    archived: bool
+    contest_for_teams: bool
+    default_show_all_contestants_in_scoreboard: bool
+    description: str
+    director: str
+    feedback: str
+    finish_time: datetime.datetime
+    has_submissions: bool
+    languages: Sequence[str]
+    needs_basic_information: bool
+    opened: bool
+    original_contest_alias: Optional[str]
+    original_problemset_id: Optional[int]
+    penalty: int
+    penalty_calc_policy: str
+    penalty_type: str
+    points_decay_factor: float
+    problems: Sequence['_ProblemsetProblem']
+    problemset_id: int
+    requests_user_information: str
+    rerun_id: Optional[int]
+    score_mode: str
+    scoreboard: int
+    scoreboard_url: Optional[str]
+    scoreboard_url_admin: Optional[str]
+    show_penalty: bool
+    show_scoreboard_after: bool
+    start_time: datetime.datetime
+    submission_deadline: Optional[datetime.datetime]
+    submissions_gap: int
+    title: str
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        admin: bool,
+        admission_mode: str,
+        alias: str,
+        archived: bool,
+        contest_for_teams: bool,
+        default_show_all_contestants_in_scoreboard: bool,
+        description: str,
+        director: str,
+        feedback: str,
+        finish_time: int,
+        has_submissions: bool,
+        languages: Sequence[str],
+        needs_basic_information: bool,
+        opened: bool,
+        penalty: int,
+        penalty_calc_policy: str,
+        penalty_type: str,
+        points_decay_factor: float,
+        problems: Sequence[Dict[str, Any]],
+        problemset_id: int,
+        requests_user_information: str,
+        score_mode: str,
+        scoreboard: int,
+        show_penalty: bool,
+        show_scoreboard_after: bool,
+        start_time: int,
+        submissions_gap: int,
+        title: str,
+        original_contest_alias: Optional[str] = None,
+        original_problemset_id: Optional[int] = None,
+        rerun_id: Optional[int] = None,
+        scoreboard_url: Optional[str] = None,
+        scoreboard_url_admin: Optional[str] = None,
+        submission_deadline: Optional[int] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = admin
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.archived = archived
+        self.contest_for_teams = contest_for_teams
+        self.default_show_all_contestants_in_scoreboard = default_show_all_contestants_in_scoreboard
+        self.description = description
+        self.director = director
+        self.feedback = feedback
+        self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        self.has_submissions = has_submissions
+        self.languages = [v for v in languages]
+        self.needs_basic_information = needs_basic_information
+        self.opened = opened
+        if original_contest_alias is not None:
+            self.original_contest_alias = original_contest_alias
+        else:
+            self.original_contest_alias = None
+        if original_problemset_id is not None:
+            self.original_problemset_id = original_problemset_id
+        else:
+            self.original_problemset_id = None
+        self.penalty = penalty
+        self.penalty_calc_policy = penalty_calc_policy
+        self.penalty_type = penalty_type
+        self.points_decay_factor = points_decay_factor
+        self.problems = [_ProblemsetProblem(**v) for v in problems]
+        self.problemset_id = problemset_id
+        self.requests_user_information = requests_user_information
+        if rerun_id is not None:
+            self.rerun_id = rerun_id
+        else:
+            self.rerun_id = None
+        self.score_mode = score_mode
+        self.scoreboard = scoreboard
+        if scoreboard_url is not None:
+            self.scoreboard_url = scoreboard_url
+        else:
+            self.scoreboard_url = None
+        if scoreboard_url_admin is not None:
+            self.scoreboard_url_admin = scoreboard_url_admin
+        else:
+            self.scoreboard_url_admin = None
+        self.show_penalty = show_penalty
+        self.show_scoreboard_after = show_scoreboard_after
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        if submission_deadline is not None:
+            self.submission_deadline = datetime.datetime.fromtimestamp(
+                submission_deadline)
+        else:
+            self.submission_deadline = None
+        self.submissions_gap = submissions_gap
+        self.title = title
+        if window_length is not None:
+            self.window_length = window_length
+        else:
+            self.window_length = None
+
+
+@dataclasses.dataclass
+class _ContestListItem:
+    """_ContestListItem"""
+    admission_mode: str
+    alias: str
+    contest_id: int
+    contestants: int
+    description: str
+    duration_minutes: Optional[int]
+    finish_time: datetime.datetime
+    last_updated: datetime.datetime
+    organizer: str
+    original_finish_time: datetime.datetime
+    participating: bool
+    problemset_id: int
+    recommended: bool
+    rerun_id: Optional[int]
+    score_mode: Optional[str]
+    scoreboard_url: Optional[str]
+    scoreboard_url_admin: Optional[str]
+    start_time: datetime.datetime
+    title: str
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        admission_mode: str,
+        alias: str,
+        contest_id: int,
+        contestants: int,
+        description: str,
+        finish_time: int,
+        last_updated: int,
+        organizer: str,
+        original_finish_time: int,
+        participating: bool,
+        problemset_id: int,
+        recommended: bool,
+        start_time: int,
+        title: str,
+        duration_minutes: Optional[int] = None,
+        rerun_id: Optional[int] = None,
+        score_mode: Optional[str] = None,
+        scoreboard_url: Optional[str] = None,
+        scoreboard_url_admin: Optional[str] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.contest_id = contest_id
+        self.contestants = contestants
+        self.description = description
+        if duration_minutes is not None:
+            self.duration_minutes = duration_minutes
+        else:
+            self.duration_minutes = None
+        self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        self.last_updated = datetime.datetime.fromtimestamp(last_updated)
+        self.organizer = organizer
+        self.original_finish_time = datetime.datetime.fromtimestamp(
+            original_finish_time)
+        self.participating = participating
+        self.problemset_id = problemset_id
+        self.recommended = recommended
+        if rerun_id is not None:
+            self.rerun_id = rerun_id
+        else:
+            self.rerun_id = None
+        if score_mode is not None:
+            self.score_mode = score_mode
+        else:
+            self.score_mode = None
+        if scoreboard_url is not None:
+            self.scoreboard_url = scoreboard_url
+        else:
+            self.scoreboard_url = None
+        if scoreboard_url_admin is not None:
+            self.scoreboard_url_admin = scoreboard_url_admin
+        else:
+            self.scoreboard_url_admin = None
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        self.title = title
+        if window_length is not None:
+            self.window_length = window_length
+        else:
+            self.window_length = None
+
+
+@dataclasses.dataclass
+class _ContestPublicDetails:
+    """_ContestPublicDetails"""
+    admission_mode: str
+    alias: str
+    default_show_all_contestants_in_scoreboard: bool
+    description: str
+    director: str
+    extra_note: Optional[str]
+    feedback: str
+    finish_time: datetime.datetime
+    languages: str
+    penalty: int
+    penalty_calc_policy: str
+    penalty_type: str
+    points_decay_factor: float
+    problemset_id: int
+    rerun_id: Optional[int]
+    score_mode: str
+    scoreboard: int
+    show_penalty: bool
+    show_scoreboard_after: bool
+    start_time: datetime.datetime
+    submissions_gap: int
+    title: str
+    user_registration_accepted: Optional[bool]
+    user_registration_answered: Optional[bool]
+    user_registration_requested: Optional[bool]
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        admission_mode: str,
+        alias: str,
+        default_show_all_contestants_in_scoreboard: bool,
+        description: str,
+        director: str,
+        feedback: str,
+        finish_time: int,
+        languages: str,
+        penalty: int,
+        penalty_calc_policy: str,
+        penalty_type: str,
+        points_decay_factor: float,
+        problemset_id: int,
+        score_mode: str,
+        scoreboard: int,
+        show_penalty: bool,
+        show_scoreboard_after: bool,
+        start_time: int,
+        submissions_gap: int,
+        title: str,
+        extra_note: Optional[str] = None,
+        rerun_id: Optional[int] = None,
+        user_registration_accepted: Optional[bool] = None,
+        user_registration_answered: Optional[bool] = None,
+        user_registration_requested: Optional[bool] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.default_show_all_contestants_in_scoreboard = default_show_all_contestants_in_scoreboard
+        self.description = description
+        self.director = director
+        if extra_note is not None:
+            self.extra_note = extra_note
+        else:
+            self.extra_note = None
+        self.feedback = feedback
+        self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        self.languages = languages
+        self.penalty = penalty
+        self.penalty_calc_policy = penalty_calc_policy
+        self.penalty_type = penalty_type
+        self.points_decay_factor = points_decay_factor
+        self.problemset_id = problemset_id
+        if rerun_id is not None:
+            self.rerun_id = rerun_id
+        else:
+            self.rerun_id = None
+        self.score_mode = score_mode
+        self.scoreboard = scoreboard
+        self.show_penalty = show_penalty
+        self.show_scoreboard_after = show_scoreboard_after
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        self.submissions_gap = submissions_gap
+        self.title = title
+        if user_registration_accepted is not None:
+            self.user_registration_accepted = user_registration_accepted
+        else:
+            self.user_registration_accepted = None
+        if user_registration_answered is not None:
+            self.user_registration_answered = user_registration_answered
+        else:
+            self.user_registration_answered = None
+        if user_registration_requested is not None:
+            self.user_registration_requested = user_registration_requested
+        else:
+            self.user_registration_requested = None
+        if window_length is not None:
+            self.window_length = window_length
+        else:
+            self.window_length = None
+
+
+@dataclasses.dataclass
+class _ContestReport:
+    """_ContestReport"""
+    country: Optional[str]
+    is_invited: bool
+    name: Optional[str]
+    place: Optional[int]
+    problems: Sequence['_ScoreboardRankingProblem']
+    total: '_ContestReport_total'
+    username: str
+
+    def __init__(
+        self,
+        *,
+        is_invited: bool,
+        problems: Sequence[Dict[str, Any]],
+        total: Dict[str, Any],
+        username: str,
+        country: Optional[str] = None,
+        name: Optional[str] = None,
+        place: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if country is not None:
+            self.country = country
+        else:
+            self.country = None
+        self.is_invited = is_invited
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if place is not None:
+            self.place = place
+        else:
+            self.place = None
+        self.problems = [_ScoreboardRankingProblem(**v) for v in problems]
+        self.total = _ContestReport_total(**total)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ContestReport_total:
+    """_ContestReport_total"""
+    penalty: float
+    points: float
+
+    def __init__(
+        self,
+        *,
+        penalty: float,
+        points: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.penalty = penalty
+        self.points = points
+
+
+@dataclasses.dataclass
+class _ContestUser:
+    """_ContestUser"""
+    access_time: Optional[datetime.datetime]
+    country_id: Optional[str]
+    end_time: Optional[datetime.datetime]
+    is_owner: Optional[int]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        access_time: Optional[int] = None,
+        country_id: Optional[str] = None,
+        end_time: Optional[int] = None,
+        is_owner: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if access_time is not None:
+            self.access_time = datetime.datetime.fromtimestamp(access_time)
+        else:
+            self.access_time = None
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        if end_time is not None:
+            self.end_time = datetime.datetime.fromtimestamp(end_time)
+        else:
+            self.end_time = None
+        if is_owner is not None:
+            self.is_owner = is_owner
+        else:
+            self.is_owner = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _Contestant:
+    """_Contestant"""
+    country: Optional[str]
+    email: Optional[str]
+    gender: Optional[str]
+    name: Optional[str]
+    school: Optional[str]
+    state: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        country: Optional[str] = None,
+        email: Optional[str] = None,
+        gender: Optional[str] = None,
+        name: Optional[str] = None,
+        school: Optional[str] = None,
+        state: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if country is not None:
+            self.country = country
+        else:
+            self.country = None
+        if email is not None:
+            self.email = email
+        else:
+            self.email = None
+        if gender is not None:
+            self.gender = gender
+        else:
+            self.gender = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if school is not None:
+            self.school = school
+        else:
+            self.school = None
+        if state is not None:
+            self.state = state
+        else:
+            self.state = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _MergedScoreboardEntry:
+    """_MergedScoreboardEntry"""
+    contests: Dict[str, '_MergedScoreboardEntry_contests_value']
+    name: Optional[str]
+    place: Optional[int]
+    total: '_MergedScoreboardEntry_total'
+    username: str
+
+    def __init__(
+        self,
+        *,
+        contests: Dict[str, Dict[str, Any]],
+        total: Dict[str, Any],
+        username: str,
+        name: Optional[str] = None,
+        place: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = {
+            k: _MergedScoreboardEntry_contests_value(**v)
+            for k, v in contests.items()
+        }
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if place is not None:
+            self.place = place
+        else:
+            self.place = None
+        self.total = _MergedScoreboardEntry_total(**total)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _MergedScoreboardEntry_contests_value:
+    """_MergedScoreboardEntry_contests_value"""
+    penalty: float
+    points: float
+
+    def __init__(
+        self,
+        *,
+        penalty: float,
+        points: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.penalty = penalty
+        self.points = points
+
+
+@dataclasses.dataclass
+class _MergedScoreboardEntry_total:
+    """_MergedScoreboardEntry_total"""
+    penalty: float
+    points: float
+
+    def __init__(
+        self,
+        *,
+        penalty: float,
+        points: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.penalty = penalty
+        self.points = points
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiActivityReport:
+    """_OmegaUp_Controllers_Contest__apiActivityReport"""
+    events: Sequence['_ActivityEvent']
+    pagerItems: Sequence['_PageItem']
+
+    def __init__(
+        self,
+        *,
+        events: Sequence[Dict[str, Any]],
+        pagerItems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.events = [_ActivityEvent(**v) for v in events]
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiAddProblem:
+    """_OmegaUp_Controllers_Contest__apiAddProblem"""
+    solutionStatus: str
+
+    def __init__(
+        self,
+        *,
+        solutionStatus: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.solutionStatus = solutionStatus
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiAdminList:
+    """_OmegaUp_Controllers_Contest__apiAdminList"""
+    contests: Sequence['_Contest']
+
+    def __init__(
+        self,
+        *,
+        contests: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = [_Contest(**v) for v in contests]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiAdmins:
+    """_OmegaUp_Controllers_Contest__apiAdmins"""
+    admins: Sequence['_OmegaUp_Controllers_Contest__apiAdmins_admins_entry']
+    group_admins: Sequence[
+        '_OmegaUp_Controllers_Contest__apiAdmins_group_admins_entry']
+
+    def __init__(
+        self,
+        *,
+        admins: Sequence[Dict[str, Any]],
+        group_admins: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admins = [
+            _OmegaUp_Controllers_Contest__apiAdmins_admins_entry(**v)
+            for v in admins
+        ]
+        self.group_admins = [
+            _OmegaUp_Controllers_Contest__apiAdmins_group_admins_entry(**v)
+            for v in group_admins
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiAdmins_admins_entry:
+    """_OmegaUp_Controllers_Contest__apiAdmins_admins_entry"""
+    role: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        role: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.role = role
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiAdmins_group_admins_entry:
+    """_OmegaUp_Controllers_Contest__apiAdmins_group_admins_entry"""
+    alias: str
+    name: str
+    role: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        role: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+        self.role = role
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiClarifications:
+    """_OmegaUp_Controllers_Contest__apiClarifications"""
+    clarifications: Sequence['_Clarification']
+
+    def __init__(
+        self,
+        *,
+        clarifications: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiClone:
+    """_OmegaUp_Controllers_Contest__apiClone"""
+    alias: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiContestants:
+    """_OmegaUp_Controllers_Contest__apiContestants"""
+    contestants: Sequence['_Contestant']
+
+    def __init__(
+        self,
+        *,
+        contestants: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contestants = [_Contestant(**v) for v in contestants]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiCreateVirtual:
+    """_OmegaUp_Controllers_Contest__apiCreateVirtual"""
+    alias: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiGetNumberOfContestants:
+    """_OmegaUp_Controllers_Contest__apiGetNumberOfContestants"""
+    response: Dict[int, int]
+
+    def __init__(
+        self,
+        *,
+        response: Dict[int, int],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.response = {k: v for k, v in response.items()}
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiList:
+    """_OmegaUp_Controllers_Contest__apiList"""
+    number_of_results: int
+    results: Sequence['_ContestListItem']
+
+    def __init__(
+        self,
+        *,
+        number_of_results: int,
+        results: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.number_of_results = number_of_results
+        self.results = [_ContestListItem(**v) for v in results]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiListParticipating:
+    """_OmegaUp_Controllers_Contest__apiListParticipating"""
+    contests: Sequence['_Contest']
+    count: int
+
+    def __init__(
+        self,
+        *,
+        contests: Sequence[Dict[str, Any]],
+        count: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = [_Contest(**v) for v in contests]
+        self.count = count
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiMyList:
+    """_OmegaUp_Controllers_Contest__apiMyList"""
+    contests: Sequence['_Contest']
+    count: int
+
+    def __init__(
+        self,
+        *,
+        contests: Sequence[Dict[str, Any]],
+        count: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = [_Contest(**v) for v in contests]
+        self.count = count
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiProblemClarifications:
+    """_OmegaUp_Controllers_Contest__apiProblemClarifications"""
+    clarifications: Sequence['_Clarification']
+
+    def __init__(
+        self,
+        *,
+        clarifications: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiProblems:
+    """_OmegaUp_Controllers_Contest__apiProblems"""
+    problems: Sequence['_ProblemsetProblemWithVersions']
+
+    def __init__(
+        self,
+        *,
+        problems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.problems = [_ProblemsetProblemWithVersions(**v) for v in problems]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiReport:
+    """_OmegaUp_Controllers_Contest__apiReport"""
+    finish_time: Optional[datetime.datetime]
+    problems: Sequence[
+        '_OmegaUp_Controllers_Contest__apiReport_problems_entry']
+    ranking: Sequence['_ContestReport']
+    start_time: datetime.datetime
+    time: datetime.datetime
+    title: str
+
+    def __init__(
+        self,
+        *,
+        problems: Sequence[Dict[str, Any]],
+        ranking: Sequence[Dict[str, Any]],
+        start_time: int,
+        time: int,
+        title: str,
+        finish_time: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        self.problems = [
+            _OmegaUp_Controllers_Contest__apiReport_problems_entry(**v)
+            for v in problems
+        ]
+        self.ranking = [_ContestReport(**v) for v in ranking]
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.title = title
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiReport_problems_entry:
+    """_OmegaUp_Controllers_Contest__apiReport_problems_entry"""
+    alias: str
+    order: int
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        order: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.order = order
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiRequests:
+    """_OmegaUp_Controllers_Contest__apiRequests"""
+    contest_alias: str
+    users: Sequence['_OmegaUp_Controllers_Contest__apiRequests_users_entry']
+
+    def __init__(
+        self,
+        *,
+        contest_alias: str,
+        users: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contest_alias = contest_alias
+        self.users = [
+            _OmegaUp_Controllers_Contest__apiRequests_users_entry(**v)
+            for v in users
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiRequests_users_entry:
+    """_OmegaUp_Controllers_Contest__apiRequests_users_entry"""
+    accepted: bool
+    admin: Optional[
+        '_OmegaUp_Controllers_Contest__apiRequests_users_entry_admin']
+    country: str
+    last_update: datetime.datetime
+    request_time: datetime.datetime
+    username: str
+
+    def __init__(
+        self,
+        *,
+        accepted: bool,
+        country: str,
+        last_update: int,
+        request_time: int,
+        username: str,
+        admin: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accepted = accepted
+        if admin is not None:
+            self.admin = _OmegaUp_Controllers_Contest__apiRequests_users_entry_admin(
+                **admin)
+        else:
+            self.admin = None
+        self.country = country
+        self.last_update = datetime.datetime.fromtimestamp(last_update)
+        self.request_time = datetime.datetime.fromtimestamp(request_time)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiRequests_users_entry_admin:
+    """_OmegaUp_Controllers_Contest__apiRequests_users_entry_admin"""
+    username: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        username: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if username is not None:
+            self.username = username
+        else:
+            self.username = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiRole:
+    """_OmegaUp_Controllers_Contest__apiRole"""
+    admin: bool
+
+    def __init__(
+        self,
+        *,
+        admin: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = admin
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiRuns:
+    """_OmegaUp_Controllers_Contest__apiRuns"""
+    runs: Sequence['_Run']
+    totalRuns: int
+
+    def __init__(
+        self,
+        *,
+        runs: Sequence[Dict[str, Any]],
+        totalRuns: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.runs = [_Run(**v) for v in runs]
+        self.totalRuns = totalRuns
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiRunsDiff:
+    """_OmegaUp_Controllers_Contest__apiRunsDiff"""
+    diff: Sequence['_OmegaUp_Controllers_Contest__apiRunsDiff_diff_entry']
+
+    def __init__(
+        self,
+        *,
+        diff: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.diff = [
+            _OmegaUp_Controllers_Contest__apiRunsDiff_diff_entry(**v)
+            for v in diff
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiRunsDiff_diff_entry:
+    """_OmegaUp_Controllers_Contest__apiRunsDiff_diff_entry"""
+    guid: str
+    new_score: float
+    new_status: str
+    new_verdict: str
+    old_score: float
+    old_status: str
+    old_verdict: str
+    problemset_id: int
+    username: str
+
+    def __init__(
+        self,
+        *,
+        guid: str,
+        new_score: float,
+        new_status: str,
+        new_verdict: str,
+        old_score: float,
+        old_status: str,
+        old_verdict: str,
+        problemset_id: int,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.guid = guid
+        self.new_score = new_score
+        self.new_status = new_status
+        self.new_verdict = new_verdict
+        self.old_score = old_score
+        self.old_status = old_status
+        self.old_verdict = old_verdict
+        self.problemset_id = problemset_id
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiScoreboardEvents:
+    """_OmegaUp_Controllers_Contest__apiScoreboardEvents"""
+    events: Sequence['_ScoreboardEvent']
+
+    def __init__(
+        self,
+        *,
+        events: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.events = [_ScoreboardEvent(**v) for v in events]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiScoreboardMerge:
+    """_OmegaUp_Controllers_Contest__apiScoreboardMerge"""
+    ranking: Sequence['_MergedScoreboardEntry']
+
+    def __init__(
+        self,
+        *,
+        ranking: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.ranking = [_MergedScoreboardEntry(**v) for v in ranking]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiSearchUsers:
+    """_OmegaUp_Controllers_Contest__apiSearchUsers"""
+    results: Sequence['_ListItem']
+
+    def __init__(
+        self,
+        *,
+        results: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.results = [_ListItem(**v) for v in results]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiStats:
+    """_OmegaUp_Controllers_Contest__apiStats"""
+    distribution: Dict[int, int]
+    max_wait_time: Optional[datetime.datetime]
+    max_wait_time_guid: Optional[str]
+    pending_runs: Sequence[str]
+    size_of_bucket: float
+    total_points: float
+    total_runs: int
+    verdict_counts: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        distribution: Dict[int, int],
+        pending_runs: Sequence[str],
+        size_of_bucket: float,
+        total_points: float,
+        total_runs: int,
+        verdict_counts: Dict[str, int],
+        max_wait_time: Optional[int] = None,
+        max_wait_time_guid: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.distribution = {k: v for k, v in distribution.items()}
+        if max_wait_time is not None:
+            self.max_wait_time = datetime.datetime.fromtimestamp(max_wait_time)
+        else:
+            self.max_wait_time = None
+        if max_wait_time_guid is not None:
+            self.max_wait_time_guid = max_wait_time_guid
+        else:
+            self.max_wait_time_guid = None
+        self.pending_runs = [v for v in pending_runs]
+        self.size_of_bucket = size_of_bucket
+        self.total_points = total_points
+        self.total_runs = total_runs
+        self.verdict_counts = {k: v for k, v in verdict_counts.items()}
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiUpdate:
+    """_OmegaUp_Controllers_Contest__apiUpdate"""
+    teamsGroupName: Optional[str]
+    title: str
+
+    def __init__(
+        self,
+        *,
+        title: str,
+        teamsGroupName: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if teamsGroupName is not None:
+            self.teamsGroupName = teamsGroupName
+        else:
+            self.teamsGroupName = None
+        self.title = title
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiUsers:
+    """_OmegaUp_Controllers_Contest__apiUsers"""
+    groups: Sequence['_OmegaUp_Controllers_Contest__apiUsers_groups_entry']
+    users: Sequence['_ContestUser']
+
+    def __init__(
+        self,
+        *,
+        groups: Sequence[Dict[str, Any]],
+        users: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.groups = [
+            _OmegaUp_Controllers_Contest__apiUsers_groups_entry(**v)
+            for v in groups
+        ]
+        self.users = [_ContestUser(**v) for v in users]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Contest__apiUsers_groups_entry:
+    """_OmegaUp_Controllers_Contest__apiUsers_groups_entry"""
+    alias: str
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+
+
+@dataclasses.dataclass
+class _ProblemsetProblemWithVersions:
+    """_ProblemsetProblemWithVersions"""
+    accepted: int
+    accepts_submissions: bool
+    alias: str
+    commit: str
+    difficulty: float
+    has_submissions: bool
+    input_limit: int
+    languages: str
+    letter: Optional[str]
+    order: int
+    points: float
+    quality_payload: Optional['_ProblemQualityPayload']
+    quality_seal: bool
+    submissions: int
+    title: str
+    version: str
+    versions: '_ProblemsetProblemWithVersions_versions'
+    visibility: int
+    visits: int
+
+    def __init__(
+        self,
+        *,
+        accepted: int,
+        accepts_submissions: bool,
+        alias: str,
+        commit: str,
+        difficulty: float,
+        has_submissions: bool,
+        input_limit: int,
+        languages: str,
+        order: int,
+        points: float,
+        quality_seal: bool,
+        submissions: int,
+        title: str,
+        version: str,
+        versions: Dict[str, Any],
+        visibility: int,
+        visits: int,
+        letter: Optional[str] = None,
+        quality_payload: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accepted = accepted
+        self.accepts_submissions = accepts_submissions
+        self.alias = alias
+        self.commit = commit
+        self.difficulty = difficulty
+        self.has_submissions = has_submissions
+        self.input_limit = input_limit
+        self.languages = languages
+        if letter is not None:
+            self.letter = letter
+        else:
+            self.letter = None
+        self.order = order
+        self.points = points
+        if quality_payload is not None:
+            self.quality_payload = _ProblemQualityPayload(**quality_payload)
+        else:
+            self.quality_payload = None
+        self.quality_seal = quality_seal
+        self.submissions = submissions
+        self.title = title
+        self.version = version
+        self.versions = _ProblemsetProblemWithVersions_versions(**versions)
+        self.visibility = visibility
+        self.visits = visits
+
+
+@dataclasses.dataclass
+class _ProblemsetProblemWithVersions_versions:
+    """_ProblemsetProblemWithVersions_versions"""
+    log: Sequence['_ProblemVersion']
+    published: str
+
+    def __init__(
+        self,
+        *,
+        log: Sequence[Dict[str, Any]],
+        published: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.log = [_ProblemVersion(**v) for v in log]
+        self.published = published
+
+
+ContestListResponse = _OmegaUp_Controllers_Contest__apiList
+"""The return type of the ContestList API."""
+
+ContestAdminListResponse = _OmegaUp_Controllers_Contest__apiAdminList
+"""The return type of the ContestAdminList API."""
+
+ContestMyListResponse = _OmegaUp_Controllers_Contest__apiMyList
+"""The return type of the ContestMyList API."""
+
+ContestListParticipatingResponse = _OmegaUp_Controllers_Contest__apiListParticipating
+"""The return type of the ContestListParticipating API."""
+
+ContestGetNumberOfContestantsResponse = _OmegaUp_Controllers_Contest__apiGetNumberOfContestants
+"""The return type of the ContestGetNumberOfContestants API."""
+
+ContestPublicDetailsResponse = _ContestPublicDetails
+"""The return type of the ContestPublicDetails API."""
+
+ContestDetailsResponse = _ContestDetails
+"""The return type of the ContestDetails API."""
+
+ContestAdminDetailsResponse = _ContestAdminDetails
+"""The return type of the ContestAdminDetails API."""
+
+ContestActivityReportResponse = _OmegaUp_Controllers_Contest__apiActivityReport
+"""The return type of the ContestActivityReport API."""
+
+ContestCloneResponse = _OmegaUp_Controllers_Contest__apiClone
+"""The return type of the ContestClone API."""
+
+ContestCreateVirtualResponse = _OmegaUp_Controllers_Contest__apiCreateVirtual
+"""The return type of the ContestCreateVirtual API."""
+
+ContestProblemsResponse = _OmegaUp_Controllers_Contest__apiProblems
+"""The return type of the ContestProblems API."""
+
+ContestAddProblemResponse = _OmegaUp_Controllers_Contest__apiAddProblem
+"""The return type of the ContestAddProblem API."""
+
+ContestRunsDiffResponse = _OmegaUp_Controllers_Contest__apiRunsDiff
+"""The return type of the ContestRunsDiff API."""
+
+ContestClarificationsResponse = _OmegaUp_Controllers_Contest__apiClarifications
+"""The return type of the ContestClarifications API."""
+
+ContestProblemClarificationsResponse = _OmegaUp_Controllers_Contest__apiProblemClarifications
+"""The return type of the ContestProblemClarifications API."""
+
+ContestScoreboardEventsResponse = _OmegaUp_Controllers_Contest__apiScoreboardEvents
+"""The return type of the ContestScoreboardEvents API."""
+
+ContestScoreboardResponse = _Scoreboard
+"""The return type of the ContestScoreboard API."""
+
+ContestScoreboardMergeResponse = _OmegaUp_Controllers_Contest__apiScoreboardMerge
+"""The return type of the ContestScoreboardMerge API."""
+
+ContestRequestsResponse = _OmegaUp_Controllers_Contest__apiRequests
+"""The return type of the ContestRequests API."""
+
+ContestUsersResponse = _OmegaUp_Controllers_Contest__apiUsers
+"""The return type of the ContestUsers API."""
+
+ContestSearchUsersResponse = _OmegaUp_Controllers_Contest__apiSearchUsers
+"""The return type of the ContestSearchUsers API."""
+
+ContestAdminsResponse = _OmegaUp_Controllers_Contest__apiAdmins
+"""The return type of the ContestAdmins API."""
+
+ContestUpdateResponse = _OmegaUp_Controllers_Contest__apiUpdate
+"""The return type of the ContestUpdate API."""
+
+ContestRunsResponse = _OmegaUp_Controllers_Contest__apiRuns
+"""The return type of the ContestRuns API."""
+
+ContestStatsResponse = _OmegaUp_Controllers_Contest__apiStats
+"""The return type of the ContestStats API."""
+
+ContestReportResponse = _OmegaUp_Controllers_Contest__apiReport
+"""The return type of the ContestReport API."""
+
+ContestRoleResponse = _OmegaUp_Controllers_Contest__apiRole
+"""The return type of the ContestRole API."""
+
+ContestContestantsResponse = _OmegaUp_Controllers_Contest__apiContestants
+"""The return type of the ContestContestants API."""
+
+
+class Contest:
+    r"""ContestController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def list(
+        self,
+        *,
+        page: int,
+        page_size: int,
+        query: str,
+        tab_name: str,
+        active: Optional[int] = None,
+        admission_mode: Optional[Any] = None,
+        participating: Optional[int] = None,
+        recommended: Optional[int] = None,
+        sort_order: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestListResponse:
+        r"""Returns a list of contests
+
+        Args:
+            page:
+            page_size:
+            query:
+            tab_name:
+            active:
+            admission_mode:
+            participating:
+            recommended:
+            sort_order:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'page': str(page),
+            'page_size': str(page_size),
+            'query': query,
+            'tab_name': tab_name,
+        }
+        if active is not None:
+            parameters['active'] = str(active)
+        if admission_mode is not None:
+            parameters['admission_mode'] = str(admission_mode)
+        if participating is not None:
+            parameters['participating'] = str(participating)
+        if recommended is not None:
+            parameters['recommended'] = str(recommended)
+        if sort_order is not None:
+            parameters['sort_order'] = sort_order
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiList,
+            self._client.query('/api/contest/list/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_list(
+        self,
+        *,
+        query: str,
+        tab_name: str,
+        active: Optional[int] = None,
+        admission_mode: Optional[Any] = None,
+        participating: Optional[int] = None,
+        recommended: Optional[int] = None,
+        sort_order: Optional[str] = None,
+        # Out-of-band parameters:
+        page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+        prefetch_: bool = True,
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> Iterator[_ContestListItem]:
+        r"""Returns a list of contests
+
+        Paginated variant of `list()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            query:
+            tab_name:
+            active:
+            admission_mode:
+            participating:
+            recommended:
+            sort_order:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.list,
+                                  query=query,
+                                  tab_name=tab_name,
+                                  active=active,
+                                  admission_mode=admission_mode,
+                                  participating=participating,
+                                  recommended=recommended,
+                                  sort_order=sort_order,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='results',
+                               page='page',
+                               page_size='page_size',
+                               first_page=1,
+                               size=page_size_,
+                               total='number_of_results',
+                               prefetch=prefetch_)
+
+    def adminList(
+        self,
+        *,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        show_archived: Optional[bool] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestAdminListResponse:
+        r"""Returns a list of contests where current user has admin rights (or is
+        the director).
+
+        Args:
+            page:
+            page_size:
+            show_archived:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if page is not None:
+            parameters['page'] = str(page)
+        if page_size is not None:
+            parameters['page_size'] = str(page_size)
+        if show_archived is not None:
+            parameters['show_archived'] = str(show_archived)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiAdminList,
+            self._client.query('/api/contest/adminList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_adminList(
+            self,
+            *,
+            show_archived: Optional[bool] = None,
+            # Out-of-band parameters:
+            page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+            prefetch_: bool = True,
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> Iterator[_Contest]:
+        r"""Returns a list of contests where current user has admin rights (or is
+        the director).
+
+        Paginated variant of `adminList()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            show_archived:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.adminList,
+                                  show_archived=show_archived,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='contests',
+                               page='page',
+                               page_size='page_size',
+                               first_page=1,
+                               size=page_size_,
+                               prefetch=prefetch_)
+
+    def myList(
+        self,
+        *,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        query: Optional[str] = None,
+        show_archived: Optional[bool] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestMyListResponse:
+        r"""Returns a list of contests where current user is the director
+
+        Args:
+            page:
+            page_size:
+            query:
+            show_archived:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if page is not None:
+            parameters['page'] = str(page)
+        if page_size is not None:
+            parameters['page_size'] = str(page_size)
+        if query is not None:
+            parameters['query'] = query
+        if show_archived is not None:
+            parameters['show_archived'] = str(show_archived)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiMyList,
+            self._client.query('/api/contest/myList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def listParticipating(
+        self,
+        *,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        query: Optional[str] = None,
+        show_archived: Optional[bool] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestListParticipatingResponse:
+        r"""Returns a list of contests where current user is participating in
+
+        Args:
+            page:
+            page_size:
+            query:
+            show_archived:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if page is not None:
+            parameters['page'] = str(page)
+        if page_size is not None:
+            parameters['page_size'] = str(page_size)
+        if query is not None:
+            parameters['query'] = query
+        if show_archived is not None:
+            parameters['show_archived'] = str(show_archived)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiListParticipating,
+            self._client.query('/api/contest/listParticipating/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def getNumberOfContestants(
+        self,
+        *,
+        contest_ids: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestGetNumberOfContestantsResponse:
+        r"""
+
+        Args:
+            contest_ids:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_ids': contest_ids,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiGetNumberOfContestants,
+            self._client.query('/api/contest/getNumberOfContestants/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def publicDetails(
+        self,
+        *,
+        contest_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestPublicDetailsResponse:
+        r"""
+
+        Args:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        return _decoder.decode(
+            _ContestPublicDetails,
+            self._client.query('/api/contest/publicDetails/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def registerForContest(
+            self,
+            *,
+            contest_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""
+
+        Args:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        self._client.query('/api/contest/registerForContest/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def open(
+            self,
+            *,
+            contest_alias: str,
+            privacy_git_object_id: str,
+            statement_type: str,
+            share_user_information: Optional[bool] = None,
+            token: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Joins a contest - explicitly adds a identity to a contest.
+
+        Args:
+            contest_alias:
+            privacy_git_object_id:
+            statement_type:
+            share_user_information:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'privacy_git_object_id': privacy_git_object_id,
+            'statement_type': statement_type,
+        }
+        if share_user_information is not None:
+            parameters['share_user_information'] = str(share_user_information)
+        if token is not None:
+            parameters['token'] = token
+        self._client.query('/api/contest/open/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def details(
+        self,
+        *,
+        contest_alias: str,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestDetailsResponse:
+        r"""Returns details of a Contest. Requesting the details of a contest will
+        not start the current user into that contest. In order to participate
+        in the contest, \OmegaUp\Controllers\Contest::apiOpen() must be used.
+
+        Args:
+            contest_alias:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _ContestDetails,
+            self._client.query('/api/contest/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def adminDetails(
+        self,
+        *,
+        contest_alias: str,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestAdminDetailsResponse:
+        r"""Returns details of a Contest, for administrators. This differs from
+        apiDetails in the sense that it does not attempt to calculate the
+        remaining time from the contest, or register the opened time.
+
+        Args:
+            contest_alias:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _ContestAdminDetails,
+            self._client.query('/api/contest/adminDetails/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def activityReport(
+        self,
+        *,
+        contest_alias: str,
+        length: Optional[int] = None,
+        page: Optional[int] = None,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestActivityReportResponse:
+        r"""Returns a report with all user activity for a contest.
+
+        Args:
+            contest_alias:
+            length:
+            page:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if length is not None:
+            parameters['length'] = str(length)
+        if page is not None:
+            parameters['page'] = str(page)
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiActivityReport,
+            self._client.query('/api/contest/activityReport/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def clone(
+        self,
+        *,
+        contest_alias: str,
+        description: str,
+        start_time: int,
+        title: str,
+        alias: Optional[str] = None,
+        auth_token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestCloneResponse:
+        r"""Clone a contest
+
+        Args:
+            contest_alias:
+            description:
+            start_time:
+            title:
+            alias:
+            auth_token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'description': description,
+            'start_time': str(start_time),
+            'title': title,
+        }
+        if alias is not None:
+            parameters['alias'] = alias
+        if auth_token is not None:
+            parameters['auth_token'] = auth_token
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiClone,
+            self._client.query('/api/contest/clone/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def createVirtual(
+        self,
+        *,
+        alias: str,
+        start_time: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestCreateVirtualResponse:
+        r"""
+
+        Args:
+            alias:
+            start_time:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'start_time': str(start_time),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiCreateVirtual,
+            self._client.query('/api/contest/createVirtual/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def create(
+            self,
+            *,
+            finish_time: int,
+            start_time: int,
+            submissions_gap: int,
+            window_length: int,
+            admission_mode: Optional[str] = None,
+            alias: Optional[str] = None,
+            check_plagiarism: Optional[bool] = None,
+            contest_for_teams: Optional[bool] = None,
+            description: Optional[str] = None,
+            feedback: Optional[str] = None,
+            languages: Optional[str] = None,
+            needs_basic_information: Optional[bool] = None,
+            penalty: Optional[int] = None,
+            penalty_calc_policy: Optional[str] = None,
+            penalty_type: Optional[str] = None,
+            points_decay_factor: Optional[float] = None,
+            problems: Optional[str] = None,
+            requests_user_information: Optional[bool] = None,
+            score_mode: Optional[str] = None,
+            scoreboard: Optional[float] = None,
+            show_scoreboard_after: Optional[bool] = None,
+            teams_group_alias: Optional[str] = None,
+            title: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Creates a new contest
+
+        Args:
+            finish_time:
+            start_time:
+            submissions_gap:
+            window_length:
+            admission_mode:
+            alias:
+            check_plagiarism:
+            contest_for_teams:
+            description:
+            feedback:
+            languages:
+            needs_basic_information:
+            penalty:
+            penalty_calc_policy:
+            penalty_type:
+            points_decay_factor:
+            problems:
+            requests_user_information:
+            score_mode:
+            scoreboard:
+            show_scoreboard_after:
+            teams_group_alias:
+            title:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'finish_time': str(finish_time),
+            'start_time': str(start_time),
+            'submissions_gap': str(submissions_gap),
+            'window_length': str(window_length),
+        }
+        if admission_mode is not None:
+            parameters['admission_mode'] = admission_mode
+        if alias is not None:
+            parameters['alias'] = alias
+        if check_plagiarism is not None:
+            parameters['check_plagiarism'] = str(check_plagiarism)
+        if contest_for_teams is not None:
+            parameters['contest_for_teams'] = str(contest_for_teams)
+        if description is not None:
+            parameters['description'] = description
+        if feedback is not None:
+            parameters['feedback'] = feedback
+        if languages is not None:
+            parameters['languages'] = languages
+        if needs_basic_information is not None:
+            parameters['needs_basic_information'] = str(
+                needs_basic_information)
+        if penalty is not None:
+            parameters['penalty'] = str(penalty)
+        if penalty_calc_policy is not None:
+            parameters['penalty_calc_policy'] = penalty_calc_policy
+        if penalty_type is not None:
+            parameters['penalty_type'] = penalty_type
+        if points_decay_factor is not None:
+            parameters['points_decay_factor'] = str(points_decay_factor)
+        if problems is not None:
+            parameters['problems'] = problems
+        if requests_user_information is not None:
+            parameters['requests_user_information'] = str(
+                requests_user_information)
+        if score_mode is not None:
+            parameters['score_mode'] = score_mode
+        if scoreboard is not None:
+            parameters['scoreboard'] = str(scoreboard)
+        if show_scoreboard_after is not None:
+            parameters['show_scoreboard_after'] = str(show_scoreboard_after)
+        if teams_group_alias is not None:
+            parameters['teams_group_alias'] = teams_group_alias
+        if title is not None:
+            parameters['title'] = title
+        self._client.query('/api/contest/create/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def problems(
+        self,
+        *,
+        contest_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestProblemsResponse:
+        r"""Gets the problems from a contest
+
+        Args:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiProblems,
+            self._client.query('/api/contest/problems/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def addProblem(
+        self,
+        *,
+        contest_alias: str,
+        order_in_contest: int,
+        points: float,
+        problem_alias: str,
+        commit: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestAddProblemResponse:
+        r"""Adds a problem to a contest
+
+        Args:
+            contest_alias:
+            order_in_contest:
+            points:
+            problem_alias:
+            commit:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'order_in_contest': str(order_in_contest),
+            'points': str(points),
+            'problem_alias': problem_alias,
+        }
+        if commit is not None:
+            parameters['commit'] = commit
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiAddProblem,
+            self._client.query('/api/contest/addProblem/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def removeProblem(
+            self,
+            *,
+            contest_alias: str,
+            problem_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a problem from a contest
+
+        Args:
+            contest_alias:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'problem_alias': problem_alias,
+        }
+        self._client.query('/api/contest/removeProblem/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def runsDiff(
+        self,
+        *,
+        contest_alias: str,
+        version: str,
+        problem_alias: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestRunsDiffResponse:
+        r"""Return a report of which runs would change due to a version change.
+
+        Args:
+            contest_alias:
+            version:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'version': version,
+        }
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiRunsDiff,
+            self._client.query('/api/contest/runsDiff/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def addUser(
+            self,
+            *,
+            contest_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds a user to a contest.
+        By default, any user can view details of public contests.
+        Only users added through this API can view private contests
+
+        Args:
+            contest_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/contest/addUser/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeUser(
+            self,
+            *,
+            contest_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Remove a user from a private contest
+
+        Args:
+            contest_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/contest/removeUser/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def replaceTeamsGroup(
+            self,
+            *,
+            contest_alias: str,
+            teams_group_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Replace the teams group assigned to a contest
+
+        Args:
+            contest_alias: The alias of the contest
+            teams_group_alias: The alias of the teams group
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'teams_group_alias': teams_group_alias,
+        }
+        self._client.query('/api/contest/replaceTeamsGroup/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addGroup(
+            self,
+            *,
+            contest_alias: str,
+            group: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds a group to a contest
+
+        Args:
+            contest_alias:
+            group:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'group': group,
+        }
+        self._client.query('/api/contest/addGroup/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeGroup(
+            self,
+            *,
+            contest_alias: str,
+            group: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a group from a contest
+
+        Args:
+            contest_alias:
+            group:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'group': group,
+        }
+        self._client.query('/api/contest/removeGroup/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addAdmin(
+            self,
+            *,
+            contest_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds an admin to a contest
+
+        Args:
+            contest_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/contest/addAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeAdmin(
+            self,
+            *,
+            contest_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes an admin from a contest
+
+        Args:
+            contest_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/contest/removeAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addGroupAdmin(
+            self,
+            *,
+            contest_alias: str,
+            group: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds a group admin to a contest
+
+        Args:
+            contest_alias:
+            group:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'group': group,
+        }
+        self._client.query('/api/contest/addGroupAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeGroupAdmin(
+            self,
+            *,
+            contest_alias: str,
+            group: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a group admin from a contest
+
+        Args:
+            contest_alias:
+            group:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'group': group,
+        }
+        self._client.query('/api/contest/removeGroupAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def clarifications(
+        self,
+        *,
+        contest_alias: str,
+        offset: int,
+        rowcount: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestClarificationsResponse:
+        r"""Get clarifications of a contest
+
+        Args:
+            contest_alias:
+            offset:
+            rowcount:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'offset': str(offset),
+            'rowcount': str(rowcount),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiClarifications,
+            self._client.query('/api/contest/clarifications/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def problemClarifications(
+        self,
+        *,
+        contest_alias: str,
+        offset: int,
+        problem_alias: str,
+        rowcount: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestProblemClarificationsResponse:
+        r"""Get clarifications of problem in a contest
+
+        Args:
+            contest_alias:
+            offset:
+            problem_alias:
+            rowcount:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'offset': str(offset),
+            'problem_alias': problem_alias,
+            'rowcount': str(rowcount),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiProblemClarifications,
+            self._client.query('/api/contest/problemClarifications/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def scoreboardEvents(
+        self,
+        *,
+        contest_alias: str,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestScoreboardEventsResponse:
+        r"""Returns the Scoreboard events
+
+        Args:
+            contest_alias:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiScoreboardEvents,
+            self._client.query('/api/contest/scoreboardEvents/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def scoreboard(
+        self,
+        *,
+        contest_alias: str,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestScoreboardResponse:
+        r"""Returns the Scoreboard
+
+        Args:
+            contest_alias:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _Scoreboard,
+            self._client.query('/api/contest/scoreboard/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def scoreboardMerge(
+        self,
+        *,
+        contest_aliases: str,
+        contest_params: Optional[Any] = None,
+        usernames_filter: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestScoreboardMergeResponse:
+        r"""Gets the accomulative scoreboard for an array of contests
+
+        Args:
+            contest_aliases:
+            contest_params:
+            usernames_filter:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_aliases': contest_aliases,
+        }
+        if contest_params is not None:
+            parameters['contest_params'] = str(contest_params)
+        if usernames_filter is not None:
+            parameters['usernames_filter'] = usernames_filter
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiScoreboardMerge,
+            self._client.query('/api/contest/scoreboardMerge/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def requests(
+        self,
+        *,
+        contest_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestRequestsResponse:
+        r"""
+
+        Args:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiRequests,
+            self._client.query('/api/contest/requests/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def arbitrateRequest(
+            self,
+            *,
+            contest_alias: str,
+            username: str,
+            note: Optional[str] = None,
+            resolution: Optional[Any] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""
+
+        Args:
+            contest_alias:
+            username:
+            note:
+            resolution:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'username': username,
+        }
+        if note is not None:
+            parameters['note'] = note
+        if resolution is not None:
+            parameters['resolution'] = str(resolution)
+        self._client.query('/api/contest/arbitrateRequest/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def users(
+        self,
+        *,
+        contest_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestUsersResponse:
+        r"""Returns ALL identities participating in a contest
+
+        Args:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiUsers,
+            self._client.query('/api/contest/users/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def searchUsers(
+        self,
+        *,
+        contest_alias: str,
+        query: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestSearchUsersResponse:
+        r"""Search users in contest
+
+        Args:
+            contest_alias:
+            query:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if query is not None:
+            parameters['query'] = query
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiSearchUsers,
+            self._client.query('/api/contest/searchUsers/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def admins(
+        self,
+        *,
+        contest_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestAdminsResponse:
+        r"""Returns all contest administrators
+
+        Args:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiAdmins,
+            self._client.query('/api/contest/admins/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def update(
+        self,
+        *,
+        contest_alias: str,
+        finish_time: int,
+        start_time: int,
+        submissions_gap: int,
+        window_length: int,
+        admission_mode: Optional[str] = None,
+        alias: Optional[str] = None,
+        check_plagiarism: Optional[bool] = None,
+        contest_for_teams: Optional[bool] = None,
+        default_show_all_contestants_in_scoreboard: Optional[bool] = None,
+        description: Optional[str] = None,
+        feedback: Optional[str] = None,
+        languages: Optional[str] = None,
+        needs_basic_information: Optional[bool] = None,
+        penalty: Optional[int] = None,
+        penalty_calc_policy: Optional[str] = None,
+        penalty_type: Optional[str] = None,
+        points_decay_factor: Optional[float] = None,
+        problems: Optional[str] = None,
+        requests_user_information: Optional[str] = None,
+        score_mode: Optional[str] = None,
+        scoreboard: Optional[float] = None,
+        show_scoreboard_after: Optional[bool] = None,
+        teams_group_alias: Optional[str] = None,
+        title: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestUpdateResponse:
+        r"""Update a Contest
+
+        Args:
+            contest_alias:
+            finish_time:
+            start_time:
+            submissions_gap:
+            window_length:
+            admission_mode:
+            alias:
+            check_plagiarism:
+            contest_for_teams:
+            default_show_all_contestants_in_scoreboard:
+            description:
+            feedback:
+            languages:
+            needs_basic_information:
+            penalty:
+            penalty_calc_policy:
+            penalty_type:
+            points_decay_factor:
+            problems:
+            requests_user_information:
+            score_mode:
+            scoreboard:
+            show_scoreboard_after:
+            teams_group_alias:
+            title:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'finish_time': str(finish_time),
+            'start_time': str(start_time),
+            'submissions_gap': str(submissions_gap),
+            'window_length': str(window_length),
+        }
+        if admission_mode is not None:
+            parameters['admission_mode'] = admission_mode
+        if alias is not None:
+            parameters['alias'] = alias
+        if check_plagiarism is not None:
+            parameters['check_plagiarism'] = str(check_plagiarism)
+        if contest_for_teams is not None:
+            parameters['contest_for_teams'] = str(contest_for_teams)
+        if default_show_all_contestants_in_scoreboard is not None:
+            parameters['default_show_all_contestants_in_scoreboard'] = str(
+                default_show_all_contestants_in_scoreboard)
+        if description is not None:
+            parameters['description'] = description
+        if feedback is not None:
+            parameters['feedback'] = feedback
+        if languages is not None:
+            parameters['languages'] = languages
+        if needs_basic_information is not None:
+            parameters['needs_basic_information'] = str(
+                needs_basic_information)
+        if penalty is not None:
+            parameters['penalty'] = str(penalty)
+        if penalty_calc_policy is not None:
+            parameters['penalty_calc_policy'] = penalty_calc_policy
+        if penalty_type is not None:
+            parameters['penalty_type'] = penalty_type
+        if points_decay_factor is not None:
+            parameters['points_decay_factor'] = str(points_decay_factor)
+        if problems is not None:
+            parameters['problems'] = problems
+        if requests_user_information is not None:
+            parameters['requests_user_information'] = requests_user_information
+        if score_mode is not None:
+            parameters['score_mode'] = score_mode
+        if scoreboard is not None:
+            parameters['scoreboard'] = str(scoreboard)
+        if show_scoreboard_after is not None:
+            parameters['show_scoreboard_after'] = str(show_scoreboard_after)
+        if teams_group_alias is not None:
+            parameters['teams_group_alias'] = teams_group_alias
+        if title is not None:
+            parameters['title'] = title
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiUpdate,
+            self._client.query('/api/contest/update/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def updateEndTimeForIdentity(
+            self,
+            *,
+            contest_alias: str,
+            end_time: datetime.datetime,
+            username: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Update Contest end time for an identity when window_length
+        option is turned on
+
+        Args:
+            contest_alias:
+            end_time:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'end_time': str(int(end_time.timestamp())),
+            'username': username,
+        }
+        self._client.query('/api/contest/updateEndTimeForIdentity/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def runs(
+        self,
+        *,
+        contest_alias: str,
+        problem_alias: str,
+        language: Optional[str] = None,
+        offset: Optional[int] = None,
+        rowcount: Optional[int] = None,
+        status: Optional[str] = None,
+        username: Optional[str] = None,
+        verdict: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestRunsResponse:
+        r"""Returns all runs for a contest
+
+        Args:
+            contest_alias:
+            problem_alias:
+            language:
+            offset:
+            rowcount:
+            status:
+            username:
+            verdict:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'problem_alias': problem_alias,
+        }
+        if language is not None:
+            parameters['language'] = language
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        if status is not None:
+            parameters['status'] = status
+        if username is not None:
+            parameters['username'] = username
+        if verdict is not None:
+            parameters['verdict'] = verdict
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiRuns,
+            self._client.query('/api/contest/runs/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def stream_runs(
+            self,
+            *,
+            contest_alias: str,
+            problem_alias: str,
+            language: Optional[str] = None,
+            offset: Optional[int] = None,
+            rowcount: Optional[int] = None,
+            status: Optional[str] = None,
+            username: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> Iterator[_Run]:
+        r"""Returns all runs for a contest
+
+        Streaming variant of `runs()` that parses the response
+        incrementally.
+
+        Args:
+            contest_alias:
+            problem_alias:
+            language:
+            offset:
+            rowcount:
+            status:
+            username:
+            verdict:
+
+        Yields:
+            The runs, decoded one at a time as the response is received.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'problem_alias': problem_alias,
+        }
+        if language is not None:
+            parameters['language'] = language
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        if status is not None:
+            parameters['status'] = status
+        if username is not None:
+            parameters['username'] = username
+        if verdict is not None:
+            parameters['verdict'] = verdict
+        return _decoder.decode_stream(
+            _Run,
+            self._client.query_stream('/api/contest/runs/',
+                                      'runs',
+                                      payload=parameters,
+                                      files_=files_,
+                                      timeout_=timeout_,
+                                      check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_runs(
+            self,
+            *,
+            contest_alias: str,
+            problem_alias: str,
+            language: Optional[str] = None,
+            status: Optional[str] = None,
+            username: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+            prefetch_: bool = True,
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> Iterator[_Run]:
+        r"""Returns all runs for a contest
+
+        Paginated variant of `runs()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            contest_alias:
+            problem_alias:
+            language:
+            status:
+            username:
+            verdict:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.runs,
+                                  contest_alias=contest_alias,
+                                  problem_alias=problem_alias,
+                                  language=language,
+                                  status=status,
+                                  username=username,
+                                  verdict=verdict,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='runs',
+                               page='offset',
+                               page_size='rowcount',
+                               first_page=0,
+                               size=page_size_,
+                               total='totalRuns',
+                               prefetch=prefetch_)
+
+    def stats(
+        self,
+        *,
+        contest_alias: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestStatsResponse:
+        r"""Stats of a contest
+
+        Args:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if contest_alias is not None:
+            parameters['contest_alias'] = contest_alias
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiStats,
+            self._client.query('/api/contest/stats/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def report(
+        self,
+        *,
+        contest_alias: str,
+        auth_token: Optional[str] = None,
+        filterBy: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestReportResponse:
+        r"""Returns a detailed report of the contest
+
+        Args:
+            contest_alias:
+            auth_token:
+            filterBy:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if auth_token is not None:
+            parameters['auth_token'] = auth_token
+        if filterBy is not None:
+            parameters['filterBy'] = filterBy
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiReport,
+            self._client.query('/api/contest/report/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def role(
+        self,
+        *,
+        contest_alias: str,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestRoleResponse:
+        r"""
+
+        Args:
+            contest_alias:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiRole,
+            self._client.query('/api/contest/role/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def setRecommended(
+            self,
+            *,
+            contest_alias: str,
+            value: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Given a contest_alias, sets the recommended flag on/off.
+        Only omegaUp admins can call this API.
+
+        Args:
+            contest_alias:
+            value:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if value is not None:
+            parameters['value'] = str(value)
+        self._client.query('/api/contest/setRecommended/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def contestants(
+        self,
+        *,
+        contest_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ContestContestantsResponse:
+        r"""Return users who participate in a contest, as long as contest admin
+        has chosen to ask for users information and contestants have
+        previously agreed to share their information.
+
+        Args:
+            contest_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Contest__apiContestants,
+            self._client.query('/api/contest/contestants/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def archive(
+            self,
+            *,
+            contest_alias: str,
+            archive: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Archives or Unarchives a contest if user is the creator
+
+        Args:
+            contest_alias:
+            archive:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+        }
+        if archive is not None:
+            parameters['archive'] = str(archive)
+        self._client.query('/api/contest/archive/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
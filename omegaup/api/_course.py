@@ -0,0 +1,2930 @@
+"""The omegaUp Course API and its response types."""
+
+import dataclasses
+import datetime
+import functools
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, Mapping, Optional, Sequence
+
+from omegaup import _decoder, _paginate
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import (
+    _ActivityEvent,
+    _Clarification,
+    _CourseAssignment,
+    _ListItem,
+    _PageItem,
+    _ProblemsetProblem,
+    _Run,
+    _Scoreboard,
+    _ScoreboardEvent,
+)
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _CourseDetails:
+    """_CourseDetails"""
+    admission_mode: str
+    alias: str
+    archived: bool
+    assignments: Sequence['_CourseAssignment']
+    clarifications: Sequence['_Clarification']
+    description: str
+    finish_time: Optional[datetime.datetime]
+    is_admin: bool
+    is_curator: bool
+    is_teaching_assistant: bool
+    languages: Optional[Sequence[str]]
+    level: Optional[str]
+    name: str
+    needs_basic_information: bool
+    objective: Optional[str]
+    recommended: bool
+    requests_user_information: str
+    school_id: Optional[int]
+    school_name: Optional[str]
+    show_scoreboard: bool
+    start_time: datetime.datetime
+    student_count: Optional[int]
+    unlimited_duration: bool
+
+    def __init__(
+        self,
+        *,
+        admission_mode: str,
+        alias: str,
+        archived: bool,
+        assignments: Sequence[Dict[str, Any]],
+        clarifications: Sequence[Dict[str, Any]],
+        description: str,
+        is_admin: bool,
+        is_curator: bool,
+        is_teaching_assistant: bool,
+        name: str,
+        needs_basic_information: bool,
+        recommended: bool,
+        requests_user_information: str,
+        show_scoreboard: bool,
+        start_time: int,
+        unlimited_duration: bool,
+        finish_time: Optional[int] = None,
+        languages: Optional[Sequence[str]] = None,
+        level: Optional[str] = None,
+        objective: Optional[str] = None,
+        school_id: Optional[int] = None,
+        school_name: Optional[str] = None,
+        student_count: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.archived = archived
+        self.assignments = [_CourseAssignment(**v) for v in assignments]
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+        self.description = description
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        self.is_admin = is_admin
+        self.is_curator = is_curator
+        self.is_teaching_assistant = is_teaching_assistant
+        if languages is not None:
+            self.languages = [v for v in languages]
+        else:
+            self.languages = None
+        if level is not None:
+            self.level = level
+        else:
+            self.level = None
+        self.name = name
+        self.needs_basic_information = needs_basic_information
+        if objective is not None:
+            self.objective = objective
+        else:
+            self.objective = None
+        self.recommended = recommended
+        self.requests_user_information = requests_user_information
+        if school_id is not None:
+            self.school_id = school_id
+        else:
+            self.school_id = None
+        if school_name is not None:
+            self.school_name = school_name
+        else:
+            self.school_name = None
+        self.show_scoreboard = show_scoreboard
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        if student_count is not None:
+            self.student_count = student_count
+        else:
+            self.student_count = None
+        self.unlimited_duration = unlimited_duration
+
+
+@dataclasses.dataclass
+class _CourseProblem:
+    """_CourseProblem"""
+    accepted: int
+    alias: str
+    commit: str
+    difficulty: float
+    languages: str
+    letter: str
+    order: int
+    points: float
+    runs: Sequence['_CourseRun']
+    submissions: int
+    title: str
+    version: str
+    visibility: int
+    visits: int
+
+    def __init__(
+        self,
+        *,
+        accepted: int,
+        alias: str,
+        commit: str,
+        difficulty: float,
+        languages: str,
+        letter: str,
+        order: int,
+        points: float,
+        runs: Sequence[Dict[str, Any]],
+        submissions: int,
+        title: str,
+        version: str,
+        visibility: int,
+        visits: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accepted = accepted
+        self.alias = alias
+        self.commit = commit
+        self.difficulty = difficulty
+        self.languages = languages
+        self.letter = letter
+        self.order = order
+        self.points = points
+        self.runs = [_CourseRun(**v) for v in runs]
+        self.submissions = submissions
+        self.title = title
+        self.version = version
+        self.visibility = visibility
+        self.visits = visits
+
+
+@dataclasses.dataclass
+class _CourseRun:
+    """_CourseRun"""
+    contest_score: Optional[float]
+    feedback: Optional['_CourseRun_feedback']
+    guid: str
+    language: str
+    memory: int
+    penalty: int
+    runtime: int
+    score: float
+    source: Optional[str]
+    status: str
+    submit_delay: int
+    time: datetime.datetime
+    verdict: str
+
+    def __init__(
+        self,
+        *,
+        guid: str,
+        language: str,
+        memory: int,
+        penalty: int,
+        runtime: int,
+        score: float,
+        status: str,
+        submit_delay: int,
+        time: int,
+        verdict: str,
+        contest_score: Optional[float] = None,
+        feedback: Optional[Dict[str, Any]] = None,
+        source: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if contest_score is not None:
+            self.contest_score = contest_score
+        else:
+            self.contest_score = None
+        if feedback is not None:
+            self.feedback = _CourseRun_feedback(**feedback)
+        else:
+            self.feedback = None
+        self.guid = guid
+        self.language = language
+        self.memory = memory
+        self.penalty = penalty
+        self.runtime = runtime
+        self.score = score
+        if source is not None:
+            self.source = source
+        else:
+            self.source = None
+        self.status = status
+        self.submit_delay = submit_delay
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.verdict = verdict
+
+
+@dataclasses.dataclass
+class _CourseRun_feedback:
+    """_CourseRun_feedback"""
+    author: str
+    author_classname: str
+    date: datetime.datetime
+    feedback: str
+    range_bytes_end: Optional[int]
+    range_bytes_start: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        author: str,
+        author_classname: str,
+        date: int,
+        feedback: str,
+        range_bytes_end: Optional[int] = None,
+        range_bytes_start: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.author = author
+        self.author_classname = author_classname
+        self.date = datetime.datetime.fromtimestamp(date)
+        self.feedback = feedback
+        if range_bytes_end is not None:
+            self.range_bytes_end = range_bytes_end
+        else:
+            self.range_bytes_end = None
+        if range_bytes_start is not None:
+            self.range_bytes_start = range_bytes_start
+        else:
+            self.range_bytes_start = None
+
+
+@dataclasses.dataclass
+class _CourseStudent:
+    """_CourseStudent"""
+    name: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _IdentityRequest:
+    """_IdentityRequest"""
+    accepted: Optional[bool]
+    admin: Optional['_IdentityRequest_admin']
+    classname: str
+    country: Optional[str]
+    country_id: Optional[str]
+    last_update: Optional[datetime.datetime]
+    name: Optional[str]
+    request_time: datetime.datetime
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        request_time: int,
+        username: str,
+        accepted: Optional[bool] = None,
+        admin: Optional[Dict[str, Any]] = None,
+        country: Optional[str] = None,
+        country_id: Optional[str] = None,
+        last_update: Optional[int] = None,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if accepted is not None:
+            self.accepted = accepted
+        else:
+            self.accepted = None
+        if admin is not None:
+            self.admin = _IdentityRequest_admin(**admin)
+        else:
+            self.admin = None
+        self.classname = classname
+        if country is not None:
+            self.country = country
+        else:
+            self.country = None
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        if last_update is not None:
+            self.last_update = datetime.datetime.fromtimestamp(last_update)
+        else:
+            self.last_update = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.request_time = datetime.datetime.fromtimestamp(request_time)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _IdentityRequest_admin:
+    """_IdentityRequest_admin"""
+    name: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _IntroDetailsPayload:
+    """_IntroDetailsPayload"""
+    course: '_CourseDetails'
+    isFirstTimeAccess: bool
+    needsBasicInformation: bool
+    shouldShowAcceptTeacher: bool
+    shouldShowResults: bool
+    statements: '_IntroDetailsPayload_statements'
+    userRegistrationAccepted: Optional[bool]
+    userRegistrationAnswered: Optional[bool]
+    userRegistrationRequested: Optional[bool]
+
+    def __init__(
+        self,
+        *,
+        course: Dict[str, Any],
+        isFirstTimeAccess: bool,
+        needsBasicInformation: bool,
+        shouldShowAcceptTeacher: bool,
+        shouldShowResults: bool,
+        statements: Dict[str, Any],
+        userRegistrationAccepted: Optional[bool] = None,
+        userRegistrationAnswered: Optional[bool] = None,
+        userRegistrationRequested: Optional[bool] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.course = _CourseDetails(**course)
+        self.isFirstTimeAccess = isFirstTimeAccess
+        self.needsBasicInformation = needsBasicInformation
+        self.shouldShowAcceptTeacher = shouldShowAcceptTeacher
+        self.shouldShowResults = shouldShowResults
+        self.statements = _IntroDetailsPayload_statements(**statements)
+        if userRegistrationAccepted is not None:
+            self.userRegistrationAccepted = userRegistrationAccepted
+        else:
+            self.userRegistrationAccepted = None
+        if userRegistrationAnswered is not None:
+            self.userRegistrationAnswered = userRegistrationAnswered
+        else:
+            self.userRegistrationAnswered = None
+        if userRegistrationRequested is not None:
+            self.userRegistrationRequested = userRegistrationRequested
+        else:
+            self.userRegistrationRequested = None
+
+
+@dataclasses.dataclass
+class _IntroDetailsPayload_statements:
+    """_IntroDetailsPayload_statements"""
+    acceptTeacher: Optional['_PrivacyStatement']
+    privacy: Optional['_PrivacyStatement']
+
+    def __init__(
+        self,
+        *,
+        acceptTeacher: Optional[Dict[str, Any]] = None,
+        privacy: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if acceptTeacher is not None:
+            self.acceptTeacher = _PrivacyStatement(**acceptTeacher)
+        else:
+            self.acceptTeacher = None
+        if privacy is not None:
+            self.privacy = _PrivacyStatement(**privacy)
+        else:
+            self.privacy = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiActivityReport:
+    """_OmegaUp_Controllers_Course__apiActivityReport"""
+    events: Sequence['_ActivityEvent']
+    pagerItems: Sequence['_PageItem']
+
+    def __init__(
+        self,
+        *,
+        events: Sequence[Dict[str, Any]],
+        pagerItems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.events = [_ActivityEvent(**v) for v in events]
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiAddProblem:
+    """_OmegaUp_Controllers_Course__apiAddProblem"""
+    solutionStatus: str
+
+    def __init__(
+        self,
+        *,
+        solutionStatus: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.solutionStatus = solutionStatus
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiAdmins:
+    """_OmegaUp_Controllers_Course__apiAdmins"""
+    admins: Sequence['_OmegaUp_Controllers_Course__apiAdmins_admins_entry']
+    group_admins: Sequence[
+        '_OmegaUp_Controllers_Course__apiAdmins_group_admins_entry']
+    group_teaching_assistants: Sequence[
+        '_OmegaUp_Controllers_Course__apiAdmins_group_teaching_assistants_entry']
+    teaching_assistants: Sequence[
+        '_OmegaUp_Controllers_Course__apiAdmins_teaching_assistants_entry']
+
+    def __init__(
+        self,
+        *,
+        admins: Sequence[Dict[str, Any]],
+        group_admins: Sequence[Dict[str, Any]],
+        group_teaching_assistants: Sequence[Dict[str, Any]],
+        teaching_assistants: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admins = [
+            _OmegaUp_Controllers_Course__apiAdmins_admins_entry(**v)
+            for v in admins
+        ]
+        self.group_admins = [
+            _OmegaUp_Controllers_Course__apiAdmins_group_admins_entry(**v)
+            for v in group_admins
+        ]
+        self.group_teaching_assistants = [
+            _OmegaUp_Controllers_Course__apiAdmins_group_teaching_assistants_entry(
+                **v) for v in group_teaching_assistants
+        ]
+        self.teaching_assistants = [
+            _OmegaUp_Controllers_Course__apiAdmins_teaching_assistants_entry(
+                **v) for v in teaching_assistants
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiAdmins_admins_entry:
+    """_OmegaUp_Controllers_Course__apiAdmins_admins_entry"""
+    role: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        role: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.role = role
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiAdmins_group_admins_entry:
+    """_OmegaUp_Controllers_Course__apiAdmins_group_admins_entry"""
+    alias: str
+    name: str
+    role: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        role: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+        self.role = role
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiAdmins_group_teaching_assistants_entry:
+    """_OmegaUp_Controllers_Course__apiAdmins_group_teaching_assistants_entry"""
+    alias: str
+    name: str
+    role: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        role: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+        self.role = role
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiAdmins_teaching_assistants_entry:
+    """_OmegaUp_Controllers_Course__apiAdmins_teaching_assistants_entry"""
+    role: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        role: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.role = role
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiAssignmentDetails:
+    """_OmegaUp_Controllers_Course__apiAssignmentDetails"""
+    admin: bool
+    alias: str
+    assignment_type: Optional[str]
+    courseAssignments: Sequence['_CourseAssignment']
+    description: Optional[str]
+    director: str
+    finish_time: Optional[datetime.datetime]
+    name: str
+    problems: Sequence['_ProblemsetProblem']
+    problemset_id: int
+    start_time: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        admin: bool,
+        alias: str,
+        courseAssignments: Sequence[Dict[str, Any]],
+        director: str,
+        name: str,
+        problems: Sequence[Dict[str, Any]],
+        problemset_id: int,
+        start_time: int,
+        assignment_type: Optional[str] = None,
+        description: Optional[str] = None,
+        finish_time: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = admin
+        self.alias = alias
+        if assignment_type is not None:
+            self.assignment_type = assignment_type
+        else:
+            self.assignment_type = None
+        self.courseAssignments = [
+            _CourseAssignment(**v) for v in courseAssignments
+        ]
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        self.director = director
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        self.name = name
+        self.problems = [_ProblemsetProblem(**v) for v in problems]
+        self.problemset_id = problemset_id
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiAssignmentScoreboardEvents:
+    """_OmegaUp_Controllers_Course__apiAssignmentScoreboardEvents"""
+    events: Sequence['_ScoreboardEvent']
+
+    def __init__(
+        self,
+        *,
+        events: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.events = [_ScoreboardEvent(**v) for v in events]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiClarifications:
+    """_OmegaUp_Controllers_Course__apiClarifications"""
+    clarifications: Sequence['_Clarification']
+
+    def __init__(
+        self,
+        *,
+        clarifications: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiClone:
+    """_OmegaUp_Controllers_Course__apiClone"""
+    alias: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiGenerateTokenForCloneCourse:
+    """_OmegaUp_Controllers_Course__apiGenerateTokenForCloneCourse"""
+    token: str
+
+    def __init__(
+        self,
+        *,
+        token: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.token = token
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiGetProblemUsers:
+    """_OmegaUp_Controllers_Course__apiGetProblemUsers"""
+    identities: Sequence[str]
+
+    def __init__(
+        self,
+        *,
+        identities: Sequence[str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.identities = [v for v in identities]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiListAssignments:
+    """_OmegaUp_Controllers_Course__apiListAssignments"""
+    assignments: Sequence['_CourseAssignment']
+
+    def __init__(
+        self,
+        *,
+        assignments: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignments = [_CourseAssignment(**v) for v in assignments]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiListSolvedProblems:
+    """_OmegaUp_Controllers_Course__apiListSolvedProblems"""
+    user_problems: Dict[str, Sequence[
+        '_OmegaUp_Controllers_Course__apiListSolvedProblems_user_problems_value_entry']]
+
+    def __init__(
+        self,
+        *,
+        user_problems: Dict[str, Sequence[Dict[str, Any]]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.user_problems = {
+            k: [
+                _OmegaUp_Controllers_Course__apiListSolvedProblems_user_problems_value_entry(
+                    **v) for v in v
+            ]
+            for k, v in user_problems.items()
+        }
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiListSolvedProblems_user_problems_value_entry:
+    """_OmegaUp_Controllers_Course__apiListSolvedProblems_user_problems_value_entry"""
+    alias: str
+    title: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        title: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.title = title
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiListStudents:
+    """_OmegaUp_Controllers_Course__apiListStudents"""
+    students: Sequence['_CourseStudent']
+
+    def __init__(
+        self,
+        *,
+        students: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.students = [_CourseStudent(**v) for v in students]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiListUnsolvedProblems:
+    """_OmegaUp_Controllers_Course__apiListUnsolvedProblems"""
+    user_problems: Dict[str, Sequence[
+        '_OmegaUp_Controllers_Course__apiListUnsolvedProblems_user_problems_value_entry']]
+
+    def __init__(
+        self,
+        *,
+        user_problems: Dict[str, Sequence[Dict[str, Any]]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.user_problems = {
+            k: [
+                _OmegaUp_Controllers_Course__apiListUnsolvedProblems_user_problems_value_entry(
+                    **v) for v in v
+            ]
+            for k, v in user_problems.items()
+        }
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiListUnsolvedProblems_user_problems_value_entry:
+    """_OmegaUp_Controllers_Course__apiListUnsolvedProblems_user_problems_value_entry"""
+    alias: str
+    title: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        title: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.title = title
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiMyProgress:
+    """_OmegaUp_Controllers_Course__apiMyProgress"""
+    assignments: Dict[str, '_Progress']
+
+    def __init__(
+        self,
+        *,
+        assignments: Dict[str, Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignments = {k: _Progress(**v) for k, v in assignments.items()}
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiProblemClarifications:
+    """_OmegaUp_Controllers_Course__apiProblemClarifications"""
+    clarifications: Sequence['_Clarification']
+
+    def __init__(
+        self,
+        *,
+        clarifications: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiRequests:
+    """_OmegaUp_Controllers_Course__apiRequests"""
+    users: Sequence['_IdentityRequest']
+
+    def __init__(
+        self,
+        *,
+        users: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.users = [_IdentityRequest(**v) for v in users]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiRuns:
+    """_OmegaUp_Controllers_Course__apiRuns"""
+    runs: Sequence['_Run']
+    totalRuns: int
+
+    def __init__(
+        self,
+        *,
+        runs: Sequence[Dict[str, Any]],
+        totalRuns: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.runs = [_Run(**v) for v in runs]
+        self.totalRuns = totalRuns
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiSearchUsers:
+    """_OmegaUp_Controllers_Course__apiSearchUsers"""
+    results: Sequence['_ListItem']
+
+    def __init__(
+        self,
+        *,
+        results: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.results = [_ListItem(**v) for v in results]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiStudentProgress:
+    """_OmegaUp_Controllers_Course__apiStudentProgress"""
+    problems: Sequence['_CourseProblem']
+
+    def __init__(
+        self,
+        *,
+        problems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.problems = [_CourseProblem(**v) for v in problems]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Course__apiStudentsProgress:
+    """_OmegaUp_Controllers_Course__apiStudentsProgress"""
+    nextPage: Optional[int]
+    progress: Sequence['_StudentProgressInCourse']
+
+    def __init__(
+        self,
+        *,
+        progress: Sequence[Dict[str, Any]],
+        nextPage: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if nextPage is not None:
+            self.nextPage = nextPage
+        else:
+            self.nextPage = None
+        self.progress = [_StudentProgressInCourse(**v) for v in progress]
+
+
+@dataclasses.dataclass
+class _PrivacyStatement:
+    """_PrivacyStatement"""
+    gitObjectId: Optional[str]
+    markdown: str
+    statementType: str
+
+    def __init__(
+        self,
+        *,
+        markdown: str,
+        statementType: str,
+        gitObjectId: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if gitObjectId is not None:
+            self.gitObjectId = gitObjectId
+        else:
+            self.gitObjectId = None
+        self.markdown = markdown
+        self.statementType = statementType
+
+
+@dataclasses.dataclass
+class _Progress:
+    """_Progress"""
+    max_score: float
+    score: float
+
+    def __init__(
+        self,
+        *,
+        max_score: float,
+        score: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.max_score = max_score
+        self.score = score
+
+
+@dataclasses.dataclass
+class _StudentProgressInCourse:
+    """_StudentProgressInCourse"""
+    assignments: Dict[str, '_StudentProgressInCourse_assignments_value']
+    classname: str
+    country_id: Optional[str]
+    courseProgress: float
+    courseScore: float
+    name: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        assignments: Dict[str, Dict[str, Any]],
+        classname: str,
+        courseProgress: float,
+        courseScore: float,
+        username: str,
+        country_id: Optional[str] = None,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignments = {
+            k: _StudentProgressInCourse_assignments_value(**v)
+            for k, v in assignments.items()
+        }
+        self.classname = classname
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        self.courseProgress = courseProgress
+        self.courseScore = courseScore
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _StudentProgressInCourse_assignments_value:
+    """_StudentProgressInCourse_assignments_value"""
+    problems: Dict[str,
+                   '_StudentProgressInCourse_assignments_value_problems_value']
+    progress: float
+    score: float
+
+    def __init__(
+        self,
+        *,
+        problems: Dict[str, Dict[str, Any]],
+        progress: float,
+        score: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.problems = {
+            k: _StudentProgressInCourse_assignments_value_problems_value(**v)
+            for k, v in problems.items()
+        }
+        self.progress = progress
+        self.score = score
+
+
+@dataclasses.dataclass
+class _StudentProgressInCourse_assignments_value_problems_value:
+    """_StudentProgressInCourse_assignments_value_problems_value"""
+    progress: float
+    score: float
+
+    def __init__(
+        self,
+        *,
+        progress: float,
+        score: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.progress = progress
+        self.score = score
+
+
+CourseGenerateTokenForCloneCourseResponse = _OmegaUp_Controllers_Course__apiGenerateTokenForCloneCourse
+"""The return type of the CourseGenerateTokenForCloneCourse API."""
+
+CourseCloneResponse = _OmegaUp_Controllers_Course__apiClone
+"""The return type of the CourseClone API."""
+
+CourseAddProblemResponse = _OmegaUp_Controllers_Course__apiAddProblem
+"""The return type of the CourseAddProblem API."""
+
+CourseGetProblemUsersResponse = _OmegaUp_Controllers_Course__apiGetProblemUsers
+"""The return type of the CourseGetProblemUsers API."""
+
+CourseListAssignmentsResponse = _OmegaUp_Controllers_Course__apiListAssignments
+"""The return type of the CourseListAssignments API."""
+
+CourseRequestsResponse = _OmegaUp_Controllers_Course__apiRequests
+"""The return type of the CourseRequests API."""
+
+CourseListStudentsResponse = _OmegaUp_Controllers_Course__apiListStudents
+"""The return type of the CourseListStudents API."""
+
+CourseStudentProgressResponse = _OmegaUp_Controllers_Course__apiStudentProgress
+"""The return type of the CourseStudentProgress API."""
+
+CourseMyProgressResponse = _OmegaUp_Controllers_Course__apiMyProgress
+"""The return type of the CourseMyProgress API."""
+
+CourseSearchUsersResponse = _OmegaUp_Controllers_Course__apiSearchUsers
+"""The return type of the CourseSearchUsers API."""
+
+CourseAdminsResponse = _OmegaUp_Controllers_Course__apiAdmins
+"""The return type of the CourseAdmins API."""
+
+CourseIntroDetailsResponse = _IntroDetailsPayload
+"""The return type of the CourseIntroDetails API."""
+
+CourseStudentsProgressResponse = _OmegaUp_Controllers_Course__apiStudentsProgress
+"""The return type of the CourseStudentsProgress API."""
+
+CourseAdminDetailsResponse = _CourseDetails
+"""The return type of the CourseAdminDetails API."""
+
+CourseActivityReportResponse = _OmegaUp_Controllers_Course__apiActivityReport
+"""The return type of the CourseActivityReport API."""
+
+CourseAssignmentDetailsResponse = _OmegaUp_Controllers_Course__apiAssignmentDetails
+"""The return type of the CourseAssignmentDetails API."""
+
+CourseRunsResponse = _OmegaUp_Controllers_Course__apiRuns
+"""The return type of the CourseRuns API."""
+
+CourseDetailsResponse = _CourseDetails
+"""The return type of the CourseDetails API."""
+
+CourseClarificationsResponse = _OmegaUp_Controllers_Course__apiClarifications
+"""The return type of the CourseClarifications API."""
+
+CourseProblemClarificationsResponse = _OmegaUp_Controllers_Course__apiProblemClarifications
+"""The return type of the CourseProblemClarifications API."""
+
+CourseAssignmentScoreboardResponse = _Scoreboard
+"""The return type of the CourseAssignmentScoreboard API."""
+
+CourseAssignmentScoreboardEventsResponse = _OmegaUp_Controllers_Course__apiAssignmentScoreboardEvents
+"""The return type of the CourseAssignmentScoreboardEvents API."""
+
+CourseListSolvedProblemsResponse = _OmegaUp_Controllers_Course__apiListSolvedProblems
+"""The return type of the CourseListSolvedProblems API."""
+
+CourseListUnsolvedProblemsResponse = _OmegaUp_Controllers_Course__apiListUnsolvedProblems
+"""The return type of the CourseListUnsolvedProblems API."""
+
+
+class Course:
+    r"""CourseController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def generateTokenForCloneCourse(
+        self,
+        *,
+        course_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseGenerateTokenForCloneCourseResponse:
+        r"""
+
+        Args:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiGenerateTokenForCloneCourse,
+            self._client.query('/api/course/generateTokenForCloneCourse/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def clone(
+        self,
+        *,
+        alias: str,
+        course_alias: str,
+        name: str,
+        start_time: datetime.datetime,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseCloneResponse:
+        r"""Clone a course
+
+        Args:
+            alias:
+            course_alias:
+            name:
+            start_time:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'course_alias': course_alias,
+            'name': name,
+            'start_time': str(int(start_time.timestamp())),
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiClone,
+            self._client.query('/api/course/clone/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def create(
+            self,
+            *,
+            alias: str,
+            description: str,
+            name: str,
+            start_time: int,
+            admission_mode: Optional[str] = None,
+            archived: Optional[bool] = None,
+            finish_time: Optional[int] = None,
+            languages: Optional[str] = None,
+            level: Optional[str] = None,
+            minimum_progress_for_certificate: Optional[int] = None,
+            needs_basic_information: Optional[bool] = None,
+            objective: Optional[str] = None,
+            requests_user_information: Optional[str] = None,
+            school_id: Optional[int] = None,
+            show_scoreboard: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Create new course API
+
+        Args:
+            alias:
+            description:
+            name:
+            start_time:
+            admission_mode:
+            archived:
+            finish_time:
+            languages:
+            level:
+            minimum_progress_for_certificate:
+            needs_basic_information:
+            objective:
+            requests_user_information:
+            school_id:
+            show_scoreboard:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'description': description,
+            'name': name,
+            'start_time': str(start_time),
+        }
+        if admission_mode is not None:
+            parameters['admission_mode'] = admission_mode
+        if archived is not None:
+            parameters['archived'] = str(archived)
+        if finish_time is not None:
+            parameters['finish_time'] = str(finish_time)
+        if languages is not None:
+            parameters['languages'] = languages
+        if level is not None:
+            parameters['level'] = level
+        if minimum_progress_for_certificate is not None:
+            parameters['minimum_progress_for_certificate'] = str(
+                minimum_progress_for_certificate)
+        if needs_basic_information is not None:
+            parameters['needs_basic_information'] = str(
+                needs_basic_information)
+        if objective is not None:
+            parameters['objective'] = objective
+        if requests_user_information is not None:
+            parameters['requests_user_information'] = requests_user_information
+        if school_id is not None:
+            parameters['school_id'] = str(school_id)
+        if show_scoreboard is not None:
+            parameters['show_scoreboard'] = str(show_scoreboard)
+        self._client.query('/api/course/create/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def createAssignment(
+            self,
+            *,
+            alias: str,
+            assignment_type: str,
+            course_alias: str,
+            description: str,
+            name: str,
+            start_time: datetime.datetime,
+            finish_time: Optional[datetime.datetime] = None,
+            order: Optional[int] = None,
+            problems: Optional[str] = None,
+            publish_time_delay: Optional[int] = None,
+            unlimited_duration: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""API to Create an assignment
+
+        Args:
+            alias:
+            assignment_type:
+            course_alias:
+            description:
+            name:
+            start_time:
+            finish_time:
+            order:
+            problems:
+            publish_time_delay:
+            unlimited_duration:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'assignment_type': assignment_type,
+            'course_alias': course_alias,
+            'description': description,
+            'name': name,
+            'start_time': str(int(start_time.timestamp())),
+        }
+        if finish_time is not None:
+            parameters['finish_time'] = str(int(finish_time.timestamp()))
+        if order is not None:
+            parameters['order'] = str(order)
+        if problems is not None:
+            parameters['problems'] = problems
+        if publish_time_delay is not None:
+            parameters['publish_time_delay'] = str(publish_time_delay)
+        if unlimited_duration is not None:
+            parameters['unlimited_duration'] = str(unlimited_duration)
+        self._client.query('/api/course/createAssignment/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def updateAssignment(
+            self,
+            *,
+            assignment: str,
+            course: str,
+            finish_time: Optional[datetime.datetime] = None,
+            start_time: Optional[datetime.datetime] = None,
+            unlimited_duration: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Update an assignment
+
+        Args:
+            assignment:
+            course:
+            finish_time:
+            start_time:
+            unlimited_duration:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment': assignment,
+            'course': course,
+        }
+        if finish_time is not None:
+            parameters['finish_time'] = str(int(finish_time.timestamp()))
+        if start_time is not None:
+            parameters['start_time'] = str(int(start_time.timestamp()))
+        if unlimited_duration is not None:
+            parameters['unlimited_duration'] = str(unlimited_duration)
+        self._client.query('/api/course/updateAssignment/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addProblem(
+        self,
+        *,
+        assignment_alias: str,
+        course_alias: str,
+        points: float,
+        problem_alias: str,
+        commit: Optional[str] = None,
+        is_extra_problem: Optional[bool] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseAddProblemResponse:
+        r"""Adds a problem to an assignment
+
+        Args:
+            assignment_alias:
+            course_alias:
+            points:
+            problem_alias:
+            commit:
+            is_extra_problem:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+            'points': str(points),
+            'problem_alias': problem_alias,
+        }
+        if commit is not None:
+            parameters['commit'] = commit
+        if is_extra_problem is not None:
+            parameters['is_extra_problem'] = str(is_extra_problem)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiAddProblem,
+            self._client.query('/api/course/addProblem/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def updateProblemsOrder(
+            self,
+            *,
+            assignment_alias: str,
+            course_alias: str,
+            problems: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""
+
+        Args:
+            assignment_alias:
+            course_alias:
+            problems:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+            'problems': problems,
+        }
+        self._client.query('/api/course/updateProblemsOrder/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def updateAssignmentsOrder(
+            self,
+            *,
+            assignments: str,
+            course_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""
+
+        Args:
+            assignments:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignments': assignments,
+            'course_alias': course_alias,
+        }
+        self._client.query('/api/course/updateAssignmentsOrder/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def getProblemUsers(
+        self,
+        *,
+        course_alias: str,
+        problem_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseGetProblemUsersResponse:
+        r"""
+
+        Args:
+            course_alias:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'problem_alias': problem_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiGetProblemUsers,
+            self._client.query('/api/course/getProblemUsers/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def removeProblem(
+            self,
+            *,
+            assignment_alias: str,
+            course_alias: str,
+            problem_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Remove a problem from an assignment
+
+        Args:
+            assignment_alias:
+            course_alias:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+            'problem_alias': problem_alias,
+        }
+        self._client.query('/api/course/removeProblem/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def listAssignments(
+        self,
+        *,
+        course_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseListAssignmentsResponse:
+        r"""List course assignments
+
+        Args:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiListAssignments,
+            self._client.query('/api/course/listAssignments/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def removeAssignment(
+            self,
+            *,
+            assignment_alias: str,
+            course_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Remove an assignment from a course
+
+        Args:
+            assignment_alias:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+        }
+        self._client.query('/api/course/removeAssignment/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def requests(
+        self,
+        *,
+        course_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseRequestsResponse:
+        r"""Returns the list of requests made by participants who are interested to
+        join the course
+
+        Args:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiRequests,
+            self._client.query('/api/course/requests/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def arbitrateRequest(
+            self,
+            *,
+            course_alias: str,
+            resolution: bool,
+            username: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Stores the resolution given to a certain request made by a contestant
+        interested to join the course.
+
+        Args:
+            course_alias:
+            resolution:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'resolution': str(resolution),
+            'username': username,
+        }
+        self._client.query('/api/course/arbitrateRequest/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def listStudents(
+        self,
+        *,
+        course_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseListStudentsResponse:
+        r"""List students in a course
+
+        Args:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiListStudents,
+            self._client.query('/api/course/listStudents/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def studentProgress(
+        self,
+        *,
+        assignment_alias: str,
+        course_alias: str,
+        usernameOrEmail: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseStudentProgressResponse:
+        r"""
+
+        Args:
+            assignment_alias:
+            course_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiStudentProgress,
+            self._client.query('/api/course/studentProgress/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def myProgress(
+        self,
+        *,
+        alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseMyProgressResponse:
+        r"""Returns details of a given course
+
+        Args:
+            alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiMyProgress,
+            self._client.query('/api/course/myProgress/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def addStudent(
+            self,
+            *,
+            accept_teacher_git_object_id: str,
+            course_alias: str,
+            privacy_git_object_id: str,
+            share_user_information: bool,
+            statement_type: str,
+            usernameOrEmail: str,
+            accept_teacher: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Add Student to Course.
+
+        Args:
+            accept_teacher_git_object_id:
+            course_alias:
+            privacy_git_object_id:
+            share_user_information:
+            statement_type:
+            usernameOrEmail:
+            accept_teacher:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'accept_teacher_git_object_id': accept_teacher_git_object_id,
+            'course_alias': course_alias,
+            'privacy_git_object_id': privacy_git_object_id,
+            'share_user_information': str(share_user_information),
+            'statement_type': statement_type,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        if accept_teacher is not None:
+            parameters['accept_teacher'] = str(accept_teacher)
+        self._client.query('/api/course/addStudent/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeStudent(
+            self,
+            *,
+            course_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Remove Student from Course
+
+        Args:
+            course_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/course/removeStudent/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def searchUsers(
+        self,
+        *,
+        assignment_alias: str,
+        course_alias: str,
+        query: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseSearchUsersResponse:
+        r"""Search users in course assignment
+
+        Args:
+            assignment_alias:
+            course_alias:
+            query:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+        }
+        if query is not None:
+            parameters['query'] = query
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiSearchUsers,
+            self._client.query('/api/course/searchUsers/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def admins(
+        self,
+        *,
+        course_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseAdminsResponse:
+        r"""Returns all course administrators
+
+        Args:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiAdmins,
+            self._client.query('/api/course/admins/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def addAdmin(
+            self,
+            *,
+            course_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds an admin to a course
+
+        Args:
+            course_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/course/addAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeAdmin(
+            self,
+            *,
+            course_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes an admin from a course
+
+        Args:
+            course_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/course/removeAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addGroupAdmin(
+            self,
+            *,
+            course_alias: str,
+            group: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds an group admin to a course
+
+        Args:
+            course_alias:
+            group:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'group': group,
+        }
+        self._client.query('/api/course/addGroupAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeGroupAdmin(
+            self,
+            *,
+            course_alias: str,
+            group: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a group admin from a course
+
+        Args:
+            course_alias:
+            group:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'group': group,
+        }
+        self._client.query('/api/course/removeGroupAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addTeachingAssistant(
+            self,
+            *,
+            course_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds a teaching assistant to a course
+
+        Args:
+            course_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/course/addTeachingAssistant/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addGroupTeachingAssistant(
+            self,
+            *,
+            course_alias: str,
+            group: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds an group teaching assistant to a course
+
+        Args:
+            course_alias:
+            group:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'group': group,
+        }
+        self._client.query('/api/course/addGroupTeachingAssistant/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeGroupTeachingAssistant(
+            self,
+            *,
+            course_alias: str,
+            group: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a group teaching assistant from a course
+
+        Args:
+            course_alias:
+            group:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'group': group,
+        }
+        self._client.query('/api/course/removeGroupTeachingAssistant/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeTeachingAssistant(
+            self,
+            *,
+            course_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a teaching assistant from a course
+
+        Args:
+            course_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/course/removeTeachingAssistant/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def requestFeedback(
+            self,
+            *,
+            assignment_alias: str,
+            course_alias: str,
+            guid: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Request feedback and its corresponding notification
+
+        Args:
+            assignment_alias:
+            course_alias:
+            guid:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+            'guid': guid,
+        }
+        self._client.query('/api/course/requestFeedback/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def introDetails(
+        self,
+        *,
+        course_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseIntroDetailsResponse:
+        r"""Show course intro only on public courses when user is not yet registered
+
+        Args:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        return _decoder.decode(
+            _IntroDetailsPayload,
+            self._client.query('/api/course/introDetails/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def studentsProgress(
+        self,
+        *,
+        course: str,
+        length: int,
+        page: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseStudentsProgressResponse:
+        r"""
+
+        Args:
+            course:
+            length:
+            page:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course': course,
+            'length': str(length),
+            'page': str(page),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiStudentsProgress,
+            self._client.query('/api/course/studentsProgress/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def registerForCourse(
+            self,
+            *,
+            course_alias: str,
+            accept_teacher: Optional[bool] = None,
+            share_user_information: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""
+
+        Args:
+            course_alias:
+            accept_teacher:
+            share_user_information:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        if accept_teacher is not None:
+            parameters['accept_teacher'] = str(accept_teacher)
+        if share_user_information is not None:
+            parameters['share_user_information'] = str(share_user_information)
+        self._client.query('/api/course/registerForCourse/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def adminDetails(
+        self,
+        *,
+        alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseAdminDetailsResponse:
+        r"""Returns all details of a given Course
+
+        Args:
+            alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+        }
+        return _decoder.decode(
+            _CourseDetails,
+            self._client.query('/api/course/adminDetails/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def activityReport(
+        self,
+        *,
+        course_alias: str,
+        length: Optional[int] = None,
+        page: Optional[int] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseActivityReportResponse:
+        r"""Returns a report with all user activity for a course.
+
+        Args:
+            course_alias:
+            length:
+            page:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        if length is not None:
+            parameters['length'] = str(length)
+        if page is not None:
+            parameters['page'] = str(page)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiActivityReport,
+            self._client.query('/api/course/activityReport/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def archive(
+            self,
+            *,
+            archive: bool,
+            course_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Archives or un-archives a course
+
+        Args:
+            archive:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'archive': str(archive),
+            'course_alias': course_alias,
+        }
+        self._client.query('/api/course/archive/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def assignmentDetails(
+        self,
+        *,
+        assignment: str,
+        course: str,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseAssignmentDetailsResponse:
+        r"""Returns details of a given assignment
+
+        Args:
+            assignment:
+            course:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment': assignment,
+            'course': course,
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiAssignmentDetails,
+            self._client.query('/api/course/assignmentDetails/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def runs(
+            self,
+            *,
+            assignment_alias: str,
+            course_alias: str,
+            execution: Optional[str] = None,
+            language: Optional[str] = None,
+            offset: Optional[int] = None,
+            output: Optional[str] = None,
+            problem_alias: Optional[str] = None,
+            rowcount: Optional[int] = None,
+            status: Optional[str] = None,
+            username: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseRunsResponse:
+        r"""Returns all runs for a course
+
+        Args:
+            assignment_alias:
+            course_alias:
+            execution:
+            language:
+            offset:
+            output:
+            problem_alias:
+            rowcount:
+            status:
+            username:
+            verdict:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+        }
+        if execution is not None:
+            parameters['execution'] = execution
+        if language is not None:
+            parameters['language'] = language
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if output is not None:
+            parameters['output'] = output
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        if status is not None:
+            parameters['status'] = status
+        if username is not None:
+            parameters['username'] = username
+        if verdict is not None:
+            parameters['verdict'] = verdict
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiRuns,
+            self._client.query('/api/course/runs/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def stream_runs(
+            self,
+            *,
+            assignment_alias: str,
+            course_alias: str,
+            execution: Optional[str] = None,
+            language: Optional[str] = None,
+            offset: Optional[int] = None,
+            output: Optional[str] = None,
+            problem_alias: Optional[str] = None,
+            rowcount: Optional[int] = None,
+            status: Optional[str] = None,
+            username: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> Iterator[_Run]:
+        r"""Returns all runs for a course
+
+        Streaming variant of `runs()` that parses the response
+        incrementally.
+
+        Args:
+            assignment_alias:
+            course_alias:
+            execution:
+            language:
+            offset:
+            output:
+            problem_alias:
+            rowcount:
+            status:
+            username:
+            verdict:
+
+        Yields:
+            The runs, decoded one at a time as the response is received.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+        }
+        if execution is not None:
+            parameters['execution'] = execution
+        if language is not None:
+            parameters['language'] = language
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if output is not None:
+            parameters['output'] = output
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        if status is not None:
+            parameters['status'] = status
+        if username is not None:
+            parameters['username'] = username
+        if verdict is not None:
+            parameters['verdict'] = verdict
+        return _decoder.decode_stream(
+            _Run,
+            self._client.query_stream('/api/course/runs/',
+                                      'runs',
+                                      payload=parameters,
+                                      files_=files_,
+                                      timeout_=timeout_,
+                                      check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_runs(
+            self,
+            *,
+            assignment_alias: str,
+            course_alias: str,
+            execution: Optional[str] = None,
+            language: Optional[str] = None,
+            output: Optional[str] = None,
+            problem_alias: Optional[str] = None,
+            status: Optional[str] = None,
+            username: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+            prefetch_: bool = True,
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> Iterator[_Run]:
+        r"""Returns all runs for a course
+
+        Paginated variant of `runs()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            assignment_alias:
+            course_alias:
+            execution:
+            language:
+            output:
+            problem_alias:
+            status:
+            username:
+            verdict:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.runs,
+                                  assignment_alias=assignment_alias,
+                                  course_alias=course_alias,
+                                  execution=execution,
+                                  language=language,
+                                  output=output,
+                                  problem_alias=problem_alias,
+                                  status=status,
+                                  username=username,
+                                  verdict=verdict,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='runs',
+                               page='offset',
+                               page_size='rowcount',
+                               first_page=0,
+                               size=page_size_,
+                               total='totalRuns',
+                               prefetch=prefetch_)
+
+    def details(
+        self,
+        *,
+        alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseDetailsResponse:
+        r"""Returns details of a given course
+
+        Args:
+            alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+        }
+        return _decoder.decode(
+            _CourseDetails,
+            self._client.query('/api/course/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def update(
+            self,
+            *,
+            alias: str,
+            languages: str,
+            school_id: int,
+            admission_mode: Optional[str] = None,
+            description: Optional[str] = None,
+            finish_time: Optional[datetime.datetime] = None,
+            level: Optional[str] = None,
+            name: Optional[str] = None,
+            needs_basic_information: Optional[bool] = None,
+            objective: Optional[str] = None,
+            recommended: Optional[bool] = None,
+            requests_user_information: Optional[str] = None,
+            show_scoreboard: Optional[bool] = None,
+            start_time: Optional[datetime.datetime] = None,
+            unlimited_duration: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Edit Course contents
+
+        Args:
+            alias:
+            languages:
+            school_id:
+            admission_mode:
+            description:
+            finish_time:
+            level:
+            name:
+            needs_basic_information:
+            objective:
+            recommended:
+            requests_user_information:
+            show_scoreboard:
+            start_time:
+            unlimited_duration:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'languages': languages,
+            'school_id': str(school_id),
+        }
+        if admission_mode is not None:
+            parameters['admission_mode'] = admission_mode
+        if description is not None:
+            parameters['description'] = description
+        if finish_time is not None:
+            parameters['finish_time'] = str(int(finish_time.timestamp()))
+        if level is not None:
+            parameters['level'] = level
+        if name is not None:
+            parameters['name'] = name
+        if needs_basic_information is not None:
+            parameters['needs_basic_information'] = str(
+                needs_basic_information)
+        if objective is not None:
+            parameters['objective'] = objective
+        if recommended is not None:
+            parameters['recommended'] = str(recommended)
+        if requests_user_information is not None:
+            parameters['requests_user_information'] = requests_user_information
+        if show_scoreboard is not None:
+            parameters['show_scoreboard'] = str(show_scoreboard)
+        if start_time is not None:
+            parameters['start_time'] = str(int(start_time.timestamp()))
+        if unlimited_duration is not None:
+            parameters['unlimited_duration'] = str(unlimited_duration)
+        self._client.query('/api/course/update/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def clarifications(
+        self,
+        *,
+        course_alias: str,
+        offset: int,
+        rowcount: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseClarificationsResponse:
+        r"""Gets the clarifications of all assignments in a course
+
+        Args:
+            course_alias:
+            offset:
+            rowcount:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+            'offset': str(offset),
+            'rowcount': str(rowcount),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiClarifications,
+            self._client.query('/api/course/clarifications/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def problemClarifications(
+        self,
+        *,
+        assignment_alias: str,
+        course_alias: str,
+        offset: int,
+        problem_alias: str,
+        rowcount: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseProblemClarificationsResponse:
+        r"""Get clarifications of problem in a contest
+
+        Args:
+            assignment_alias:
+            course_alias:
+            offset:
+            problem_alias:
+            rowcount:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+            'offset': str(offset),
+            'problem_alias': problem_alias,
+            'rowcount': str(rowcount),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiProblemClarifications,
+            self._client.query('/api/course/problemClarifications/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def assignmentScoreboard(
+        self,
+        *,
+        assignment: str,
+        course: str,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseAssignmentScoreboardResponse:
+        r"""Gets Scoreboard for an assignment
+
+        Args:
+            assignment:
+            course:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment': assignment,
+            'course': course,
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _Scoreboard,
+            self._client.query('/api/course/assignmentScoreboard/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def assignmentScoreboardEvents(
+        self,
+        *,
+        assignment: str,
+        course: str,
+        token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseAssignmentScoreboardEventsResponse:
+        r"""Returns the Scoreboard events
+
+        Args:
+            assignment:
+            course:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment': assignment,
+            'course': course,
+        }
+        if token is not None:
+            parameters['token'] = token
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiAssignmentScoreboardEvents,
+            self._client.query('/api/course/assignmentScoreboardEvents/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def listSolvedProblems(
+        self,
+        *,
+        course_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseListSolvedProblemsResponse:
+        r"""Get Problems solved by users of a course
+
+        Args:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiListSolvedProblems,
+            self._client.query('/api/course/listSolvedProblems/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def listUnsolvedProblems(
+        self,
+        *,
+        course_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> CourseListUnsolvedProblemsResponse:
+        r"""Get Problems unsolved by users of a course
+
+        Args:
+            course_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'course_alias': course_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Course__apiListUnsolvedProblems,
+            self._client.query('/api/course/listUnsolvedProblems/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
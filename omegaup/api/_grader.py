@@ -0,0 +1,129 @@
+"""The omegaUp Grader API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _GraderStatus:
+    """_GraderStatus"""
+    broadcaster_sockets: int
+    embedded_runner: bool
+    queue: '_GraderStatus_queue'
+    status: str
+
+    def __init__(
+        self,
+        *,
+        broadcaster_sockets: int,
+        embedded_runner: bool,
+        queue: Dict[str, Any],
+        status: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.broadcaster_sockets = broadcaster_sockets
+        self.embedded_runner = embedded_runner
+        self.queue = _GraderStatus_queue(**queue)
+        self.status = status
+
+
+@dataclasses.dataclass
+class _GraderStatus_queue:
+    """_GraderStatus_queue"""
+    run_queue_length: int
+    runner_queue_length: int
+    runners: Sequence[str]
+    running: Sequence['_GraderStatus_queue_running_entry']
+
+    def __init__(
+        self,
+        *,
+        run_queue_length: int,
+        runner_queue_length: int,
+        runners: Sequence[str],
+        running: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.run_queue_length = run_queue_length
+        self.runner_queue_length = runner_queue_length
+        self.runners = [v for v in runners]
+        self.running = [
+            _GraderStatus_queue_running_entry(**v) for v in running
+        ]
+
+
+@dataclasses.dataclass
+class _GraderStatus_queue_running_entry:
+    """_GraderStatus_queue_running_entry"""
+    id: int
+    name: str
+
+    def __init__(
+        self,
+        *,
+        id: int,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.id = id
+        self.name = name
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Grader__apiStatus:
+    """_OmegaUp_Controllers_Grader__apiStatus"""
+    grader: '_GraderStatus'
+
+    def __init__(
+        self,
+        *,
+        grader: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.grader = _GraderStatus(**grader)
+
+
+GraderStatusResponse = _OmegaUp_Controllers_Grader__apiStatus
+"""The return type of the GraderStatus API."""
+
+
+class Grader:
+    r"""Description of GraderController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def status(
+        self,
+        *,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> GraderStatusResponse:
+        r"""Calls to /status grader
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_Grader__apiStatus,
+            self._client.query('/api/grader/status/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
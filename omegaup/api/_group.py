@@ -0,0 +1,443 @@
+"""The omegaUp Group API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import _Identity
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _GroupListItem:
+    """_GroupListItem"""
+    label: str
+    value: str
+
+    def __init__(
+        self,
+        *,
+        label: str,
+        value: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.label = label
+        self.value = value
+
+
+@dataclasses.dataclass
+class _GroupScoreboard:
+    """_GroupScoreboard"""
+    alias: str
+    create_time: str
+    description: Optional[str]
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        create_time: str,
+        name: str,
+        description: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.create_time = create_time
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        self.name = name
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Group__apiDetails:
+    """_OmegaUp_Controllers_Group__apiDetails"""
+    group: '_OmegaUp_Controllers_Group__apiDetails_group'
+    scoreboards: Sequence['_GroupScoreboard']
+
+    def __init__(
+        self,
+        *,
+        group: Dict[str, Any],
+        scoreboards: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.group = _OmegaUp_Controllers_Group__apiDetails_group(**group)
+        self.scoreboards = [_GroupScoreboard(**v) for v in scoreboards]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Group__apiDetails_group:
+    """_OmegaUp_Controllers_Group__apiDetails_group"""
+    alias: str
+    create_time: int
+    description: str
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        create_time: int,
+        description: str,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.create_time = create_time
+        self.description = description
+        self.name = name
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Group__apiMembers:
+    """_OmegaUp_Controllers_Group__apiMembers"""
+    identities: Sequence['_Identity']
+
+    def __init__(
+        self,
+        *,
+        identities: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.identities = [_Identity(**v) for v in identities]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Group__apiMyList:
+    """_OmegaUp_Controllers_Group__apiMyList"""
+    groups: Sequence['_OmegaUp_Controllers_Group__apiMyList_groups_entry']
+
+    def __init__(
+        self,
+        *,
+        groups: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.groups = [
+            _OmegaUp_Controllers_Group__apiMyList_groups_entry(**v)
+            for v in groups
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Group__apiMyList_groups_entry:
+    """_OmegaUp_Controllers_Group__apiMyList_groups_entry"""
+    alias: str
+    create_time: datetime.datetime
+    description: str
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        create_time: int,
+        description: str,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.create_time = datetime.datetime.fromtimestamp(create_time)
+        self.description = description
+        self.name = name
+
+
+GroupMyListResponse = _OmegaUp_Controllers_Group__apiMyList
+"""The return type of the GroupMyList API."""
+
+GroupListResponse = Sequence['_GroupListItem']
+"""The return type of the GroupList API."""
+
+GroupDetailsResponse = _OmegaUp_Controllers_Group__apiDetails
+"""The return type of the GroupDetails API."""
+
+GroupMembersResponse = _OmegaUp_Controllers_Group__apiMembers
+"""The return type of the GroupMembers API."""
+
+
+class Group:
+    r"""GroupController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def create(
+            self,
+            *,
+            alias: str,
+            description: str,
+            name: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""New group
+
+        Args:
+            alias:
+            description:
+            name:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'description': description,
+            'name': name,
+        }
+        self._client.query('/api/group/create/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def update(
+            self,
+            *,
+            alias: str,
+            description: str,
+            name: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Update an existing group
+
+        Args:
+            alias:
+            description:
+            name:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'description': description,
+            'name': name,
+        }
+        self._client.query('/api/group/update/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addUser(
+            self,
+            *,
+            group_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Add identity to group
+
+        Args:
+            group_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group_alias': group_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/group/addUser/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeUser(
+            self,
+            *,
+            group_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Remove user from group
+
+        Args:
+            group_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group_alias': group_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/group/removeUser/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def myList(
+        self,
+        *,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> GroupMyListResponse:
+        r"""Returns a list of groups by owner
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_Group__apiMyList,
+            self._client.query('/api/group/myList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def list(
+            self,
+            *,
+            query: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> GroupListResponse:
+        r"""Returns a list of groups that match a partial name. This returns an
+        array instead of an object since it is used by typeahead.
+
+        Args:
+            query:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'query': query,
+        }
+        return list(
+            _decoder.decode_each(
+                _GroupListItem,
+                self._client.query('/api/group/list/',
+                                   payload=parameters,
+                                   files_=files_,
+                                   timeout_=timeout_,
+                                   check_=check_),
+                timestamps=self._client.timestamps))
+
+    def details(
+        self,
+        *,
+        group_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> GroupDetailsResponse:
+        r"""Details of a group (scoreboards)
+
+        Args:
+            group_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group_alias': group_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Group__apiDetails,
+            self._client.query('/api/group/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def members(
+        self,
+        *,
+        group_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> GroupMembersResponse:
+        r"""Members of a group (usernames only).
+
+        Args:
+            group_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group_alias': group_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Group__apiMembers,
+            self._client.query('/api/group/members/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def createScoreboard(
+            self,
+            *,
+            group_alias: str,
+            name: str,
+            alias: Optional[str] = None,
+            description: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Create a scoreboard set to a group
+
+        Args:
+            group_alias:
+            name:
+            alias:
+            description:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group_alias': group_alias,
+            'name': name,
+        }
+        if alias is not None:
+            parameters['alias'] = alias
+        if description is not None:
+            parameters['description'] = description
+        self._client.query('/api/group/createScoreboard/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
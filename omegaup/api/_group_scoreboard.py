@@ -0,0 +1,419 @@
+"""The omegaUp GroupScoreboard API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _GroupScoreboardDetails:
+    """_GroupScoreboardDetails"""
+    contests: Sequence['_ScoreboardContest']
+    ranking: Sequence['_ScoreboardRanking']
+    scoreboard: '_ScoreboardDetails'
+
+    def __init__(
+        self,
+        *,
+        contests: Sequence[Dict[str, Any]],
+        ranking: Sequence[Dict[str, Any]],
+        scoreboard: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = [_ScoreboardContest(**v) for v in contests]
+        self.ranking = [_ScoreboardRanking(**v) for v in ranking]
+        self.scoreboard = _ScoreboardDetails(**scoreboard)
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_GroupScoreboard__apiList:
+    """_OmegaUp_Controllers_GroupScoreboard__apiList"""
+    scoreboards: Sequence[
+        '_OmegaUp_Controllers_GroupScoreboard__apiList_scoreboards_entry']
+
+    def __init__(
+        self,
+        *,
+        scoreboards: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.scoreboards = [
+            _OmegaUp_Controllers_GroupScoreboard__apiList_scoreboards_entry(
+                **v) for v in scoreboards
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_GroupScoreboard__apiList_scoreboards_entry:
+    """_OmegaUp_Controllers_GroupScoreboard__apiList_scoreboards_entry"""
+    alias: str
+    create_time: int
+    description: str
+    group_id: int
+    group_scoreboard_id: int
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        create_time: int,
+        description: str,
+        group_id: int,
+        group_scoreboard_id: int,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.create_time = create_time
+        self.description = description
+        self.group_id = group_id
+        self.group_scoreboard_id = group_scoreboard_id
+        self.name = name
+
+
+@dataclasses.dataclass
+class _ScoreboardContest:
+    """_ScoreboardContest"""
+    acl_id: int
+    admission_mode: str
+    alias: str
+    contest_id: int
+    description: str
+    feedback: str
+    finish_time: datetime.datetime
+    languages: str
+    last_updated: int
+    only_ac: Optional[bool]
+    penalty: str
+    penalty_calc_policy: str
+    points_decay_factor: float
+    problemset_id: int
+    recommended: bool
+    rerun_id: int
+    score_mode: str
+    scoreboard: int
+    show_scoreboard_after: bool
+    start_time: datetime.datetime
+    submissions_gap: int
+    title: str
+    urgent: bool
+    weight: Optional[float]
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        acl_id: int,
+        admission_mode: str,
+        alias: str,
+        contest_id: int,
+        description: str,
+        feedback: str,
+        finish_time: int,
+        languages: str,
+        last_updated: int,
+        penalty: str,
+        penalty_calc_policy: str,
+        points_decay_factor: float,
+        problemset_id: int,
+        recommended: bool,
+        rerun_id: int,
+        score_mode: str,
+        scoreboard: int,
+        show_scoreboard_after: bool,
+        start_time: int,
+        submissions_gap: int,
+        title: str,
+        urgent: bool,
+        only_ac: Optional[bool] = None,
+        weight: Optional[float] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.acl_id = acl_id
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.contest_id = contest_id
+        self.description = description
+        self.feedback = feedback
+        self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        self.languages = languages
+        self.last_updated = last_updated
+        if only_ac is not None:
+            self.only_ac = only_ac
+        else:
+            self.only_ac = None
+        self.penalty = penalty
+        self.penalty_calc_policy = penalty_calc_policy
+        self.points_decay_factor = points_decay_factor
+        self.problemset_id = problemset_id
+        self.recommended = recommended
+        self.rerun_id = rerun_id
+        self.score_mode = score_mode
+        self.scoreboard = scoreboard
+        self.show_scoreboard_after = show_scoreboard_after
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        self.submissions_gap = submissions_gap
+        self.title = title
+        self.urgent = urgent
+        if weight is not None:
+            self.weight = weight
+        else:
+            self.weight = None
+        if window_length is not None:
+            self.window_length = window_length
+        else:
+            self.window_length = None
+
+
+@dataclasses.dataclass
+class _ScoreboardDetails:
+    """_ScoreboardDetails"""
+    alias: str
+    create_time: int
+    description: str
+    group_id: int
+    group_scoreboard_id: int
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        create_time: int,
+        description: str,
+        group_id: int,
+        group_scoreboard_id: int,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.create_time = create_time
+        self.description = description
+        self.group_id = group_id
+        self.group_scoreboard_id = group_scoreboard_id
+        self.name = name
+
+
+@dataclasses.dataclass
+class _ScoreboardRanking:
+    """_ScoreboardRanking"""
+    contests: Dict[str, '_ScoreboardRanking_contests_value']
+    name: Optional[str]
+    total: '_ScoreboardRanking_total'
+    username: str
+
+    def __init__(
+        self,
+        *,
+        contests: Dict[str, Dict[str, Any]],
+        total: Dict[str, Any],
+        username: str,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = {
+            k: _ScoreboardRanking_contests_value(**v)
+            for k, v in contests.items()
+        }
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.total = _ScoreboardRanking_total(**total)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ScoreboardRanking_contests_value:
+    """_ScoreboardRanking_contests_value"""
+    penalty: float
+    points: float
+
+    def __init__(
+        self,
+        *,
+        penalty: float,
+        points: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.penalty = penalty
+        self.points = points
+
+
+@dataclasses.dataclass
+class _ScoreboardRanking_total:
+    """_ScoreboardRanking_total"""
+    penalty: float
+    points: float
+
+    def __init__(
+        self,
+        *,
+        penalty: float,
+        points: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.penalty = penalty
+        self.points = points
+
+
+GroupScoreboardDetailsResponse = _GroupScoreboardDetails
+"""The return type of the GroupScoreboardDetails API."""
+
+GroupScoreboardListResponse = _OmegaUp_Controllers_GroupScoreboard__apiList
+"""The return type of the GroupScoreboardList API."""
+
+
+class GroupScoreboard:
+    r"""GroupScoreboardController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def addContest(
+            self,
+            *,
+            contest_alias: str,
+            group_alias: str,
+            scoreboard_alias: str,
+            weight: float,
+            only_ac: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Add contest to a group scoreboard
+
+        Args:
+            contest_alias:
+            group_alias:
+            scoreboard_alias:
+            weight:
+            only_ac:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'group_alias': group_alias,
+            'scoreboard_alias': scoreboard_alias,
+            'weight': str(weight),
+        }
+        if only_ac is not None:
+            parameters['only_ac'] = str(only_ac)
+        self._client.query('/api/groupScoreboard/addContest/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeContest(
+            self,
+            *,
+            contest_alias: str,
+            group_alias: str,
+            scoreboard_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Add contest to a group scoreboard
+
+        Args:
+            contest_alias:
+            group_alias:
+            scoreboard_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'group_alias': group_alias,
+            'scoreboard_alias': scoreboard_alias,
+        }
+        self._client.query('/api/groupScoreboard/removeContest/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def details(
+        self,
+        *,
+        group_alias: str,
+        scoreboard_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> GroupScoreboardDetailsResponse:
+        r"""Details of a scoreboard. Returns a list with all contests that belong to
+        the given scoreboard_alias
+
+        Args:
+            group_alias:
+            scoreboard_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group_alias': group_alias,
+            'scoreboard_alias': scoreboard_alias,
+        }
+        return _decoder.decode(
+            _GroupScoreboardDetails,
+            self._client.query('/api/groupScoreboard/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def list(
+        self,
+        *,
+        group_alias: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> GroupScoreboardListResponse:
+        r"""Details of a scoreboard
+
+        Args:
+            group_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if group_alias is not None:
+            parameters['group_alias'] = group_alias
+        return _decoder.decode(
+            _OmegaUp_Controllers_GroupScoreboard__apiList,
+            self._client.query('/api/groupScoreboard/list/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
@@ -0,0 +1,332 @@
+"""The omegaUp Identity API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Identity__apiCreate:
+    """_OmegaUp_Controllers_Identity__apiCreate"""
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.username = username
+
+
+IdentityCreateResponse = _OmegaUp_Controllers_Identity__apiCreate
+"""The return type of the IdentityCreate API."""
+
+
+class Identity:
+    r"""IdentityController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def create(
+        self,
+        *,
+        gender: str,
+        name: str,
+        password: str,
+        school_name: str,
+        username: str,
+        country_id: Optional[str] = None,
+        group_alias: Optional[str] = None,
+        identities: Optional[Any] = None,
+        state_id: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> IdentityCreateResponse:
+        r"""Entry point for Create an Identity API
+
+        Args:
+            gender:
+            name:
+            password:
+            school_name:
+            username:
+            country_id:
+            group_alias:
+            identities:
+            state_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'gender': gender,
+            'name': name,
+            'password': password,
+            'school_name': school_name,
+            'username': username,
+        }
+        if country_id is not None:
+            parameters['country_id'] = country_id
+        if group_alias is not None:
+            parameters['group_alias'] = group_alias
+        if identities is not None:
+            parameters['identities'] = str(identities)
+        if state_id is not None:
+            parameters['state_id'] = state_id
+        return _decoder.decode(
+            _OmegaUp_Controllers_Identity__apiCreate,
+            self._client.query('/api/identity/create/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def bulkCreate(
+            self,
+            *,
+            identities: str,
+            group_alias: Optional[str] = None,
+            name: Optional[Any] = None,
+            username: Optional[Any] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Entry point for Create bulk Identities API
+
+        Args:
+            identities:
+            group_alias:
+            name:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'identities': identities,
+        }
+        if group_alias is not None:
+            parameters['group_alias'] = group_alias
+        if name is not None:
+            parameters['name'] = str(name)
+        if username is not None:
+            parameters['username'] = str(username)
+        self._client.query('/api/identity/bulkCreate/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def bulkCreateForTeams(
+            self,
+            *,
+            team_group_alias: str,
+            team_identities: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Entry point for Create bulk Identities for teams API
+
+        Args:
+            team_group_alias:
+            team_identities:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'team_group_alias': team_group_alias,
+            'team_identities': team_identities,
+        }
+        self._client.query('/api/identity/bulkCreateForTeams/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def updateIdentityTeam(
+            self,
+            *,
+            gender: str,
+            group_alias: str,
+            name: str,
+            original_username: str,
+            school_name: str,
+            username: str,
+            country_id: Optional[str] = None,
+            identities: Optional[Any] = None,
+            state_id: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Entry point for Update an Identity team API
+
+        Args:
+            gender:
+            group_alias:
+            name:
+            original_username:
+            school_name:
+            username:
+            country_id:
+            identities:
+            state_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'gender': gender,
+            'group_alias': group_alias,
+            'name': name,
+            'original_username': original_username,
+            'school_name': school_name,
+            'username': username,
+        }
+        if country_id is not None:
+            parameters['country_id'] = country_id
+        if identities is not None:
+            parameters['identities'] = str(identities)
+        if state_id is not None:
+            parameters['state_id'] = state_id
+        self._client.query('/api/identity/updateIdentityTeam/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def update(
+            self,
+            *,
+            gender: str,
+            group_alias: str,
+            name: str,
+            original_username: str,
+            school_name: str,
+            username: str,
+            country_id: Optional[str] = None,
+            identities: Optional[Any] = None,
+            state_id: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Entry point for Update an Identity API
+
+        Args:
+            gender:
+            group_alias:
+            name:
+            original_username:
+            school_name:
+            username:
+            country_id:
+            identities:
+            state_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'gender': gender,
+            'group_alias': group_alias,
+            'name': name,
+            'original_username': original_username,
+            'school_name': school_name,
+            'username': username,
+        }
+        if country_id is not None:
+            parameters['country_id'] = country_id
+        if identities is not None:
+            parameters['identities'] = str(identities)
+        if state_id is not None:
+            parameters['state_id'] = state_id
+        self._client.query('/api/identity/update/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def changePassword(
+            self,
+            *,
+            group_alias: str,
+            password: str,
+            username: str,
+            identities: Optional[Any] = None,
+            name: Optional[Any] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Entry point for change passowrd of an identity
+
+        Args:
+            group_alias:
+            password:
+            username:
+            identities:
+            name:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group_alias': group_alias,
+            'password': password,
+            'username': username,
+        }
+        if identities is not None:
+            parameters['identities'] = str(identities)
+        if name is not None:
+            parameters['name'] = str(name)
+        self._client.query('/api/identity/changePassword/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def selectIdentity(
+            self,
+            *,
+            usernameOrEmail: str,
+            auth_token: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Entry point for switching between associated identities for a user
+
+        Args:
+            usernameOrEmail:
+            auth_token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'usernameOrEmail': usernameOrEmail,
+        }
+        if auth_token is not None:
+            parameters['auth_token'] = auth_token
+        self._client.query('/api/identity/selectIdentity/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
@@ -0,0 +1,176 @@
+"""The omegaUp Notification API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _Notification:
+    """_Notification"""
+    contents: '_NotificationContents'
+    notification_id: int
+    timestamp: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        contents: Dict[str, Any],
+        notification_id: int,
+        timestamp: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contents = _NotificationContents(**contents)
+        self.notification_id = notification_id
+        self.timestamp = datetime.datetime.fromtimestamp(timestamp)
+
+
+@dataclasses.dataclass
+class _NotificationContents:
+    """_NotificationContents"""
+    badge: Optional[str]
+    body: Optional['_NotificationContents_body']
+    message: Optional[str]
+    status: Optional[str]
+    type: str
+    url: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        type: str,
+        badge: Optional[str] = None,
+        body: Optional[Dict[str, Any]] = None,
+        message: Optional[str] = None,
+        status: Optional[str] = None,
+        url: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if badge is not None:
+            self.badge = badge
+        else:
+            self.badge = None
+        if body is not None:
+            self.body = _NotificationContents_body(**body)
+        else:
+            self.body = None
+        if message is not None:
+            self.message = message
+        else:
+            self.message = None
+        if status is not None:
+            self.status = status
+        else:
+            self.status = None
+        self.type = type
+        if url is not None:
+            self.url = url
+        else:
+            self.url = None
+
+
+@dataclasses.dataclass
+class _NotificationContents_body:
+    """_NotificationContents_body"""
+    iconUrl: str
+    localizationParams: Sequence[str]
+    localizationString: str
+    url: str
+
+    def __init__(
+        self,
+        *,
+        iconUrl: str,
+        localizationParams: Sequence[str],
+        localizationString: str,
+        url: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.iconUrl = iconUrl
+        self.localizationParams = [v for v in localizationParams]
+        self.localizationString = localizationString
+        self.url = url
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Notification__apiMyList:
+    """_OmegaUp_Controllers_Notification__apiMyList"""
+    notifications: Sequence['_Notification']
+
+    def __init__(
+        self,
+        *,
+        notifications: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.notifications = [_Notification(**v) for v in notifications]
+
+
+NotificationMyListResponse = _OmegaUp_Controllers_Notification__apiMyList
+"""The return type of the NotificationMyList API."""
+
+
+class Notification:
+    r"""BadgesController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def myList(
+        self,
+        *,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> NotificationMyListResponse:
+        r"""Returns a list of unread notifications for user
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_Notification__apiMyList,
+            self._client.query('/api/notification/myList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def readNotifications(
+            self,
+            *,
+            notifications: Optional[Any] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Updates notifications as read in database
+
+        Args:
+            notifications:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if notifications is not None:
+            parameters['notifications'] = str(notifications)
+        self._client.query('/api/notification/readNotifications/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
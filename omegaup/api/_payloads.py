@@ -0,0 +1,5625 @@
+"""Types of the omegaUp page payloads that are not returned by any API."""
+
+import dataclasses
+import datetime
+
+from typing import Any, Dict, Optional, Sequence, Union
+
+from omegaup.api._badge import _Badge
+from omegaup.api._certificate import _CertificateListItem
+from omegaup.api._contest import (
+    _Contest,
+    _ContestAdminDetails,
+    _ContestDetails,
+    _ContestListItem,
+    _ContestPublicDetails,
+    _ContestReport,
+    _ContestUser,
+    _ProblemsetProblemWithVersions,
+)
+from omegaup.api._course import (
+    _CourseDetails,
+    _CourseProblem,
+    _CourseStudent,
+    _IdentityRequest,
+    _PrivacyStatement,
+    _Progress,
+    _StudentProgressInCourse,
+)
+from omegaup.api._group import _GroupScoreboard
+from omegaup.api._group_scoreboard import (
+    _GroupScoreboardDetails,
+    _ScoreboardContest,
+)
+from omegaup.api._problem import (
+    _BestSolvers,
+    _LimitsSettings,
+    _NominationStatus,
+    _ProblemAdmin,
+    _ProblemDetails,
+    _ProblemGroupAdmin,
+    _ProblemListItem,
+    _ProblemSettingsDistrib,
+    _ProblemsetterInfo,
+    _SettingLimits,
+)
+from omegaup.api._submission import _Submission
+from omegaup.api._tag import _TagWithProblemCount
+from omegaup.api._teams_group import _TeamMember
+from omegaup.api._types import (
+    _ActivityEvent,
+    _ApiToken,
+    _AssociatedIdentity,
+    _Clarification,
+    _CourseAssignment,
+    _Identity,
+    _PageItem,
+    _ProblemStatement,
+    _ProblemVersion,
+    _ProblemsetProblem,
+    _Run,
+    _Scoreboard,
+    _ScoreboardEvent,
+)
+from omegaup.api._user import (
+    _CoderOfTheMonthList_entry,
+    _Problem,
+    _UserProfile,
+    _UserProfileContests_value,
+    _UserProfileInfo,
+    _UserProfileStats,
+)
+
+
+@dataclasses.dataclass
+class _OmegaUp_DAO_VO_Contests:
+    """Type definition for the \\OmegaUp\\DAO\\VO\\Contests Data Object."""
+    acl_id: Optional[int]
+    admission_mode: Optional[str]
+    alias: Optional[str]
+    archived: Optional[bool]
+    certificate_cutoff: Optional[int]
+    certificates_status: Optional[str]
+    check_plagiarism: Optional[bool]
+    contest_for_teams: Optional[bool]
+    contest_id: Optional[int]
+    default_show_all_contestants_in_scoreboard: Optional[bool]
+    description: Optional[str]
+    feedback: Optional[str]
+    finish_time: Optional[datetime.datetime]
+    languages: Optional[str]
+    last_updated: Optional[datetime.datetime]
+    partial_score: Optional[bool]
+    penalty: Optional[int]
+    penalty_calc_policy: Optional[str]
+    penalty_type: Optional[str]
+    plagiarism_threshold: Optional[bool]
+    points_decay_factor: Optional[float]
+    problemset_id: Optional[int]
+    recommended: Optional[bool]
+    rerun_id: Optional[int]
+    score_mode: Optional[str]
+    scoreboard: Optional[int]
+    show_scoreboard_after: Optional[bool]
+    start_time: Optional[datetime.datetime]
+    submissions_gap: Optional[int]
+    title: Optional[str]
+    urgent: Optional[bool]
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        acl_id: Optional[int] = None,
+        admission_mode: Optional[str] = None,
+        alias: Optional[str] = None,
+        archived: Optional[bool] = None,
+        certificate_cutoff: Optional[int] = None,
+        certificates_status: Optional[str] = None,
+        check_plagiarism: Optional[bool] = None,
+        contest_for_teams: Optional[bool] = None,
+        contest_id: Optional[int] = None,
+        default_show_all_contestants_in_scoreboard: Optional[bool] = None,
+        description: Optional[str] = None,
+        feedback: Optional[str] = None,
+        finish_time: Optional[int] = None,
+        languages: Optional[str] = None,
+        last_updated: Optional[int] = None,
+        partial_score: Optional[bool] = None,
+        penalty: Optional[int] = None,
+        penalty_calc_policy: Optional[str] = None,
+        penalty_type: Optional[str] = None,
+        plagiarism_threshold: Optional[bool] = None,
+        points_decay_factor: Optional[float] = None,
+        problemset_id: Optional[int] = None,
+        recommended: Optional[bool] = None,
+        rerun_id: Optional[int] = None,
+        score_mode: Optional[str] = None,
+        scoreboard: Optional[int] = None,
+        show_scoreboard_after: Optional[bool] = None,
+        start_time: Optional[int] = None,
+        submissions_gap: Optional[int] = None,
+        title: Optional[str] = None,
+        urgent: Optional[bool] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        """Create a new \\OmegaUp\\DAO\\VO\\Contests Data Object."""
+        self.acl_id = acl_id
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.archived = archived
+        self.certificate_cutoff = certificate_cutoff
+        self.certificates_status = certificates_status
+        self.check_plagiarism = check_plagiarism
+        self.contest_for_teams = contest_for_teams
+        self.contest_id = contest_id
+        self.default_show_all_contestants_in_scoreboard = default_show_all_contestants_in_scoreboard
+        self.description = description
+        self.feedback = feedback
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        self.languages = languages
+        if last_updated is not None:
+            self.last_updated = datetime.datetime.fromtimestamp(last_updated)
+        else:
+            self.last_updated = None
+        self.partial_score = partial_score
+        self.penalty = penalty
+        self.penalty_calc_policy = penalty_calc_policy
+        self.penalty_type = penalty_type
+        self.plagiarism_threshold = plagiarism_threshold
+        self.points_decay_factor = points_decay_factor
+        self.problemset_id = problemset_id
+        self.recommended = recommended
+        self.rerun_id = rerun_id
+        self.score_mode = score_mode
+        self.scoreboard = scoreboard
+        self.show_scoreboard_after = show_scoreboard_after
+        if start_time is not None:
+            self.start_time = datetime.datetime.fromtimestamp(start_time)
+        else:
+            self.start_time = None
+        self.submissions_gap = submissions_gap
+        self.title = title
+        self.urgent = urgent
+        self.window_length = window_length
+
+
+@dataclasses.dataclass
+class _OmegaUp_DAO_VO_Countries:
+    """Type definition for the \\OmegaUp\\DAO\\VO\\Countries Data Object."""
+    country_id: Optional[str]
+    name: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        country_id: Optional[str] = None,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        """Create a new \\OmegaUp\\DAO\\VO\\Countries Data Object."""
+        self.country_id = country_id
+        self.name = name
+
+
+@dataclasses.dataclass
+class _ActivityFeedPayload:
+    """_ActivityFeedPayload"""
+    alias: str
+    events: Sequence['_ActivityEvent']
+    length: int
+    page: int
+    pagerItems: Sequence['_PageItem']
+    type: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        events: Sequence[Dict[str, Any]],
+        length: int,
+        page: int,
+        pagerItems: Sequence[Dict[str, Any]],
+        type: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.events = [_ActivityEvent(**v) for v in events]
+        self.length = length
+        self.page = page
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.type = type
+
+
+@dataclasses.dataclass
+class _AddedProblem:
+    """_AddedProblem"""
+    alias: str
+    commit: Optional[str]
+    is_extra_problem: Optional[bool]
+    points: float
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        points: float,
+        commit: Optional[str] = None,
+        is_extra_problem: Optional[bool] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        if commit is not None:
+            self.commit = commit
+        else:
+            self.commit = None
+        if is_extra_problem is not None:
+            self.is_extra_problem = is_extra_problem
+        else:
+            self.is_extra_problem = None
+        self.points = points
+
+
+@dataclasses.dataclass
+class _AdminCourses:
+    """_AdminCourses"""
+    admin: '_AdminCourses_admin'
+
+    def __init__(
+        self,
+        *,
+        admin: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = _AdminCourses_admin(**admin)
+
+
+@dataclasses.dataclass
+class _AdminCourses_admin:
+    """_AdminCourses_admin"""
+    accessMode: str
+    activeTab: str
+    filteredCourses: '_AdminCourses_admin_filteredCourses'
+
+    def __init__(
+        self,
+        *,
+        accessMode: str,
+        activeTab: str,
+        filteredCourses: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accessMode = accessMode
+        self.activeTab = activeTab
+        self.filteredCourses = _AdminCourses_admin_filteredCourses(
+            **filteredCourses)
+
+
+@dataclasses.dataclass
+class _AdminCourses_admin_filteredCourses:
+    """_AdminCourses_admin_filteredCourses"""
+    archived: '_CoursesByTimeType'
+    current: '_CoursesByTimeType'
+    past: '_CoursesByTimeType'
+    teachingAssistant: '_CoursesByTimeType'
+
+    def __init__(
+        self,
+        *,
+        archived: Dict[str, Any],
+        current: Dict[str, Any],
+        past: Dict[str, Any],
+        teachingAssistant: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.archived = _CoursesByTimeType(**archived)
+        self.current = _CoursesByTimeType(**current)
+        self.past = _CoursesByTimeType(**past)
+        self.teachingAssistant = _CoursesByTimeType(**teachingAssistant)
+
+
+@dataclasses.dataclass
+class _ArenaAssignment:
+    """_ArenaAssignment"""
+    alias: Optional[str]
+    assignment_type: str
+    description: Optional[str]
+    director: str
+    finish_time: Optional[datetime.datetime]
+    name: Optional[str]
+    problems: Sequence['_NavbarProblemsetProblem']
+    problemset_id: int
+    runs: Sequence['_Run']
+    start_time: datetime.datetime
+    totalRuns: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        assignment_type: str,
+        director: str,
+        problems: Sequence[Dict[str, Any]],
+        problemset_id: int,
+        runs: Sequence[Dict[str, Any]],
+        start_time: int,
+        alias: Optional[str] = None,
+        description: Optional[str] = None,
+        finish_time: Optional[int] = None,
+        name: Optional[str] = None,
+        totalRuns: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if alias is not None:
+            self.alias = alias
+        else:
+            self.alias = None
+        self.assignment_type = assignment_type
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        self.director = director
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.problems = [_NavbarProblemsetProblem(**v) for v in problems]
+        self.problemset_id = problemset_id
+        self.runs = [_Run(**v) for v in runs]
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        if totalRuns is not None:
+            self.totalRuns = totalRuns
+        else:
+            self.totalRuns = None
+
+
+@dataclasses.dataclass
+class _ArenaContest:
+    """_ArenaContest"""
+    alias: str
+    director: str
+    finish_time: Optional[datetime.datetime]
+    rerun_id: Optional[int]
+    start_time: Optional[datetime.datetime]
+    title: str
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        director: str,
+        title: str,
+        finish_time: Optional[int] = None,
+        rerun_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.director = director
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        if rerun_id is not None:
+            self.rerun_id = rerun_id
+        else:
+            self.rerun_id = None
+        if start_time is not None:
+            self.start_time = datetime.datetime.fromtimestamp(start_time)
+        else:
+            self.start_time = None
+        self.title = title
+        if window_length is not None:
+            self.window_length = window_length
+        else:
+            self.window_length = None
+
+
+@dataclasses.dataclass
+class _ArenaCourseAssignment:
+    """_ArenaCourseAssignment"""
+    alias: str
+    description: str
+    name: str
+    problemset_id: int
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        description: str,
+        name: str,
+        problemset_id: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.description = description
+        self.name = name
+        self.problemset_id = problemset_id
+
+
+@dataclasses.dataclass
+class _ArenaCourseDetails:
+    """_ArenaCourseDetails"""
+    alias: str
+    assignments: Sequence['_CourseAssignment']
+    languages: Optional[Sequence[str]]
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        assignments: Sequence[Dict[str, Any]],
+        name: str,
+        languages: Optional[Sequence[str]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.assignments = [_CourseAssignment(**v) for v in assignments]
+        if languages is not None:
+            self.languages = [v for v in languages]
+        else:
+            self.languages = None
+        self.name = name
+
+
+@dataclasses.dataclass
+class _ArenaCoursePayload:
+    """_ArenaCoursePayload"""
+    assignment: '_ArenaCourseAssignment'
+    clarifications: Sequence['_Clarification']
+    course: '_ArenaCourseDetails'
+    currentProblem: Optional['_ProblemDetails']
+    problems: Sequence['_ArenaCourseProblem']
+    runs: Sequence['_Run']
+    scoreboard: Optional['_Scoreboard']
+
+    def __init__(
+        self,
+        *,
+        assignment: Dict[str, Any],
+        clarifications: Sequence[Dict[str, Any]],
+        course: Dict[str, Any],
+        problems: Sequence[Dict[str, Any]],
+        runs: Sequence[Dict[str, Any]],
+        currentProblem: Optional[Dict[str, Any]] = None,
+        scoreboard: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignment = _ArenaCourseAssignment(**assignment)
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+        self.course = _ArenaCourseDetails(**course)
+        if currentProblem is not None:
+            self.currentProblem = _ProblemDetails(**currentProblem)
+        else:
+            self.currentProblem = None
+        self.problems = [_ArenaCourseProblem(**v) for v in problems]
+        self.runs = [_Run(**v) for v in runs]
+        if scoreboard is not None:
+            self.scoreboard = _Scoreboard(**scoreboard)
+        else:
+            self.scoreboard = None
+
+
+@dataclasses.dataclass
+class _ArenaCourseProblem:
+    """_ArenaCourseProblem"""
+    alias: str
+    letter: str
+    title: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        letter: str,
+        title: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.letter = letter
+        self.title = title
+
+
+@dataclasses.dataclass
+class _ArenaProblemDetails:
+    """_ArenaProblemDetails"""
+    accepts_submissions: bool
+    alias: str
+    commit: str
+    input_limit: int
+    languages: Sequence[str]
+    letter: Optional[str]
+    points: float
+    problem_id: Optional[int]
+    problemsetter: Optional['_ProblemsetterInfo']
+    quality_seal: bool
+    runs: Optional[Sequence['_Run']]
+    settings: Optional['_ProblemSettingsDistrib']
+    source: Optional[str]
+    statement: Optional['_ProblemStatement']
+    title: str
+    visibility: int
+
+    def __init__(
+        self,
+        *,
+        accepts_submissions: bool,
+        alias: str,
+        commit: str,
+        input_limit: int,
+        languages: Sequence[str],
+        points: float,
+        quality_seal: bool,
+        title: str,
+        visibility: int,
+        letter: Optional[str] = None,
+        problem_id: Optional[int] = None,
+        problemsetter: Optional[Dict[str, Any]] = None,
+        runs: Optional[Sequence[Dict[str, Any]]] = None,
+        settings: Optional[Dict[str, Any]] = None,
+        source: Optional[str] = None,
+        statement: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accepts_submissions = accepts_submissions
+        self.alias = alias
+        self.commit = commit
+        self.input_limit = input_limit
+        self.languages = [v for v in languages]
+        if letter is not None:
+            self.letter = letter
+        else:
+            self.letter = None
+        self.points = points
+        if problem_id is not None:
+            self.problem_id = problem_id
+        else:
+            self.problem_id = None
+        if problemsetter is not None:
+            self.problemsetter = _ProblemsetterInfo(**problemsetter)
+        else:
+            self.problemsetter = None
+        self.quality_seal = quality_seal
+        if runs is not None:
+            self.runs = [_Run(**v) for v in runs]
+        else:
+            self.runs = None
+        if settings is not None:
+            self.settings = _ProblemSettingsDistrib(**settings)
+        else:
+            self.settings = None
+        if source is not None:
+            self.source = source
+        else:
+            self.source = None
+        if statement is not None:
+            self.statement = _ProblemStatement(**statement)
+        else:
+            self.statement = None
+        self.title = title
+        self.visibility = visibility
+
+
+@dataclasses.dataclass
+class _ArenaProblemset:
+    """_ArenaProblemset"""
+    admin: Optional[bool]
+    admission_mode: Optional[str]
+    alias: Optional[str]
+    courseAssignments: Optional[Sequence['_CourseAssignment']]
+    director: Optional[str]
+    feedback: Optional[str]
+    finish_time: Optional[datetime.datetime]
+    name: Optional[str]
+    opened: Optional[bool]
+    original_contest_alias: Optional[str]
+    original_problemset_id: Optional[int]
+    problems: Optional[Sequence['_ProblemsetProblem']]
+    problemset_id: Optional[int]
+    requests_user_information: Optional[str]
+    show_penalty: Optional[bool]
+    start_time: Optional[datetime.datetime]
+    submission_deadline: Optional[datetime.datetime]
+    submissions_gap: Optional[int]
+    title: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        admin: Optional[bool] = None,
+        admission_mode: Optional[str] = None,
+        alias: Optional[str] = None,
+        courseAssignments: Optional[Sequence[Dict[str, Any]]] = None,
+        director: Optional[str] = None,
+        feedback: Optional[str] = None,
+        finish_time: Optional[int] = None,
+        name: Optional[str] = None,
+        opened: Optional[bool] = None,
+        original_contest_alias: Optional[str] = None,
+        original_problemset_id: Optional[int] = None,
+        problems: Optional[Sequence[Dict[str, Any]]] = None,
+        problemset_id: Optional[int] = None,
+        requests_user_information: Optional[str] = None,
+        show_penalty: Optional[bool] = None,
+        start_time: Optional[int] = None,
+        submission_deadline: Optional[int] = None,
+        submissions_gap: Optional[int] = None,
+        title: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if admin is not None:
+            self.admin = admin
+        else:
+            self.admin = None
+        if admission_mode is not None:
+            self.admission_mode = admission_mode
+        else:
+            self.admission_mode = None
+        if alias is not None:
+            self.alias = alias
+        else:
+            self.alias = None
+        if courseAssignments is not None:
+            self.courseAssignments = [
+                _CourseAssignment(**v) for v in courseAssignments
+            ]
+        else:
+            self.courseAssignments = None
+        if director is not None:
+            self.director = director
+        else:
+            self.director = None
+        if feedback is not None:
+            self.feedback = feedback
+        else:
+            self.feedback = None
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if opened is not None:
+            self.opened = opened
+        else:
+            self.opened = None
+        if original_contest_alias is not None:
+            self.original_contest_alias = original_contest_alias
+        else:
+            self.original_contest_alias = None
+        if original_problemset_id is not None:
+            self.original_problemset_id = original_problemset_id
+        else:
+            self.original_problemset_id = None
+        if problems is not None:
+            self.problems = [_ProblemsetProblem(**v) for v in problems]
+        else:
+            self.problems = None
+        if problemset_id is not None:
+            self.problemset_id = problemset_id
+        else:
+            self.problemset_id = None
+        if requests_user_information is not None:
+            self.requests_user_information = requests_user_information
+        else:
+            self.requests_user_information = None
+        if show_penalty is not None:
+            self.show_penalty = show_penalty
+        else:
+            self.show_penalty = None
+        if start_time is not None:
+            self.start_time = datetime.datetime.fromtimestamp(start_time)
+        else:
+            self.start_time = None
+        if submission_deadline is not None:
+            self.submission_deadline = datetime.datetime.fromtimestamp(
+                submission_deadline)
+        else:
+            self.submission_deadline = None
+        if submissions_gap is not None:
+            self.submissions_gap = submissions_gap
+        else:
+            self.submissions_gap = None
+        if title is not None:
+            self.title = title
+        else:
+            self.title = None
+
+
+@dataclasses.dataclass
+class _AssignmentDetails:
+    """_AssignmentDetails"""
+    admin: bool
+    alias: str
+    assignmentType: str
+    courseAssignments: Sequence['_CourseAssignment']
+    description: str
+    director: str
+    finishTime: Optional[datetime.datetime]
+    name: str
+    problems: Sequence['_ProblemsetProblem']
+    problemsetId: int
+    startTime: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        admin: bool,
+        alias: str,
+        assignmentType: str,
+        courseAssignments: Sequence[Dict[str, Any]],
+        description: str,
+        director: str,
+        name: str,
+        problems: Sequence[Dict[str, Any]],
+        problemsetId: int,
+        startTime: int,
+        finishTime: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = admin
+        self.alias = alias
+        self.assignmentType = assignmentType
+        self.courseAssignments = [
+            _CourseAssignment(**v) for v in courseAssignments
+        ]
+        self.description = description
+        self.director = director
+        if finishTime is not None:
+            self.finishTime = datetime.datetime.fromtimestamp(finishTime)
+        else:
+            self.finishTime = None
+        self.name = name
+        self.problems = [_ProblemsetProblem(**v) for v in problems]
+        self.problemsetId = problemsetId
+        self.startTime = datetime.datetime.fromtimestamp(startTime)
+
+
+@dataclasses.dataclass
+class _AssignmentDetailsPayload:
+    """_AssignmentDetailsPayload"""
+    courseDetails: '_CourseDetails'
+    currentAssignment: '_ArenaAssignment'
+    isTeachingAssistant: bool
+    scoreboard: Optional['_Scoreboard']
+    shouldShowFirstAssociatedIdentityRunWarning: bool
+    showRanking: bool
+
+    def __init__(
+        self,
+        *,
+        courseDetails: Dict[str, Any],
+        currentAssignment: Dict[str, Any],
+        isTeachingAssistant: bool,
+        shouldShowFirstAssociatedIdentityRunWarning: bool,
+        showRanking: bool,
+        scoreboard: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.courseDetails = _CourseDetails(**courseDetails)
+        self.currentAssignment = _ArenaAssignment(**currentAssignment)
+        self.isTeachingAssistant = isTeachingAssistant
+        if scoreboard is not None:
+            self.scoreboard = _Scoreboard(**scoreboard)
+        else:
+            self.scoreboard = None
+        self.shouldShowFirstAssociatedIdentityRunWarning = shouldShowFirstAssociatedIdentityRunWarning
+        self.showRanking = showRanking
+
+
+@dataclasses.dataclass
+class _AssignmentsProblemsPoints:
+    """_AssignmentsProblemsPoints"""
+    alias: str
+    extraPoints: float
+    name: str
+    order: int
+    points: float
+    problems: Sequence['_AssignmentsProblemsPoints_problems_entry']
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        extraPoints: float,
+        name: str,
+        order: int,
+        points: float,
+        problems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.extraPoints = extraPoints
+        self.name = name
+        self.order = order
+        self.points = points
+        self.problems = [
+            _AssignmentsProblemsPoints_problems_entry(**v) for v in problems
+        ]
+
+
+@dataclasses.dataclass
+class _AssignmentsProblemsPoints_problems_entry:
+    """_AssignmentsProblemsPoints_problems_entry"""
+    alias: str
+    isExtraProblem: bool
+    order: int
+    points: float
+    title: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        isExtraProblem: bool,
+        order: int,
+        points: float,
+        title: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.isExtraProblem = isExtraProblem
+        self.order = order
+        self.points = points
+        self.title = title
+
+
+@dataclasses.dataclass
+class _AuthIdentityExt:
+    """_AuthIdentityExt"""
+    currentIdentity: '_IdentityExt'
+    loginIdentity: '_IdentityExt'
+
+    def __init__(
+        self,
+        *,
+        currentIdentity: Dict[str, Any],
+        loginIdentity: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.currentIdentity = _IdentityExt(**currentIdentity)
+        self.loginIdentity = _IdentityExt(**loginIdentity)
+
+
+@dataclasses.dataclass
+class _AuthorRankTablePayload:
+    """_AuthorRankTablePayload"""
+    length: int
+    page: int
+    pagerItems: Sequence['_PageItem']
+    ranking: '_AuthorsRank'
+
+    def __init__(
+        self,
+        *,
+        length: int,
+        page: int,
+        pagerItems: Sequence[Dict[str, Any]],
+        ranking: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.length = length
+        self.page = page
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.ranking = _AuthorsRank(**ranking)
+
+
+@dataclasses.dataclass
+class _AuthorsRank:
+    """_AuthorsRank"""
+    ranking: Sequence['_AuthorsRank_ranking_entry']
+    total: int
+
+    def __init__(
+        self,
+        *,
+        ranking: Sequence[Dict[str, Any]],
+        total: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.ranking = [_AuthorsRank_ranking_entry(**v) for v in ranking]
+        self.total = total
+
+
+@dataclasses.dataclass
+class _AuthorsRank_ranking_entry:
+    """_AuthorsRank_ranking_entry"""
+    author_ranking: Optional[int]
+    author_score: float
+    classname: str
+    country_id: Optional[str]
+    name: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        author_score: float,
+        classname: str,
+        username: str,
+        author_ranking: Optional[int] = None,
+        country_id: Optional[str] = None,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if author_ranking is not None:
+            self.author_ranking = author_ranking
+        else:
+            self.author_ranking = None
+        self.author_score = author_score
+        self.classname = classname
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _BadgeDetailsPayload:
+    """_BadgeDetailsPayload"""
+    badge: '_Badge'
+
+    def __init__(
+        self,
+        *,
+        badge: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.badge = _Badge(**badge)
+
+
+@dataclasses.dataclass
+class _BadgeListPayload:
+    """_BadgeListPayload"""
+    badges: Sequence[str]
+    ownedBadges: Sequence['_Badge']
+
+    def __init__(
+        self,
+        *,
+        badges: Sequence[str],
+        ownedBadges: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.badges = [v for v in badges]
+        self.ownedBadges = [_Badge(**v) for v in ownedBadges]
+
+
+@dataclasses.dataclass
+class _CachedExtraProfileDetails:
+    """_CachedExtraProfileDetails"""
+    badges: Sequence[str]
+    contests: Dict[str, '_UserProfileContests_value']
+    createdContests: Sequence['_Contest']
+    createdCourses: Sequence['_Course']
+    createdProblems: Sequence['_Problem']
+    solvedProblems: Sequence['_Problem']
+    stats: Sequence['_UserProfileStats']
+    unsolvedProblems: Sequence['_Problem']
+
+    def __init__(
+        self,
+        *,
+        badges: Sequence[str],
+        contests: Dict[str, Dict[str, Any]],
+        createdContests: Sequence[Dict[str, Any]],
+        createdCourses: Sequence[Dict[str, Any]],
+        createdProblems: Sequence[Dict[str, Any]],
+        solvedProblems: Sequence[Dict[str, Any]],
+        stats: Sequence[Dict[str, Any]],
+        unsolvedProblems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.badges = [v for v in badges]
+        self.contests = {
+            k: _UserProfileContests_value(**v)
+            for k, v in contests.items()
+        }
+        self.createdContests = [_Contest(**v) for v in createdContests]
+        self.createdCourses = [_Course(**v) for v in createdCourses]
+        self.createdProblems = [_Problem(**v) for v in createdProblems]
+        self.solvedProblems = [_Problem(**v) for v in solvedProblems]
+        self.stats = [_UserProfileStats(**v) for v in stats]
+        self.unsolvedProblems = [_Problem(**v) for v in unsolvedProblems]
+
+
+@dataclasses.dataclass
+class _CertificateDetailsPayload:
+    """_CertificateDetailsPayload"""
+    uuid: str
+
+    def __init__(
+        self,
+        *,
+        uuid: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.uuid = uuid
+
+
+@dataclasses.dataclass
+class _CertificateListMinePayload:
+    """_CertificateListMinePayload"""
+    certificates: Sequence['_CertificateListItem']
+
+    def __init__(
+        self,
+        *,
+        certificates: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.certificates = [_CertificateListItem(**v) for v in certificates]
+
+
+@dataclasses.dataclass
+class _CertificateValidationPayload:
+    """_CertificateValidationPayload"""
+    certificate: Optional[str]
+    valid: bool
+    verification_code: str
+
+    def __init__(
+        self,
+        *,
+        valid: bool,
+        verification_code: str,
+        certificate: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if certificate is not None:
+            self.certificate = certificate
+        else:
+            self.certificate = None
+        self.valid = valid
+        self.verification_code = verification_code
+
+
+@dataclasses.dataclass
+class _CoderOfTheMonth:
+    """_CoderOfTheMonth"""
+    category: str
+    classname: str
+    coder_of_the_month_id: int
+    country_id: str
+    description: Optional[str]
+    problems_solved: int
+    ranking: int
+    school_id: Optional[int]
+    score: float
+    selected_by: Optional[int]
+    time: str
+    user_id: int
+    username: str
+
+    def __init__(
+        self,
+        *,
+        category: str,
+        classname: str,
+        coder_of_the_month_id: int,
+        country_id: str,
+        problems_solved: int,
+        ranking: int,
+        score: float,
+        time: str,
+        user_id: int,
+        username: str,
+        description: Optional[str] = None,
+        school_id: Optional[int] = None,
+        selected_by: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.category = category
+        self.classname = classname
+        self.coder_of_the_month_id = coder_of_the_month_id
+        self.country_id = country_id
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        self.problems_solved = problems_solved
+        self.ranking = ranking
+        if school_id is not None:
+            self.school_id = school_id
+        else:
+            self.school_id = None
+        self.score = score
+        if selected_by is not None:
+            self.selected_by = selected_by
+        else:
+            self.selected_by = None
+        self.time = time
+        self.user_id = user_id
+        self.username = username
+
+
+@dataclasses.dataclass
+class _CoderOfTheMonthPayload:
+    """_CoderOfTheMonthPayload"""
+    candidatesToCoderOfTheMonth: Sequence['_CoderOfTheMonthList_entry']
+    category: str
+    codersOfCurrentMonth: Sequence['_CoderOfTheMonthList_entry']
+    codersOfPreviousMonth: Sequence['_CoderOfTheMonthList_entry']
+    isMentor: bool
+    options: Optional['_CoderOfTheMonthPayload_options']
+
+    def __init__(
+        self,
+        *,
+        candidatesToCoderOfTheMonth: Sequence[Dict[str, Any]],
+        category: str,
+        codersOfCurrentMonth: Sequence[Dict[str, Any]],
+        codersOfPreviousMonth: Sequence[Dict[str, Any]],
+        isMentor: bool,
+        options: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.candidatesToCoderOfTheMonth = [
+            _CoderOfTheMonthList_entry(**v)
+            for v in candidatesToCoderOfTheMonth
+        ]
+        self.category = category
+        self.codersOfCurrentMonth = [
+            _CoderOfTheMonthList_entry(**v) for v in codersOfCurrentMonth
+        ]
+        self.codersOfPreviousMonth = [
+            _CoderOfTheMonthList_entry(**v) for v in codersOfPreviousMonth
+        ]
+        self.isMentor = isMentor
+        if options is not None:
+            self.options = _CoderOfTheMonthPayload_options(**options)
+        else:
+            self.options = None
+
+
+@dataclasses.dataclass
+class _CoderOfTheMonthPayload_options:
+    """_CoderOfTheMonthPayload_options"""
+    canChooseCoder: bool
+    coderIsSelected: bool
+
+    def __init__(
+        self,
+        *,
+        canChooseCoder: bool,
+        coderIsSelected: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.canChooseCoder = canChooseCoder
+        self.coderIsSelected = coderIsSelected
+
+
+@dataclasses.dataclass
+class _CollectionDetailsByAuthorPayload:
+    """_CollectionDetailsByAuthorPayload"""
+    authors: Sequence[str]
+    authorsRanking: '_AuthorsRank'
+    column: str
+    columns: Sequence[str]
+    keyword: str
+    language: str
+    languages: Sequence[str]
+    loggedIn: bool
+    mode: str
+    modes: Sequence[str]
+    pagerItems: Sequence['_PageItem']
+    problems: Sequence['_ProblemListItem']
+    selectedTags: Sequence[str]
+    tagData: Sequence['_CollectionDetailsByAuthorPayload_tagData_entry']
+    tags: Sequence[str]
+
+    def __init__(
+        self,
+        *,
+        authors: Sequence[str],
+        authorsRanking: Dict[str, Any],
+        column: str,
+        columns: Sequence[str],
+        keyword: str,
+        language: str,
+        languages: Sequence[str],
+        loggedIn: bool,
+        mode: str,
+        modes: Sequence[str],
+        pagerItems: Sequence[Dict[str, Any]],
+        problems: Sequence[Dict[str, Any]],
+        selectedTags: Sequence[str],
+        tagData: Sequence[Dict[str, Any]],
+        tags: Sequence[str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.authors = [v for v in authors]
+        self.authorsRanking = _AuthorsRank(**authorsRanking)
+        self.column = column
+        self.columns = [v for v in columns]
+        self.keyword = keyword
+        self.language = language
+        self.languages = [v for v in languages]
+        self.loggedIn = loggedIn
+        self.mode = mode
+        self.modes = [v for v in modes]
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.problems = [_ProblemListItem(**v) for v in problems]
+        self.selectedTags = [v for v in selectedTags]
+        self.tagData = [
+            _CollectionDetailsByAuthorPayload_tagData_entry(**v)
+            for v in tagData
+        ]
+        self.tags = [v for v in tags]
+
+
+@dataclasses.dataclass
+class _CollectionDetailsByAuthorPayload_tagData_entry:
+    """_CollectionDetailsByAuthorPayload_tagData_entry"""
+    name: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+
+
+@dataclasses.dataclass
+class _CollectionDetailsByLevelPayload:
+    """_CollectionDetailsByLevelPayload"""
+    column: str
+    columns: Sequence[str]
+    difficulty: str
+    frequentTags: Sequence['_TagWithProblemCount']
+    keyword: str
+    language: str
+    languages: Sequence[str]
+    level: str
+    loggedIn: bool
+    mode: str
+    modes: Sequence[str]
+    pagerItems: Sequence['_PageItem']
+    problems: Sequence['_ProblemListItem']
+    publicTags: Sequence['_TagWithProblemCount']
+    selectedTags: Sequence[str]
+    tagData: Sequence['_CollectionDetailsByLevelPayload_tagData_entry']
+    tagsList: Sequence[str]
+
+    def __init__(
+        self,
+        *,
+        column: str,
+        columns: Sequence[str],
+        difficulty: str,
+        frequentTags: Sequence[Dict[str, Any]],
+        keyword: str,
+        language: str,
+        languages: Sequence[str],
+        level: str,
+        loggedIn: bool,
+        mode: str,
+        modes: Sequence[str],
+        pagerItems: Sequence[Dict[str, Any]],
+        problems: Sequence[Dict[str, Any]],
+        publicTags: Sequence[Dict[str, Any]],
+        selectedTags: Sequence[str],
+        tagData: Sequence[Dict[str, Any]],
+        tagsList: Sequence[str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.column = column
+        self.columns = [v for v in columns]
+        self.difficulty = difficulty
+        self.frequentTags = [_TagWithProblemCount(**v) for v in frequentTags]
+        self.keyword = keyword
+        self.language = language
+        self.languages = [v for v in languages]
+        self.level = level
+        self.loggedIn = loggedIn
+        self.mode = mode
+        self.modes = [v for v in modes]
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.problems = [_ProblemListItem(**v) for v in problems]
+        self.publicTags = [_TagWithProblemCount(**v) for v in publicTags]
+        self.selectedTags = [v for v in selectedTags]
+        self.tagData = [
+            _CollectionDetailsByLevelPayload_tagData_entry(**v)
+            for v in tagData
+        ]
+        self.tagsList = [v for v in tagsList]
+
+
+@dataclasses.dataclass
+class _CollectionDetailsByLevelPayload_tagData_entry:
+    """_CollectionDetailsByLevelPayload_tagData_entry"""
+    name: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+
+
+@dataclasses.dataclass
+class _CommonPayload:
+    """_CommonPayload"""
+    apiTokens: Sequence['_ApiToken']
+    associatedIdentities: Sequence['_AssociatedIdentity']
+    currentEmail: str
+    currentName: Optional[str]
+    currentUsername: str
+    gravatarURL128: str
+    gravatarURL51: str
+    inContest: bool
+    isAdmin: bool
+    isLoggedIn: bool
+    isMainUserIdentity: bool
+    isReviewer: bool
+    isUnder13User: bool
+    lockDownImage: str
+    navbarSection: str
+    nextRegisteredContestForUser: Optional['_ContestListItem']
+    omegaUpLockDown: bool
+    profileProgress: float
+    userClassname: str
+    userCountry: str
+    userTypes: Sequence[str]
+    userVerificationDeadline: Optional[datetime.datetime]
+
+    def __init__(
+        self,
+        *,
+        apiTokens: Sequence[Dict[str, Any]],
+        associatedIdentities: Sequence[Dict[str, Any]],
+        currentEmail: str,
+        currentUsername: str,
+        gravatarURL128: str,
+        gravatarURL51: str,
+        inContest: bool,
+        isAdmin: bool,
+        isLoggedIn: bool,
+        isMainUserIdentity: bool,
+        isReviewer: bool,
+        isUnder13User: bool,
+        lockDownImage: str,
+        navbarSection: str,
+        omegaUpLockDown: bool,
+        profileProgress: float,
+        userClassname: str,
+        userCountry: str,
+        userTypes: Sequence[str],
+        currentName: Optional[str] = None,
+        nextRegisteredContestForUser: Optional[Dict[str, Any]] = None,
+        userVerificationDeadline: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.apiTokens = [_ApiToken(**v) for v in apiTokens]
+        self.associatedIdentities = [
+            _AssociatedIdentity(**v) for v in associatedIdentities
+        ]
+        self.currentEmail = currentEmail
+        if currentName is not None:
+            self.currentName = currentName
+        else:
+            self.currentName = None
+        self.currentUsername = currentUsername
+        self.gravatarURL128 = gravatarURL128
+        self.gravatarURL51 = gravatarURL51
+        self.inContest = inContest
+        self.isAdmin = isAdmin
+        self.isLoggedIn = isLoggedIn
+        self.isMainUserIdentity = isMainUserIdentity
+        self.isReviewer = isReviewer
+        self.isUnder13User = isUnder13User
+        self.lockDownImage = lockDownImage
+        self.navbarSection = navbarSection
+        if nextRegisteredContestForUser is not None:
+            self.nextRegisteredContestForUser = _ContestListItem(
+                **nextRegisteredContestForUser)
+        else:
+            self.nextRegisteredContestForUser = None
+        self.omegaUpLockDown = omegaUpLockDown
+        self.profileProgress = profileProgress
+        self.userClassname = userClassname
+        self.userCountry = userCountry
+        self.userTypes = [v for v in userTypes]
+        if userVerificationDeadline is not None:
+            self.userVerificationDeadline = datetime.datetime.fromtimestamp(
+                userVerificationDeadline)
+        else:
+            self.userVerificationDeadline = None
+
+
+@dataclasses.dataclass
+class _ConsentStatement:
+    """_ConsentStatement"""
+    contest_alias: str
+    privacy_git_object_id: Optional[str]
+    share_user_information: Optional[bool]
+    statement_type: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        contest_alias: str,
+        privacy_git_object_id: Optional[str] = None,
+        share_user_information: Optional[bool] = None,
+        statement_type: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contest_alias = contest_alias
+        if privacy_git_object_id is not None:
+            self.privacy_git_object_id = privacy_git_object_id
+        else:
+            self.privacy_git_object_id = None
+        if share_user_information is not None:
+            self.share_user_information = share_user_information
+        else:
+            self.share_user_information = None
+        if statement_type is not None:
+            self.statement_type = statement_type
+        else:
+            self.statement_type = None
+
+
+@dataclasses.dataclass
+class _ContestAdmin:
+    """_ContestAdmin"""
+    role: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        role: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.role = role
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ContestCertificatesAdminDetails:
+    """_ContestCertificatesAdminDetails"""
+    certificateCutoff: Optional[int]
+    certificatesStatus: str
+    isCertificateGenerator: bool
+
+    def __init__(
+        self,
+        *,
+        certificatesStatus: str,
+        isCertificateGenerator: bool,
+        certificateCutoff: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if certificateCutoff is not None:
+            self.certificateCutoff = certificateCutoff
+        else:
+            self.certificateCutoff = None
+        self.certificatesStatus = certificatesStatus
+        self.isCertificateGenerator = isCertificateGenerator
+
+
+@dataclasses.dataclass
+class _ContestDetailsPayload:
+    """_ContestDetailsPayload"""
+    adminPayload: Optional['_ContestDetailsPayload_adminPayload']
+    clarifications: Sequence['_Clarification']
+    contest: '_ContestPublicDetails'
+    original: Optional['_ContestDetailsPayload_original']
+    problems: Sequence['_NavbarProblemsetProblem']
+    scoreboard: '_Scoreboard'
+    scoreboardEvents: Sequence['_ScoreboardEvent']
+    shouldShowFirstAssociatedIdentityRunWarning: bool
+    submissionDeadline: Optional[datetime.datetime]
+
+    def __init__(
+        self,
+        *,
+        clarifications: Sequence[Dict[str, Any]],
+        contest: Dict[str, Any],
+        problems: Sequence[Dict[str, Any]],
+        scoreboard: Dict[str, Any],
+        scoreboardEvents: Sequence[Dict[str, Any]],
+        shouldShowFirstAssociatedIdentityRunWarning: bool,
+        adminPayload: Optional[Dict[str, Any]] = None,
+        original: Optional[Dict[str, Any]] = None,
+        submissionDeadline: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if adminPayload is not None:
+            self.adminPayload = _ContestDetailsPayload_adminPayload(
+                **adminPayload)
+        else:
+            self.adminPayload = None
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+        self.contest = _ContestPublicDetails(**contest)
+        if original is not None:
+            self.original = _ContestDetailsPayload_original(**original)
+        else:
+            self.original = None
+        self.problems = [_NavbarProblemsetProblem(**v) for v in problems]
+        self.scoreboard = _Scoreboard(**scoreboard)
+        self.scoreboardEvents = [
+            _ScoreboardEvent(**v) for v in scoreboardEvents
+        ]
+        self.shouldShowFirstAssociatedIdentityRunWarning = shouldShowFirstAssociatedIdentityRunWarning
+        if submissionDeadline is not None:
+            self.submissionDeadline = datetime.datetime.fromtimestamp(
+                submissionDeadline)
+        else:
+            self.submissionDeadline = None
+
+
+@dataclasses.dataclass
+class _ContestDetailsPayload_adminPayload:
+    """_ContestDetailsPayload_adminPayload"""
+    allRuns: Sequence['_Run']
+    totalRuns: int
+    users: Sequence['_ContestUser']
+
+    def __init__(
+        self,
+        *,
+        allRuns: Sequence[Dict[str, Any]],
+        totalRuns: int,
+        users: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.allRuns = [_Run(**v) for v in allRuns]
+        self.totalRuns = totalRuns
+        self.users = [_ContestUser(**v) for v in users]
+
+
+@dataclasses.dataclass
+class _ContestDetailsPayload_original:
+    """_ContestDetailsPayload_original"""
+    contest: _OmegaUp_DAO_VO_Contests
+    scoreboard: Optional['_Scoreboard']
+    scoreboardEvents: Optional[Sequence['_ScoreboardEvent']]
+
+    def __init__(
+        self,
+        *,
+        contest: Dict[str, Any],
+        scoreboard: Optional[Dict[str, Any]] = None,
+        scoreboardEvents: Optional[Sequence[Dict[str, Any]]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contest = _OmegaUp_DAO_VO_Contests(**contest)
+        if scoreboard is not None:
+            self.scoreboard = _Scoreboard(**scoreboard)
+        else:
+            self.scoreboard = None
+        if scoreboardEvents is not None:
+            self.scoreboardEvents = [
+                _ScoreboardEvent(**v) for v in scoreboardEvents
+            ]
+        else:
+            self.scoreboardEvents = None
+
+
+@dataclasses.dataclass
+class _ContestEditPayload:
+    """_ContestEditPayload"""
+    admins: Sequence['_ContestAdmin']
+    certificatesDetails: '_ContestCertificatesAdminDetails'
+    details: '_ContestAdminDetails'
+    group_admins: Sequence['_ContestGroupAdmin']
+    groups: Sequence['_ContestGroup']
+    original_contest_admission_mode: Optional[str]
+    problems: Sequence['_ProblemsetProblemWithVersions']
+    requests: Sequence['_ContestRequest']
+    teams_group: Optional['_ContestGroup']
+    users: Sequence['_ContestUser']
+
+    def __init__(
+        self,
+        *,
+        admins: Sequence[Dict[str, Any]],
+        certificatesDetails: Dict[str, Any],
+        details: Dict[str, Any],
+        group_admins: Sequence[Dict[str, Any]],
+        groups: Sequence[Dict[str, Any]],
+        problems: Sequence[Dict[str, Any]],
+        requests: Sequence[Dict[str, Any]],
+        users: Sequence[Dict[str, Any]],
+        original_contest_admission_mode: Optional[str] = None,
+        teams_group: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admins = [_ContestAdmin(**v) for v in admins]
+        self.certificatesDetails = _ContestCertificatesAdminDetails(
+            **certificatesDetails)
+        self.details = _ContestAdminDetails(**details)
+        self.group_admins = [_ContestGroupAdmin(**v) for v in group_admins]
+        self.groups = [_ContestGroup(**v) for v in groups]
+        if original_contest_admission_mode is not None:
+            self.original_contest_admission_mode = original_contest_admission_mode
+        else:
+            self.original_contest_admission_mode = None
+        self.problems = [_ProblemsetProblemWithVersions(**v) for v in problems]
+        self.requests = [_ContestRequest(**v) for v in requests]
+        if teams_group is not None:
+            self.teams_group = _ContestGroup(**teams_group)
+        else:
+            self.teams_group = None
+        self.users = [_ContestUser(**v) for v in users]
+
+
+@dataclasses.dataclass
+class _ContestGroup:
+    """_ContestGroup"""
+    alias: str
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+
+
+@dataclasses.dataclass
+class _ContestGroupAdmin:
+    """_ContestGroupAdmin"""
+    alias: str
+    name: str
+    role: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        role: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+        self.role = role
+
+
+@dataclasses.dataclass
+class _ContestIntroPayload:
+    """_ContestIntroPayload"""
+    contest: '_ContestPublicDetails'
+    needsBasicInformation: bool
+    privacyStatement: '_PrivacyStatement'
+    requestsUserInformation: str
+    shouldShowModalToLoginWithRegisteredIdentity: bool
+
+    def __init__(
+        self,
+        *,
+        contest: Dict[str, Any],
+        needsBasicInformation: bool,
+        privacyStatement: Dict[str, Any],
+        requestsUserInformation: str,
+        shouldShowModalToLoginWithRegisteredIdentity: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contest = _ContestPublicDetails(**contest)
+        self.needsBasicInformation = needsBasicInformation
+        self.privacyStatement = _PrivacyStatement(**privacyStatement)
+        self.requestsUserInformation = requestsUserInformation
+        self.shouldShowModalToLoginWithRegisteredIdentity = shouldShowModalToLoginWithRegisteredIdentity
+
+
+@dataclasses.dataclass
+class _ContestList:
+    """_ContestList"""
+    current: Sequence['_ContestListItem']
+    future: Sequence['_ContestListItem']
+    past: Sequence['_ContestListItem']
+
+    def __init__(
+        self,
+        *,
+        current: Sequence[Dict[str, Any]],
+        future: Sequence[Dict[str, Any]],
+        past: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.current = [_ContestListItem(**v) for v in current]
+        self.future = [_ContestListItem(**v) for v in future]
+        self.past = [_ContestListItem(**v) for v in past]
+
+
+@dataclasses.dataclass
+class _ContestListMinePayload:
+    """_ContestListMinePayload"""
+    contests: Sequence['_Contest']
+    privateContestsAlert: bool
+
+    def __init__(
+        self,
+        *,
+        contests: Sequence[Dict[str, Any]],
+        privateContestsAlert: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = [_Contest(**v) for v in contests]
+        self.privateContestsAlert = privateContestsAlert
+
+
+@dataclasses.dataclass
+class _ContestListPayload:
+    """_ContestListPayload"""
+    contests: Sequence['_ContestListItem']
+    countContests: int
+    query: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        contests: Sequence[Dict[str, Any]],
+        countContests: int,
+        query: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = [_ContestListItem(**v) for v in contests]
+        self.countContests = countContests
+        if query is not None:
+            self.query = query
+        else:
+            self.query = None
+
+
+@dataclasses.dataclass
+class _ContestListv2Payload:
+    """_ContestListv2Payload"""
+    contests: '_ContestList'
+    countContests: '_ContestListv2Payload_countContests'
+    query: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        contests: Dict[str, Any],
+        countContests: Dict[str, Any],
+        query: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = _ContestList(**contests)
+        self.countContests = _ContestListv2Payload_countContests(
+            **countContests)
+        if query is not None:
+            self.query = query
+        else:
+            self.query = None
+
+
+@dataclasses.dataclass
+class _ContestListv2Payload_countContests:
+    """_ContestListv2Payload_countContests"""
+    current: int
+    future: int
+    past: int
+
+    def __init__(
+        self,
+        *,
+        current: int,
+        future: int,
+        past: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.current = current
+        self.future = future
+        self.past = past
+
+
+@dataclasses.dataclass
+class _ContestNewPayload:
+    """_ContestNewPayload"""
+    hasVisitedSection: Optional[bool]
+    languages: Dict[str, str]
+
+    def __init__(
+        self,
+        *,
+        languages: Dict[str, str],
+        hasVisitedSection: Optional[bool] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if hasVisitedSection is not None:
+            self.hasVisitedSection = hasVisitedSection
+        else:
+            self.hasVisitedSection = None
+        self.languages = {k: v for k, v in languages.items()}
+
+
+@dataclasses.dataclass
+class _ContestPracticeDetailsPayload:
+    """_ContestPracticeDetailsPayload"""
+    adminPayload: Optional['_ContestPracticeDetailsPayload_adminPayload']
+    clarifications: Sequence['_Clarification']
+    contest: '_ContestPublicDetails'
+    contestAdmin: bool
+    original: Optional['_ContestPracticeDetailsPayload_original']
+    problems: Sequence['_NavbarProblemsetProblem']
+    shouldShowFirstAssociatedIdentityRunWarning: bool
+    submissionDeadline: Optional[datetime.datetime]
+
+    def __init__(
+        self,
+        *,
+        clarifications: Sequence[Dict[str, Any]],
+        contest: Dict[str, Any],
+        contestAdmin: bool,
+        problems: Sequence[Dict[str, Any]],
+        shouldShowFirstAssociatedIdentityRunWarning: bool,
+        adminPayload: Optional[Dict[str, Any]] = None,
+        original: Optional[Dict[str, Any]] = None,
+        submissionDeadline: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if adminPayload is not None:
+            self.adminPayload = _ContestPracticeDetailsPayload_adminPayload(
+                **adminPayload)
+        else:
+            self.adminPayload = None
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+        self.contest = _ContestPublicDetails(**contest)
+        self.contestAdmin = contestAdmin
+        if original is not None:
+            self.original = _ContestPracticeDetailsPayload_original(**original)
+        else:
+            self.original = None
+        self.problems = [_NavbarProblemsetProblem(**v) for v in problems]
+        self.shouldShowFirstAssociatedIdentityRunWarning = shouldShowFirstAssociatedIdentityRunWarning
+        if submissionDeadline is not None:
+            self.submissionDeadline = datetime.datetime.fromtimestamp(
+                submissionDeadline)
+        else:
+            self.submissionDeadline = None
+
+
+@dataclasses.dataclass
+class _ContestPracticeDetailsPayload_adminPayload:
+    """_ContestPracticeDetailsPayload_adminPayload"""
+    allRuns: Sequence['_Run']
+    users: Sequence['_ContestUser']
+
+    def __init__(
+        self,
+        *,
+        allRuns: Sequence[Dict[str, Any]],
+        users: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.allRuns = [_Run(**v) for v in allRuns]
+        self.users = [_ContestUser(**v) for v in users]
+
+
+@dataclasses.dataclass
+class _ContestPracticeDetailsPayload_original:
+    """_ContestPracticeDetailsPayload_original"""
+    contest: _OmegaUp_DAO_VO_Contests
+    scoreboard: Optional['_Scoreboard']
+    scoreboardEvents: Optional[Sequence['_ScoreboardEvent']]
+
+    def __init__(
+        self,
+        *,
+        contest: Dict[str, Any],
+        scoreboard: Optional[Dict[str, Any]] = None,
+        scoreboardEvents: Optional[Sequence[Dict[str, Any]]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contest = _OmegaUp_DAO_VO_Contests(**contest)
+        if scoreboard is not None:
+            self.scoreboard = _Scoreboard(**scoreboard)
+        else:
+            self.scoreboard = None
+        if scoreboardEvents is not None:
+            self.scoreboardEvents = [
+                _ScoreboardEvent(**v) for v in scoreboardEvents
+            ]
+        else:
+            self.scoreboardEvents = None
+
+
+@dataclasses.dataclass
+class _ContestPrintDetailsPayload:
+    """_ContestPrintDetailsPayload"""
+    contestTitle: str
+    problems: Dict[int, Optional['_ProblemDetails']]
+
+    def __init__(
+        self,
+        *,
+        contestTitle: str,
+        problems: Dict[int, Optional[Dict[str, Any]]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contestTitle = contestTitle
+        self.problems = {
+            k: _ProblemDetails(**v) if v is not None else None
+            for k, v in problems.items()
+        }
+
+
+@dataclasses.dataclass
+class _ContestReportDetailsPayload:
+    """_ContestReportDetailsPayload"""
+    contestAlias: str
+    contestReport: Sequence['_ContestReport']
+
+    def __init__(
+        self,
+        *,
+        contestAlias: str,
+        contestReport: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contestAlias = contestAlias
+        self.contestReport = [_ContestReport(**v) for v in contestReport]
+
+
+@dataclasses.dataclass
+class _ContestRequest:
+    """_ContestRequest"""
+    accepted: Optional[bool]
+    admin: Optional['_ContestRequest_admin']
+    country: Optional[str]
+    last_update: Optional[datetime.datetime]
+    request_time: datetime.datetime
+    username: str
+
+    def __init__(
+        self,
+        *,
+        request_time: int,
+        username: str,
+        accepted: Optional[bool] = None,
+        admin: Optional[Dict[str, Any]] = None,
+        country: Optional[str] = None,
+        last_update: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if accepted is not None:
+            self.accepted = accepted
+        else:
+            self.accepted = None
+        if admin is not None:
+            self.admin = _ContestRequest_admin(**admin)
+        else:
+            self.admin = None
+        if country is not None:
+            self.country = country
+        else:
+            self.country = None
+        if last_update is not None:
+            self.last_update = datetime.datetime.fromtimestamp(last_update)
+        else:
+            self.last_update = None
+        self.request_time = datetime.datetime.fromtimestamp(request_time)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ContestRequest_admin:
+    """_ContestRequest_admin"""
+    username: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        username: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if username is not None:
+            self.username = username
+        else:
+            self.username = None
+
+
+@dataclasses.dataclass
+class _ContestScoreboardPayload:
+    """_ContestScoreboardPayload"""
+    contest: '_ContestDetails'
+    contestAdmin: bool
+    problems: Sequence['_NavbarProblemsetProblem']
+    scoreboard: '_Scoreboard'
+    scoreboardEvents: Sequence['_ScoreboardEvent']
+    scoreboardToken: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        contest: Dict[str, Any],
+        contestAdmin: bool,
+        problems: Sequence[Dict[str, Any]],
+        scoreboard: Dict[str, Any],
+        scoreboardEvents: Sequence[Dict[str, Any]],
+        scoreboardToken: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contest = _ContestDetails(**contest)
+        self.contestAdmin = contestAdmin
+        self.problems = [_NavbarProblemsetProblem(**v) for v in problems]
+        self.scoreboard = _Scoreboard(**scoreboard)
+        self.scoreboardEvents = [
+            _ScoreboardEvent(**v) for v in scoreboardEvents
+        ]
+        if scoreboardToken is not None:
+            self.scoreboardToken = scoreboardToken
+        else:
+            self.scoreboardToken = None
+
+
+@dataclasses.dataclass
+class _ContestVirtualDetailsPayload:
+    """_ContestVirtualDetailsPayload"""
+    contest: '_ContestPublicDetails'
+
+    def __init__(
+        self,
+        *,
+        contest: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contest = _ContestPublicDetails(**contest)
+
+
+@dataclasses.dataclass
+class _Course:
+    """_Course"""
+    acl_id: Optional[int]
+    admission_mode: str
+    alias: str
+    archived: bool
+    course_id: int
+    description: str
+    finish_time: Optional[datetime.datetime]
+    group_id: Optional[int]
+    languages: Optional[str]
+    level: Optional[str]
+    minimum_progress_for_certificate: Optional[int]
+    name: str
+    needs_basic_information: bool
+    objective: Optional[str]
+    requests_user_information: str
+    school_id: Optional[int]
+    show_scoreboard: bool
+    start_time: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        admission_mode: str,
+        alias: str,
+        archived: bool,
+        course_id: int,
+        description: str,
+        name: str,
+        needs_basic_information: bool,
+        requests_user_information: str,
+        show_scoreboard: bool,
+        start_time: int,
+        acl_id: Optional[int] = None,
+        finish_time: Optional[int] = None,
+        group_id: Optional[int] = None,
+        languages: Optional[str] = None,
+        level: Optional[str] = None,
+        minimum_progress_for_certificate: Optional[int] = None,
+        objective: Optional[str] = None,
+        school_id: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if acl_id is not None:
+            self.acl_id = acl_id
+        else:
+            self.acl_id = None
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.archived = archived
+        self.course_id = course_id
+        self.description = description
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        if group_id is not None:
+            self.group_id = group_id
+        else:
+            self.group_id = None
+        if languages is not None:
+            self.languages = languages
+        else:
+            self.languages = None
+        if level is not None:
+            self.level = level
+        else:
+            self.level = None
+        if minimum_progress_for_certificate is not None:
+            self.minimum_progress_for_certificate = minimum_progress_for_certificate
+        else:
+            self.minimum_progress_for_certificate = None
+        self.name = name
+        self.needs_basic_information = needs_basic_information
+        if objective is not None:
+            self.objective = objective
+        else:
+            self.objective = None
+        self.requests_user_information = requests_user_information
+        if school_id is not None:
+            self.school_id = school_id
+        else:
+            self.school_id = None
+        self.show_scoreboard = show_scoreboard
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+
+
+@dataclasses.dataclass
+class _CourseAdmin:
+    """_CourseAdmin"""
+    role: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        role: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.role = role
+        self.username = username
+
+
+@dataclasses.dataclass
+class _CourseCardEnrolled:
+    """_CourseCardEnrolled"""
+    alias: str
+    name: str
+    progress: float
+    school_name: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        progress: float,
+        school_name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+        self.progress = progress
+        if school_name is not None:
+            self.school_name = school_name
+        else:
+            self.school_name = None
+
+
+@dataclasses.dataclass
+class _CourseCardFinished:
+    """_CourseCardFinished"""
+    alias: str
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+
+
+@dataclasses.dataclass
+class _CourseCardPublic:
+    """_CourseCardPublic"""
+    alias: str
+    alreadyStarted: bool
+    lessonCount: int
+    level: Optional[str]
+    name: str
+    school_name: Optional[str]
+    studentCount: int
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        alreadyStarted: bool,
+        lessonCount: int,
+        name: str,
+        studentCount: int,
+        level: Optional[str] = None,
+        school_name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.alreadyStarted = alreadyStarted
+        self.lessonCount = lessonCount
+        if level is not None:
+            self.level = level
+        else:
+            self.level = None
+        self.name = name
+        if school_name is not None:
+            self.school_name = school_name
+        else:
+            self.school_name = None
+        self.studentCount = studentCount
+
+
+@dataclasses.dataclass
+class _CourseClarificationsPayload:
+    """_CourseClarificationsPayload"""
+    clarifications: Sequence['_Clarification']
+    is_admin: bool
+    is_teaching_assistant: bool
+    length: int
+    page: int
+    pagerItems: Sequence['_PageItem']
+
+    def __init__(
+        self,
+        *,
+        clarifications: Sequence[Dict[str, Any]],
+        is_admin: bool,
+        is_teaching_assistant: bool,
+        length: int,
+        page: int,
+        pagerItems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+        self.is_admin = is_admin
+        self.is_teaching_assistant = is_teaching_assistant
+        self.length = length
+        self.page = page
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+
+
+@dataclasses.dataclass
+class _CourseCloneDetailsPayload:
+    """_CourseCloneDetailsPayload"""
+    creator: '_CourseCloneDetailsPayload_creator'
+    details: '_CourseDetails'
+    token: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        creator: Dict[str, Any],
+        details: Dict[str, Any],
+        token: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.creator = _CourseCloneDetailsPayload_creator(**creator)
+        self.details = _CourseDetails(**details)
+        if token is not None:
+            self.token = token
+        else:
+            self.token = None
+
+
+@dataclasses.dataclass
+class _CourseCloneDetailsPayload_creator:
+    """_CourseCloneDetailsPayload_creator"""
+    classname: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        self.username = username
+
+
+@dataclasses.dataclass
+class _CourseDetailsPayload:
+    """_CourseDetailsPayload"""
+    details: '_CourseDetails'
+    progress: Optional[Dict[str, '_Progress']]
+
+    def __init__(
+        self,
+        *,
+        details: Dict[str, Any],
+        progress: Optional[Dict[str, Dict[str, Any]]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.details = _CourseDetails(**details)
+        if progress is not None:
+            self.progress = {k: _Progress(**v) for k, v in progress.items()}
+        else:
+            self.progress = None
+
+
+@dataclasses.dataclass
+class _CourseEditPayload:
+    """_CourseEditPayload"""
+    admins: Sequence['_CourseAdmin']
+    allLanguages: Dict[str, str]
+    assignmentProblems: Sequence['_ProblemsetProblem']
+    course: '_CourseDetails'
+    groupsAdmins: Sequence['_CourseGroupAdmin']
+    groupsTeachingAssistants: Sequence['_CourseGroupAdmin']
+    identityRequests: Sequence['_IdentityRequest']
+    selectedAssignment: Optional['_CourseAssignment']
+    students: Sequence['_CourseStudent']
+    tags: Sequence[str]
+    teachingAssistants: Sequence['_CourseAdmin']
+
+    def __init__(
+        self,
+        *,
+        admins: Sequence[Dict[str, Any]],
+        allLanguages: Dict[str, str],
+        assignmentProblems: Sequence[Dict[str, Any]],
+        course: Dict[str, Any],
+        groupsAdmins: Sequence[Dict[str, Any]],
+        groupsTeachingAssistants: Sequence[Dict[str, Any]],
+        identityRequests: Sequence[Dict[str, Any]],
+        students: Sequence[Dict[str, Any]],
+        tags: Sequence[str],
+        teachingAssistants: Sequence[Dict[str, Any]],
+        selectedAssignment: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admins = [_CourseAdmin(**v) for v in admins]
+        self.allLanguages = {k: v for k, v in allLanguages.items()}
+        self.assignmentProblems = [
+            _ProblemsetProblem(**v) for v in assignmentProblems
+        ]
+        self.course = _CourseDetails(**course)
+        self.groupsAdmins = [_CourseGroupAdmin(**v) for v in groupsAdmins]
+        self.groupsTeachingAssistants = [
+            _CourseGroupAdmin(**v) for v in groupsTeachingAssistants
+        ]
+        self.identityRequests = [
+            _IdentityRequest(**v) for v in identityRequests
+        ]
+        if selectedAssignment is not None:
+            self.selectedAssignment = _CourseAssignment(**selectedAssignment)
+        else:
+            self.selectedAssignment = None
+        self.students = [_CourseStudent(**v) for v in students]
+        self.tags = [v for v in tags]
+        self.teachingAssistants = [
+            _CourseAdmin(**v) for v in teachingAssistants
+        ]
+
+
+@dataclasses.dataclass
+class _CourseGroupAdmin:
+    """_CourseGroupAdmin"""
+    alias: str
+    name: str
+    role: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        role: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+        self.role = role
+
+
+@dataclasses.dataclass
+class _CourseListMinePayload:
+    """_CourseListMinePayload"""
+    courses: '_AdminCourses'
+
+    def __init__(
+        self,
+        *,
+        courses: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.courses = _AdminCourses(**courses)
+
+
+@dataclasses.dataclass
+class _CourseNewPayload:
+    """_CourseNewPayload"""
+    hasVisitedSection: bool
+    is_admin: bool
+    is_curator: bool
+    languages: Dict[str, str]
+
+    def __init__(
+        self,
+        *,
+        hasVisitedSection: bool,
+        is_admin: bool,
+        is_curator: bool,
+        languages: Dict[str, str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.hasVisitedSection = hasVisitedSection
+        self.is_admin = is_admin
+        self.is_curator = is_curator
+        self.languages = {k: v for k, v in languages.items()}
+
+
+@dataclasses.dataclass
+class _CourseProblemStatistics:
+    """_CourseProblemStatistics"""
+    assignment_alias: str
+    average: float
+    avg_runs: float
+    completed_score_percentage: float
+    high_score_percentage: float
+    low_score_percentage: float
+    max_points: float
+    maximum: float
+    minimum: float
+    problem_alias: str
+    variance: float
+
+    def __init__(
+        self,
+        *,
+        assignment_alias: str,
+        average: float,
+        avg_runs: float,
+        completed_score_percentage: float,
+        high_score_percentage: float,
+        low_score_percentage: float,
+        max_points: float,
+        maximum: float,
+        minimum: float,
+        problem_alias: str,
+        variance: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignment_alias = assignment_alias
+        self.average = average
+        self.avg_runs = avg_runs
+        self.completed_score_percentage = completed_score_percentage
+        self.high_score_percentage = high_score_percentage
+        self.low_score_percentage = low_score_percentage
+        self.max_points = max_points
+        self.maximum = maximum
+        self.minimum = minimum
+        self.problem_alias = problem_alias
+        self.variance = variance
+
+
+@dataclasses.dataclass
+class _CourseProblemTried:
+    """_CourseProblemTried"""
+    alias: str
+    title: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        title: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.title = title
+        self.username = username
+
+
+@dataclasses.dataclass
+class _CourseProblemVerdict:
+    """_CourseProblemVerdict"""
+    assignment_alias: str
+    problem_alias: str
+    problem_id: int
+    runs: int
+    verdict: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        assignment_alias: str,
+        problem_alias: str,
+        problem_id: int,
+        runs: int,
+        verdict: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignment_alias = assignment_alias
+        self.problem_alias = problem_alias
+        self.problem_id = problem_id
+        self.runs = runs
+        if verdict is not None:
+            self.verdict = verdict
+        else:
+            self.verdict = None
+
+
+@dataclasses.dataclass
+class _CourseScoreboardPayload:
+    """_CourseScoreboardPayload"""
+    assignment: '_AssignmentDetails'
+    problems: Sequence['_NavbarProblemsetProblem']
+    scoreboard: '_Scoreboard'
+    scoreboardToken: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        assignment: Dict[str, Any],
+        problems: Sequence[Dict[str, Any]],
+        scoreboard: Dict[str, Any],
+        scoreboardToken: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignment = _AssignmentDetails(**assignment)
+        self.problems = [_NavbarProblemsetProblem(**v) for v in problems]
+        self.scoreboard = _Scoreboard(**scoreboard)
+        if scoreboardToken is not None:
+            self.scoreboardToken = scoreboardToken
+        else:
+            self.scoreboardToken = None
+
+
+@dataclasses.dataclass
+class _CourseStatisticsPayload:
+    """_CourseStatisticsPayload"""
+    course: '_CourseDetails'
+    problemStats: Sequence['_CourseProblemStatistics']
+    verdicts: Sequence['_CourseProblemVerdict']
+
+    def __init__(
+        self,
+        *,
+        course: Dict[str, Any],
+        problemStats: Sequence[Dict[str, Any]],
+        verdicts: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.course = _CourseDetails(**course)
+        self.problemStats = [
+            _CourseProblemStatistics(**v) for v in problemStats
+        ]
+        self.verdicts = [_CourseProblemVerdict(**v) for v in verdicts]
+
+
+@dataclasses.dataclass
+class _CourseSubmissionsListPayload:
+    """_CourseSubmissionsListPayload"""
+    solvedProblems: Dict[str, Sequence['_CourseProblemTried']]
+    unsolvedProblems: Dict[str, Sequence['_CourseProblemTried']]
+
+    def __init__(
+        self,
+        *,
+        solvedProblems: Dict[str, Sequence[Dict[str, Any]]],
+        unsolvedProblems: Dict[str, Sequence[Dict[str, Any]]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.solvedProblems = {
+            k: [_CourseProblemTried(**v) for v in v]
+            for k, v in solvedProblems.items()
+        }
+        self.unsolvedProblems = {
+            k: [_CourseProblemTried(**v) for v in v]
+            for k, v in unsolvedProblems.items()
+        }
+
+
+@dataclasses.dataclass
+class _CourseTabsPayload:
+    """_CourseTabsPayload"""
+    courses: '_CourseTabsPayload_courses'
+    hasVisitedSection: bool
+
+    def __init__(
+        self,
+        *,
+        courses: Dict[str, Any],
+        hasVisitedSection: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.courses = _CourseTabsPayload_courses(**courses)
+        self.hasVisitedSection = hasVisitedSection
+
+
+@dataclasses.dataclass
+class _CourseTabsPayload_courses:
+    """_CourseTabsPayload_courses"""
+    enrolled: Sequence['_CourseCardEnrolled']
+    finished: Sequence['_CourseCardFinished']
+    public: Sequence['_CourseCardPublic']
+
+    def __init__(
+        self,
+        *,
+        enrolled: Sequence[Dict[str, Any]],
+        finished: Sequence[Dict[str, Any]],
+        public: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.enrolled = [_CourseCardEnrolled(**v) for v in enrolled]
+        self.finished = [_CourseCardFinished(**v) for v in finished]
+        self.public = [_CourseCardPublic(**v) for v in public]
+
+
+@dataclasses.dataclass
+class _CoursesByAccessMode:
+    """_CoursesByAccessMode"""
+    accessMode: str
+    activeTab: str
+    filteredCourses: '_CoursesByAccessMode_filteredCourses'
+
+    def __init__(
+        self,
+        *,
+        accessMode: str,
+        activeTab: str,
+        filteredCourses: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accessMode = accessMode
+        self.activeTab = activeTab
+        self.filteredCourses = _CoursesByAccessMode_filteredCourses(
+            **filteredCourses)
+
+
+@dataclasses.dataclass
+class _CoursesByAccessMode_filteredCourses:
+    """_CoursesByAccessMode_filteredCourses"""
+    current: '_CoursesByTimeType'
+    past: '_CoursesByTimeType'
+
+    def __init__(
+        self,
+        *,
+        current: Dict[str, Any],
+        past: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.current = _CoursesByTimeType(**current)
+        self.past = _CoursesByTimeType(**past)
+
+
+@dataclasses.dataclass
+class _CoursesByTimeType:
+    """_CoursesByTimeType"""
+    courses: Sequence['_FilteredCourse']
+    timeType: str
+
+    def __init__(
+        self,
+        *,
+        courses: Sequence[Dict[str, Any]],
+        timeType: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.courses = [_FilteredCourse(**v) for v in courses]
+        self.timeType = timeType
+
+
+@dataclasses.dataclass
+class _CoursesList:
+    """_CoursesList"""
+    admin: Sequence['_FilteredCourse']
+    archived: Sequence['_FilteredCourse']
+    public: Sequence['_FilteredCourse']
+    student: Sequence['_FilteredCourse']
+    teachingAssistant: Sequence['_FilteredCourse']
+
+    def __init__(
+        self,
+        *,
+        admin: Sequence[Dict[str, Any]],
+        archived: Sequence[Dict[str, Any]],
+        public: Sequence[Dict[str, Any]],
+        student: Sequence[Dict[str, Any]],
+        teachingAssistant: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = [_FilteredCourse(**v) for v in admin]
+        self.archived = [_FilteredCourse(**v) for v in archived]
+        self.public = [_FilteredCourse(**v) for v in public]
+        self.student = [_FilteredCourse(**v) for v in student]
+        self.teachingAssistant = [
+            _FilteredCourse(**v) for v in teachingAssistant
+        ]
+
+
+@dataclasses.dataclass
+class _EmailEditDetailsPayload:
+    """_EmailEditDetailsPayload"""
+    email: Optional[str]
+    profile: Optional['_UserProfileInfo']
+
+    def __init__(
+        self,
+        *,
+        email: Optional[str] = None,
+        profile: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if email is not None:
+            self.email = email
+        else:
+            self.email = None
+        if profile is not None:
+            self.profile = _UserProfileInfo(**profile)
+        else:
+            self.profile = None
+
+
+@dataclasses.dataclass
+class _Experiment:
+    """_Experiment"""
+    config: bool
+    hash: str
+    name: str
+
+    def __init__(
+        self,
+        *,
+        config: bool,
+        hash: str,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.config = config
+        self.hash = hash
+        self.name = name
+
+
+@dataclasses.dataclass
+class _ExtraProfileDetails:
+    """_ExtraProfileDetails"""
+    badges: Sequence[str]
+    contests: Dict[str, '_UserProfileContests_value']
+    createdContests: Sequence['_Contest']
+    createdCourses: Sequence['_Course']
+    createdProblems: Sequence['_Problem']
+    hasPassword: bool
+    ownedBadges: Sequence['_Badge']
+    solvedProblems: Sequence['_Problem']
+    stats: Sequence['_UserProfileStats']
+    unsolvedProblems: Sequence['_Problem']
+
+    def __init__(
+        self,
+        *,
+        badges: Sequence[str],
+        contests: Dict[str, Dict[str, Any]],
+        createdContests: Sequence[Dict[str, Any]],
+        createdCourses: Sequence[Dict[str, Any]],
+        createdProblems: Sequence[Dict[str, Any]],
+        hasPassword: bool,
+        ownedBadges: Sequence[Dict[str, Any]],
+        solvedProblems: Sequence[Dict[str, Any]],
+        stats: Sequence[Dict[str, Any]],
+        unsolvedProblems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.badges = [v for v in badges]
+        self.contests = {
+            k: _UserProfileContests_value(**v)
+            for k, v in contests.items()
+        }
+        self.createdContests = [_Contest(**v) for v in createdContests]
+        self.createdCourses = [_Course(**v) for v in createdCourses]
+        self.createdProblems = [_Problem(**v) for v in createdProblems]
+        self.hasPassword = hasPassword
+        self.ownedBadges = [_Badge(**v) for v in ownedBadges]
+        self.solvedProblems = [_Problem(**v) for v in solvedProblems]
+        self.stats = [_UserProfileStats(**v) for v in stats]
+        self.unsolvedProblems = [_Problem(**v) for v in unsolvedProblems]
+
+
+@dataclasses.dataclass
+class _FilteredCourse:
+    """_FilteredCourse"""
+    accept_teacher: Optional[bool]
+    admission_mode: str
+    alias: str
+    assignments: Sequence['_CourseAssignment']
+    counts: Dict[str, int]
+    description: str
+    finish_time: Optional[datetime.datetime]
+    is_open: bool
+    name: str
+    progress: Optional[float]
+    school_name: Optional[str]
+    start_time: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        admission_mode: str,
+        alias: str,
+        assignments: Sequence[Dict[str, Any]],
+        counts: Dict[str, int],
+        description: str,
+        is_open: bool,
+        name: str,
+        start_time: int,
+        accept_teacher: Optional[bool] = None,
+        finish_time: Optional[int] = None,
+        progress: Optional[float] = None,
+        school_name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if accept_teacher is not None:
+            self.accept_teacher = accept_teacher
+        else:
+            self.accept_teacher = None
+        self.admission_mode = admission_mode
+        self.alias = alias
+        self.assignments = [_CourseAssignment(**v) for v in assignments]
+        self.counts = {k: v for k, v in counts.items()}
+        self.description = description
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        self.is_open = is_open
+        self.name = name
+        if progress is not None:
+            self.progress = progress
+        else:
+            self.progress = None
+        if school_name is not None:
+            self.school_name = school_name
+        else:
+            self.school_name = None
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+
+
+@dataclasses.dataclass
+class _FullIDEPayload:
+    """_FullIDEPayload"""
+    acceptedLanguages: Sequence[str]
+    preferredLanguage: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        acceptedLanguages: Sequence[str],
+        preferredLanguage: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.acceptedLanguages = [v for v in acceptedLanguages]
+        if preferredLanguage is not None:
+            self.preferredLanguage = preferredLanguage
+        else:
+            self.preferredLanguage = None
+
+
+@dataclasses.dataclass
+class _Group:
+    """_Group"""
+    alias: str
+    create_time: datetime.datetime
+    description: Optional[str]
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        create_time: int,
+        name: str,
+        description: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.create_time = datetime.datetime.fromtimestamp(create_time)
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        self.name = name
+
+
+@dataclasses.dataclass
+class _GroupEditPayload:
+    """_GroupEditPayload"""
+    countries: Sequence['_OmegaUp_DAO_VO_Countries']
+    groupAlias: str
+    groupDescription: Optional[str]
+    groupName: Optional[str]
+    hasVisitedSection: Optional[bool]
+    identities: Sequence['_Identity']
+    isOrganizer: bool
+    scoreboards: Sequence['_GroupScoreboard']
+
+    def __init__(
+        self,
+        *,
+        countries: Sequence[Dict[str, Any]],
+        groupAlias: str,
+        identities: Sequence[Dict[str, Any]],
+        isOrganizer: bool,
+        scoreboards: Sequence[Dict[str, Any]],
+        groupDescription: Optional[str] = None,
+        groupName: Optional[str] = None,
+        hasVisitedSection: Optional[bool] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.countries = [_OmegaUp_DAO_VO_Countries(**v) for v in countries]
+        self.groupAlias = groupAlias
+        if groupDescription is not None:
+            self.groupDescription = groupDescription
+        else:
+            self.groupDescription = None
+        if groupName is not None:
+            self.groupName = groupName
+        else:
+            self.groupName = None
+        if hasVisitedSection is not None:
+            self.hasVisitedSection = hasVisitedSection
+        else:
+            self.hasVisitedSection = None
+        self.identities = [_Identity(**v) for v in identities]
+        self.isOrganizer = isOrganizer
+        self.scoreboards = [_GroupScoreboard(**v) for v in scoreboards]
+
+
+@dataclasses.dataclass
+class _GroupListPayload:
+    """_GroupListPayload"""
+    groups: Sequence['_Group']
+
+    def __init__(
+        self,
+        *,
+        groups: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.groups = [_Group(**v) for v in groups]
+
+
+@dataclasses.dataclass
+class _GroupScoreboardContestsPayload:
+    """_GroupScoreboardContestsPayload"""
+    availableContests: Sequence['_ContestListItem']
+    contests: Sequence['_ScoreboardContest']
+    groupAlias: str
+    scoreboardAlias: str
+
+    def __init__(
+        self,
+        *,
+        availableContests: Sequence[Dict[str, Any]],
+        contests: Sequence[Dict[str, Any]],
+        groupAlias: str,
+        scoreboardAlias: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.availableContests = [
+            _ContestListItem(**v) for v in availableContests
+        ]
+        self.contests = [_ScoreboardContest(**v) for v in contests]
+        self.groupAlias = groupAlias
+        self.scoreboardAlias = scoreboardAlias
+
+
+@dataclasses.dataclass
+class _GroupScoreboardDetailsPayload:
+    """_GroupScoreboardDetailsPayload"""
+    details: '_GroupScoreboardDetails'
+    groupAlias: str
+    scoreboardAlias: str
+
+    def __init__(
+        self,
+        *,
+        details: Dict[str, Any],
+        groupAlias: str,
+        scoreboardAlias: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.details = _GroupScoreboardDetails(**details)
+        self.groupAlias = groupAlias
+        self.scoreboardAlias = scoreboardAlias
+
+
+@dataclasses.dataclass
+class _Histogram:
+    """_Histogram"""
+    difficulty: float
+    difficultyHistogram: Optional[str]
+    quality: float
+    qualityHistogram: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        difficulty: float,
+        quality: float,
+        difficultyHistogram: Optional[str] = None,
+        qualityHistogram: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.difficulty = difficulty
+        if difficultyHistogram is not None:
+            self.difficultyHistogram = difficultyHistogram
+        else:
+            self.difficultyHistogram = None
+        self.quality = quality
+        if qualityHistogram is not None:
+            self.qualityHistogram = qualityHistogram
+        else:
+            self.qualityHistogram = None
+
+
+@dataclasses.dataclass
+class _IdentityExt:
+    """_IdentityExt"""
+    classname: str
+    country_id: Optional[str]
+    current_identity_school_id: Optional[int]
+    gender: Optional[str]
+    identity_id: int
+    language_id: Optional[int]
+    name: Optional[str]
+    password: Optional[str]
+    state_id: Optional[str]
+    user_id: Optional[int]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        identity_id: int,
+        username: str,
+        country_id: Optional[str] = None,
+        current_identity_school_id: Optional[int] = None,
+        gender: Optional[str] = None,
+        language_id: Optional[int] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+        state_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        if current_identity_school_id is not None:
+            self.current_identity_school_id = current_identity_school_id
+        else:
+            self.current_identity_school_id = None
+        if gender is not None:
+            self.gender = gender
+        else:
+            self.gender = None
+        self.identity_id = identity_id
+        if language_id is not None:
+            self.language_id = language_id
+        else:
+            self.language_id = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if password is not None:
+            self.password = password
+        else:
+            self.password = None
+        if state_id is not None:
+            self.state_id = state_id
+        else:
+            self.state_id = None
+        if user_id is not None:
+            self.user_id = user_id
+        else:
+            self.user_id = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _IndexPayload:
+    """_IndexPayload"""
+    coderOfTheMonthData: '_IndexPayload_coderOfTheMonthData'
+    currentUserInfo: '_IndexPayload_currentUserInfo'
+    schoolOfTheMonthData: Optional['_IndexPayload_schoolOfTheMonthData']
+    schoolRank: Sequence['_IndexPayload_schoolRank_entry']
+    userRank: Sequence['_CoderOfTheMonth']
+
+    def __init__(
+        self,
+        *,
+        coderOfTheMonthData: Dict[str, Any],
+        currentUserInfo: Dict[str, Any],
+        schoolRank: Sequence[Dict[str, Any]],
+        userRank: Sequence[Dict[str, Any]],
+        schoolOfTheMonthData: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.coderOfTheMonthData = _IndexPayload_coderOfTheMonthData(
+            **coderOfTheMonthData)
+        self.currentUserInfo = _IndexPayload_currentUserInfo(**currentUserInfo)
+        if schoolOfTheMonthData is not None:
+            self.schoolOfTheMonthData = _IndexPayload_schoolOfTheMonthData(
+                **schoolOfTheMonthData)
+        else:
+            self.schoolOfTheMonthData = None
+        self.schoolRank = [
+            _IndexPayload_schoolRank_entry(**v) for v in schoolRank
+        ]
+        self.userRank = [_CoderOfTheMonth(**v) for v in userRank]
+
+
+@dataclasses.dataclass
+class _IndexPayload_coderOfTheMonthData:
+    """_IndexPayload_coderOfTheMonthData"""
+    all: Optional['_UserProfile']
+    female: Optional['_UserProfile']
+
+    def __init__(
+        self,
+        *,
+        all: Optional[Dict[str, Any]] = None,
+        female: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if all is not None:
+            self.all = _UserProfile(**all)
+        else:
+            self.all = None
+        if female is not None:
+            self.female = _UserProfile(**female)
+        else:
+            self.female = None
+
+
+@dataclasses.dataclass
+class _IndexPayload_currentUserInfo:
+    """_IndexPayload_currentUserInfo"""
+    username: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        username: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if username is not None:
+            self.username = username
+        else:
+            self.username = None
+
+
+@dataclasses.dataclass
+class _IndexPayload_schoolOfTheMonthData:
+    """_IndexPayload_schoolOfTheMonthData"""
+    country: Optional[str]
+    country_id: Optional[str]
+    name: str
+    school_id: int
+    state: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        school_id: int,
+        country: Optional[str] = None,
+        country_id: Optional[str] = None,
+        state: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if country is not None:
+            self.country = country
+        else:
+            self.country = None
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        self.name = name
+        self.school_id = school_id
+        if state is not None:
+            self.state = state
+        else:
+            self.state = None
+
+
+@dataclasses.dataclass
+class _IndexPayload_schoolRank_entry:
+    """_IndexPayload_schoolRank_entry"""
+    name: str
+    ranking: int
+    school_id: int
+    school_of_the_month_id: int
+    score: float
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        ranking: int,
+        school_id: int,
+        school_of_the_month_id: int,
+        score: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.ranking = ranking
+        self.school_id = school_id
+        self.school_of_the_month_id = school_of_the_month_id
+        self.score = score
+
+
+@dataclasses.dataclass
+class _InteractiveInterface:
+    """_InteractiveInterface"""
+    ExecutableDescription: '_InteractiveInterface_ExecutableDescription'
+    Files: Dict[str, str]
+    MakefileRules: Sequence['_InteractiveInterface_MakefileRules_entry']
+
+    def __init__(
+        self,
+        *,
+        ExecutableDescription: Dict[str, Any],
+        Files: Dict[str, str],
+        MakefileRules: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.ExecutableDescription = _InteractiveInterface_ExecutableDescription(
+            **ExecutableDescription)
+        self.Files = {k: v for k, v in Files.items()}
+        self.MakefileRules = [
+            _InteractiveInterface_MakefileRules_entry(**v)
+            for v in MakefileRules
+        ]
+
+
+@dataclasses.dataclass
+class _InteractiveInterface_ExecutableDescription:
+    """_InteractiveInterface_ExecutableDescription"""
+    Args: Sequence[str]
+    Env: Dict[str, str]
+
+    def __init__(
+        self,
+        *,
+        Args: Sequence[str],
+        Env: Dict[str, str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.Args = [v for v in Args]
+        self.Env = {k: v for k, v in Env.items()}
+
+
+@dataclasses.dataclass
+class _InteractiveInterface_MakefileRules_entry:
+    """_InteractiveInterface_MakefileRules_entry"""
+    Compiler: str
+    Debug: bool
+    Params: str
+    Requisites: Sequence[str]
+    Targets: Sequence[str]
+
+    def __init__(
+        self,
+        *,
+        Compiler: str,
+        Debug: bool,
+        Params: str,
+        Requisites: Sequence[str],
+        Targets: Sequence[str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.Compiler = Compiler
+        self.Debug = Debug
+        self.Params = Params
+        self.Requisites = [v for v in Requisites]
+        self.Targets = [v for v in Targets]
+
+
+@dataclasses.dataclass
+class _IntroCourseDetails:
+    """_IntroCourseDetails"""
+    details: '_CourseDetails'
+    progress: Dict[str, Dict[str, float]]
+
+    def __init__(
+        self,
+        *,
+        details: Dict[str, Any],
+        progress: Dict[str, Dict[str, float]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.details = _CourseDetails(**details)
+        self.progress = {
+            k: {k: v
+                for k, v in v.items()}
+            for k, v in progress.items()
+        }
+
+
+@dataclasses.dataclass
+class _LibinteractiveError:
+    """_LibinteractiveError"""
+    description: str
+    field: str
+
+    def __init__(
+        self,
+        *,
+        description: str,
+        field: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.description = description
+        self.field = field
+
+
+@dataclasses.dataclass
+class _LibinteractiveGenPayload:
+    """_LibinteractiveGenPayload"""
+    error: Optional['_LibinteractiveError']
+    idl: Optional[str]
+    language: Optional[str]
+    name: Optional[str]
+    os: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        error: Optional[Dict[str, Any]] = None,
+        idl: Optional[str] = None,
+        language: Optional[str] = None,
+        name: Optional[str] = None,
+        os: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if error is not None:
+            self.error = _LibinteractiveError(**error)
+        else:
+            self.error = None
+        if idl is not None:
+            self.idl = idl
+        else:
+            self.idl = None
+        if language is not None:
+            self.language = language
+        else:
+            self.language = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if os is not None:
+            self.os = os
+        else:
+            self.os = None
+
+
+@dataclasses.dataclass
+class _LoginDetailsPayload:
+    """_LoginDetailsPayload"""
+    facebookUrl: Optional[str]
+    hasVisitedSection: Optional[bool]
+    statusError: Optional[str]
+    validateRecaptcha: bool
+    verifyEmailSuccessfully: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        validateRecaptcha: bool,
+        facebookUrl: Optional[str] = None,
+        hasVisitedSection: Optional[bool] = None,
+        statusError: Optional[str] = None,
+        verifyEmailSuccessfully: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if facebookUrl is not None:
+            self.facebookUrl = facebookUrl
+        else:
+            self.facebookUrl = None
+        if hasVisitedSection is not None:
+            self.hasVisitedSection = hasVisitedSection
+        else:
+            self.hasVisitedSection = None
+        if statusError is not None:
+            self.statusError = statusError
+        else:
+            self.statusError = None
+        self.validateRecaptcha = validateRecaptcha
+        if verifyEmailSuccessfully is not None:
+            self.verifyEmailSuccessfully = verifyEmailSuccessfully
+        else:
+            self.verifyEmailSuccessfully = None
+
+
+@dataclasses.dataclass
+class _NavbarProblemsetProblem:
+    """_NavbarProblemsetProblem"""
+    acceptsSubmissions: bool
+    alias: str
+    bestScore: int
+    hasMyRuns: Optional[bool]
+    hasRuns: bool
+    maxScore: Union[float, int]
+    myBestScore: Optional[float]
+    text: str
+
+    def __init__(
+        self,
+        *,
+        acceptsSubmissions: bool,
+        alias: str,
+        bestScore: int,
+        hasRuns: bool,
+        maxScore: Union[float, int],
+        text: str,
+        hasMyRuns: Optional[bool] = None,
+        myBestScore: Optional[float] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.acceptsSubmissions = acceptsSubmissions
+        self.alias = alias
+        self.bestScore = bestScore
+        if hasMyRuns is not None:
+            self.hasMyRuns = hasMyRuns
+        else:
+            self.hasMyRuns = None
+        self.hasRuns = hasRuns
+        self.maxScore = maxScore
+        if myBestScore is not None:
+            self.myBestScore = myBestScore
+        else:
+            self.myBestScore = None
+        self.text = text
+
+
+@dataclasses.dataclass
+class _Participant:
+    """_Participant"""
+    country_id: Optional[str]
+    gender: Optional[str]
+    name: Optional[str]
+    participant_password: Optional[str]
+    participant_username: str
+    password: Optional[str]
+    school_name: Optional[str]
+    state_id: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        participant_username: str,
+        username: str,
+        country_id: Optional[str] = None,
+        gender: Optional[str] = None,
+        name: Optional[str] = None,
+        participant_password: Optional[str] = None,
+        password: Optional[str] = None,
+        school_name: Optional[str] = None,
+        state_id: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        if gender is not None:
+            self.gender = gender
+        else:
+            self.gender = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if participant_password is not None:
+            self.participant_password = participant_password
+        else:
+            self.participant_password = None
+        self.participant_username = participant_username
+        if password is not None:
+            self.password = password
+        else:
+            self.password = None
+        if school_name is not None:
+            self.school_name = school_name
+        else:
+            self.school_name = None
+        if state_id is not None:
+            self.state_id = state_id
+        else:
+            self.state_id = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _PrivacyPolicyDetailsPayload:
+    """_PrivacyPolicyDetailsPayload"""
+    git_object_id: str
+    has_accepted: bool
+    policy_markdown: str
+    statement_type: str
+
+    def __init__(
+        self,
+        *,
+        git_object_id: str,
+        has_accepted: bool,
+        policy_markdown: str,
+        statement_type: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.git_object_id = git_object_id
+        self.has_accepted = has_accepted
+        self.policy_markdown = policy_markdown
+        self.statement_type = statement_type
+
+
+@dataclasses.dataclass
+class _ProblemDetailsPayload:
+    """_ProblemDetailsPayload"""
+    allRuns: Optional[Sequence['_Run']]
+    allowUserAddTags: Optional[bool]
+    allowedSolutionsToSee: int
+    clarifications: Optional[Sequence['_Clarification']]
+    hasVisitedSection: Optional[bool]
+    histogram: '_Histogram'
+    levelTags: Optional[Sequence[str]]
+    nominationStatus: Optional['_NominationStatus']
+    problem: '_ProblemInfo'
+    problemLevel: Optional[str]
+    publicTags: Optional[Sequence[str]]
+    runs: Optional[Sequence['_Run']]
+    selectedPrivateTags: Optional[Sequence[str]]
+    selectedPublicTags: Optional[Sequence[str]]
+    solutionStatus: Optional[str]
+    solvers: Sequence['_BestSolvers']
+    totalRuns: Optional[int]
+    user: '_UserInfoForProblem'
+
+    def __init__(
+        self,
+        *,
+        allowedSolutionsToSee: int,
+        histogram: Dict[str, Any],
+        problem: Dict[str, Any],
+        solvers: Sequence[Dict[str, Any]],
+        user: Dict[str, Any],
+        allRuns: Optional[Sequence[Dict[str, Any]]] = None,
+        allowUserAddTags: Optional[bool] = None,
+        clarifications: Optional[Sequence[Dict[str, Any]]] = None,
+        hasVisitedSection: Optional[bool] = None,
+        levelTags: Optional[Sequence[str]] = None,
+        nominationStatus: Optional[Dict[str, Any]] = None,
+        problemLevel: Optional[str] = None,
+        publicTags: Optional[Sequence[str]] = None,
+        runs: Optional[Sequence[Dict[str, Any]]] = None,
+        selectedPrivateTags: Optional[Sequence[str]] = None,
+        selectedPublicTags: Optional[Sequence[str]] = None,
+        solutionStatus: Optional[str] = None,
+        totalRuns: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if allRuns is not None:
+            self.allRuns = [_Run(**v) for v in allRuns]
+        else:
+            self.allRuns = None
+        if allowUserAddTags is not None:
+            self.allowUserAddTags = allowUserAddTags
+        else:
+            self.allowUserAddTags = None
+        self.allowedSolutionsToSee = allowedSolutionsToSee
+        if clarifications is not None:
+            self.clarifications = [_Clarification(**v) for v in clarifications]
+        else:
+            self.clarifications = None
+        if hasVisitedSection is not None:
+            self.hasVisitedSection = hasVisitedSection
+        else:
+            self.hasVisitedSection = None
+        self.histogram = _Histogram(**histogram)
+        if levelTags is not None:
+            self.levelTags = [v for v in levelTags]
+        else:
+            self.levelTags = None
+        if nominationStatus is not None:
+            self.nominationStatus = _NominationStatus(**nominationStatus)
+        else:
+            self.nominationStatus = None
+        self.problem = _ProblemInfo(**problem)
+        if problemLevel is not None:
+            self.problemLevel = problemLevel
+        else:
+            self.problemLevel = None
+        if publicTags is not None:
+            self.publicTags = [v for v in publicTags]
+        else:
+            self.publicTags = None
+        if runs is not None:
+            self.runs = [_Run(**v) for v in runs]
+        else:
+            self.runs = None
+        if selectedPrivateTags is not None:
+            self.selectedPrivateTags = [v for v in selectedPrivateTags]
+        else:
+            self.selectedPrivateTags = None
+        if selectedPublicTags is not None:
+            self.selectedPublicTags = [v for v in selectedPublicTags]
+        else:
+            self.selectedPublicTags = None
+        if solutionStatus is not None:
+            self.solutionStatus = solutionStatus
+        else:
+            self.solutionStatus = None
+        self.solvers = [_BestSolvers(**v) for v in solvers]
+        if totalRuns is not None:
+            self.totalRuns = totalRuns
+        else:
+            self.totalRuns = None
+        self.user = _UserInfoForProblem(**user)
+
+
+@dataclasses.dataclass
+class _ProblemEditPayload:
+    """_ProblemEditPayload"""
+    admins: Sequence['_ProblemAdmin']
+    alias: str
+    allowUserAddTags: bool
+    emailClarifications: bool
+    extraWallTime: float
+    groupAdmins: Sequence['_ProblemGroupAdmin']
+    groupScorePolicy: Optional[str]
+    inputLimit: int
+    languages: str
+    levelTags: Sequence[str]
+    log: Sequence['_ProblemVersion']
+    memoryLimit: float
+    outputLimit: int
+    overallWallTimeLimit: float
+    problemLevel: Optional[str]
+    problemsetter: Optional['_ProblemsetterInfo']
+    publicTags: Sequence[str]
+    publishedRevision: Optional['_ProblemVersion']
+    selectedPrivateTags: Sequence[str]
+    selectedPublicTags: Sequence[str]
+    showDiff: str
+    solution: Optional['_ProblemStatement']
+    source: str
+    statement: '_ProblemStatement'
+    statusError: Optional[str]
+    statusSuccess: bool
+    timeLimit: float
+    title: str
+    validLanguages: Dict[str, str]
+    validator: str
+    validatorTimeLimit: Union[float, int]
+    validatorTypes: Dict[str, Optional[str]]
+    visibility: int
+    visibilityStatuses: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        admins: Sequence[Dict[str, Any]],
+        alias: str,
+        allowUserAddTags: bool,
+        emailClarifications: bool,
+        extraWallTime: float,
+        groupAdmins: Sequence[Dict[str, Any]],
+        inputLimit: int,
+        languages: str,
+        levelTags: Sequence[str],
+        log: Sequence[Dict[str, Any]],
+        memoryLimit: float,
+        outputLimit: int,
+        overallWallTimeLimit: float,
+        publicTags: Sequence[str],
+        selectedPrivateTags: Sequence[str],
+        selectedPublicTags: Sequence[str],
+        showDiff: str,
+        source: str,
+        statement: Dict[str, Any],
+        statusSuccess: bool,
+        timeLimit: float,
+        title: str,
+        validLanguages: Dict[str, str],
+        validator: str,
+        validatorTimeLimit: Union[float, int],
+        validatorTypes: Dict[str, Optional[str]],
+        visibility: int,
+        visibilityStatuses: Dict[str, int],
+        groupScorePolicy: Optional[str] = None,
+        problemLevel: Optional[str] = None,
+        problemsetter: Optional[Dict[str, Any]] = None,
+        publishedRevision: Optional[Dict[str, Any]] = None,
+        solution: Optional[Dict[str, Any]] = None,
+        statusError: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admins = [_ProblemAdmin(**v) for v in admins]
+        self.alias = alias
+        self.allowUserAddTags = allowUserAddTags
+        self.emailClarifications = emailClarifications
+        self.extraWallTime = extraWallTime
+        self.groupAdmins = [_ProblemGroupAdmin(**v) for v in groupAdmins]
+        if groupScorePolicy is not None:
+            self.groupScorePolicy = groupScorePolicy
+        else:
+            self.groupScorePolicy = None
+        self.inputLimit = inputLimit
+        self.languages = languages
+        self.levelTags = [v for v in levelTags]
+        self.log = [_ProblemVersion(**v) for v in log]
+        self.memoryLimit = memoryLimit
+        self.outputLimit = outputLimit
+        self.overallWallTimeLimit = overallWallTimeLimit
+        if problemLevel is not None:
+            self.problemLevel = problemLevel
+        else:
+            self.problemLevel = None
+        if problemsetter is not None:
+            self.problemsetter = _ProblemsetterInfo(**problemsetter)
+        else:
+            self.problemsetter = None
+        self.publicTags = [v for v in publicTags]
+        if publishedRevision is not None:
+            self.publishedRevision = _ProblemVersion(**publishedRevision)
+        else:
+            self.publishedRevision = None
+        self.selectedPrivateTags = [v for v in selectedPrivateTags]
+        self.selectedPublicTags = [v for v in selectedPublicTags]
+        self.showDiff = showDiff
+        if solution is not None:
+            self.solution = _ProblemStatement(**solution)
+        else:
+            self.solution = None
+        self.source = source
+        self.statement = _ProblemStatement(**statement)
+        if statusError is not None:
+            self.statusError = statusError
+        else:
+            self.statusError = None
+        self.statusSuccess = statusSuccess
+        self.timeLimit = timeLimit
+        self.title = title
+        self.validLanguages = {k: v for k, v in validLanguages.items()}
+        self.validator = validator
+        self.validatorTimeLimit = validatorTimeLimit
+        self.validatorTypes = {
+            k: v if v is not None else None
+            for k, v in validatorTypes.items()
+        }
+        self.visibility = visibility
+        self.visibilityStatuses = {k: v for k, v in visibilityStatuses.items()}
+
+
+@dataclasses.dataclass
+class _ProblemFormPayload:
+    """_ProblemFormPayload"""
+    alias: str
+    allowUserAddTags: bool
+    emailClarifications: bool
+    extraWallTime: Union[int, str]
+    groupScorePolicy: Optional[str]
+    hasVisitedSection: Optional[bool]
+    inputLimit: Union[int, str]
+    languages: str
+    levelTags: Sequence[str]
+    memoryLimit: Union[int, str]
+    message: Optional[str]
+    outputLimit: Union[int, str]
+    overallWallTimeLimit: Union[int, str]
+    parameter: Optional[str]
+    problem_level: str
+    publicTags: Sequence[str]
+    selectedTags: Optional[Sequence['_SelectedTag']]
+    showDiff: str
+    source: str
+    statusError: str
+    tags: Sequence['_ProblemFormPayload_tags_entry']
+    timeLimit: Union[int, str]
+    title: str
+    validLanguages: Dict[str, str]
+    validator: str
+    validatorTimeLimit: Union[int, str]
+    validatorTypes: Dict[str, Optional[str]]
+    visibility: int
+    visibilityStatuses: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        allowUserAddTags: bool,
+        emailClarifications: bool,
+        extraWallTime: Union[int, str],
+        inputLimit: Union[int, str],
+        languages: str,
+        levelTags: Sequence[str],
+        memoryLimit: Union[int, str],
+        outputLimit: Union[int, str],
+        overallWallTimeLimit: Union[int, str],
+        problem_level: str,
+        publicTags: Sequence[str],
+        showDiff: str,
+        source: str,
+        statusError: str,
+        tags: Sequence[Dict[str, Any]],
+        timeLimit: Union[int, str],
+        title: str,
+        validLanguages: Dict[str, str],
+        validator: str,
+        validatorTimeLimit: Union[int, str],
+        validatorTypes: Dict[str, Optional[str]],
+        visibility: int,
+        visibilityStatuses: Dict[str, int],
+        groupScorePolicy: Optional[str] = None,
+        hasVisitedSection: Optional[bool] = None,
+        message: Optional[str] = None,
+        parameter: Optional[str] = None,
+        selectedTags: Optional[Sequence[Dict[str, Any]]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.allowUserAddTags = allowUserAddTags
+        self.emailClarifications = emailClarifications
+        self.extraWallTime = extraWallTime
+        if groupScorePolicy is not None:
+            self.groupScorePolicy = groupScorePolicy
+        else:
+            self.groupScorePolicy = None
+        if hasVisitedSection is not None:
+            self.hasVisitedSection = hasVisitedSection
+        else:
+            self.hasVisitedSection = None
+        self.inputLimit = inputLimit
+        self.languages = languages
+        self.levelTags = [v for v in levelTags]
+        self.memoryLimit = memoryLimit
+        if message is not None:
+            self.message = message
+        else:
+            self.message = None
+        self.outputLimit = outputLimit
+        self.overallWallTimeLimit = overallWallTimeLimit
+        if parameter is not None:
+            self.parameter = parameter
+        else:
+            self.parameter = None
+        self.problem_level = problem_level
+        self.publicTags = [v for v in publicTags]
+        if selectedTags is not None:
+            self.selectedTags = [_SelectedTag(**v) for v in selectedTags]
+        else:
+            self.selectedTags = None
+        self.showDiff = showDiff
+        self.source = source
+        self.statusError = statusError
+        self.tags = [_ProblemFormPayload_tags_entry(**v) for v in tags]
+        self.timeLimit = timeLimit
+        self.title = title
+        self.validLanguages = {k: v for k, v in validLanguages.items()}
+        self.validator = validator
+        self.validatorTimeLimit = validatorTimeLimit
+        self.validatorTypes = {
+            k: v if v is not None else None
+            for k, v in validatorTypes.items()
+        }
+        self.visibility = visibility
+        self.visibilityStatuses = {k: v for k, v in visibilityStatuses.items()}
+
+
+@dataclasses.dataclass
+class _ProblemFormPayload_tags_entry:
+    """_ProblemFormPayload_tags_entry"""
+    name: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+
+
+@dataclasses.dataclass
+class _ProblemInfo:
+    """_ProblemInfo"""
+    accepts_submissions: bool
+    alias: str
+    commit: str
+    input_limit: int
+    karel_problem: bool
+    languages: Sequence[str]
+    letter: Optional[str]
+    limits: '_SettingLimits'
+    nextSubmissionTimestamp: Optional[datetime.datetime]
+    points: float
+    preferred_language: Optional[str]
+    problem_id: int
+    problemsetter: Optional['_ProblemsetterInfo']
+    quality_seal: bool
+    sample_input: Optional[str]
+    settings: '_ProblemSettingsDistrib'
+    source: Optional[str]
+    statement: '_ProblemStatement'
+    title: str
+    visibility: int
+
+    def __init__(
+        self,
+        *,
+        accepts_submissions: bool,
+        alias: str,
+        commit: str,
+        input_limit: int,
+        karel_problem: bool,
+        languages: Sequence[str],
+        limits: Dict[str, Any],
+        points: float,
+        problem_id: int,
+        quality_seal: bool,
+        settings: Dict[str, Any],
+        statement: Dict[str, Any],
+        title: str,
+        visibility: int,
+        letter: Optional[str] = None,
+        nextSubmissionTimestamp: Optional[int] = None,
+        preferred_language: Optional[str] = None,
+        problemsetter: Optional[Dict[str, Any]] = None,
+        sample_input: Optional[str] = None,
+        source: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accepts_submissions = accepts_submissions
+        self.alias = alias
+        self.commit = commit
+        self.input_limit = input_limit
+        self.karel_problem = karel_problem
+        self.languages = [v for v in languages]
+        if letter is not None:
+            self.letter = letter
+        else:
+            self.letter = None
+        self.limits = _SettingLimits(**limits)
+        if nextSubmissionTimestamp is not None:
+            self.nextSubmissionTimestamp = datetime.datetime.fromtimestamp(
+                nextSubmissionTimestamp)
+        else:
+            self.nextSubmissionTimestamp = None
+        self.points = points
+        if preferred_language is not None:
+            self.preferred_language = preferred_language
+        else:
+            self.preferred_language = None
+        self.problem_id = problem_id
+        if problemsetter is not None:
+            self.problemsetter = _ProblemsetterInfo(**problemsetter)
+        else:
+            self.problemsetter = None
+        self.quality_seal = quality_seal
+        if sample_input is not None:
+            self.sample_input = sample_input
+        else:
+            self.sample_input = None
+        self.settings = _ProblemSettingsDistrib(**settings)
+        if source is not None:
+            self.source = source
+        else:
+            self.source = None
+        self.statement = _ProblemStatement(**statement)
+        self.title = title
+        self.visibility = visibility
+
+
+@dataclasses.dataclass
+class _ProblemListCollectionPayload:
+    """_ProblemListCollectionPayload"""
+    allTags: Sequence['_Tag']
+    levelTags: Sequence[str]
+    problemCount: Sequence['_ProblemListCollectionPayload_problemCount_entry']
+
+    def __init__(
+        self,
+        *,
+        allTags: Sequence[Dict[str, Any]],
+        levelTags: Sequence[str],
+        problemCount: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.allTags = [_Tag(**v) for v in allTags]
+        self.levelTags = [v for v in levelTags]
+        self.problemCount = [
+            _ProblemListCollectionPayload_problemCount_entry(**v)
+            for v in problemCount
+        ]
+
+
+@dataclasses.dataclass
+class _ProblemListCollectionPayload_problemCount_entry:
+    """_ProblemListCollectionPayload_problemCount_entry"""
+    name: str
+    problems_per_tag: int
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        problems_per_tag: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.problems_per_tag = problems_per_tag
+
+
+@dataclasses.dataclass
+class _ProblemListPayload:
+    """_ProblemListPayload"""
+    column: str
+    columns: Sequence[str]
+    keyword: str
+    language: str
+    languages: Sequence[str]
+    loggedIn: bool
+    mode: str
+    modes: Sequence[str]
+    pagerItems: Sequence['_PageItem']
+    problems: Sequence['_ProblemListItem']
+    selectedTags: Sequence[str]
+    tagData: Sequence['_ProblemListPayload_tagData_entry']
+    tags: Sequence[str]
+
+    def __init__(
+        self,
+        *,
+        column: str,
+        columns: Sequence[str],
+        keyword: str,
+        language: str,
+        languages: Sequence[str],
+        loggedIn: bool,
+        mode: str,
+        modes: Sequence[str],
+        pagerItems: Sequence[Dict[str, Any]],
+        problems: Sequence[Dict[str, Any]],
+        selectedTags: Sequence[str],
+        tagData: Sequence[Dict[str, Any]],
+        tags: Sequence[str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.column = column
+        self.columns = [v for v in columns]
+        self.keyword = keyword
+        self.language = language
+        self.languages = [v for v in languages]
+        self.loggedIn = loggedIn
+        self.mode = mode
+        self.modes = [v for v in modes]
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.problems = [_ProblemListItem(**v) for v in problems]
+        self.selectedTags = [v for v in selectedTags]
+        self.tagData = [
+            _ProblemListPayload_tagData_entry(**v) for v in tagData
+        ]
+        self.tags = [v for v in tags]
+
+
+@dataclasses.dataclass
+class _ProblemListPayload_tagData_entry:
+    """_ProblemListPayload_tagData_entry"""
+    name: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+
+
+@dataclasses.dataclass
+class _ProblemPrintDetailsPayload:
+    """_ProblemPrintDetailsPayload"""
+    details: '_ProblemDetails'
+
+    def __init__(
+        self,
+        *,
+        details: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.details = _ProblemDetails(**details)
+
+
+@dataclasses.dataclass
+class _ProblemSettings:
+    """_ProblemSettings"""
+    Cases: Sequence['_ProblemSettings_Cases_entry']
+    Interactive: Optional['_ProblemSettings_Interactive']
+    Limits: '_LimitsSettings'
+    Slow: bool
+    Validator: '_ProblemSettings_Validator'
+
+    def __init__(
+        self,
+        *,
+        Cases: Sequence[Dict[str, Any]],
+        Limits: Dict[str, Any],
+        Slow: bool,
+        Validator: Dict[str, Any],
+        Interactive: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.Cases = [_ProblemSettings_Cases_entry(**v) for v in Cases]
+        if Interactive is not None:
+            self.Interactive = _ProblemSettings_Interactive(**Interactive)
+        else:
+            self.Interactive = None
+        self.Limits = _LimitsSettings(**Limits)
+        self.Slow = Slow
+        self.Validator = _ProblemSettings_Validator(**Validator)
+
+
+@dataclasses.dataclass
+class _ProblemSettings_Cases_entry:
+    """_ProblemSettings_Cases_entry"""
+    Cases: Sequence['_ProblemSettings_Cases_entry_Cases_entry']
+    Name: str
+
+    def __init__(
+        self,
+        *,
+        Cases: Sequence[Dict[str, Any]],
+        Name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.Cases = [
+            _ProblemSettings_Cases_entry_Cases_entry(**v) for v in Cases
+        ]
+        self.Name = Name
+
+
+@dataclasses.dataclass
+class _ProblemSettings_Cases_entry_Cases_entry:
+    """_ProblemSettings_Cases_entry_Cases_entry"""
+    Name: str
+    Weight: float
+
+    def __init__(
+        self,
+        *,
+        Name: str,
+        Weight: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.Name = Name
+        self.Weight = Weight
+
+
+@dataclasses.dataclass
+class _ProblemSettings_Interactive:
+    """_ProblemSettings_Interactive"""
+    Interfaces: Dict[str, Dict[str, '_InteractiveInterface']]
+    LibinteractiveVersion: str
+    Main: str
+    ModuleName: str
+    ParentLang: str
+    Templates: Dict[str, str]
+
+    def __init__(
+        self,
+        *,
+        Interfaces: Dict[str, Dict[str, Dict[str, Any]]],
+        LibinteractiveVersion: str,
+        Main: str,
+        ModuleName: str,
+        ParentLang: str,
+        Templates: Dict[str, str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.Interfaces = {
+            k: {k: _InteractiveInterface(**v)
+                for k, v in v.items()}
+            for k, v in Interfaces.items()
+        }
+        self.LibinteractiveVersion = LibinteractiveVersion
+        self.Main = Main
+        self.ModuleName = ModuleName
+        self.ParentLang = ParentLang
+        self.Templates = {k: v for k, v in Templates.items()}
+
+
+@dataclasses.dataclass
+class _ProblemSettings_Validator:
+    """_ProblemSettings_Validator"""
+    GroupScorePolicy: Optional[str]
+    Lang: Optional[str]
+    Limits: Optional['_LimitsSettings']
+    Name: str
+    Tolerance: float
+
+    def __init__(
+        self,
+        *,
+        Name: str,
+        Tolerance: float,
+        GroupScorePolicy: Optional[str] = None,
+        Lang: Optional[str] = None,
+        Limits: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if GroupScorePolicy is not None:
+            self.GroupScorePolicy = GroupScorePolicy
+        else:
+            self.GroupScorePolicy = None
+        if Lang is not None:
+            self.Lang = Lang
+        else:
+            self.Lang = None
+        if Limits is not None:
+            self.Limits = _LimitsSettings(**Limits)
+        else:
+            self.Limits = None
+        self.Name = Name
+        self.Tolerance = Tolerance
+
+
+@dataclasses.dataclass
+class _ProblemsMineInfoPayload:
+    """_ProblemsMineInfoPayload"""
+    isSysadmin: bool
+    privateProblemsAlert: bool
+    query: Optional[str]
+    visibilityStatuses: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        isSysadmin: bool,
+        privateProblemsAlert: bool,
+        visibilityStatuses: Dict[str, int],
+        query: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.isSysadmin = isSysadmin
+        self.privateProblemsAlert = privateProblemsAlert
+        if query is not None:
+            self.query = query
+        else:
+            self.query = None
+        self.visibilityStatuses = {k: v for k, v in visibilityStatuses.items()}
+
+
+@dataclasses.dataclass
+class _School:
+    """_School"""
+    country_id: Optional[str]
+    name: str
+    ranking: Optional[int]
+    school_id: int
+    score: float
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        school_id: int,
+        score: float,
+        country_id: Optional[str] = None,
+        ranking: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        self.name = name
+        if ranking is not None:
+            self.ranking = ranking
+        else:
+            self.ranking = None
+        self.school_id = school_id
+        self.score = score
+
+
+@dataclasses.dataclass
+class _SchoolCoderOfTheMonth:
+    """_SchoolCoderOfTheMonth"""
+    classname: str
+    time: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        time: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        self.time = time
+        self.username = username
+
+
+@dataclasses.dataclass
+class _SchoolOfTheMonthPayload:
+    """_SchoolOfTheMonthPayload"""
+    candidatesToSchoolOfTheMonth: Sequence[
+        '_SchoolOfTheMonthPayload_candidatesToSchoolOfTheMonth_entry']
+    isMentor: bool
+    options: Optional['_SchoolOfTheMonthPayload_options']
+    schoolsOfPreviousMonth: Sequence[
+        '_SchoolOfTheMonthPayload_schoolsOfPreviousMonth_entry']
+    schoolsOfPreviousMonths: Sequence[
+        '_SchoolOfTheMonthPayload_schoolsOfPreviousMonths_entry']
+
+    def __init__(
+        self,
+        *,
+        candidatesToSchoolOfTheMonth: Sequence[Dict[str, Any]],
+        isMentor: bool,
+        schoolsOfPreviousMonth: Sequence[Dict[str, Any]],
+        schoolsOfPreviousMonths: Sequence[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.candidatesToSchoolOfTheMonth = [
+            _SchoolOfTheMonthPayload_candidatesToSchoolOfTheMonth_entry(**v)
+            for v in candidatesToSchoolOfTheMonth
+        ]
+        self.isMentor = isMentor
+        if options is not None:
+            self.options = _SchoolOfTheMonthPayload_options(**options)
+        else:
+            self.options = None
+        self.schoolsOfPreviousMonth = [
+            _SchoolOfTheMonthPayload_schoolsOfPreviousMonth_entry(**v)
+            for v in schoolsOfPreviousMonth
+        ]
+        self.schoolsOfPreviousMonths = [
+            _SchoolOfTheMonthPayload_schoolsOfPreviousMonths_entry(**v)
+            for v in schoolsOfPreviousMonths
+        ]
+
+
+@dataclasses.dataclass
+class _SchoolOfTheMonthPayload_candidatesToSchoolOfTheMonth_entry:
+    """_SchoolOfTheMonthPayload_candidatesToSchoolOfTheMonth_entry"""
+    country_id: str
+    name: str
+    ranking: int
+    school_id: int
+    school_of_the_month_id: int
+    score: float
+
+    def __init__(
+        self,
+        *,
+        country_id: str,
+        name: str,
+        ranking: int,
+        school_id: int,
+        school_of_the_month_id: int,
+        score: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.country_id = country_id
+        self.name = name
+        self.ranking = ranking
+        self.school_id = school_id
+        self.school_of_the_month_id = school_of_the_month_id
+        self.score = score
+
+
+@dataclasses.dataclass
+class _SchoolOfTheMonthPayload_options:
+    """_SchoolOfTheMonthPayload_options"""
+    canChooseSchool: bool
+    schoolIsSelected: bool
+
+    def __init__(
+        self,
+        *,
+        canChooseSchool: bool,
+        schoolIsSelected: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.canChooseSchool = canChooseSchool
+        self.schoolIsSelected = schoolIsSelected
+
+
+@dataclasses.dataclass
+class _SchoolOfTheMonthPayload_schoolsOfPreviousMonth_entry:
+    """_SchoolOfTheMonthPayload_schoolsOfPreviousMonth_entry"""
+    country_id: str
+    name: str
+    ranking: int
+    school_id: int
+
+    def __init__(
+        self,
+        *,
+        country_id: str,
+        name: str,
+        ranking: int,
+        school_id: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.country_id = country_id
+        self.name = name
+        self.ranking = ranking
+        self.school_id = school_id
+
+
+@dataclasses.dataclass
+class _SchoolOfTheMonthPayload_schoolsOfPreviousMonths_entry:
+    """_SchoolOfTheMonthPayload_schoolsOfPreviousMonths_entry"""
+    country_id: str
+    name: str
+    school_id: int
+    time: str
+
+    def __init__(
+        self,
+        *,
+        country_id: str,
+        name: str,
+        school_id: int,
+        time: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.country_id = country_id
+        self.name = name
+        self.school_id = school_id
+        self.time = time
+
+
+@dataclasses.dataclass
+class _SchoolProblemsSolved:
+    """_SchoolProblemsSolved"""
+    month: int
+    problems_solved: int
+    year: int
+
+    def __init__(
+        self,
+        *,
+        month: int,
+        problems_solved: int,
+        year: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.month = month
+        self.problems_solved = problems_solved
+        self.year = year
+
+
+@dataclasses.dataclass
+class _SchoolProfileDetailsPayload:
+    """_SchoolProfileDetailsPayload"""
+    coders_of_the_month: Sequence['_SchoolCoderOfTheMonth']
+    country: Optional['_SchoolProfileDetailsPayload_country']
+    monthly_solved_problems: Sequence['_SchoolProblemsSolved']
+    ranking: int
+    school_id: int
+    school_name: str
+    school_users: Sequence['_SchoolUser']
+    state_name: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        coders_of_the_month: Sequence[Dict[str, Any]],
+        monthly_solved_problems: Sequence[Dict[str, Any]],
+        ranking: int,
+        school_id: int,
+        school_name: str,
+        school_users: Sequence[Dict[str, Any]],
+        country: Optional[Dict[str, Any]] = None,
+        state_name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.coders_of_the_month = [
+            _SchoolCoderOfTheMonth(**v) for v in coders_of_the_month
+        ]
+        if country is not None:
+            self.country = _SchoolProfileDetailsPayload_country(**country)
+        else:
+            self.country = None
+        self.monthly_solved_problems = [
+            _SchoolProblemsSolved(**v) for v in monthly_solved_problems
+        ]
+        self.ranking = ranking
+        self.school_id = school_id
+        self.school_name = school_name
+        self.school_users = [_SchoolUser(**v) for v in school_users]
+        if state_name is not None:
+            self.state_name = state_name
+        else:
+            self.state_name = None
+
+
+@dataclasses.dataclass
+class _SchoolProfileDetailsPayload_country:
+    """_SchoolProfileDetailsPayload_country"""
+    id: str
+    name: str
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.id = id
+        self.name = name
+
+
+@dataclasses.dataclass
+class _SchoolRankPayload:
+    """_SchoolRankPayload"""
+    length: int
+    page: int
+    pagerItems: Sequence['_PageItem']
+    rank: Sequence['_School']
+    showHeader: bool
+    totalRows: int
+
+    def __init__(
+        self,
+        *,
+        length: int,
+        page: int,
+        pagerItems: Sequence[Dict[str, Any]],
+        rank: Sequence[Dict[str, Any]],
+        showHeader: bool,
+        totalRows: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.length = length
+        self.page = page
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.rank = [_School(**v) for v in rank]
+        self.showHeader = showHeader
+        self.totalRows = totalRows
+
+
+@dataclasses.dataclass
+class _SchoolUser:
+    """_SchoolUser"""
+    classname: str
+    created_problems: int
+    organized_contests: int
+    solved_problems: int
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        created_problems: int,
+        organized_contests: int,
+        solved_problems: int,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        self.created_problems = created_problems
+        self.organized_contests = organized_contests
+        self.solved_problems = solved_problems
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ScoreboardMergePayload:
+    """_ScoreboardMergePayload"""
+    contests: Sequence['_ContestListItem']
+
+    def __init__(
+        self,
+        *,
+        contests: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contests = [_ContestListItem(**v) for v in contests]
+
+
+@dataclasses.dataclass
+class _SelectedTag:
+    """_SelectedTag"""
+    public: bool
+    tagname: str
+
+    def __init__(
+        self,
+        *,
+        public: bool,
+        tagname: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.public = public
+        self.tagname = tagname
+
+
+@dataclasses.dataclass
+class _StatsPayload:
+    """_StatsPayload"""
+    alias: str
+    cases_stats: Optional[Dict[str, int]]
+    distribution: Optional[Dict[int, int]]
+    entity_type: str
+    max_wait_time: Optional[datetime.datetime]
+    max_wait_time_guid: Optional[str]
+    pending_runs: Sequence[str]
+    size_of_bucket: Optional[float]
+    total_points: Optional[float]
+    total_runs: int
+    verdict_counts: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        entity_type: str,
+        pending_runs: Sequence[str],
+        total_runs: int,
+        verdict_counts: Dict[str, int],
+        cases_stats: Optional[Dict[str, int]] = None,
+        distribution: Optional[Dict[int, int]] = None,
+        max_wait_time: Optional[int] = None,
+        max_wait_time_guid: Optional[str] = None,
+        size_of_bucket: Optional[float] = None,
+        total_points: Optional[float] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        if cases_stats is not None:
+            self.cases_stats = {k: v for k, v in cases_stats.items()}
+        else:
+            self.cases_stats = None
+        if distribution is not None:
+            self.distribution = {k: v for k, v in distribution.items()}
+        else:
+            self.distribution = None
+        self.entity_type = entity_type
+        if max_wait_time is not None:
+            self.max_wait_time = datetime.datetime.fromtimestamp(max_wait_time)
+        else:
+            self.max_wait_time = None
+        if max_wait_time_guid is not None:
+            self.max_wait_time_guid = max_wait_time_guid
+        else:
+            self.max_wait_time_guid = None
+        self.pending_runs = [v for v in pending_runs]
+        if size_of_bucket is not None:
+            self.size_of_bucket = size_of_bucket
+        else:
+            self.size_of_bucket = None
+        if total_points is not None:
+            self.total_points = total_points
+        else:
+            self.total_points = None
+        self.total_runs = total_runs
+        self.verdict_counts = {k: v for k, v in verdict_counts.items()}
+
+
+@dataclasses.dataclass
+class _StudentProgress:
+    """_StudentProgress"""
+    classname: str
+    country_id: Optional[str]
+    name: Optional[str]
+    points: Dict[str, Dict[str, float]]
+    progress: Dict[str, Dict[str, float]]
+    score: Dict[str, Dict[str, float]]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        points: Dict[str, Dict[str, float]],
+        progress: Dict[str, Dict[str, float]],
+        score: Dict[str, Dict[str, float]],
+        username: str,
+        country_id: Optional[str] = None,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.points = {
+            k: {k: v
+                for k, v in v.items()}
+            for k, v in points.items()
+        }
+        self.progress = {
+            k: {k: v
+                for k, v in v.items()}
+            for k, v in progress.items()
+        }
+        self.score = {
+            k: {k: v
+                for k, v in v.items()}
+            for k, v in score.items()
+        }
+        self.username = username
+
+
+@dataclasses.dataclass
+class _StudentProgressByAssignmentPayload:
+    """_StudentProgressByAssignmentPayload"""
+    assignment: str
+    course: '_CourseDetails'
+    problems: Sequence['_CourseProblem']
+    student: str
+    students: Sequence['_StudentProgress']
+
+    def __init__(
+        self,
+        *,
+        assignment: str,
+        course: Dict[str, Any],
+        problems: Sequence[Dict[str, Any]],
+        student: str,
+        students: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignment = assignment
+        self.course = _CourseDetails(**course)
+        self.problems = [_CourseProblem(**v) for v in problems]
+        self.student = student
+        self.students = [_StudentProgress(**v) for v in students]
+
+
+@dataclasses.dataclass
+class _StudentProgressPayload:
+    """_StudentProgressPayload"""
+    course: '_CourseDetails'
+    student: str
+    students: Sequence['_StudentProgress']
+
+    def __init__(
+        self,
+        *,
+        course: Dict[str, Any],
+        student: str,
+        students: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.course = _CourseDetails(**course)
+        self.student = student
+        self.students = [_StudentProgress(**v) for v in students]
+
+
+@dataclasses.dataclass
+class _StudentsProgressPayload:
+    """_StudentsProgressPayload"""
+    assignmentsProblems: Sequence['_AssignmentsProblemsPoints']
+    course: '_CourseDetails'
+    length: int
+    page: int
+    pagerItems: Sequence['_PageItem']
+    students: Sequence['_StudentProgressInCourse']
+    totalRows: int
+
+    def __init__(
+        self,
+        *,
+        assignmentsProblems: Sequence[Dict[str, Any]],
+        course: Dict[str, Any],
+        length: int,
+        page: int,
+        pagerItems: Sequence[Dict[str, Any]],
+        students: Sequence[Dict[str, Any]],
+        totalRows: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.assignmentsProblems = [
+            _AssignmentsProblemsPoints(**v) for v in assignmentsProblems
+        ]
+        self.course = _CourseDetails(**course)
+        self.length = length
+        self.page = page
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.students = [_StudentProgressInCourse(**v) for v in students]
+        self.totalRows = totalRows
+
+
+@dataclasses.dataclass
+class _SubmissionsListPayload:
+    """_SubmissionsListPayload"""
+    includeUser: bool
+    submissions: Sequence['_Submission']
+    username: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        includeUser: bool,
+        submissions: Sequence[Dict[str, Any]],
+        username: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.includeUser = includeUser
+        self.submissions = [_Submission(**v) for v in submissions]
+        if username is not None:
+            self.username = username
+        else:
+            self.username = None
+
+
+@dataclasses.dataclass
+class _SupportDetailsPayload:
+    """_SupportDetailsPayload"""
+    roleNamesWithDescription: Sequence['_UserRole']
+
+    def __init__(
+        self,
+        *,
+        roleNamesWithDescription: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.roleNamesWithDescription = [
+            _UserRole(**v) for v in roleNamesWithDescription
+        ]
+
+
+@dataclasses.dataclass
+class _Tag:
+    """_Tag"""
+    name: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+
+
+@dataclasses.dataclass
+class _TeamGroupEditPayload:
+    """_TeamGroupEditPayload"""
+    countries: Sequence['_OmegaUp_DAO_VO_Countries']
+    identities: Sequence['_Identity']
+    isOrganizer: bool
+    maxNumberOfContestants: int
+    teamGroup: '_TeamGroupEditPayload_teamGroup'
+    teamsMembers: Sequence['_TeamMember']
+
+    def __init__(
+        self,
+        *,
+        countries: Sequence[Dict[str, Any]],
+        identities: Sequence[Dict[str, Any]],
+        isOrganizer: bool,
+        maxNumberOfContestants: int,
+        teamGroup: Dict[str, Any],
+        teamsMembers: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.countries = [_OmegaUp_DAO_VO_Countries(**v) for v in countries]
+        self.identities = [_Identity(**v) for v in identities]
+        self.isOrganizer = isOrganizer
+        self.maxNumberOfContestants = maxNumberOfContestants
+        self.teamGroup = _TeamGroupEditPayload_teamGroup(**teamGroup)
+        self.teamsMembers = [_TeamMember(**v) for v in teamsMembers]
+
+
+@dataclasses.dataclass
+class _TeamGroupEditPayload_teamGroup:
+    """_TeamGroupEditPayload_teamGroup"""
+    alias: str
+    description: Optional[str]
+    name: Optional[str]
+    numberOfContestants: int
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        numberOfContestants: int,
+        description: Optional[str] = None,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.numberOfContestants = numberOfContestants
+
+
+@dataclasses.dataclass
+class _TeamGroupNewPayload:
+    """_TeamGroupNewPayload"""
+    maxNumberOfContestants: int
+    numberOfContestants: int
+
+    def __init__(
+        self,
+        *,
+        maxNumberOfContestants: int,
+        numberOfContestants: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.maxNumberOfContestants = maxNumberOfContestants
+        self.numberOfContestants = numberOfContestants
+
+
+@dataclasses.dataclass
+class _TeamsGroup:
+    """_TeamsGroup"""
+    alias: str
+    create_time: datetime.datetime
+    description: Optional[str]
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        create_time: int,
+        name: str,
+        description: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.create_time = datetime.datetime.fromtimestamp(create_time)
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        self.name = name
+
+
+@dataclasses.dataclass
+class _TeamsGroupListPayload:
+    """_TeamsGroupListPayload"""
+    teamsGroups: Sequence['_TeamsGroup']
+
+    def __init__(
+        self,
+        *,
+        teamsGroups: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.teamsGroups = [_TeamsGroup(**v) for v in teamsGroups]
+
+
+@dataclasses.dataclass
+class _UserDependent:
+    """_UserDependent"""
+    classname: str
+    name: Optional[str]
+    parent_email_verification_deadline: Optional[datetime.datetime]
+    parent_verified: Optional[bool]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        username: str,
+        name: Optional[str] = None,
+        parent_email_verification_deadline: Optional[int] = None,
+        parent_verified: Optional[bool] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if parent_email_verification_deadline is not None:
+            self.parent_email_verification_deadline = datetime.datetime.fromtimestamp(
+                parent_email_verification_deadline)
+        else:
+            self.parent_email_verification_deadline = None
+        if parent_verified is not None:
+            self.parent_verified = parent_verified
+        else:
+            self.parent_verified = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _UserDependentsPayload:
+    """_UserDependentsPayload"""
+    dependents: Sequence['_UserDependent']
+
+    def __init__(
+        self,
+        *,
+        dependents: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.dependents = [_UserDependent(**v) for v in dependents]
+
+
+@dataclasses.dataclass
+class _UserDetailsPayload:
+    """_UserDetailsPayload"""
+    emails: Sequence[str]
+    experiments: Sequence[str]
+    roleNames: Sequence['_UserRole']
+    systemExperiments: Sequence['_Experiment']
+    systemRoles: Sequence[str]
+    username: str
+    verified: bool
+
+    def __init__(
+        self,
+        *,
+        emails: Sequence[str],
+        experiments: Sequence[str],
+        roleNames: Sequence[Dict[str, Any]],
+        systemExperiments: Sequence[Dict[str, Any]],
+        systemRoles: Sequence[str],
+        username: str,
+        verified: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.emails = [v for v in emails]
+        self.experiments = [v for v in experiments]
+        self.roleNames = [_UserRole(**v) for v in roleNames]
+        self.systemExperiments = [_Experiment(**v) for v in systemExperiments]
+        self.systemRoles = [v for v in systemRoles]
+        self.username = username
+        self.verified = verified
+
+
+@dataclasses.dataclass
+class _UserInfoForProblem:
+    """_UserInfoForProblem"""
+    admin: bool
+    loggedIn: bool
+    reviewer: bool
+
+    def __init__(
+        self,
+        *,
+        admin: bool,
+        loggedIn: bool,
+        reviewer: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = admin
+        self.loggedIn = loggedIn
+        self.reviewer = reviewer
+
+
+@dataclasses.dataclass
+class _UserProfileDetailsPayload:
+    """_UserProfileDetailsPayload"""
+    countries: Sequence['_OmegaUp_DAO_VO_Countries']
+    extraProfileDetails: Optional['_ExtraProfileDetails']
+    identities: Sequence['_AssociatedIdentity']
+    profile: '_UserProfileInfo'
+    programmingLanguages: Dict[str, str]
+
+    def __init__(
+        self,
+        *,
+        countries: Sequence[Dict[str, Any]],
+        identities: Sequence[Dict[str, Any]],
+        profile: Dict[str, Any],
+        programmingLanguages: Dict[str, str],
+        extraProfileDetails: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.countries = [_OmegaUp_DAO_VO_Countries(**v) for v in countries]
+        if extraProfileDetails is not None:
+            self.extraProfileDetails = _ExtraProfileDetails(
+                **extraProfileDetails)
+        else:
+            self.extraProfileDetails = None
+        self.identities = [_AssociatedIdentity(**v) for v in identities]
+        self.profile = _UserProfileInfo(**profile)
+        self.programmingLanguages = {
+            k: v
+            for k, v in programmingLanguages.items()
+        }
+
+
+@dataclasses.dataclass
+class _UserRank:
+    """_UserRank"""
+    rank: Sequence['_UserRank_rank_entry']
+    total: int
+
+    def __init__(
+        self,
+        *,
+        rank: Sequence[Dict[str, Any]],
+        total: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.rank = [_UserRank_rank_entry(**v) for v in rank]
+        self.total = total
+
+
+@dataclasses.dataclass
+class _UserRankInfo:
+    """_UserRankInfo"""
+    author_ranking: Optional[int]
+    name: str
+    problems_solved: int
+    rank: int
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        problems_solved: int,
+        rank: int,
+        author_ranking: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if author_ranking is not None:
+            self.author_ranking = author_ranking
+        else:
+            self.author_ranking = None
+        self.name = name
+        self.problems_solved = problems_solved
+        self.rank = rank
+
+
+@dataclasses.dataclass
+class _UserRankTablePayload:
+    """_UserRankTablePayload"""
+    availableFilters: '_UserRankTablePayload_availableFilters'
+    filter: str
+    isIndex: bool
+    isLogged: bool
+    lastUpdated: Optional[datetime.datetime]
+    length: int
+    page: int
+    pagerItems: Sequence['_PageItem']
+    ranking: '_UserRank'
+
+    def __init__(
+        self,
+        *,
+        availableFilters: Dict[str, Any],
+        filter: str,
+        isIndex: bool,
+        isLogged: bool,
+        length: int,
+        page: int,
+        pagerItems: Sequence[Dict[str, Any]],
+        ranking: Dict[str, Any],
+        lastUpdated: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.availableFilters = _UserRankTablePayload_availableFilters(
+            **availableFilters)
+        self.filter = filter
+        self.isIndex = isIndex
+        self.isLogged = isLogged
+        if lastUpdated is not None:
+            self.lastUpdated = datetime.datetime.fromtimestamp(lastUpdated)
+        else:
+            self.lastUpdated = None
+        self.length = length
+        self.page = page
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.ranking = _UserRank(**ranking)
+
+
+@dataclasses.dataclass
+class _UserRankTablePayload_availableFilters:
+    """_UserRankTablePayload_availableFilters"""
+    country: Optional[str]
+    school: Optional[str]
+    state: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        country: Optional[str] = None,
+        school: Optional[str] = None,
+        state: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if country is not None:
+            self.country = country
+        else:
+            self.country = None
+        if school is not None:
+            self.school = school
+        else:
+            self.school = None
+        if state is not None:
+            self.state = state
+        else:
+            self.state = None
+
+
+@dataclasses.dataclass
+class _UserRank_rank_entry:
+    """_UserRank_rank_entry"""
+    classname: str
+    country_id: Optional[str]
+    name: Optional[str]
+    problems_solved: int
+    ranking: Optional[int]
+    score: float
+    timestamp: Optional[datetime.datetime]
+    user_id: int
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        problems_solved: int,
+        score: float,
+        user_id: int,
+        username: str,
+        country_id: Optional[str] = None,
+        name: Optional[str] = None,
+        ranking: Optional[int] = None,
+        timestamp: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.problems_solved = problems_solved
+        if ranking is not None:
+            self.ranking = ranking
+        else:
+            self.ranking = None
+        self.score = score
+        if timestamp is not None:
+            self.timestamp = datetime.datetime.fromtimestamp(timestamp)
+        else:
+            self.timestamp = None
+        self.user_id = user_id
+        self.username = username
+
+
+@dataclasses.dataclass
+class _UserRole:
+    """_UserRole"""
+    description: Optional[str]
+    name: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        description: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        self.name = name
+
+
+@dataclasses.dataclass
+class _UserRolesPayload:
+    """_UserRolesPayload"""
+    userSystemGroups: Dict[int, '_UserRolesPayload_userSystemGroups_value']
+    userSystemRoles: Dict[int, '_UserRolesPayload_userSystemRoles_value']
+    username: str
+
+    def __init__(
+        self,
+        *,
+        userSystemGroups: Dict[int, Dict[str, Any]],
+        userSystemRoles: Dict[int, Dict[str, Any]],
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.userSystemGroups = {
+            k: _UserRolesPayload_userSystemGroups_value(**v)
+            for k, v in userSystemGroups.items()
+        }
+        self.userSystemRoles = {
+            k: _UserRolesPayload_userSystemRoles_value(**v)
+            for k, v in userSystemRoles.items()
+        }
+        self.username = username
+
+
+@dataclasses.dataclass
+class _UserRolesPayload_userSystemGroups_value:
+    """_UserRolesPayload_userSystemGroups_value"""
+    name: str
+    value: bool
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        value: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.value = value
+
+
+@dataclasses.dataclass
+class _UserRolesPayload_userSystemRoles_value:
+    """_UserRolesPayload_userSystemRoles_value"""
+    name: str
+    value: bool
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        value: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.value = value
+
+
+@dataclasses.dataclass
+class _VerificationParentalTokenDetailsPayload:
+    """_VerificationParentalTokenDetailsPayload"""
+    hasParentalVerificationToken: bool
+    message: str
+
+    def __init__(
+        self,
+        *,
+        hasParentalVerificationToken: bool,
+        message: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.hasParentalVerificationToken = hasParentalVerificationToken
+        self.message = message
@@ -0,0 +1,2888 @@
+"""The omegaUp Problem API and its response types."""
+
+import dataclasses
+import datetime
+import functools
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, Mapping, Optional, Sequence, Union
+
+from omegaup import _decoder, _paginate
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import (
+    _Clarification,
+    _ListItem,
+    _PageItem,
+    _ProblemCasesContents_value,
+    _ProblemStatement,
+    _ProblemVersion,
+    _Run,
+    _RunDetailsGroup,
+    _RunMetadata,
+    _SubmissionFeedback,
+)
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _BestSolvers:
+    """_BestSolvers"""
+    classname: str
+    language: str
+    memory: float
+    runtime: float
+    time: datetime.datetime
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        language: str,
+        memory: float,
+        runtime: float,
+        time: int,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        self.language = language
+        self.memory = memory
+        self.runtime = runtime
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _InteractiveSettingsDistrib:
+    """_InteractiveSettingsDistrib"""
+    idl: str
+    language: str
+    main_source: str
+    module_name: str
+    templates: Dict[str, str]
+
+    def __init__(
+        self,
+        *,
+        idl: str,
+        language: str,
+        main_source: str,
+        module_name: str,
+        templates: Dict[str, str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.idl = idl
+        self.language = language
+        self.main_source = main_source
+        self.module_name = module_name
+        self.templates = {k: v for k, v in templates.items()}
+
+
+@dataclasses.dataclass
+class _LimitsSettings:
+    """_LimitsSettings"""
+    ExtraWallTime: str
+    MemoryLimit: Union[int, str]
+    OutputLimit: Union[int, str]
+    OverallWallTimeLimit: str
+    TimeLimit: str
+
+    def __init__(
+        self,
+        *,
+        ExtraWallTime: str,
+        MemoryLimit: Union[int, str],
+        OutputLimit: Union[int, str],
+        OverallWallTimeLimit: str,
+        TimeLimit: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.ExtraWallTime = ExtraWallTime
+        self.MemoryLimit = MemoryLimit
+        self.OutputLimit = OutputLimit
+        self.OverallWallTimeLimit = OverallWallTimeLimit
+        self.TimeLimit = TimeLimit
+
+
+@dataclasses.dataclass
+class _NominationStatus:
+    """_NominationStatus"""
+    alreadyReviewed: bool
+    canNominateProblem: bool
+    dismissed: bool
+    dismissedBeforeAc: bool
+    language: str
+    nominated: bool
+    nominatedBeforeAc: bool
+    solved: bool
+    tried: bool
+
+    def __init__(
+        self,
+        *,
+        alreadyReviewed: bool,
+        canNominateProblem: bool,
+        dismissed: bool,
+        dismissedBeforeAc: bool,
+        language: str,
+        nominated: bool,
+        nominatedBeforeAc: bool,
+        solved: bool,
+        tried: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alreadyReviewed = alreadyReviewed
+        self.canNominateProblem = canNominateProblem
+        self.dismissed = dismissed
+        self.dismissedBeforeAc = dismissedBeforeAc
+        self.language = language
+        self.nominated = nominated
+        self.nominatedBeforeAc = nominatedBeforeAc
+        self.solved = solved
+        self.tried = tried
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiAddTag:
+    """_OmegaUp_Controllers_Problem__apiAddTag"""
+    name: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiAdminList:
+    """_OmegaUp_Controllers_Problem__apiAdminList"""
+    pagerItems: Sequence['_PageItem']
+    problems: Sequence['_ProblemListItem']
+
+    def __init__(
+        self,
+        *,
+        pagerItems: Sequence[Dict[str, Any]],
+        problems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.problems = [_ProblemListItem(**v) for v in problems]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiAdmins:
+    """_OmegaUp_Controllers_Problem__apiAdmins"""
+    admins: Sequence['_ProblemAdmin']
+    group_admins: Sequence['_ProblemGroupAdmin']
+
+    def __init__(
+        self,
+        *,
+        admins: Sequence[Dict[str, Any]],
+        group_admins: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admins = [_ProblemAdmin(**v) for v in admins]
+        self.group_admins = [_ProblemGroupAdmin(**v) for v in group_admins]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiBestScore:
+    """_OmegaUp_Controllers_Problem__apiBestScore"""
+    score: float
+
+    def __init__(
+        self,
+        *,
+        score: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.score = score
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiClarifications:
+    """_OmegaUp_Controllers_Problem__apiClarifications"""
+    clarifications: Sequence['_Clarification']
+
+    def __init__(
+        self,
+        *,
+        clarifications: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.clarifications = [_Clarification(**v) for v in clarifications]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiList:
+    """_OmegaUp_Controllers_Problem__apiList"""
+    results: Sequence['_ProblemListItem']
+    total: int
+
+    def __init__(
+        self,
+        *,
+        results: Sequence[Dict[str, Any]],
+        total: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.results = [_ProblemListItem(**v) for v in results]
+        self.total = total
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiListForTypeahead:
+    """_OmegaUp_Controllers_Problem__apiListForTypeahead"""
+    results: Sequence['_ListItem']
+
+    def __init__(
+        self,
+        *,
+        results: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.results = [_ListItem(**v) for v in results]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiMyList:
+    """_OmegaUp_Controllers_Problem__apiMyList"""
+    pagerItems: Sequence['_PageItem']
+    problems: Sequence['_ProblemListItem']
+
+    def __init__(
+        self,
+        *,
+        pagerItems: Sequence[Dict[str, Any]],
+        problems: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.pagerItems = [_PageItem(**v) for v in pagerItems]
+        self.problems = [_ProblemListItem(**v) for v in problems]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiRandomKarelProblem:
+    """_OmegaUp_Controllers_Problem__apiRandomKarelProblem"""
+    alias: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiRandomLanguageProblem:
+    """_OmegaUp_Controllers_Problem__apiRandomLanguageProblem"""
+    alias: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiRuns:
+    """_OmegaUp_Controllers_Problem__apiRuns"""
+    runs: Sequence['_Run']
+    totalRuns: int
+
+    def __init__(
+        self,
+        *,
+        runs: Sequence[Dict[str, Any]],
+        totalRuns: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.runs = [_Run(**v) for v in runs]
+        self.totalRuns = totalRuns
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiRunsDiff:
+    """_OmegaUp_Controllers_Problem__apiRunsDiff"""
+    diff: Sequence['_RunsDiff']
+
+    def __init__(
+        self,
+        *,
+        diff: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.diff = [_RunsDiff(**v) for v in diff]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiSolution:
+    """_OmegaUp_Controllers_Problem__apiSolution"""
+    solution: Optional['_ProblemStatement']
+
+    def __init__(
+        self,
+        *,
+        solution: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if solution is not None:
+            self.solution = _ProblemStatement(**solution)
+        else:
+            self.solution = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiStats:
+    """_OmegaUp_Controllers_Problem__apiStats"""
+    cases_stats: Dict[str, int]
+    pending_runs: Sequence[str]
+    total_runs: int
+    verdict_counts: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        cases_stats: Dict[str, int],
+        pending_runs: Sequence[str],
+        total_runs: int,
+        verdict_counts: Dict[str, int],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.cases_stats = {k: v for k, v in cases_stats.items()}
+        self.pending_runs = [v for v in pending_runs]
+        self.total_runs = total_runs
+        self.verdict_counts = {k: v for k, v in verdict_counts.items()}
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiTags:
+    """_OmegaUp_Controllers_Problem__apiTags"""
+    tags: Sequence['_OmegaUp_Controllers_Problem__apiTags_tags_entry']
+
+    def __init__(
+        self,
+        *,
+        tags: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.tags = [
+            _OmegaUp_Controllers_Problem__apiTags_tags_entry(**v) for v in tags
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiTags_tags_entry:
+    """_OmegaUp_Controllers_Problem__apiTags_tags_entry"""
+    name: str
+    public: bool
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        public: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.public = public
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiUpdate:
+    """_OmegaUp_Controllers_Problem__apiUpdate"""
+    rejudged: bool
+
+    def __init__(
+        self,
+        *,
+        rejudged: bool,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.rejudged = rejudged
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problem__apiVersions:
+    """_OmegaUp_Controllers_Problem__apiVersions"""
+    log: Sequence['_ProblemVersion']
+    published: str
+
+    def __init__(
+        self,
+        *,
+        log: Sequence[Dict[str, Any]],
+        published: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.log = [_ProblemVersion(**v) for v in log]
+        self.published = published
+
+
+@dataclasses.dataclass
+class _ProblemAdmin:
+    """_ProblemAdmin"""
+    role: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        role: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.role = role
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ProblemDetails:
+    """_ProblemDetails"""
+    accepted: int
+    accepts_submissions: bool
+    admin: Optional[bool]
+    alias: str
+    allow_user_add_tags: bool
+    commit: str
+    creation_date: datetime.datetime
+    difficulty: Optional[float]
+    email_clarifications: bool
+    input_limit: int
+    karel_problem: bool
+    languages: Sequence[str]
+    letter: Optional[str]
+    limits: '_SettingLimits'
+    nextSubmissionTimestamp: Optional[datetime.datetime]
+    nominationStatus: '_NominationStatus'
+    order: str
+    points: float
+    preferred_language: Optional[str]
+    problem_id: int
+    problemsetter: Optional['_ProblemsetterInfo']
+    quality_seal: bool
+    runs: Optional[Sequence['_RunWithDetails']]
+    score: float
+    settings: '_ProblemSettingsDistrib'
+    show_diff: str
+    solvers: Optional[Sequence['_BestSolvers']]
+    source: Optional[str]
+    statement: '_ProblemStatement'
+    submissions: int
+    title: str
+    version: str
+    visibility: int
+    visits: int
+
+    def __init__(
+        self,
+        *,
+        accepted: int,
+        accepts_submissions: bool,
+        alias: str,
+        allow_user_add_tags: bool,
+        commit: str,
+        creation_date: int,
+        email_clarifications: bool,
+        input_limit: int,
+        karel_problem: bool,
+        languages: Sequence[str],
+        limits: Dict[str, Any],
+        nominationStatus: Dict[str, Any],
+        order: str,
+        points: float,
+        problem_id: int,
+        quality_seal: bool,
+        score: float,
+        settings: Dict[str, Any],
+        show_diff: str,
+        statement: Dict[str, Any],
+        submissions: int,
+        title: str,
+        version: str,
+        visibility: int,
+        visits: int,
+        admin: Optional[bool] = None,
+        difficulty: Optional[float] = None,
+        letter: Optional[str] = None,
+        nextSubmissionTimestamp: Optional[int] = None,
+        preferred_language: Optional[str] = None,
+        problemsetter: Optional[Dict[str, Any]] = None,
+        runs: Optional[Sequence[Dict[str, Any]]] = None,
+        solvers: Optional[Sequence[Dict[str, Any]]] = None,
+        source: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accepted = accepted
+        self.accepts_submissions = accepts_submissions
+        if admin is not None:
+            self.admin = admin
+        else:
+            self.admin = None
+        self.alias = alias
+        self.allow_user_add_tags = allow_user_add_tags
+        self.commit = commit
+        self.creation_date = datetime.datetime.fromtimestamp(creation_date)
+        if difficulty is not None:
+            self.difficulty = difficulty
+        else:
+            self.difficulty = None
+        self.email_clarifications = email_clarifications
+        self.input_limit = input_limit
+        self.karel_problem = karel_problem
+        self.languages = [v for v in languages]
+        if letter is not None:
+            self.letter = letter
+        else:
+            self.letter = None
+        self.limits = _SettingLimits(**limits)
+        if nextSubmissionTimestamp is not None:
+            self.nextSubmissionTimestamp = datetime.datetime.fromtimestamp(
+                nextSubmissionTimestamp)
+        else:
+            self.nextSubmissionTimestamp = None
+        self.nominationStatus = _NominationStatus(**nominationStatus)
+        self.order = order
+        self.points = points
+        if preferred_language is not None:
+            self.preferred_language = preferred_language
+        else:
+            self.preferred_language = None
+        self.problem_id = problem_id
+        if problemsetter is not None:
+            self.problemsetter = _ProblemsetterInfo(**problemsetter)
+        else:
+            self.problemsetter = None
+        self.quality_seal = quality_seal
+        if runs is not None:
+            self.runs = [_RunWithDetails(**v) for v in runs]
+        else:
+            self.runs = None
+        self.score = score
+        self.settings = _ProblemSettingsDistrib(**settings)
+        self.show_diff = show_diff
+        if solvers is not None:
+            self.solvers = [_BestSolvers(**v) for v in solvers]
+        else:
+            self.solvers = None
+        if source is not None:
+            self.source = source
+        else:
+            self.source = None
+        self.statement = _ProblemStatement(**statement)
+        self.submissions = submissions
+        self.title = title
+        self.version = version
+        self.visibility = visibility
+        self.visits = visits
+
+
+@dataclasses.dataclass
+class _ProblemGroupAdmin:
+    """_ProblemGroupAdmin"""
+    alias: str
+    name: str
+    role: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        name: str,
+        role: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.name = name
+        self.role = role
+
+
+@dataclasses.dataclass
+class _ProblemListItem:
+    """_ProblemListItem"""
+    accepted: int
+    alias: str
+    can_be_removed: Optional[bool]
+    difficulty: Optional[float]
+    difficulty_histogram: Sequence[int]
+    points: float
+    problem_id: int
+    quality: Optional[float]
+    quality_histogram: Sequence[int]
+    quality_seal: bool
+    ratio: float
+    score: float
+    submissions: int
+    tags: Sequence['_ProblemListItem_tags_entry']
+    title: str
+    visibility: int
+
+    def __init__(
+        self,
+        *,
+        accepted: int,
+        alias: str,
+        difficulty_histogram: Sequence[int],
+        points: float,
+        problem_id: int,
+        quality_histogram: Sequence[int],
+        quality_seal: bool,
+        ratio: float,
+        score: float,
+        submissions: int,
+        tags: Sequence[Dict[str, Any]],
+        title: str,
+        visibility: int,
+        can_be_removed: Optional[bool] = None,
+        difficulty: Optional[float] = None,
+        quality: Optional[float] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accepted = accepted
+        self.alias = alias
+        if can_be_removed is not None:
+            self.can_be_removed = can_be_removed
+        else:
+            self.can_be_removed = None
+        if difficulty is not None:
+            self.difficulty = difficulty
+        else:
+            self.difficulty = None
+        self.difficulty_histogram = [v for v in difficulty_histogram]
+        self.points = points
+        self.problem_id = problem_id
+        if quality is not None:
+            self.quality = quality
+        else:
+            self.quality = None
+        self.quality_histogram = [v for v in quality_histogram]
+        self.quality_seal = quality_seal
+        self.ratio = ratio
+        self.score = score
+        self.submissions = submissions
+        self.tags = [_ProblemListItem_tags_entry(**v) for v in tags]
+        self.title = title
+        self.visibility = visibility
+
+
+@dataclasses.dataclass
+class _ProblemListItem_tags_entry:
+    """_ProblemListItem_tags_entry"""
+    name: str
+    source: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        source: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.source = source
+
+
+@dataclasses.dataclass
+class _ProblemSettingsDistrib:
+    """_ProblemSettingsDistrib"""
+    cases: Dict[str, '_ProblemSettingsDistrib_cases_value']
+    interactive: Optional['_InteractiveSettingsDistrib']
+    limits: '_LimitsSettings'
+    validator: '_ProblemSettingsDistrib_validator'
+
+    def __init__(
+        self,
+        *,
+        cases: Dict[str, Dict[str, Any]],
+        limits: Dict[str, Any],
+        validator: Dict[str, Any],
+        interactive: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.cases = {
+            k: _ProblemSettingsDistrib_cases_value(**v)
+            for k, v in cases.items()
+        }
+        if interactive is not None:
+            self.interactive = _InteractiveSettingsDistrib(**interactive)
+        else:
+            self.interactive = None
+        self.limits = _LimitsSettings(**limits)
+        self.validator = _ProblemSettingsDistrib_validator(**validator)
+
+
+@dataclasses.dataclass
+class _ProblemSettingsDistrib_cases_value:
+    """_ProblemSettingsDistrib_cases_value"""
+    in_: str
+    out: str
+    weight: Optional[float]
+
+    def __init__(
+        self,
+        *,
+        out: str,
+        weight: Optional[float] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.in_ = _kwargs['in']
+        self.out = out
+        if weight is not None:
+            self.weight = weight
+        else:
+            self.weight = None
+
+
+@dataclasses.dataclass
+class _ProblemSettingsDistrib_validator:
+    """_ProblemSettingsDistrib_validator"""
+    custom_validator: Optional[
+        '_ProblemSettingsDistrib_validator_custom_validator']
+    group_score_policy: Optional[str]
+    name: str
+    tolerance: Optional[float]
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        custom_validator: Optional[Dict[str, Any]] = None,
+        group_score_policy: Optional[str] = None,
+        tolerance: Optional[float] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if custom_validator is not None:
+            self.custom_validator = _ProblemSettingsDistrib_validator_custom_validator(
+                **custom_validator)
+        else:
+            self.custom_validator = None
+        if group_score_policy is not None:
+            self.group_score_policy = group_score_policy
+        else:
+            self.group_score_policy = None
+        self.name = name
+        if tolerance is not None:
+            self.tolerance = tolerance
+        else:
+            self.tolerance = None
+
+
+@dataclasses.dataclass
+class _ProblemSettingsDistrib_validator_custom_validator:
+    """_ProblemSettingsDistrib_validator_custom_validator"""
+    language: str
+    limits: Optional['_LimitsSettings']
+    source: str
+
+    def __init__(
+        self,
+        *,
+        language: str,
+        source: str,
+        limits: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.language = language
+        if limits is not None:
+            self.limits = _LimitsSettings(**limits)
+        else:
+            self.limits = None
+        self.source = source
+
+
+@dataclasses.dataclass
+class _ProblemsetterInfo:
+    """_ProblemsetterInfo"""
+    classname: str
+    creation_date: Optional[datetime.datetime]
+    name: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        name: str,
+        username: str,
+        creation_date: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        if creation_date is not None:
+            self.creation_date = datetime.datetime.fromtimestamp(creation_date)
+        else:
+            self.creation_date = None
+        self.name = name
+        self.username = username
+
+
+@dataclasses.dataclass
+class _RunDetailsV2:
+    """_RunDetailsV2"""
+    admin: bool
+    cases: Dict[str, '_ProblemCasesContents_value']
+    compile_error: Optional[str]
+    details: Optional['_RunDetailsV2_details']
+    feedback: Optional['_SubmissionFeedback']
+    judged_by: Optional[str]
+    logs: Optional[str]
+    show_diff: str
+    source: Optional[str]
+    source_link: Optional[bool]
+    source_name: Optional[str]
+    source_url: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        admin: bool,
+        cases: Dict[str, Dict[str, Any]],
+        show_diff: str,
+        compile_error: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        feedback: Optional[Dict[str, Any]] = None,
+        judged_by: Optional[str] = None,
+        logs: Optional[str] = None,
+        source: Optional[str] = None,
+        source_link: Optional[bool] = None,
+        source_name: Optional[str] = None,
+        source_url: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = admin
+        self.cases = {
+            k: _ProblemCasesContents_value(**v)
+            for k, v in cases.items()
+        }
+        if compile_error is not None:
+            self.compile_error = compile_error
+        else:
+            self.compile_error = None
+        if details is not None:
+            self.details = _RunDetailsV2_details(**details)
+        else:
+            self.details = None
+        if feedback is not None:
+            self.feedback = _SubmissionFeedback(**feedback)
+        else:
+            self.feedback = None
+        if judged_by is not None:
+            self.judged_by = judged_by
+        else:
+            self.judged_by = None
+        if logs is not None:
+            self.logs = logs
+        else:
+            self.logs = None
+        self.show_diff = show_diff
+        if source is not None:
+            self.source = source
+        else:
+            self.source = None
+        if source_link is not None:
+            self.source_link = source_link
+        else:
+            self.source_link = None
+        if source_name is not None:
+            self.source_name = source_name
+        else:
+            self.source_name = None
+        if source_url is not None:
+            self.source_url = source_url
+        else:
+            self.source_url = None
+
+
+@dataclasses.dataclass
+class _RunDetailsV2_details:
+    """_RunDetailsV2_details"""
+    compile_meta: Optional[Dict[str, '_RunMetadata']]
+    groups: Optional[Sequence['_RunDetailsGroup']]
+    judged_by: str
+    max_score: Optional[float]
+    memory: Optional[float]
+    score: float
+    time: Optional[float]
+    verdict: str
+    wall_time: Optional[float]
+
+    def __init__(
+        self,
+        *,
+        judged_by: str,
+        score: float,
+        verdict: str,
+        compile_meta: Optional[Dict[str, Dict[str, Any]]] = None,
+        groups: Optional[Sequence[Dict[str, Any]]] = None,
+        max_score: Optional[float] = None,
+        memory: Optional[float] = None,
+        time: Optional[float] = None,
+        wall_time: Optional[float] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if compile_meta is not None:
+            self.compile_meta = {
+                k: _RunMetadata(**v)
+                for k, v in compile_meta.items()
+            }
+        else:
+            self.compile_meta = None
+        if groups is not None:
+            self.groups = [_RunDetailsGroup(**v) for v in groups]
+        else:
+            self.groups = None
+        self.judged_by = judged_by
+        if max_score is not None:
+            self.max_score = max_score
+        else:
+            self.max_score = None
+        if memory is not None:
+            self.memory = memory
+        else:
+            self.memory = None
+        self.score = score
+        if time is not None:
+            self.time = time
+        else:
+            self.time = None
+        self.verdict = verdict
+        if wall_time is not None:
+            self.wall_time = wall_time
+        else:
+            self.wall_time = None
+
+
+@dataclasses.dataclass
+class _RunWithDetails:
+    """_RunWithDetails"""
+    alias: str
+    classname: str
+    contest_alias: Optional[str]
+    contest_score: Optional[float]
+    country: str
+    details: Optional['_RunDetailsV2']
+    execution: Optional[str]
+    guid: str
+    language: str
+    memory: int
+    output: Optional[str]
+    penalty: int
+    runtime: int
+    score: float
+    score_by_group: Optional[Dict[str, Optional[float]]]
+    status: str
+    status_memory: Optional[str]
+    status_runtime: Optional[str]
+    submit_delay: int
+    time: datetime.datetime
+    type: Optional[str]
+    username: str
+    verdict: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        classname: str,
+        country: str,
+        guid: str,
+        language: str,
+        memory: int,
+        penalty: int,
+        runtime: int,
+        score: float,
+        status: str,
+        submit_delay: int,
+        time: int,
+        username: str,
+        verdict: str,
+        contest_alias: Optional[str] = None,
+        contest_score: Optional[float] = None,
+        details: Optional[Dict[str, Any]] = None,
+        execution: Optional[str] = None,
+        output: Optional[str] = None,
+        score_by_group: Optional[Dict[str, Optional[float]]] = None,
+        status_memory: Optional[str] = None,
+        status_runtime: Optional[str] = None,
+        type: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.classname = classname
+        if contest_alias is not None:
+            self.contest_alias = contest_alias
+        else:
+            self.contest_alias = None
+        if contest_score is not None:
+            self.contest_score = contest_score
+        else:
+            self.contest_score = None
+        self.country = country
+        if details is not None:
+            self.details = _RunDetailsV2(**details)
+        else:
+            self.details = None
+        if execution is not None:
+            self.execution = execution
+        else:
+            self.execution = None
+        self.guid = guid
+        self.language = language
+        self.memory = memory
+        if output is not None:
+            self.output = output
+        else:
+            self.output = None
+        self.penalty = penalty
+        self.runtime = runtime
+        self.score = score
+        if score_by_group is not None:
+            self.score_by_group = {
+                k: v if v is not None else None
+                for k, v in score_by_group.items()
+            }
+        else:
+            self.score_by_group = None
+        self.status = status
+        if status_memory is not None:
+            self.status_memory = status_memory
+        else:
+            self.status_memory = None
+        if status_runtime is not None:
+            self.status_runtime = status_runtime
+        else:
+            self.status_runtime = None
+        self.submit_delay = submit_delay
+        self.time = datetime.datetime.fromtimestamp(time)
+        if type is not None:
+            self.type = type
+        else:
+            self.type = None
+        self.username = username
+        self.verdict = verdict
+
+
+@dataclasses.dataclass
+class _RunsDiff:
+    """_RunsDiff"""
+    guid: str
+    new_score: Optional[float]
+    new_status: Optional[str]
+    new_verdict: Optional[str]
+    old_score: Optional[float]
+    old_status: Optional[str]
+    old_verdict: Optional[str]
+    problemset_id: Optional[int]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        guid: str,
+        username: str,
+        new_score: Optional[float] = None,
+        new_status: Optional[str] = None,
+        new_verdict: Optional[str] = None,
+        old_score: Optional[float] = None,
+        old_status: Optional[str] = None,
+        old_verdict: Optional[str] = None,
+        problemset_id: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.guid = guid
+        if new_score is not None:
+            self.new_score = new_score
+        else:
+            self.new_score = None
+        if new_status is not None:
+            self.new_status = new_status
+        else:
+            self.new_status = None
+        if new_verdict is not None:
+            self.new_verdict = new_verdict
+        else:
+            self.new_verdict = None
+        if old_score is not None:
+            self.old_score = old_score
+        else:
+            self.old_score = None
+        if old_status is not None:
+            self.old_status = old_status
+        else:
+            self.old_status = None
+        if old_verdict is not None:
+            self.old_verdict = old_verdict
+        else:
+            self.old_verdict = None
+        if problemset_id is not None:
+            self.problemset_id = problemset_id
+        else:
+            self.problemset_id = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _SettingLimits:
+    """_SettingLimits"""
+    input_limit: str
+    memory_limit: str
+    overall_wall_time_limit: str
+    time_limit: str
+
+    def __init__(
+        self,
+        *,
+        input_limit: str,
+        memory_limit: str,
+        overall_wall_time_limit: str,
+        time_limit: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.input_limit = input_limit
+        self.memory_limit = memory_limit
+        self.overall_wall_time_limit = overall_wall_time_limit
+        self.time_limit = time_limit
+
+
+ProblemAddTagResponse = _OmegaUp_Controllers_Problem__apiAddTag
+"""The return type of the ProblemAddTag API."""
+
+ProblemAdminsResponse = _OmegaUp_Controllers_Problem__apiAdmins
+"""The return type of the ProblemAdmins API."""
+
+ProblemTagsResponse = _OmegaUp_Controllers_Problem__apiTags
+"""The return type of the ProblemTags API."""
+
+ProblemUpdateResponse = _OmegaUp_Controllers_Problem__apiUpdate
+"""The return type of the ProblemUpdate API."""
+
+ProblemDetailsResponse = _ProblemDetails
+"""The return type of the ProblemDetails API."""
+
+ProblemSolutionResponse = _OmegaUp_Controllers_Problem__apiSolution
+"""The return type of the ProblemSolution API."""
+
+ProblemVersionsResponse = _OmegaUp_Controllers_Problem__apiVersions
+"""The return type of the ProblemVersions API."""
+
+ProblemRunsDiffResponse = _OmegaUp_Controllers_Problem__apiRunsDiff
+"""The return type of the ProblemRunsDiff API."""
+
+ProblemRunsResponse = _OmegaUp_Controllers_Problem__apiRuns
+"""The return type of the ProblemRuns API."""
+
+ProblemClarificationsResponse = _OmegaUp_Controllers_Problem__apiClarifications
+"""The return type of the ProblemClarifications API."""
+
+ProblemStatsResponse = _OmegaUp_Controllers_Problem__apiStats
+"""The return type of the ProblemStats API."""
+
+ProblemListForTypeaheadResponse = _OmegaUp_Controllers_Problem__apiListForTypeahead
+"""The return type of the ProblemListForTypeahead API."""
+
+ProblemListResponse = _OmegaUp_Controllers_Problem__apiList
+"""The return type of the ProblemList API."""
+
+ProblemAdminListResponse = _OmegaUp_Controllers_Problem__apiAdminList
+"""The return type of the ProblemAdminList API."""
+
+ProblemMyListResponse = _OmegaUp_Controllers_Problem__apiMyList
+"""The return type of the ProblemMyList API."""
+
+ProblemBestScoreResponse = _OmegaUp_Controllers_Problem__apiBestScore
+"""The return type of the ProblemBestScore API."""
+
+ProblemRandomLanguageProblemResponse = _OmegaUp_Controllers_Problem__apiRandomLanguageProblem
+"""The return type of the ProblemRandomLanguageProblem API."""
+
+ProblemRandomKarelProblemResponse = _OmegaUp_Controllers_Problem__apiRandomKarelProblem
+"""The return type of the ProblemRandomKarelProblem API."""
+
+
+class Problem:
+    r"""ProblemsController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def create(
+            self,
+            *,
+            problem_alias: str,
+            allow_user_add_tags: Optional[bool] = None,
+            email_clarifications: Optional[bool] = None,
+            extra_wall_time: Optional[int] = None,
+            group_score_policy: Optional[str] = None,
+            input_limit: Optional[int] = None,
+            languages: Optional[str] = None,
+            memory_limit: Optional[int] = None,
+            output_limit: Optional[int] = None,
+            overall_wall_time_limit: Optional[int] = None,
+            problem_level: Optional[str] = None,
+            selected_tags: Optional[str] = None,
+            show_diff: Optional[str] = None,
+            source: Optional[str] = None,
+            time_limit: Optional[int] = None,
+            title: Optional[str] = None,
+            update_published: Optional[str] = None,
+            validator: Optional[str] = None,
+            validator_time_limit: Optional[int] = None,
+            visibility: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Create a new problem
+
+        Args:
+            problem_alias:
+            allow_user_add_tags:
+            email_clarifications:
+            extra_wall_time:
+            group_score_policy:
+            input_limit:
+            languages:
+            memory_limit:
+            output_limit:
+            overall_wall_time_limit:
+            problem_level:
+            selected_tags:
+            show_diff:
+            source:
+            time_limit:
+            title:
+            update_published:
+            validator:
+            validator_time_limit:
+            visibility:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        if allow_user_add_tags is not None:
+            parameters['allow_user_add_tags'] = str(allow_user_add_tags)
+        if email_clarifications is not None:
+            parameters['email_clarifications'] = str(email_clarifications)
+        if extra_wall_time is not None:
+            parameters['extra_wall_time'] = str(extra_wall_time)
+        if group_score_policy is not None:
+            parameters['group_score_policy'] = group_score_policy
+        if input_limit is not None:
+            parameters['input_limit'] = str(input_limit)
+        if languages is not None:
+            parameters['languages'] = languages
+        if memory_limit is not None:
+            parameters['memory_limit'] = str(memory_limit)
+        if output_limit is not None:
+            parameters['output_limit'] = str(output_limit)
+        if overall_wall_time_limit is not None:
+            parameters['overall_wall_time_limit'] = str(
+                overall_wall_time_limit)
+        if problem_level is not None:
+            parameters['problem_level'] = problem_level
+        if selected_tags is not None:
+            parameters['selected_tags'] = selected_tags
+        if show_diff is not None:
+            parameters['show_diff'] = show_diff
+        if source is not None:
+            parameters['source'] = source
+        if time_limit is not None:
+            parameters['time_limit'] = str(time_limit)
+        if title is not None:
+            parameters['title'] = title
+        if update_published is not None:
+            parameters['update_published'] = update_published
+        if validator is not None:
+            parameters['validator'] = validator
+        if validator_time_limit is not None:
+            parameters['validator_time_limit'] = str(validator_time_limit)
+        if visibility is not None:
+            parameters['visibility'] = visibility
+        self._client.query('/api/problem/create/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addAdmin(
+            self,
+            *,
+            problem_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds an admin to a problem
+
+        Args:
+            problem_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/problem/addAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addGroupAdmin(
+            self,
+            *,
+            group: str,
+            problem_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Adds a group admin to a problem
+
+        Args:
+            group:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group': group,
+            'problem_alias': problem_alias,
+        }
+        self._client.query('/api/problem/addGroupAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def updateProblemLevel(
+            self,
+            *,
+            problem_alias: str,
+            level_tag: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Updates the problem level of a problem
+
+        Args:
+            problem_alias:
+            level_tag:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        if level_tag is not None:
+            parameters['level_tag'] = level_tag
+        self._client.query('/api/problem/updateProblemLevel/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addTag(
+        self,
+        *,
+        name: str,
+        problem_alias: str,
+        public: Optional[bool] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemAddTagResponse:
+        r"""Adds a tag to a problem
+
+        Args:
+            name:
+            problem_alias:
+            public:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'name': name,
+            'problem_alias': problem_alias,
+        }
+        if public is not None:
+            parameters['public'] = str(public)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiAddTag,
+            self._client.query('/api/problem/addTag/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def removeAdmin(
+            self,
+            *,
+            problem_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes an admin from a problem
+
+        Args:
+            problem_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/problem/removeAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeGroupAdmin(
+            self,
+            *,
+            group: str,
+            problem_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a group admin from a problem
+
+        Args:
+            group:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'group': group,
+            'problem_alias': problem_alias,
+        }
+        self._client.query('/api/problem/removeGroupAdmin/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def removeTag(
+            self,
+            *,
+            name: str,
+            problem_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a tag from a contest
+
+        Args:
+            name:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'name': name,
+            'problem_alias': problem_alias,
+        }
+        self._client.query('/api/problem/removeTag/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def delete(
+            self,
+            *,
+            problem_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Removes a problem whether user is the creator
+
+        Args:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        self._client.query('/api/problem/delete/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def admins(
+        self,
+        *,
+        problem_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemAdminsResponse:
+        r"""Returns all problem administrators
+
+        Args:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiAdmins,
+            self._client.query('/api/problem/admins/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def tags(
+        self,
+        *,
+        problem_alias: str,
+        include_voted: Optional[Any] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemTagsResponse:
+        r"""Returns every tag associated to a given problem.
+
+        Args:
+            problem_alias:
+            include_voted:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        if include_voted is not None:
+            parameters['include_voted'] = str(include_voted)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiTags,
+            self._client.query('/api/problem/tags/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def rejudge(
+            self,
+            *,
+            problem_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Rejudge problem
+
+        Args:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        self._client.query('/api/problem/rejudge/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def update(
+        self,
+        *,
+        message: str,
+        problem_alias: str,
+        redirect: Union[bool, str],
+        allow_user_add_tags: Optional[bool] = None,
+        email_clarifications: Optional[bool] = None,
+        extra_wall_time: Optional[int] = None,
+        group_score_policy: Optional[str] = None,
+        input_limit: Optional[int] = None,
+        languages: Optional[str] = None,
+        memory_limit: Optional[int] = None,
+        output_limit: Optional[int] = None,
+        overall_wall_time_limit: Optional[int] = None,
+        problem_level: Optional[str] = None,
+        selected_tags: Optional[str] = None,
+        show_diff: Optional[str] = None,
+        source: Optional[str] = None,
+        time_limit: Optional[int] = None,
+        title: Optional[str] = None,
+        update_published: Optional[str] = None,
+        validator: Optional[str] = None,
+        validator_time_limit: Optional[int] = None,
+        visibility: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemUpdateResponse:
+        r"""Update problem contents
+
+        Args:
+            message:
+            problem_alias:
+            redirect:
+            allow_user_add_tags:
+            email_clarifications:
+            extra_wall_time:
+            group_score_policy:
+            input_limit:
+            languages:
+            memory_limit:
+            output_limit:
+            overall_wall_time_limit:
+            problem_level:
+            selected_tags:
+            show_diff:
+            source:
+            time_limit:
+            title:
+            update_published:
+            validator:
+            validator_time_limit:
+            visibility:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'message': message,
+            'problem_alias': problem_alias,
+            'redirect': str(redirect),
+        }
+        if allow_user_add_tags is not None:
+            parameters['allow_user_add_tags'] = str(allow_user_add_tags)
+        if email_clarifications is not None:
+            parameters['email_clarifications'] = str(email_clarifications)
+        if extra_wall_time is not None:
+            parameters['extra_wall_time'] = str(extra_wall_time)
+        if group_score_policy is not None:
+            parameters['group_score_policy'] = group_score_policy
+        if input_limit is not None:
+            parameters['input_limit'] = str(input_limit)
+        if languages is not None:
+            parameters['languages'] = languages
+        if memory_limit is not None:
+            parameters['memory_limit'] = str(memory_limit)
+        if output_limit is not None:
+            parameters['output_limit'] = str(output_limit)
+        if overall_wall_time_limit is not None:
+            parameters['overall_wall_time_limit'] = str(
+                overall_wall_time_limit)
+        if problem_level is not None:
+            parameters['problem_level'] = problem_level
+        if selected_tags is not None:
+            parameters['selected_tags'] = selected_tags
+        if show_diff is not None:
+            parameters['show_diff'] = show_diff
+        if source is not None:
+            parameters['source'] = source
+        if time_limit is not None:
+            parameters['time_limit'] = str(time_limit)
+        if title is not None:
+            parameters['title'] = title
+        if update_published is not None:
+            parameters['update_published'] = update_published
+        if validator is not None:
+            parameters['validator'] = validator
+        if validator_time_limit is not None:
+            parameters['validator_time_limit'] = str(validator_time_limit)
+        if visibility is not None:
+            parameters['visibility'] = visibility
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiUpdate,
+            self._client.query('/api/problem/update/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def updateStatement(
+            self,
+            *,
+            lang: str,
+            message: str,
+            problem_alias: str,
+            statement: str,
+            allow_user_add_tags: Optional[bool] = None,
+            email_clarifications: Optional[bool] = None,
+            extra_wall_time: Optional[int] = None,
+            group_score_policy: Optional[str] = None,
+            input_limit: Optional[int] = None,
+            languages: Optional[str] = None,
+            memory_limit: Optional[int] = None,
+            output_limit: Optional[int] = None,
+            overall_wall_time_limit: Optional[int] = None,
+            problem_level: Optional[str] = None,
+            selected_tags: Optional[str] = None,
+            show_diff: Optional[str] = None,
+            source: Optional[str] = None,
+            time_limit: Optional[int] = None,
+            title: Optional[str] = None,
+            update_published: Optional[str] = None,
+            validator: Optional[str] = None,
+            validator_time_limit: Optional[int] = None,
+            visibility: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Updates problem statement only
+
+        Args:
+            lang:
+            message:
+            problem_alias:
+            statement:
+            allow_user_add_tags:
+            email_clarifications:
+            extra_wall_time:
+            group_score_policy:
+            input_limit:
+            languages:
+            memory_limit:
+            output_limit:
+            overall_wall_time_limit:
+            problem_level:
+            selected_tags:
+            show_diff:
+            source:
+            time_limit:
+            title:
+            update_published:
+            validator:
+            validator_time_limit:
+            visibility:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'lang': lang,
+            'message': message,
+            'problem_alias': problem_alias,
+            'statement': statement,
+        }
+        if allow_user_add_tags is not None:
+            parameters['allow_user_add_tags'] = str(allow_user_add_tags)
+        if email_clarifications is not None:
+            parameters['email_clarifications'] = str(email_clarifications)
+        if extra_wall_time is not None:
+            parameters['extra_wall_time'] = str(extra_wall_time)
+        if group_score_policy is not None:
+            parameters['group_score_policy'] = group_score_policy
+        if input_limit is not None:
+            parameters['input_limit'] = str(input_limit)
+        if languages is not None:
+            parameters['languages'] = languages
+        if memory_limit is not None:
+            parameters['memory_limit'] = str(memory_limit)
+        if output_limit is not None:
+            parameters['output_limit'] = str(output_limit)
+        if overall_wall_time_limit is not None:
+            parameters['overall_wall_time_limit'] = str(
+                overall_wall_time_limit)
+        if problem_level is not None:
+            parameters['problem_level'] = problem_level
+        if selected_tags is not None:
+            parameters['selected_tags'] = selected_tags
+        if show_diff is not None:
+            parameters['show_diff'] = show_diff
+        if source is not None:
+            parameters['source'] = source
+        if time_limit is not None:
+            parameters['time_limit'] = str(time_limit)
+        if title is not None:
+            parameters['title'] = title
+        if update_published is not None:
+            parameters['update_published'] = update_published
+        if validator is not None:
+            parameters['validator'] = validator
+        if validator_time_limit is not None:
+            parameters['validator_time_limit'] = str(validator_time_limit)
+        if visibility is not None:
+            parameters['visibility'] = visibility
+        self._client.query('/api/problem/updateStatement/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def updateSolution(
+            self,
+            *,
+            message: str,
+            problem_alias: str,
+            solution: str,
+            allow_user_add_tags: Optional[bool] = None,
+            email_clarifications: Optional[bool] = None,
+            extra_wall_time: Optional[int] = None,
+            group_score_policy: Optional[str] = None,
+            input_limit: Optional[int] = None,
+            lang: Optional[str] = None,
+            languages: Optional[str] = None,
+            memory_limit: Optional[int] = None,
+            output_limit: Optional[int] = None,
+            overall_wall_time_limit: Optional[int] = None,
+            problem_level: Optional[str] = None,
+            selected_tags: Optional[str] = None,
+            show_diff: Optional[str] = None,
+            source: Optional[str] = None,
+            time_limit: Optional[int] = None,
+            title: Optional[str] = None,
+            update_published: Optional[str] = None,
+            validator: Optional[str] = None,
+            validator_time_limit: Optional[int] = None,
+            visibility: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Updates problem solution only
+
+        Args:
+            message:
+            problem_alias:
+            solution:
+            allow_user_add_tags:
+            email_clarifications:
+            extra_wall_time:
+            group_score_policy:
+            input_limit:
+            lang:
+            languages:
+            memory_limit:
+            output_limit:
+            overall_wall_time_limit:
+            problem_level:
+            selected_tags:
+            show_diff:
+            source:
+            time_limit:
+            title:
+            update_published:
+            validator:
+            validator_time_limit:
+            visibility:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'message': message,
+            'problem_alias': problem_alias,
+            'solution': solution,
+        }
+        if allow_user_add_tags is not None:
+            parameters['allow_user_add_tags'] = str(allow_user_add_tags)
+        if email_clarifications is not None:
+            parameters['email_clarifications'] = str(email_clarifications)
+        if extra_wall_time is not None:
+            parameters['extra_wall_time'] = str(extra_wall_time)
+        if group_score_policy is not None:
+            parameters['group_score_policy'] = group_score_policy
+        if input_limit is not None:
+            parameters['input_limit'] = str(input_limit)
+        if lang is not None:
+            parameters['lang'] = lang
+        if languages is not None:
+            parameters['languages'] = languages
+        if memory_limit is not None:
+            parameters['memory_limit'] = str(memory_limit)
+        if output_limit is not None:
+            parameters['output_limit'] = str(output_limit)
+        if overall_wall_time_limit is not None:
+            parameters['overall_wall_time_limit'] = str(
+                overall_wall_time_limit)
+        if problem_level is not None:
+            parameters['problem_level'] = problem_level
+        if selected_tags is not None:
+            parameters['selected_tags'] = selected_tags
+        if show_diff is not None:
+            parameters['show_diff'] = show_diff
+        if source is not None:
+            parameters['source'] = source
+        if time_limit is not None:
+            parameters['time_limit'] = str(time_limit)
+        if title is not None:
+            parameters['title'] = title
+        if update_published is not None:
+            parameters['update_published'] = update_published
+        if validator is not None:
+            parameters['validator'] = validator
+        if validator_time_limit is not None:
+            parameters['validator_time_limit'] = str(validator_time_limit)
+        if visibility is not None:
+            parameters['visibility'] = visibility
+        self._client.query('/api/problem/updateSolution/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def details(
+        self,
+        *,
+        problem_alias: str,
+        contest_alias: Optional[str] = None,
+        lang: Optional[str] = None,
+        prevent_problemset_open: Optional[bool] = None,
+        problemset_id: Optional[int] = None,
+        show_solvers: Optional[bool] = None,
+        statement_type: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemDetailsResponse:
+        r"""Entry point for Problem Details API
+
+        Args:
+            problem_alias:
+            contest_alias:
+            lang:
+            prevent_problemset_open:
+            problemset_id:
+            show_solvers:
+            statement_type:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        if contest_alias is not None:
+            parameters['contest_alias'] = contest_alias
+        if lang is not None:
+            parameters['lang'] = lang
+        if prevent_problemset_open is not None:
+            parameters['prevent_problemset_open'] = str(
+                prevent_problemset_open)
+        if problemset_id is not None:
+            parameters['problemset_id'] = str(problemset_id)
+        if show_solvers is not None:
+            parameters['show_solvers'] = str(show_solvers)
+        if statement_type is not None:
+            parameters['statement_type'] = statement_type
+        return _decoder.decode(
+            _ProblemDetails,
+            self._client.query('/api/problem/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def solution(
+        self,
+        *,
+        contest_alias: Optional[str] = None,
+        forfeit_problem: Optional[bool] = None,
+        lang: Optional[str] = None,
+        problem_alias: Optional[str] = None,
+        problemset_id: Optional[Any] = None,
+        statement_type: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemSolutionResponse:
+        r"""Returns the solution for a problem if conditions are satisfied.
+
+        Args:
+            contest_alias:
+            forfeit_problem:
+            lang:
+            problem_alias:
+            problemset_id:
+            statement_type:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if contest_alias is not None:
+            parameters['contest_alias'] = contest_alias
+        if forfeit_problem is not None:
+            parameters['forfeit_problem'] = str(forfeit_problem)
+        if lang is not None:
+            parameters['lang'] = lang
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if problemset_id is not None:
+            parameters['problemset_id'] = str(problemset_id)
+        if statement_type is not None:
+            parameters['statement_type'] = statement_type
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiSolution,
+            self._client.query('/api/problem/solution/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def versions(
+        self,
+        *,
+        problem_alias: Optional[str] = None,
+        problemset_id: Optional[int] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemVersionsResponse:
+        r"""Entry point for Problem Versions API
+
+        Args:
+            problem_alias:
+            problemset_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if problemset_id is not None:
+            parameters['problemset_id'] = str(problemset_id)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiVersions,
+            self._client.query('/api/problem/versions/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def selectVersion(
+            self,
+            *,
+            commit: Optional[str] = None,
+            problem_alias: Optional[str] = None,
+            update_published: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Change the version of the problem.
+
+        Args:
+            commit:
+            problem_alias:
+            update_published:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if commit is not None:
+            parameters['commit'] = commit
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if update_published is not None:
+            parameters['update_published'] = update_published
+        self._client.query('/api/problem/selectVersion/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def runsDiff(
+        self,
+        *,
+        version: str,
+        problem_alias: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemRunsDiffResponse:
+        r"""Return a report of which runs would change due to a version change.
+
+        Args:
+            version:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'version': version,
+        }
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiRunsDiff,
+            self._client.query('/api/problem/runsDiff/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def runs(
+        self,
+        *,
+        execution: Optional[str] = None,
+        language: Optional[str] = None,
+        offset: Optional[int] = None,
+        output: Optional[str] = None,
+        problem_alias: Optional[str] = None,
+        rowcount: Optional[int] = None,
+        show_all: Optional[bool] = None,
+        status: Optional[str] = None,
+        username: Optional[str] = None,
+        verdict: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemRunsResponse:
+        r"""Entry point for Problem runs API
+
+        Args:
+            execution:
+            language:
+            offset:
+            output:
+            problem_alias:
+            rowcount:
+            show_all:
+            status:
+            username:
+            verdict:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if execution is not None:
+            parameters['execution'] = execution
+        if language is not None:
+            parameters['language'] = language
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if output is not None:
+            parameters['output'] = output
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        if show_all is not None:
+            parameters['show_all'] = str(show_all)
+        if status is not None:
+            parameters['status'] = status
+        if username is not None:
+            parameters['username'] = username
+        if verdict is not None:
+            parameters['verdict'] = verdict
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiRuns,
+            self._client.query('/api/problem/runs/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def stream_runs(
+            self,
+            *,
+            execution: Optional[str] = None,
+            language: Optional[str] = None,
+            offset: Optional[int] = None,
+            output: Optional[str] = None,
+            problem_alias: Optional[str] = None,
+            rowcount: Optional[int] = None,
+            show_all: Optional[bool] = None,
+            status: Optional[str] = None,
+            username: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> Iterator[_Run]:
+        r"""Entry point for Problem runs API
+
+        Streaming variant of `runs()` that parses the response
+        incrementally.
+
+        Args:
+            execution:
+            language:
+            offset:
+            output:
+            problem_alias:
+            rowcount:
+            show_all:
+            status:
+            username:
+            verdict:
+
+        Yields:
+            The runs, decoded one at a time as the response is received.
+        """
+        parameters: Dict[str, str] = {}
+        if execution is not None:
+            parameters['execution'] = execution
+        if language is not None:
+            parameters['language'] = language
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if output is not None:
+            parameters['output'] = output
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        if show_all is not None:
+            parameters['show_all'] = str(show_all)
+        if status is not None:
+            parameters['status'] = status
+        if username is not None:
+            parameters['username'] = username
+        if verdict is not None:
+            parameters['verdict'] = verdict
+        return _decoder.decode_stream(
+            _Run,
+            self._client.query_stream('/api/problem/runs/',
+                                      'runs',
+                                      payload=parameters,
+                                      files_=files_,
+                                      timeout_=timeout_,
+                                      check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_runs(
+            self,
+            *,
+            execution: Optional[str] = None,
+            language: Optional[str] = None,
+            output: Optional[str] = None,
+            problem_alias: Optional[str] = None,
+            show_all: Optional[bool] = None,
+            status: Optional[str] = None,
+            username: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+            prefetch_: bool = True,
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> Iterator[_Run]:
+        r"""Entry point for Problem runs API
+
+        Paginated variant of `runs()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            execution:
+            language:
+            output:
+            problem_alias:
+            show_all:
+            status:
+            username:
+            verdict:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.runs,
+                                  execution=execution,
+                                  language=language,
+                                  output=output,
+                                  problem_alias=problem_alias,
+                                  show_all=show_all,
+                                  status=status,
+                                  username=username,
+                                  verdict=verdict,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='runs',
+                               page='offset',
+                               page_size='rowcount',
+                               first_page=0,
+                               size=page_size_,
+                               total='totalRuns',
+                               prefetch=prefetch_)
+
+    def clarifications(
+        self,
+        *,
+        problem_alias: str,
+        offset: Optional[int] = None,
+        rowcount: Optional[int] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemClarificationsResponse:
+        r"""Entry point for Problem clarifications API
+
+        Args:
+            problem_alias:
+            offset:
+            rowcount:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiClarifications,
+            self._client.query('/api/problem/clarifications/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def stats(
+        self,
+        *,
+        problem_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemStatsResponse:
+        r"""Stats of a problem
+
+        Args:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiStats,
+            self._client.query('/api/problem/stats/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def listForTypeahead(
+        self,
+        *,
+        query: str,
+        search_type: str,
+        offset: Optional[int] = None,
+        rowcount: Optional[int] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemListForTypeaheadResponse:
+        r"""List of public problems shown in the typeahead component
+
+        Args:
+            query:
+            search_type:
+            offset:
+            rowcount:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'query': query,
+            'search_type': search_type,
+        }
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiListForTypeahead,
+            self._client.query('/api/problem/listForTypeahead/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def list(
+        self,
+        *,
+        only_quality_seal: bool,
+        difficulty: Optional[str] = None,
+        difficulty_range: Optional[str] = None,
+        language: Optional[Any] = None,
+        level: Optional[str] = None,
+        max_difficulty: Optional[int] = None,
+        min_difficulty: Optional[int] = None,
+        min_visibility: Optional[int] = None,
+        offset: Optional[int] = None,
+        only_karel: Optional[Any] = None,
+        order_by: Optional[Any] = None,
+        page: Optional[int] = None,
+        programming_languages: Optional[str] = None,
+        query: Optional[str] = None,
+        require_all_tags: Optional[Any] = None,
+        rowcount: Optional[int] = None,
+        some_tags: Optional[Any] = None,
+        sort_order: Optional[Any] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemListResponse:
+        r"""List of public and user's private problems
+
+        Args:
+            only_quality_seal:
+            difficulty:
+            difficulty_range:
+            language:
+            level:
+            max_difficulty:
+            min_difficulty:
+            min_visibility:
+            offset:
+            only_karel:
+            order_by:
+            page:
+            programming_languages:
+            query:
+            require_all_tags:
+            rowcount:
+            some_tags:
+            sort_order:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'only_quality_seal': str(only_quality_seal),
+        }
+        if difficulty is not None:
+            parameters['difficulty'] = difficulty
+        if difficulty_range is not None:
+            parameters['difficulty_range'] = difficulty_range
+        if language is not None:
+            parameters['language'] = str(language)
+        if level is not None:
+            parameters['level'] = level
+        if max_difficulty is not None:
+            parameters['max_difficulty'] = str(max_difficulty)
+        if min_difficulty is not None:
+            parameters['min_difficulty'] = str(min_difficulty)
+        if min_visibility is not None:
+            parameters['min_visibility'] = str(min_visibility)
+        if offset is not None:
+            parameters['offset'] = str(offset)
+        if only_karel is not None:
+            parameters['only_karel'] = str(only_karel)
+        if order_by is not None:
+            parameters['order_by'] = str(order_by)
+        if page is not None:
+            parameters['page'] = str(page)
+        if programming_languages is not None:
+            parameters['programming_languages'] = programming_languages
+        if query is not None:
+            parameters['query'] = query
+        if require_all_tags is not None:
+            parameters['require_all_tags'] = str(require_all_tags)
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        if some_tags is not None:
+            parameters['some_tags'] = str(some_tags)
+        if sort_order is not None:
+            parameters['sort_order'] = str(sort_order)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiList,
+            self._client.query('/api/problem/list/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_list(
+        self,
+        *,
+        only_quality_seal: bool,
+        difficulty: Optional[str] = None,
+        difficulty_range: Optional[str] = None,
+        language: Optional[Any] = None,
+        level: Optional[str] = None,
+        max_difficulty: Optional[int] = None,
+        min_difficulty: Optional[int] = None,
+        min_visibility: Optional[int] = None,
+        only_karel: Optional[Any] = None,
+        order_by: Optional[Any] = None,
+        programming_languages: Optional[str] = None,
+        query: Optional[str] = None,
+        require_all_tags: Optional[Any] = None,
+        some_tags: Optional[Any] = None,
+        sort_order: Optional[Any] = None,
+        # Out-of-band parameters:
+        page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+        prefetch_: bool = True,
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> Iterator[_ProblemListItem]:
+        r"""List of public and user's private problems
+
+        Paginated variant of `list()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            only_quality_seal:
+            difficulty:
+            difficulty_range:
+            language:
+            level:
+            max_difficulty:
+            min_difficulty:
+            min_visibility:
+            only_karel:
+            order_by:
+            programming_languages:
+            query:
+            require_all_tags:
+            some_tags:
+            sort_order:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.list,
+                                  only_quality_seal=only_quality_seal,
+                                  difficulty=difficulty,
+                                  difficulty_range=difficulty_range,
+                                  language=language,
+                                  level=level,
+                                  max_difficulty=max_difficulty,
+                                  min_difficulty=min_difficulty,
+                                  min_visibility=min_visibility,
+                                  only_karel=only_karel,
+                                  order_by=order_by,
+                                  programming_languages=programming_languages,
+                                  query=query,
+                                  require_all_tags=require_all_tags,
+                                  some_tags=some_tags,
+                                  sort_order=sort_order,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='results',
+                               page='page',
+                               page_size='rowcount',
+                               first_page=1,
+                               size=page_size_,
+                               total='total',
+                               prefetch=prefetch_)
+
+    def adminList(
+        self,
+        *,
+        page: int,
+        page_size: int,
+        query: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemAdminListResponse:
+        r"""Returns a list of problems where current user has admin rights (or is
+        the owner).
+
+        Args:
+            page:
+            page_size:
+            query:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'page': str(page),
+            'page_size': str(page_size),
+        }
+        if query is not None:
+            parameters['query'] = query
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiAdminList,
+            self._client.query('/api/problem/adminList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_adminList(
+        self,
+        *,
+        query: Optional[str] = None,
+        # Out-of-band parameters:
+        page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+        prefetch_: bool = True,
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> Iterator[_ProblemListItem]:
+        r"""Returns a list of problems where current user has admin rights (or is
+        the owner).
+
+        Paginated variant of `adminList()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            query:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.adminList,
+                                  query=query,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='problems',
+                               page='page',
+                               page_size='page_size',
+                               first_page=1,
+                               size=page_size_,
+                               prefetch=prefetch_)
+
+    def myList(
+        self,
+        *,
+        page: int,
+        query: Optional[str] = None,
+        rowcount: Optional[int] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemMyListResponse:
+        r"""Gets a list of problems where current user is the owner
+
+        Args:
+            page:
+            query:
+            rowcount:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'page': str(page),
+        }
+        if query is not None:
+            parameters['query'] = query
+        if rowcount is not None:
+            parameters['rowcount'] = str(rowcount)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiMyList,
+            self._client.query('/api/problem/myList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def bestScore(
+        self,
+        *,
+        contest_alias: Optional[str] = None,
+        problem_alias: Optional[str] = None,
+        problemset_id: Optional[Any] = None,
+        statement_type: Optional[str] = None,
+        username: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemBestScoreResponse:
+        r"""Returns the best score for a problem
+
+        Args:
+            contest_alias:
+            problem_alias:
+            problemset_id:
+            statement_type:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if contest_alias is not None:
+            parameters['contest_alias'] = contest_alias
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if problemset_id is not None:
+            parameters['problemset_id'] = str(problemset_id)
+        if statement_type is not None:
+            parameters['statement_type'] = statement_type
+        if username is not None:
+            parameters['username'] = username
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiBestScore,
+            self._client.query('/api/problem/bestScore/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def randomLanguageProblem(
+        self,
+        *,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemRandomLanguageProblemResponse:
+        r"""
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiRandomLanguageProblem,
+            self._client.query('/api/problem/randomLanguageProblem/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def randomKarelProblem(
+        self,
+        *,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemRandomKarelProblemResponse:
+        r"""
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problem__apiRandomKarelProblem,
+            self._client.query('/api/problem/randomKarelProblem/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
@@ -0,0 +1,65 @@
+"""The omegaUp ProblemForfeited API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_ProblemForfeited__apiGetCounts:
+    """_OmegaUp_Controllers_ProblemForfeited__apiGetCounts"""
+    allowed: int
+    seen: int
+
+    def __init__(
+        self,
+        *,
+        allowed: int,
+        seen: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.allowed = allowed
+        self.seen = seen
+
+
+ProblemForfeitedGetCountsResponse = _OmegaUp_Controllers_ProblemForfeited__apiGetCounts
+"""The return type of the ProblemForfeitedGetCounts API."""
+
+
+class ProblemForfeited:
+    r"""ProblemForfeitedController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def getCounts(
+        self,
+        *,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemForfeitedGetCountsResponse:
+        r"""Returns the number of solutions allowed
+        and the number of solutions already seen
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_ProblemForfeited__apiGetCounts,
+            self._client.query('/api/problemForfeited/getCounts/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
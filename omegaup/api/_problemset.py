@@ -0,0 +1,482 @@
+"""The omegaUp Problemset API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import (
+    _CourseAssignment,
+    _ProblemsetProblem,
+    _Scoreboard,
+    _ScoreboardEvent,
+)
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Problemset__apiScoreboardEvents:
+    """_OmegaUp_Controllers_Problemset__apiScoreboardEvents"""
+    events: Sequence['_ScoreboardEvent']
+
+    def __init__(
+        self,
+        *,
+        events: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.events = [_ScoreboardEvent(**v) for v in events]
+
+
+@dataclasses.dataclass
+class _Problemset:
+    """_Problemset"""
+    admin: Optional[bool]
+    admission_mode: Optional[str]
+    alias: Optional[str]
+    archived: Optional[bool]
+    assignment_type: Optional[str]
+    contest_alias: Optional[str]
+    courseAssignments: Optional[Sequence['_CourseAssignment']]
+    description: Optional[str]
+    director: Optional[str]
+    feedback: Optional[str]
+    finish_time: Optional[datetime.datetime]
+    has_submissions: Optional[bool]
+    languages: Optional[Sequence[str]]
+    name: Optional[str]
+    needs_basic_information: Optional[bool]
+    opened: Optional[bool]
+    original_contest_alias: Optional[str]
+    original_problemset_id: Optional[int]
+    penalty: Optional[int]
+    penalty_calc_policy: Optional[str]
+    penalty_type: Optional[str]
+    points_decay_factor: Optional[float]
+    problems: Optional[Sequence['_ProblemsetProblem']]
+    problemset_id: Optional[int]
+    requests_user_information: Optional[str]
+    rerun_id: Optional[int]
+    score_mode: Optional[str]
+    scoreboard: Optional[int]
+    scoreboard_url: Optional[str]
+    scoreboard_url_admin: Optional[str]
+    show_penalty: Optional[bool]
+    show_scoreboard_after: Optional[bool]
+    start_time: Optional[datetime.datetime]
+    submission_deadline: Optional[datetime.datetime]
+    submissions_gap: Optional[int]
+    title: Optional[str]
+    users: Optional[Sequence['_Problemset_users_entry']]
+    window_length: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        admin: Optional[bool] = None,
+        admission_mode: Optional[str] = None,
+        alias: Optional[str] = None,
+        archived: Optional[bool] = None,
+        assignment_type: Optional[str] = None,
+        contest_alias: Optional[str] = None,
+        courseAssignments: Optional[Sequence[Dict[str, Any]]] = None,
+        description: Optional[str] = None,
+        director: Optional[str] = None,
+        feedback: Optional[str] = None,
+        finish_time: Optional[int] = None,
+        has_submissions: Optional[bool] = None,
+        languages: Optional[Sequence[str]] = None,
+        name: Optional[str] = None,
+        needs_basic_information: Optional[bool] = None,
+        opened: Optional[bool] = None,
+        original_contest_alias: Optional[str] = None,
+        original_problemset_id: Optional[int] = None,
+        penalty: Optional[int] = None,
+        penalty_calc_policy: Optional[str] = None,
+        penalty_type: Optional[str] = None,
+        points_decay_factor: Optional[float] = None,
+        problems: Optional[Sequence[Dict[str, Any]]] = None,
+        problemset_id: Optional[int] = None,
+        requests_user_information: Optional[str] = None,
+        rerun_id: Optional[int] = None,
+        score_mode: Optional[str] = None,
+        scoreboard: Optional[int] = None,
+        scoreboard_url: Optional[str] = None,
+        scoreboard_url_admin: Optional[str] = None,
+        show_penalty: Optional[bool] = None,
+        show_scoreboard_after: Optional[bool] = None,
+        start_time: Optional[int] = None,
+        submission_deadline: Optional[int] = None,
+        submissions_gap: Optional[int] = None,
+        title: Optional[str] = None,
+        users: Optional[Sequence[Dict[str, Any]]] = None,
+        window_length: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if admin is not None:
+            self.admin = admin
+        else:
+            self.admin = None
+        if admission_mode is not None:
+            self.admission_mode = admission_mode
+        else:
+            self.admission_mode = None
+        if alias is not None:
+            self.alias = alias
+        else:
+            self.alias = None
+        if archived is not None:
+            self.archived = archived
+        else:
+            self.archived = None
+        if assignment_type is not None:
+            self.assignment_type = assignment_type
+        else:
+            self.assignment_type = None
+        if contest_alias is not None:
+            self.contest_alias = contest_alias
+        else:
+            self.contest_alias = None
+        if courseAssignments is not None:
+            self.courseAssignments = [
+                _CourseAssignment(**v) for v in courseAssignments
+            ]
+        else:
+            self.courseAssignments = None
+        if description is not None:
+            self.description = description
+        else:
+            self.description = None
+        if director is not None:
+            self.director = director
+        else:
+            self.director = None
+        if feedback is not None:
+            self.feedback = feedback
+        else:
+            self.feedback = None
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        if has_submissions is not None:
+            self.has_submissions = has_submissions
+        else:
+            self.has_submissions = None
+        if languages is not None:
+            self.languages = [v for v in languages]
+        else:
+            self.languages = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if needs_basic_information is not None:
+            self.needs_basic_information = needs_basic_information
+        else:
+            self.needs_basic_information = None
+        if opened is not None:
+            self.opened = opened
+        else:
+            self.opened = None
+        if original_contest_alias is not None:
+            self.original_contest_alias = original_contest_alias
+        else:
+            self.original_contest_alias = None
+        if original_problemset_id is not None:
+            self.original_problemset_id = original_problemset_id
+        else:
+            self.original_problemset_id = None
+        if penalty is not None:
+            self.penalty = penalty
+        else:
+            self.penalty = None
+        if penalty_calc_policy is not None:
+            self.penalty_calc_policy = penalty_calc_policy
+        else:
+            self.penalty_calc_policy = None
+        if penalty_type is not None:
+            self.penalty_type = penalty_type
+        else:
+            self.penalty_type = None
+        if points_decay_factor is not None:
+            self.points_decay_factor = points_decay_factor
+        else:
+            self.points_decay_factor = None
+        if problems is not None:
+            self.problems = [_ProblemsetProblem(**v) for v in problems]
+        else:
+            self.problems = None
+        if problemset_id is not None:
+            self.problemset_id = problemset_id
+        else:
+            self.problemset_id = None
+        if requests_user_information is not None:
+            self.requests_user_information = requests_user_information
+        else:
+            self.requests_user_information = None
+        if rerun_id is not None:
+            self.rerun_id = rerun_id
+        else:
+            self.rerun_id = None
+        if score_mode is not None:
+            self.score_mode = score_mode
+        else:
+            self.score_mode = None
+        if scoreboard is not None:
+            self.scoreboard = scoreboard
+        else:
+            self.scoreboard = None
+        if scoreboard_url is not None:
+            self.scoreboard_url = scoreboard_url
+        else:
+            self.scoreboard_url = None
+        if scoreboard_url_admin is not None:
+            self.scoreboard_url_admin = scoreboard_url_admin
+        else:
+            self.scoreboard_url_admin = None
+        if show_penalty is not None:
+            self.show_penalty = show_penalty
+        else:
+            self.show_penalty = None
+        if show_scoreboard_after is not None:
+            self.show_scoreboard_after = show_scoreboard_after
+        else:
+            self.show_scoreboard_after = None
+        if start_time is not None:
+            self.start_time = datetime.datetime.fromtimestamp(start_time)
+        else:
+            self.start_time = None
+        if submission_deadline is not None:
+            self.submission_deadline = datetime.datetime.fromtimestamp(
+                submission_deadline)
+        else:
+            self.submission_deadline = None
+        if submissions_gap is not None:
+            self.submissions_gap = submissions_gap
+        else:
+            self.submissions_gap = None
+        if title is not None:
+            self.title = title
+        else:
+            self.title = None
+        if users is not None:
+            self.users = [_Problemset_users_entry(**v) for v in users]
+        else:
+            self.users = None
+        if window_length is not None:
+            self.window_length = window_length
+        else:
+            self.window_length = None
+
+
+@dataclasses.dataclass
+class _Problemset_users_entry:
+    """_Problemset_users_entry"""
+    access_time: Optional[datetime.datetime]
+    country: Optional[str]
+    email: Optional[str]
+    user_id: Optional[int]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        access_time: Optional[int] = None,
+        country: Optional[str] = None,
+        email: Optional[str] = None,
+        user_id: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if access_time is not None:
+            self.access_time = datetime.datetime.fromtimestamp(access_time)
+        else:
+            self.access_time = None
+        if country is not None:
+            self.country = country
+        else:
+            self.country = None
+        if email is not None:
+            self.email = email
+        else:
+            self.email = None
+        if user_id is not None:
+            self.user_id = user_id
+        else:
+            self.user_id = None
+        self.username = username
+
+
+ProblemsetDetailsResponse = _Problemset
+"""The return type of the ProblemsetDetails API."""
+
+ProblemsetScoreboardResponse = _Scoreboard
+"""The return type of the ProblemsetScoreboard API."""
+
+ProblemsetScoreboardEventsResponse = _OmegaUp_Controllers_Problemset__apiScoreboardEvents
+"""The return type of the ProblemsetScoreboardEvents API."""
+
+
+class Problemset:
+    r"""
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def details(
+        self,
+        *,
+        assignment: str,
+        contest_alias: str,
+        course: str,
+        problemset_id: int,
+        auth_token: Optional[Any] = None,
+        token: Optional[str] = None,
+        tokens: Optional[Any] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemsetDetailsResponse:
+        r"""
+
+        Args:
+            assignment:
+            contest_alias:
+            course:
+            problemset_id:
+            auth_token:
+            token:
+            tokens:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment': assignment,
+            'contest_alias': contest_alias,
+            'course': course,
+            'problemset_id': str(problemset_id),
+        }
+        if auth_token is not None:
+            parameters['auth_token'] = str(auth_token)
+        if token is not None:
+            parameters['token'] = token
+        if tokens is not None:
+            parameters['tokens'] = str(tokens)
+        return _decoder.decode(
+            _Problemset,
+            self._client.query('/api/problemset/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def scoreboard(
+        self,
+        *,
+        assignment: str,
+        contest_alias: str,
+        course: str,
+        problemset_id: int,
+        auth_token: Optional[Any] = None,
+        token: Optional[Any] = None,
+        tokens: Optional[Any] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemsetScoreboardResponse:
+        r"""
+
+        Args:
+            assignment:
+            contest_alias:
+            course:
+            problemset_id:
+            auth_token:
+            token:
+            tokens:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment': assignment,
+            'contest_alias': contest_alias,
+            'course': course,
+            'problemset_id': str(problemset_id),
+        }
+        if auth_token is not None:
+            parameters['auth_token'] = str(auth_token)
+        if token is not None:
+            parameters['token'] = str(token)
+        if tokens is not None:
+            parameters['tokens'] = str(tokens)
+        return _decoder.decode(
+            _Scoreboard,
+            self._client.query('/api/problemset/scoreboard/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def scoreboardEvents(
+        self,
+        *,
+        assignment: str,
+        contest_alias: str,
+        course: str,
+        problemset_id: int,
+        auth_token: Optional[Any] = None,
+        token: Optional[Any] = None,
+        tokens: Optional[Any] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ProblemsetScoreboardEventsResponse:
+        r"""Returns the Scoreboard events
+
+        Args:
+            assignment:
+            contest_alias:
+            course:
+            problemset_id:
+            auth_token:
+            token:
+            tokens:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment': assignment,
+            'contest_alias': contest_alias,
+            'course': course,
+            'problemset_id': str(problemset_id),
+        }
+        if auth_token is not None:
+            parameters['auth_token'] = str(auth_token)
+        if token is not None:
+            parameters['token'] = str(token)
+        if tokens is not None:
+            parameters['tokens'] = str(tokens)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Problemset__apiScoreboardEvents,
+            self._client.query('/api/problemset/scoreboardEvents/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
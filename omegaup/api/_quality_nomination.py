@@ -0,0 +1,1082 @@
+"""The omegaUp QualityNomination API and its response types."""
+
+import dataclasses
+import datetime
+import functools
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, Mapping, Optional, Sequence
+
+from omegaup import _decoder, _paginate
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import (
+    _PageItem,
+    _ProblemStatement,
+)
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _NominationListItem:
+    """_NominationListItem"""
+    author: '_NominationListItem_author'
+    contents: Optional['_NominationListItem_contents']
+    nomination: str
+    nominator: '_NominationListItem_nominator'
+    problem: '_NominationListItem_problem'
+    qualitynomination_id: int
+    status: str
+    time: datetime.datetime
+    votes: Sequence['_NominationListItem_votes_entry']
+
+    def __init__(
+        self,
+        *,
+        author: Dict[str, Any],
+        nomination: str,
+        nominator: Dict[str, Any],
+        problem: Dict[str, Any],
+        qualitynomination_id: int,
+        status: str,
+        time: int,
+        votes: Sequence[Dict[str, Any]],
+        contents: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.author = _NominationListItem_author(**author)
+        if contents is not None:
+            self.contents = _NominationListItem_contents(**contents)
+        else:
+            self.contents = None
+        self.nomination = nomination
+        self.nominator = _NominationListItem_nominator(**nominator)
+        self.problem = _NominationListItem_problem(**problem)
+        self.qualitynomination_id = qualitynomination_id
+        self.status = status
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.votes = [_NominationListItem_votes_entry(**v) for v in votes]
+
+
+@dataclasses.dataclass
+class _NominationListItem_author:
+    """_NominationListItem_author"""
+    name: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _NominationListItem_contents:
+    """_NominationListItem_contents"""
+    before_ac: Optional[bool]
+    difficulty: Optional[int]
+    quality: Optional[int]
+    rationale: Optional[str]
+    reason: Optional[str]
+    statements: Optional[Dict[str, str]]
+    tags: Optional[Sequence[str]]
+
+    def __init__(
+        self,
+        *,
+        before_ac: Optional[bool] = None,
+        difficulty: Optional[int] = None,
+        quality: Optional[int] = None,
+        rationale: Optional[str] = None,
+        reason: Optional[str] = None,
+        statements: Optional[Dict[str, str]] = None,
+        tags: Optional[Sequence[str]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if before_ac is not None:
+            self.before_ac = before_ac
+        else:
+            self.before_ac = None
+        if difficulty is not None:
+            self.difficulty = difficulty
+        else:
+            self.difficulty = None
+        if quality is not None:
+            self.quality = quality
+        else:
+            self.quality = None
+        if rationale is not None:
+            self.rationale = rationale
+        else:
+            self.rationale = None
+        if reason is not None:
+            self.reason = reason
+        else:
+            self.reason = None
+        if statements is not None:
+            self.statements = {k: v for k, v in statements.items()}
+        else:
+            self.statements = None
+        if tags is not None:
+            self.tags = [v for v in tags]
+        else:
+            self.tags = None
+
+
+@dataclasses.dataclass
+class _NominationListItem_nominator:
+    """_NominationListItem_nominator"""
+    name: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _NominationListItem_problem:
+    """_NominationListItem_problem"""
+    alias: str
+    title: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        title: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.title = title
+
+
+@dataclasses.dataclass
+class _NominationListItem_votes_entry:
+    """_NominationListItem_votes_entry"""
+    time: Optional[datetime.datetime]
+    user: '_NominationListItem_votes_entry_user'
+    vote: int
+
+    def __init__(
+        self,
+        *,
+        user: Dict[str, Any],
+        vote: int,
+        time: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if time is not None:
+            self.time = datetime.datetime.fromtimestamp(time)
+        else:
+            self.time = None
+        self.user = _NominationListItem_votes_entry_user(**user)
+        self.vote = vote
+
+
+@dataclasses.dataclass
+class _NominationListItem_votes_entry_user:
+    """_NominationListItem_votes_entry_user"""
+    name: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiCreate:
+    """_OmegaUp_Controllers_QualityNomination__apiCreate"""
+    qualitynomination_id: int
+
+    def __init__(
+        self,
+        *,
+        qualitynomination_id: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.qualitynomination_id = qualitynomination_id
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails"""
+    author: '_OmegaUp_Controllers_QualityNomination__apiDetails_author'
+    contents: Optional[
+        '_OmegaUp_Controllers_QualityNomination__apiDetails_contents']
+    nomination: str
+    nomination_status: str
+    nominator: '_OmegaUp_Controllers_QualityNomination__apiDetails_nominator'
+    original_contents: Optional[
+        '_OmegaUp_Controllers_QualityNomination__apiDetails_original_contents']
+    problem: '_OmegaUp_Controllers_QualityNomination__apiDetails_problem'
+    qualitynomination_id: int
+    reviewer: bool
+    time: datetime.datetime
+    votes: Sequence[
+        '_OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry']
+
+    def __init__(
+        self,
+        *,
+        author: Dict[str, Any],
+        nomination: str,
+        nomination_status: str,
+        nominator: Dict[str, Any],
+        problem: Dict[str, Any],
+        qualitynomination_id: int,
+        reviewer: bool,
+        time: int,
+        votes: Sequence[Dict[str, Any]],
+        contents: Optional[Dict[str, Any]] = None,
+        original_contents: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.author = _OmegaUp_Controllers_QualityNomination__apiDetails_author(
+            **author)
+        if contents is not None:
+            self.contents = _OmegaUp_Controllers_QualityNomination__apiDetails_contents(
+                **contents)
+        else:
+            self.contents = None
+        self.nomination = nomination
+        self.nomination_status = nomination_status
+        self.nominator = _OmegaUp_Controllers_QualityNomination__apiDetails_nominator(
+            **nominator)
+        if original_contents is not None:
+            self.original_contents = _OmegaUp_Controllers_QualityNomination__apiDetails_original_contents(
+                **original_contents)
+        else:
+            self.original_contents = None
+        self.problem = _OmegaUp_Controllers_QualityNomination__apiDetails_problem(
+            **problem)
+        self.qualitynomination_id = qualitynomination_id
+        self.reviewer = reviewer
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.votes = [
+            _OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry(**v)
+            for v in votes
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails_author:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails_author"""
+    name: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails_contents:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails_contents"""
+    before_ac: Optional[bool]
+    difficulty: Optional[int]
+    quality: Optional[int]
+    rationale: Optional[str]
+    reason: Optional[str]
+    statements: Optional[Dict[str, str]]
+    tags: Optional[Sequence[str]]
+
+    def __init__(
+        self,
+        *,
+        before_ac: Optional[bool] = None,
+        difficulty: Optional[int] = None,
+        quality: Optional[int] = None,
+        rationale: Optional[str] = None,
+        reason: Optional[str] = None,
+        statements: Optional[Dict[str, str]] = None,
+        tags: Optional[Sequence[str]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if before_ac is not None:
+            self.before_ac = before_ac
+        else:
+            self.before_ac = None
+        if difficulty is not None:
+            self.difficulty = difficulty
+        else:
+            self.difficulty = None
+        if quality is not None:
+            self.quality = quality
+        else:
+            self.quality = None
+        if rationale is not None:
+            self.rationale = rationale
+        else:
+            self.rationale = None
+        if reason is not None:
+            self.reason = reason
+        else:
+            self.reason = None
+        if statements is not None:
+            self.statements = {k: v for k, v in statements.items()}
+        else:
+            self.statements = None
+        if tags is not None:
+            self.tags = [v for v in tags]
+        else:
+            self.tags = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails_nominator:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails_nominator"""
+    name: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails_original_contents:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails_original_contents"""
+    source: str
+    statements: Dict[str, '_ProblemStatement']
+    tags: Optional[Sequence[
+        '_OmegaUp_Controllers_QualityNomination__apiDetails_original_contents_tags_entry']]
+
+    def __init__(
+        self,
+        *,
+        source: str,
+        statements: Dict[str, Dict[str, Any]],
+        tags: Optional[Sequence[Dict[str, Any]]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.source = source
+        self.statements = {
+            k: _ProblemStatement(**v)
+            for k, v in statements.items()
+        }
+        if tags is not None:
+            self.tags = [
+                _OmegaUp_Controllers_QualityNomination__apiDetails_original_contents_tags_entry(
+                    **v) for v in tags
+            ]
+        else:
+            self.tags = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails_original_contents_tags_entry:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails_original_contents_tags_entry"""
+    name: str
+    source: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        source: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.source = source
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails_problem:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails_problem"""
+    alias: str
+    title: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        title: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.title = title
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry"""
+    time: datetime.datetime
+    user: '_OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry_user'
+    vote: int
+
+    def __init__(
+        self,
+        *,
+        time: int,
+        user: Dict[str, Any],
+        vote: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.user = _OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry_user(
+            **user)
+        self.vote = vote
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry_user:
+    """_OmegaUp_Controllers_QualityNomination__apiDetails_votes_entry_user"""
+    name: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiList:
+    """_OmegaUp_Controllers_QualityNomination__apiList"""
+    nominations: Sequence['_NominationListItem']
+    pager_items: Sequence['_PageItem']
+
+    def __init__(
+        self,
+        *,
+        nominations: Sequence[Dict[str, Any]],
+        pager_items: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.nominations = [_NominationListItem(**v) for v in nominations]
+        self.pager_items = [_PageItem(**v) for v in pager_items]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyAssignedList:
+    """_OmegaUp_Controllers_QualityNomination__apiMyAssignedList"""
+    nominations: Sequence[
+        '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry']
+
+    def __init__(
+        self,
+        *,
+        nominations: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.nominations = [
+            _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry(
+                **v) for v in nominations
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry:
+    """_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry"""
+    author: '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_author'
+    contents: Optional[
+        '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_contents']
+    nomination: str
+    nominator: '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_nominator'
+    problem: '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_problem'
+    qualitynomination_id: int
+    status: str
+    time: datetime.datetime
+    votes: Sequence[
+        '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry']
+
+    def __init__(
+        self,
+        *,
+        author: Dict[str, Any],
+        nomination: str,
+        nominator: Dict[str, Any],
+        problem: Dict[str, Any],
+        qualitynomination_id: int,
+        status: str,
+        time: int,
+        votes: Sequence[Dict[str, Any]],
+        contents: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.author = _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_author(
+            **author)
+        if contents is not None:
+            self.contents = _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_contents(
+                **contents)
+        else:
+            self.contents = None
+        self.nomination = nomination
+        self.nominator = _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_nominator(
+            **nominator)
+        self.problem = _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_problem(
+            **problem)
+        self.qualitynomination_id = qualitynomination_id
+        self.status = status
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.votes = [
+            _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry(
+                **v) for v in votes
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_author:
+    """_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_author"""
+    name: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_contents:
+    """_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_contents"""
+    before_ac: Optional[bool]
+    difficulty: Optional[int]
+    quality: Optional[int]
+    rationale: Optional[str]
+    reason: Optional[str]
+    statements: Optional[Dict[str, str]]
+    tags: Optional[Sequence[str]]
+
+    def __init__(
+        self,
+        *,
+        before_ac: Optional[bool] = None,
+        difficulty: Optional[int] = None,
+        quality: Optional[int] = None,
+        rationale: Optional[str] = None,
+        reason: Optional[str] = None,
+        statements: Optional[Dict[str, str]] = None,
+        tags: Optional[Sequence[str]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if before_ac is not None:
+            self.before_ac = before_ac
+        else:
+            self.before_ac = None
+        if difficulty is not None:
+            self.difficulty = difficulty
+        else:
+            self.difficulty = None
+        if quality is not None:
+            self.quality = quality
+        else:
+            self.quality = None
+        if rationale is not None:
+            self.rationale = rationale
+        else:
+            self.rationale = None
+        if reason is not None:
+            self.reason = reason
+        else:
+            self.reason = None
+        if statements is not None:
+            self.statements = {k: v for k, v in statements.items()}
+        else:
+            self.statements = None
+        if tags is not None:
+            self.tags = [v for v in tags]
+        else:
+            self.tags = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_nominator:
+    """_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_nominator"""
+    name: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_problem:
+    """_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_problem"""
+    alias: str
+    title: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        title: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.title = title
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry:
+    """_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry"""
+    time: datetime.datetime
+    user: '_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry_user'
+    vote: int
+
+    def __init__(
+        self,
+        *,
+        time: int,
+        user: Dict[str, Any],
+        vote: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.user = _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry_user(
+            **user)
+        self.vote = vote
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry_user:
+    """_OmegaUp_Controllers_QualityNomination__apiMyAssignedList_nominations_entry_votes_entry_user"""
+    name: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_QualityNomination__apiMyList:
+    """_OmegaUp_Controllers_QualityNomination__apiMyList"""
+    nominations: Sequence['_NominationListItem']
+    pager_items: Sequence['_PageItem']
+
+    def __init__(
+        self,
+        *,
+        nominations: Sequence[Dict[str, Any]],
+        pager_items: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.nominations = [_NominationListItem(**v) for v in nominations]
+        self.pager_items = [_PageItem(**v) for v in pager_items]
+
+
+QualityNominationCreateResponse = _OmegaUp_Controllers_QualityNomination__apiCreate
+"""The return type of the QualityNominationCreate API."""
+
+QualityNominationListResponse = _OmegaUp_Controllers_QualityNomination__apiList
+"""The return type of the QualityNominationList API."""
+
+QualityNominationMyAssignedListResponse = _OmegaUp_Controllers_QualityNomination__apiMyAssignedList
+"""The return type of the QualityNominationMyAssignedList API."""
+
+QualityNominationMyListResponse = _OmegaUp_Controllers_QualityNomination__apiMyList
+"""The return type of the QualityNominationMyList API."""
+
+QualityNominationDetailsResponse = _OmegaUp_Controllers_QualityNomination__apiDetails
+"""The return type of the QualityNominationDetails API."""
+
+
+class QualityNomination:
+    r"""QualityNominationController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def create(
+        self,
+        *,
+        contents: str,
+        nomination: str,
+        problem_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> QualityNominationCreateResponse:
+        r"""Creates a new QualityNomination
+
+        There are three ways in which users can interact with this:
+
+        # Suggestion
+
+        A user that has already solved a problem can make suggestions about a
+        problem. This expects the `nomination` field to be `suggestion` and the
+        `contents` field should be a JSON blob with at least one the following fields:
+
+        * `difficulty`: (Optional) A number in the range [0-4] indicating the
+                        difficulty of the problem.
+        * `quality`: (Optional) A number in the range [0-4] indicating the quality
+                    of the problem.
+        * `tags`: (Optional) An array of tag names that will be added to the
+                  problem upon promotion.
+        * `before_ac`: (Optional) Boolean indicating if the suggestion has been sent
+                       before receiving an AC verdict for problem run.
+
+        # Quality tag
+
+        A reviewer could send this type of nomination to make the user marked as
+        a quality problem or not. The reviewer could also specify which category
+        is the one the problem belongs to. The 'contents' field should have the
+        following subfields:
+
+        * tag: The name of the tag corresponding to the category of the problem
+        * quality_seal: A boolean that if activated, means that the problem is a
+          quality problem
+
+        # Promotion
+
+        A user that has already solved a problem can nominate it to be promoted
+        as a Quality Problem. This expects the `nomination` field to be
+        `promotion` and the `contents` field should be a JSON blob with the
+        following fields:
+
+        * `statements`: A dictionary of languages to objects that contain a
+                        `markdown` field, which is the markdown-formatted
+                        problem statement for that language.
+        * `source`: A URL or string clearly documenting the source or full name
+                    of original author of the problem.
+        * `tags`: An array of tag names that will be added to the problem upon
+                  promotion.
+
+        # Demotion
+
+        A demoted problem is banned, and cannot be un-banned or added to any new
+        problemsets. This expects the `nomination` field to be `demotion` and
+        the `contents` field should be a JSON blob with the following fields:
+
+        * `rationale`: A small text explaining the rationale for demotion.
+        * `reason`: One of `['duplicate', 'no-problem-statement', 'offensive', 'other', 'spam']`.
+        * `original`: If the `reason` is `duplicate`, the alias of the original
+                      problem.
+        # Dismissal
+        A user that has already solved a problem can dismiss suggestions. The
+        `contents` field is empty.
+
+        Args:
+            contents:
+            nomination:
+            problem_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contents': contents,
+            'nomination': nomination,
+            'problem_alias': problem_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_QualityNomination__apiCreate,
+            self._client.query('/api/qualityNomination/create/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def resolve(
+            self,
+            *,
+            problem_alias: str,
+            qualitynomination_id: int,
+            rationale: str,
+            status: str,
+            all: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Marks a problem of a nomination (only the demotion type supported for now) as (resolved, banned, warning).
+
+        Args:
+            problem_alias:
+            qualitynomination_id:
+            rationale:
+            status:
+            all:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problem_alias': problem_alias,
+            'qualitynomination_id': str(qualitynomination_id),
+            'rationale': rationale,
+            'status': status,
+        }
+        if all is not None:
+            parameters['all'] = str(all)
+        self._client.query('/api/qualityNomination/resolve/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def list(
+        self,
+        *,
+        offset: int,
+        rowcount: int,
+        column: Optional[str] = None,
+        query: Optional[str] = None,
+        status: Optional[Any] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> QualityNominationListResponse:
+        r"""
+
+        Args:
+            offset:
+            rowcount:
+            column:
+            query:
+            status:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'offset': str(offset),
+            'rowcount': str(rowcount),
+        }
+        if column is not None:
+            parameters['column'] = column
+        if query is not None:
+            parameters['query'] = query
+        if status is not None:
+            parameters['status'] = str(status)
+        return _decoder.decode(
+            _OmegaUp_Controllers_QualityNomination__apiList,
+            self._client.query('/api/qualityNomination/list/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_list(
+        self,
+        *,
+        column: Optional[str] = None,
+        query: Optional[str] = None,
+        status: Optional[Any] = None,
+        # Out-of-band parameters:
+        page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+        prefetch_: bool = True,
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> Iterator[_NominationListItem]:
+        r"""
+
+        Paginated variant of `list()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            column:
+            query:
+            status:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.list,
+                                  column=column,
+                                  query=query,
+                                  status=status,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        # Unlike the runs endpoints, where `offset` is a 0-based page index,
+        # the server treats this `offset` as a 1-based page number.
+        return _paginate.items(fetch,
+                               items='nominations',
+                               page='offset',
+                               page_size='rowcount',
+                               first_page=1,
+                               size=page_size_,
+                               prefetch=prefetch_)
+
+    def myAssignedList(
+        self,
+        *,
+        page: int,
+        page_size: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> QualityNominationMyAssignedListResponse:
+        r"""Displays the nominations that this user has been assigned.
+
+        Args:
+            page:
+            page_size:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'page': str(page),
+            'page_size': str(page_size),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_QualityNomination__apiMyAssignedList,
+            self._client.query('/api/qualityNomination/myAssignedList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def myList(
+        self,
+        *,
+        offset: int,
+        rowcount: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> QualityNominationMyListResponse:
+        r"""
+
+        Args:
+            offset:
+            rowcount:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'offset': str(offset),
+            'rowcount': str(rowcount),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_QualityNomination__apiMyList,
+            self._client.query('/api/qualityNomination/myList/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def details(
+        self,
+        *,
+        qualitynomination_id: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> QualityNominationDetailsResponse:
+        r"""Displays the details of a nomination. The user needs to be either the
+        nominator or a member of the reviewer group.
+
+        Args:
+            qualitynomination_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'qualitynomination_id': str(qualitynomination_id),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_QualityNomination__apiDetails,
+            self._client.query('/api/qualityNomination/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
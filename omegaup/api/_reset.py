@@ -0,0 +1,187 @@
+"""The omegaUp Reset API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Reset__apiCreate:
+    """_OmegaUp_Controllers_Reset__apiCreate"""
+    message: Optional[str]
+    token: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        message: Optional[str] = None,
+        token: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if message is not None:
+            self.message = message
+        else:
+            self.message = None
+        if token is not None:
+            self.token = token
+        else:
+            self.token = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Reset__apiGenerateToken:
+    """_OmegaUp_Controllers_Reset__apiGenerateToken"""
+    link: str
+    token: str
+
+    def __init__(
+        self,
+        *,
+        link: str,
+        token: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.link = link
+        self.token = token
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Reset__apiUpdate:
+    """_OmegaUp_Controllers_Reset__apiUpdate"""
+    message: str
+
+    def __init__(
+        self,
+        *,
+        message: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.message = message
+
+
+ResetCreateResponse = _OmegaUp_Controllers_Reset__apiCreate
+"""The return type of the ResetCreate API."""
+
+ResetGenerateTokenResponse = _OmegaUp_Controllers_Reset__apiGenerateToken
+"""The return type of the ResetGenerateToken API."""
+
+ResetUpdateResponse = _OmegaUp_Controllers_Reset__apiUpdate
+"""The return type of the ResetUpdate API."""
+
+
+class Reset:
+    r"""
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def create(
+        self,
+        *,
+        email: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ResetCreateResponse:
+        r"""Creates a reset operation, the first of two steps needed to reset a
+        password. The first step consist of sending an email to the user with
+        instructions to reset he's password, if and only if the email is valid.
+
+        Args:
+            email:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'email': email,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Reset__apiCreate,
+            self._client.query('/api/reset/create/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def generateToken(
+        self,
+        *,
+        email: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ResetGenerateTokenResponse:
+        r"""Creates a reset operation, support team members can generate a valid
+        token and then they can send it to end user
+
+        Args:
+            email:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'email': email,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Reset__apiGenerateToken,
+            self._client.query('/api/reset/generateToken/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def update(
+        self,
+        *,
+        email: str,
+        password: str,
+        password_confirmation: str,
+        reset_token: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> ResetUpdateResponse:
+        r"""Updates the password of a given user, this is the second and last step
+        in order to reset the password. This operation is done if and only if
+        the correct parameters are suplied.
+
+        Args:
+            email:
+            password:
+            password_confirmation:
+            reset_token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'email': email,
+            'password': password,
+            'password_confirmation': password_confirmation,
+            'reset_token': reset_token,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Reset__apiUpdate,
+            self._client.query('/api/reset/update/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
@@ -0,0 +1,863 @@
+"""The omegaUp Run API and its response types."""
+
+import dataclasses
+import datetime
+import functools
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, Mapping, Optional, Sequence
+
+from omegaup import _decoder, _paginate
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import (
+    _CaseResult,
+    _ProblemCasesContents_value,
+    _Run,
+    _RunDetailsGroup,
+    _RunMetadata,
+    _SubmissionFeedback,
+)
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Run__apiCounts:
+    """_OmegaUp_Controllers_Run__apiCounts"""
+    ac: Dict[str, int]
+    total: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        ac: Dict[str, int],
+        total: Dict[str, int],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.ac = {k: v for k, v in ac.items()}
+        self.total = {k: v for k, v in total.items()}
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Run__apiCreate:
+    """_OmegaUp_Controllers_Run__apiCreate"""
+    guid: str
+    nextSubmissionTimestamp: datetime.datetime
+    submission_deadline: datetime.datetime
+    submit_delay: int
+
+    def __init__(
+        self,
+        *,
+        guid: str,
+        nextSubmissionTimestamp: int,
+        submission_deadline: int,
+        submit_delay: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.guid = guid
+        self.nextSubmissionTimestamp = datetime.datetime.fromtimestamp(
+            nextSubmissionTimestamp)
+        self.submission_deadline = datetime.datetime.fromtimestamp(
+            submission_deadline)
+        self.submit_delay = submit_delay
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Run__apiDisqualify:
+    """_OmegaUp_Controllers_Run__apiDisqualify"""
+    runs: Sequence['_OmegaUp_Controllers_Run__apiDisqualify_runs_entry']
+
+    def __init__(
+        self,
+        *,
+        runs: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.runs = [
+            _OmegaUp_Controllers_Run__apiDisqualify_runs_entry(**v)
+            for v in runs
+        ]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Run__apiDisqualify_runs_entry:
+    """_OmegaUp_Controllers_Run__apiDisqualify_runs_entry"""
+    guid: str
+    username: str
+
+    def __init__(
+        self,
+        *,
+        guid: str,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.guid = guid
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Run__apiList:
+    """_OmegaUp_Controllers_Run__apiList"""
+    runs: Sequence['_Run']
+    totalRuns: int
+
+    def __init__(
+        self,
+        *,
+        runs: Sequence[Dict[str, Any]],
+        totalRuns: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.runs = [_Run(**v) for v in runs]
+        self.totalRuns = totalRuns
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Run__apiSource:
+    """_OmegaUp_Controllers_Run__apiSource"""
+    compile_error: Optional[str]
+    details: Optional['_OmegaUp_Controllers_Run__apiSource_details']
+    source: str
+
+    def __init__(
+        self,
+        *,
+        source: str,
+        compile_error: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if compile_error is not None:
+            self.compile_error = compile_error
+        else:
+            self.compile_error = None
+        if details is not None:
+            self.details = _OmegaUp_Controllers_Run__apiSource_details(
+                **details)
+        else:
+            self.details = None
+        self.source = source
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Run__apiSource_details:
+    """_OmegaUp_Controllers_Run__apiSource_details"""
+    compile_meta: Optional[Dict[str, '_RunMetadata']]
+    contest_score: float
+    groups: Optional[
+        Sequence['_OmegaUp_Controllers_Run__apiSource_details_groups_entry']]
+    judged_by: str
+    max_score: Optional[float]
+    memory: Optional[float]
+    score: float
+    time: Optional[float]
+    verdict: str
+    wall_time: Optional[float]
+
+    def __init__(
+        self,
+        *,
+        contest_score: float,
+        judged_by: str,
+        score: float,
+        verdict: str,
+        compile_meta: Optional[Dict[str, Dict[str, Any]]] = None,
+        groups: Optional[Sequence[Dict[str, Any]]] = None,
+        max_score: Optional[float] = None,
+        memory: Optional[float] = None,
+        time: Optional[float] = None,
+        wall_time: Optional[float] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if compile_meta is not None:
+            self.compile_meta = {
+                k: _RunMetadata(**v)
+                for k, v in compile_meta.items()
+            }
+        else:
+            self.compile_meta = None
+        self.contest_score = contest_score
+        if groups is not None:
+            self.groups = [
+                _OmegaUp_Controllers_Run__apiSource_details_groups_entry(**v)
+                for v in groups
+            ]
+        else:
+            self.groups = None
+        self.judged_by = judged_by
+        if max_score is not None:
+            self.max_score = max_score
+        else:
+            self.max_score = None
+        if memory is not None:
+            self.memory = memory
+        else:
+            self.memory = None
+        self.score = score
+        if time is not None:
+            self.time = time
+        else:
+            self.time = None
+        self.verdict = verdict
+        if wall_time is not None:
+            self.wall_time = wall_time
+        else:
+            self.wall_time = None
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Run__apiSource_details_groups_entry:
+    """_OmegaUp_Controllers_Run__apiSource_details_groups_entry"""
+    cases: Sequence['_CaseResult']
+    contest_score: float
+    group: str
+    max_score: float
+    score: float
+
+    def __init__(
+        self,
+        *,
+        cases: Sequence[Dict[str, Any]],
+        contest_score: float,
+        group: str,
+        max_score: float,
+        score: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.cases = [_CaseResult(**v) for v in cases]
+        self.contest_score = contest_score
+        self.group = group
+        self.max_score = max_score
+        self.score = score
+
+
+@dataclasses.dataclass
+class _RunDetails:
+    """_RunDetails"""
+    admin: bool
+    alias: str
+    cases: Dict[str, '_ProblemCasesContents_value']
+    compile_error: Optional[str]
+    details: Optional['_RunDetails_details']
+    feedback: Sequence['_SubmissionFeedback']
+    guid: str
+    judged_by: Optional[str]
+    language: str
+    logs: Optional[str]
+    show_diff: str
+    source: Optional[str]
+    source_link: Optional[bool]
+    source_name: Optional[str]
+    source_url: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        admin: bool,
+        alias: str,
+        cases: Dict[str, Dict[str, Any]],
+        feedback: Sequence[Dict[str, Any]],
+        guid: str,
+        language: str,
+        show_diff: str,
+        compile_error: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        judged_by: Optional[str] = None,
+        logs: Optional[str] = None,
+        source: Optional[str] = None,
+        source_link: Optional[bool] = None,
+        source_name: Optional[str] = None,
+        source_url: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.admin = admin
+        self.alias = alias
+        self.cases = {
+            k: _ProblemCasesContents_value(**v)
+            for k, v in cases.items()
+        }
+        if compile_error is not None:
+            self.compile_error = compile_error
+        else:
+            self.compile_error = None
+        if details is not None:
+            self.details = _RunDetails_details(**details)
+        else:
+            self.details = None
+        self.feedback = [_SubmissionFeedback(**v) for v in feedback]
+        self.guid = guid
+        if judged_by is not None:
+            self.judged_by = judged_by
+        else:
+            self.judged_by = None
+        self.language = language
+        if logs is not None:
+            self.logs = logs
+        else:
+            self.logs = None
+        self.show_diff = show_diff
+        if source is not None:
+            self.source = source
+        else:
+            self.source = None
+        if source_link is not None:
+            self.source_link = source_link
+        else:
+            self.source_link = None
+        if source_name is not None:
+            self.source_name = source_name
+        else:
+            self.source_name = None
+        if source_url is not None:
+            self.source_url = source_url
+        else:
+            self.source_url = None
+
+
+@dataclasses.dataclass
+class _RunDetails_details:
+    """_RunDetails_details"""
+    compile_meta: Optional[Dict[str, '_RunMetadata']]
+    contest_score: float
+    groups: Optional[Sequence['_RunDetailsGroup']]
+    judged_by: str
+    max_score: Optional[float]
+    memory: Optional[float]
+    score: float
+    time: Optional[float]
+    verdict: str
+    wall_time: Optional[float]
+
+    def __init__(
+        self,
+        *,
+        contest_score: float,
+        judged_by: str,
+        score: float,
+        verdict: str,
+        compile_meta: Optional[Dict[str, Dict[str, Any]]] = None,
+        groups: Optional[Sequence[Dict[str, Any]]] = None,
+        max_score: Optional[float] = None,
+        memory: Optional[float] = None,
+        time: Optional[float] = None,
+        wall_time: Optional[float] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if compile_meta is not None:
+            self.compile_meta = {
+                k: _RunMetadata(**v)
+                for k, v in compile_meta.items()
+            }
+        else:
+            self.compile_meta = None
+        self.contest_score = contest_score
+        if groups is not None:
+            self.groups = [_RunDetailsGroup(**v) for v in groups]
+        else:
+            self.groups = None
+        self.judged_by = judged_by
+        if max_score is not None:
+            self.max_score = max_score
+        else:
+            self.max_score = None
+        if memory is not None:
+            self.memory = memory
+        else:
+            self.memory = None
+        self.score = score
+        if time is not None:
+            self.time = time
+        else:
+            self.time = None
+        self.verdict = verdict
+        if wall_time is not None:
+            self.wall_time = wall_time
+        else:
+            self.wall_time = None
+
+
+RunCreateResponse = _OmegaUp_Controllers_Run__apiCreate
+"""The return type of the RunCreate API."""
+
+RunStatusResponse = _Run
+"""The return type of the RunStatus API."""
+
+RunDisqualifyResponse = _OmegaUp_Controllers_Run__apiDisqualify
+"""The return type of the RunDisqualify API."""
+
+RunGetSubmissionFeedbackResponse = Sequence['_SubmissionFeedback']
+"""The return type of the RunGetSubmissionFeedback API."""
+
+RunDetailsResponse = _RunDetails
+"""The return type of the RunDetails API."""
+
+RunSourceResponse = _OmegaUp_Controllers_Run__apiSource
+"""The return type of the RunSource API."""
+
+RunCountsResponse = _OmegaUp_Controllers_Run__apiCounts
+"""The return type of the RunCounts API."""
+
+RunListResponse = _OmegaUp_Controllers_Run__apiList
+"""The return type of the RunList API."""
+
+
+class Run:
+    r"""RunController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def create(
+            self,
+            *,
+            contest_alias: str,
+            language: str,
+            problem_alias: str,
+            source: str,
+            problemset_id: Optional[Any] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> RunCreateResponse:
+        r"""Create a new run
+
+        Args:
+            contest_alias:
+            language:
+            problem_alias:
+            source:
+            problemset_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'contest_alias': contest_alias,
+            'language': language,
+            'problem_alias': problem_alias,
+            'source': source,
+        }
+        if problemset_id is not None:
+            parameters['problemset_id'] = str(problemset_id)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Run__apiCreate,
+            self._client.query('/api/run/create/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def status(
+            self,
+            *,
+            run_alias: str,
+            username: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> RunStatusResponse:
+        r"""Get basic details of a run
+
+        Args:
+            run_alias:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'run_alias': run_alias,
+        }
+        if username is not None:
+            parameters['username'] = username
+        return _decoder.decode(
+            _Run,
+            self._client.query('/api/run/status/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def rejudge(
+            self,
+            *,
+            run_alias: str,
+            debug: Optional[bool] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Re-sends a problem to Grader.
+
+        Args:
+            run_alias:
+            debug:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'run_alias': run_alias,
+        }
+        if debug is not None:
+            parameters['debug'] = str(debug)
+        self._client.query('/api/run/rejudge/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def disqualify(
+        self,
+        *,
+        contest_alias: Optional[str] = None,
+        problem_alias: Optional[str] = None,
+        run_alias: Optional[str] = None,
+        username: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> RunDisqualifyResponse:
+        r"""Disqualify one or more submissions based on the received parameters:
+
+        - When a run_alias is provided, it will only disqualify a single
+          submission.
+        - When run_alias is not provided, both the username and the contest_alias
+          are required.
+        - If a problem_alias is provided, all submissions belonging to the user
+          for this problem and contest will be disqualified.
+        - If a problem_alias is not provided, all submissions belonging to the
+          user in this contest will be disqualified.
+
+        Args:
+            contest_alias:
+            problem_alias:
+            run_alias:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if contest_alias is not None:
+            parameters['contest_alias'] = contest_alias
+        if problem_alias is not None:
+            parameters['problem_alias'] = problem_alias
+        if run_alias is not None:
+            parameters['run_alias'] = run_alias
+        if username is not None:
+            parameters['username'] = username
+        return _decoder.decode(
+            _OmegaUp_Controllers_Run__apiDisqualify,
+            self._client.query('/api/run/disqualify/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def requalify(
+            self,
+            *,
+            run_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Requalify a submission previously disqualified
+
+        Args:
+            run_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'run_alias': run_alias,
+        }
+        self._client.query('/api/run/requalify/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def getSubmissionFeedback(
+        self,
+        *,
+        run_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> RunGetSubmissionFeedbackResponse:
+        r"""Get all the comments related to a submission feedback
+
+        Args:
+            run_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'run_alias': run_alias,
+        }
+        return list(
+            _decoder.decode_each(
+                _SubmissionFeedback,
+                self._client.query('/api/run/getSubmissionFeedback/',
+                                   payload=parameters,
+                                   files_=files_,
+                                   timeout_=timeout_,
+                                   check_=check_),
+                timestamps=self._client.timestamps))
+
+    def details(
+            self,
+            *,
+            run_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> RunDetailsResponse:
+        r"""Gets the details of a run. Includes admin details if admin.
+
+        Args:
+            run_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'run_alias': run_alias,
+        }
+        return _decoder.decode(
+            _RunDetails,
+            self._client.query('/api/run/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def source(
+            self,
+            *,
+            run_alias: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> RunSourceResponse:
+        r"""Given the run alias, returns the source code and any compile errors if any
+        Used in the arena, any contestant can view its own codes and compile errors
+
+        Args:
+            run_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'run_alias': run_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Run__apiSource,
+            self._client.query('/api/run/source/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def counts(
+            self,
+            *,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> RunCountsResponse:
+        r"""Get total of last 6 months
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_Run__apiCounts,
+            self._client.query('/api/run/counts/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def list(
+            self,
+            *,
+            offset: int,
+            problem_alias: str,
+            rowcount: int,
+            username: str,
+            language: Optional[str] = None,
+            status: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> RunListResponse:
+        r"""Gets a list of latest runs overall
+
+        Args:
+            offset:
+            problem_alias:
+            rowcount:
+            username:
+            language:
+            status:
+            verdict:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'offset': str(offset),
+            'problem_alias': problem_alias,
+            'rowcount': str(rowcount),
+            'username': username,
+        }
+        if language is not None:
+            parameters['language'] = language
+        if status is not None:
+            parameters['status'] = status
+        if verdict is not None:
+            parameters['verdict'] = verdict
+        return _decoder.decode(
+            _OmegaUp_Controllers_Run__apiList,
+            self._client.query('/api/run/list/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def stream_list(
+            self,
+            *,
+            offset: int,
+            problem_alias: str,
+            rowcount: int,
+            username: str,
+            language: Optional[str] = None,
+            status: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> Iterator[_Run]:
+        r"""Gets a list of latest runs overall
+
+        Streaming variant of `list()` that parses the response
+        incrementally.
+
+        Args:
+            offset:
+            problem_alias:
+            rowcount:
+            username:
+            language:
+            status:
+            verdict:
+
+        Yields:
+            The runs, decoded one at a time as the response is received.
+        """
+        parameters: Dict[str, str] = {
+            'offset': str(offset),
+            'problem_alias': problem_alias,
+            'rowcount': str(rowcount),
+            'username': username,
+        }
+        if language is not None:
+            parameters['language'] = language
+        if status is not None:
+            parameters['status'] = status
+        if verdict is not None:
+            parameters['verdict'] = verdict
+        return _decoder.decode_stream(
+            _Run,
+            self._client.query_stream('/api/run/list/',
+                                      'runs',
+                                      payload=parameters,
+                                      files_=files_,
+                                      timeout_=timeout_,
+                                      check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_list(
+            self,
+            *,
+            problem_alias: str,
+            username: str,
+            language: Optional[str] = None,
+            status: Optional[str] = None,
+            verdict: Optional[str] = None,
+            # Out-of-band parameters:
+            page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+            prefetch_: bool = True,
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> Iterator[_Run]:
+        r"""Gets a list of latest runs overall
+
+        Paginated variant of `list()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            problem_alias:
+            username:
+            language:
+            status:
+            verdict:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.list,
+                                  problem_alias=problem_alias,
+                                  username=username,
+                                  language=language,
+                                  status=status,
+                                  verdict=verdict,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='runs',
+                               page='offset',
+                               page_size='rowcount',
+                               first_page=0,
+                               size=page_size_,
+                               total='totalRuns',
+                               prefetch=prefetch_)
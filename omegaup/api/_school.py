@@ -0,0 +1,169 @@
+"""The omegaUp School API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_School__apiCreate:
+    """_OmegaUp_Controllers_School__apiCreate"""
+    school_id: int
+
+    def __init__(
+        self,
+        *,
+        school_id: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.school_id = school_id
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_School__apiList:
+    """_OmegaUp_Controllers_School__apiList"""
+    results: Sequence['_SchoolListItem']
+
+    def __init__(
+        self,
+        *,
+        results: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.results = [_SchoolListItem(**v) for v in results]
+
+
+@dataclasses.dataclass
+class _SchoolListItem:
+    """_SchoolListItem"""
+    key: int
+    value: str
+
+    def __init__(
+        self,
+        *,
+        key: int,
+        value: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.key = key
+        self.value = value
+
+
+SchoolListResponse = _OmegaUp_Controllers_School__apiList
+"""The return type of the SchoolList API."""
+
+SchoolCreateResponse = _OmegaUp_Controllers_School__apiCreate
+"""The return type of the SchoolCreate API."""
+
+
+class School:
+    r"""SchoolController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def list(
+            self,
+            *,
+            query: Optional[str] = None,
+            term: Optional[str] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> SchoolListResponse:
+        r"""Gets a list of schools
+
+        Args:
+            query:
+            term:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if query is not None:
+            parameters['query'] = query
+        if term is not None:
+            parameters['term'] = term
+        return _decoder.decode(
+            _OmegaUp_Controllers_School__apiList,
+            self._client.query('/api/school/list/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def create(
+        self,
+        *,
+        name: str,
+        country_id: Optional[str] = None,
+        state_id: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> SchoolCreateResponse:
+        r"""Api to create new school
+
+        Args:
+            name:
+            country_id:
+            state_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'name': name,
+        }
+        if country_id is not None:
+            parameters['country_id'] = country_id
+        if state_id is not None:
+            parameters['state_id'] = state_id
+        return _decoder.decode(
+            _OmegaUp_Controllers_School__apiCreate,
+            self._client.query('/api/school/create/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def selectSchoolOfTheMonth(
+            self,
+            *,
+            school_id: int,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Selects a certain school as school of the month
+
+        Args:
+            school_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'school_id': str(school_id),
+        }
+        self._client.query('/api/school/selectSchoolOfTheMonth/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
@@ -0,0 +1,50 @@
+"""The omegaUp Scoreboard API and its response types."""
+
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional
+
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+class Scoreboard:
+    r"""ScoreboardController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def refresh(
+            self,
+            *,
+            alias: str,
+            course_alias: Optional[str] = None,
+            token: Optional[Any] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Returns a list of contests
+
+        Args:
+            alias:
+            course_alias:
+            token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+        }
+        if course_alias is not None:
+            parameters['course_alias'] = course_alias
+        if token is not None:
+            parameters['token'] = str(token)
+        self._client.query('/api/scoreboard/refresh/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
@@ -0,0 +1,310 @@
+"""The omegaUp Session API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import (
+    _ApiToken,
+    _AssociatedIdentity,
+)
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_DAO_VO_Identities:
+    """Type definition for the \\OmegaUp\\DAO\\VO\\Identities Data Object."""
+    country_id: Optional[str]
+    current_identity_school_id: Optional[int]
+    gender: Optional[str]
+    identity_id: Optional[int]
+    language_id: Optional[int]
+    name: Optional[str]
+    password: Optional[str]
+    state_id: Optional[str]
+    user_id: Optional[int]
+    username: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        country_id: Optional[str] = None,
+        current_identity_school_id: Optional[int] = None,
+        gender: Optional[str] = None,
+        identity_id: Optional[int] = None,
+        language_id: Optional[int] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+        state_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+        username: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        """Create a new \\OmegaUp\\DAO\\VO\\Identities Data Object."""
+        self.country_id = country_id
+        self.current_identity_school_id = current_identity_school_id
+        self.gender = gender
+        self.identity_id = identity_id
+        self.language_id = language_id
+        self.name = name
+        self.password = password
+        self.state_id = state_id
+        self.user_id = user_id
+        self.username = username
+
+
+@dataclasses.dataclass
+class _OmegaUp_DAO_VO_Users:
+    """Type definition for the \\OmegaUp\\DAO\\VO\\Users Data Object."""
+    birth_date: Optional[str]
+    creation_timestamp: Optional[datetime.datetime]
+    deletion_token: Optional[str]
+    facebook_user_id: Optional[str]
+    git_token: Optional[str]
+    has_competitive_objective: Optional[bool]
+    has_learning_objective: Optional[bool]
+    has_scholar_objective: Optional[bool]
+    has_teaching_objective: Optional[bool]
+    hide_problem_tags: Optional[bool]
+    in_mailing_list: Optional[bool]
+    is_private: Optional[bool]
+    main_email_id: Optional[int]
+    main_identity_id: Optional[int]
+    parent_email_id: Optional[int]
+    parent_email_verification_deadline: Optional[datetime.datetime]
+    parent_email_verification_initial: Optional[datetime.datetime]
+    parent_verified: Optional[bool]
+    parental_verification_token: Optional[str]
+    preferred_language: Optional[str]
+    reset_digest: Optional[str]
+    reset_sent_at: Optional[datetime.datetime]
+    scholar_degree: Optional[str]
+    user_id: Optional[int]
+    verification_id: Optional[str]
+    verified: Optional[bool]
+
+    def __init__(
+        self,
+        *,
+        birth_date: Optional[str] = None,
+        creation_timestamp: Optional[int] = None,
+        deletion_token: Optional[str] = None,
+        facebook_user_id: Optional[str] = None,
+        git_token: Optional[str] = None,
+        has_competitive_objective: Optional[bool] = None,
+        has_learning_objective: Optional[bool] = None,
+        has_scholar_objective: Optional[bool] = None,
+        has_teaching_objective: Optional[bool] = None,
+        hide_problem_tags: Optional[bool] = None,
+        in_mailing_list: Optional[bool] = None,
+        is_private: Optional[bool] = None,
+        main_email_id: Optional[int] = None,
+        main_identity_id: Optional[int] = None,
+        parent_email_id: Optional[int] = None,
+        parent_email_verification_deadline: Optional[int] = None,
+        parent_email_verification_initial: Optional[int] = None,
+        parent_verified: Optional[bool] = None,
+        parental_verification_token: Optional[str] = None,
+        preferred_language: Optional[str] = None,
+        reset_digest: Optional[str] = None,
+        reset_sent_at: Optional[int] = None,
+        scholar_degree: Optional[str] = None,
+        user_id: Optional[int] = None,
+        verification_id: Optional[str] = None,
+        verified: Optional[bool] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        """Create a new \\OmegaUp\\DAO\\VO\\Users Data Object."""
+        self.birth_date = birth_date
+        if creation_timestamp is not None:
+            self.creation_timestamp = datetime.datetime.fromtimestamp(
+                creation_timestamp)
+        else:
+            self.creation_timestamp = None
+        self.deletion_token = deletion_token
+        self.facebook_user_id = facebook_user_id
+        self.git_token = git_token
+        self.has_competitive_objective = has_competitive_objective
+        self.has_learning_objective = has_learning_objective
+        self.has_scholar_objective = has_scholar_objective
+        self.has_teaching_objective = has_teaching_objective
+        self.hide_problem_tags = hide_problem_tags
+        self.in_mailing_list = in_mailing_list
+        self.is_private = is_private
+        self.main_email_id = main_email_id
+        self.main_identity_id = main_identity_id
+        self.parent_email_id = parent_email_id
+        if parent_email_verification_deadline is not None:
+            self.parent_email_verification_deadline = datetime.datetime.fromtimestamp(
+                parent_email_verification_deadline)
+        else:
+            self.parent_email_verification_deadline = None
+        if parent_email_verification_initial is not None:
+            self.parent_email_verification_initial = datetime.datetime.fromtimestamp(
+                parent_email_verification_initial)
+        else:
+            self.parent_email_verification_initial = None
+        self.parent_verified = parent_verified
+        self.parental_verification_token = parental_verification_token
+        self.preferred_language = preferred_language
+        self.reset_digest = reset_digest
+        if reset_sent_at is not None:
+            self.reset_sent_at = datetime.datetime.fromtimestamp(reset_sent_at)
+        else:
+            self.reset_sent_at = None
+        self.scholar_degree = scholar_degree
+        self.user_id = user_id
+        self.verification_id = verification_id
+        self.verified = verified
+
+
+@dataclasses.dataclass
+class _CurrentSession:
+    """_CurrentSession"""
+    apiTokenId: Optional[int]
+    api_tokens: Sequence['_ApiToken']
+    associated_identities: Sequence['_AssociatedIdentity']
+    auth_token: Optional[str]
+    cacheKey: Optional[str]
+    classname: str
+    email: Optional[str]
+    identity: Optional[_OmegaUp_DAO_VO_Identities]
+    is_admin: bool
+    is_under_13_user: bool
+    loginIdentity: Optional[_OmegaUp_DAO_VO_Identities]
+    user: Optional[_OmegaUp_DAO_VO_Users]
+    user_verification_deadline: Optional[datetime.datetime]
+    valid: bool
+
+    def __init__(
+        self,
+        *,
+        api_tokens: Sequence[Dict[str, Any]],
+        associated_identities: Sequence[Dict[str, Any]],
+        classname: str,
+        is_admin: bool,
+        is_under_13_user: bool,
+        valid: bool,
+        apiTokenId: Optional[int] = None,
+        auth_token: Optional[str] = None,
+        cacheKey: Optional[str] = None,
+        email: Optional[str] = None,
+        identity: Optional[Dict[str, Any]] = None,
+        loginIdentity: Optional[Dict[str, Any]] = None,
+        user: Optional[Dict[str, Any]] = None,
+        user_verification_deadline: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if apiTokenId is not None:
+            self.apiTokenId = apiTokenId
+        else:
+            self.apiTokenId = None
+        self.api_tokens = [_ApiToken(**v) for v in api_tokens]
+        self.associated_identities = [
+            _AssociatedIdentity(**v) for v in associated_identities
+        ]
+        if auth_token is not None:
+            self.auth_token = auth_token
+        else:
+            self.auth_token = None
+        if cacheKey is not None:
+            self.cacheKey = cacheKey
+        else:
+            self.cacheKey = None
+        self.classname = classname
+        if email is not None:
+            self.email = email
+        else:
+            self.email = None
+        if identity is not None:
+            self.identity = _OmegaUp_DAO_VO_Identities(**identity)
+        else:
+            self.identity = None
+        self.is_admin = is_admin
+        self.is_under_13_user = is_under_13_user
+        if loginIdentity is not None:
+            self.loginIdentity = _OmegaUp_DAO_VO_Identities(**loginIdentity)
+        else:
+            self.loginIdentity = None
+        if user is not None:
+            self.user = _OmegaUp_DAO_VO_Users(**user)
+        else:
+            self.user = None
+        if user_verification_deadline is not None:
+            self.user_verification_deadline = datetime.datetime.fromtimestamp(
+                user_verification_deadline)
+        else:
+            self.user_verification_deadline = None
+        self.valid = valid
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Session__apiCurrentSession:
+    """_OmegaUp_Controllers_Session__apiCurrentSession"""
+    session: Optional['_CurrentSession']
+    time: int
+
+    def __init__(
+        self,
+        *,
+        time: int,
+        session: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if session is not None:
+            self.session = _CurrentSession(**session)
+        else:
+            self.session = None
+        self.time = time
+
+
+SessionCurrentSessionResponse = _OmegaUp_Controllers_Session__apiCurrentSession
+"""The return type of the SessionCurrentSession API."""
+
+
+class Session:
+    r"""Session controller handles sessions.
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def currentSession(
+        self,
+        *,
+        auth_token: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> SessionCurrentSessionResponse:
+        r"""Returns information about current session. In order to avoid one full
+        server roundtrip (about ~100msec on each pageload), it also returns the
+        current time to be able to calculate the time delta between the
+        contestant's machine and the server.
+
+        Args:
+            auth_token:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if auth_token is not None:
+            parameters['auth_token'] = auth_token
+        return _decoder.decode(
+            _OmegaUp_Controllers_Session__apiCurrentSession,
+            self._client.query('/api/session/currentSession/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
@@ -0,0 +1,347 @@
+"""The omegaUp Submission API and its response types."""
+
+import dataclasses
+import datetime
+import functools
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, Mapping, Optional, Sequence
+
+from omegaup import _decoder, _paginate
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_DAO_VO_SubmissionFeedback:
+    """Type definition for the \\OmegaUp\\DAO\\VO\\SubmissionFeedback Data Object."""
+    date: Optional[datetime.datetime]
+    feedback: Optional[str]
+    identity_id: Optional[int]
+    range_bytes_end: Optional[int]
+    range_bytes_start: Optional[int]
+    submission_feedback_id: Optional[int]
+    submission_id: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        date: Optional[int] = None,
+        feedback: Optional[str] = None,
+        identity_id: Optional[int] = None,
+        range_bytes_end: Optional[int] = None,
+        range_bytes_start: Optional[int] = None,
+        submission_feedback_id: Optional[int] = None,
+        submission_id: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        """Create a new \\OmegaUp\\DAO\\VO\\SubmissionFeedback Data Object."""
+        if date is not None:
+            self.date = datetime.datetime.fromtimestamp(date)
+        else:
+            self.date = None
+        self.feedback = feedback
+        self.identity_id = identity_id
+        self.range_bytes_end = range_bytes_end
+        self.range_bytes_start = range_bytes_start
+        self.submission_feedback_id = submission_feedback_id
+        self.submission_id = submission_id
+
+
+@dataclasses.dataclass
+class _OmegaUp_DAO_VO_SubmissionFeedbackThread:
+    """Type definition for the \\OmegaUp\\DAO\\VO\\SubmissionFeedbackThread Data Object."""
+    contents: Optional[str]
+    date: Optional[datetime.datetime]
+    identity_id: Optional[int]
+    submission_feedback_id: Optional[int]
+    submission_feedback_thread_id: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        contents: Optional[str] = None,
+        date: Optional[int] = None,
+        identity_id: Optional[int] = None,
+        submission_feedback_id: Optional[int] = None,
+        submission_feedback_thread_id: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        """Create a new \\OmegaUp\\DAO\\VO\\SubmissionFeedbackThread Data Object."""
+        self.contents = contents
+        if date is not None:
+            self.date = datetime.datetime.fromtimestamp(date)
+        else:
+            self.date = None
+        self.identity_id = identity_id
+        self.submission_feedback_id = submission_feedback_id
+        self.submission_feedback_thread_id = submission_feedback_thread_id
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Submission__apiList:
+    """_OmegaUp_Controllers_Submission__apiList"""
+    submissions: Sequence['_Submission']
+
+    def __init__(
+        self,
+        *,
+        submissions: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.submissions = [_Submission(**v) for v in submissions]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Submission__apiSetFeedback:
+    """_OmegaUp_Controllers_Submission__apiSetFeedback"""
+    submissionFeedback: Optional[_OmegaUp_DAO_VO_SubmissionFeedback]
+    submissionFeedbackThread: Optional[
+        _OmegaUp_DAO_VO_SubmissionFeedbackThread]
+
+    def __init__(
+        self,
+        *,
+        submissionFeedback: Optional[Dict[str, Any]] = None,
+        submissionFeedbackThread: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if submissionFeedback is not None:
+            self.submissionFeedback = _OmegaUp_DAO_VO_SubmissionFeedback(
+                **submissionFeedback)
+        else:
+            self.submissionFeedback = None
+        if submissionFeedbackThread is not None:
+            self.submissionFeedbackThread = _OmegaUp_DAO_VO_SubmissionFeedbackThread(
+                **submissionFeedbackThread)
+        else:
+            self.submissionFeedbackThread = None
+
+
+@dataclasses.dataclass
+class _Submission:
+    """_Submission"""
+    alias: str
+    language: str
+    memory: int
+    runtime: int
+    school_id: Optional[int]
+    school_name: Optional[str]
+    time: datetime.datetime
+    title: str
+    username: str
+    verdict: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        language: str,
+        memory: int,
+        runtime: int,
+        time: int,
+        title: str,
+        username: str,
+        verdict: str,
+        school_id: Optional[int] = None,
+        school_name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.language = language
+        self.memory = memory
+        self.runtime = runtime
+        if school_id is not None:
+            self.school_id = school_id
+        else:
+            self.school_id = None
+        if school_name is not None:
+            self.school_name = school_name
+        else:
+            self.school_name = None
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.title = title
+        self.username = username
+        self.verdict = verdict
+
+
+SubmissionListResponse = _OmegaUp_Controllers_Submission__apiList
+"""The return type of the SubmissionList API."""
+
+SubmissionSetFeedbackResponse = _OmegaUp_Controllers_Submission__apiSetFeedback
+"""The return type of the SubmissionSetFeedback API."""
+
+
+class Submission:
+    r"""SubmissionController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def list(
+        self,
+        *,
+        page: Optional[int] = None,
+        pageSize: Optional[int] = None,
+        username: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> SubmissionListResponse:
+        r"""Returns a list of submissions in the last 24 hours
+        for given page and username.
+
+        Args:
+            page:
+            pageSize:
+            username:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if page is not None:
+            parameters['page'] = str(page)
+        if pageSize is not None:
+            parameters['pageSize'] = str(pageSize)
+        if username is not None:
+            parameters['username'] = username
+        return _decoder.decode(
+            _OmegaUp_Controllers_Submission__apiList,
+            self._client.query('/api/submission/list/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def iter_list(
+        self,
+        *,
+        username: Optional[str] = None,
+        # Out-of-band parameters:
+        page_size_: int = _paginate.DEFAULT_PAGE_SIZE,
+        prefetch_: bool = True,
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> Iterator[_Submission]:
+        r"""Returns a list of submissions in the last 24 hours
+        for given page and username.
+
+        Paginated variant of `list()` that requests `page_size_` items
+        at a time until all of them have been returned. Unless
+        `prefetch_` is False, the next page is requested in the
+        background while the current one is being consumed.
+
+        Args:
+            username:
+
+        Yields:
+            The items of every page, in order.
+        """
+        fetch = functools.partial(self.list,
+                                  username=username,
+                                  files_=files_,
+                                  check_=check_,
+                                  timeout_=timeout_)
+        return _paginate.items(fetch,
+                               items='submissions',
+                               page='page',
+                               page_size='pageSize',
+                               first_page=1,
+                               size=page_size_,
+                               prefetch=prefetch_)
+
+    def setFeedback(
+        self,
+        *,
+        assignment_alias: str,
+        course_alias: str,
+        feedback: str,
+        guid: str,
+        range_bytes_end: Optional[int] = None,
+        range_bytes_start: Optional[int] = None,
+        submission_feedback_id: Optional[int] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> SubmissionSetFeedbackResponse:
+        r"""Updates the admin feedback for a submission or creates the request feedback,
+        also it creates a notification
+
+        Args:
+            assignment_alias:
+            course_alias:
+            feedback:
+            guid:
+            range_bytes_end:
+            range_bytes_start:
+            submission_feedback_id:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+            'feedback': feedback,
+            'guid': guid,
+        }
+        if range_bytes_end is not None:
+            parameters['range_bytes_end'] = str(range_bytes_end)
+        if range_bytes_start is not None:
+            parameters['range_bytes_start'] = str(range_bytes_start)
+        if submission_feedback_id is not None:
+            parameters['submission_feedback_id'] = str(submission_feedback_id)
+        return _decoder.decode(
+            _OmegaUp_Controllers_Submission__apiSetFeedback,
+            self._client.query('/api/submission/setFeedback/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def setFeedbackList(
+            self,
+            *,
+            assignment_alias: str,
+            course_alias: str,
+            feedback_list: str,
+            guid: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Updates the admin feedback for a submission or creates the request feedback,
+        also it creates a notification
+
+        Args:
+            assignment_alias:
+            course_alias:
+            feedback_list:
+            guid:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'assignment_alias': assignment_alias,
+            'course_alias': course_alias,
+            'feedback_list': feedback_list,
+            'guid': guid,
+        }
+        self._client.query('/api/submission/setFeedbackList/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
@@ -0,0 +1,140 @@
+"""The omegaUp Tag API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Tag__apiFrequentTags:
+    """_OmegaUp_Controllers_Tag__apiFrequentTags"""
+    frequent_tags: Sequence['_TagWithProblemCount']
+
+    def __init__(
+        self,
+        *,
+        frequent_tags: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.frequent_tags = [_TagWithProblemCount(**v) for v in frequent_tags]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Tag__apiList_entry:
+    """_OmegaUp_Controllers_Tag__apiList_entry"""
+    name: str
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+
+
+@dataclasses.dataclass
+class _TagWithProblemCount:
+    """_TagWithProblemCount"""
+    name: str
+    problemCount: int
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        problemCount: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.name = name
+        self.problemCount = problemCount
+
+
+TagListResponse = Sequence['_OmegaUp_Controllers_Tag__apiList_entry']
+"""The return type of the TagList API."""
+
+TagFrequentTagsResponse = _OmegaUp_Controllers_Tag__apiFrequentTags
+"""The return type of the TagFrequentTags API."""
+
+
+class Tag:
+    r"""TagController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def list(
+            self,
+            *,
+            query: Optional[Any] = None,
+            term: Optional[Any] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> TagListResponse:
+        r"""Gets a list of tags
+
+        Args:
+            query:
+            term:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if query is not None:
+            parameters['query'] = str(query)
+        if term is not None:
+            parameters['term'] = str(term)
+        return list(
+            _decoder.decode_each(
+                _OmegaUp_Controllers_Tag__apiList_entry,
+                self._client.query('/api/tag/list/',
+                                   payload=parameters,
+                                   files_=files_,
+                                   timeout_=timeout_,
+                                   check_=check_),
+                timestamps=self._client.timestamps))
+
+    def frequentTags(
+        self,
+        *,
+        problemLevel: str,
+        rows: int,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> TagFrequentTagsResponse:
+        r"""Return most frequent public tags of a certain level
+
+        Args:
+            problemLevel:
+            rows:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'problemLevel': problemLevel,
+            'rows': str(rows),
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_Tag__apiFrequentTags,
+            self._client.query('/api/tag/frequentTags/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
@@ -0,0 +1,426 @@
+"""The omegaUp TeamsGroup API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional, Sequence
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+from omegaup.api._types import (
+    _Identity,
+    _ListItem,
+)
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_TeamsGroup__apiDetails:
+    """_OmegaUp_Controllers_TeamsGroup__apiDetails"""
+    team_group: '_OmegaUp_Controllers_TeamsGroup__apiDetails_team_group'
+
+    def __init__(
+        self,
+        *,
+        team_group: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.team_group = _OmegaUp_Controllers_TeamsGroup__apiDetails_team_group(
+            **team_group)
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_TeamsGroup__apiDetails_team_group:
+    """_OmegaUp_Controllers_TeamsGroup__apiDetails_team_group"""
+    alias: str
+    create_time: int
+    description: str
+    name: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        create_time: int,
+        description: str,
+        name: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.create_time = create_time
+        self.description = description
+        self.name = name
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_TeamsGroup__apiTeams:
+    """_OmegaUp_Controllers_TeamsGroup__apiTeams"""
+    identities: Sequence['_Identity']
+
+    def __init__(
+        self,
+        *,
+        identities: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.identities = [_Identity(**v) for v in identities]
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_TeamsGroup__apiTeamsMembers:
+    """_OmegaUp_Controllers_TeamsGroup__apiTeamsMembers"""
+    pageNumber: int
+    teamsUsers: Sequence['_TeamMember']
+    totalRows: int
+
+    def __init__(
+        self,
+        *,
+        pageNumber: int,
+        teamsUsers: Sequence[Dict[str, Any]],
+        totalRows: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.pageNumber = pageNumber
+        self.teamsUsers = [_TeamMember(**v) for v in teamsUsers]
+        self.totalRows = totalRows
+
+
+@dataclasses.dataclass
+class _TeamMember:
+    """_TeamMember"""
+    classname: str
+    isMainUserIdentity: bool
+    name: Optional[str]
+    team_alias: str
+    team_name: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        isMainUserIdentity: bool,
+        team_alias: str,
+        username: str,
+        name: Optional[str] = None,
+        team_name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        self.isMainUserIdentity = isMainUserIdentity
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.team_alias = team_alias
+        if team_name is not None:
+            self.team_name = team_name
+        else:
+            self.team_name = None
+        self.username = username
+
+
+TeamsGroupDetailsResponse = _OmegaUp_Controllers_TeamsGroup__apiDetails
+"""The return type of the TeamsGroupDetails API."""
+
+TeamsGroupTeamsResponse = _OmegaUp_Controllers_TeamsGroup__apiTeams
+"""The return type of the TeamsGroupTeams API."""
+
+TeamsGroupListResponse = Sequence['_ListItem']
+"""The return type of the TeamsGroupList API."""
+
+TeamsGroupTeamsMembersResponse = _OmegaUp_Controllers_TeamsGroup__apiTeamsMembers
+"""The return type of the TeamsGroupTeamsMembers API."""
+
+
+class TeamsGroup:
+    r"""TeamsGroupController
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def details(
+        self,
+        *,
+        team_group_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> TeamsGroupDetailsResponse:
+        r"""Details of a team group
+
+        Args:
+            team_group_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'team_group_alias': team_group_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_TeamsGroup__apiDetails,
+            self._client.query('/api/teamsGroup/details/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def create(
+            self,
+            *,
+            alias: str,
+            description: str,
+            name: str,
+            numberOfContestants: Optional[int] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""New team group
+
+        Args:
+            alias:
+            description:
+            name:
+            numberOfContestants:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'description': description,
+            'name': name,
+        }
+        if numberOfContestants is not None:
+            parameters['numberOfContestants'] = str(numberOfContestants)
+        self._client.query('/api/teamsGroup/create/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def update(
+            self,
+            *,
+            alias: str,
+            description: str,
+            name: str,
+            numberOfContestants: Optional[int] = None,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Update an existing teams group
+
+        Args:
+            alias:
+            description:
+            name:
+            numberOfContestants:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'alias': alias,
+            'description': description,
+            'name': name,
+        }
+        if numberOfContestants is not None:
+            parameters['numberOfContestants'] = str(numberOfContestants)
+        self._client.query('/api/teamsGroup/update/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def teams(
+        self,
+        *,
+        team_group_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> TeamsGroupTeamsResponse:
+        r"""Teams of a teams group
+
+        Args:
+            team_group_alias:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'team_group_alias': team_group_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_TeamsGroup__apiTeams,
+            self._client.query('/api/teamsGroup/teams/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
+
+    def removeTeam(
+            self,
+            *,
+            team_group_alias: str,
+            usernameOrEmail: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Remove team from teams group
+
+        Args:
+            team_group_alias:
+            usernameOrEmail:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'team_group_alias': team_group_alias,
+            'usernameOrEmail': usernameOrEmail,
+        }
+        self._client.query('/api/teamsGroup/removeTeam/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def addMembers(
+            self,
+            *,
+            team_group_alias: str,
+            usernames: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Add one or more users to a given team
+
+        Args:
+            team_group_alias: The username of the team.
+            usernames: Username of all members to add
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'team_group_alias': team_group_alias,
+            'usernames': usernames,
+        }
+        self._client.query('/api/teamsGroup/addMembers/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def list(
+        self,
+        *,
+        query: Optional[str] = None,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> TeamsGroupListResponse:
+        r"""Gets a list of teams groups. This returns an array instead of an object
+        since it is used by typeahead.
+
+        Args:
+            query:
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        if query is not None:
+            parameters['query'] = query
+        return list(
+            _decoder.decode_each(
+                _ListItem,
+                self._client.query('/api/teamsGroup/list/',
+                                   payload=parameters,
+                                   files_=files_,
+                                   timeout_=timeout_,
+                                   check_=check_),
+                timestamps=self._client.timestamps))
+
+    def removeMember(
+            self,
+            *,
+            team_group_alias: str,
+            username: str,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT) -> None:
+        r"""Remove an existing team member of a teams group
+
+        Args:
+            team_group_alias: The username of the team
+            username: The username of user to remove
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'team_group_alias': team_group_alias,
+            'username': username,
+        }
+        self._client.query('/api/teamsGroup/removeMember/',
+                           payload=parameters,
+                           files_=files_,
+                           timeout_=timeout_,
+                           check_=check_)
+
+    def teamsMembers(
+        self,
+        *,
+        page: int,
+        page_size: int,
+        team_group_alias: str,
+        # Out-of-band parameters:
+        files_: Optional[Mapping[str, BinaryIO]] = None,
+        check_: bool = True,
+        timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> TeamsGroupTeamsMembersResponse:
+        r"""Get a list of team members of a teams group
+
+        Args:
+            page:
+            page_size:
+            team_group_alias: The username of the team.
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {
+            'page': str(page),
+            'page_size': str(page_size),
+            'team_group_alias': team_group_alias,
+        }
+        return _decoder.decode(
+            _OmegaUp_Controllers_TeamsGroup__apiTeamsMembers,
+            self._client.query('/api/teamsGroup/teamsMembers/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
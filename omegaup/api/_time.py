@@ -0,0 +1,63 @@
+"""The omegaUp Time API and its response types."""
+
+import dataclasses
+import datetime
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Mapping, Optional
+
+from omegaup import _decoder
+from omegaup.api._base import _DEFAULT_TIMEOUT
+
+if TYPE_CHECKING:
+    from omegaup.api import Client
+
+
+@dataclasses.dataclass
+class _OmegaUp_Controllers_Time__apiGet:
+    """_OmegaUp_Controllers_Time__apiGet"""
+    time: int
+
+    def __init__(
+        self,
+        *,
+        time: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.time = time
+
+
+TimeGetResponse = _OmegaUp_Controllers_Time__apiGet
+"""The return type of the TimeGet API."""
+
+
+class Time:
+    r"""TimeController
+
+    Used by arena to sync time between client and server from time to time
+    """
+    def __init__(self, client: 'Client') -> None:
+        self._client = client
+
+    def get(
+            self,
+            *,
+            # Out-of-band parameters:
+            files_: Optional[Mapping[str, BinaryIO]] = None,
+            check_: bool = True,
+            timeout_: datetime.timedelta = _DEFAULT_TIMEOUT
+    ) -> TimeGetResponse:
+        r"""Entry point for /time API
+
+        Returns:
+            The API result object.
+        """
+        parameters: Dict[str, str] = {}
+        return _decoder.decode(
+            _OmegaUp_Controllers_Time__apiGet,
+            self._client.query('/api/time/get/',
+                               payload=parameters,
+                               files_=files_,
+                               timeout_=timeout_,
+                               check_=check_),
+            timestamps=self._client.timestamps)
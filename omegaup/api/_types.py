@@ -0,0 +1,1185 @@
+"""Response types shared by several of the omegaUp API controllers."""
+
+import dataclasses
+import datetime
+
+from typing import Any, Dict, Optional, Sequence
+
+
+@dataclasses.dataclass
+class _ActivityEvent:
+    """_ActivityEvent"""
+    classname: str
+    event: '_Event'
+    ip: Optional[int]
+    time: datetime.datetime
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        event: Dict[str, Any],
+        time: int,
+        username: str,
+        ip: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        self.event = _Event(**event)
+        if ip is not None:
+            self.ip = ip
+        else:
+            self.ip = None
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ApiToken:
+    """_ApiToken"""
+    last_used: datetime.datetime
+    name: str
+    rate_limit: '_ApiToken_rate_limit'
+    timestamp: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        last_used: int,
+        name: str,
+        rate_limit: Dict[str, Any],
+        timestamp: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.last_used = datetime.datetime.fromtimestamp(last_used)
+        self.name = name
+        self.rate_limit = _ApiToken_rate_limit(**rate_limit)
+        self.timestamp = datetime.datetime.fromtimestamp(timestamp)
+
+
+@dataclasses.dataclass
+class _ApiToken_rate_limit:
+    """_ApiToken_rate_limit"""
+    limit: int
+    remaining: int
+    reset: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        limit: int,
+        remaining: int,
+        reset: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = datetime.datetime.fromtimestamp(reset)
+
+
+@dataclasses.dataclass
+class _AssociatedIdentity:
+    """_AssociatedIdentity"""
+    default: bool
+    username: str
+
+    def __init__(
+        self,
+        *,
+        default: bool,
+        username: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.default = default
+        self.username = username
+
+
+@dataclasses.dataclass
+class _CaseResult:
+    """_CaseResult"""
+    contest_score: float
+    max_score: float
+    meta: '_RunMetadata'
+    name: str
+    out_diff: Optional[str]
+    score: float
+    verdict: str
+
+    def __init__(
+        self,
+        *,
+        contest_score: float,
+        max_score: float,
+        meta: Dict[str, Any],
+        name: str,
+        score: float,
+        verdict: str,
+        out_diff: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.contest_score = contest_score
+        self.max_score = max_score
+        self.meta = _RunMetadata(**meta)
+        self.name = name
+        if out_diff is not None:
+            self.out_diff = out_diff
+        else:
+            self.out_diff = None
+        self.score = score
+        self.verdict = verdict
+
+
+@dataclasses.dataclass
+class _Clarification:
+    """_Clarification"""
+    answer: Optional[str]
+    assignment_alias: Optional[str]
+    author: str
+    clarification_id: int
+    contest_alias: Optional[str]
+    message: str
+    problem_alias: str
+    public: bool
+    receiver: Optional[str]
+    time: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        author: str,
+        clarification_id: int,
+        message: str,
+        problem_alias: str,
+        public: bool,
+        time: int,
+        answer: Optional[str] = None,
+        assignment_alias: Optional[str] = None,
+        contest_alias: Optional[str] = None,
+        receiver: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if answer is not None:
+            self.answer = answer
+        else:
+            self.answer = None
+        if assignment_alias is not None:
+            self.assignment_alias = assignment_alias
+        else:
+            self.assignment_alias = None
+        self.author = author
+        self.clarification_id = clarification_id
+        if contest_alias is not None:
+            self.contest_alias = contest_alias
+        else:
+            self.contest_alias = None
+        self.message = message
+        self.problem_alias = problem_alias
+        self.public = public
+        if receiver is not None:
+            self.receiver = receiver
+        else:
+            self.receiver = None
+        self.time = datetime.datetime.fromtimestamp(time)
+
+
+@dataclasses.dataclass
+class _CourseAssignment:
+    """_CourseAssignment"""
+    alias: str
+    assignment_type: str
+    description: str
+    finish_time: Optional[datetime.datetime]
+    has_runs: bool
+    max_points: float
+    name: str
+    opened: bool
+    order: int
+    problemCount: int
+    problemset_id: int
+    publish_time_delay: Optional[int]
+    scoreboard_url: str
+    scoreboard_url_admin: str
+    start_time: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        assignment_type: str,
+        description: str,
+        has_runs: bool,
+        max_points: float,
+        name: str,
+        opened: bool,
+        order: int,
+        problemCount: int,
+        problemset_id: int,
+        scoreboard_url: str,
+        scoreboard_url_admin: str,
+        start_time: int,
+        finish_time: Optional[int] = None,
+        publish_time_delay: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.assignment_type = assignment_type
+        self.description = description
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        self.has_runs = has_runs
+        self.max_points = max_points
+        self.name = name
+        self.opened = opened
+        self.order = order
+        self.problemCount = problemCount
+        self.problemset_id = problemset_id
+        if publish_time_delay is not None:
+            self.publish_time_delay = publish_time_delay
+        else:
+            self.publish_time_delay = None
+        self.scoreboard_url = scoreboard_url
+        self.scoreboard_url_admin = scoreboard_url_admin
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+
+
+@dataclasses.dataclass
+class _Event:
+    """_Event"""
+    courseAlias: Optional[str]
+    courseName: Optional[str]
+    name: str
+    problem: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        courseAlias: Optional[str] = None,
+        courseName: Optional[str] = None,
+        problem: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if courseAlias is not None:
+            self.courseAlias = courseAlias
+        else:
+            self.courseAlias = None
+        if courseName is not None:
+            self.courseName = courseName
+        else:
+            self.courseName = None
+        self.name = name
+        if problem is not None:
+            self.problem = problem
+        else:
+            self.problem = None
+
+
+@dataclasses.dataclass
+class _Identity:
+    """_Identity"""
+    classname: Optional[str]
+    country: Optional[str]
+    country_id: Optional[str]
+    gender: Optional[str]
+    name: Optional[str]
+    password: Optional[str]
+    school: Optional[str]
+    school_id: Optional[int]
+    school_name: Optional[str]
+    state: Optional[str]
+    state_id: Optional[str]
+    username: str
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        classname: Optional[str] = None,
+        country: Optional[str] = None,
+        country_id: Optional[str] = None,
+        gender: Optional[str] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+        school: Optional[str] = None,
+        school_id: Optional[int] = None,
+        school_name: Optional[str] = None,
+        state: Optional[str] = None,
+        state_id: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if classname is not None:
+            self.classname = classname
+        else:
+            self.classname = None
+        if country is not None:
+            self.country = country
+        else:
+            self.country = None
+        if country_id is not None:
+            self.country_id = country_id
+        else:
+            self.country_id = None
+        if gender is not None:
+            self.gender = gender
+        else:
+            self.gender = None
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if password is not None:
+            self.password = password
+        else:
+            self.password = None
+        if school is not None:
+            self.school = school
+        else:
+            self.school = None
+        if school_id is not None:
+            self.school_id = school_id
+        else:
+            self.school_id = None
+        if school_name is not None:
+            self.school_name = school_name
+        else:
+            self.school_name = None
+        if state is not None:
+            self.state = state
+        else:
+            self.state = None
+        if state_id is not None:
+            self.state_id = state_id
+        else:
+            self.state_id = None
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ListItem:
+    """_ListItem"""
+    key: str
+    value: str
+
+    def __init__(
+        self,
+        *,
+        key: str,
+        value: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.key = key
+        self.value = value
+
+
+@dataclasses.dataclass
+class _PageItem:
+    """_PageItem"""
+    class_: str
+    label: str
+    page: int
+    url: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        label: str,
+        page: int,
+        url: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.class_ = _kwargs['class']
+        self.label = label
+        self.page = page
+        if url is not None:
+            self.url = url
+        else:
+            self.url = None
+
+
+@dataclasses.dataclass
+class _ProblemCasesContents_value:
+    """_ProblemCasesContents_value"""
+    contestantOutput: Optional[str]
+    in_: str
+    out: str
+
+    def __init__(
+        self,
+        *,
+        out: str,
+        contestantOutput: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if contestantOutput is not None:
+            self.contestantOutput = contestantOutput
+        else:
+            self.contestantOutput = None
+        self.in_ = _kwargs['in']
+        self.out = out
+
+
+@dataclasses.dataclass
+class _ProblemQualityPayload:
+    """_ProblemQualityPayload"""
+    canNominateProblem: bool
+    dismissed: bool
+    dismissedBeforeAc: bool
+    language: Optional[str]
+    nominated: bool
+    nominatedBeforeAc: bool
+    problemAlias: str
+    solved: bool
+    tried: bool
+
+    def __init__(
+        self,
+        *,
+        canNominateProblem: bool,
+        dismissed: bool,
+        dismissedBeforeAc: bool,
+        nominated: bool,
+        nominatedBeforeAc: bool,
+        problemAlias: str,
+        solved: bool,
+        tried: bool,
+        language: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.canNominateProblem = canNominateProblem
+        self.dismissed = dismissed
+        self.dismissedBeforeAc = dismissedBeforeAc
+        if language is not None:
+            self.language = language
+        else:
+            self.language = None
+        self.nominated = nominated
+        self.nominatedBeforeAc = nominatedBeforeAc
+        self.problemAlias = problemAlias
+        self.solved = solved
+        self.tried = tried
+
+
+@dataclasses.dataclass
+class _ProblemStatement:
+    """_ProblemStatement"""
+    images: Dict[str, str]
+    language: str
+    markdown: str
+    sources: Dict[str, str]
+
+    def __init__(
+        self,
+        *,
+        images: Dict[str, str],
+        language: str,
+        markdown: str,
+        sources: Dict[str, str],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.images = {k: v for k, v in images.items()}
+        self.language = language
+        self.markdown = markdown
+        self.sources = {k: v for k, v in sources.items()}
+
+
+@dataclasses.dataclass
+class _ProblemVersion:
+    """_ProblemVersion"""
+    author: '_Signature'
+    commit: str
+    committer: '_Signature'
+    message: str
+    parents: Sequence[str]
+    tree: Dict[str, str]
+    version: str
+
+    def __init__(
+        self,
+        *,
+        author: Dict[str, Any],
+        commit: str,
+        committer: Dict[str, Any],
+        message: str,
+        parents: Sequence[str],
+        tree: Dict[str, str],
+        version: str,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.author = _Signature(**author)
+        self.commit = commit
+        self.committer = _Signature(**committer)
+        self.message = message
+        self.parents = [v for v in parents]
+        self.tree = {k: v for k, v in tree.items()}
+        self.version = version
+
+
+@dataclasses.dataclass
+class _ProblemsetProblem:
+    """_ProblemsetProblem"""
+    accepted: int
+    accepts_submissions: bool
+    alias: str
+    commit: str
+    difficulty: float
+    has_submissions: bool
+    input_limit: int
+    is_extra_problem: bool
+    languages: str
+    letter: Optional[str]
+    order: int
+    points: float
+    problem_id: Optional[int]
+    quality_payload: Optional['_ProblemQualityPayload']
+    quality_seal: bool
+    submissions: int
+    title: str
+    version: str
+    visibility: int
+    visits: int
+
+    def __init__(
+        self,
+        *,
+        accepted: int,
+        accepts_submissions: bool,
+        alias: str,
+        commit: str,
+        difficulty: float,
+        has_submissions: bool,
+        input_limit: int,
+        is_extra_problem: bool,
+        languages: str,
+        order: int,
+        points: float,
+        quality_seal: bool,
+        submissions: int,
+        title: str,
+        version: str,
+        visibility: int,
+        visits: int,
+        letter: Optional[str] = None,
+        problem_id: Optional[int] = None,
+        quality_payload: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.accepted = accepted
+        self.accepts_submissions = accepts_submissions
+        self.alias = alias
+        self.commit = commit
+        self.difficulty = difficulty
+        self.has_submissions = has_submissions
+        self.input_limit = input_limit
+        self.is_extra_problem = is_extra_problem
+        self.languages = languages
+        if letter is not None:
+            self.letter = letter
+        else:
+            self.letter = None
+        self.order = order
+        self.points = points
+        if problem_id is not None:
+            self.problem_id = problem_id
+        else:
+            self.problem_id = None
+        if quality_payload is not None:
+            self.quality_payload = _ProblemQualityPayload(**quality_payload)
+        else:
+            self.quality_payload = None
+        self.quality_seal = quality_seal
+        self.submissions = submissions
+        self.title = title
+        self.version = version
+        self.visibility = visibility
+        self.visits = visits
+
+
+@dataclasses.dataclass
+class _Run:
+    """_Run"""
+    alias: str
+    classname: str
+    contest_alias: Optional[str]
+    contest_score: Optional[float]
+    country: str
+    execution: Optional[str]
+    guid: str
+    language: str
+    memory: int
+    output: Optional[str]
+    penalty: int
+    runtime: int
+    score: float
+    score_by_group: Optional[Dict[str, Optional[float]]]
+    status: str
+    status_memory: Optional[str]
+    status_runtime: Optional[str]
+    submit_delay: int
+    suggestions: Optional[int]
+    time: datetime.datetime
+    type: Optional[str]
+    username: str
+    verdict: str
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        classname: str,
+        country: str,
+        guid: str,
+        language: str,
+        memory: int,
+        penalty: int,
+        runtime: int,
+        score: float,
+        status: str,
+        submit_delay: int,
+        time: int,
+        username: str,
+        verdict: str,
+        contest_alias: Optional[str] = None,
+        contest_score: Optional[float] = None,
+        execution: Optional[str] = None,
+        output: Optional[str] = None,
+        score_by_group: Optional[Dict[str, Optional[float]]] = None,
+        status_memory: Optional[str] = None,
+        status_runtime: Optional[str] = None,
+        suggestions: Optional[int] = None,
+        type: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.classname = classname
+        if contest_alias is not None:
+            self.contest_alias = contest_alias
+        else:
+            self.contest_alias = None
+        if contest_score is not None:
+            self.contest_score = contest_score
+        else:
+            self.contest_score = None
+        self.country = country
+        if execution is not None:
+            self.execution = execution
+        else:
+            self.execution = None
+        self.guid = guid
+        self.language = language
+        self.memory = memory
+        if output is not None:
+            self.output = output
+        else:
+            self.output = None
+        self.penalty = penalty
+        self.runtime = runtime
+        self.score = score
+        if score_by_group is not None:
+            self.score_by_group = {
+                k: v if v is not None else None
+                for k, v in score_by_group.items()
+            }
+        else:
+            self.score_by_group = None
+        self.status = status
+        if status_memory is not None:
+            self.status_memory = status_memory
+        else:
+            self.status_memory = None
+        if status_runtime is not None:
+            self.status_runtime = status_runtime
+        else:
+            self.status_runtime = None
+        self.submit_delay = submit_delay
+        if suggestions is not None:
+            self.suggestions = suggestions
+        else:
+            self.suggestions = None
+        self.time = datetime.datetime.fromtimestamp(time)
+        if type is not None:
+            self.type = type
+        else:
+            self.type = None
+        self.username = username
+        self.verdict = verdict
+
+
+@dataclasses.dataclass
+class _RunDetailsGroup:
+    """_RunDetailsGroup"""
+    cases: Sequence['_CaseResult']
+    contest_score: float
+    group: str
+    max_score: float
+    score: float
+    verdict: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        cases: Sequence[Dict[str, Any]],
+        contest_score: float,
+        group: str,
+        max_score: float,
+        score: float,
+        verdict: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.cases = [_CaseResult(**v) for v in cases]
+        self.contest_score = contest_score
+        self.group = group
+        self.max_score = max_score
+        self.score = score
+        if verdict is not None:
+            self.verdict = verdict
+        else:
+            self.verdict = None
+
+
+@dataclasses.dataclass
+class _RunMetadata:
+    """_RunMetadata"""
+    memory: int
+    sys_time: int
+    time: float
+    verdict: str
+    wall_time: float
+
+    def __init__(
+        self,
+        *,
+        memory: int,
+        sys_time: int,
+        time: float,
+        verdict: str,
+        wall_time: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.memory = memory
+        self.sys_time = sys_time
+        self.time = time
+        self.verdict = verdict
+        self.wall_time = wall_time
+
+
+@dataclasses.dataclass
+class _Scoreboard:
+    """_Scoreboard"""
+    finish_time: Optional[datetime.datetime]
+    problems: Sequence['_Scoreboard_problems_entry']
+    ranking: Sequence['_ScoreboardRankingEntry']
+    start_time: datetime.datetime
+    time: datetime.datetime
+    title: str
+
+    def __init__(
+        self,
+        *,
+        problems: Sequence[Dict[str, Any]],
+        ranking: Sequence[Dict[str, Any]],
+        start_time: int,
+        time: int,
+        title: str,
+        finish_time: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if finish_time is not None:
+            self.finish_time = datetime.datetime.fromtimestamp(finish_time)
+        else:
+            self.finish_time = None
+        self.problems = [_Scoreboard_problems_entry(**v) for v in problems]
+        self.ranking = [_ScoreboardRankingEntry(**v) for v in ranking]
+        self.start_time = datetime.datetime.fromtimestamp(start_time)
+        self.time = datetime.datetime.fromtimestamp(time)
+        self.title = title
+
+
+@dataclasses.dataclass
+class _ScoreboardEvent:
+    """_ScoreboardEvent"""
+    classname: str
+    country: str
+    delta: float
+    is_invited: bool
+    name: Optional[str]
+    problem: '_ScoreboardEvent_problem'
+    total: '_ScoreboardEvent_total'
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        country: str,
+        delta: float,
+        is_invited: bool,
+        problem: Dict[str, Any],
+        total: Dict[str, Any],
+        username: str,
+        name: Optional[str] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        self.country = country
+        self.delta = delta
+        self.is_invited = is_invited
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        self.problem = _ScoreboardEvent_problem(**problem)
+        self.total = _ScoreboardEvent_total(**total)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ScoreboardEvent_problem:
+    """_ScoreboardEvent_problem"""
+    alias: str
+    penalty: float
+    points: float
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        penalty: float,
+        points: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.penalty = penalty
+        self.points = points
+
+
+@dataclasses.dataclass
+class _ScoreboardEvent_total:
+    """_ScoreboardEvent_total"""
+    penalty: float
+    points: float
+
+    def __init__(
+        self,
+        *,
+        penalty: float,
+        points: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.penalty = penalty
+        self.points = points
+
+
+@dataclasses.dataclass
+class _ScoreboardRankingEntry:
+    """_ScoreboardRankingEntry"""
+    classname: str
+    country: str
+    is_invited: bool
+    name: Optional[str]
+    place: Optional[int]
+    problems: Sequence['_ScoreboardRankingProblem']
+    total: '_ScoreboardRankingEntry_total'
+    username: str
+
+    def __init__(
+        self,
+        *,
+        classname: str,
+        country: str,
+        is_invited: bool,
+        problems: Sequence[Dict[str, Any]],
+        total: Dict[str, Any],
+        username: str,
+        name: Optional[str] = None,
+        place: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.classname = classname
+        self.country = country
+        self.is_invited = is_invited
+        if name is not None:
+            self.name = name
+        else:
+            self.name = None
+        if place is not None:
+            self.place = place
+        else:
+            self.place = None
+        self.problems = [_ScoreboardRankingProblem(**v) for v in problems]
+        self.total = _ScoreboardRankingEntry_total(**total)
+        self.username = username
+
+
+@dataclasses.dataclass
+class _ScoreboardRankingEntry_total:
+    """_ScoreboardRankingEntry_total"""
+    penalty: float
+    points: float
+
+    def __init__(
+        self,
+        *,
+        penalty: float,
+        points: float,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.penalty = penalty
+        self.points = points
+
+
+@dataclasses.dataclass
+class _ScoreboardRankingProblem:
+    """_ScoreboardRankingProblem"""
+    alias: str
+    penalty: float
+    pending: Optional[int]
+    percent: float
+    place: Optional[int]
+    points: float
+    run_details: Optional['_ScoreboardRankingProblem_run_details']
+    runs: int
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        penalty: float,
+        percent: float,
+        points: float,
+        runs: int,
+        pending: Optional[int] = None,
+        place: Optional[int] = None,
+        run_details: Optional[Dict[str, Any]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.penalty = penalty
+        if pending is not None:
+            self.pending = pending
+        else:
+            self.pending = None
+        self.percent = percent
+        if place is not None:
+            self.place = place
+        else:
+            self.place = None
+        self.points = points
+        if run_details is not None:
+            self.run_details = _ScoreboardRankingProblem_run_details(
+                **run_details)
+        else:
+            self.run_details = None
+        self.runs = runs
+
+
+@dataclasses.dataclass
+class _ScoreboardRankingProblemDetailsGroup:
+    """_ScoreboardRankingProblemDetailsGroup"""
+    cases: Sequence['_ScoreboardRankingProblemDetailsGroup_cases_entry']
+
+    def __init__(
+        self,
+        *,
+        cases: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.cases = [
+            _ScoreboardRankingProblemDetailsGroup_cases_entry(**v)
+            for v in cases
+        ]
+
+
+@dataclasses.dataclass
+class _ScoreboardRankingProblemDetailsGroup_cases_entry:
+    """_ScoreboardRankingProblemDetailsGroup_cases_entry"""
+    meta: '_RunMetadata'
+
+    def __init__(
+        self,
+        *,
+        meta: Dict[str, Any],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.meta = _RunMetadata(**meta)
+
+
+@dataclasses.dataclass
+class _ScoreboardRankingProblem_run_details:
+    """_ScoreboardRankingProblem_run_details"""
+    cases: Optional[Sequence['_CaseResult']]
+    details: '_ScoreboardRankingProblem_run_details_details'
+
+    def __init__(
+        self,
+        *,
+        details: Dict[str, Any],
+        cases: Optional[Sequence[Dict[str, Any]]] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        if cases is not None:
+            self.cases = [_CaseResult(**v) for v in cases]
+        else:
+            self.cases = None
+        self.details = _ScoreboardRankingProblem_run_details_details(**details)
+
+
+@dataclasses.dataclass
+class _ScoreboardRankingProblem_run_details_details:
+    """_ScoreboardRankingProblem_run_details_details"""
+    groups: Sequence['_ScoreboardRankingProblemDetailsGroup']
+
+    def __init__(
+        self,
+        *,
+        groups: Sequence[Dict[str, Any]],
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.groups = [
+            _ScoreboardRankingProblemDetailsGroup(**v) for v in groups
+        ]
+
+
+@dataclasses.dataclass
+class _Scoreboard_problems_entry:
+    """_Scoreboard_problems_entry"""
+    alias: str
+    order: int
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        order: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.alias = alias
+        self.order = order
+
+
+@dataclasses.dataclass
+class _Signature:
+    """_Signature"""
+    email: str
+    name: str
+    time: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        email: str,
+        name: str,
+        time: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.email = email
+        self.name = name
+        self.time = datetime.datetime.fromtimestamp(time)
+
+
+@dataclasses.dataclass
+class _SubmissionFeedback:
+    """_SubmissionFeedback"""
+    author: str
+    author_classname: str
+    date: datetime.datetime
+    feedback: str
+    feedback_thread: Optional[Sequence['_SubmissionFeedbackThread']]
+    range_bytes_end: Optional[int]
+    range_bytes_start: Optional[int]
+    submission_feedback_id: int
+
+    def __init__(
+        self,
+        *,
+        author: str,
+        author_classname: str,
+        date: int,
+        feedback: str,
+        submission_feedback_id: int,
+        feedback_thread: Optional[Sequence[Dict[str, Any]]] = None,
+        range_bytes_end: Optional[int] = None,
+        range_bytes_start: Optional[int] = None,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.author = author
+        self.author_classname = author_classname
+        self.date = datetime.datetime.fromtimestamp(date)
+        self.feedback = feedback
+        if feedback_thread is not None:
+            self.feedback_thread = [
+                _SubmissionFeedbackThread(**v) for v in feedback_thread
+            ]
+        else:
+            self.feedback_thread = None
+        if range_bytes_end is not None:
+            self.range_bytes_end = range_bytes_end
+        else:
+            self.range_bytes_end = None
+        if range_bytes_start is not None:
+            self.range_bytes_start = range_bytes_start
+        else:
+            self.range_bytes_start = None
+        self.submission_feedback_id = submission_feedback_id
+
+
+@dataclasses.dataclass
+class _SubmissionFeedbackThread:
+    """_SubmissionFeedbackThread"""
+    author: str
+    authorClassname: str
+    submission_feedback_thread_id: int
+    text: str
+    timestamp: datetime.datetime
+
+    def __init__(
+        self,
+        *,
+        author: str,
+        authorClassname: str,
+        submission_feedback_thread_id: int,
+        text: str,
+        timestamp: int,
+        # Ignore any unknown arguments
+        **_kwargs: Any,
+    ):
+        self.author = author
+        self.authorClassname = authorClassname
+        self.submission_feedback_thread_id = submission_feedback_thread_id
+        self.text = text
+        self.timestamp = datetime.datetime.fromtimestamp(timestamp)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Fetches the whole omegaUp problem catalog.
+
+`Problem.list` returns one page of problems per request, so walking the
+catalog one page after the other pays one full round trip per page. This
+module requests the first page to learn the total number of problems, and
+then requests the rest of the pages concurrently with a bounded number of
+workers, yielding the problems in catalog order. Only as many pages as there
+are workers are requested ahead of the ones that have been consumed.
+
+The catalog can change while it is being crawled: a problem that is added
+or removed shifts the problems on every later page by one, which makes a
+problem show up twice (on both sides of a page boundary) or never. The
+duplicates are dropped by `alias`, and if the last page turns out to be full
+the crawl continues one page at a time until a short page is found.
+
+Sample usage:
+
+```python
+import omegaup.api
+import omegaup.catalog
+
+client = omegaup.api.Client(api_token='my API token')
+for problem in omegaup.catalog.iter_problems(client):
+    print(problem.alias, problem.title)
+```
+"""
+
+import collections
+import concurrent.futures
+import functools
+import itertools
+
+from typing import Any, Deque, Generator, Iterator, Set
+
+from omegaup import api
+
+_DEFAULT_PAGE_SIZE = 100
+"""The number of problems requested per page."""
+
+_DEFAULT_MAX_WORKERS = 8
+"""The maximum number of concurrent requests."""
+
+
+def iter_problems(
+        client: api.Client,
+        *,
+        only_quality_seal: bool = False,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        **kwargs: Any) -> Generator[api._ProblemListItem, None, None]:
+    """Yields every problem in the catalog, in order and without duplicates.
+
+    Args:
+        client: The API client.
+        only_quality_seal: Whether to only list problems with the quality
+            seal.
+        page_size: The number of problems requested per page.
+        max_workers: The maximum number of pages requested concurrently.
+        kwargs: Other filters forwarded to `omegaup.api.Problem.list`.
+
+    Yields:
+        The problems, in the order they are listed by the API. Closing the
+        generator cancels the pages that were requested ahead.
+    """
+    if page_size <= 0:
+        raise ValueError(f'Invalid page size: {page_size}')
+    if max_workers <= 0:
+        raise ValueError(f'Invalid number of workers: {max_workers}')
+    fetch = functools.partial(client.problem.list,
+                              only_quality_seal=only_quality_seal,
+                              rowcount=page_size,
+                              **kwargs)
+
+    seen: Set[str] = set()
+
+    def _unseen(
+            page: api.ProblemListResponse) -> Iterator[api._ProblemListItem]:
+        for problem in page.results:
+            if problem.alias in seen:
+                continue
+            seen.add(problem.alias)
+            yield problem
+
+    first = fetch(page=1)
+    yield from _unseen(first)
+    if len(first.results) < page_size:
+        return
+    last_page = max(1, -(-first.total // page_size))
+    last = first
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='omegaup-catalog')
+    pages = iter(range(2, last_page + 1))
+    # Only `max_workers` pages are requested ahead of the one being yielded,
+    # so a caller that stops early does not crawl the rest of the catalog.
+    pending: Deque['concurrent.futures.Future[api.ProblemListResponse]'] = (
+        collections.deque(
+            executor.submit(fetch, page=page)
+            for page in itertools.islice(pages, max_workers)))
+    try:
+        while pending:
+            last = pending.popleft().result()
+            for page in itertools.islice(pages, 1):
+                pending.append(executor.submit(fetch, page=page))
+            yield from _unseen(last)
+    finally:
+        # If the caller stopped early, do not wait for the pages that were
+        # requested ahead.
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+    page = last_page
+    while len(last.results) >= page_size:
+        page += 1
+        last = fetch(page=page)
+        yield from _unseen(last)
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Watches the clarifications of a contest or a course.
+
+`ClarificationWatcher` polls `Contest.clarifications` or
+`Course.clarifications` and only reports the clarifications that are new or
+that changed (e.g. because they were answered or made public) since the last
+poll. The lists are sorted by `clarification_id`, newest first (optionally
+with the unanswered ones before everything else), so each poll only walks the
+pages down to the oldest clarification that still needs to be looked at:
+the last one seen, or the oldest one that had not been answered yet.
+
+A single watcher can serve any number of subscribers: callbacks registered
+with `subscribe()`, and asynchronous iterators returned by `updates()`. When
+started, a background thread polls upstream, more often while clarifications
+keep arriving and backing off exponentially while nothing happens.
+
+Sample usage:
+
+```python
+import omegaup.api
+import omegaup.clarifications
+
+client = omegaup.api.Client(api_token='my API token')
+with omegaup.clarifications.contest_watcher(client, 'my-contest') as watcher:
+    watcher.subscribe(lambda c: print(c.author, c.message, c.answer))
+    input('Press enter to stop')
+```
+"""
+
+import asyncio
+import contextlib
+import datetime
+import functools
+import logging
+import threading
+
+from typing import (Any, AsyncGenerator, Callable, Dict, List, Optional,
+                    Sequence, Tuple)
+
+from omegaup import _paginate, api
+
+_DEFAULT_PAGE_SIZE = 100
+"""The number of clarifications requested per page."""
+
+_DEFAULT_MIN_INTERVAL = datetime.timedelta(seconds=5)
+"""The polling interval while clarifications keep arriving."""
+
+_DEFAULT_MAX_INTERVAL = datetime.timedelta(minutes=1)
+"""The polling interval after a long time without clarifications."""
+
+Callback = Callable[[api._Clarification], None]
+"""A function that is called with every new or updated clarification."""
+
+
+def _signature(clarification: api._Clarification) -> Tuple[Any, ...]:
+    """Returns the values of the fields that change after creation."""
+    return (clarification.answer, clarification.public,
+            clarification.message, clarification.receiver)
+
+
+class ClarificationWatcher:
+    """Reports new and updated clarifications to its subscribers.
+
+    Args:
+        fetch: The API function that lists the clarifications. It is called
+            with the `offset` and `rowcount` keyword arguments.
+        page_size: The number of clarifications requested per page.
+        min_interval: The polling interval while clarifications keep
+            arriving.
+        max_interval: The longest polling interval.
+    """
+    def __init__(
+            self,
+            fetch: Callable[..., Any],
+            *,
+            page_size: int = _DEFAULT_PAGE_SIZE,
+            min_interval: datetime.timedelta = _DEFAULT_MIN_INTERVAL,
+            max_interval: datetime.timedelta = _DEFAULT_MAX_INTERVAL) -> None:
+        self._fetch = fetch
+        self._page_size = page_size
+        self.min_interval = min_interval.total_seconds()
+        self.max_interval = max_interval.total_seconds()
+        self.interval = self.min_interval
+        self._signatures: Dict[int, Tuple[Any, ...]] = {}
+        self._last_id: Optional[int] = None
+        self._subscribers: List[Callback] = []
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Callback) -> Callable[[], None]:
+        """Registers a callback for new and updated clarifications.
+
+        Callbacks are invoked from the thread that polls.
+
+        Returns:
+            A function that unregisters the callback.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    def _low_water(self) -> Optional[int]:
+        """Returns the id of the oldest clarification that must be seen."""
+        if self._last_id is None:
+            return None
+        low = self._last_id
+        for clarification_id, signature in self._signatures.items():
+            if signature[0] is None and clarification_id < low:
+                low = clarification_id
+        return low
+
+    def _update(self, page: Sequence[api._Clarification],
+                changes: List[api._Clarification]) -> None:
+        """Records a page of clarifications and appends the changed ones."""
+        for clarification in page:
+            clarification_id = clarification.clarification_id
+            signature = _signature(clarification)
+            if self._signatures.get(clarification_id) != signature:
+                self._signatures[clarification_id] = signature
+                changes.append(clarification)
+            if self._last_id is None or clarification_id > self._last_id:
+                self._last_id = clarification_id
+
+    def poll(self) -> List[api._Clarification]:
+        """Fetches the new and updated clarifications and notifies them.
+
+        Returns:
+            The new and updated clarifications, in the order they were
+            listed.
+        """
+        with self._poll_lock:
+            low = self._low_water()
+            changes: List[api._Clarification] = []
+            # Usually only the first page is needed, so only prefetch the rest
+            # on the first poll.
+            pages = _paginate.pages(self._fetch,
+                                    items='clarifications',
+                                    page='offset',
+                                    page_size='rowcount',
+                                    first_page=0,
+                                    size=self._page_size,
+                                    prefetch=low is None)
+            with contextlib.closing(pages):
+                for page in pages:
+                    self._update(page, changes)
+                    last = page[-1]
+                    if (low is not None and last.answer is not None
+                            and last.clarification_id < low):
+                        break
+            if changes:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.max_interval, self.interval * 2)
+            with self._lock:
+                subscribers = self._subscribers[:]
+        for clarification in changes:
+            for callback in subscribers:
+                try:
+                    callback(clarification)
+                except Exception:  # pylint: disable=broad-except
+                    logging.getLogger('omegaup').exception(
+                        'Clarification callback failed')
+        return changes
+
+    async def updates(
+            self) -> AsyncGenerator[api._Clarification, None]:
+        """Yields the new and updated clarifications as they arrive.
+
+        The clarifications are delivered to the running event loop as soon
+        as they are fetched by `poll()`, usually in the background thread
+        started by `start()`.
+        """
+        loop = asyncio.get_running_loop()
+        queue: 'asyncio.Queue[api._Clarification]' = asyncio.Queue()
+
+        def _enqueue(clarification: api._Clarification) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, clarification)
+
+        unsubscribe = self.subscribe(_enqueue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger('omegaup').exception(
+                    'Failed to poll clarifications')
+                self.interval = min(self.max_interval, self.interval * 2)
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Starts polling in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='omegaup-clarifications',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> 'ClarificationWatcher':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+def contest_watcher(client: api.Client, contest_alias: str,
+                    **kwargs: Any) -> ClarificationWatcher:
+    """Returns a watcher for the clarifications of a contest.
+
+    Args:
+        client: The API client.
+        contest_alias: The alias of the contest.
+        kwargs: Arguments forwarded to `ClarificationWatcher`.
+    """
+    fetch = functools.partial(client.contest.clarifications,
+                              contest_alias=contest_alias)
+    return ClarificationWatcher(fetch, **kwargs)
+
+
+def course_watcher(client: api.Client, course_alias: str,
+                   **kwargs: Any) -> ClarificationWatcher:
+    """Returns a watcher for the clarifications of a course.
+
+    Args:
+        client: The API client.
+        course_alias: The alias of the course.
+        kwargs: Arguments forwarded to `ClarificationWatcher`.
+    """
+    fetch = functools.partial(client.course.clarifications,
+                              course_alias=course_alias)
+    return ClarificationWatcher(fetch, **kwargs)
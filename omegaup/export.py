@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""Exports omegaUp API responses to Apache Arrow, Parquet and Feather.
+
+The generated response types in `omegaup.api` are mapped to
+[Arrow](https://arrow.apache.org/docs/python/) schemas, and the rows are
+written one record batch per fetched page, so memory stays bounded by the
+page size rather than by the size of the contest or course.
+
+This module requires the optional `pyarrow` dependency (`pip install
+omegaup[export]`).
+
+Sample usage:
+
+```python
+import omegaup.api
+import omegaup.export
+
+client = omegaup.api.Client(api_token='my API token')
+omegaup.export.export_contest_runs(client,
+                                   'runs.parquet',
+                                   contest_alias='my-contest',
+                                   problem_alias='my-problem')
+```
+"""
+
+import collections.abc
+import dataclasses
+import datetime
+import functools
+import operator
+import typing
+
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Type
+
+import pyarrow  # type: ignore
+import pyarrow.ipc  # type: ignore
+import pyarrow.parquet  # type: ignore
+
+from omegaup import _decoder, _paginate, api
+
+_DEFAULT_PAGE_SIZE = 1000
+"""The number of rows requested per page when paginating."""
+
+_Converter = Optional[Callable[[Any], Any]]
+"""Converts a decoded value into something pyarrow accepts.
+
+`None` means that the value can be passed through as-is.
+"""
+
+
+def _arrow_type(tp: Any) -> Any:
+    """Maps a type annotation of a generated type to an Arrow type."""
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Union:
+        non_null = [arg for arg in args if arg is not _decoder._NoneType]
+        if len(non_null) == 1:
+            return _arrow_type(non_null[0])
+        if float in non_null:
+            return pyarrow.float64()
+        return pyarrow.string()
+    if origin is collections.abc.Sequence:
+        return pyarrow.list_(_arrow_type(args[0]))
+    if origin is dict:
+        return pyarrow.map_(_arrow_type(args[0]), _arrow_type(args[1]))
+    if dataclasses.is_dataclass(tp):
+        return pyarrow.struct(_fields(tp))
+    if tp is bool:
+        return pyarrow.bool_()
+    if tp is int:
+        return pyarrow.int64()
+    if tp is float:
+        return pyarrow.float64()
+    if tp is str:
+        return pyarrow.string()
+    if tp is datetime.datetime:
+        return pyarrow.timestamp('s', tz='UTC')
+    if tp is Any:
+        return pyarrow.string()
+    raise TypeError(f'Unsupported type annotation: {tp!r}')
+
+
+def _fields(cls: Any) -> List[Any]:
+    """Returns the list of Arrow fields for a generated type."""
+    hints = typing.get_type_hints(cls)
+    return [
+        pyarrow.field(field.name, _arrow_type(hints[field.name]))
+        for field in dataclasses.fields(cls)
+    ]
+
+
+def schema_for(cls: Type[Any]) -> Any:
+    """Returns the Arrow schema for one of the generated response types.
+
+    Args:
+        cls: A dataclass from `omegaup.api`, like `omegaup.api._Run`.
+
+    Returns:
+        A `pyarrow.Schema` with one column per field of `cls`.
+    """
+    return pyarrow.schema(_fields(cls))
+
+
+def _converter(tp: Any) -> _Converter:
+    """Returns the function that converts values of type `tp` for Arrow."""
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Union:
+        non_null = [arg for arg in args if arg is not _decoder._NoneType]
+        if len(non_null) == 1:
+            maybe_inner = _converter(non_null[0])
+            if maybe_inner is None:
+                return None
+            inner: Callable[[Any], Any] = maybe_inner
+            return lambda v: None if v is None else inner(v)
+        if float in non_null:
+            return lambda v: None if v is None else float(v)
+        return lambda v: None if v is None else str(v)
+    if origin is dict:
+        key = _converter(args[0])
+        value = _converter(args[1])
+        return lambda v: None if v is None else [(
+            k if key is None else key(k),
+            x if value is None else value(x),
+        ) for k, x in v.items()]
+    if origin is collections.abc.Sequence:
+        maybe_item = _converter(args[0])
+        if maybe_item is None:
+            return None
+        item: Callable[[Any], Any] = maybe_item
+        return lambda v: None if v is None else [item(x) for x in v]
+    if dataclasses.is_dataclass(tp):
+        hints = typing.get_type_hints(tp)
+        converters = [(field.name, _converter(hints[field.name]))
+                      for field in dataclasses.fields(tp)]
+        return lambda v: None if v is None else {
+            name: (getattr(v, name)
+                   if conv is None else conv(getattr(v, name)))
+            for name, conv in converters
+        }
+    if tp is datetime.datetime:
+        return lambda v: None if v is None else _decoder.epoch(v)
+    return None
+
+
+class RecordBatchBuilder:
+    """Converts sequences of generated objects into Arrow record batches.
+
+    The conversion is done column-wise with precomputed per-field
+    converters, so no intermediate per-row dictionaries are built for the
+    top-level fields.
+    """
+    def __init__(self, cls: Type[Any]) -> None:
+        self.cls = cls
+        self.schema = schema_for(cls)
+        hints = typing.get_type_hints(cls)
+        self._columns = [(field.name, operator.attrgetter(field.name),
+                          _converter(hints[field.name]))
+                         for field in dataclasses.fields(cls)]
+
+    def build(self, rows: Sequence[Any]) -> Any:
+        """Returns a `pyarrow.RecordBatch` with the contents of `rows`."""
+        arrays = []
+        for field, (_, getter, conv) in zip(self.schema, self._columns):
+            values = list(map(getter, rows))
+            if conv is not None:
+                values = [conv(v) for v in values]
+            arrays.append(pyarrow.array(values, type=field.type))
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+class Writer:
+    """Incrementally writes generated objects to a Parquet or Feather file.
+
+    Each call to `write()` appends one record batch, which allows callers to
+    write pages as they are fetched without holding the whole dataset in
+    memory.
+
+    Args:
+        path: The path of the output file.
+        cls: The generated type of the rows that will be written.
+        format: Either `'parquet'` or `'feather'`.
+        compression: The compression codec used by the writer.
+    """
+    def __init__(self,
+                 path: str,
+                 cls: Type[Any],
+                 *,
+                 format: str = 'parquet',
+                 compression: Optional[str] = 'zstd') -> None:
+        self._builder = RecordBatchBuilder(cls)
+        self.rows = 0
+        if format == 'parquet':
+            self._writer = pyarrow.parquet.ParquetWriter(
+                path, self._builder.schema, compression=compression)
+        elif format == 'feather':
+            self._writer = pyarrow.ipc.new_file(
+                path,
+                self._builder.schema,
+                options=pyarrow.ipc.IpcWriteOptions(compression=compression))
+        else:
+            raise ValueError(f'Unsupported export format: {format!r}')
+
+    def write(self, rows: Sequence[Any]) -> None:
+        """Appends `rows` to the output file as a single record batch."""
+        if not rows:
+            return
+        self._writer.write_batch(self._builder.build(rows))
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        """Flushes and closes the output file."""
+        self._writer.close()
+
+    def __enter__(self) -> 'Writer':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def export_pages(path: str,
+                 cls: Type[Any],
+                 pages: Iterable[Sequence[Any]],
+                 *,
+                 format: str = 'parquet') -> int:
+    """Writes every page of `pages` to `path`.
+
+    Args:
+        path: The path of the output file.
+        cls: The generated type of the rows in each page.
+        pages: An iterable of sequences of `cls`. It is consumed lazily.
+        format: Either `'parquet'` or `'feather'`.
+
+    Returns:
+        The total number of rows written.
+    """
+    with Writer(path, cls, format=format) as writer:
+        for page in pages:
+            writer.write(page)
+    return writer.rows
+
+
+def _contest_runs_pages(client: api.Client, page_size: int,
+                        **kwargs: Any) -> Iterator[Sequence[api._Run]]:
+    return _paginate.pages(functools.partial(client.contest.runs, **kwargs),
+                           items='runs',
+                           page='offset',
+                           page_size='rowcount',
+                           first_page=0,
+                           size=page_size,
+                           total='totalRuns')
+
+
+def export_contest_runs(client: api.Client,
+                        path: str,
+                        *,
+                        page_size: int = _DEFAULT_PAGE_SIZE,
+                        format: str = 'parquet',
+                        **kwargs: Any) -> int:
+    """Exports the runs of a contest, one page at a time.
+
+    Args:
+        client: The API client.
+        path: The path of the output file.
+        page_size: The number of runs requested per page.
+        format: Either `'parquet'` or `'feather'`.
+        kwargs: Arguments forwarded to `omegaup.api.Contest.runs`.
+
+    Returns:
+        The total number of rows written.
+    """
+    return export_pages(path,
+                        api._Run,
+                        _contest_runs_pages(client, page_size, **kwargs),
+                        format=format)
+
+
+def export_contest_scoreboard(client: api.Client,
+                              path: str,
+                              *,
+                              format: str = 'parquet',
+                              **kwargs: Any) -> int:
+    """Exports the ranking of a contest scoreboard.
+
+    Args:
+        client: The API client.
+        path: The path of the output file.
+        format: Either `'parquet'` or `'feather'`.
+        kwargs: Arguments forwarded to `omegaup.api.Contest.scoreboard`.
+
+    Returns:
+        The total number of rows written.
+    """
+    return export_scoreboard(path,
+                             client.contest.scoreboard(**kwargs),
+                             format=format)
+
+
+def export_scoreboard(path: str,
+                      scoreboard: api._Scoreboard,
+                      *,
+                      format: str = 'parquet') -> int:
+    """Exports the ranking of any scoreboard.
+
+    This works with the scoreboards of contests, course assignments and
+    problemsets, including the snapshots of
+    `omegaup.scoreboard.live.LiveScoreboard`.
+
+    Args:
+        path: The path of the output file.
+        scoreboard: The scoreboard.
+        format: Either `'parquet'` or `'feather'`.
+
+    Returns:
+        The total number of rows written.
+    """
+    return export_pages(path,
+                        api._ScoreboardRankingEntry, [scoreboard.ranking],
+                        format=format)
+
+
+def export_contest_report(client: api.Client,
+                          path: str,
+                          *,
+                          format: str = 'parquet',
+                          **kwargs: Any) -> int:
+    """Exports the ranking of a contest report.
+
+    Args:
+        client: The API client.
+        path: The path of the output file.
+        format: Either `'parquet'` or `'feather'`.
+        kwargs: Arguments forwarded to `omegaup.api.Contest.report`.
+
+    Returns:
+        The total number of rows written.
+    """
+    report = client.contest.report(**kwargs)
+    return export_pages(path,
+                        api._ContestReport, [report.ranking],
+                        format=format)
+
+
+def _students_progress_pages(
+        client: api.Client, page_size: int,
+        **kwargs: Any) -> Iterator[Sequence[api._StudentProgressInCourse]]:
+    page: Optional[int] = 1
+    while page is not None:
+        response = client.course.studentsProgress(page=page,
+                                                  length=page_size,
+                                                  **kwargs)
+        yield response.progress
+        if not response.progress:
+            return
+        page = response.nextPage
+
+
+def export_course_students_progress(client: api.Client,
+                                    path: str,
+                                    *,
+                                    page_size: int = 100,
+                                    format: str = 'parquet',
+                                    **kwargs: Any) -> int:
+    """Exports the progress of all the students of a course.
+
+    Args:
+        client: The API client.
+        path: The path of the output file.
+        page_size: The number of students requested per page.
+        format: Either `'parquet'` or `'feather'`.
+        kwargs: Arguments forwarded to `omegaup.api.Course.studentsProgress`.
+
+    Returns:
+        The total number of rows written.
+    """
+    return export_pages(path,
+                        api._StudentProgressInCourse,
+                        _students_progress_pages(client, page_size, **kwargs),
+                        format=format)
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""A local SQLite mirror of the omegaUp contest catalog.
+
+Listing contests and showing their details are the most common reads of a
+portal built on top of omegaUp, and they change rarely. `ContestMirror`
+keeps a copy of the contest list in a local SQLite database keyed by the
+contest alias, with indices on the start and finish times, the admission
+mode and the `recommended` and `archived` flags, so those reads can be
+served locally.
+
+Refreshing the mirror walks the contest lists and only rewrites the contests
+whose `last_updated` timestamp advanced. Neither `Contest.list` nor
+`Contest.adminList` can be sorted by `last_updated`, so a refresh cannot stop
+at the first page without newer contests and has to walk every page. The
+mirror remembers which of the two lists each contest was last seen in, and
+full walks remove the contests that are no longer in either of them, e.g.
+because they were deleted or hidden upstream. The public details of a contest
+are fetched the first time they are requested and reused until the contest is
+updated again.
+
+Sample usage:
+
+```python
+import omegaup.api
+import omegaup.mirror
+
+client = omegaup.api.Client(api_token='my API token')
+with omegaup.mirror.ContestMirror(client, 'contests.sqlite3') as mirror:
+    mirror.refresh()
+    for contest in mirror.query(admission_mode='public', recommended=True):
+        print(contest.alias, contest.title)
+```
+"""
+
+import dataclasses
+import datetime
+import sqlite3
+
+from typing import Any, Iterable, List, Optional, Tuple
+
+from omegaup import _decoder, api, codec
+
+_TAB_NAMES = ('current', 'future', 'past')
+"""The contest lists that are mirrored by default."""
+
+_LIST_FILTERS = frozenset(
+    ('active', 'admission_mode', 'participating', 'recommended'))
+"""The arguments of `Contest.list` that narrow down the listed contests."""
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS `contests` (
+        `alias` TEXT PRIMARY KEY,
+        `title` TEXT NOT NULL,
+        `admission_mode` TEXT NOT NULL,
+        `recommended` INTEGER NOT NULL,
+        `archived` INTEGER,
+        `start_time` INTEGER NOT NULL,
+        `finish_time` INTEGER NOT NULL,
+        `last_updated` INTEGER NOT NULL,
+        `details` BLOB,
+        `details_updated` INTEGER,
+        `public` INTEGER NOT NULL DEFAULT 0,
+        `admin` INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS `contests_start_time`
+        ON `contests` (`start_time`);
+    CREATE INDEX IF NOT EXISTS `contests_finish_time`
+        ON `contests` (`finish_time`);
+    CREATE INDEX IF NOT EXISTS `contests_admission_mode`
+        ON `contests` (`admission_mode`, `start_time`);
+    CREATE INDEX IF NOT EXISTS `contests_recommended`
+        ON `contests` (`recommended`, `start_time`);
+    CREATE INDEX IF NOT EXISTS `contests_archived`
+        ON `contests` (`archived`, `start_time`);
+'''
+
+_COLUMNS = ('`alias`, `title`, `admission_mode`, `recommended`, `archived`, '
+            '`start_time`, `finish_time`, `last_updated`')
+
+
+@dataclasses.dataclass
+class MirroredContest:
+    """The mirrored summary of a contest.
+
+    `archived` is `None` unless the contest was returned by
+    `Contest.adminList`.
+    """
+    alias: str
+    title: str
+    admission_mode: str
+    recommended: bool
+    archived: Optional[bool]
+    start_time: datetime.datetime
+    finish_time: datetime.datetime
+    last_updated: datetime.datetime
+
+
+class ContestMirror:
+    """A local, indexed copy of the omegaUp contest catalog.
+
+    Args:
+        client: The API client.
+        path: The path of the SQLite database. The default keeps it in
+            memory only.
+    """
+    def __init__(self, client: api.Client, path: str = ':memory:') -> None:
+        self._client = client
+        self._convert = _decoder.timestamp_converter(client.timestamps)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        columns = {
+            row[1]
+            for row in self._db.execute('PRAGMA table_info(`contests`);')
+        }
+        if 'public' not in columns:
+            # Mirrors created before the lists were tracked separately only
+            # know about the list each contest was last stored from.
+            with self._db:
+                self._db.executescript('''
+                    ALTER TABLE `contests`
+                        ADD COLUMN `public` INTEGER NOT NULL DEFAULT 0;
+                    ALTER TABLE `contests`
+                        ADD COLUMN `admin` INTEGER NOT NULL DEFAULT 0;
+                    UPDATE `contests` SET
+                        `public` = `archived` IS NULL,
+                        `admin` = `archived` IS NOT NULL;
+                ''')
+
+    def _store(self, contests: Iterable[Any],
+               archived: Optional[bool]) -> Tuple[int, List[str]]:
+        """Upserts `contests` into the mirror.
+
+        Contests whose `last_updated` did not advance are left untouched,
+        except for recording which list they were seen in and whether they
+        are archived. `archived` is `None` for the contests of
+        `Contest.list`.
+
+        Returns the number of contests that were added or updated, and the
+        aliases of all the stored contests.
+        """
+        listed = '`public`' if archived is None else '`admin`'
+        updated = 0
+        aliases: List[str] = []
+        for contest in contests:
+            aliases.append(contest.alias)
+            last_updated = _decoder.epoch(contest.last_updated)
+            row = self._db.execute(
+                'SELECT `last_updated` FROM `contests` WHERE `alias` = ?;',
+                (contest.alias, )).fetchone()
+            if row is not None and row[0] >= last_updated:
+                self._db.execute(
+                    f'UPDATE `contests` SET {listed} = 1, '
+                    '`archived` = COALESCE(?, `archived`) '
+                    'WHERE `alias` = ?;', (archived, contest.alias))
+                continue
+            updated += 1
+            self._db.execute(
+                'INSERT INTO `contests` '
+                f'({_COLUMNS}, {listed}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1) '
+                'ON CONFLICT (`alias`) DO UPDATE SET '
+                '`title` = excluded.`title`, '
+                '`admission_mode` = excluded.`admission_mode`, '
+                '`recommended` = excluded.`recommended`, '
+                '`archived` = COALESCE(excluded.`archived`, `archived`), '
+                '`start_time` = excluded.`start_time`, '
+                '`finish_time` = excluded.`finish_time`, '
+                '`last_updated` = excluded.`last_updated`, '
+                f'{listed} = 1;',
+                (contest.alias, contest.title, contest.admission_mode,
+                 contest.recommended, archived,
+                 _decoder.epoch(contest.start_time),
+                 _decoder.epoch(contest.finish_time), last_updated))
+        return updated, aliases
+
+    def _prune(self, seen: Iterable[str], admin: bool) -> int:
+        """Records which contests a full walk did not see.
+
+        The contests that are then in neither `Contest.list` nor
+        `Contest.adminList` are removed. The ones that are no longer in
+        `Contest.adminList` forget whether they are archived.
+
+        Returns the number of contests that were removed.
+        """
+        listed = '`admin`' if admin else '`public`'
+        stale = {
+            alias
+            for alias, in self._db.execute(
+                f'SELECT `alias` FROM `contests` WHERE {listed} = 1;')
+        }.difference(seen)
+        cleared = ', `archived` = NULL' if admin else ''
+        self._db.executemany(
+            f'UPDATE `contests` SET {listed} = 0{cleared} '
+            'WHERE `alias` = ?;', [(alias, ) for alias in stale])
+        removed = self._db.execute(
+            'DELETE FROM `contests` WHERE `public` = 0 AND `admin` = 0;')
+        return removed.rowcount
+
+    def refresh(self,
+                tab_names: Iterable[str] = _TAB_NAMES,
+                *,
+                query: str = '',
+                **kwargs: Any) -> int:
+        """Refreshes the mirror from `Contest.list`.
+
+        When every contest list is walked without a query nor filters that
+        narrow it down, the contests that are no longer listed by either
+        `Contest.list` or `Contest.adminList` are removed from the mirror.
+
+        Args:
+            tab_names: The contest lists that are walked.
+            query: The search query forwarded to `Contest.list`.
+            kwargs: Other filters forwarded to `Contest.list`.
+
+        Returns:
+            The number of contests that were added, updated or removed.
+        """
+        tab_names = list(tab_names)
+        updated = 0
+        seen: List[str] = []
+        with self._db:
+            for tab_name in tab_names:
+                count, aliases = self._store(
+                    self._client.contest.iter_list(query=query,
+                                                   tab_name=tab_name,
+                                                   **kwargs), None)
+                updated += count
+                seen.extend(aliases)
+            narrowed = any(kwargs.get(name) is not None
+                           for name in _LIST_FILTERS)
+            if (set(_TAB_NAMES) <= set(tab_names) and not query
+                    and not narrowed):
+                updated += self._prune(seen, admin=False)
+        return updated
+
+    def refresh_admin(self) -> int:
+        """Refreshes the mirror from `Contest.adminList`.
+
+        This also records which contests are archived: the ones that are
+        only listed when archived contests are requested. Contests that are
+        no longer listed by either `Contest.adminList` or `Contest.list` are
+        removed.
+
+        Returns:
+            The number of contests that were added, updated or removed.
+        """
+        with self._db:
+            updated, active = self._store(
+                self._client.contest.iter_adminList(), False)
+            active_aliases = set(active)
+            count, archived = self._store(
+                (contest for contest in self._client.contest.iter_adminList(
+                    show_archived=True)
+                 if contest.alias not in active_aliases), True)
+            removed = self._prune(active + archived, admin=True)
+        return updated + count + removed
+
+    def _row(self, row: Tuple[Any, ...]) -> MirroredContest:
+        convert = self._convert
+        return MirroredContest(
+            alias=row[0],
+            title=row[1],
+            admission_mode=row[2],
+            recommended=bool(row[3]),
+            archived=None if row[4] is None else bool(row[4]),
+            start_time=row[5] if convert is None else convert(row[5]),
+            finish_time=row[6] if convert is None else convert(row[6]),
+            last_updated=row[7] if convert is None else convert(row[7]),
+        )
+
+    def get(self, alias: str) -> Optional[MirroredContest]:
+        """Returns the mirrored contest with the given alias, if any."""
+        row = self._db.execute(
+            f'SELECT {_COLUMNS} FROM `contests` WHERE `alias` = ?;',
+            (alias, )).fetchone()
+        if row is None:
+            return None
+        return self._row(row)
+
+    def query(self,
+              *,
+              starts_after: Optional[datetime.datetime] = None,
+              starts_before: Optional[datetime.datetime] = None,
+              active_at: Optional[datetime.datetime] = None,
+              admission_mode: Optional[str] = None,
+              recommended: Optional[bool] = None,
+              archived: Optional[bool] = None,
+              limit: Optional[int] = None) -> List[MirroredContest]:
+        """Returns the mirrored contests that match all the given filters.
+
+        Args:
+            starts_after: Only contests that start at or after this time.
+            starts_before: Only contests that start before this time.
+            active_at: Only contests that are running at this time.
+            admission_mode: Only contests with this admission mode.
+            recommended: Only contests that are (or are not) recommended.
+            archived: Only contests that are (or are not) archived.
+            limit: The maximum number of contests returned.
+
+        Returns:
+            The matching contests, the ones that start last first.
+        """
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        if starts_after is not None:
+            conditions.append('`start_time` >= ?')
+            parameters.append(_decoder.epoch(starts_after))
+        if starts_before is not None:
+            conditions.append('`start_time` < ?')
+            parameters.append(_decoder.epoch(starts_before))
+        if active_at is not None:
+            conditions.append('`start_time` <= ? AND ? < `finish_time`')
+            active = _decoder.epoch(active_at)
+            parameters.extend((active, active))
+        if admission_mode is not None:
+            conditions.append('`admission_mode` = ?')
+            parameters.append(admission_mode)
+        if recommended is not None:
+            conditions.append('`recommended` = ?')
+            parameters.append(recommended)
+        if archived is not None:
+            conditions.append('`archived` = ?')
+            parameters.append(archived)
+        sql = f'SELECT {_COLUMNS} FROM `contests`'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY `start_time` DESC, `alias`'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            parameters.append(limit)
+        return [self._row(row) for row in self._db.execute(sql, parameters)]
+
+    def details(self, alias: str) -> api.ContestPublicDetailsResponse:
+        """Returns the public details of a contest.
+
+        The details are fetched with `Contest.publicDetails` and cached
+        until the mirror learns that the contest was updated.
+        """
+        row = self._db.execute(
+            'SELECT `details`, `details_updated` >= `last_updated` '
+            'FROM `contests` WHERE `alias` = ?;', (alias, )).fetchone()
+        if row is not None and row[0] is not None and row[1]:
+            return codec.from_bytes(api._ContestPublicDetails,
+                                    row[0],
+                                    timestamps=self._client.timestamps)
+        details = self._client.contest.publicDetails(contest_alias=alias)
+        if row is not None:
+            with self._db:
+                self._db.execute(
+                    'UPDATE `contests` '
+                    'SET `details` = ?, `details_updated` = `last_updated` '
+                    'WHERE `alias` = ?;', (codec.to_bytes(details), alias))
+        return details
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._db.close()
+
+    def __enter__(self) -> 'ContestMirror':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""Polls the notifications of many identities from a single process.
+
+`NotificationPoller` calls `Notification.myList` for every registered client,
+hands each notification that was not seen before to a callback and then marks
+all of the handled notifications of that identity as read with a single
+`Notification.readNotifications` call (split in batches of `ack_batch_size`).
+
+Identities are polled by a small pool of worker threads, driven by a single
+scheduler thread that keeps the identities in a heap ordered by their next
+poll time, so hundreds of identities only need a handful of threads. Every
+identity has its own polling interval, which drops to `min_interval` after
+it receives a notification and doubles (up to `max_interval`) after every
+poll that brings nothing new.
+
+Sample usage:
+
+```python
+import omegaup.api
+import omegaup.notifications
+
+def _handle(client, notification):
+    print(client.username, notification.contents.type)
+
+poller = omegaup.notifications.NotificationPoller(_handle)
+for username, token in [('bot1', 'token1'), ('bot2', 'token2')]:
+    poller.add(omegaup.api.Client(username=username, api_token=token))
+with poller:
+    input('Press enter to stop')
+```
+"""
+
+import concurrent.futures
+import dataclasses
+import datetime
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+from omegaup import api
+
+_DEFAULT_MIN_INTERVAL = datetime.timedelta(seconds=30)
+"""The polling interval of an identity that just got a notification."""
+
+_DEFAULT_MAX_INTERVAL = datetime.timedelta(minutes=10)
+"""The polling interval of an identity that has been idle for a long time."""
+
+_DEFAULT_ACK_BATCH_SIZE = 100
+"""The maximum number of notifications marked as read per request."""
+
+Callback = Callable[[api.Client, api._Notification], None]
+"""A function that handles a notification of one of the identities."""
+
+
+@dataclasses.dataclass
+class _Identity:
+    """The polling state of one identity."""
+    client: api.Client
+    interval: float
+    # The notifications that were handled but are still listed as unread.
+    seen: Set[int] = dataclasses.field(default_factory=set)
+    # The notifications that were handled but not yet marked as read.
+    pending: List[int] = dataclasses.field(default_factory=list)
+    # Serializes the polls of the identity, e.g. `poll_all()` and the
+    # background thread.
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock,
+                                             compare=False,
+                                             repr=False)
+
+
+class NotificationPoller:
+    """Polls and acknowledges the notifications of many identities.
+
+    Args:
+        callback: The function that is called with every new notification
+            and the client of the identity that received it. Notifications
+            are only marked as read after the callback returns; if it raises,
+            the notification is handed to it again in the next poll.
+        min_interval: The shortest polling interval of an identity.
+        max_interval: The longest polling interval of an identity.
+        max_workers: The maximum number of identities polled concurrently.
+        ack_batch_size: The maximum number of notifications marked as read
+            per `readNotifications` request.
+    """
+    def __init__(
+            self,
+            callback: Callback,
+            *,
+            min_interval: datetime.timedelta = _DEFAULT_MIN_INTERVAL,
+            max_interval: datetime.timedelta = _DEFAULT_MAX_INTERVAL,
+            max_workers: int = 16,
+            ack_batch_size: int = _DEFAULT_ACK_BATCH_SIZE) -> None:
+        if ack_batch_size <= 0:
+            raise ValueError(f'Invalid batch size: {ack_batch_size}')
+        self._callback = callback
+        self.min_interval = min_interval.total_seconds()
+        self.max_interval = max_interval.total_seconds()
+        self._max_workers = max_workers
+        self._ack_batch_size = ack_batch_size
+        self._identities: List[_Identity] = []
+        # Entries are (next poll time, sequence number, identity).
+        self._schedule: List[Tuple[float, int, _Identity]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._identities)
+
+    def _enqueue(self, identity: _Identity, when: float) -> None:
+        with self._lock:
+            heapq.heappush(self._schedule,
+                           (when, next(self._sequence), identity))
+        self._wake.set()
+
+    def add(self, client: api.Client) -> None:
+        """Starts polling the notifications of the identity of `client`."""
+        identity = _Identity(client=client, interval=self.min_interval)
+        with self._lock:
+            self._identities.append(identity)
+        self._enqueue(identity, time.monotonic())
+
+    def _acknowledge(self, identity: _Identity) -> None:
+        """Marks the handled notifications of an identity as read."""
+        while identity.pending:
+            batch = identity.pending[:self._ack_batch_size]
+            identity.client.notification.readNotifications(
+                notifications=','.join(str(n) for n in batch))
+            del identity.pending[:len(batch)]
+
+    def _poll(self, identity: _Identity) -> int:
+        """Polls one identity. Returns the number of new notifications."""
+        response = identity.client.notification.myList()
+        listed = {n.notification_id for n in response.notifications}
+        # Notifications that are no longer listed were already marked as
+        # read, and will not show up again.
+        identity.seen &= listed
+        handled = 0
+        for notification in response.notifications:
+            if notification.notification_id in identity.seen:
+                continue
+            try:
+                self._callback(identity.client, notification)
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger('omegaup').exception(
+                    'Failed to handle notification %d',
+                    notification.notification_id)
+                continue
+            identity.seen.add(notification.notification_id)
+            identity.pending.append(notification.notification_id)
+            handled += 1
+        self._acknowledge(identity)
+        if handled:
+            identity.interval = self.min_interval
+        else:
+            identity.interval = min(self.max_interval, identity.interval * 2)
+        return handled
+
+    def _safe_poll(self, identity: _Identity) -> int:
+        try:
+            with identity.lock:
+                return self._poll(identity)
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger('omegaup').exception(
+                'Failed to poll the notifications of %s',
+                identity.client.username)
+            identity.interval = min(self.max_interval, identity.interval * 2)
+            return 0
+
+    def poll_all(self) -> int:
+        """Polls every identity once, concurrently.
+
+        This can be called while polling in the background: the polls of
+        each identity never overlap, so no notification is handled twice.
+
+        Returns:
+            The number of new notifications that were handled.
+        """
+        with self._lock:
+            identities = self._identities[:]
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix='omegaup-notifications') as executor:
+            return sum(executor.map(self._safe_poll, identities))
+
+    def _due(self) -> Tuple[List[_Identity], Optional[float]]:
+        """Pops the identities that are due and returns the next wait."""
+        now = time.monotonic()
+        due: List[_Identity] = []
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                due.append(heapq.heappop(self._schedule)[2])
+            if not self._schedule:
+                return due, None
+            return due, self._schedule[0][0] - now
+
+    def _run(self) -> None:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix='omegaup-notifications') as executor:
+            while not self._stop.is_set():
+                self._wake.clear()
+                due, wait = self._due()
+                for identity in due:
+                    future = executor.submit(self._safe_poll, identity)
+                    future.add_done_callback(self._reschedule(identity))
+                self._wake.wait(wait)
+
+    def _reschedule(
+            self, identity: _Identity
+    ) -> Callable[['concurrent.futures.Future[int]'], None]:
+        def _done(future: 'concurrent.futures.Future[int]') -> None:
+            self._enqueue(identity, time.monotonic() + identity.interval)
+
+        return _done
+
+    def start(self) -> None:
+        """Starts polling in the background."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='omegaup-notifications',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops polling and waits for the polls in flight to finish."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> 'NotificationPoller':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""An in-process search index over the omegaUp problem catalog.
+
+Problem pickers usually call `Problem.listForTypeahead` or
+`Problem.list(query=...)` on every keystroke. `ProblemIndex` instead keeps
+the whole catalog in memory and answers those queries locally:
+
+- An inverted index maps every word of the titles and aliases (casefolded
+  and without accents) to the set of problems that contain it. The last word
+  of a query is matched as a prefix, so partial words work for typeahead.
+- Every tag, and the quality seal, maps to the set of problems that have it.
+- Difficulty ranges are checked on the candidates that survive the rest of
+  the filters.
+
+Sets of problems are represented as bitsets (Python integers where bit `i`
+is set if the problem with index `i` is in the set), so intersecting them is
+a handful of machine word operations per 64 problems.
+
+The index is built from `Problem.list` (which already includes the tags of
+every problem) with `omegaup.catalog.iter_problems()`, and `refresh()` only
+reindexes the problems that changed since the last refresh.
+
+Sample usage:
+
+```python
+import omegaup.api
+import omegaup.problemindex
+
+client = omegaup.api.Client(api_token='my API token')
+index = omegaup.problemindex.ProblemIndex()
+index.refresh(client)
+for problem in index.search('suma', tags=['problemTopicMath']):
+    print(problem.alias, problem.title)
+```
+"""
+
+import bisect
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from omegaup import _text, api, catalog
+
+
+def _bits(mask: int) -> Iterable[int]:
+    """Yields the indices of the set bits of `mask`, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _signature(problem: api._ProblemListItem) -> Tuple[Any, ...]:
+    """Returns the values of the indexed fields of a problem."""
+    return (
+        problem.title,
+        problem.difficulty,
+        problem.quality_seal,
+        tuple(sorted(tag.name for tag in problem.tags)),
+    )
+
+
+class ProblemIndex:
+    """An in-memory index of problems for local search and typeahead."""
+    def __init__(self) -> None:
+        self._problems: List[Optional[api._ProblemListItem]] = []
+        self._ids: Dict[str, int] = {}
+        self._live = 0
+        self._signatures: Dict[int, Tuple[Any, ...]] = {}
+        self._doc_tokens: Dict[int, Set[str]] = {}
+        self._tokens: Dict[str, int] = {}
+        self._tags: Dict[str, int] = {}
+        self._quality_seal = 0
+        self._sorted_tokens: Optional[List[str]] = None
+        self._prefixes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, alias: object) -> bool:
+        return alias in self._ids
+
+    def get(self, alias: str) -> Optional[api._ProblemListItem]:
+        """Returns the indexed problem with the given alias, if any."""
+        doc = self._ids.get(alias)
+        if doc is None:
+            return None
+        return self._problems[doc]
+
+    def _invalidate(self) -> None:
+        self._sorted_tokens = None
+        self._prefixes.clear()
+
+    def _unindex(self, doc: int) -> None:
+        """Removes a problem from the inverted indices."""
+        problem = self._problems[doc]
+        assert problem is not None
+        bit = 1 << doc
+        for token in self._doc_tokens.pop(doc):
+            mask = self._tokens[token] & ~bit
+            if mask:
+                self._tokens[token] = mask
+            else:
+                del self._tokens[token]
+        for tag in problem.tags:
+            mask = self._tags[tag.name] & ~bit
+            if mask:
+                self._tags[tag.name] = mask
+            else:
+                del self._tags[tag.name]
+        self._quality_seal &= ~bit
+        self._live &= ~bit
+
+    def _index(self, doc: int, problem: api._ProblemListItem) -> None:
+        """Adds a problem to the inverted indices."""
+        bit = 1 << doc
+        tokens = set(_text.tokenize(problem.title))
+        tokens.update(_text.tokenize(problem.alias))
+        tokens.add(_text.normalize(problem.alias))
+        self._doc_tokens[doc] = tokens
+        for token in tokens:
+            self._tokens[token] = self._tokens.get(token, 0) | bit
+        for tag in problem.tags:
+            self._tags[tag.name] = self._tags.get(tag.name, 0) | bit
+        if problem.quality_seal:
+            self._quality_seal |= bit
+        self._live |= bit
+        self._problems[doc] = problem
+        self._signatures[doc] = _signature(problem)
+
+    def add(self, problem: api._ProblemListItem) -> bool:
+        """Adds or updates a problem.
+
+        Returns whether the indexed fields of the problem changed.
+        """
+        doc = self._ids.get(problem.alias)
+        if doc is not None:
+            if self._signatures[doc] == _signature(problem):
+                self._problems[doc] = problem
+                return False
+            self._unindex(doc)
+        else:
+            doc = len(self._problems)
+            self._problems.append(None)
+        self._ids[problem.alias] = doc
+        self._index(doc, problem)
+        self._invalidate()
+        return True
+
+    def remove(self, alias: str) -> bool:
+        """Removes a problem. Returns whether it was in the index."""
+        doc = self._ids.pop(alias, None)
+        if doc is None:
+            return False
+        self._unindex(doc)
+        del self._signatures[doc]
+        self._problems[doc] = None
+        self._invalidate()
+        return True
+
+    def refresh(self, client: api.Client, **kwargs: Any) -> int:
+        """Synchronizes the index with the problem catalog.
+
+        Args:
+            client: The API client.
+            kwargs: Arguments forwarded to `omegaup.catalog.iter_problems`.
+
+        Returns:
+            The number of problems that were added, updated or removed.
+        """
+        changed = 0
+        seen: Set[str] = set()
+        for problem in catalog.iter_problems(client, **kwargs):
+            seen.add(problem.alias)
+            if self.add(problem):
+                changed += 1
+        for alias in [alias for alias in self._ids if alias not in seen]:
+            self.remove(alias)
+            changed += 1
+        if self._sorted_tokens is None:
+            # Sort the words now rather than during the first query.
+            self._sorted_tokens = sorted(self._tokens)
+        return changed
+
+    def _prefix(self, prefix: str) -> int:
+        """Returns the problems with a word that starts with `prefix`."""
+        mask = self._prefixes.get(prefix)
+        if mask is not None:
+            return mask
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._tokens)
+        tokens = self._sorted_tokens
+        mask = 0
+        for i in range(bisect.bisect_left(tokens, prefix), len(tokens)):
+            if not tokens[i].startswith(prefix):
+                break
+            mask |= self._tokens[tokens[i]]
+        self._prefixes[prefix] = mask
+        return mask
+
+    def search(self,
+               query: str = '',
+               *,
+               tags: Iterable[str] = (),
+               some_tags: Iterable[str] = (),
+               quality_seal: Optional[bool] = None,
+               min_difficulty: Optional[float] = None,
+               max_difficulty: Optional[float] = None,
+               limit: Optional[int] = 10) -> List[api._ProblemListItem]:
+        """Returns the problems that match all the given filters.
+
+        Args:
+            query: Words that must all appear in the title or the alias. The
+                last one can be incomplete.
+            tags: Tags that the problems must all have.
+            some_tags: Tags of which the problems must have at least one.
+            quality_seal: Only problems that have (or do not have) the
+                quality seal.
+            min_difficulty: The minimum difficulty of the problems.
+            max_difficulty: The maximum difficulty of the problems.
+            limit: The maximum number of problems returned.
+
+        Returns:
+            The matching problems, in the order in which they were first
+            indexed.
+        """
+        mask = self._live
+        words = _text.tokenize(query)
+        if words:
+            for word in words[:-1]:
+                mask &= self._tokens.get(word, 0)
+            mask &= self._prefix(words[-1])
+        for tag in tags:
+            mask &= self._tags.get(tag, 0)
+        some_tags = list(some_tags)
+        if some_tags:
+            some = 0
+            for tag in some_tags:
+                some |= self._tags.get(tag, 0)
+            mask &= some
+        if quality_seal is not None:
+            if quality_seal:
+                mask &= self._quality_seal
+            else:
+                mask &= ~self._quality_seal
+        result: List[api._ProblemListItem] = []
+        if limit is not None and limit <= 0:
+            return result
+        low = float('-inf') if min_difficulty is None else min_difficulty
+        high = float('inf') if max_difficulty is None else max_difficulty
+        check_difficulty = min_difficulty is not None
+        check_difficulty |= max_difficulty is not None
+        for doc in _bits(mask):
+            problem = self._problems[doc]
+            assert problem is not None
+            if check_difficulty:
+                difficulty = problem.difficulty
+                if difficulty is None or not low <= difficulty <= high:
+                    continue
+            result.append(problem)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def typeahead(self,
+                  prefix: str,
+                  limit: int = 10) -> List[api._ProblemListItem]:
+        """Returns the first problems whose title or alias match `prefix`."""
+        return self.search(prefix, limit=limit)
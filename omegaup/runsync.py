@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""Incremental synchronization of contest and course runs.
+
+`Contest.runs` and `Course.runs` list the runs newest first, so a dashboard
+that only wants to know what changed since it last looked does not need to
+download the whole list every time. `RunSync` keeps, for every contest or
+course it polls, a high-water mark (the time and guid of the newest run it
+has seen) plus a small summary of every run, in a local SQLite database. Each
+poll then only walks the pages down to the mark and reports the runs that
+are new or whose result changed.
+
+Runs that are still being graded are tracked until they are `ready`, so the
+verdict they eventually get is always reported. Rejudges of runs that were
+already graded are only noticed if they are at most `lookback` older than the
+mark; `RunSync.reset()` forces a full resynchronization.
+
+Sample usage:
+
+```python
+import omegaup.api
+import omegaup.runsync
+
+client = omegaup.api.Client(api_token='my API token')
+with omegaup.runsync.RunSync(client, 'runs.sqlite3') as sync:
+    for change in sync.poll_contest('my-contest', 'my-problem'):
+        print(change.run.guid, change.run.verdict, change.is_new)
+```
+"""
+
+import dataclasses
+import datetime
+import functools
+import json
+import sqlite3
+
+from typing import Any, Callable, List, Optional, Tuple
+
+from omegaup import _decoder, _paginate, api, codec
+
+_DEFAULT_PAGE_SIZE = 100
+"""The number of runs requested per page."""
+
+_DEFAULT_LOOKBACK = datetime.timedelta(minutes=5)
+"""How far behind the high-water mark runs are checked for changes."""
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS `marks` (
+        `scope` TEXT PRIMARY KEY,
+        `time` INTEGER NOT NULL,
+        `guid` TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS `runs` (
+        `scope` TEXT NOT NULL,
+        `guid` TEXT NOT NULL,
+        `time` INTEGER NOT NULL,
+        `status` TEXT NOT NULL,
+        `result` TEXT NOT NULL,
+        `data` BLOB NOT NULL,
+        PRIMARY KEY (`scope`, `guid`)
+    );
+    CREATE INDEX IF NOT EXISTS `runs_scope_time` ON `runs` (`scope`, `time`);
+'''
+
+
+@dataclasses.dataclass
+class RunChange:
+    """A run that is new, or whose result changed since the last poll."""
+    run: api._Run
+    is_new: bool
+
+
+def _result(run: api._Run) -> str:
+    """Returns a summary of the fields of a run that change on grading."""
+    return json.dumps([
+        run.status,
+        run.verdict,
+        run.score,
+        run.contest_score,
+        run.penalty,
+        run.runtime,
+        run.memory,
+        run.status_memory,
+        run.status_runtime,
+    ])
+
+
+def _scope(kind: str, *args: str, **kwargs: Any) -> str:
+    """Returns the key of the state of a polled list of runs."""
+    return json.dumps([kind, *args, sorted(kwargs.items())])
+
+
+class RunSync:
+    """Keeps track of the runs of contests and courses across polls.
+
+    Args:
+        client: The API client.
+        path: The path of the SQLite database where the state is stored. The
+            default keeps it in memory only.
+        page_size: The number of runs requested per page.
+        lookback: How far behind the high-water mark graded runs are checked
+            for changes.
+    """
+    def __init__(self,
+                 client: api.Client,
+                 path: str = ':memory:',
+                 *,
+                 page_size: int = _DEFAULT_PAGE_SIZE,
+                 lookback: datetime.timedelta = _DEFAULT_LOOKBACK) -> None:
+        self._client = client
+        self._page_size = page_size
+        self._lookback = int(lookback.total_seconds())
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+
+    def mark(self, scope: str) -> Optional[Tuple[int, str]]:
+        """Returns the high-water mark of `scope`, if it has been polled."""
+        row = self._db.execute(
+            'SELECT `time`, `guid` FROM `marks` WHERE `scope` = ?;',
+            (scope, )).fetchone()
+        if row is None:
+            return None
+        return (row[0], row[1])
+
+    def reset(self, scope: str) -> None:
+        """Forgets everything about `scope`."""
+        with self._db:
+            self._db.execute('DELETE FROM `marks` WHERE `scope` = ?;',
+                             (scope, ))
+            self._db.execute('DELETE FROM `runs` WHERE `scope` = ?;',
+                             (scope, ))
+
+    def runs(self, scope: str) -> List[api._Run]:
+        """Returns all the known runs of `scope`, newest first."""
+        return [
+            codec.from_bytes(api._Run,
+                             data,
+                             timestamps=self._client.timestamps)
+            for (data, ) in self._db.execute(
+                'SELECT `data` FROM `runs` WHERE `scope` = ? '
+                'ORDER BY `time` DESC, `guid` DESC;', (scope, ))
+        ]
+
+    def _cutoff(self, scope: str, mark: Tuple[int, str]) -> int:
+        """Returns the time of the oldest run that must be fetched."""
+        cutoff = mark[0] - self._lookback
+        row = self._db.execute(
+            'SELECT MIN(`time`) FROM `runs` '
+            'WHERE `scope` = ? AND `status` != \'ready\';',
+            (scope, )).fetchone()
+        if row[0] is not None:
+            cutoff = min(cutoff, row[0])
+        return cutoff
+
+    def poll(self, scope: str, fetch: Callable[..., Any]) -> List[RunChange]:
+        """Fetches the runs of `scope` that changed since the last poll.
+
+        Args:
+            scope: The key under which the state is stored.
+            fetch: The API function that lists the runs. It is called with
+                the `offset` and `rowcount` keyword arguments, and it must
+                return an object with `runs` and `totalRuns` fields.
+
+        Returns:
+            The new and changed runs, newest first.
+        """
+        mark = self.mark(scope)
+        cutoff = None if mark is None else self._cutoff(scope, mark)
+        changes: List[RunChange] = []
+        newest = mark
+        with self._db:
+            for page in _paginate.pages(fetch,
+                                        items='runs',
+                                        page='offset',
+                                        page_size='rowcount',
+                                        first_page=0,
+                                        size=self._page_size,
+                                        total='totalRuns',
+                                        prefetch=mark is None):
+                for run in page:
+                    time = _decoder.epoch(run.time)
+                    if newest is None or (time, run.guid) > newest:
+                        newest = (time, run.guid)
+                    result = _result(run)
+                    row = self._db.execute(
+                        'SELECT `result` FROM `runs` '
+                        'WHERE `scope` = ? AND `guid` = ?;',
+                        (scope, run.guid)).fetchone()
+                    if row is not None and row[0] == result:
+                        continue
+                    changes.append(RunChange(run=run, is_new=row is None))
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO `runs` '
+                        'VALUES (?, ?, ?, ?, ?, ?);',
+                        (scope, run.guid, time, run.status, result,
+                         codec.to_bytes(run)))
+                if (cutoff is not None
+                        and _decoder.epoch(page[-1].time) < cutoff):
+                    break
+            if newest is not None and newest != mark:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO `marks` VALUES (?, ?, ?);',
+                    (scope, newest[0], newest[1]))
+        return changes
+
+    def poll_contest(self, contest_alias: str, problem_alias: str,
+                     **kwargs: Any) -> List[RunChange]:
+        """Fetches the runs of a contest that changed since the last poll.
+
+        Args:
+            contest_alias: The alias of the contest.
+            problem_alias: The alias of the problem.
+            kwargs: Other filters forwarded to `omegaup.api.Contest.runs`.
+
+        Returns:
+            The new and changed runs, newest first.
+        """
+        return self.poll(
+            _scope('contest', contest_alias, problem_alias, **kwargs),
+            functools.partial(self._client.contest.runs,
+                              contest_alias=contest_alias,
+                              problem_alias=problem_alias,
+                              **kwargs))
+
+    def poll_course(self, course_alias: str, assignment_alias: str,
+                    **kwargs: Any) -> List[RunChange]:
+        """Fetches the runs of a course assignment that changed since the
+        last poll.
+
+        Args:
+            course_alias: The alias of the course.
+            assignment_alias: The alias of the assignment.
+            kwargs: Other filters forwarded to `omegaup.api.Course.runs`.
+
+        Returns:
+            The new and changed runs, newest first.
+        """
+        return self.poll(
+            _scope('course', course_alias, assignment_alias, **kwargs),
+            functools.partial(self._client.course.runs,
+                              course_alias=course_alias,
+                              assignment_alias=assignment_alias,
+                              **kwargs))
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._db.close()
+
+    def __enter__(self) -> 'RunSync':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
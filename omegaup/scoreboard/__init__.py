@@ -0,0 +1,29 @@
+"""Local computation of scoreboards.
+
+This is composed of the following modules:
+
+- [**`omegaup.scoreboard.engine`**](./scoreboard/engine/) keeps a
+  scoreboard up to date by applying scoreboard events to a snapshot.
+- [**`omegaup.scoreboard.live`**](./scoreboard/live/) keeps the
+  scoreboards of contests, course assignments and problemsets up to date
+  the same way, and refreshes many of them concurrently.
+- [**`omegaup.scoreboard.merge`**](./scoreboard/merge/) merges the
+  scoreboards of several contests like `Contest.scoreboardMerge`.
+- [**`omegaup.scoreboard.ranking`**](./scoreboard/ranking/) ranks whole
+  scoreboards under any contest rules with NumPy. Requires the optional
+  `numpy` dependency.
+- [**`omegaup.scoreboard.diff`**](./scoreboard/diff/) computes, encodes and
+  applies minimal deltas between scoreboard snapshots.
+- [**`omegaup.scoreboard.group`**](./scoreboard/group/) aggregates weighted
+  group scoreboards locally, like `GroupScoreboard.details`.
+- [**`omegaup.scoreboard.history`**](./scoreboard/history/) answers
+  "scoreboard as of minute t" queries from checkpoints and indexed events.
+- [**`omegaup.scoreboard.resolver`**](./scoreboard/resolver/) precomputes
+  the reveal sequence of a frozen scoreboard for award ceremonies.
+- [**`omegaup.scoreboard.subscription`**](./scoreboard/subscription/) polls
+  a scoreboard at a rate that depends on the phase of the contest and shares
+  every poll among many local consumers.
+- [**`omegaup.scoreboard.server`**](./scoreboard/server/) streams
+  scoreboard snapshots and deltas to many clients over Server-Sent Events,
+  with a single upstream subscription per contest.
+"""
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""An indexable skip list."""
+
+import random
+
+from typing import Any, Iterator, List, Optional
+
+_MAX_LEVELS = 24
+"""Enough levels for about 2**24 elements."""
+
+
+class _Node:
+    """A node of the skip list."""
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key: Any, levels: int) -> None:
+        self.key = key
+        self.next: List[Optional['_Node']] = [None] * levels
+        # The number of elements between this node and the next one in each
+        # level, counting the next one.
+        self.width = [1] * levels
+
+
+class SkipList:
+    """A sorted list of unique keys.
+
+    Insertions, removals, rank queries and positional lookups all take
+    O(log n) expected time.
+    """
+    def __init__(self) -> None:
+        self._head = _Node(None, _MAX_LEVELS)
+        self._size = 0
+        self._random = random.Random(0)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _levels(self) -> int:
+        levels = 1
+        while levels < _MAX_LEVELS and self._random.random() < 0.5:
+            levels += 1
+        return levels
+
+    def add(self, key: Any) -> None:
+        """Inserts a key, which must not be in the list already."""
+        chain: List[_Node] = [self._head] * _MAX_LEVELS
+        steps = [0] * _MAX_LEVELS
+        node = self._head
+        for level in reversed(range(_MAX_LEVELS)):
+            successor = node.next[level]
+            while successor is not None and successor.key < key:
+                steps[level] += node.width[level]
+                node = successor
+                successor = node.next[level]
+            chain[level] = node
+        levels = self._levels()
+        inserted = _Node(key, levels)
+        distance = 0
+        for level in range(levels):
+            previous = chain[level]
+            inserted.next[level] = previous.next[level]
+            previous.next[level] = inserted
+            inserted.width[level] = previous.width[level] - distance
+            previous.width[level] = distance + 1
+            distance += steps[level]
+        for level in range(levels, _MAX_LEVELS):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key: Any) -> None:
+        """Removes a key. Raises `KeyError` if it is not in the list."""
+        chain: List[_Node] = [self._head] * _MAX_LEVELS
+        node = self._head
+        for level in reversed(range(_MAX_LEVELS)):
+            successor = node.next[level]
+            while successor is not None and successor.key < key:
+                node = successor
+                successor = node.next[level]
+            chain[level] = node
+        removed = chain[0].next[0]
+        if removed is None or removed.key != key:
+            raise KeyError(key)
+        for level in range(len(removed.next)):
+            previous = chain[level]
+            previous.width[level] += removed.width[level] - 1
+            previous.next[level] = removed.next[level]
+        for level in range(len(removed.next), _MAX_LEVELS):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def rank(self, key: Any) -> int:
+        """Returns the number of keys that are less than `key`."""
+        node = self._head
+        rank = 0
+        for level in reversed(range(_MAX_LEVELS)):
+            successor = node.next[level]
+            while successor is not None and successor.key < key:
+                rank += node.width[level]
+                node = successor
+                successor = node.next[level]
+        return rank
+
+    def _node(self, index: int) -> Optional[_Node]:
+        """Returns the node at `index`, or `None` if it is out of range."""
+        if not 0 <= index < self._size:
+            return None
+        node = self._head
+        remaining = index + 1
+        for level in reversed(range(_MAX_LEVELS)):
+            while (node.next[level] is not None
+                   and node.width[level] <= remaining):
+                remaining -= node.width[level]
+                node = node.next[level]  # type: ignore
+        return node
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._size
+        node = self._node(index)
+        if node is None:
+            raise IndexError(index)
+        return node.key
+
+    def iterate(self, start: int = 0) -> Iterator[Any]:
+        """Yields the keys in order, starting at position `start`."""
+        node = self._node(start)
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iterate()
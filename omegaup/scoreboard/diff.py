@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+"""Minimal deltas between two scoreboard snapshots.
+
+Broadcasting the whole `_Scoreboard` to every viewer on each refresh sends
+mostly unchanged rows. `diff()` compares two snapshots and produces a
+`ScoreboardDelta` with only:
+
+- The usernames of the contestants that are no longer in the ranking.
+- The rows that changed: their total, the problem cells that changed, and
+  their name, class, country and invitation status only if they changed
+  (or if the row is new).
+- The new position of the rows that moved. The rest of the rows keep their
+  relative order, so a contestant that climbs from the last place to the
+  first one is a single move rather than a shift of every row in between.
+- The place changes, as runs of consecutive rows whose place changed by the
+  same amount.
+
+`encode()` turns a delta into compact JSON, `decode()` reverses it, and
+`apply()` rebuilds the new snapshot from the old one and the delta. The
+`run_details` of the cells are not part of the delta.
+
+Comparing two plain snapshots takes linear time. When the caller already
+knows which contestants changed (for instance, from
+`omegaup.scoreboard.engine.ScoreboardEngine.update()`), passing them to
+`diff()` together with `IndexedScoreboard`s, which are built once per
+snapshot and shared by every viewer, makes it proportional to the number of
+changed rows, plus one pass over the rows below the highest change to
+compute the place runs.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import diff
+
+client = omegaup.api.Client(api_token='my API token')
+old = client.contest.scoreboard(contest_alias='my-contest')
+new = client.contest.scoreboard(contest_alias='my-contest')
+data = diff.encode(diff.diff(old, new))
+assert diff.apply(old, diff.decode(data)).ranking == new.ranking
+```
+"""
+
+import bisect
+import copy
+import dataclasses
+import datetime
+import json
+
+from typing import (Any, Dict, Iterable, List, Optional, Sequence, Set,
+                    Tuple, Union)
+
+from omegaup import _decoder, api
+
+_WIRE_VERSION = 1
+"""The version of the format produced by `encode()`."""
+
+
+def _timestamp(seconds: int, like: Any) -> Any:
+    """Returns `seconds` as a timestamp of the same type as `like`."""
+    if isinstance(like, datetime.datetime):
+        return datetime.datetime.fromtimestamp(seconds, like.tzinfo)
+    return seconds
+
+
+@dataclasses.dataclass
+class CellChange:
+    """The new value of one problem cell of a row."""
+    column: int
+    points: float
+    penalty: float
+    percent: float
+    runs: int
+    pending: Optional[int]
+    place: Optional[int]
+
+
+@dataclasses.dataclass
+class RowChange:
+    """The changes to one row of the ranking."""
+    username: str
+    # The new position of the row, if it moved or is new.
+    index: Optional[int] = None
+    # The new total points and penalty, if they changed.
+    total: Optional[Tuple[float, float]] = None
+    cells: List[CellChange] = dataclasses.field(default_factory=list)
+    # The new name, class, country and invitation status, if they changed.
+    meta: Optional[Tuple[Optional[str], str, str, bool]] = None
+
+
+@dataclasses.dataclass
+class ScoreboardDelta:
+    """The differences between two scoreboard snapshots."""
+    time: int
+    removed: List[str] = dataclasses.field(default_factory=list)
+    rows: List[RowChange] = dataclasses.field(default_factory=list)
+    # Runs of `(start, count, change)`: the places of `count` consecutive
+    # rows starting at position `start` of the new ranking changed by
+    # `change`.
+    places: List[Tuple[int, int, int]] = dataclasses.field(
+        default_factory=list)
+    # The new problems, if they changed.
+    problems: Optional[List[Tuple[str, int]]] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.removed or self.rows or self.places
+                    or self.problems is not None)
+
+
+class IndexedScoreboard:
+    """A scoreboard snapshot plus the position of every contestant."""
+    def __init__(self, scoreboard: api._Scoreboard) -> None:
+        self.scoreboard = scoreboard
+        self.positions = {
+            entry.username: position
+            for position, entry in enumerate(scoreboard.ranking)
+        }
+
+
+def _indexed(
+    scoreboard: Union[api._Scoreboard, IndexedScoreboard]
+) -> IndexedScoreboard:
+    if isinstance(scoreboard, IndexedScoreboard):
+        return scoreboard
+    return IndexedScoreboard(scoreboard)
+
+
+def _meta(
+    entry: api._ScoreboardRankingEntry
+) -> Tuple[Optional[str], str, str, bool]:
+    return (entry.name, entry.classname, entry.country, entry.is_invited)
+
+
+def _cell(column: int, cell: api._ScoreboardRankingProblem) -> CellChange:
+    return CellChange(column=column,
+                      points=cell.points,
+                      penalty=cell.penalty,
+                      percent=cell.percent,
+                      runs=cell.runs,
+                      pending=cell.pending,
+                      place=cell.place)
+
+
+def _cell_changes(
+        old: Optional[api._ScoreboardRankingEntry],
+        new: api._ScoreboardRankingEntry) -> List[CellChange]:
+    changes: List[CellChange] = []
+    for column, cell in enumerate(new.problems):
+        change = _cell(column, cell)
+        if old is not None and column < len(old.problems):
+            if _cell(column, old.problems[column]) == change:
+                continue
+        changes.append(change)
+    return changes
+
+
+def _stable_rows(old_positions: Sequence[int]) -> Set[int]:
+    """Returns the indices of a longest increasing subsequence."""
+    tails: List[int] = []
+    tail_indices: List[int] = []
+    parents: List[int] = []
+    for index, position in enumerate(old_positions):
+        length = bisect.bisect_left(tails, position)
+        if length == len(tails):
+            tails.append(position)
+            tail_indices.append(index)
+        else:
+            tails[length] = position
+            tail_indices[length] = index
+        parents.append(tail_indices[length - 1] if length else -1)
+    result: Set[int] = set()
+    index = tail_indices[-1] if tail_indices else -1
+    while index >= 0:
+        result.add(index)
+        index = parents[index]
+    return result
+
+
+def _reorder(old_order: Iterable[str], removed: Set[str],
+             moves: Sequence[Tuple[int, str]]) -> List[str]:
+    """Returns the new order given the old one and the moved rows."""
+    moved = {username for _, username in moves}
+    kept = (username for username in old_order
+            if username not in removed and username not in moved)
+    order: List[str] = []
+    for index, username in sorted(moves):
+        while len(order) < index:
+            order.append(next(kept))
+        order.append(username)
+    order.extend(kept)
+    return order
+
+
+def diff(old: Union[api._Scoreboard, IndexedScoreboard],
+         new: Union[api._Scoreboard, IndexedScoreboard],
+         *,
+         changed: Optional[Iterable[str]] = None) -> ScoreboardDelta:
+    """Computes the delta that turns `old` into `new`.
+
+    Args:
+        old: The previous snapshot.
+        new: The current snapshot.
+        changed: The usernames of the contestants that might have changed,
+            if known. Any contestant that is added, removed, or whose row
+            or place changed must be included. Contestants whose totals did
+            not change must keep their relative order. Ignored if the
+            problems changed, since then every row is sent.
+
+    Returns:
+        The delta.
+    """
+    old_index = _indexed(old)
+    new_index = _indexed(new)
+    old_board = old_index.scoreboard
+    new_board = new_index.scoreboard
+    delta = ScoreboardDelta(time=_decoder.epoch(new_board.time))
+
+    old_problems = [(p.alias, p.order) for p in old_board.problems]
+    new_problems = [(p.alias, p.order) for p in new_board.problems]
+    if old_problems != new_problems:
+        delta.problems = new_problems
+        # `apply()` rebuilds every row it receives from scratch, so the rows
+        # that are left out would keep their stale problem cells.
+        changed = None
+
+    if changed is None:
+        candidates: Iterable[str] = new_index.positions
+        delta.removed = [
+            username for username in old_index.positions
+            if username not in new_index.positions
+        ]
+    else:
+        changed = set(changed)
+        candidates = sorted(
+            (username
+             for username in changed if username in new_index.positions),
+            key=new_index.positions.__getitem__)
+        delta.removed = [
+            username for username in changed
+            if username not in new_index.positions
+            and username in old_index.positions
+        ]
+
+    moves: List[Tuple[int, str]] = []
+    rows: Dict[str, RowChange] = {}
+    for username in candidates:
+        position = new_index.positions[username]
+        new_entry = new_board.ranking[position]
+        old_position = old_index.positions.get(username)
+        old_entry: Optional[api._ScoreboardRankingEntry] = None
+        if old_position is not None and delta.problems is None:
+            old_entry = old_board.ranking[old_position]
+        row = RowChange(username=username)
+        total = (new_entry.total.points, new_entry.total.penalty)
+        old_total: Optional[Tuple[float, float]] = None
+        if old_entry is not None:
+            old_total = (old_entry.total.points, old_entry.total.penalty)
+        if total != old_total:
+            row.total = total
+            row.index = position
+            moves.append((position, username))
+        if old_entry is None or _meta(old_entry) != _meta(new_entry):
+            row.meta = _meta(new_entry)
+        row.cells = _cell_changes(old_entry, new_entry)
+        if row.total is not None or row.meta is not None or row.cells:
+            rows[username] = row
+
+    new_order = [entry.username for entry in new_board.ranking]
+    old_order = [entry.username for entry in old_board.ranking]
+    if (changed is None
+            and _reorder(old_order, set(delta.removed), moves) != new_order):
+        # Some rows whose totals did not change were reordered (for
+        # instance, ties that were broken differently), so find the largest
+        # set of rows that kept their relative order and move the rest.
+        kept = [
+            username for username in new_order
+            if username in old_index.positions
+        ]
+        stable = _stable_rows([old_index.positions[u] for u in kept])
+        moved = {username for _, username in moves}
+        for index, username in enumerate(kept):
+            if index in stable or username in moved:
+                continue
+            position = new_index.positions[username]
+            row = rows.setdefault(username, RowChange(username=username))
+            row.index = position
+            moves.append((position, username))
+    delta.rows = sorted(rows.values(),
+                        key=lambda row: new_index.positions[row.username])
+
+    # Places can only change at or below the highest change.
+    affected = [position for position, _ in moves]
+    affected.extend(old_index.positions[username]
+                    for username in delta.removed)
+    affected.extend(new_index.positions[username] for username in rows)
+    # The rows below the old position of a row that moved or changed might
+    # have moved up.
+    affected.extend(old_index.positions[username] for username in rows
+                    if username in old_index.positions)
+    if changed is None:
+        affected.append(0)
+    if affected:
+        changes: List[Tuple[int, int, int]] = []
+        for position in range(min(affected), len(new_board.ranking)):
+            entry = new_board.ranking[position]
+            old_position = old_index.positions.get(entry.username)
+            old_place = 0
+            if old_position is not None:
+                old_place = old_board.ranking[old_position].place or 0
+            change = (entry.place or 0) - old_place
+            if change:
+                changes.append((position, 1, change))
+        delta.places = _merge_runs(changes)
+    return delta
+
+
+def _merge_runs(
+        runs: Sequence[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    """Merges adjacent runs with the same change."""
+    result: List[Tuple[int, int, int]] = []
+    for start, count, change in runs:
+        if result:
+            last_start, last_count, last_change = result[-1]
+            if last_start + last_count == start and last_change == change:
+                result[-1] = (last_start, last_count + count, change)
+                continue
+        result.append((start, count, change))
+    return result
+
+
+def apply(scoreboard: api._Scoreboard,
+          delta: ScoreboardDelta) -> api._Scoreboard:
+    """Returns the snapshot obtained by applying `delta` to `scoreboard`.
+
+    The rows that did not change are shared with `scoreboard`.
+    """
+    result = copy.copy(scoreboard)
+    result.time = _timestamp(delta.time, scoreboard.time)
+    if delta.problems is not None:
+        result.problems = [
+            api._Scoreboard_problems_entry(alias=alias, order=order)
+            for alias, order in delta.problems
+        ]
+    aliases = [problem.alias for problem in result.problems]
+    original = {entry.username: entry for entry in scoreboard.ranking}
+    entries = dict(original)
+    # The usernames whose entries are no longer shared with `scoreboard`.
+    copied: Set[str] = set()
+    moves: List[Tuple[int, str]] = []
+    for row in delta.rows:
+        entry = entries.get(row.username)
+        if entry is None or delta.problems is not None:
+            assert row.meta is not None, row.username
+            name, classname, country, is_invited = row.meta
+            entry = api._ScoreboardRankingEntry(
+                classname=classname,
+                country=country,
+                is_invited=is_invited,
+                name=name,
+                problems=[{
+                    'alias': alias,
+                    'penalty': 0.0,
+                    'percent': 0.0,
+                    'points': 0.0,
+                    'runs': 0,
+                } for alias in aliases],
+                total={
+                    'penalty': 0.0,
+                    'points': 0.0,
+                },
+                username=row.username,
+            )
+            if row.username in original:
+                entry.place = original[row.username].place
+        else:
+            entry = copy.copy(entry)
+        if row.meta is not None:
+            entry.name, entry.classname, entry.country, entry.is_invited = (
+                row.meta)
+        if row.total is not None:
+            entry.total = copy.copy(entry.total)
+            entry.total.points, entry.total.penalty = row.total
+        problems = list(entry.problems)
+        for cell_change in row.cells:
+            cell = copy.copy(problems[cell_change.column])
+            cell.points = cell_change.points
+            cell.penalty = cell_change.penalty
+            cell.percent = cell_change.percent
+            cell.runs = cell_change.runs
+            cell.pending = cell_change.pending
+            cell.place = cell_change.place
+            cell.run_details = None
+            problems[cell_change.column] = cell
+        entry.problems = problems
+        entries[row.username] = entry
+        copied.add(row.username)
+        if row.index is not None:
+            moves.append((row.index, row.username))
+
+    order = _reorder((entry.username for entry in scoreboard.ranking),
+                     set(delta.removed), moves)
+    ranking = [entries[username] for username in order]
+    for start, count, change in delta.places:
+        for position in range(start, start + count):
+            entry = ranking[position]
+            old_place = 0
+            if entry.username in original:
+                old_place = entry.place or 0
+            if entry.username not in copied:
+                entry = copy.copy(entry)
+                copied.add(entry.username)
+            entry.place = (old_place + change) or None
+            ranking[position] = entry
+    result.ranking = ranking
+    return result
+
+
+def encode(delta: ScoreboardDelta) -> bytes:
+    """Encodes a delta as compact JSON."""
+    return json.dumps(
+        [
+            _WIRE_VERSION,
+            delta.time,
+            delta.removed,
+            [[
+                row.username,
+                row.index,
+                row.total,
+                [[
+                    cell.column, cell.points, cell.penalty, cell.percent,
+                    cell.runs, cell.pending, cell.place
+                ] for cell in row.cells],
+                row.meta,
+            ] for row in delta.rows],
+            delta.places,
+            delta.problems,
+        ],
+        separators=(',', ':'),
+    ).encode('utf-8')
+
+
+def decode(data: bytes) -> ScoreboardDelta:
+    """Decodes a delta encoded by `encode()`."""
+    value = json.loads(data)
+    if value[0] != _WIRE_VERSION:
+        raise ValueError(f'Unsupported delta version: {value[0]}')
+    _, time, removed, rows, places, problems = value
+    return ScoreboardDelta(
+        time=time,
+        removed=removed,
+        rows=[
+            RowChange(
+                username=username,
+                index=index,
+                total=((total[0], total[1]) if total is not None else None),
+                cells=[CellChange(*cell) for cell in cells],
+                meta=((meta[0], meta[1], meta[2], meta[3])
+                      if meta is not None else None),
+            ) for username, index, total, cells, meta in rows
+        ],
+        places=[(start, count, change) for start, count, change in places],
+        problems=([(alias, order) for alias, order in problems]
+                  if problems is not None else None),
+    )
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""An incrementally updated scoreboard.
+
+`Contest.scoreboard` recomputes and transfers the whole ranking on every
+call. `ScoreboardEngine` instead starts from one `_Scoreboard` snapshot and
+applies the `_ScoreboardEvent`s returned by `Contest.scoreboardEvents`. Each
+event carries the best points and penalty of one contestant in one problem
+and their new totals after one submission, so applying it only touches one
+cell and moves one contestant within the ranking.
+
+The ranking is kept in a skip list ordered by points (descending), penalty
+(ascending) and username, so applying an event and looking up the place of
+a contestant take O(log n) time. Contestants with the same points and
+penalty share the same place. A full `_Scoreboard` is only built when
+`snapshot()` is called.
+
+Every event is one submission, so the `runs` of a problem cell are
+incremented once per distinct event that was not reflected in the snapshot.
+Events are told apart by contestant, problem, time, points and penalty.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import engine
+
+client = omegaup.api.Client(api_token='my API token')
+board = engine.ScoreboardEngine(
+    client.contest.scoreboard(contest_alias='my-contest'))
+while True:
+    response = client.contest.scoreboardEvents(contest_alias='my-contest')
+    for username in board.update(response.events):
+        print(username, board.place(username))
+```
+"""
+
+import copy
+
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from omegaup import _decoder, api
+from omegaup.scoreboard import _skiplist
+
+RankingKey = Tuple[float, float, str]
+"""The sort key of a contestant: `(-points, penalty, username)`."""
+
+_EventKey = Tuple[str, str, float, float, float]
+
+
+def _event_key(event: api._ScoreboardEvent) -> _EventKey:
+    """Returns the identity of an event."""
+    return (event.username, event.problem.alias, event.delta,
+            event.problem.points, event.problem.penalty)
+
+
+def ranking_key(entry: api._ScoreboardRankingEntry) -> RankingKey:
+    """Returns the sort key of a ranking entry."""
+    return (-entry.total.points, entry.total.penalty, entry.username)
+
+
+def infer_max_points(scoreboard: api._Scoreboard) -> Dict[str, float]:
+    """Returns the maximum points of the problems of a scoreboard.
+
+    These are inferred from the cells that have a percentage, so problems
+    that nobody has scored yet are missing.
+    """
+    result: Dict[str, float] = {}
+    for entry in scoreboard.ranking:
+        for problem in entry.problems:
+            if problem.percent and problem.alias not in result:
+                result[problem.alias] = problem.points * 100 / problem.percent
+    return result
+
+
+def copy_entry(
+        entry: api._ScoreboardRankingEntry) -> api._ScoreboardRankingEntry:
+    """Returns a copy of a ranking entry that can be modified freely."""
+    result = copy.copy(entry)
+    result.problems = [copy.copy(problem) for problem in entry.problems]
+    result.total = copy.copy(entry.total)
+    return result
+
+
+def empty_entry(event: api._ScoreboardEvent,
+                aliases: Sequence[str]) -> api._ScoreboardRankingEntry:
+    """Returns the ranking entry of a contestant without any points."""
+    return api._ScoreboardRankingEntry(
+        classname=event.classname,
+        country=event.country,
+        is_invited=event.is_invited,
+        name=event.name,
+        problems=[{
+            'alias': alias,
+            'penalty': 0.0,
+            'percent': 0.0,
+            'points': 0.0,
+            'runs': 0,
+        } for alias in aliases],
+        total={
+            'penalty': 0.0,
+            'points': 0.0,
+        },
+        username=event.username,
+    )
+
+
+class ScoreboardEngine:
+    """A scoreboard that is kept up to date by applying events.
+
+    Args:
+        scoreboard: The initial snapshot. It is not modified.
+        max_points: The maximum points of every problem, used to compute
+            the percentage of updated cells. Inferred from `scoreboard` by
+            default.
+    """
+    def __init__(self,
+                 scoreboard: api._Scoreboard,
+                 *,
+                 max_points: Optional[Mapping[str, float]] = None) -> None:
+        self._scoreboard = scoreboard
+        self._aliases = [problem.alias for problem in scoreboard.problems]
+        self._columns = {alias: i for i, alias in enumerate(self._aliases)}
+        self._entries: Dict[str, api._ScoreboardRankingEntry] = {}
+        self._order = _skiplist.SkipList()
+        if max_points is None:
+            max_points = infer_max_points(scoreboard)
+        self._max_points = dict(max_points)
+        for entry in scoreboard.ranking:
+            entry = copy_entry(entry)
+            self._entries[entry.username] = entry
+            self._order.add(ranking_key(entry))
+        self._start = _decoder.epoch(scoreboard.start_time)
+        snapshot_time = _decoder.epoch(scoreboard.time)
+        self._snapshot_delta = (snapshot_time - self._start) / 60
+        self.delta = self._snapshot_delta
+        """The time of the newest event, in minutes since the start."""
+        # The events that were applied or were already reflected in the
+        # snapshot, so that every run is counted exactly once regardless of
+        # where it shows up in the list of events.
+        self._applied: Set[_EventKey] = set()
+        self._primed = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, username: object) -> bool:
+        return username in self._entries
+
+    @property
+    def aliases(self) -> Sequence[str]:
+        """The aliases of the problems, in scoreboard order."""
+        return self._aliases
+
+    def _cell(self, entry: api._ScoreboardRankingEntry,
+              alias: str) -> api._ScoreboardRankingProblem:
+        """Returns the cell of a problem in a ranking entry."""
+        column = self._columns.get(alias)
+        if column is None:
+            # A problem that was added after the snapshot was taken.
+            column = len(self._aliases)
+            self._aliases.append(alias)
+            self._columns[alias] = column
+            for other in self._entries.values():
+                other.problems = list(other.problems) + [
+                    api._ScoreboardRankingProblem(
+                        alias=alias,
+                        penalty=0.0,
+                        percent=0.0,
+                        points=0.0,
+                        runs=0,
+                    )
+                ]
+        if (column < len(entry.problems)
+                and entry.problems[column].alias == alias):
+            return entry.problems[column]
+        for problem in entry.problems:
+            if problem.alias == alias:
+                return problem
+        raise KeyError(alias)
+
+    def apply(self, event: api._ScoreboardEvent) -> bool:
+        """Applies one event.
+
+        Events carry absolute values, so applying an event more than once
+        is harmless: its run is only counted the first time.
+
+        Returns:
+            Whether the scoreboard changed.
+        """
+        changed = False
+        entry = self._entries.get(event.username)
+        if entry is None:
+            entry = empty_entry(event, self._aliases)
+            self._entries[event.username] = entry
+            self._order.add(ranking_key(entry))
+            changed = True
+        entry.classname = event.classname
+        entry.country = event.country
+        entry.is_invited = event.is_invited
+        if event.name is not None:
+            entry.name = event.name
+        self.delta = max(self.delta, event.delta)
+
+        cell = self._cell(entry, event.problem.alias)
+        key = _event_key(event)
+        if key not in self._applied:
+            self._applied.add(key)
+            cell.runs += 1
+            changed = True
+        if (cell.points != event.problem.points
+                or cell.penalty != event.problem.penalty):
+            cell.points = event.problem.points
+            cell.penalty = event.problem.penalty
+            max_points = self._max_points.get(cell.alias)
+            if max_points:
+                cell.percent = cell.points * 100 / max_points
+            changed = True
+        if (entry.total.points != event.total.points
+                or entry.total.penalty != event.total.penalty):
+            self._order.remove(ranking_key(entry))
+            entry.total.points = event.total.points
+            entry.total.penalty = event.total.penalty
+            self._order.add(ranking_key(entry))
+            changed = True
+        return changed
+
+    def update(self, events: Sequence[api._ScoreboardEvent]) -> Set[str]:
+        """Applies the events that were not applied by a previous call.
+
+        Args:
+            events: All the events of the scoreboard, as returned by
+                `Contest.scoreboardEvents`. The endpoint sorts them by
+                submission time, so runs that are judged late show up in the
+                middle of the list: events are told apart by their contents
+                rather than by their position. In the first call, events
+                that are older than the snapshot are assumed to be reflected
+                in it and are skipped.
+
+        Returns:
+            The usernames of the contestants whose entries changed.
+        """
+        if not self._primed:
+            self._primed = True
+            self._applied.update(
+                _event_key(event) for event in events
+                if event.delta < self._snapshot_delta)
+        changed: Set[str] = set()
+        for event in events:
+            if _event_key(event) in self._applied:
+                continue
+            if self.apply(event):
+                changed.add(event.username)
+        return changed
+
+    def entry(self,
+              username: str) -> Optional[api._ScoreboardRankingEntry]:
+        """Returns a copy of the ranking entry of a contestant, if any."""
+        entry = self._entries.get(username)
+        if entry is None:
+            return None
+        result = copy_entry(entry)
+        result.place = self.place(username)
+        return result
+
+    def place(self, username: str) -> Optional[int]:
+        """Returns the place of a contestant, if they are in the board."""
+        entry = self._entries.get(username)
+        if entry is None:
+            return None
+        return 1 + self._order.rank(
+            (-entry.total.points, entry.total.penalty, ''))
+
+    def ranking(
+            self,
+            start: int = 0,
+            stop: Optional[int] = None) -> List[api._ScoreboardRankingEntry]:
+        """Returns copies of a slice of the ranking, with their places.
+
+        Args:
+            start: The position of the first entry.
+            stop: The position past the last entry.
+        """
+        if stop is None:
+            stop = len(self._entries)
+        result: List[api._ScoreboardRankingEntry] = []
+        if start >= stop:
+            return result
+        place = 0
+        previous: Optional[Tuple[float, float]] = None
+        for position, key in enumerate(self._order.iterate(start), start):
+            if position >= stop:
+                break
+            if previous is None:
+                place = 1 + self._order.rank((key[0], key[1], ''))
+            elif previous != key[:2]:
+                place = position + 1
+            previous = (key[0], key[1])
+            entry = copy_entry(self._entries[key[2]])
+            entry.place = place
+            result.append(entry)
+        return result
+
+    def snapshot(self) -> api._Scoreboard:
+        """Returns the current scoreboard."""
+        result = copy.copy(self._scoreboard)
+        result.problems = list(self._scoreboard.problems)
+        known = {problem.alias for problem in result.problems}
+        for alias in self._aliases:
+            if alias not in known:
+                order = len(result.problems) + 1
+                result.problems.append(
+                    api._Scoreboard_problems_entry(alias=alias, order=order))
+        result.ranking = self.ranking()
+        if self.delta > self._snapshot_delta:
+            result.time = _decoder.advance(self._scoreboard.start_time,
+                                           self.delta * 60)
+        return result
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""A local equivalent of `GroupScoreboard.details`.
+
+`GroupScoreboard.details` makes the server recompute the scoreboard of every
+contest that a group scoreboard tracks and merge them with their weights on
+every call, which gets slow for leagues that track many contests.
+`GroupScoreboardAggregator` only uses the API for the metadata (the contests,
+their weights and the members of the group) and keeps a
+`omegaup.scoreboard.live.LiveScoreboard` per contest. Every refresh only
+fetches the new scoreboard events of each contest, and the weighted totals
+are only recomputed for the contestants of the contests that changed, with
+`omegaup.scoreboard.merge.ScoreboardMerge`.
+
+The ranking, the totals and the places are cached until the next change, so
+looking them up does not touch the network nor recompute anything.
+
+Like `ScoreboardMerge`, the `only_ac` contest parameter is not supported.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import group
+
+client = omegaup.api.Client(api_token='my API token')
+league = group.group_scoreboard(client, 'my-school', 'league-2024')
+league.refresh()
+for entry in league.ranking()[:10]:
+    print(league.place(entry.username), entry.username, entry.total.points)
+```
+"""
+
+import bisect
+import copy
+
+from typing import (Any, Dict, Iterable, List, Mapping, Optional, Set,
+                    Tuple)
+
+from omegaup import api
+from omegaup.scoreboard import live, merge
+
+_EMPTY_SCOREBOARD = api._Scoreboard(problems=[],
+                                    ranking=[],
+                                    start_time=0,
+                                    time=0,
+                                    title='')
+"""The scoreboard of a contest until its first successful refresh."""
+
+
+class GroupScoreboardAggregator:
+    """Merges the live scoreboards of the contests of a group scoreboard.
+
+    Args:
+        sources: The source of the scoreboard of every contest, keyed by the
+            alias of the contest, in the order of the group scoreboard.
+        weights: The weight of every contest. Contests without a weight have
+            a weight of 1.
+        usernames_filter: If provided, only these contestants are included
+            in the ranking.
+        details: The response of `GroupScoreboard.details`, used as the
+            template of `response()`.
+        max_workers: The maximum number of contests refreshed concurrently.
+    """
+    def __init__(
+            self,
+            sources: Mapping[str, live.Source],
+            *,
+            weights: Optional[Mapping[str, float]] = None,
+            usernames_filter: Optional[Iterable[str]] = None,
+            details: Optional[api.GroupScoreboardDetailsResponse] = None,
+            max_workers: int = live.DEFAULT_MAX_WORKERS) -> None:
+        self._merge = merge.ScoreboardMerge(weights=weights,
+                                            usernames_filter=usernames_filter)
+        self._pool = live.ScoreboardPool(max_workers=max_workers)
+        # The alias of the contest of every source key, in order.
+        self._aliases: Dict[str, str] = {}
+        for contest_alias, source in sources.items():
+            self._pool.add(source)
+            self._aliases[source.key] = contest_alias
+            # Every contest takes its slot in the order of the group
+            # scoreboard, which breaks ties, even while it is empty or it
+            # fails to refresh.
+            self._merge.set(contest_alias, _EMPTY_SCOREBOARD)
+        self._details = details
+        self._ranking: Optional[List[api._ScoreboardRanking]] = None
+        self._positions: Dict[str, int] = {}
+        self._keys: List[Tuple[float, float]] = []
+
+    @property
+    def contest_aliases(self) -> List[str]:
+        """The aliases of the contests, in order."""
+        return list(self._aliases.values())
+
+    def refresh(self) -> Set[str]:
+        """Refreshes the scoreboard of every contest.
+
+        Returns:
+            The aliases of the contests whose scoreboards changed the
+            merged ranking.
+        """
+        changed = self._pool.refresh()
+        result: Set[str] = set()
+        for key, contest_alias in self._aliases.items():
+            if key not in changed:
+                continue
+            if self._merge.set(contest_alias, self._pool[key].snapshot()):
+                result.add(contest_alias)
+        if result:
+            self._ranking = None
+        return result
+
+    def _index(self) -> List[api._ScoreboardRanking]:
+        """Computes the ranking and its indices, if needed."""
+        if self._ranking is None:
+            self._ranking = [
+                api._ScoreboardRanking(
+                    contests={
+                        contest_alias: {
+                            'points': value.points,
+                            'penalty': value.penalty,
+                        }
+                        for contest_alias, value in entry.contests.items()
+                    },
+                    name=entry.name,
+                    total={
+                        'points': entry.total.points,
+                        'penalty': entry.total.penalty,
+                    },
+                    username=entry.username,
+                ) for entry in self._merge.ranking()
+            ]
+            self._positions = {
+                entry.username: position
+                for position, entry in enumerate(self._ranking)
+            }
+            self._keys = [(-entry.total.points, entry.total.penalty)
+                          for entry in self._ranking]
+        return self._ranking
+
+    def ranking(self) -> List[api._ScoreboardRanking]:
+        """Returns the merged ranking, as `GroupScoreboard.details` does.
+
+        The entries are cached, so they must not be modified.
+        """
+        return list(self._index())
+
+    def entry(self, username: str) -> Optional[api._ScoreboardRanking]:
+        """Returns the entry of a contestant, if they are in the ranking."""
+        ranking = self._index()
+        position = self._positions.get(username)
+        if position is None:
+            return None
+        return ranking[position]
+
+    def total(self,
+              username: str) -> Optional[api._ScoreboardRanking_total]:
+        """Returns the weighted totals of a contestant, if any."""
+        entry = self.entry(username)
+        if entry is None:
+            return None
+        return entry.total
+
+    def place(self, username: str) -> Optional[int]:
+        """Returns the place of a contestant, if they are in the ranking.
+
+        Contestants with the same points and penalty share the same place.
+        """
+        entry = self.entry(username)
+        if entry is None:
+            return None
+        return 1 + bisect.bisect_left(
+            self._keys, (-entry.total.points, entry.total.penalty))
+
+    def response(self) -> api.GroupScoreboardDetailsResponse:
+        """Returns the group scoreboard as `GroupScoreboard.details` would.
+
+        Requires the `details` passed to the constructor.
+        """
+        if self._details is None:
+            raise ValueError('The group scoreboard details are not known')
+        response = copy.copy(self._details)
+        response.ranking = self.ranking()
+        return response
+
+
+def group_scoreboard(client: api.Client,
+                     group_alias: str,
+                     scoreboard_alias: str,
+                     *,
+                     members_only: bool = True,
+                     **kwargs: Any) -> GroupScoreboardAggregator:
+    """Returns an aggregator for a group scoreboard.
+
+    Args:
+        client: The API client.
+        group_alias: The alias of the group.
+        scoreboard_alias: The alias of the group scoreboard.
+        members_only: Whether only the members of the group are ranked,
+            like the server does. Requires permission to list the members.
+        kwargs: Arguments forwarded to `GroupScoreboardAggregator`.
+    """
+    details = client.groupScoreboard.details(
+        group_alias=group_alias, scoreboard_alias=scoreboard_alias)
+    weights = {
+        contest.alias: 1.0 if contest.weight is None else contest.weight
+        for contest in details.contests
+    }
+    sources = {
+        contest.alias: live.contest_source(client, contest.alias)
+        for contest in details.contests
+    }
+    if members_only and 'usernames_filter' not in kwargs:
+        members = client.group.members(group_alias=group_alias)
+        kwargs['usernames_filter'] = [
+            identity.username for identity in members.identities
+        ]
+    return GroupScoreboardAggregator(sources,
+                                     weights=weights,
+                                     details=details,
+                                     **kwargs)
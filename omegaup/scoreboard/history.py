@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""The scoreboard of a contest at any point in time.
+
+Post-contest analysis and freeze replays need the scoreboard "as of minute
+t" for many values of t. `ScoreboardHistory` indexes all the
+`_ScoreboardEvent`s of a contest, course assignment or problemset by time
+and by contestant, and keeps a checkpoint of the whole scoreboard every
+`checkpoint_interval` events. A query for any time restores the nearest
+checkpoint before it and only replays the events since that checkpoint
+through a `ScoreboardEngine`, instead of replaying every event since the
+start of the contest.
+
+Restoring a checkpoint costs about as much as replaying one event per
+contestant, so by default there is one checkpoint every as many events as
+there are contestants.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import history
+
+client = omegaup.api.Client(api_token='my API token')
+contest = history.contest_history(client, 'my-contest')
+for scoreboard in contest.scoreboards(range(0, 300, 10)):
+    print(scoreboard.time, scoreboard.ranking[0].username)
+```
+"""
+
+import bisect
+import copy
+import operator
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from omegaup import _decoder, api
+from omegaup.scoreboard import engine, live
+
+_MIN_CHECKPOINT_INTERVAL = 64
+
+
+def _reset_entry(
+        entry: api._ScoreboardRankingEntry) -> api._ScoreboardRankingEntry:
+    """Returns a copy of a ranking entry without any points."""
+    result = engine.copy_entry(entry)
+    result.place = None
+    for problem in result.problems:
+        problem.penalty = 0.0
+        problem.pending = None
+        problem.percent = 0.0
+        problem.place = None
+        problem.points = 0.0
+        problem.runs = 0
+        problem.run_details = None
+    result.total.penalty = 0.0
+    result.total.points = 0.0
+    return result
+
+
+class ScoreboardHistory:
+    """The scoreboard of a contest at any point in time.
+
+    Args:
+        scoreboard: A snapshot of the scoreboard, usually the latest one. Its
+            metadata, problems and contestants are used as the starting
+            point, with every contestant reset to no points.
+        events: All the scoreboard events, in any order.
+        checkpoint_interval: The number of events between checkpoints.
+            Defaults to the number of contestants.
+    """
+    def __init__(self,
+                 scoreboard: api._Scoreboard,
+                 events: Sequence[api._ScoreboardEvent],
+                 *,
+                 checkpoint_interval: Optional[int] = None) -> None:
+        self._start = scoreboard.start_time
+        self._base = copy.copy(scoreboard)
+        self._base.ranking = [_reset_entry(e) for e in scoreboard.ranking]
+        self._base.time = scoreboard.start_time
+        self._max_points = engine.infer_max_points(scoreboard)
+        # The sort is stable, so events that happened in the same minute
+        # keep the order of the server.
+        self._events = sorted(events, key=operator.attrgetter('delta'))
+        self._deltas = [event.delta for event in self._events]
+        # The positions of the events of every contestant, in time order.
+        self._user_events: Dict[str, List[int]] = {}
+        for position, event in enumerate(self._events):
+            self._user_events.setdefault(event.username, []).append(position)
+        self._user_deltas = {
+            username: [self._deltas[position] for position in positions]
+            for username, positions in self._user_events.items()
+        }
+
+        if checkpoint_interval is None:
+            usernames = set(self._user_events)
+            usernames.update(entry.username for entry in scoreboard.ranking)
+            checkpoint_interval = max(_MIN_CHECKPOINT_INTERVAL,
+                                      len(usernames))
+        if checkpoint_interval < 1:
+            raise ValueError('checkpoint_interval must be positive')
+        self._interval = checkpoint_interval
+        # The i-th checkpoint is the scoreboard after the first
+        # `i * checkpoint_interval` events.
+        self._checkpoints: List[api._Scoreboard] = [self._base]
+        board = self._restore(0)
+        for position in range(self._interval,
+                              len(self._events) + 1, self._interval):
+            for event in self._events[position - self._interval:position]:
+                board.apply(event)
+            self._checkpoints.append(board.snapshot())
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def deltas(self) -> List[float]:
+        """The distinct times of the events, in minutes since the start."""
+        return sorted(set(self._deltas))
+
+    def _restore(self, checkpoint: int) -> engine.ScoreboardEngine:
+        """Returns an engine with the scoreboard of a checkpoint."""
+        return engine.ScoreboardEngine(self._checkpoints[checkpoint],
+                                       max_points=self._max_points)
+
+    def _snapshot(self, board: engine.ScoreboardEngine,
+                  delta: float) -> api._Scoreboard:
+        result = board.snapshot()
+        result.time = _decoder.advance(self._start, delta * 60)
+        return result
+
+    def scoreboard(self, delta: float) -> api._Scoreboard:
+        """Returns the scoreboard at a point in time.
+
+        Args:
+            delta: The time, in minutes since the start. Events that
+                happened at exactly this time are included.
+        """
+        position = bisect.bisect_right(self._deltas, delta)
+        checkpoint = position // self._interval
+        board = self._restore(checkpoint)
+        for event in self._events[checkpoint * self._interval:position]:
+            board.apply(event)
+        return self._snapshot(board, delta)
+
+    def scoreboards(self,
+                    deltas: Iterable[float]) -> Iterator[api._Scoreboard]:
+        """Returns the scoreboards at several points in time.
+
+        This is like calling `scoreboard()` for every time, but consecutive
+        times in ascending order continue replaying from the previous one
+        whenever that is closer than the nearest checkpoint.
+
+        Args:
+            deltas: The times, in minutes since the start.
+        """
+        board: Optional[engine.ScoreboardEngine] = None
+        position = 0
+        for delta in deltas:
+            target = bisect.bisect_right(self._deltas, delta)
+            checkpoint = target // self._interval
+            if (board is None or target < position
+                    or checkpoint * self._interval > position):
+                board = self._restore(checkpoint)
+                position = checkpoint * self._interval
+            for event in self._events[position:target]:
+                board.apply(event)
+            position = target
+            yield self._snapshot(board, delta)
+
+    def events(self, username: str) -> List[api._ScoreboardEvent]:
+        """Returns the events of a contestant, in time order."""
+        return [
+            self._events[position]
+            for position in self._user_events.get(username, [])
+        ]
+
+    def last_event(self, username: str,
+                   delta: float) -> Optional[api._ScoreboardEvent]:
+        """Returns the last event of a contestant up to a point in time.
+
+        Its `total` has the points and penalty of the contestant at that
+        time.
+
+        Args:
+            username: The username of the contestant.
+            delta: The time, in minutes since the start.
+        """
+        deltas = self._user_deltas.get(username)
+        if not deltas:
+            return None
+        index = bisect.bisect_right(deltas, delta)
+        if index == 0:
+            return None
+        return self._events[self._user_events[username][index - 1]]
+
+
+def from_source(source: live.Source, **kwargs: Any) -> ScoreboardHistory:
+    """Returns the history of the scoreboard of a source.
+
+    Args:
+        source: Where the scoreboard and its events are fetched from.
+        kwargs: Arguments forwarded to `ScoreboardHistory`.
+    """
+    return ScoreboardHistory(source.scoreboard(), source.events(), **kwargs)
+
+
+def contest_history(client: api.Client,
+                    contest_alias: str,
+                    *,
+                    token: Optional[str] = None,
+                    **kwargs: Any) -> ScoreboardHistory:
+    """Returns the history of the scoreboard of a contest.
+
+    Args:
+        client: The API client.
+        contest_alias: The alias of the contest.
+        token: The scoreboard token, if any.
+        kwargs: Arguments forwarded to `ScoreboardHistory`.
+    """
+    return from_source(
+        live.contest_source(client, contest_alias, token=token), **kwargs)
+
+
+def course_assignment_history(client: api.Client,
+                              course_alias: str,
+                              assignment_alias: str,
+                              *,
+                              token: Optional[str] = None,
+                              **kwargs: Any) -> ScoreboardHistory:
+    """Returns the history of the scoreboard of a course assignment.
+
+    Args:
+        client: The API client.
+        course_alias: The alias of the course.
+        assignment_alias: The alias of the assignment.
+        token: The scoreboard token, if any.
+        kwargs: Arguments forwarded to `ScoreboardHistory`.
+    """
+    return from_source(
+        live.course_assignment_source(client,
+                                      course_alias,
+                                      assignment_alias,
+                                      token=token), **kwargs)
+
+
+def problemset_history(client: api.Client,
+                       problemset_id: int,
+                       *,
+                       contest_alias: str = '',
+                       course_alias: str = '',
+                       assignment_alias: str = '',
+                       token: Optional[str] = None,
+                       **kwargs: Any) -> ScoreboardHistory:
+    """Returns the history of the scoreboard of a problemset.
+
+    Args:
+        client: The API client.
+        problemset_id: The id of the problemset.
+        contest_alias: The alias of the contest of the problemset, if any.
+        course_alias: The alias of the course of the problemset, if any.
+        assignment_alias: The alias of the assignment of the problemset, if
+            any.
+        token: The scoreboard token, if any.
+        kwargs: Arguments forwarded to `ScoreboardHistory`.
+    """
+    return from_source(
+        live.problemset_source(client,
+                               problemset_id,
+                               contest_alias=contest_alias,
+                               course_alias=course_alias,
+                               assignment_alias=assignment_alias,
+                               token=token), **kwargs)
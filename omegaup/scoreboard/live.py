@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""Incrementally updated scoreboards of contests, courses and problemsets.
+
+Contests, course assignments and problemsets all expose a `_Scoreboard` and
+a list of `_ScoreboardEvent`s, through different endpoints with different
+arguments:
+
+- `Contest.scoreboard` and `Contest.scoreboardEvents`.
+- `Course.assignmentScoreboard` and `Course.assignmentScoreboardEvents`.
+- `Problemset.scoreboard` and `Problemset.scoreboardEvents`.
+
+A `Source` hides those differences, and `LiveScoreboard` keeps any source up
+to date the same way: the full scoreboard is only fetched once, and every
+refresh after that only fetches the events and applies the new ones through
+a `ScoreboardEngine`. Snapshots are cached until the next change, and can be
+serialized with `omegaup.codec` or exported with
+`omegaup.export.export_scoreboard()`.
+
+`ScoreboardPool` refreshes many live scoreboards concurrently, e.g. every
+assignment of a set of courses, so running hundreds of them at once costs
+one events request per scoreboard per round instead of hundreds of full
+refreshes.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import live
+
+client = omegaup.api.Client(api_token='my API token')
+pool = live.ScoreboardPool()
+for assignment in ('homework-1', 'homework-2', 'exam'):
+    pool.add(live.course_assignment_source(client, 'my-course', assignment))
+for key, usernames in pool.refresh().items():
+    for username in usernames:
+        print(key, username, pool[key].place(username))
+```
+"""
+
+import concurrent.futures
+import functools
+import logging
+import threading
+
+from typing import (Any, Callable, Dict, Iterator, List, NamedTuple, Optional,
+                    Sequence, Set)
+
+from omegaup import api, codec
+from omegaup.scoreboard import engine
+
+DEFAULT_MAX_WORKERS = 16
+"""The maximum number of scoreboards refreshed concurrently."""
+
+
+class Source(NamedTuple):
+    """Where a scoreboard and its events are fetched from."""
+    # A unique name of the scoreboard, e.g. `'contest/my-contest'`.
+    key: str
+    scoreboard: Callable[[], api._Scoreboard]
+    events: Callable[[], Sequence[api._ScoreboardEvent]]
+
+
+def _events(fetch: Callable[..., Any]) -> Sequence[api._ScoreboardEvent]:
+    """Returns the events of a scoreboard events response."""
+    events: Sequence[api._ScoreboardEvent] = fetch().events
+    return events
+
+
+def contest_source(client: api.Client,
+                   contest_alias: str,
+                   *,
+                   token: Optional[str] = None) -> Source:
+    """Returns the source of the scoreboard of a contest.
+
+    Args:
+        client: The API client.
+        contest_alias: The alias of the contest.
+        token: The scoreboard token, if any.
+    """
+    return Source(
+        key=f'contest/{contest_alias}',
+        scoreboard=functools.partial(client.contest.scoreboard,
+                                     contest_alias=contest_alias,
+                                     token=token),
+        events=functools.partial(
+            _events,
+            functools.partial(client.contest.scoreboardEvents,
+                              contest_alias=contest_alias,
+                              token=token)),
+    )
+
+
+def course_assignment_source(client: api.Client,
+                             course_alias: str,
+                             assignment_alias: str,
+                             *,
+                             token: Optional[str] = None) -> Source:
+    """Returns the source of the scoreboard of a course assignment.
+
+    Args:
+        client: The API client.
+        course_alias: The alias of the course.
+        assignment_alias: The alias of the assignment.
+        token: The scoreboard token, if any.
+    """
+    return Source(
+        key=f'course/{course_alias}/{assignment_alias}',
+        scoreboard=functools.partial(client.course.assignmentScoreboard,
+                                     course=course_alias,
+                                     assignment=assignment_alias,
+                                     token=token),
+        events=functools.partial(
+            _events,
+            functools.partial(client.course.assignmentScoreboardEvents,
+                              course=course_alias,
+                              assignment=assignment_alias,
+                              token=token)),
+    )
+
+
+def problemset_source(client: api.Client,
+                      problemset_id: int,
+                      *,
+                      contest_alias: str = '',
+                      course_alias: str = '',
+                      assignment_alias: str = '',
+                      token: Optional[str] = None) -> Source:
+    """Returns the source of the scoreboard of a problemset.
+
+    Args:
+        client: The API client.
+        problemset_id: The id of the problemset.
+        contest_alias: The alias of the contest of the problemset, if any.
+        course_alias: The alias of the course of the problemset, if any.
+        assignment_alias: The alias of the assignment of the problemset, if
+            any.
+        token: The scoreboard token, if any.
+    """
+    parameters: Dict[str, Any] = {
+        'problemset_id': problemset_id,
+        'contest_alias': contest_alias,
+        'course': course_alias,
+        'assignment': assignment_alias,
+        'token': token,
+    }
+    return Source(
+        key=f'problemset/{problemset_id}',
+        scoreboard=functools.partial(client.problemset.scoreboard,
+                                     **parameters),
+        events=functools.partial(
+            _events,
+            functools.partial(client.problemset.scoreboardEvents,
+                              **parameters)),
+    )
+
+
+class LiveScoreboard:
+    """A scoreboard that is kept up to date with its events.
+
+    Args:
+        source: Where the scoreboard is fetched from.
+    """
+    def __init__(self, source: Source) -> None:
+        self.source = source
+        self._engine: Optional[engine.ScoreboardEngine] = None
+        self._event_count = 0
+        self._snapshot: Optional[api._Scoreboard] = None
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        """The key of the source."""
+        return self.source.key
+
+    def _board(self) -> engine.ScoreboardEngine:
+        if self._engine is None:
+            raise ValueError(f'{self.key} has not been refreshed yet')
+        return self._engine
+
+    def reload(self) -> Set[str]:
+        """Fetches the full scoreboard, discarding the current state.
+
+        Returns:
+            The usernames of the contestants in the scoreboard.
+        """
+        scoreboard = self.source.scoreboard()
+        board = engine.ScoreboardEngine(scoreboard)
+        with self._lock:
+            self._engine = board
+            self._event_count = 0
+            self._snapshot = None
+        return {entry.username for entry in scoreboard.ranking}
+
+    def refresh(self) -> Set[str]:
+        """Applies the new events, fetching the full scoreboard if needed.
+
+        The full scoreboard is fetched on the first call, and again if the
+        list of events gets shorter (e.g. after the scoreboard is reset).
+
+        Returns:
+            The usernames of the contestants whose entries changed, or of
+            every contestant if the full scoreboard was fetched.
+        """
+        changed: Set[str] = set()
+        if self._engine is None:
+            changed = self.reload()
+        events = self.source.events()
+        if len(events) < self._event_count:
+            changed = self.reload()
+        with self._lock:
+            changed |= self._board().update(events)
+            self._event_count = len(events)
+            if changed:
+                self._snapshot = None
+        return changed
+
+    def snapshot(self) -> api._Scoreboard:
+        """Returns the current scoreboard.
+
+        The snapshot is cached until the scoreboard changes, so it must not
+        be modified.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._board().snapshot()
+            return self._snapshot
+
+    def place(self, username: str) -> Optional[int]:
+        """Returns the place of a contestant, if they are in the board."""
+        with self._lock:
+            return self._board().place(username)
+
+    def entry(self,
+              username: str) -> Optional[api._ScoreboardRankingEntry]:
+        """Returns a copy of the ranking entry of a contestant, if any."""
+        with self._lock:
+            return self._board().entry(username)
+
+    def to_bytes(self, *, format: str = 'pickle') -> bytes:
+        """Serializes the current scoreboard with `omegaup.codec`."""
+        return codec.to_bytes(self.snapshot(), format=format)
+
+
+class ScoreboardPool:
+    """Refreshes many live scoreboards concurrently.
+
+    Args:
+        max_workers: The maximum number of scoreboards refreshed
+            concurrently.
+    """
+    def __init__(self, *, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self._max_workers = max_workers
+        self._scoreboards: Dict[str, LiveScoreboard] = {}
+
+    def __len__(self) -> int:
+        return len(self._scoreboards)
+
+    def __iter__(self) -> Iterator[LiveScoreboard]:
+        return iter(list(self._scoreboards.values()))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._scoreboards
+
+    def __getitem__(self, key: str) -> LiveScoreboard:
+        return self._scoreboards[key]
+
+    def add(self, source: Source) -> LiveScoreboard:
+        """Adds a scoreboard, unless one with the same key is already in.
+
+        Returns:
+            The live scoreboard of the source.
+        """
+        scoreboard = self._scoreboards.get(source.key)
+        if scoreboard is None:
+            scoreboard = LiveScoreboard(source)
+            self._scoreboards[source.key] = scoreboard
+        return scoreboard
+
+    def remove(self, key: str) -> bool:
+        """Removes a scoreboard.
+
+        Returns:
+            Whether the scoreboard was in the pool.
+        """
+        return self._scoreboards.pop(key, None) is not None
+
+    def refresh(self) -> Dict[str, Set[str]]:
+        """Refreshes every scoreboard.
+
+        Scoreboards that fail to refresh are logged and skipped.
+
+        Returns:
+            The usernames of the contestants whose entries changed, for
+            every scoreboard with changes.
+        """
+        scoreboards: List[LiveScoreboard] = list(self)
+        result: Dict[str, Set[str]] = {}
+        if not scoreboards:
+            return result
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self._max_workers,
+                                len(scoreboards))) as executor:
+            futures = {
+                executor.submit(scoreboard.refresh): scoreboard.key
+                for scoreboard in scoreboards
+            }
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                try:
+                    changed = future.result()
+                except Exception:  # pylint: disable=broad-except
+                    logging.getLogger('omegaup').exception(
+                        'Failed to refresh scoreboard %s', key)
+                    continue
+                if changed:
+                    result[key] = changed
+        return result
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""A local equivalent of `Contest.scoreboardMerge`.
+
+`Contest.scoreboardMerge` makes the server recompute the scoreboard of every
+contest and merge them on every call. `ScoreboardMerge` instead merges
+`_Scoreboard`s that the caller already has (for instance, from
+`omegaup.scoreboard.engine` or a cache), and when one of them changes it
+only recomputes the totals of the contestants that appear in that contest.
+
+The result follows the same rules as the server:
+
+- The points of every contest are multiplied by the weight of the contest,
+  and the penalties are added as they are.
+- Every contestant gets an entry for every contest, with zero points and
+  penalty for the contests they did not take part in.
+- The ranking is sorted by total points (descending) and total penalty
+  (ascending). Ties keep the order in which the contestants first appear in
+  the scoreboards, taken in the order in which the contests were added.
+- Entries do not have a place.
+
+The `only_ac` contest parameter changes how the server computes each
+contest scoreboard, so it cannot be applied to already computed ones.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import merge
+
+client = omegaup.api.Client(api_token='my API token')
+merged = merge.ScoreboardMerge(weights={'round-1': 1.0, 'round-2': 2.0})
+for contest_alias in ('round-1', 'round-2'):
+    merged.refresh(client, contest_alias)
+for entry in merged.ranking():
+    print(entry.username, entry.total.points)
+```
+"""
+
+import dataclasses
+
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from omegaup import api
+
+
+@dataclasses.dataclass
+class _MergedContest:
+    """The contribution of one contest to the merged scoreboard."""
+    weight: float
+    # The weighted points and the penalty of every contestant.
+    scores: Dict[str, Tuple[float, float]]
+    # The position of every contestant in the ranking of the contest.
+    positions: Dict[str, int]
+    names: Dict[str, Optional[str]]
+
+
+class ScoreboardMerge:
+    """Merges the scoreboards of several contests.
+
+    Args:
+        weights: The weight of each contest. Contests without a weight have
+            a weight of 1.
+        usernames_filter: If provided, only these contestants are included
+            in the ranking.
+    """
+    def __init__(self,
+                 weights: Optional[Mapping[str, float]] = None,
+                 usernames_filter: Optional[Iterable[str]] = None) -> None:
+        self._weights = dict(weights or {})
+        self._filter: Optional[Set[str]] = None
+        if usernames_filter is not None:
+            self._filter = set(usernames_filter)
+        self._contests: Dict[str, _MergedContest] = {}
+        self._totals: Dict[str, Tuple[float, float]] = {}
+        self._ranking: Optional[List[api._MergedScoreboardEntry]] = None
+
+    @property
+    def contest_aliases(self) -> List[str]:
+        """The aliases of the merged contests, in the order they were added."""
+        return list(self._contests)
+
+    def _total(self, username: str) -> None:
+        """Recomputes the totals of a contestant."""
+        points = 0.0
+        penalty = 0.0
+        present = False
+        # Add the contests in order so that the floating point results are
+        # the same as the ones the server computes.
+        for contest in self._contests.values():
+            score = contest.scores.get(username)
+            if score is None:
+                continue
+            present = True
+            points += score[0]
+            penalty += score[1]
+        if present:
+            self._totals[username] = (points, penalty)
+        else:
+            self._totals.pop(username, None)
+
+    def set(self,
+            contest_alias: str,
+            scoreboard: api._Scoreboard,
+            *,
+            weight: Optional[float] = None) -> bool:
+        """Adds or replaces the scoreboard of a contest.
+
+        Args:
+            contest_alias: The alias of the contest.
+            scoreboard: The scoreboard of the contest.
+            weight: The weight of the contest. Defaults to the weight passed
+                to the constructor.
+
+        Returns:
+            Whether the merged scoreboard changed.
+        """
+        contest_weight: float = (self._weights.get(contest_alias, 1.0)
+                                 if weight is None else weight)
+        self._weights[contest_alias] = contest_weight
+        ranking = [
+            entry for entry in scoreboard.ranking
+            if self._filter is None or entry.username in self._filter
+        ]
+        contest = _MergedContest(
+            weight=contest_weight,
+            scores={
+                entry.username:
+                (entry.total.points * contest_weight, entry.total.penalty)
+                for entry in ranking
+            },
+            positions={
+                entry.username: position
+                for position, entry in enumerate(ranking)
+            },
+            names={entry.username: entry.name
+                   for entry in ranking},
+        )
+        previous = self._contests.get(contest_alias)
+        if previous == contest:
+            return False
+        self._contests[contest_alias] = contest
+        affected = set(contest.scores)
+        if previous is not None:
+            affected.update(previous.scores)
+        for username in affected:
+            self._total(username)
+        self._ranking = None
+        return True
+
+    def remove(self, contest_alias: str) -> bool:
+        """Removes a contest. Returns whether it had been added."""
+        contest = self._contests.pop(contest_alias, None)
+        if contest is None:
+            return False
+        for username in contest.scores:
+            self._total(username)
+        self._ranking = None
+        return True
+
+    def refresh(self, client: api.Client, contest_alias: str) -> bool:
+        """Fetches the scoreboard of a contest and merges it.
+
+        Returns:
+            Whether the merged scoreboard changed.
+        """
+        return self.set(contest_alias,
+                        client.contest.scoreboard(contest_alias=contest_alias))
+
+    def _first_appearance(self, username: str) -> Tuple[int, int]:
+        for index, contest in enumerate(self._contests.values()):
+            position = contest.positions.get(username)
+            if position is not None:
+                return (index, position)
+        raise KeyError(username)
+
+    def _entry(self, username: str) -> api._MergedScoreboardEntry:
+        name: Optional[str] = None
+        contests: Dict[str, Dict[str, float]] = {}
+        missing: List[str] = []
+        for contest_alias, contest in self._contests.items():
+            score = contest.scores.get(username)
+            if score is None:
+                missing.append(contest_alias)
+                continue
+            if not contests:
+                name = contest.names[username]
+            contests[contest_alias] = {
+                'points': score[0],
+                'penalty': score[1],
+            }
+        for contest_alias in missing:
+            contests[contest_alias] = {'points': 0, 'penalty': 0}
+        points, penalty = self._totals[username]
+        return api._MergedScoreboardEntry(
+            contests=contests,
+            name=name,
+            total={
+                'points': points,
+                'penalty': penalty,
+            },
+            username=username,
+        )
+
+    def ranking(self) -> List[api._MergedScoreboardEntry]:
+        """Returns the merged ranking."""
+        if self._ranking is None:
+            order = sorted(self._totals,
+                           key=lambda username: (
+                               -self._totals[username][0],
+                               self._totals[username][1],
+                               self._first_appearance(username),
+                           ))
+            self._ranking = [self._entry(username) for username in order]
+        return list(self._ranking)
+
+    def response(self) -> api.ContestScoreboardMergeResponse:
+        """Returns the merged scoreboard as `Contest.scoreboardMerge` would."""
+        response = api.ContestScoreboardMergeResponse(ranking=[])
+        response.ranking = self.ranking()
+        return response
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""The reveal sequence of a frozen scoreboard.
+
+At award ceremonies the part of the scoreboard that was frozen during the
+last minutes of a contest is revealed one cell at a time, ICPC style: the
+lowest ranked contestant that still has hidden cells gets their leftmost
+hidden cell revealed, which may move them up the ranking, and this repeats
+until every cell is revealed.
+
+`Resolver` takes the frozen `_Scoreboard` and the final `_ScoreboardEvent`s
+and precomputes the whole sequence as a list of `Step`s, each one with the
+cell that flips and the position and place of the contestant before and
+after it. `frames()` turns the steps into the frames of the animation.
+
+A hidden cell is a cell that has events after the freeze time, or whose
+final points or penalty differ from the ones in the frozen scoreboard.
+Every event after the freeze time counts as one more run of its cell, so
+cells with only wrong submissions after the freeze are revealed too, with
+their new number of runs. The time of the frozen scoreboard is when it was
+generated, not when it was frozen, so the freeze time is passed explicitly;
+`subscription.contest_freeze_time` computes it from the contest details.
+Problems that are not in the frozen scoreboard are ignored. The ranking and the
+contestants with hidden cells are kept in sorted lists, so every step takes
+O(log n) comparisons plus the cost of shifting the rows in between, and a
+1000 × 15 scoreboard is resolved in a fraction of a second.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import resolver, subscription
+
+client = omegaup.api.Client(api_token='my API token')
+details = client.contest.publicDetails(contest_alias='my-contest')
+frozen = client.contest.scoreboard(contest_alias='my-contest')
+events = client.contest.scoreboardEvents(contest_alias='my-contest',
+                                         token='admin token').events
+ceremony = resolver.Resolver(
+    frozen, events, freeze_time=subscription.contest_freeze_time(details))
+for frame in ceremony.frames():
+    print(frame.kind, frame.username, frame.index)
+```
+"""
+
+import bisect
+import copy
+import dataclasses
+import operator
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from omegaup import _decoder, api
+from omegaup.scoreboard import engine
+
+FRAME_KINDS = ('focus', 'reveal', 'move')
+"""The kinds of `Frame`s."""
+
+
+@dataclasses.dataclass
+class Step:
+    """The reveal of one hidden cell."""
+    username: str
+    alias: str
+    # The cell before and after being revealed.
+    before: api._ScoreboardRankingProblem
+    after: api._ScoreboardRankingProblem
+    # The total points and penalty of the contestant after the reveal.
+    points: float
+    penalty: float
+    # The position of the contestant in the ranking, starting at 0, and
+    # their place, before and after the reveal. The rows between `index`
+    # and `previous_index` move one position down.
+    previous_index: int
+    index: int
+    previous_place: int
+    place: int
+    # Whether this was the last hidden cell of the contestant.
+    finished: bool
+
+
+@dataclasses.dataclass
+class Frame:
+    """One frame of the reveal animation.
+
+    - `'focus'` moves the cursor to the row at `index`.
+    - `'reveal'` flips the cell of `steps[step]` in the row at `index`.
+    - `'move'` moves the row of the contestant to `index`.
+    """
+    kind: str
+    step: int
+    username: str
+    index: int
+
+
+class Resolver:
+    """Precomputes the reveal sequence of a frozen scoreboard.
+
+    Args:
+        frozen: The frozen scoreboard, as seen by the contestants. It is
+            not modified.
+        events: All the scoreboard events, including the frozen ones.
+        freeze_time: When the scoreboard was frozen, as a timestamp of the
+            same kind as the ones of `frozen`. `None` means the scoreboard
+            was never frozen, so only the cells that differ are revealed.
+        penalty_calc_policy: Whether the total penalty is the `'sum'` or
+            the `'max'` of the penalties of the cells.
+    """
+    def __init__(self,
+                 frozen: api._Scoreboard,
+                 events: Sequence[api._ScoreboardEvent],
+                 *,
+                 freeze_time: Optional[Any],
+                 penalty_calc_policy: str = 'sum') -> None:
+        if penalty_calc_policy not in ('sum', 'max'):
+            raise ValueError('Unsupported penalty calc policy: '
+                             f'{penalty_calc_policy!r}')
+        self._frozen = frozen
+        self._penalty_calc_policy = penalty_calc_policy
+        self._max_points = engine.infer_max_points(frozen)
+        self._aliases = [problem.alias for problem in frozen.problems]
+        self._entries: Dict[str, api._ScoreboardRankingEntry] = {}
+        for entry in frozen.ranking:
+            self._entries[entry.username] = engine.copy_entry(entry)
+
+        # The final value of every cell is the one of its last event, and
+        # every event after the freeze is one hidden submission.
+        frozen_delta = float('inf')
+        if freeze_time is not None:
+            start_time = _decoder.epoch(frozen.start_time)
+            frozen_delta = (_decoder.epoch(freeze_time) - start_time) / 60
+        final: Dict[Tuple[str, str], api._ScoreboardEvent] = {}
+        self._runs: Dict[Tuple[str, str], int] = {}
+        for event in sorted(events, key=operator.attrgetter('delta')):
+            key = (event.username, event.problem.alias)
+            final[key] = event
+            if event.delta > frozen_delta:
+                self._runs[key] = self._runs.get(key, 0) + 1
+            if event.username not in self._entries:
+                self._entries[event.username] = engine.empty_entry(
+                    event, self._aliases)
+        # The hidden cells of every contestant, in reverse problem order so
+        # that the leftmost one is popped first.
+        self._hidden: Dict[str, List[Tuple[int, api._ScoreboardEvent]]] = {}
+        for (username, alias), event in final.items():
+            entry = self._entries[username]
+            column = self._column(entry, alias)
+            if column is None:
+                continue
+            cell = entry.problems[column]
+            if (cell.points == event.problem.points
+                    and cell.penalty == event.problem.penalty
+                    and (username, alias) not in self._runs):
+                continue
+            self._hidden.setdefault(username, []).append((column, event))
+        for hidden in self._hidden.values():
+            hidden.sort(key=operator.itemgetter(0), reverse=True)
+
+        self.steps: List[Step] = []
+        """The reveal sequence."""
+        self._resolve()
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def _column(self, entry: api._ScoreboardRankingEntry,
+                alias: str) -> Optional[int]:
+        """Returns the column of a problem in a ranking entry, if any."""
+        for column, problem in enumerate(entry.problems):
+            if problem.alias == alias:
+                return column
+        return None
+
+    def _total(self, entry: api._ScoreboardRankingEntry,
+               before: api._ScoreboardRankingProblem,
+               after: api._ScoreboardRankingProblem) -> Tuple[float, float]:
+        """Returns the totals of an entry after a cell changes."""
+        points = entry.total.points + after.points - before.points
+        if self._penalty_calc_policy == 'max':
+            penalty = max([after.penalty] + [
+                problem.penalty
+                for problem in entry.problems if problem.alias != after.alias
+            ])
+        else:
+            penalty = entry.total.penalty + after.penalty - before.penalty
+        return points, penalty
+
+    def _resolve(self) -> None:
+        order = sorted(
+            engine.ranking_key(entry) for entry in self._entries.values())
+        # The contestants with hidden cells. The last one is revealed next.
+        pending = sorted(
+            engine.ranking_key(self._entries[username])
+            for username in self._hidden)
+        while pending:
+            key = pending.pop()
+            username = key[2]
+            entry = self._entries[username]
+            column, event = self._hidden[username].pop()
+            previous_index = bisect.bisect_left(order, key)
+            previous_place = 1 + bisect.bisect_left(order,
+                                                    (key[0], key[1], ''))
+
+            before = entry.problems[column]
+            after = copy.copy(before)
+            after.points = event.problem.points
+            after.penalty = event.problem.penalty
+            # The cell is hidden, so at least one submission was hidden.
+            after.runs += max(1, self._runs.get((username, after.alias), 0))
+            max_points = self._max_points.get(after.alias)
+            if max_points:
+                after.percent = after.points * 100 / max_points
+            points, penalty = self._total(entry, before, after)
+            problems = list(entry.problems)
+            problems[column] = after
+            entry.problems = problems
+            entry.total.points = points
+            entry.total.penalty = penalty
+
+            del order[previous_index]
+            key = engine.ranking_key(entry)
+            index = bisect.bisect_left(order, key)
+            order.insert(index, key)
+            finished = not self._hidden[username]
+            if not finished:
+                bisect.insort(pending, key)
+            self.steps.append(
+                Step(username=username,
+                     alias=after.alias,
+                     before=before,
+                     after=after,
+                     points=points,
+                     penalty=penalty,
+                     previous_index=previous_index,
+                     index=index,
+                     previous_place=previous_place,
+                     place=1 + bisect.bisect_left(order,
+                                                  (key[0], key[1], '')),
+                     finished=finished))
+        self._order = [key[2] for key in order]
+
+    def frames(self) -> Iterator[Frame]:
+        """Yields the frames of the reveal animation."""
+        cursor: Optional[int] = None
+        for step_index, step in enumerate(self.steps):
+            if cursor != step.previous_index:
+                cursor = step.previous_index
+                yield Frame(kind='focus',
+                            step=step_index,
+                            username=step.username,
+                            index=cursor)
+            yield Frame(kind='reveal',
+                        step=step_index,
+                        username=step.username,
+                        index=cursor)
+            if step.index != step.previous_index:
+                yield Frame(kind='move',
+                            step=step_index,
+                            username=step.username,
+                            index=step.index)
+
+    def scoreboard(self) -> api._Scoreboard:
+        """Returns the scoreboard after every cell has been revealed."""
+        result = copy.copy(self._frozen)
+        result.ranking = []
+        previous: Tuple[float, float] = (-1.0, -1.0)
+        place = 0
+        for position, username in enumerate(self._order):
+            entry = engine.copy_entry(self._entries[username])
+            total = (entry.total.points, entry.total.penalty)
+            if total != previous:
+                place = position + 1
+            previous = total
+            entry.place = place
+            result.ranking.append(entry)
+        return result
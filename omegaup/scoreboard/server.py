@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+"""A local server that fans scoreboards out to many viewers.
+
+When hundreds of projector screens and spectator browsers each poll omegaUp
+for the same scoreboard, the upstream load grows with the audience.
+`ScoreboardServer` keeps a single
+`omegaup.scoreboard.subscription.ScoreboardSubscription` per contest and
+streams every change to any number of downstream clients with
+[Server-Sent Events](https://html.spec.whatwg.org/multipage/server-sent-events.html),
+so the upstream load only depends on the number of contests.
+
+`GET /contests/<alias>/events` opens a stream. The first message is a
+`snapshot` event, and every change after that is a `delta` event. Both carry
+a `omegaup.scoreboard.diff` delta encoded with `diff.encode()` (a snapshot
+is the delta from an empty scoreboard), and their `id` is
+`<epoch>-<sequence>`, where the sequence number counts the scoreboards of
+the contest and the epoch changes every time its polling starts over.
+Clients that reconnect with a `Last-Event-ID` header only get the deltas
+they missed, if they are still buffered and the epoch did not change;
+otherwise they get a new snapshot. Clients that fall behind by more than
+`max_pending` messages get a new snapshot instead of the backlog. Contests
+are only polled while they have clients, plus a grace period, and the number
+of contests polled at the same time is capped.
+
+`GET /metrics` returns a JSON object with the number of connections and, for
+every contest, the number of subscribers, the messages and bytes fanned out,
+the number of resynchronizations, the time between an upstream change and
+its delivery to the clients, and the age of the latest upstream scoreboard.
+
+The server only uses the standard library. WebSockets are not supported,
+since SSE covers one-way streams and is natively supported by browsers.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import server
+
+client = omegaup.api.Client(api_token='my API token')
+with server.serve(client, ('', 8080), contests=['my-contest']) as httpd:
+    httpd.serve_forever()
+```
+"""
+
+import collections
+import copy
+import datetime
+import http.server
+import json
+import logging
+import re
+import socketserver
+import threading
+import time
+import uuid
+
+from typing import (Any, Callable, Deque, Dict, Iterable, List, Optional,
+                    Set, Tuple)
+
+from omegaup import _decoder, api
+from omegaup.scoreboard import diff, subscription
+
+_DEFAULT_MAX_PENDING = 64
+"""The messages a client can fall behind before it gets a new snapshot."""
+
+_DEFAULT_HISTORY = 64
+"""The number of deltas kept to resume streams with `Last-Event-ID`."""
+
+_DEFAULT_KEEPALIVE = datetime.timedelta(seconds=15)
+"""The time between comments sent to idle streams."""
+
+_DEFAULT_MAX_CHANNELS = 16
+"""The maximum number of contests streamed at the same time."""
+
+_DEFAULT_IDLE_TIMEOUT = datetime.timedelta(minutes=5)
+"""How long a contest without clients keeps being polled."""
+
+_EVENTS_PATH = re.compile(r'^/contests/([a-zA-Z0-9_.-]+)/events$')
+
+Subscribe = Callable[[str], subscription.ScoreboardSubscription]
+"""A function that returns the upstream subscription of a contest."""
+
+
+def _message(event: str, epoch: str, sequence: int, data: bytes) -> bytes:
+    """Returns a Server-Sent Events message."""
+    header = f'event: {event}\nid: {epoch}-{sequence}\ndata: '.encode('utf-8')
+    return header + data + b'\n\n'
+
+
+class _Listener:
+    """The queue of messages of one downstream client."""
+    def __init__(self) -> None:
+        self.messages: Deque[Tuple[bytes, float]] = collections.deque()
+        self.condition = threading.Condition()
+        self.closed = False
+
+    def get(self, timeout: float) -> Optional[Tuple[bytes, float]]:
+        """Returns the next message, or `None` after `timeout` seconds."""
+        with self.condition:
+            if not self.messages and not self.closed:
+                self.condition.wait(timeout)
+            if not self.messages:
+                return None
+            return self.messages.popleft()
+
+
+class Channel:
+    """Fans the scoreboard of one contest out to its listeners.
+
+    Args:
+        upstream: The subscription to the scoreboard of the contest.
+        max_pending: The messages a listener can fall behind before it gets
+            a new snapshot instead.
+        history: The number of deltas kept to resume streams.
+    """
+    def __init__(self,
+                 upstream: subscription.ScoreboardSubscription,
+                 *,
+                 max_pending: int = _DEFAULT_MAX_PENDING,
+                 history: int = _DEFAULT_HISTORY) -> None:
+        self.upstream = upstream
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._listeners: Set[_Listener] = set()
+        self._scoreboard: Optional[diff.IndexedScoreboard] = None
+        self._snapshot: Optional[bytes] = None
+        self._history: Deque[Tuple[int, bytes]] = collections.deque(
+            maxlen=history)
+        # Distinguishes the ids of this channel from the ones of any channel
+        # that streamed the same contest before it, since both count from 1.
+        self.epoch = uuid.uuid4().hex[:12]
+        self.sequence = 0
+        self.published = 0
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.resyncs = 0
+        self._delivery_total = 0.0
+        self._delivery_max = 0.0
+        self._idle_since: Optional[float] = time.monotonic()
+        upstream.subscribe(self.publish)
+
+    def publish(self, scoreboard: api._Scoreboard) -> None:
+        """Sends a new scoreboard to every listener."""
+        indexed = diff.IndexedScoreboard(scoreboard)
+        empty = copy.copy(scoreboard)
+        empty.problems = []
+        empty.ranking = []
+        snapshot = diff.encode(diff.diff(empty, indexed))
+        published_at = time.monotonic()
+        with self._lock:
+            previous = self._scoreboard
+            self._scoreboard = indexed
+            self.sequence += 1
+            resync = _message('snapshot', self.epoch, self.sequence,
+                              snapshot)
+            self._snapshot = resync
+            if previous is None:
+                message = resync
+            else:
+                data = diff.encode(diff.diff(previous, indexed))
+                message = _message('delta', self.epoch, self.sequence, data)
+                self._history.append((self.sequence, message))
+            self.published += 1
+            listeners = list(self._listeners)
+        for listener in listeners:
+            with listener.condition:
+                if len(listener.messages) >= self._max_pending:
+                    listener.messages.clear()
+                    listener.messages.append((resync, published_at))
+                    with self._lock:
+                        self.resyncs += 1
+                else:
+                    listener.messages.append((message, published_at))
+                listener.condition.notify()
+
+    def _resume_point(self, last_event_id: Optional[str]) -> Optional[int]:
+        """Returns the sequence number after which a stream can resume.
+
+        This is `None` if the message is not from this channel, or if some of
+        the deltas after it are no longer buffered.
+        """
+        if last_event_id is None:
+            return None
+        epoch, _, sequence_id = last_event_id.partition('-')
+        if epoch != self.epoch or not sequence_id.isdigit():
+            return None
+        last_sequence = int(sequence_id)
+        if last_sequence > self.sequence:
+            return None
+        if last_sequence == self.sequence:
+            return last_sequence
+        if self._history and self._history[0][0] <= last_sequence + 1:
+            return last_sequence
+        return None
+
+    def attach(self, last_event_id: Optional[str] = None) -> _Listener:
+        """Adds a listener, with the messages it needs to catch up.
+
+        Args:
+            last_event_id: The id of the last message the client received,
+                if it is resuming a stream.
+        """
+        listener = _Listener()
+        now = time.monotonic()
+        with self._lock:
+            last_sequence = self._resume_point(last_event_id)
+            if last_sequence is not None:
+                listener.messages.extend(
+                    (message, now) for sequence, message in self._history
+                    if sequence > last_sequence)
+            elif self._snapshot is not None:
+                listener.messages.append((self._snapshot, now))
+            self._listeners.add(listener)
+            self._idle_since = None
+        return listener
+
+    def detach(self, listener: _Listener) -> None:
+        """Removes a listener."""
+        with self._lock:
+            self._listeners.discard(listener)
+            if not self._listeners and self._idle_since is None:
+                self._idle_since = time.monotonic()
+        with listener.condition:
+            listener.closed = True
+            listener.condition.notify()
+
+    def idle_seconds(self) -> float:
+        """Returns how long the channel has had no listeners."""
+        with self._lock:
+            if self._idle_since is None:
+                return 0.0
+            return time.monotonic() - self._idle_since
+
+    def delivered(self, message: bytes, published_at: float) -> None:
+        """Records that a message was written to a listener."""
+        delay = time.monotonic() - published_at
+        with self._lock:
+            self.messages_sent += 1
+            self.bytes_sent += len(message)
+            self._delivery_total += delay
+            self._delivery_max = max(self._delivery_max, delay)
+
+    def close(self) -> None:
+        """Disconnects every listener."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            self.detach(listener)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns the metrics of the channel."""
+        with self._lock:
+            mean = 0.0
+            if self.messages_sent:
+                mean = self._delivery_total / self.messages_sent
+            result: Dict[str, Any] = {
+                'subscribers': len(self._listeners),
+                'epoch': self.epoch,
+                'sequence': self.sequence,
+                'published': self.published,
+                'messages_sent': self.messages_sent,
+                'bytes_sent': self.bytes_sent,
+                'resyncs': self.resyncs,
+                'delivery_seconds_mean': mean,
+                'delivery_seconds_max': self._delivery_max,
+                'upstream_lag_seconds': None,
+            }
+            if self._scoreboard is not None:
+                lag = self.upstream.now() - _decoder.epoch(
+                    self._scoreboard.scoreboard.time)
+                result['upstream_lag_seconds'] = max(0.0, lag)
+        return result
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves the streams and the metrics."""
+    server: 'ScoreboardServer'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logging.getLogger('omegaup').debug(format, *args)
+
+    def _json(self, status: int, value: Any) -> None:
+        body = json.dumps(value).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Handles a GET request."""
+        path = self.path.split('?', 1)[0]
+        if path == '/metrics':
+            self._json(200, self.server.metrics())
+            return
+        match = _EVENTS_PATH.match(path)
+        if match is None:
+            self._json(404, {'error': 'not found'})
+            return
+        try:
+            channel, listener = self.server.attach(
+                match.group(1), self.headers.get('Last-Event-ID'))
+        except KeyError:
+            self._json(404, {'error': 'unknown contest'})
+            return
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger('omegaup').exception(
+                'Failed to subscribe to contest %s', match.group(1))
+            self._json(404, {'error': 'unknown contest'})
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.server.connected(1)
+        try:
+            while not self.server.closing:
+                item = listener.get(self.server.keepalive)
+                if listener.closed:
+                    break
+                if item is None:
+                    self.wfile.write(b': keepalive\n\n')
+                    self.wfile.flush()
+                    continue
+                message, published_at = item
+                self.wfile.write(message)
+                self.wfile.flush()
+                channel.delivered(message, published_at)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            channel.detach(listener)
+            self.server.connected(-1)
+
+
+class ScoreboardServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """Streams the scoreboards of contests to many clients.
+
+    Args:
+        address: The address to listen on.
+        subscribe: The function that returns the upstream subscription of a
+            contest. It is called when a contest gets its first client.
+        contests: The aliases of the contests that can be streamed. Defaults
+            to any contest, up to `max_channels` at the same time.
+        max_pending: The messages a client can fall behind before it gets a
+            new snapshot instead.
+        keepalive: The time between comments sent to idle streams.
+        max_channels: The maximum number of contests streamed at the same
+            time.
+        idle_timeout: How long a contest without clients keeps being
+            polled before its subscription is stopped.
+    """
+    daemon_threads = True
+
+    def __init__(self,
+                 address: Tuple[str, int],
+                 subscribe: Subscribe,
+                 *,
+                 contests: Optional[Iterable[str]] = None,
+                 max_pending: int = _DEFAULT_MAX_PENDING,
+                 keepalive: datetime.timedelta = _DEFAULT_KEEPALIVE,
+                 max_channels: int = _DEFAULT_MAX_CHANNELS,
+                 idle_timeout: datetime.timedelta = _DEFAULT_IDLE_TIMEOUT
+                 ) -> None:
+        super().__init__(address, _Handler)
+        self._subscribe = subscribe
+        self._allowed: Optional[Set[str]] = None
+        if contests is not None:
+            self._allowed = set(contests)
+        self._max_pending = max_pending
+        self.keepalive = keepalive.total_seconds()
+        self._max_channels = max_channels
+        self._idle_timeout = idle_timeout.total_seconds()
+        self.closing = False
+        self._lock = threading.Lock()
+        self._channels: Dict[str, Channel] = {}
+        self._connections = 0
+        self._connections_total = 0
+
+    def _attach(self, contest_alias: str,
+                last_event_id: Optional[str]) -> Optional[_Listener]:
+        """Attaches a listener to an existing channel, if any."""
+        channel = self._channels.get(contest_alias)
+        if channel is None:
+            return None
+        return channel.attach(last_event_id)
+
+    def attach(self, contest_alias: str,
+               last_event_id: Optional[str]) -> Tuple[Channel, _Listener]:
+        """Adds a listener to the channel of a contest, starting it if needed.
+
+        The upstream subscription is created without holding any lock, so a
+        slow upstream does not block other clients.
+
+        Args:
+            contest_alias: The alias of the contest.
+            last_event_id: The id of the last message the client received,
+                if it is resuming a stream.
+
+        Raises:
+            KeyError: If the contest cannot be streamed, or if too many
+                contests are being streamed already.
+        """
+        if self._allowed is not None and contest_alias not in self._allowed:
+            raise KeyError(contest_alias)
+        with self._lock:
+            listener = self._attach(contest_alias, last_event_id)
+            if listener is not None:
+                return self._channels[contest_alias], listener
+            if len(self._channels) >= self._max_channels:
+                raise KeyError(contest_alias)
+        channel = Channel(self._subscribe(contest_alias),
+                          max_pending=self._max_pending)
+        with self._lock:
+            # Another client might have started the channel meanwhile.
+            listener = self._attach(contest_alias, last_event_id)
+            if listener is not None:
+                return self._channels[contest_alias], listener
+            if len(self._channels) >= self._max_channels:
+                raise KeyError(contest_alias)
+            self._channels[contest_alias] = channel
+            listener = channel.attach(last_event_id)
+        channel.upstream.start()
+        return channel, listener
+
+    def connected(self, change: int) -> None:
+        """Records that a client connected or disconnected."""
+        with self._lock:
+            self._connections += change
+            if change > 0:
+                self._connections_total += change
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns the metrics of the server and every channel."""
+        with self._lock:
+            channels = dict(self._channels)
+            result: Dict[str, Any] = {
+                'connections': self._connections,
+                'connections_total': self._connections_total,
+            }
+        result['contests'] = {
+            contest_alias: channel.metrics()
+            for contest_alias, channel in channels.items()
+        }
+        return result
+
+    def service_actions(self) -> None:
+        """Stops the channels that have had no clients for a while."""
+        with self._lock:
+            idle = {
+                contest_alias: channel
+                for contest_alias, channel in self._channels.items()
+                if channel.idle_seconds() > self._idle_timeout
+            }
+            for contest_alias in idle:
+                del self._channels[contest_alias]
+        for channel in idle.values():
+            channel.upstream.stop()
+            channel.close()
+
+    def server_close(self) -> None:
+        """Stops the upstream subscriptions and closes every stream."""
+        self.closing = True
+        with self._lock:
+            channels: List[Channel] = list(self._channels.values())
+        for channel in channels:
+            channel.upstream.stop()
+            channel.close()
+        super().server_close()
+
+
+def serve(client: api.Client, address: Tuple[str, int], *,
+          contests: Iterable[str], **kwargs: Any) -> ScoreboardServer:
+    """Returns a server that streams contest scoreboards from omegaUp.
+
+    Every contest is polled with
+    `omegaup.scoreboard.subscription.contest_subscription()`, using the
+    credentials of `client`, so the contests must be listed explicitly.
+
+    Args:
+        client: The API client.
+        address: The address to listen on.
+        contests: The aliases of the contests that can be streamed.
+        kwargs: Arguments forwarded to `ScoreboardServer`.
+    """
+    def _subscribe(contest_alias: str) -> subscription.ScoreboardSubscription:
+        return subscription.contest_subscription(client, contest_alias)
+
+    return ScoreboardServer(address, _subscribe, contests=contests, **kwargs)
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+"""A shared, phase-aware scoreboard poller.
+
+Polling `Contest.scoreboard` on a fixed interval wastes requests before the
+contest starts and after it finishes, and is too slow during the last hour,
+when the ranking changes the most. `ScoreboardSubscription` knows the time
+window of the contest and picks its polling interval from the current
+phase:
+
+- `'before'`: before `start_time`. Polls rarely, and right at the start.
+- `'running'`: polls at a moderate rate.
+- `'closing'`: the last hour before `finish_time`. Polls aggressively.
+- `'frozen'`: after the scoreboard is frozen, when the public scoreboard
+  barely changes.
+- `'finished'`: after `finish_time`. Polls rarely, to pick up late
+  judgements and rejudges.
+
+Phases are computed with the clock of the server, estimated by
+`ServerClock` through `Time.get`, so a skewed local clock does not delay
+the switch to a faster interval. Intervals never go past the next phase
+change.
+
+A single subscription serves any number of local consumers, so they all
+share one upstream poll: callbacks registered with `subscribe()`, and
+asynchronous iterators returned by `updates()`. They are only notified when
+the problems or the ranking change.
+
+Sample usage:
+
+```python
+import omegaup.api
+from omegaup.scoreboard import subscription
+
+client = omegaup.api.Client(api_token='my API token')
+with subscription.contest_subscription(client, 'my-contest') as scoreboard:
+    scoreboard.subscribe(lambda s: print(s.ranking[0].username))
+    input('Press enter to stop')
+```
+"""
+
+import asyncio
+import datetime
+import functools
+import logging
+import threading
+import time
+
+from typing import (Any, AsyncGenerator, Callable, Dict, List, Mapping,
+                    Optional, Tuple)
+
+from omegaup import _decoder, api
+
+PHASES = ('before', 'running', 'closing', 'frozen', 'finished')
+"""The phases of a contest, in order."""
+
+DEFAULT_INTERVALS: Mapping[str, datetime.timedelta] = {
+    'before': datetime.timedelta(minutes=10),
+    'running': datetime.timedelta(seconds=30),
+    'closing': datetime.timedelta(seconds=5),
+    'frozen': datetime.timedelta(seconds=30),
+    'finished': datetime.timedelta(minutes=10),
+}
+"""The default polling interval of every phase."""
+
+_CLOSING_PERIOD = datetime.timedelta(hours=1)
+"""How long before `finish_time` the `'closing'` phase starts."""
+
+Callback = Callable[[api._Scoreboard], None]
+"""A function that is called with every new scoreboard."""
+
+
+def _freeze_time(start_time: float, finish_time: float,
+                 percent: float) -> Optional[float]:
+    """Returns when a scoreboard that shows `percent` of a contest freezes."""
+    if percent >= 100:
+        return None
+    return start_time + (finish_time - start_time) * percent / 100
+
+
+class ServerClock:
+    """Estimates the clock of the omegaUp server.
+
+    The offset is measured once per `sync()`, as the difference between the
+    time reported by `Time.get` and the local time halfway through the
+    request.
+
+    Args:
+        client: The API client.
+    """
+    def __init__(self, client: api.Client) -> None:
+        self._client = client
+        self.offset = 0.0
+        """The seconds that the server clock is ahead of the local one."""
+
+    def sync(self) -> None:
+        """Measures the offset of the server clock."""
+        before = time.time()
+        server_time = _decoder.epoch(self._client.time.get().time)
+        after = time.time()
+        self.offset = server_time - (before + after) / 2
+
+    def now(self) -> float:
+        """Returns the current server time, in seconds since the epoch."""
+        return time.time() + self.offset
+
+
+class ScoreboardSubscription:
+    """Polls a scoreboard at a phase-dependent rate for many consumers.
+
+    Args:
+        fetch: The function that returns the scoreboard.
+        start_time: When the contest starts.
+        finish_time: When the contest finishes, if it does.
+        freeze_time: When the scoreboard is frozen, if it is.
+        freeze_percent: The percentage of the contest that the scoreboard
+            shows before it is frozen, as in the `scoreboard` field of
+            `Contest.publicDetails`. Unlike `freeze_time`, the freeze time
+            computed from it follows the contest when it is rescheduled.
+            Requires `finish_time`.
+        clock: The clock used to compute the phase. Defaults to the local
+            one.
+        intervals: The polling interval of some phases, overriding the ones
+            in `DEFAULT_INTERVALS`.
+    """
+    def __init__(
+            self,
+            fetch: Callable[[], api._Scoreboard],
+            *,
+            start_time: Any,
+            finish_time: Optional[Any] = None,
+            freeze_time: Optional[Any] = None,
+            freeze_percent: Optional[float] = None,
+            clock: Optional[ServerClock] = None,
+            intervals: Optional[Mapping[str, datetime.timedelta]] = None
+    ) -> None:
+        self._fetch = fetch
+        self.start_time = _decoder.epoch(start_time)
+        self.finish_time: Optional[int] = None
+        if finish_time is not None:
+            self.finish_time = _decoder.epoch(finish_time)
+        if freeze_percent is not None:
+            if freeze_time is not None:
+                raise ValueError(
+                    'freeze_time and freeze_percent are mutually exclusive')
+            if finish_time is None:
+                raise ValueError('freeze_percent requires a finish_time')
+        self._freeze_percent = freeze_percent
+        self.freeze_time: Optional[int] = None
+        if freeze_time is not None:
+            self.freeze_time = _decoder.epoch(freeze_time)
+        self._update_freeze_time()
+        self._clock = clock
+        self._intervals: Dict[str, float] = {
+            phase: interval.total_seconds()
+            for phase, interval in DEFAULT_INTERVALS.items()
+        }
+        for phase, interval in (intervals or {}).items():
+            if phase not in self._intervals:
+                raise ValueError(f'Unknown phase: {phase!r}')
+            self._intervals[phase] = interval.total_seconds()
+        self.scoreboard: Optional[api._Scoreboard] = None
+        """The latest scoreboard, if any."""
+        self._signature: Optional[Tuple[Any, Any]] = None
+        self._subscribers: List[Callback] = []
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _update_freeze_time(self) -> None:
+        """Recomputes the freeze time from the freeze percentage, if any."""
+        if self._freeze_percent is None or self.finish_time is None:
+            return
+        freeze_time = _freeze_time(self.start_time, self.finish_time,
+                                   self._freeze_percent)
+        self.freeze_time = (None if freeze_time is None else
+                            _decoder.epoch(freeze_time))
+
+    def now(self) -> float:
+        """Returns the current time, in seconds since the epoch."""
+        if self._clock is None:
+            return time.time()
+        return self._clock.now()
+
+    def _boundaries(self) -> List[Tuple[float, str]]:
+        """Returns the times at which every phase starts, in order."""
+        boundaries: List[Tuple[float, str]] = [(self.start_time, 'running')]
+        if self.finish_time is not None:
+            closing = self.finish_time - _CLOSING_PERIOD.total_seconds()
+            boundaries.append((max(self.start_time, closing), 'closing'))
+            boundaries.append((self.finish_time, 'finished'))
+        if self.freeze_time is not None:
+            boundaries.append((self.freeze_time, 'frozen'))
+        # At the same time, the later phase wins.
+        boundaries.sort(key=lambda b: (b[0], PHASES.index(b[1])))
+        return boundaries
+
+    def phase(self, now: Optional[float] = None) -> str:
+        """Returns the phase of the contest at a time.
+
+        Args:
+            now: The time, in seconds since the epoch. Defaults to now.
+        """
+        if now is None:
+            now = self.now()
+        result = 'before'
+        for boundary, phase in self._boundaries():
+            if now < boundary:
+                break
+            if phase == 'closing' and result == 'frozen':
+                # A scoreboard frozen before the last hour stays frozen.
+                continue
+            result = phase
+        return result
+
+    def interval(self, now: Optional[float] = None) -> float:
+        """Returns the seconds until the next poll after a poll at a time.
+
+        Args:
+            now: The time, in seconds since the epoch. Defaults to now.
+        """
+        if now is None:
+            now = self.now()
+        result = self._intervals[self.phase(now)]
+        for boundary, _ in self._boundaries():
+            if now < boundary:
+                result = min(result, boundary - now)
+                break
+        return max(result, 0.0)
+
+    def subscribe(self, callback: Callback) -> Callable[[], None]:
+        """Registers a callback for new scoreboards.
+
+        Callbacks are invoked from the thread that polls.
+
+        Returns:
+            A function that unregisters the callback.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    def poll(self) -> Optional[api._Scoreboard]:
+        """Fetches the scoreboard and notifies it if it changed.
+
+        Returns:
+            The scoreboard if it changed, `None` otherwise.
+        """
+        with self._poll_lock:
+            scoreboard = self._fetch()
+            # The contest might have been rescheduled.
+            self.start_time = _decoder.epoch(scoreboard.start_time)
+            if scoreboard.finish_time is not None:
+                self.finish_time = _decoder.epoch(scoreboard.finish_time)
+            self._update_freeze_time()
+            self.scoreboard = scoreboard
+            signature = (scoreboard.problems, scoreboard.ranking)
+            if signature == self._signature:
+                return None
+            self._signature = signature
+            with self._lock:
+                subscribers = self._subscribers[:]
+        for callback in subscribers:
+            try:
+                callback(scoreboard)
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger('omegaup').exception(
+                    'Scoreboard callback failed')
+        return scoreboard
+
+    async def updates(self) -> AsyncGenerator[api._Scoreboard, None]:
+        """Yields the new scoreboards as they arrive.
+
+        The latest scoreboard, if any, is yielded first.
+        """
+        loop = asyncio.get_running_loop()
+        queue: 'asyncio.Queue[api._Scoreboard]' = asyncio.Queue()
+
+        def _enqueue(scoreboard: api._Scoreboard) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, scoreboard)
+
+        unsubscribe = self.subscribe(_enqueue)
+        try:
+            if self.scoreboard is not None:
+                yield self.scoreboard
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger('omegaup').exception(
+                    'Failed to poll the scoreboard')
+            self._stop.wait(self.interval())
+
+    def start(self) -> None:
+        """Starts polling in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='omegaup-scoreboard',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> 'ScoreboardSubscription':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+def contest_freeze_time(
+        details: api.ContestPublicDetailsResponse) -> Optional[float]:
+    """Returns when the scoreboard of a contest is frozen, if it is.
+
+    The scoreboard shows the submissions of the first `details.scoreboard`
+    percent of the contest.
+
+    Args:
+        details: The details of the contest, from `Contest.publicDetails`.
+
+    Returns:
+        The freeze time in seconds since the epoch, or `None` if the
+        scoreboard is never frozen.
+    """
+    return _freeze_time(_decoder.epoch(details.start_time),
+                        _decoder.epoch(details.finish_time),
+                        details.scoreboard)
+
+
+def contest_subscription(client: api.Client,
+                         contest_alias: str,
+                         *,
+                         token: Optional[str] = None,
+                         **kwargs: Any) -> ScoreboardSubscription:
+    """Returns a subscription to the scoreboard of a contest.
+
+    The time window and the freeze percentage are read from
+    `Contest.publicDetails`, and the clock is synchronized with the server.
+
+    Args:
+        client: The API client.
+        contest_alias: The alias of the contest.
+        token: The scoreboard token, if any. Scoreboards seen with an admin
+            token are not frozen, so consider passing
+            `intervals={'frozen': DEFAULT_INTERVALS['closing']}`.
+        kwargs: Arguments forwarded to `ScoreboardSubscription`.
+    """
+    details = client.contest.publicDetails(contest_alias=contest_alias)
+    start_time = _decoder.epoch(details.start_time)
+    finish_time = _decoder.epoch(details.finish_time)
+    if 'clock' not in kwargs:
+        kwargs['clock'] = ServerClock(client)
+        kwargs['clock'].sync()
+    fetch = functools.partial(client.contest.scoreboard,
+                              contest_alias=contest_alias,
+                              token=token)
+    return ScoreboardSubscription(fetch,
+                                  start_time=start_time,
+                                  finish_time=finish_time,
+                                  freeze_percent=details.scoreboard,
+                                  **kwargs)
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""An in-process prefix index over users and identities.
+
+Admin tools usually call `Contest.searchUsers`, `Course.searchUsers` or
+`User.list` on every keystroke of a typeahead. `UserIndex` instead keeps the
+participants of the contests, courses and groups that the tool cares about
+in a trie keyed by their username, their full name and every word of their
+name (casefolded and without accents), so a query only walks as many trie
+nodes as it has characters.
+
+Sample usage:
+
+```python
+import omegaup.api
+import omegaup.userindex
+
+client = omegaup.api.Client(api_token='my API token')
+index = omegaup.userindex.UserIndex()
+index.add_course_students(client, 'my-course')
+for user in index.search('jose'):
+    print(user.username, user.name)
+```
+"""
+
+import bisect
+import dataclasses
+import functools
+
+from typing import Dict, List, Optional, Set
+
+from omegaup import _paginate, _text, api
+
+
+@dataclasses.dataclass
+class IndexedUser:
+    """A user or identity in the index."""
+    username: str
+    name: Optional[str]
+
+
+class _Node:
+    """A node of the trie."""
+    __slots__ = ('children', 'usernames')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_Node'] = {}
+        # The sorted usernames of every key that goes through this node.
+        self.usernames: List[str] = []
+
+
+def _keys(username: str, name: Optional[str]) -> Set[str]:
+    """Returns the normalized keys under which a user is indexed."""
+    keys = {_text.normalize(username)}
+    if name:
+        keys.add(_text.normalize(name))
+        keys.update(_text.tokenize(name))
+    return keys
+
+
+class UserIndex:
+    """A trie of users for local typeahead queries."""
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._users: Dict[str, IndexedUser] = {}
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, username: object) -> bool:
+        return username in self._users
+
+    def _insert(self, key: str, username: str) -> None:
+        node = self._root
+        for c in key:
+            child = node.children.get(c)
+            if child is None:
+                child = node.children[c] = _Node()
+            node = child
+            bisect.insort(node.usernames, username)
+
+    def _delete(self, key: str, username: str) -> None:
+        path = [self._root]
+        for c in key:
+            path.append(path[-1].children[c])
+        for node in path[1:]:
+            del node.usernames[bisect.bisect_left(node.usernames, username)]
+        for parent, c, node in reversed(list(zip(path, key, path[1:]))):
+            if node.usernames:
+                break
+            del parent.children[c]
+
+    def add(self, username: str, name: Optional[str] = None) -> bool:
+        """Adds a user to the index.
+
+        If the user was already indexed, its name is updated, unless `name`
+        is `None`.
+
+        Returns whether the index changed.
+        """
+        user = self._users.get(username)
+        if user is not None:
+            if name is None or name == user.name:
+                return False
+            self.remove(username)
+        self._users[username] = IndexedUser(username=username, name=name)
+        for key in _keys(username, name):
+            self._insert(key, username)
+        return True
+
+    def remove(self, username: str) -> bool:
+        """Removes a user. Returns whether it was in the index."""
+        user = self._users.pop(username, None)
+        if user is None:
+            return False
+        for key in _keys(user.username, user.name):
+            self._delete(key, username)
+        return True
+
+    def search(self, prefix: str, limit: int = 10) -> List[IndexedUser]:
+        """Returns the users whose username or name start with `prefix`.
+
+        Words of the name are also matched individually.
+
+        Args:
+            prefix: The text typed so far.
+            limit: The maximum number of users returned.
+
+        Returns:
+            The matching users, sorted by username.
+        """
+        key = _text.normalize(prefix)
+        if not key:
+            return [
+                self._users[username]
+                for username in sorted(self._users)[:limit]
+            ]
+        node: Optional[_Node] = self._root
+        for c in key:
+            assert node is not None
+            node = node.children.get(c)
+            if node is None:
+                return []
+        assert node is not None
+        usernames = node.usernames
+        result: List[IndexedUser] = []
+        for username in usernames:
+            # A user appears once for every matching key, and the
+            # duplicates are adjacent because the list is sorted.
+            if result and result[-1].username == username:
+                continue
+            if len(result) >= limit:
+                break
+            result.append(self._users[username])
+        return result
+
+    def add_contest_users(self, client: api.Client, contest_alias: str) -> int:
+        """Adds the participants of a contest.
+
+        Returns the number of users that were added or updated.
+        """
+        response = client.contest.users(contest_alias=contest_alias)
+        return sum(self.add(user.username) for user in response.users)
+
+    def add_course_students(self, client: api.Client,
+                            course_alias: str) -> int:
+        """Adds the students of a course.
+
+        Returns the number of users that were added or updated.
+        """
+        response = client.course.listStudents(course_alias=course_alias)
+        return sum(
+            self.add(student.username, student.name)
+            for student in response.students)
+
+    def add_group_members(self, client: api.Client, group_alias: str) -> int:
+        """Adds the members of a group.
+
+        Returns the number of users that were added or updated.
+        """
+        response = client.group.members(group_alias=group_alias)
+        return sum(
+            self.add(identity.username, identity.name)
+            for identity in response.identities)
+
+    def add_teams_group_members(
+            self,
+            client: api.Client,
+            team_group_alias: str,
+            page_size: int = _paginate.DEFAULT_PAGE_SIZE) -> int:
+        """Adds the members of every team of a teams group.
+
+        Returns the number of users that were added or updated.
+        """
+        fetch = functools.partial(client.teamsGroup.teamsMembers,
+                                  team_group_alias=team_group_alias)
+        members = _paginate.items(fetch,
+                                  items='teamsUsers',
+                                  page='page',
+                                  page_size='page_size',
+                                  first_page=1,
+                                  size=page_size,
+                                  total='totalRows')
+        return sum(
+            self.add(member.username, member.name) for member in members)
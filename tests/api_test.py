@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.api."""
+
+import subprocess
+import sys
+import unittest
+
+import omegaup.api
+
+
+class TestApi(unittest.TestCase):
+    """Test omegaup.api."""
+    def test_lazy_import(self) -> None:
+        """Importing omegaup.api does not load any controller module."""
+        loaded = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                ('import sys, omegaup.api; '
+                 'print(*sorted(m for m in sys.modules '
+                 'if m.startswith("omegaup.api.")))'),
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout.split()
+        self.assertEqual(loaded, ['omegaup.api._base'])
+
+    def test_lazy_attributes(self) -> None:
+        """Controllers and types are loaded on first access."""
+        client = omegaup.api.Client(api_token='token')
+        self.assertIsInstance(client.contest, omegaup.api.Contest)
+        self.assertIs(client.contest, client.contest)
+        self.assertIs(omegaup.api._Run, omegaup.api.RunStatusResponse)
+        self.assertIn('_Scoreboard', dir(omegaup.api))
+        with self.assertRaises(AttributeError):
+            getattr(omegaup.api, 'NotAController')
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
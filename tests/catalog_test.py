@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.catalog."""
+
+import itertools
+import threading
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import omegaup.api
+import omegaup.catalog
+
+
+def _problem(alias: str) -> Dict[str, Any]:
+    return {
+        'accepted': 1,
+        'alias': alias,
+        'difficulty': None,
+        'difficulty_histogram': [],
+        'points': 1.0,
+        'problem_id': 1,
+        'quality': None,
+        'quality_histogram': [],
+        'quality_seal': False,
+        'ratio': 1.0,
+        'score': 0.0,
+        'submissions': 1,
+        'tags': [],
+        'title': alias,
+        'visibility': 2,
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves a catalog that can change during the crawl."""
+    def __init__(self, aliases: List[str]) -> None:
+        super().__init__(api_token='token')
+        self.aliases = aliases
+        self.pages: List[int] = []
+        self._lock = threading.Lock()
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert endpoint == '/api/problem/list/'
+        assert payload is not None
+        page = int(payload['page'])
+        rowcount = int(payload['rowcount'])
+        with self._lock:
+            self.pages.append(page)
+            if page == 1 and len(self.pages) == 1:
+                # Answer with the catalog as it was, and then add a new
+                # problem at the top.
+                aliases = self.aliases[:]
+                self.aliases.insert(0, 'new')
+            else:
+                aliases = self.aliases
+        start = (page - 1) * rowcount
+        return {
+            'results': [_problem(a) for a in aliases[start:start + rowcount]],
+            'total': len(aliases),
+        }
+
+
+class TestCatalog(unittest.TestCase):
+    """Test omegaup.catalog."""
+    def test_iter_problems(self) -> None:
+        """The catalog is fetched in order and without duplicates."""
+        aliases = [f'problem{i:02}' for i in range(30)]
+        client = _FakeClient(aliases[:])
+        problems = list(
+            omegaup.catalog.iter_problems(client, page_size=10, max_workers=3))
+        self.assertEqual([p.alias for p in problems], aliases)
+        # The catalog grew by one, so one more page had to be fetched.
+        self.assertEqual(sorted(client.pages), [1, 2, 3, 4])
+
+    def test_stop_early(self) -> None:
+        """Stopping early does not fetch the rest of the catalog."""
+        client = _FakeClient([f'problem{i:03}' for i in range(100)])
+        it = omegaup.catalog.iter_problems(client,
+                                           page_size=10,
+                                           max_workers=2)
+        problems = list(itertools.islice(it, 15))
+        it.close()
+        self.assertEqual(len(problems), 15)
+        # Page 2 is being consumed, and only the next `max_workers` pages
+        # were requested ahead of it.
+        self.assertLessEqual(set(client.pages), {1, 2, 3, 4})
+
+    def test_short_catalog(self) -> None:
+        """A catalog that fits in a single page is fetched once."""
+        client = _FakeClient(['a', 'b'])
+        problems = list(omegaup.catalog.iter_problems(client, page_size=10))
+        self.assertEqual([p.alias for p in problems], ['a', 'b'])
+        self.assertEqual(client.pages, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.clarifications."""
+
+import asyncio
+import datetime
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import omegaup.api
+import omegaup.clarifications
+
+
+def _clarification(clarification_id: int,
+                   answer: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        'answer': answer,
+        'author': f'user{clarification_id}',
+        'clarification_id': clarification_id,
+        'contest_alias': 'contest',
+        'message': f'Question {clarification_id}',
+        'problem_alias': 'sumas',
+        'public': False,
+        'time': 1600000000 + clarification_id,
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves the clarifications of a contest.
+
+    Unanswered clarifications are listed first, then newest first.
+    """
+    def __init__(self, clarifications: List[Dict[str, Any]]) -> None:
+        super().__init__(api_token='token', timestamps='epoch')
+        self.clarifications = clarifications
+        self.offsets: List[int] = []
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert endpoint == '/api/contest/clarifications/'
+        assert payload is not None
+        offset = int(payload['offset'])
+        rowcount = int(payload['rowcount'])
+        self.offsets.append(offset)
+        clarifications = sorted(
+            self.clarifications,
+            key=lambda c: (c['answer'] is not None, -c['clarification_id']))
+        return {
+            'clarifications':
+            clarifications[offset * rowcount:(offset + 1) * rowcount],
+        }
+
+
+class TestClarifications(unittest.TestCase):
+    """Test omegaup.clarifications."""
+    def test_poll(self) -> None:
+        """Only new and updated clarifications are reported."""
+        client = _FakeClient(
+            [_clarification(i, answer='No') for i in range(1, 10)])
+        client.clarifications.append(_clarification(10))
+        watcher = omegaup.clarifications.contest_watcher(
+            client,
+            'contest',
+            page_size=3,
+            min_interval=datetime.timedelta(seconds=1),
+            max_interval=datetime.timedelta(seconds=3))
+        received: List[int] = []
+        unsubscribe = watcher.subscribe(
+            lambda c: received.append(c.clarification_id))
+
+        self.assertEqual(len(watcher.poll()), 10)
+        self.assertEqual(client.offsets, [0, 1, 2, 3])
+        self.assertEqual(received, [10, 9, 8, 7, 6, 5, 4, 3, 2, 1])
+        self.assertEqual(watcher.interval, 1)
+
+        # Nothing changed, so only the first page is fetched.
+        client.offsets.clear()
+        received.clear()
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(client.offsets, [0])
+        self.assertEqual(received, [])
+        self.assertEqual(watcher.interval, 2)
+        watcher.poll()
+        self.assertEqual(watcher.interval, 3)
+
+        # A new clarification and an answer to the pending one.
+        client.clarifications[9] = _clarification(10, answer='Yes')
+        client.clarifications.append(_clarification(11))
+        client.offsets.clear()
+        self.assertEqual(
+            [c.clarification_id for c in watcher.poll()], [11, 10])
+        self.assertEqual(client.offsets, [0])
+        self.assertEqual(received, [11, 10])
+        self.assertEqual(watcher.interval, 1)
+
+        unsubscribe()
+        client.clarifications.append(_clarification(12))
+        self.assertEqual(len(watcher.poll()), 1)
+        self.assertEqual(received, [11, 10])
+
+    def test_updates(self) -> None:
+        """Clarifications are delivered to asynchronous iterators."""
+        client = _FakeClient([_clarification(1)])
+        watcher = omegaup.clarifications.contest_watcher(client, 'contest')
+
+        async def _first() -> int:
+            updates = watcher.updates()
+            first = asyncio.ensure_future(updates.__anext__())
+            # Let the iterator subscribe before polling.
+            await asyncio.sleep(0)
+            watcher.poll()
+            clarification = await first
+            await updates.aclose()
+            return clarification.clarification_id
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(_first()), 1)
+        finally:
+            loop.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.codec."""
+
+import datetime
+import pickle
+import unittest
+
+from typing import Any, Dict
+
+import omegaup.api
+import omegaup.codec
+from omegaup import _decoder
+
+
+def _scoreboard() -> Dict[str, Any]:
+    return {
+        'finish_time': None,
+        'problems': [{'alias': 'sumas', 'order': 1}],
+        'ranking': [{
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'is_invited': True,
+            'name': None,
+            'place': 1,
+            'problems': [{
+                'alias': 'sumas',
+                'penalty': 10.0,
+                'percent': 100.0,
+                'points': 100.0,
+                'runs': 1,
+            }],
+            'total': {'penalty': 10.0, 'points': 100.0},
+            'username': 'user',
+        }],
+        'start_time': 1600000000,
+        'time': 1600003600,
+        'title': 'Contest',
+    }
+
+
+class TestCodec(unittest.TestCase):
+    """Test omegaup.codec."""
+    def test_roundtrip(self) -> None:
+        """Objects survive a serialization roundtrip."""
+        scoreboard = _decoder.decode(omegaup.api._Scoreboard, _scoreboard())
+        for fmt in omegaup.codec.FORMATS:
+            with self.subTest(format=fmt):
+                data = omegaup.codec.to_bytes(scoreboard, format=fmt)
+                self.assertEqual(
+                    omegaup.codec.from_bytes(omegaup.api._Scoreboard, data),
+                    scoreboard)
+                self.assertLess(len(data),
+                                len(pickle.dumps(scoreboard, protocol=5)))
+
+    def test_timestamps(self) -> None:
+        """Timestamps are restored according to the policy."""
+        data = omegaup.codec.to_bytes(
+            _decoder.decode(omegaup.api._Scoreboard, _scoreboard()))
+        self.assertEqual(
+            omegaup.codec.from_bytes(omegaup.api._Scoreboard,
+                                     data,
+                                     timestamps='epoch').start_time,
+            1600000000)
+        self.assertEqual(
+            omegaup.codec.from_bytes(omegaup.api._Scoreboard,
+                                     data,
+                                     timestamps='utc').start_time,
+            datetime.datetime(2020, 9, 13, 12, 26, 40,
+                              tzinfo=datetime.timezone.utc))
+
+    def test_layout_mismatch(self) -> None:
+        """Decoding into a different type is rejected."""
+        data = omegaup.codec.to_bytes(
+            _decoder.decode(omegaup.api._Scoreboard, _scoreboard()))
+        with self.assertRaises(ValueError):
+            omegaup.codec.from_bytes(omegaup.api._ContestReport, data)
+
+    def test_globals_rejected(self) -> None:
+        """Pickled payloads that reference globals are not loaded."""
+        data = omegaup.codec.to_bytes(
+            _decoder.decode(omegaup.api._Scoreboard, _scoreboard()))
+        malicious = data[:omegaup.codec._HEADER.size] + pickle.dumps(
+            datetime.datetime(2020, 1, 1), protocol=5)
+        with self.assertRaises(pickle.UnpicklingError):
+            omegaup.codec.from_bytes(omegaup.api._Scoreboard, malicious)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup._decoder."""
+
+import dataclasses
+import datetime
+import random
+import unittest
+import unittest.mock
+
+from typing import Any
+
+import omegaup.api
+from omegaup import _decoder
+
+import _payloads
+
+
+def _sample(tp: Any, rnd: random.Random) -> Any:
+    """Returns a random JSON value for type `tp`."""
+    return _payloads.sample(tp, rnd, list_size=2, none_probability=0.5)
+
+
+class TestDecoder(unittest.TestCase):
+    """Test omegaup._decoder."""
+    def test_matches_constructors(self) -> None:
+        """Decoders produce the same objects as the constructors."""
+        rnd = random.Random(0)
+        for name in dir(omegaup.api):
+            cls = getattr(omegaup.api, name)
+            if not name.startswith('_') or not isinstance(cls, type):
+                continue
+            if not dataclasses.is_dataclass(cls):
+                continue
+            for _ in range(2):
+                value = _sample(cls, rnd)
+                with self.subTest(cls=name):
+                    self.assertEqual(_decoder.decode(cls, value),
+                                     cls(**value))
+
+    def test_keyword_fields(self) -> None:
+        """Fields named after Python keywords are read from the JSON key."""
+        item = _decoder.decode(omegaup.api._PageItem, {
+            'class': 'active',
+            'label': '1',
+            'page': 1,
+        })
+        self.assertEqual(item.class_, 'active')
+        self.assertIsNone(item.url)
+
+    def test_ignores_unknown_keys(self) -> None:
+        """Unknown keys in the response are ignored."""
+        total = _decoder.decode(omegaup.api._ScoreboardEvent_total, {
+            'penalty': 1.0,
+            'points': 2.0,
+            'unknown': 3,
+        })
+        self.assertEqual(total,
+                         omegaup.api._ScoreboardEvent_total(penalty=1.0,
+                                                            points=2.0))
+
+    def test_interned_fields(self) -> None:
+        """Low-cardinality strings are shared across decoded objects."""
+        rnd = random.Random(0)
+        runs = []
+        for _ in range(2):
+            value = _sample(omegaup.api._Run, rnd)
+            value['country'] = ''.join(['M', 'X'])
+            value['verdict'] = ''.join(['A', 'C'])
+            value['username'] = ''.join(['us', 'er'])
+            runs.append(_decoder.decode(omegaup.api._Run, value))
+        self.assertIs(runs[0].country, runs[1].country)
+        self.assertIs(runs[0].verdict, runs[1].verdict)
+        # High-cardinality strings are not interned across responses.
+        self.assertIsNot(runs[0].username, runs[1].username)
+
+    def test_deduped_fields(self) -> None:
+        """High-cardinality strings are shared within one response."""
+        rnd = random.Random(0)
+        values = []
+        for _ in range(3):
+            value = _sample(omegaup.api._Run, rnd)
+            value['username'] = ''.join(['us', 'er'])
+            value['alias'] = ''.join(['su', 'mas'])
+            values.append(value)
+        runs = list(_decoder.decode_each(omegaup.api._Run, values))
+        self.assertEqual(runs, [omegaup.api._Run(**v) for v in values])
+        self.assertIs(runs[0].username, runs[2].username)
+        self.assertIs(runs[0].alias, runs[1].alias)
+
+        # Nested objects share the strings of their parent.
+        scoreboard = _sample(omegaup.api._Scoreboard, rnd)
+        entry = _sample(omegaup.api._ScoreboardRankingEntry, rnd)
+        scoreboard['ranking'] = [
+            dict(entry, username=''.join(['us', 'er'])) for _ in range(2)
+        ]
+        ranking = _decoder.decode(omegaup.api._Scoreboard, scoreboard).ranking
+        self.assertIs(ranking[0].username, ranking[1].username)
+
+    def test_decode_stream(self) -> None:
+        """Streams only share strings between nearby objects."""
+        rnd = random.Random(0)
+        values = []
+        for i in range(12):
+            value = _sample(omegaup.api._Run, rnd)
+            value['username'] = ''.join(
+                ['us', 'er'] if i in (0, 1, 11) else ['user', str(i)])
+            values.append(value)
+        with unittest.mock.patch.object(_decoder, '_STREAM_MEMO_SIZE', 4):
+            runs = list(
+                _decoder.decode_stream(omegaup.api._Run, iter(values)))
+        self.assertEqual(runs, [omegaup.api._Run(**v) for v in values])
+        self.assertIs(runs[0].username, runs[1].username)
+        # The shared strings were dropped after a few distinct ones.
+        self.assertIsNot(runs[0].username, runs[11].username)
+
+    def test_timestamp_policies(self) -> None:
+        """Timestamps are decoded according to the policy."""
+        value = _sample(omegaup.api._Run, random.Random(0))
+        value['time'] = 1600000000
+        self.assertEqual(
+            _decoder.decode(omegaup.api._Run, value).time,
+            datetime.datetime.fromtimestamp(1600000000))
+        self.assertEqual(
+            _decoder.decode(omegaup.api._Run, value, timestamps='utc').time,
+            datetime.datetime(2020, 9, 13, 12, 26, 40,
+                              tzinfo=datetime.timezone.utc))
+        self.assertEqual(
+            _decoder.decode(omegaup.api._Run, value, timestamps='epoch').time,
+            1600000000)
+        with self.assertRaises(ValueError):
+            _decoder.decode(omegaup.api._Run, value, timestamps='unknown')
+        with self.assertRaises(ValueError):
+            omegaup.api.Client(api_token='token', timestamps='unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
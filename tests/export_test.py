@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.export."""
+
+import os.path
+import tempfile
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import omegaup.api
+
+try:
+    import pyarrow.feather  # type: ignore
+    import pyarrow.parquet  # type: ignore
+
+    import omegaup.export
+except ImportError:
+    pyarrow = None
+
+
+def _run(index: int) -> Dict[str, Any]:
+    return {
+        'alias': 'sumas',
+        'classname': 'user-rank-unranked',
+        'country': 'MX',
+        'guid': f'{index:032x}',
+        'language': 'cpp17-gcc',
+        'memory': 1024,
+        'penalty': index,
+        'runtime': 10,
+        'score': 1.0,
+        'score_by_group': {'easy': 0.5, 'hard': None},
+        'status': 'ready',
+        'submit_delay': 0,
+        'time': 1600000000 + index,
+        'username': f'user{index}',
+        'verdict': 'AC',
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves a fixed number of runs."""
+    def __init__(self, total_runs: int) -> None:
+        super().__init__(api_token='token')
+        self.total_runs = total_runs
+        self.calls: List[Mapping[str, str]] = []
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert endpoint == '/api/contest/runs/'
+        assert payload is not None
+        self.calls.append(payload)
+        rowcount = int(payload['rowcount'])
+        start = int(payload['offset']) * rowcount
+        end = min(start + rowcount, self.total_runs)
+        return {
+            'runs': [_run(i) for i in range(start, end)],
+            'totalRuns': self.total_runs,
+        }
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class TestExport(unittest.TestCase):
+    """Test omegaup.export."""
+    def test_schema(self) -> None:
+        """Every generated type can be mapped to an Arrow schema."""
+        for name in dir(omegaup.api):
+            value = getattr(omegaup.api, name)
+            if name.startswith('_') and isinstance(value, type):
+                omegaup.export.schema_for(value)
+
+    def test_export_contest_runs(self) -> None:
+        """Runs are written one page at a time."""
+        client = _FakeClient(25)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for fmt in ('parquet', 'feather'):
+                path = os.path.join(tmpdir, f'runs.{fmt}')
+                client.calls.clear()
+                self.assertEqual(
+                    omegaup.export.export_contest_runs(
+                        client,
+                        path,
+                        contest_alias='contest',
+                        problem_alias='sumas',
+                        page_size=10,
+                        format=fmt),
+                    25,
+                )
+                self.assertEqual(len(client.calls), 3)
+                if fmt == 'parquet':
+                    table = pyarrow.parquet.read_table(path)
+                else:
+                    table = pyarrow.feather.read_table(path)
+                self.assertEqual(table.num_rows, 25)
+                rows = table.to_pylist()
+                self.assertEqual(rows[3]['username'], 'user3')
+                self.assertEqual(
+                    int(rows[3]['time'].timestamp()), 1600000003)
+                self.assertEqual(rows[3]['score_by_group'], [('easy', 0.5),
+                                                             ('hard', None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup._jsonstream."""
+
+import json
+import unittest
+import unittest.mock
+
+from typing import Any, Dict, Iterator, List
+
+import omegaup.api
+from omegaup import _jsonstream
+
+
+def _chunks(data: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+class TestJsonStream(unittest.TestCase):
+    """Test omegaup._jsonstream."""
+    def test_iter_array(self) -> None:
+        """Elements are decoded regardless of how the input is chunked."""
+        document = {
+            'before': {'nested': [1, 2, {'x': 'y'}]},
+            'runs': [12345, 'ñandú', {'a': [1.5e3, None, True]}, [], -7],
+            'totalRuns': 1234567,
+        }
+        data = json.dumps(document, ensure_ascii=False,
+                          indent=1).encode('utf-8')
+        for size in (1, 2, 3, 7, len(data)):
+            with self.subTest(size=size):
+                members: Dict[str, Any] = {}
+                self.assertEqual(
+                    list(
+                        _jsonstream.iter_array(_chunks(data, size), 'runs',
+                                               members)),
+                    document['runs'],
+                )
+                self.assertEqual(members, {
+                    'before': document['before'],
+                    'totalRuns': 1234567,
+                })
+
+    def test_split_points(self) -> None:
+        """Values are decoded regardless of where the input is split."""
+        documents = [
+            {'totalRuns': 1.5, 'runs': [1.5, -2e10, True, None, 'x', 0.25]},
+            {'runs': [[1.5, 25], {'a': 12.75}], 'page': 10, 'ok': False},
+        ]
+        for document in documents:
+            data = json.dumps(document, separators=(',', ':')).encode('utf-8')
+            for split in range(len(data) + 1):
+                with self.subTest(data=data, split=split):
+                    members: Dict[str, Any] = {}
+                    self.assertEqual(
+                        list(
+                            _jsonstream.iter_array(
+                                [data[:split], data[split:]], 'runs',
+                                members)),
+                        document['runs'],
+                    )
+                    self.assertEqual(
+                        members,
+                        {k: v
+                         for k, v in document.items() if k != 'runs'})
+
+    def test_empty(self) -> None:
+        """Empty objects and arrays yield nothing."""
+        self.assertEqual(list(_jsonstream.iter_array([b'{}'], 'runs')), [])
+        self.assertEqual(
+            list(_jsonstream.iter_array([b'{"runs": [ ]}'], 'runs')), [])
+
+    def test_truncated(self) -> None:
+        """Truncated responses raise an error."""
+        with self.assertRaises(json.JSONDecodeError):
+            list(_jsonstream.iter_array([b'{"runs": [1, {"a"'], 'runs'))
+
+    def test_stream_runs(self) -> None:
+        """Client.contest.stream_runs yields decoded runs."""
+        run: Dict[str, Any] = {
+            'alias': 'sumas',
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'guid': '0' * 32,
+            'language': 'py3',
+            'memory': 0,
+            'penalty': 0,
+            'runtime': 0,
+            'score': 1.0,
+            'status': 'ready',
+            'submit_delay': 0,
+            'time': 1600000000,
+            'username': 'user',
+            'verdict': 'AC',
+        }
+        data = json.dumps({'runs': [run] * 3, 'totalRuns': 3}).encode('utf-8')
+        response = unittest.mock.MagicMock()
+        response.__enter__.return_value = response
+        response.status_code = 200
+        response.iter_content.side_effect = lambda chunk_size: _chunks(
+            data, 16)
+        client = omegaup.api.Client(api_token='token')
+        with unittest.mock.patch('requests.post',
+                                 return_value=response) as post:
+            runs: List[omegaup.api._Run] = list(
+                client.contest.stream_runs(contest_alias='contest',
+                                           problem_alias='sumas'))
+        self.assertTrue(post.call_args.kwargs['stream'])
+        self.assertEqual(runs, [omegaup.api._Run(**run)] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
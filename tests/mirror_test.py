@@ -0,0 +1,224 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.mirror."""
+
+import datetime
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+import omegaup.api
+import omegaup.mirror
+
+
+def _contest(alias: str, start: int, last_updated: int,
+             **kwargs: Any) -> Dict[str, Any]:
+    return {
+        'acl_id': 1,
+        'admission_mode': 'public',
+        'alias': alias,
+        'contest_id': 1,
+        'contestants': 0,
+        'description': '',
+        'finish_time': start + 3600,
+        'last_updated': last_updated,
+        'organizer': 'omegaup',
+        'original_finish_time': start + 3600,
+        'participating': False,
+        'problemset_id': 1,
+        'recommended': False,
+        'score_mode': 'partial',
+        'scoreboard_url': '',
+        'scoreboard_url_admin': '',
+        'start_time': start,
+        'title': alias.title(),
+        **kwargs,
+    }
+
+
+def _details(alias: str) -> Dict[str, Any]:
+    return {
+        'admission_mode': 'public',
+        'alias': alias,
+        'default_show_all_contestants_in_scoreboard': False,
+        'description': '',
+        'director': 'omegaup',
+        'feedback': 'none',
+        'finish_time': 1600003600,
+        'languages': 'cpp17-gcc',
+        'penalty': 0,
+        'penalty_calc_policy': 'sum',
+        'penalty_type': 'none',
+        'points_decay_factor': 0.0,
+        'problemset_id': 1,
+        'score_mode': 'partial',
+        'scoreboard': 100,
+        'show_penalty': True,
+        'show_scoreboard_after': True,
+        'start_time': 1600000000,
+        'submissions_gap': 60,
+        'title': alias.title(),
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves a few contests."""
+    def __init__(self) -> None:
+        super().__init__(api_token='token', timestamps='epoch')
+        self.contests: Dict[str, List[Dict[str, Any]]] = {
+            'current': [
+                _contest('current', 1600000000, 1, recommended=True),
+            ],
+            'past': [
+                _contest('past', 1500000000, 1, admission_mode='private'),
+                _contest('old', 1400000000, 1),
+            ],
+        }
+        self.archived = [_contest('archived', 1300000000, 1)]
+        # The contests that are not in `Contest.adminList`.
+        self.admin_hidden: Set[str] = set()
+        self.endpoints: List[str] = []
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert payload is not None
+        self.endpoints.append(endpoint)
+        if endpoint == '/api/contest/list/':
+            assert payload['page'] == '1'
+            return {
+                'number_of_results': 1,
+                'results': self.contests.get(payload['tab_name'], []),
+            }
+        if endpoint == '/api/contest/adminList/':
+            assert payload['page'] == '1'
+            contests = self.contests['current'] + self.contests['past']
+            if payload.get('show_archived') == 'True':
+                contests = contests + self.archived
+            return {
+                'contests': [
+                    contest for contest in contests
+                    if contest['alias'] not in self.admin_hidden
+                ]
+            }
+        assert endpoint == '/api/contest/publicDetails/'
+        return _details(payload['contest_alias'])
+
+
+class TestMirror(unittest.TestCase):
+    """Test omegaup.mirror."""
+    def test_refresh(self) -> None:
+        """Only contests that were updated are rewritten."""
+        client = _FakeClient()
+        with omegaup.mirror.ContestMirror(client) as mirror:
+            self.assertEqual(mirror.refresh(), 3)
+            self.assertEqual(mirror.refresh(), 0)
+            client.contests['past'][1] = _contest('old', 1400000000, 2)
+            self.assertEqual(mirror.refresh(), 1)
+            self.assertEqual(mirror.refresh_admin(), 1)
+
+            self.assertEqual([c.alias for c in mirror.query()],
+                             ['current', 'past', 'old', 'archived'])
+            self.assertEqual([c.alias for c in mirror.query(archived=True)],
+                             ['archived'])
+            self.assertEqual(
+                [c.alias for c in mirror.query(archived=False, limit=2)],
+                ['current', 'past'])
+            self.assertEqual([c.alias for c in mirror.query(recommended=True)],
+                             ['current'])
+            self.assertEqual(
+                [c.alias for c in mirror.query(admission_mode='private')],
+                ['past'])
+            self.assertEqual([
+                c.alias for c in mirror.query(
+                    active_at=datetime.datetime.fromtimestamp(1500000001))
+            ], ['past'])
+            self.assertEqual([
+                c.alias for c in mirror.query(
+                    starts_after=datetime.datetime.fromtimestamp(1400000000),
+                    starts_before=datetime.datetime.fromtimestamp(1600000000))
+            ], ['past', 'old'])
+
+            contest = mirror.get('old')
+            assert contest is not None
+            self.assertEqual(contest.last_updated, 2)
+            self.assertIsNone(mirror.get('missing'))
+
+    def test_removed(self) -> None:
+        """Contests that are no longer listed are removed by full walks."""
+        client = _FakeClient()
+        with omegaup.mirror.ContestMirror(client) as mirror:
+            mirror.refresh()
+            mirror.refresh_admin()
+            del client.contests['past'][1]
+            self.assertEqual(mirror.refresh(['past']), 0)
+            self.assertIsNotNone(mirror.get('old'))
+            self.assertEqual(mirror.refresh(query='old'), 0)
+            self.assertIsNotNone(mirror.get('old'))
+            # Contests seen by the admin walk are only removed by it.
+            self.assertEqual(mirror.refresh(), 0)
+            self.assertIsNotNone(mirror.get('old'))
+            self.assertEqual(mirror.refresh_admin(), 1)
+            self.assertIsNone(mirror.get('old'))
+
+            client.contests['future'] = [_contest('future', 1700000000, 1)]
+            self.assertEqual(mirror.refresh(), 1)
+            client.contests['future'] = []
+            self.assertEqual(mirror.refresh(), 1)
+            self.assertIsNone(mirror.get('future'))
+            self.assertEqual([c.alias for c in mirror.query()],
+                             ['current', 'past', 'archived'])
+
+    def test_listed_by_both(self) -> None:
+        """Contests are only removed when neither list has them."""
+        client = _FakeClient()
+        with omegaup.mirror.ContestMirror(client) as mirror:
+            mirror.refresh()
+            mirror.refresh_admin()
+            client.admin_hidden.add('current')
+            for _ in range(2):
+                self.assertEqual(mirror.refresh_admin(), 0)
+                self.assertEqual(mirror.refresh(), 0)
+                contest = mirror.get('current')
+                assert contest is not None
+                self.assertIsNone(contest.archived)
+
+            client.contests['current'] = []
+            self.assertEqual(mirror.refresh(), 1)
+            self.assertIsNone(mirror.get('current'))
+
+    def test_prune_arguments(self) -> None:
+        """Only the filters that narrow down the list disable pruning."""
+        client = _FakeClient()
+        with omegaup.mirror.ContestMirror(client) as mirror:
+            mirror.refresh()
+            del client.contests['past'][1]
+            self.assertEqual(mirror.refresh(recommended=1), 0)
+            self.assertIsNotNone(mirror.get('old'))
+            self.assertEqual(mirror.refresh(prefetch_=False, page_size_=10),
+                             1)
+            self.assertIsNone(mirror.get('old'))
+
+    def test_details(self) -> None:
+        """Details are cached until the contest is updated."""
+        client = _FakeClient()
+        with omegaup.mirror.ContestMirror(client) as mirror:
+            mirror.refresh()
+            client.endpoints.clear()
+            self.assertEqual(mirror.details('past').alias, 'past')
+            self.assertEqual(mirror.details('past'), mirror.details('past'))
+            self.assertEqual(client.endpoints, ['/api/contest/publicDetails/'])
+
+            client.contests['past'][0] = _contest('past', 1500000000, 2)
+            mirror.refresh()
+            client.endpoints.clear()
+            mirror.details('past')
+            self.assertEqual(client.endpoints, ['/api/contest/publicDetails/'])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
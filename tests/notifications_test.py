@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.notifications."""
+
+import datetime
+import threading
+import time
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import omegaup.api
+import omegaup.notifications
+
+
+def _notification(notification_id: int) -> Dict[str, Any]:
+    return {
+        'contents': {
+            'type': 'general_notification',
+            'message': f'Message {notification_id}',
+        },
+        'notification_id': notification_id,
+        'timestamp': 1600000000 + notification_id,
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves the unread notifications of one identity."""
+    def __init__(self, username: str, notifications: List[int]) -> None:
+        super().__init__(username=username, api_token='token')
+        self.unread = notifications
+        self.acknowledged: List[List[int]] = []
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert payload is not None
+        if endpoint == '/api/notification/myList/':
+            return {
+                'notifications': [_notification(n) for n in self.unread],
+            }
+        assert endpoint == '/api/notification/readNotifications/'
+        batch = [int(n) for n in payload['notifications'].split(',')]
+        self.acknowledged.append(batch)
+        self.unread = [n for n in self.unread if n not in batch]
+        return {'status': 'ok'}
+
+
+class TestNotifications(unittest.TestCase):
+    """Test omegaup.notifications."""
+    def test_poll_all(self) -> None:
+        """Notifications are handled once and acknowledged in batches."""
+        clients = [
+            _FakeClient('bot1', [1, 2, 3, 4, 5]),
+            _FakeClient('bot2', []),
+        ]
+        handled: List[Any] = []
+        failing = {3}
+
+        def _handle(client: omegaup.api.Client,
+                    notification: omegaup.api._Notification) -> None:
+            if notification.notification_id in failing:
+                raise Exception('Temporary failure')
+            handled.append((client.username, notification.notification_id))
+
+        poller = omegaup.notifications.NotificationPoller(
+            _handle,
+            min_interval=datetime.timedelta(seconds=1),
+            max_interval=datetime.timedelta(seconds=4),
+            ack_batch_size=2)
+        for client in clients:
+            poller.add(client)
+        self.assertEqual(len(poller), 2)
+
+        self.assertEqual(poller.poll_all(), 4)
+        self.assertEqual(handled, [('bot1', 1), ('bot1', 2), ('bot1', 4),
+                                   ('bot1', 5)])
+        self.assertEqual(clients[0].acknowledged, [[1, 2], [4, 5]])
+        self.assertEqual(clients[0].unread, [3])
+        self.assertEqual(clients[1].acknowledged, [])
+
+        # The notification that failed is retried.
+        failing.clear()
+        handled.clear()
+        self.assertEqual(poller.poll_all(), 1)
+        self.assertEqual(handled, [('bot1', 3)])
+        self.assertEqual(clients[0].unread, [])
+
+        # Idle identities back off.
+        self.assertEqual(poller.poll_all(), 0)
+        self.assertEqual(poller.poll_all(), 0)
+        self.assertEqual(poller.poll_all(), 0)
+        intervals = sorted(i.interval for i in poller._identities)
+        self.assertEqual(intervals, [4, 4])
+
+    def test_concurrent_polls(self) -> None:
+        """Overlapping polls of an identity handle notifications once."""
+        handled: List[int] = []
+
+        def _handle(client: omegaup.api.Client,
+                    notification: omegaup.api._Notification) -> None:
+            time.sleep(0.01)
+            handled.append(notification.notification_id)
+
+        poller = omegaup.notifications.NotificationPoller(_handle)
+        poller.add(_FakeClient('bot', [1, 2, 3]))
+        threads = [threading.Thread(target=poller.poll_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(handled), [1, 2, 3])
+
+    def test_background(self) -> None:
+        """The background thread polls every identity."""
+        clients = [_FakeClient(f'bot{i}', [i]) for i in range(10)]
+        handled = threading.Semaphore(0)
+        poller = omegaup.notifications.NotificationPoller(
+            lambda client, notification: handled.release(), max_workers=4)
+        for client in clients:
+            poller.add(client)
+        with poller:
+            for _ in clients:
+                self.assertTrue(handled.acquire(timeout=10))
+        for client in clients:
+            self.assertEqual(client.unread, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
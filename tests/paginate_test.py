@@ -0,0 +1,138 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup._paginate."""
+
+import itertools
+import threading
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import omegaup.api
+
+
+def _run(index: int) -> Dict[str, Any]:
+    return {
+        'alias': 'sumas',
+        'classname': 'user-rank-unranked',
+        'country': 'MX',
+        'guid': f'{index:032x}',
+        'language': 'cpp17-gcc',
+        'memory': 1024,
+        'penalty': 0,
+        'runtime': 10,
+        'score': 1.0,
+        'status': 'ready',
+        'submit_delay': 0,
+        'time': 1600000000 + index,
+        'username': f'user{index}',
+        'verdict': 'AC',
+    }
+
+
+def _submission(index: int) -> Dict[str, Any]:
+    return {
+        'alias': 'sumas',
+        'classname': 'user-rank-unranked',
+        'guid': f'{index:032x}',
+        'language': 'cpp17-gcc',
+        'memory': 1024,
+        'runtime': 10,
+        'school_id': None,
+        'school_name': None,
+        'time': 1600000000 + index,
+        'title': 'Sumas',
+        'username': f'user{index}',
+        'verdict': 'AC',
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves a fixed number of runs and submissions."""
+    def __init__(self, total: int) -> None:
+        super().__init__(api_token='token')
+        self.total = total
+        self.calls: List[Mapping[str, str]] = []
+        self._lock = threading.Lock()
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert payload is not None
+        with self._lock:
+            self.calls.append(payload)
+        if endpoint == '/api/contest/runs/':
+            rowcount = int(payload['rowcount'])
+            start = int(payload['offset']) * rowcount
+            end = min(start + rowcount, self.total)
+            return {
+                'runs': [_run(i) for i in range(start, end)],
+                'totalRuns': self.total,
+            }
+        if endpoint == '/api/qualityNomination/list/':
+            return {'nominations': [], 'pager_items': []}
+        assert endpoint == '/api/submission/list/'
+        page_size = int(payload['pageSize'])
+        start = (int(payload['page']) - 1) * page_size
+        end = min(start + page_size, self.total)
+        return {
+            'submissions': [_submission(i) for i in range(start, end)],
+        }
+
+
+class TestPaginate(unittest.TestCase):
+    """Test omegaup._paginate."""
+    def test_iter_runs(self) -> None:
+        """All the pages are requested, and no more."""
+        for total, offsets in ((0, ['0']), (20, ['0', '1']),
+                               (25, ['0', '1', '2'])):
+            for prefetch in (False, True):
+                with self.subTest(total=total, prefetch=prefetch):
+                    client = _FakeClient(total)
+                    runs = list(
+                        client.contest.iter_runs(contest_alias='contest',
+                                                 problem_alias='sumas',
+                                                 page_size_=10,
+                                                 prefetch_=prefetch))
+                    self.assertEqual([run.username for run in runs],
+                                     [f'user{i}' for i in range(total)])
+                    self.assertEqual(
+                        [call['offset'] for call in client.calls], offsets)
+
+    def test_iter_page(self) -> None:
+        """Endpoints with 1-based pages and no total stop at a short page."""
+        client = _FakeClient(25)
+        submissions = list(client.submission.iter_list(page_size_=10))
+        self.assertEqual(len(submissions), 25)
+        self.assertEqual([call['page'] for call in client.calls],
+                         ['1', '2', '3'])
+
+    def test_iter_nominations(self) -> None:
+        """The `offset` of quality nominations is a 1-based page number."""
+        client = _FakeClient(0)
+        self.assertEqual(list(client.qualityNomination.iter_list()), [])
+        self.assertEqual([call['offset'] for call in client.calls], ['1'])
+
+    def test_early_stop(self) -> None:
+        """At most one page is prefetched past the one being consumed."""
+        client = _FakeClient(1000)
+        runs = client.contest.iter_runs(contest_alias='contest',
+                                        problem_alias='sumas',
+                                        page_size_=10)
+        self.assertEqual(len(list(itertools.islice(runs, 5))), 5)
+        del runs
+        self.assertLessEqual(len(client.calls), 2)
+
+    def test_invalid_page_size(self) -> None:
+        """Non-positive page sizes are rejected."""
+        client = _FakeClient(10)
+        with self.assertRaises(ValueError):
+            next(client.submission.iter_list(page_size_=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
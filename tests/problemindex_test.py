@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.problemindex."""
+
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import omegaup.api
+import omegaup.problemindex
+
+
+def _problem(alias: str,
+             title: str,
+             tags: Sequence[str] = (),
+             difficulty: Optional[float] = None,
+             quality_seal: bool = False) -> Dict[str, Any]:
+    return {
+        'accepted': 1,
+        'alias': alias,
+        'difficulty': difficulty,
+        'difficulty_histogram': [],
+        'points': 1.0,
+        'problem_id': 1,
+        'quality': None,
+        'quality_histogram': [],
+        'quality_seal': quality_seal,
+        'ratio': 1.0,
+        'score': 0.0,
+        'submissions': 1,
+        'tags': [{
+            'name': tag,
+            'source': 'owner'
+        } for tag in tags],
+        'title': title,
+        'visibility': 2,
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves a fixed problem catalog."""
+    def __init__(self, problems: List[Dict[str, Any]]) -> None:
+        super().__init__(api_token='token')
+        self.problems = problems
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert endpoint == '/api/problem/list/'
+        assert payload is not None
+        rowcount = int(payload['rowcount'])
+        start = (int(payload['page']) - 1) * rowcount
+        return {
+            'results': self.problems[start:start + rowcount],
+            'total': len(self.problems),
+        }
+
+
+class TestProblemIndex(unittest.TestCase):
+    """Test omegaup.problemindex."""
+    def setUp(self) -> None:
+        self.client = _FakeClient([
+            _problem('sumas', 'Sumas', ['problemTopicMath'], 1.0, True),
+            _problem('arboles-binarios', 'Árboles binarios',
+                     ['problemTopicTrees', 'problemTopicMath'], 3.5),
+            _problem('suma-de-arboles', 'Suma de árboles',
+                     ['problemTopicTrees'], 2.0, True),
+            _problem('cadenas', 'Cadenas'),
+        ])
+        self.index = omegaup.problemindex.ProblemIndex()
+        self.assertEqual(self.index.refresh(self.client), 4)
+
+    def _search(self, *args: Any, **kwargs: Any) -> List[str]:
+        return [p.alias for p in self.index.search(*args, **kwargs)]
+
+    def test_search(self) -> None:
+        """Queries match words, prefixes and filters."""
+        self.assertEqual(self._search('sum'), ['sumas', 'suma-de-arboles'])
+        self.assertEqual(self._search('ARBOL'),
+                         ['arboles-binarios', 'suma-de-arboles'])
+        self.assertEqual(self._search('suma árb'), ['suma-de-arboles'])
+        self.assertEqual(self._search('arboles-bin'), ['arboles-binarios'])
+        self.assertEqual(self._search('xyz'), [])
+        self.assertEqual(
+            self._search(tags=['problemTopicMath', 'problemTopicTrees']),
+            ['arboles-binarios'])
+        self.assertEqual(
+            self._search(some_tags=['problemTopicMath', 'problemTopicTrees']),
+            ['sumas', 'arboles-binarios', 'suma-de-arboles'])
+        self.assertEqual(self._search(quality_seal=False),
+                         ['arboles-binarios', 'cadenas'])
+        self.assertEqual(self._search(min_difficulty=1.5, max_difficulty=3),
+                         ['suma-de-arboles'])
+        self.assertEqual(self._search(limit=2), ['sumas', 'arboles-binarios'])
+        self.assertEqual([p.alias for p in self.index.typeahead('ca')],
+                         ['cadenas'])
+
+    def test_refresh(self) -> None:
+        """Only changed problems are reindexed."""
+        self.client.problems[0] = _problem('sumas', 'Restas')
+        del self.client.problems[3]
+        self.assertEqual(self.index.refresh(self.client), 2)
+        self.assertEqual(self._search('restas'), ['sumas'])
+        self.assertEqual(self._search(tags=['problemTopicMath']),
+                         ['arboles-binarios'])
+        self.assertNotIn('cadenas', self.index)
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.refresh(self.client), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.runsync."""
+
+import os.path
+import tempfile
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import omegaup.api
+import omegaup.runsync
+
+
+def _run(index: int, status: str = 'ready') -> Dict[str, Any]:
+    return {
+        'alias': 'sumas',
+        'classname': 'user-rank-unranked',
+        'country': 'MX',
+        'guid': f'{index:032x}',
+        'language': 'cpp17-gcc',
+        'memory': 1024,
+        'penalty': 0,
+        'runtime': 10,
+        'score': 1.0,
+        'status': status,
+        'submit_delay': 0,
+        'time': 1600000000 + index * 60,
+        'username': f'user{index}',
+        'verdict': 'AC' if status == 'ready' else 'JE',
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves the runs of a contest, newest first."""
+    def __init__(self, runs: List[Dict[str, Any]]) -> None:
+        super().__init__(api_token='token')
+        self.runs = runs
+        self.offsets: List[int] = []
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert endpoint == '/api/contest/runs/'
+        assert payload is not None
+        offset = int(payload['offset'])
+        rowcount = int(payload['rowcount'])
+        self.offsets.append(offset)
+        runs = sorted(self.runs, key=lambda run: -int(run['time']))
+        return {
+            'runs': runs[offset * rowcount:(offset + 1) * rowcount],
+            'totalRuns': len(runs),
+        }
+
+
+class TestRunSync(unittest.TestCase):
+    """Test omegaup.runsync."""
+    def test_poll(self) -> None:
+        """Only new and changed runs are reported."""
+        runs = [_run(i) for i in range(30)]
+        runs.append(_run(30, status='running'))
+        client = _FakeClient(runs)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'runs.sqlite3')
+            with omegaup.runsync.RunSync(client, path, page_size=10) as sync:
+                changes = sync.poll_contest('contest', 'sumas')
+                self.assertEqual(len(changes), 31)
+                self.assertTrue(all(change.is_new for change in changes))
+                self.assertEqual(client.offsets, [0, 1, 2, 3])
+
+            client.offsets.clear()
+            client.runs[30] = _run(30)
+            client.runs.append(_run(31))
+            with omegaup.runsync.RunSync(client, path, page_size=10) as sync:
+                changes = sync.poll_contest('contest', 'sumas')
+                self.assertEqual(
+                    [(change.run.username, change.run.verdict, change.is_new)
+                     for change in changes],
+                    [('user31', 'AC', True), ('user30', 'AC', False)])
+                self.assertEqual(client.offsets, [0])
+                stored = sync.runs(
+                    omegaup.runsync._scope('contest', 'contest', 'sumas'))
+                self.assertEqual(len(stored), 32)
+                self.assertEqual(stored[1], changes[1].run)
+
+                client.offsets.clear()
+                self.assertEqual(sync.poll_contest('contest', 'sumas'), [])
+                self.assertEqual(client.offsets, [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.diff."""
+
+import random
+import unittest
+
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+import omegaup.api
+from omegaup import _decoder
+from omegaup.scoreboard import diff
+
+_PROBLEMS = ('a', 'b', 'c')
+
+
+def _default_order(entry: Dict[str, Any]) -> Tuple[float, float, str]:
+    return (-entry['total']['points'], entry['total']['penalty'],
+            entry['username'])
+
+
+def _scoreboard(
+        users: Dict[str, List[float]],
+        time: int,
+        key: Any = None,
+        problems: Sequence[str] = _PROBLEMS) -> omegaup.api._Scoreboard:
+    """Returns a scoreboard with the given points per problem."""
+    ranking: List[Dict[str, Any]] = []
+    for username, points in users.items():
+        ranking.append({
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'is_invited': True,
+            'name': username.title(),
+            'problems': [{
+                'alias': alias,
+                'penalty': 1 if point else 0,
+                'percent': point,
+                'points': point,
+                'runs': 1 if point else 0,
+            } for alias, point in zip(problems, points)],
+            'total': {
+                'penalty': sum(1 for point in points if point),
+                'points': sum(points),
+            },
+            'username': username,
+        })
+    ranking.sort(key=key or _default_order)
+    previous: Tuple[float, float] = (-1, -1)
+    for position, entry in enumerate(ranking):
+        total = (entry['total']['points'], entry['total']['penalty'])
+        if total != previous:
+            place = position + 1
+        previous = total
+        entry['place'] = place
+    return _decoder.decode(
+        omegaup.api._Scoreboard, {
+            'problems': [{
+                'alias': alias,
+                'order': order
+            } for order, alias in enumerate(problems, 1)],
+            'ranking': ranking,
+            'start_time': 1600000000,
+            'time': time,
+            'title': 'Contest',
+        })
+
+
+class TestDiff(unittest.TestCase):
+    """Test omegaup.scoreboard.diff."""
+    def test_single_move(self) -> None:
+        """A contestant that climbs to the top is a single move."""
+        users = {f'user{i:03}': [100.0 - i, 0.0, 0.0] for i in range(100)}
+        old = _scoreboard(users, 1600000600)
+        users['user099'] = [1.0, 100.0, 0.0]
+        new = _scoreboard(users, 1600000660)
+        delta = diff.diff(old, new)
+        self.assertEqual([(row.username, row.index) for row in delta.rows],
+                         [('user099', 0)])
+        self.assertEqual([cell.column for cell in delta.rows[0].cells], [1])
+        self.assertIsNone(delta.rows[0].meta)
+        self.assertEqual(delta.places, [(0, 1, -99), (1, 99, 1)])
+        self.assertLess(len(diff.encode(delta)), 200)
+        self.assertEqual(diff.apply(old, delta), new)
+
+        self.assertFalse(diff.diff(new, new))
+
+    def test_random(self) -> None:
+        """Applying the delta reproduces the new snapshot."""
+        rng = random.Random(0)
+        for iteration in range(50):
+            users = {
+                f'user{i:03}':
+                [rng.choice([0.0, 50.0, 100.0]) for _ in _PROBLEMS]
+                for i in range(rng.randrange(1, 60))
+            }
+            old = _scoreboard(users, 1600000600)
+            changed: Set[str] = set()
+            for username in list(users):
+                action = rng.random()
+                if action < 0.1:
+                    del users[username]
+                    changed.add(username)
+                elif action < 0.3:
+                    users[username][rng.randrange(len(_PROBLEMS))] = 100.0
+                    changed.add(username)
+            for i in range(rng.randrange(5)):
+                username = f'new{iteration}-{i}'
+                users[username] = [rng.choice([0.0, 100.0]) for _ in _PROBLEMS]
+                changed.add(username)
+            new = _scoreboard(users, 1600000660)
+            with self.subTest(iteration=iteration):
+                delta = diff.decode(diff.encode(diff.diff(old, new)))
+                self.assertEqual(diff.apply(old, delta), new)
+                indexed = diff.diff(diff.IndexedScoreboard(old),
+                                    diff.IndexedScoreboard(new),
+                                    changed=changed)
+                self.assertEqual(diff.apply(old, indexed), new)
+
+    def test_changed_drops(self) -> None:
+        """The fast path updates the places of rows that move up."""
+        users = {
+            'a': [100.0, 100.0, 0.0],
+            'b': [100.0, 0.0, 0.0],
+            'c': [50.0, 0.0, 0.0],
+        }
+        old = _scoreboard(users, 1600000600)
+        users['a'] = [0.0, 0.0, 0.0]
+        new = _scoreboard(users, 1600000660)
+        result = diff.apply(old, diff.diff(old, new, changed={'a'}))
+        self.assertEqual([(e.username, e.place) for e in result.ranking],
+                         [('b', 1), ('c', 2), ('a', 3)])
+        self.assertEqual(result, new)
+
+        rng = random.Random(1)
+        for iteration in range(50):
+            users = {
+                f'user{i:03}':
+                [rng.choice([0.0, 50.0, 100.0]) for _ in _PROBLEMS]
+                for i in range(rng.randrange(1, 60))
+            }
+            old = _scoreboard(users, 1600000600)
+            changed: Set[str] = set()
+            for username in list(users):
+                if rng.random() < 0.2:
+                    users[username] = [
+                        rng.choice([0.0, 50.0, 100.0]) for _ in _PROBLEMS
+                    ]
+                    changed.add(username)
+            new = _scoreboard(users, 1600000660)
+            with self.subTest(iteration=iteration):
+                full = diff.apply(old, diff.diff(old, new))
+                fast = diff.apply(old, diff.diff(old, new, changed=changed))
+                self.assertEqual(fast, full)
+                self.assertEqual(fast, new)
+
+    def test_changed_problems(self) -> None:
+        """A change to the problems sends every row, even on the fast path."""
+        users = {
+            'a': [100.0, 100.0, 0.0],
+            'b': [100.0, 0.0, 0.0],
+            'c': [50.0, 0.0, 0.0],
+        }
+        old = _scoreboard(users, 1600000600)
+        users['a'] = [0.0, 100.0]
+        users['b'] = [100.0, 0.0]
+        users['c'] = [50.0, 0.0]
+        new = _scoreboard(users, 1600000660, problems=('a', 'b'))
+        delta = diff.diff(old, new, changed={'a'})
+        self.assertEqual([row.username for row in delta.rows],
+                         ['a', 'b', 'c'])
+        self.assertEqual(diff.apply(old, diff.decode(diff.encode(delta))),
+                         new)
+
+    def test_reordered_ties(self) -> None:
+        """Ties that are broken differently are moved."""
+        users = {f'user{i}': [100.0, 0.0, 0.0] for i in range(10)}
+        old = _scoreboard(users, 1600000600)
+        new = _scoreboard(users,
+                          1600000660,
+                          key=lambda e: e['username'] == 'user3')
+        delta = diff.diff(old, new)
+        self.assertEqual([(row.username, row.index) for row in delta.rows],
+                         [('user3', 9)])
+        self.assertEqual(diff.apply(old, delta), new)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,208 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.engine."""
+
+import bisect
+import random
+import unittest
+
+from typing import Any, Dict, List
+
+import omegaup.api
+from omegaup import _decoder
+from omegaup.scoreboard import _skiplist, engine
+
+
+def _entry(username: str, points: List[float],
+           penalties: List[float]) -> Dict[str, Any]:
+    return {
+        'classname': 'user-rank-unranked',
+        'country': 'MX',
+        'is_invited': True,
+        'name': None,
+        'problems': [{
+            'alias': alias,
+            'penalty': penalty,
+            'percent': point,
+            'points': point,
+            'runs': 1 if point else 0,
+        } for alias, point, penalty in zip(('a', 'b'), points, penalties)],
+        'total': {
+            'penalty': sum(penalties),
+            'points': sum(points),
+        },
+        'username': username,
+    }
+
+
+def _scoreboard(ranking: List[Dict[str, Any]]) -> omegaup.api._Scoreboard:
+    return _decoder.decode(
+        omegaup.api._Scoreboard, {
+            'finish_time': 1600018000,
+            'problems': [
+                {'alias': 'a', 'order': 1},
+                {'alias': 'b', 'order': 2},
+            ],
+            'ranking': ranking,
+            'start_time': 1600000000,
+            'time': 1600000600,
+            'title': 'Contest',
+        },
+        timestamps='epoch')
+
+
+def _event(username: str, delta: float, alias: str, points: float,
+           penalty: float, total_points: float,
+           total_penalty: float) -> omegaup.api._ScoreboardEvent:
+    return _decoder.decode(
+        omegaup.api._ScoreboardEvent, {
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'delta': delta,
+            'is_invited': True,
+            'problem': {
+                'alias': alias,
+                'penalty': penalty,
+                'points': points,
+            },
+            'total': {
+                'penalty': total_penalty,
+                'points': total_points,
+            },
+            'username': username,
+        })
+
+
+class TestSkipList(unittest.TestCase):
+    """Test omegaup.scoreboard._skiplist."""
+    def test_random(self) -> None:
+        """The skip list behaves like a sorted list."""
+        rng = random.Random(1)
+        skiplist = _skiplist.SkipList()
+        expected: List[int] = []
+        for _ in range(2000):
+            key = rng.randrange(500)
+            index = bisect.bisect_left(expected, key)
+            if index < len(expected) and expected[index] == key:
+                skiplist.remove(key)
+                del expected[index]
+            else:
+                skiplist.add(key)
+                expected.insert(index, key)
+            self.assertEqual(skiplist.rank(key), index)
+        self.assertEqual(list(skiplist), expected)
+        self.assertEqual(len(skiplist), len(expected))
+        for index in range(0, len(expected), 7):
+            self.assertEqual(skiplist[index], expected[index])
+            self.assertEqual(list(skiplist.iterate(index)), expected[index:])
+        with self.assertRaises(KeyError):
+            skiplist.remove(-1)
+        with self.assertRaises(IndexError):
+            skiplist[len(expected)]  # pylint: disable=pointless-statement
+
+
+class TestEngine(unittest.TestCase):
+    """Test omegaup.scoreboard.engine."""
+    def test_update(self) -> None:
+        """Events move contestants within the ranking."""
+        board = engine.ScoreboardEngine(
+            _scoreboard([
+                _entry('alice', [100, 0], [5, 0]),
+                _entry('bob', [100, 0], [5, 0]),
+                _entry('carol', [0, 0], [0, 0]),
+            ]))
+        self.assertEqual(board.place('alice'), 1)
+        self.assertEqual(board.place('bob'), 1)
+        self.assertEqual(board.place('carol'), 3)
+
+        events = [
+            # Older than the snapshot, and already reflected in it.
+            _event('alice', 5, 'a', 100, 5, 100, 5),
+            _event('carol', 12, 'b', 50, 12, 50, 12),
+            _event('dave', 13, 'a', 100, 13, 100, 13),
+        ]
+        self.assertEqual(board.update(events), {'carol', 'dave'})
+        self.assertEqual(board.update(events), set())
+        events.append(_event('carol', 15, 'a', 100, 15, 150, 27))
+        self.assertEqual(board.update(events), {'carol'})
+
+        self.assertEqual(
+            [(e.username, e.place) for e in board.ranking()],
+            [('carol', 1), ('alice', 2), ('bob', 2), ('dave', 4)])
+        self.assertEqual(
+            [(e.username, e.place) for e in board.ranking(2, 3)],
+            [('bob', 2)])
+
+        snapshot = board.snapshot()
+        self.assertEqual(snapshot.time, 1600000000 + 15 * 60)
+        carol = snapshot.ranking[0]
+        self.assertEqual(carol.total.points, 150)
+        self.assertEqual([p.points for p in carol.problems], [100, 50])
+        self.assertEqual([p.runs for p in carol.problems], [1, 1])
+        self.assertEqual(carol.problems[0].percent, 100)
+        dave = board.entry('dave')
+        assert dave is not None
+        self.assertEqual(dave.place, 4)
+        self.assertIsNone(board.entry('eve'))
+
+        # Submissions that do not improve the score still count as runs.
+        events.append(_event('carol', 16, 'a', 100, 15, 150, 27))
+        self.assertEqual(board.update(events), {'carol'})
+        board.apply(events[-1])
+        carol = board.snapshot().ranking[0]
+        self.assertEqual([p.runs for p in carol.problems], [2, 1])
+
+    def test_late_events(self) -> None:
+        """Events that are inserted in the middle of the list are applied."""
+        board = engine.ScoreboardEngine(
+            _scoreboard([
+                _entry('alice', [100, 0], [5, 0]),
+                _entry('bob', [0, 0], [0, 0]),
+            ]))
+        events = [
+            _event('alice', 5, 'a', 100, 5, 100, 5),
+            _event('alice', 12, 'b', 0, 0, 100, 5),
+        ]
+        self.assertEqual(board.update(events), {'alice'})
+        # A run that was submitted earlier is judged late, and is sorted
+        # before the ones that were already seen.
+        events.insert(1, _event('bob', 11, 'a', 100, 11, 100, 11))
+        events.append(_event('bob', 13, 'b', 0, 0, 100, 11))
+        self.assertEqual(board.update(events), {'bob'})
+        self.assertEqual(board.update(events), set())
+        bob = board.entry('bob')
+        assert bob is not None
+        self.assertEqual([p.points for p in bob.problems], [100, 0])
+        self.assertEqual([p.runs for p in bob.problems], [1, 1])
+        alice = board.entry('alice')
+        assert alice is not None
+        self.assertEqual([p.runs for p in alice.problems], [1, 1])
+
+    def test_random(self) -> None:
+        """The ranking matches a full recomputation."""
+        rng = random.Random(2)
+        board = engine.ScoreboardEngine(_scoreboard([]))
+        totals: Dict[str, List[float]] = {}
+        for i in range(1000):
+            username = f'user{rng.randrange(100)}'
+            total = totals.setdefault(username, [0, 0])
+            total[0] += rng.choice([0, 50, 100])
+            total[1] += rng.randrange(10)
+            board.apply(
+                _event(username, 10 + i / 10, 'a', 100, 1, total[0], total[1]))
+        expected = sorted(totals, key=lambda u: (-totals[u][0], totals[u][1],
+                                                 u))
+        ranking = board.ranking()
+        self.assertEqual([e.username for e in ranking], expected)
+        for entry in ranking:
+            key = (-entry.total.points, entry.total.penalty)
+            better = sum(1 for total in totals.values()
+                         if (-total[0], total[1]) < key)
+            self.assertEqual(entry.place, better + 1)
+            self.assertEqual(board.place(entry.username), better + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
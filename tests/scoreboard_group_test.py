@@ -0,0 +1,201 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.group."""
+
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+import omegaup.api
+from omegaup.scoreboard import group
+
+
+def _contest(alias: str, weight: Optional[float]) -> Dict[str, Any]:
+    return {
+        'acl_id': 1,
+        'admission_mode': 'private',
+        'alias': alias,
+        'contest_id': 1,
+        'description': '',
+        'feedback': 'none',
+        'finish_time': 1600018000,
+        'languages': 'py3',
+        'last_updated': 1600000000,
+        'penalty': '0',
+        'penalty_calc_policy': 'sum',
+        'points_decay_factor': 0.0,
+        'problemset_id': 1,
+        'recommended': False,
+        'rerun_id': 0,
+        'score_mode': 'partial',
+        'scoreboard': 100,
+        'show_scoreboard_after': True,
+        'start_time': 1600000000,
+        'submissions_gap': 60,
+        'title': alias,
+        'urgent': False,
+        'weight': weight,
+    }
+
+
+def _scoreboard(
+        ranking: List[Tuple[str, float, float]]) -> Dict[str, Any]:
+    return {
+        'problems': [{
+            'alias': 'a',
+            'order': 1
+        }],
+        'ranking': [{
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'is_invited': True,
+            'name': username.title(),
+            'problems': [{
+                'alias': 'a',
+                'penalty': penalty,
+                'percent': points,
+                'points': points,
+                'runs': 1,
+            }],
+            'total': {
+                'penalty': penalty,
+                'points': points,
+            },
+            'username': username,
+        } for username, points, penalty in ranking],
+        'start_time': 1600000000,
+        'time': 1600000000,
+        'title': 'Contest',
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves a group scoreboard with two contests."""
+    def __init__(self) -> None:
+        super().__init__(api_token='token', timestamps='epoch')
+        self.events: Dict[str, List[Dict[str, Any]]] = {'a': [], 'b': []}
+        self.endpoints: List[str] = []
+        # The contests whose scoreboards fail to load.
+        self.failing: Set[str] = set()
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert payload is not None
+        self.endpoints.append(endpoint)
+        if endpoint == '/api/groupScoreboard/details/':
+            return {
+                'contests': [_contest('a', None), _contest('b', 2.0)],
+                'ranking': [],
+                'scoreboard': {
+                    'alias': payload['scoreboard_alias'],
+                    'create_time': 1600000000,
+                    'description': '',
+                    'group_id': 1,
+                    'group_scoreboard_id': 1,
+                    'name': 'League',
+                },
+            }
+        if endpoint == '/api/group/members/':
+            return {
+                'identities': [{
+                    'username': username
+                } for username in ('alice', 'bob', 'carol')],
+            }
+        if endpoint == '/api/contest/scoreboard/':
+            if payload['contest_alias'] in self.failing:
+                raise Exception('scoreboard unavailable')
+            if payload['contest_alias'] == 'a':
+                return _scoreboard([('alice', 100, 10), ('bob', 50, 5),
+                                    ('mallory', 300, 0)])
+            return _scoreboard([('carol', 50, 1), ('bob', 25, 5)])
+        assert endpoint == '/api/contest/scoreboardEvents/'
+        return {'events': self.events[payload['contest_alias']]}
+
+
+class TestGroup(unittest.TestCase):
+    """Test omegaup.scoreboard.group."""
+    def test_aggregate(self) -> None:
+        """Contests are weighted and only members are ranked."""
+        client = _FakeClient()
+        league = group.group_scoreboard(client, 'school', 'league')
+        self.assertEqual(league.contest_aliases, ['a', 'b'])
+        self.assertEqual(league.refresh(), {'a', 'b'})
+        self.assertEqual(
+            [(e.username, e.total.points, e.total.penalty)
+             for e in league.ranking()],
+            [('carol', 100, 1), ('alice', 100, 10), ('bob', 100, 10)])
+        self.assertEqual(league.place('carol'), 1)
+        self.assertEqual(league.place('alice'), 2)
+        self.assertEqual(league.place('bob'), 2)
+        self.assertIsNone(league.place('mallory'))
+        bob = league.total('bob')
+        assert bob is not None
+        self.assertEqual((bob.points, bob.penalty), (100, 10))
+        entry = league.entry('carol')
+        assert entry is not None
+        self.assertEqual(entry.contests['a'].points, 0)
+        self.assertEqual(entry.contests['b'].points, 100)
+        response = league.response()
+        self.assertEqual(response.scoreboard.name, 'League')
+        self.assertEqual(len(response.ranking), 3)
+
+        # Nothing changed, so nothing is recomputed.
+        ranking = league.ranking()
+        self.assertEqual(league.refresh(), set())
+        self.assertEqual(league.ranking(), ranking)
+        self.assertIs(league.entry('carol'), entry)
+
+        client.events['b'] = [{
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'delta': 10,
+            'is_invited': True,
+            'problem': {
+                'alias': 'a',
+                'penalty': 10,
+                'points': 100,
+            },
+            'total': {
+                'penalty': 10,
+                'points': 100,
+            },
+            'username': 'bob',
+        }]
+        self.assertEqual(league.refresh(), {'b'})
+        self.assertEqual(league.place('bob'), 1)
+        bob = league.total('bob')
+        assert bob is not None
+        self.assertEqual((bob.points, bob.penalty), (250, 15))
+        self.assertEqual(
+            client.endpoints.count('/api/contest/scoreboard/'), 2)
+        self.assertEqual(
+            client.endpoints.count('/api/groupScoreboard/details/'), 1)
+
+    def test_contest_order(self) -> None:
+        """Ties follow the group order even if a contest loads late."""
+        client = _FakeClient()
+        client.failing.add('a')
+        league = group.group_scoreboard(client, 'school', 'league')
+        with self.assertLogs('omegaup', level='ERROR'):
+            self.assertEqual(league.refresh(), {'b'})
+        entry = league.entry('carol')
+        assert entry is not None
+        self.assertEqual(entry.contests['a'].points, 0)
+
+        client.failing.clear()
+        self.assertEqual(league.refresh(), {'a'})
+        fresh = group.group_scoreboard(client, 'school', 'league')
+        fresh.refresh()
+        self.assertEqual([e.username for e in league.ranking()],
+                         [e.username for e in fresh.ranking()])
+        self.assertEqual([e.username for e in league.ranking()],
+                         ['carol', 'alice', 'bob'])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
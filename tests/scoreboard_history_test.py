@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.history."""
+
+import random
+import unittest
+
+from typing import Any, Dict, List, Optional
+
+import omegaup.api
+from omegaup import _decoder
+from omegaup.scoreboard import engine, history
+
+
+def _scoreboard() -> omegaup.api._Scoreboard:
+    return _decoder.decode(
+        omegaup.api._Scoreboard, {
+            'problems': [
+                {'alias': 'a', 'order': 1},
+                {'alias': 'b', 'order': 2},
+            ],
+            'ranking': [{
+                'classname': 'user-rank-unranked',
+                'country': 'MX',
+                'is_invited': True,
+                'name': 'Alice',
+                'problems': [{
+                    'alias': alias,
+                    'penalty': 10,
+                    'percent': 100,
+                    'points': 100,
+                    'runs': 2,
+                } for alias in ('a', 'b')],
+                'total': {
+                    'penalty': 20,
+                    'points': 200,
+                },
+                'username': 'alice',
+            }],
+            'start_time': 1600000000,
+            'time': 1600018000,
+            'title': 'Contest',
+        },
+        timestamps='epoch')
+
+
+def _event(username: str, delta: float, alias: str, points: float,
+           total_points: float) -> omegaup.api._ScoreboardEvent:
+    return _decoder.decode(
+        omegaup.api._ScoreboardEvent, {
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'delta': delta,
+            'is_invited': True,
+            'problem': {
+                'alias': alias,
+                'penalty': delta,
+                'points': points,
+            },
+            'total': {
+                'penalty': delta,
+                'points': total_points,
+            },
+            'username': username,
+        })
+
+
+def _random_events(rng: random.Random) -> List[omegaup.api._ScoreboardEvent]:
+    events: List[omegaup.api._ScoreboardEvent] = []
+    cells: Dict[str, Dict[str, float]] = {}
+    for delta in range(300):
+        username = f'user{rng.randrange(30)}'
+        alias = rng.choice(('a', 'b'))
+        user_cells = cells.setdefault(username, {})
+        user_cells[alias] = max(user_cells.get(alias, 0),
+                                rng.choice([0, 50, 100]))
+        events.append(
+            _event(username, delta, alias, user_cells[alias],
+                   sum(user_cells.values())))
+    return events
+
+
+def _summary(scoreboard: omegaup.api._Scoreboard) -> List[Any]:
+    return [(entry.username, entry.place, entry.total.points,
+             [(p.alias, p.points, p.runs) for p in entry.problems])
+            for entry in scoreboard.ranking]
+
+
+class TestHistory(unittest.TestCase):
+    """Test omegaup.scoreboard.history."""
+    def test_scoreboard(self) -> None:
+        """Every point in time matches a replay from the start."""
+        rng = random.Random(3)
+        events = _random_events(rng)
+        contest = history.ScoreboardHistory(_scoreboard(),
+                                            list(reversed(events)),
+                                            checkpoint_interval=16)
+        self.assertEqual(len(contest), len(events))
+        deltas = [-1.0, 0.0, 15.5, 16.0, 120.0, 17.0, 299.0, 1000.0]
+        for delta, scoreboard in zip(deltas, contest.scoreboards(deltas)):
+            with self.subTest(delta=delta):
+                board = engine.ScoreboardEngine(
+                    history.ScoreboardHistory(_scoreboard(), []).scoreboard(0))
+                for event in events:
+                    if event.delta <= delta:
+                        board.apply(event)
+                expected = board.snapshot()
+                self.assertEqual(_summary(scoreboard), _summary(expected))
+                self.assertEqual(_summary(contest.scoreboard(delta)),
+                                 _summary(expected))
+                self.assertEqual(scoreboard.time, 1600000000 + delta * 60)
+
+        # Contestants start without points, but keep the maximum points of
+        # the problems.
+        alice = contest.scoreboard(-1).ranking[-1]
+        self.assertEqual(alice.username, 'alice')
+        self.assertEqual(alice.total.points, 0)
+        contest = history.ScoreboardHistory(
+            _scoreboard(), [_event('bob', 1, 'a', 50, 50)])
+        self.assertEqual(contest.scoreboard(1).ranking[0].problems[0].percent,
+                         50)
+
+    def test_contestants(self) -> None:
+        """The events of every contestant are indexed by time."""
+        events = [
+            _event('bob', 10, 'a', 50, 50),
+            _event('carol', 5, 'a', 100, 100),
+            _event('bob', 20, 'b', 100, 150),
+        ]
+        contest = history.ScoreboardHistory(_scoreboard(), events)
+        self.assertEqual([e.delta for e in contest.events('bob')], [10, 20])
+        self.assertEqual(contest.events('dave'), [])
+        self.assertEqual(contest.deltas, [5, 10, 20])
+
+        def _points(username: str, delta: float) -> Optional[float]:
+            event = contest.last_event(username, delta)
+            return event.total.points if event else None
+
+        self.assertIsNone(_points('bob', 9))
+        self.assertEqual(_points('bob', 10), 50)
+        self.assertEqual(_points('bob', 19), 50)
+        self.assertEqual(_points('bob', 25), 150)
+        self.assertIsNone(_points('dave', 25))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
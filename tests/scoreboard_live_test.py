@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.live."""
+
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import omegaup.api
+import omegaup.codec
+from omegaup.scoreboard import live
+
+
+def _scoreboard(title: str) -> Dict[str, Any]:
+    return {
+        'problems': [{
+            'alias': 'a',
+            'order': 1
+        }],
+        'ranking': [{
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'is_invited': True,
+            'problems': [{
+                'alias': 'a',
+                'penalty': 0,
+                'percent': 0,
+                'points': 0,
+                'runs': 0,
+            }],
+            'total': {
+                'penalty': 0,
+                'points': 0,
+            },
+            'username': 'alice',
+        }],
+        'start_time': 1600000000,
+        'time': 1600000000,
+        'title': title,
+    }
+
+
+def _event(username: str, delta: float, points: float) -> Dict[str, Any]:
+    return {
+        'classname': 'user-rank-unranked',
+        'country': 'MX',
+        'delta': delta,
+        'is_invited': True,
+        'problem': {
+            'alias': 'a',
+            'penalty': delta,
+            'points': points,
+        },
+        'total': {
+            'penalty': delta,
+            'points': points,
+        },
+        'username': username,
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves the scoreboards of course assignments."""
+    def __init__(self) -> None:
+        super().__init__(api_token='token', timestamps='epoch')
+        self.events: Dict[str, List[Dict[str, Any]]] = {}
+        self.endpoints: List[str] = []
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert payload is not None
+        self.endpoints.append(endpoint)
+        assignment = payload['assignment']
+        if endpoint == '/api/course/assignmentScoreboard/':
+            return _scoreboard(assignment)
+        if endpoint in ('/api/course/assignmentScoreboardEvents/',
+                        '/api/problemset/scoreboardEvents/'):
+            return {'events': self.events.get(assignment, [])}
+        assert endpoint == '/api/problemset/scoreboard/'
+        return _scoreboard(assignment)
+
+
+class TestLive(unittest.TestCase):
+    """Test omegaup.scoreboard.live."""
+    def test_refresh(self) -> None:
+        """The full scoreboard is only fetched once."""
+        client = _FakeClient()
+        scoreboard = live.LiveScoreboard(
+            live.course_assignment_source(client, 'course', 'hw1'))
+        self.assertEqual(scoreboard.key, 'course/course/hw1')
+        with self.assertRaises(ValueError):
+            scoreboard.snapshot()
+
+        self.assertEqual(scoreboard.refresh(), {'alice'})
+        snapshot = scoreboard.snapshot()
+        self.assertIs(scoreboard.snapshot(), snapshot)
+        self.assertEqual(scoreboard.refresh(), set())
+        self.assertIs(scoreboard.snapshot(), snapshot)
+
+        client.events['hw1'] = [_event('bob', 10, 100)]
+        self.assertEqual(scoreboard.refresh(), {'bob'})
+        self.assertEqual(scoreboard.place('bob'), 1)
+        self.assertEqual(scoreboard.place('alice'), 2)
+        snapshot = scoreboard.snapshot()
+        self.assertEqual([e.username for e in snapshot.ranking],
+                         ['bob', 'alice'])
+        self.assertEqual(
+            omegaup.codec.from_bytes(omegaup.api._Scoreboard,
+                                     scoreboard.to_bytes(),
+                                     timestamps='epoch'), snapshot)
+        self.assertEqual(client.endpoints.count(
+            '/api/course/assignmentScoreboard/'), 1)
+
+        # A shorter list of events means that the scoreboard was reset.
+        client.events['hw1'] = []
+        self.assertEqual(scoreboard.refresh(), {'alice'})
+        self.assertIsNone(scoreboard.place('bob'))
+        self.assertEqual(client.endpoints.count(
+            '/api/course/assignmentScoreboard/'), 2)
+
+    def test_pool(self) -> None:
+        """Many scoreboards are refreshed together."""
+        client = _FakeClient()
+        pool = live.ScoreboardPool(max_workers=4)
+        for i in range(20):
+            pool.add(live.course_assignment_source(client, 'course', f'hw{i}'))
+        pool.add(
+            live.problemset_source(client,
+                                   1,
+                                   course_alias='course',
+                                   assignment_alias='exam'))
+        pool.add(live.course_assignment_source(client, 'course', 'hw0'))
+        self.assertEqual(len(pool), 21)
+        self.assertIn('problemset/1', pool)
+
+        self.assertEqual(len(pool.refresh()), 21)
+        client.events['hw3'] = [_event('bob', 10, 100)]
+        client.events['exam'] = [_event('carol', 20, 50)]
+        self.assertEqual(pool.refresh(), {
+            'course/course/hw3': {'bob'},
+            'problemset/1': {'carol'},
+        })
+        self.assertEqual(pool['problemset/1'].snapshot().title, 'exam')
+        self.assertEqual(
+            client.endpoints.count('/api/course/assignmentScoreboard/'), 20)
+        self.assertTrue(pool.remove('problemset/1'))
+        self.assertFalse(pool.remove('problemset/1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.merge."""
+
+import unittest
+
+from typing import Any, Dict, List, Tuple
+
+import omegaup.api
+from omegaup import _decoder
+from omegaup.scoreboard import merge
+
+
+def _scoreboard(
+        ranking: List[Tuple[str, float, float]]) -> omegaup.api._Scoreboard:
+    return _decoder.decode(
+        omegaup.api._Scoreboard, {
+            'problems': [],
+            'ranking': [{
+                'classname': 'user-rank-unranked',
+                'country': 'MX',
+                'is_invited': True,
+                'name': username.title(),
+                'problems': [],
+                'total': {
+                    'penalty': penalty,
+                    'points': points,
+                },
+                'username': username,
+            } for username, points, penalty in ranking],
+            'start_time': 1600000000,
+            'time': 1600000600,
+            'title': 'Contest',
+        },
+        timestamps='epoch')
+
+
+def _summary(entry: omegaup.api._MergedScoreboardEntry) -> Dict[str, Any]:
+    return {
+        'username': entry.username,
+        'name': entry.name,
+        'total': (entry.total.points, entry.total.penalty),
+        'contests': [(alias, value.points, value.penalty)
+                     for alias, value in entry.contests.items()],
+    }
+
+
+class TestMerge(unittest.TestCase):
+    """Test omegaup.scoreboard.merge."""
+    def test_merge(self) -> None:
+        """Scoreboards are merged like the server does."""
+        merged = merge.ScoreboardMerge(weights={'b': 2.0})
+        self.assertTrue(
+            merged.set('a', _scoreboard([('alice', 100, 10),
+                                         ('bob', 50, 5)])))
+        self.assertTrue(
+            merged.set('b', _scoreboard([('carol', 100, 1),
+                                         ('bob', 25, 5)])))
+        self.assertFalse(
+            merged.set('b', _scoreboard([('carol', 100, 1),
+                                         ('bob', 25, 5)])))
+        self.assertEqual(merged.contest_aliases, ['a', 'b'])
+        self.assertEqual([_summary(e) for e in merged.ranking()], [
+            {
+                'username': 'carol',
+                'name': 'Carol',
+                'total': (200, 1),
+                'contests': [('b', 200, 1), ('a', 0, 0)],
+            },
+            {
+                'username': 'alice',
+                'name': 'Alice',
+                'total': (100, 10),
+                'contests': [('a', 100, 10), ('b', 0, 0)],
+            },
+            {
+                'username': 'bob',
+                'name': 'Bob',
+                'total': (100, 10),
+                'contests': [('a', 50, 5), ('b', 50, 5)],
+            },
+        ])
+        self.assertIsNone(merged.ranking()[0].place)
+
+        # Ties keep the order of first appearance.
+        merged.set('a', _scoreboard([('bob', 50, 5), ('alice', 100, 10)]))
+        self.assertEqual([e.username for e in merged.ranking()],
+                         ['carol', 'bob', 'alice'])
+
+        self.assertTrue(merged.remove('b'))
+        self.assertFalse(merged.remove('b'))
+        self.assertEqual([(e.username, e.total.points)
+                          for e in merged.response().ranking],
+                         [('alice', 100), ('bob', 50)])
+
+    def test_filter(self) -> None:
+        """Only the requested contestants are included."""
+        merged = merge.ScoreboardMerge(usernames_filter=['bob'])
+        merged.set('a', _scoreboard([('alice', 100, 10), ('bob', 50, 5)]))
+        self.assertEqual([e.username for e in merged.ranking()], ['bob'])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
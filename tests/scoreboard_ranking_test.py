@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.ranking."""
+
+import random
+import unittest
+
+import omegaup.api
+from omegaup import _decoder
+
+try:
+    import numpy  # type: ignore
+
+    from omegaup.scoreboard import ranking
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestRanking(unittest.TestCase):
+    """Test omegaup.scoreboard.ranking."""
+    def test_rules(self) -> None:
+        """Every rule changes the cells as expected."""
+        scores = numpy.array([[1.0, 0.5], [1.0, 0.0]])
+        points = numpy.array([100.0, 200.0])
+        times = numpy.array([[600.0, 1230.0], [90.0, 0.0]])
+        wrong = numpy.array([[1, 2], [0, 3]])
+
+        result = ranking.rank(scores,
+                              points=points,
+                              times=times,
+                              wrong=wrong,
+                              rules=ranking.Rules(penalty=20))
+        self.assertEqual(result.points.tolist(), [[100, 100], [100, 0]])
+        self.assertEqual(result.penalties.tolist(), [[30, 60], [1, 0]])
+        self.assertEqual(result.total_points.tolist(), [200, 100])
+        self.assertEqual(result.total_penalties.tolist(), [90, 1])
+        self.assertEqual(result.order.tolist(), [0, 1])
+        self.assertEqual(result.places.tolist(), [1, 2])
+
+        result = ranking.rank(scores,
+                              points=points,
+                              times=times,
+                              wrong=wrong,
+                              rules=ranking.Rules(
+                                  score_mode='all_or_nothing',
+                                  penalty_calc_policy='max',
+                              ))
+        self.assertEqual(result.total_points.tolist(), [100, 100])
+        self.assertEqual(result.total_penalties.tolist(), [10, 1])
+        self.assertEqual(result.order.tolist(), [1, 0])
+        self.assertEqual(result.places.tolist(), [2, 1])
+
+        result = ranking.rank(scores,
+                              points=points,
+                              times=times,
+                              rules=ranking.Rules(penalty_type='none'))
+        self.assertEqual(result.places.tolist(), [1, 2])
+        self.assertEqual(result.total_penalties.tolist(), [0, 0])
+
+        result = ranking.rank(scores,
+                              points=points,
+                              times=times,
+                              opened=numpy.array([[0.0, 630.0], [60.0, 0.0]]),
+                              rules=ranking.Rules(penalty_type='problem_open'))
+        self.assertEqual(result.penalties.tolist(), [[10, 10], [0, 0]])
+
+        result = ranking.rank(scores,
+                              points=points,
+                              times=times,
+                              rules=ranking.Rules(points_decay_factor=0.7,
+                                                  duration=600.0))
+        # Solved after the whole length of the contest.
+        self.assertAlmostEqual(result.points[0, 0], 100 * (0.3 + 0.7 / 11))
+        with self.assertRaises(ValueError):
+            ranking.Rules(score_mode='invalid')
+
+    def test_ties(self) -> None:
+        """Contestants with the same points and penalty share places."""
+        cell_points = numpy.array([[100.0], [50.0], [100.0], [100.0]])
+        cell_penalties = numpy.array([[10.0], [0.0], [10.0], [5.0]])
+        result = ranking.rank_cells(cell_points,
+                                    cell_penalties,
+                                    tiebreak=numpy.array([3, 2, 1, 0]))
+        self.assertEqual(result.order.tolist(), [3, 2, 0, 1])
+        self.assertEqual(result.places.tolist(), [2, 4, 2, 1])
+
+    def test_random(self) -> None:
+        """The ranking matches a straightforward computation."""
+        rng = random.Random(0)
+        rows, columns = 500, 5
+        cell_points = numpy.array(
+            [[rng.choice([0, 50, 100]) for _ in range(columns)]
+             for _ in range(rows)], dtype=float)
+        cell_penalties = numpy.array(
+            [[rng.randrange(3) for _ in range(columns)] for _ in range(rows)],
+            dtype=float)
+        result = ranking.rank_cells(cell_points, cell_penalties)
+        totals = [(-sum(cell_points[i]), sum(cell_penalties[i]))
+                  for i in range(rows)]
+        expected = sorted(range(rows), key=lambda i: (totals[i], i))
+        self.assertEqual(result.order.tolist(), expected)
+        for i in range(rows):
+            better = sum(1 for total in totals if total < totals[i])
+            self.assertEqual(result.places[i], better + 1)
+
+    def test_from_scoreboard(self) -> None:
+        """Matrices are extracted from a scoreboard."""
+        scoreboard = _decoder.decode(
+            omegaup.api._Scoreboard, {
+                'problems': [
+                    {'alias': 'a', 'order': 1},
+                    {'alias': 'b', 'order': 2},
+                ],
+                'ranking': [{
+                    'classname': 'user-rank-unranked',
+                    'country': 'MX',
+                    'is_invited': True,
+                    'problems': [
+                        {'alias': 'b', 'penalty': 3, 'percent': 100,
+                         'points': 100, 'runs': 1},
+                    ],
+                    'total': {'penalty': 3, 'points': 100},
+                    'username': 'alice',
+                }],
+                'start_time': 1600000000,
+                'time': 1600000600,
+                'title': 'Contest',
+            })
+        usernames, cell_points, cell_penalties = ranking.from_scoreboard(
+            scoreboard)
+        self.assertEqual(usernames, ['alice'])
+        self.assertEqual(cell_points.tolist(), [[0, 100]])
+        self.assertEqual(cell_penalties.tolist(), [[0, 3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,210 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.resolver."""
+
+import random
+import unittest
+
+from typing import Any, Dict, List, Tuple
+
+import omegaup.api
+from omegaup import _decoder
+from omegaup.scoreboard import resolver
+
+_PROBLEMS = ('a', 'b', 'c')
+# The last hour of the five-hour contest is frozen.
+_FREEZE_TIME = 1600014400
+
+
+def _scoreboard(
+        users: Dict[str, List[Tuple[float, float]]]) -> omegaup.api._Scoreboard:
+    """Returns a scoreboard with the given points and penalty per cell."""
+    return _decoder.decode(
+        omegaup.api._Scoreboard, {
+            'problems': [{
+                'alias': alias,
+                'order': order
+            } for order, alias in enumerate(_PROBLEMS, 1)],
+            'ranking': [{
+                'classname': 'user-rank-unranked',
+                'country': 'MX',
+                'is_invited': True,
+                'name': None,
+                'problems': [{
+                    'alias': alias,
+                    'penalty': penalty,
+                    'percent': points,
+                    'points': points,
+                    'runs': 1 if points else 0,
+                } for alias, (points, penalty) in zip(_PROBLEMS, cells)],
+                'total': {
+                    'penalty': sum(penalty for _, penalty in cells),
+                    'points': sum(points for points, _ in cells),
+                },
+                'username': username,
+            } for username, cells in users.items()],
+            'start_time': 1600000000,
+            'time': 1600018000,
+            'title': 'Contest',
+        },
+        timestamps='epoch')
+
+
+def _event(username: str, delta: float, alias: str, points: float,
+           penalty: float) -> omegaup.api._ScoreboardEvent:
+    return _decoder.decode(
+        omegaup.api._ScoreboardEvent, {
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'delta': delta,
+            'is_invited': True,
+            'problem': {
+                'alias': alias,
+                'penalty': penalty,
+                'points': points,
+            },
+            # The resolver computes the totals from the cells.
+            'total': {
+                'penalty': 0,
+                'points': 0,
+            },
+            'username': username,
+        })
+
+
+class TestResolver(unittest.TestCase):
+    """Test omegaup.scoreboard.resolver."""
+    def test_resolve(self) -> None:
+        """The lowest contestant with hidden cells is revealed first."""
+        frozen = _scoreboard({
+            'alice': [(100, 10), (0, 0), (0, 0)],
+            'bob': [(100, 20), (0, 0), (0, 0)],
+            'carol': [(0, 0), (0, 0), (0, 0)],
+        })
+        events = [
+            _event('alice', 10, 'a', 100, 10),
+            _event('carol', 250, 'c', 100, 250),
+            _event('carol', 260, 'b', 100, 260),
+            _event('bob', 270, 'b', 100, 270),
+            _event('bob', 280, 'b', 100, 270),
+            _event('alice', 290, 'c', 0, 0),
+        ]
+        ceremony = resolver.Resolver(frozen,
+                                     events,
+                                     freeze_time=_FREEZE_TIME)
+        self.assertEqual(
+            [(s.username, s.alias, s.previous_index, s.index, s.place,
+              s.finished) for s in ceremony.steps],
+            [
+                ('carol', 'b', 2, 2, 3, False),
+                ('carol', 'c', 2, 0, 1, True),
+                ('bob', 'b', 2, 0, 1, True),
+                # A wrong submission during the freeze is revealed too.
+                ('alice', 'c', 2, 2, 3, True),
+            ])
+        self.assertEqual(ceremony.steps[1].points, 200)
+        self.assertEqual(ceremony.steps[1].penalty, 510)
+        self.assertEqual(ceremony.steps[0].before.points, 0)
+        self.assertEqual(ceremony.steps[0].after.points, 100)
+        self.assertEqual(ceremony.steps[0].after.runs, 1)
+        # Both of bob's submissions after the freeze are counted.
+        self.assertEqual(ceremony.steps[2].after.runs, 2)
+        self.assertEqual(ceremony.steps[3].after.points, 0)
+        self.assertEqual(ceremony.steps[3].after.runs, 1)
+        self.assertEqual(
+            [(f.kind, f.step, f.username, f.index)
+             for f in ceremony.frames()],
+            [
+                ('focus', 0, 'carol', 2),
+                ('reveal', 0, 'carol', 2),
+                ('reveal', 1, 'carol', 2),
+                ('move', 1, 'carol', 0),
+                ('reveal', 2, 'bob', 2),
+                ('move', 2, 'bob', 0),
+                ('reveal', 3, 'alice', 2),
+            ])
+        self.assertEqual([(e.username, e.place, e.total.points)
+                          for e in ceremony.scoreboard().ranking],
+                         [('bob', 1, 200), ('carol', 2, 200),
+                          ('alice', 3, 100)])
+        # The frozen scoreboard is not modified.
+        self.assertEqual(frozen.ranking[2].total.points, 0)
+
+        # Without a freeze, only the cells that changed are revealed.
+        self.assertEqual(
+            [(s.username, s.alias, s.after.runs)
+             for s in resolver.Resolver(frozen, events,
+                                        freeze_time=None).steps],
+            [('carol', 'b', 1), ('carol', 'c', 1), ('bob', 'b', 1)])
+
+        with self.assertRaises(ValueError):
+            resolver.Resolver(frozen,
+                              events,
+                              freeze_time=_FREEZE_TIME,
+                              penalty_calc_policy='min')
+
+    def test_random(self) -> None:
+        """Every step matches a full recomputation of the ranking."""
+        rng = random.Random(4)
+        for iteration in range(20):
+            users: Dict[str, List[Tuple[float, float]]] = {
+                f'user{i:02}': [(rng.choice([0, 100]), rng.randrange(5))
+                                for _ in _PROBLEMS]
+                for i in range(rng.randrange(1, 40))
+            }
+            final = {
+                username: [(points or rng.choice([0, 100]), penalty)
+                           for points, penalty in cells]
+                for username, cells in users.items()
+            }
+            final['newcomer'] = [(100, 1)] * len(_PROBLEMS)
+            events = [
+                _event(username, 200, alias, points, penalty)
+                for username, cells in final.items()
+                for alias, (points, penalty) in zip(_PROBLEMS, cells)
+            ]
+            rng.shuffle(events)
+            ceremony = resolver.Resolver(_scoreboard(users),
+                                         events,
+                                         freeze_time=_FREEZE_TIME)
+            with self.subTest(iteration=iteration):
+                current = {
+                    username: list(cells)
+                    for username, cells in users.items()
+                }
+                current['newcomer'] = [(0, 0)] * len(_PROBLEMS)
+
+                def _order() -> List[Any]:
+                    return sorted(
+                        current,
+                        key=lambda u: (-sum(c[0] for c in current[u]),
+                                       sum(c[1] for c in current[u]), u))
+
+                for step in ceremony.steps:
+                    order = _order()
+                    pending = [
+                        username for username in order
+                        if current[username] != final[username]
+                    ]
+                    self.assertEqual(step.username, pending[-1])
+                    self.assertEqual(order.index(step.username),
+                                     step.previous_index)
+                    column = _PROBLEMS.index(step.alias)
+                    self.assertEqual(
+                        column,
+                        min(i for i, cell in enumerate(current[step.username])
+                            if cell != final[step.username][i]))
+                    current[step.username][column] = final[step.username][
+                        column]
+                    self.assertEqual(_order().index(step.username),
+                                     step.index)
+                self.assertEqual(current, final)
+                self.assertEqual(
+                    [e.username for e in ceremony.scoreboard().ranking],
+                    _order())
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,281 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.server."""
+
+import datetime
+import http.client
+import json
+import threading
+import time
+import unittest
+
+from typing import Any, Dict, List, Tuple
+
+import omegaup.api
+from omegaup.scoreboard import diff, server, subscription
+
+_START = 1600000000
+
+
+def _scoreboard(points: Dict[str, float]) -> omegaup.api._Scoreboard:
+    return omegaup.api._Scoreboard(
+        problems=[{
+            'alias': 'a',
+            'order': 1,
+        }],
+        ranking=[{
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'is_invited': True,
+            'problems': [{
+                'alias': 'a',
+                'penalty': 0,
+                'percent': value,
+                'points': value,
+                'runs': 1,
+            }],
+            'total': {
+                'penalty': 0,
+                'points': value,
+            },
+            'username': username,
+        } for username, value in sorted(points.items(),
+                                        key=lambda item: -item[1])],
+        start_time=_START,
+        time=int(time.time()),
+        title='Contest',
+    )
+
+
+def _events(response: http.client.HTTPResponse,
+            count: int) -> List[Tuple[str, str, diff.ScoreboardDelta]]:
+    """Reads a number of Server-Sent Events."""
+    result: List[Tuple[str, str, diff.ScoreboardDelta]] = []
+    fields: Dict[str, bytes] = {}
+    while len(result) < count:
+        line = response.readline().rstrip(b'\n')
+        if line.startswith(b':'):
+            continue
+        if line:
+            name, value = line.split(b': ', 1)
+            fields[name.decode('utf-8')] = value
+            continue
+        result.append((fields['event'].decode('utf-8'),
+                       fields['id'].decode('utf-8'),
+                       diff.decode(fields['data'])))
+        fields = {}
+    return result
+
+
+class TestServer(unittest.TestCase):
+    """Test omegaup.scoreboard.server."""
+    def setUp(self) -> None:
+        self.points = {'alice': 100.0, 'bob': 50.0}
+        self.subscriptions: List[subscription.ScoreboardSubscription] = []
+
+        def _subscribe(
+                contest_alias: str) -> subscription.ScoreboardSubscription:
+            if contest_alias != 'contest':
+                raise Exception('contest not found')
+            upstream = subscription.ScoreboardSubscription(
+                lambda: _scoreboard(self.points),
+                start_time=_START,
+                intervals={
+                    phase: datetime.timedelta(hours=1)
+                    for phase in subscription.PHASES
+                })
+            self.subscriptions.append(upstream)
+            return upstream
+
+        self.httpd = server.ScoreboardServer(
+            ('127.0.0.1', 0),
+            _subscribe,
+            contests=['contest', 'missing'],
+            keepalive=datetime.timedelta(milliseconds=50))
+        self.thread = threading.Thread(target=self.httpd.serve_forever,
+                                       daemon=True)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+    def _get(self, path: str, **headers: str) -> http.client.HTTPResponse:
+        host, port = self.httpd.server_address[:2]
+        connection = http.client.HTTPConnection(str(host), port, timeout=10)
+        connection.request('GET', path, headers=headers)
+        return connection.getresponse()
+
+    def _wait(self, predicate: Any) -> None:
+        deadline = time.monotonic() + 10
+        while not predicate():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    def test_stream(self) -> None:
+        """Many clients share one upstream subscription."""
+        responses = [
+            self._get('/contests/contest/events') for _ in range(3)
+        ]
+        for response in responses:
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.getheader('Content-Type'),
+                             'text/event-stream')
+        self.assertEqual(len(self.subscriptions), 1)
+        upstream = self.subscriptions[0]
+        self._wait(lambda: upstream.scoreboard is not None)
+        epoch = self.httpd.metrics()['contests']['contest']['epoch']
+
+        empty = _scoreboard({})
+        empty.problems = []
+        snapshots = []
+        for response in responses:
+            [(event, event_id, delta)] = _events(response, 1)
+            self.assertEqual((event, event_id), ('snapshot', f'{epoch}-1'))
+            snapshots.append(diff.apply(empty, delta))
+            self.assertEqual(
+                [entry.username for entry in snapshots[-1].ranking],
+                ['alice', 'bob'])
+
+        self._wait(lambda: self.httpd.metrics()['connections'] == 3)
+        self.points['bob'] = 200.0
+        self.assertIsNotNone(upstream.poll())
+        for response, snapshot in zip(responses, snapshots):
+            [(event, event_id, delta)] = _events(response, 1)
+            self.assertEqual((event, event_id), ('delta', f'{epoch}-2'))
+            self.assertEqual(
+                [entry.username for entry in diff.apply(snapshot,
+                                                        delta).ranking],
+                ['bob', 'alice'])
+
+        # A reconnecting client only gets the deltas it missed.
+        self.points['alice'] = 300.0
+        self.assertIsNotNone(upstream.poll())
+        resumed = self._get('/contests/contest/events', **{
+            'Last-Event-ID': f'{epoch}-1',
+        })
+        self.assertEqual([(event, event_id)
+                          for event, event_id, _ in _events(resumed, 2)],
+                         [('delta', f'{epoch}-2'), ('delta', f'{epoch}-3')])
+        resumed.close()
+
+        self._wait(lambda: self.httpd.metrics()['contests']['contest'][
+            'messages_sent'] == 11)
+        metrics = json.loads(self._get('/metrics').read())
+        self.assertEqual(metrics['connections_total'], 4)
+        contest = metrics['contests']['contest']
+        self.assertEqual(contest['sequence'], 3)
+        self.assertEqual(contest['published'], 3)
+        self.assertEqual(contest['resyncs'], 0)
+        self.assertIsNotNone(contest['upstream_lag_seconds'])
+        self.assertEqual(len(self.subscriptions), 1)
+        for response in responses:
+            response.close()
+
+    def test_not_found(self) -> None:
+        """Unknown contests and paths are rejected."""
+        self.assertEqual(self._get('/contests/other/events').status, 404)
+        with self.assertLogs('omegaup', level='ERROR'):
+            self.assertEqual(
+                self._get('/contests/missing/events').status, 404)
+        self.assertEqual(self._get('/').status, 404)
+        self.assertEqual(self.subscriptions, [])
+
+    def test_channels(self) -> None:
+        """Upstream failures, limits and idle channels are handled."""
+        started: List[str] = []
+
+        def _subscribe(
+                contest_alias: str) -> subscription.ScoreboardSubscription:
+            if contest_alias == 'missing':
+                raise Exception('contest not found')
+            started.append(contest_alias)
+            return subscription.ScoreboardSubscription(
+                lambda: _scoreboard(self.points),
+                start_time=_START,
+                intervals={
+                    phase: datetime.timedelta(hours=1)
+                    for phase in subscription.PHASES
+                })
+
+        httpd = server.ScoreboardServer(('127.0.0.1', 0),
+                                        _subscribe,
+                                        max_channels=1,
+                                        idle_timeout=datetime.timedelta(0))
+        try:
+            with self.assertRaises(Exception):
+                httpd.attach('missing', None)
+            channel, listener = httpd.attach('first', None)
+            with self.assertRaises(KeyError):
+                httpd.attach('second', None)
+            self.assertEqual(started, ['first'])
+
+            # Channels with listeners are kept.
+            httpd.service_actions()
+            self.assertEqual(list(httpd.metrics()['contests']), ['first'])
+            channel.detach(listener)
+            httpd.service_actions()
+            self.assertEqual(httpd.metrics()['contests'], {})
+            httpd.attach('second', None)
+            self.assertEqual(started, ['first', 'second'])
+        finally:
+            httpd.server_close()
+
+    def test_resync(self) -> None:
+        """Clients that fall behind get a new snapshot."""
+        upstream = subscription.ScoreboardSubscription(
+            lambda: _scoreboard(self.points), start_time=_START)
+        channel = server.Channel(upstream, max_pending=2)
+        upstream.poll()
+        listener = channel.attach()
+        for points in (10.0, 20.0, 30.0):
+            self.points['bob'] = points
+            upstream.poll()
+        messages = [message for message, _ in listener.messages]
+        self.assertEqual(len(messages), 2)
+        self.assertTrue(messages[0].startswith(
+            f'event: snapshot\nid: {channel.epoch}-3\n'.encode('utf-8')))
+        self.assertTrue(messages[1].startswith(
+            f'event: delta\nid: {channel.epoch}-4\n'.encode('utf-8')))
+        self.assertEqual(channel.metrics()['resyncs'], 1)
+        self.assertEqual(channel.metrics()['subscribers'], 1)
+        channel.detach(listener)
+        self.assertEqual(channel.metrics()['subscribers'], 0)
+
+    def test_resume_new_channel(self) -> None:
+        """Ids from a previous channel of the contest get a new snapshot."""
+        upstream = subscription.ScoreboardSubscription(
+            lambda: _scoreboard(self.points), start_time=_START)
+        old = server.Channel(upstream)
+        upstream.poll()
+        old.detach(old.attach())
+
+        channel = server.Channel(upstream)
+        for points in (10.0, 20.0):
+            self.points['bob'] = points
+            upstream.poll()
+        self.assertNotEqual(channel.epoch, old.epoch)
+
+        for last_event_id in (f'{old.epoch}-1', '1', 'invalid',
+                              f'{channel.epoch}-5'):
+            with self.subTest(last_event_id=last_event_id):
+                listener = channel.attach(last_event_id)
+                messages = [message for message, _ in listener.messages]
+                self.assertEqual(len(messages), 1)
+                self.assertTrue(messages[0].startswith(
+                    f'event: snapshot\nid: {channel.epoch}-2\n'.encode(
+                        'utf-8')))
+                channel.detach(listener)
+
+        listener = channel.attach(f'{channel.epoch}-1')
+        messages = [message for message, _ in listener.messages]
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(messages[0].startswith(
+            f'event: delta\nid: {channel.epoch}-2\n'.encode('utf-8')))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
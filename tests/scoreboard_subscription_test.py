@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.scoreboard.subscription."""
+
+import datetime
+import time
+import unittest
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import omegaup.api
+from omegaup.scoreboard import subscription
+
+_START = 1600000000
+_FINISH = _START + 5 * 60 * 60
+
+
+def _scoreboard(points: float, finish_time: int = _FINISH) -> Dict[str, Any]:
+    return {
+        'finish_time': finish_time,
+        'problems': [],
+        'ranking': [{
+            'classname': 'user-rank-unranked',
+            'country': 'MX',
+            'is_invited': True,
+            'problems': [],
+            'total': {
+                'penalty': 0,
+                'points': points,
+            },
+            'username': 'alice',
+        }],
+        'start_time': _START,
+        'time': int(time.time()),
+        'title': 'Contest',
+    }
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves the details and the scoreboard of a contest."""
+    def __init__(self) -> None:
+        super().__init__(api_token='token', timestamps='epoch')
+        self.points = 0.0
+        self.finish_time = _FINISH
+        self.endpoints: List[str] = []
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        self.endpoints.append(endpoint)
+        if endpoint == '/api/time/get/':
+            return {'time': int(time.time()) + 3600}
+        if endpoint == '/api/contest/publicDetails/':
+            return {
+                'admission_mode': 'public',
+                'alias': 'contest',
+                'default_show_all_contestants_in_scoreboard': False,
+                'description': '',
+                'director': 'admin',
+                'feedback': 'none',
+                'finish_time': _FINISH,
+                'languages': 'py3',
+                'penalty': 0,
+                'penalty_calc_policy': 'sum',
+                'penalty_type': 'none',
+                'points_decay_factor': 0.0,
+                'problemset_id': 1,
+                'score_mode': 'partial',
+                'scoreboard': 80,
+                'show_penalty': True,
+                'show_scoreboard_after': True,
+                'start_time': _START,
+                'submissions_gap': 60,
+                'title': 'Contest',
+            }
+        assert endpoint == '/api/contest/scoreboard/'
+        return _scoreboard(self.points, self.finish_time)
+
+
+class TestSubscription(unittest.TestCase):
+    """Test omegaup.scoreboard.subscription."""
+    def test_phases(self) -> None:
+        """The interval depends on the phase of the contest."""
+        client = _FakeClient()
+        scoreboard = subscription.contest_subscription(client, 'contest')
+        self.assertEqual(scoreboard.freeze_time, _START + 4 * 60 * 60)
+        self.assertAlmostEqual(scoreboard.now(), time.time() + 3600, delta=5)
+
+        cases = [
+            (_START - 3600, 'before', 600),
+            (_START - 60, 'before', 60),
+            (_START, 'running', 30),
+            (_START + 4 * 3600 - 10, 'running', 10),
+            (_START + 4 * 3600, 'frozen', 30),
+            (_FINISH - 1, 'frozen', 1),
+            (_FINISH, 'finished', 600),
+        ]
+        for now, phase, interval in cases:
+            with self.subTest(now=now):
+                self.assertEqual(scoreboard.phase(now), phase)
+                self.assertEqual(scoreboard.interval(now), interval)
+
+        # Without a freeze, the last hour is polled aggressively.
+        unfrozen = subscription.ScoreboardSubscription(
+            lambda: omegaup.api._Scoreboard(**_scoreboard(0)),
+            start_time=_START,
+            finish_time=_FINISH,
+            intervals={'closing': datetime.timedelta(seconds=2)})
+        self.assertEqual(unfrozen.phase(_FINISH - 3600), 'closing')
+        self.assertEqual(unfrozen.interval(_FINISH - 3600), 2)
+        with self.assertRaises(ValueError):
+            subscription.ScoreboardSubscription(
+                lambda: omegaup.api._Scoreboard(**_scoreboard(0)),
+                start_time=_START,
+                intervals={'paused': datetime.timedelta(seconds=1)})
+
+    def test_rescheduled(self) -> None:
+        """The freeze time follows a contest that is extended."""
+        client = _FakeClient()
+        scoreboard = subscription.contest_subscription(client, 'contest')
+        client.finish_time = _START + 10 * 60 * 60
+        scoreboard.poll()
+        self.assertEqual(scoreboard.finish_time, client.finish_time)
+        self.assertEqual(scoreboard.freeze_time, _START + 8 * 60 * 60)
+        self.assertEqual(scoreboard.phase(_START + 4 * 60 * 60), 'running')
+        self.assertEqual(scoreboard.phase(_START + 8 * 60 * 60), 'frozen')
+
+        with self.assertRaises(ValueError):
+            subscription.ScoreboardSubscription(
+                lambda: omegaup.api._Scoreboard(**_scoreboard(0)),
+                start_time=_START,
+                freeze_percent=80)
+        with self.assertRaises(ValueError):
+            subscription.ScoreboardSubscription(
+                lambda: omegaup.api._Scoreboard(**_scoreboard(0)),
+                start_time=_START,
+                finish_time=_FINISH,
+                freeze_time=_START,
+                freeze_percent=80)
+
+    def test_subscribers(self) -> None:
+        """Every subscriber shares a single poll."""
+        client = _FakeClient()
+        scoreboard = subscription.contest_subscription(client, 'contest')
+        received: List[List[float]] = [[], []]
+        unsubscribe = scoreboard.subscribe(
+            lambda s: received[0].append(s.ranking[0].total.points))
+        scoreboard.subscribe(
+            lambda s: received[1].append(s.ranking[0].total.points))
+
+        self.assertIsNotNone(scoreboard.poll())
+        self.assertIsNone(scoreboard.poll())
+        client.points = 100
+        unsubscribe()
+        self.assertIsNotNone(scoreboard.poll())
+        self.assertEqual(received, [[0], [0, 100]])
+        self.assertEqual(
+            client.endpoints.count('/api/contest/scoreboard/'), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Test omegaup.userindex."""
+
+import unittest
+
+from typing import Any, List, Mapping, Optional
+
+import omegaup.api
+import omegaup.userindex
+
+
+class _FakeClient(omegaup.api.Client):
+    """A client that serves the participants of a course and a group."""
+    def __init__(self) -> None:
+        super().__init__(api_token='token')
+        self.pages: List[str] = []
+
+    def query(self,
+              endpoint: str,
+              payload: Optional[Mapping[str, str]] = None,
+              *args: Any,
+              **kwargs: Any) -> Any:
+        assert payload is not None
+        if endpoint == '/api/course/listStudents/':
+            return {
+                'students': [
+                    {
+                        'username': 'jperez',
+                        'name': 'José Pérez'
+                    },
+                    {
+                        'username': 'maria',
+                        'name': None
+                    },
+                ],
+            }
+        if endpoint == '/api/contest/users/':
+            return {
+                'groups': [],
+                'users': [{
+                    'username': 'maria'
+                }, {
+                    'username': 'pedro'
+                }],
+            }
+        assert endpoint == '/api/teamsGroup/teamsMembers/'
+        self.pages.append(payload['page'])
+        members = [{
+            'classname': 'user-rank-unranked',
+            'isMainUserIdentity': False,
+            'name': f'Miembro {i}',
+            'team_alias': 'team',
+            'team_name': 'Team',
+            'username': f'team:member{i}',
+        } for i in range(3)]
+        page = int(payload['page'])
+        page_size = int(payload['page_size'])
+        return {
+            'pageNumber': page,
+            'teamsUsers': members[(page - 1) * page_size:page * page_size],
+            'totalRows': len(members),
+        }
+
+
+class TestUserIndex(unittest.TestCase):
+    """Test omegaup.userindex."""
+    def test_search(self) -> None:
+        """Users are found by username and name prefixes."""
+        client = _FakeClient()
+        index = omegaup.userindex.UserIndex()
+        self.assertEqual(index.add_course_students(client, 'course'), 2)
+        self.assertEqual(index.add_contest_users(client, 'contest'), 1)
+        self.assertEqual(
+            index.add_teams_group_members(client, 'teams', page_size=2), 3)
+        self.assertEqual(client.pages, ['1', '2'])
+        self.assertEqual(len(index), 6)
+
+        def _search(prefix: str, limit: int = 10) -> List[str]:
+            return [user.username for user in index.search(prefix, limit)]
+
+        self.assertEqual(_search('PE'), ['jperez', 'pedro'])
+        self.assertEqual(_search('jose pe'), ['jperez'])
+        self.assertEqual(_search('Pérez'), ['jperez'])
+        self.assertEqual(_search('team:'),
+                         ['team:member0', 'team:member1', 'team:member2'])
+        self.assertEqual(_search('miembro', limit=2),
+                         ['team:member0', 'team:member1'])
+        self.assertEqual(_search('x'), [])
+        self.assertEqual(len(_search('')), 6)
+
+        # Adding a user without a name keeps the known name.
+        self.assertFalse(index.add('jperez'))
+        self.assertTrue(index.add('jperez', 'Juan Pérez'))
+        self.assertEqual(_search('jose'), [])
+        self.assertEqual(_search('juan'), ['jperez'])
+        self.assertTrue(index.remove('jperez'))
+        self.assertEqual(_search('pe'), ['pedro'])
+        self.assertFalse(index.remove('jperez'))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
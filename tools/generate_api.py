@@ -0,0 +1,608 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Generates the `omegaup.api` package from the omegaUp API client generator.
+
+omegaUp's `frontend/server/cmd/APITool.php` emits the whole Python client as a
+single `api.py` module. This script turns that module into the package layout
+of `omegaup.api`:
+
+- Every controller goes in its own `_<controller>.py` module, together with
+  its response aliases and the types that only it uses. Types that are used
+  by several controllers go in `_types.py`, and types that no API returns go
+  in `_payloads.py`.
+- Responses are decoded with the compiled decoders of `omegaup._decoder`
+  instead of the keyword constructors.
+- The endpoints in `STREAMS` get a `stream_*` variant that parses the
+  response incrementally, and the ones in `PAGINATED` get an `iter_*`
+  variant that walks every page.
+- The lazily-loaded re-exports and the controller properties of `Client` in
+  `__init__.py` are rewritten to match. The rest of `__init__.py` and
+  `_base.py` are maintained by hand.
+
+Sample usage:
+
+```shell
+php frontend/server/cmd/APITool.php --file=api.py --lang=python > /tmp/api.py
+python3 tools/generate_api.py /tmp/api.py
+```
+"""
+
+import argparse
+import ast
+import collections
+import dataclasses
+import os
+import re
+
+from typing import DefaultDict, Dict, List, Optional, Sequence, Set
+
+_API_DIR = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'omegaup', 'api')
+
+_TYPING_NAMES = ('TYPE_CHECKING', 'Any', 'BinaryIO', 'Dict', 'Iterator',
+                 'Mapping', 'Optional', 'Sequence', 'Union')
+
+_MAX_LINE_LENGTH = 79
+
+
+@dataclasses.dataclass
+class Paginated:
+    """An endpoint that gets an `iter_*` variant."""
+    # The name of the parameter that selects the page, its first value, and
+    # the name of the parameter that selects the page size.
+    page: str
+    first_page: int
+    page_size: str
+    # The response member with the items of the page, and their type.
+    items: str
+    item_type: str
+    # The response member with the total number of items, if any.
+    total: Optional[str] = None
+    # The parameters that the paginator controls.
+    controlled: Sequence[str] = ()
+    # A comment that is emitted before the call to the paginator.
+    comment: Sequence[str] = ()
+
+
+STREAMS = {
+    ('Contest', 'runs'): ('runs', '_Run'),
+    ('Course', 'runs'): ('runs', '_Run'),
+    ('Problem', 'runs'): ('runs', '_Run'),
+    ('Run', 'list'): ('runs', '_Run'),
+}
+"""The endpoints that get a `stream_*` variant: their array member and type."""
+
+PAGINATED = {
+    ('Contest', 'adminList'):
+    Paginated('page', 1, 'page_size', 'contests', '_Contest',
+              controlled=('page', 'page_size')),
+    ('Contest', 'list'):
+    Paginated('page', 1, 'page_size', 'results', '_ContestListItem',
+              total='number_of_results', controlled=('page', 'page_size')),
+    ('Contest', 'runs'):
+    Paginated('offset', 0, 'rowcount', 'runs', '_Run', total='totalRuns',
+              controlled=('offset', 'rowcount')),
+    ('Course', 'runs'):
+    Paginated('offset', 0, 'rowcount', 'runs', '_Run', total='totalRuns',
+              controlled=('offset', 'rowcount')),
+    ('Problem', 'adminList'):
+    Paginated('page', 1, 'page_size', 'problems', '_ProblemListItem',
+              controlled=('page', 'page_size')),
+    ('Problem', 'list'):
+    Paginated('page', 1, 'rowcount', 'results', '_ProblemListItem',
+              total='total', controlled=('offset', 'page', 'rowcount')),
+    ('Problem', 'runs'):
+    Paginated('offset', 0, 'rowcount', 'runs', '_Run', total='totalRuns',
+              controlled=('offset', 'rowcount')),
+    ('QualityNomination', 'list'):
+    Paginated('offset', 1, 'rowcount', 'nominations', '_NominationListItem',
+              controlled=('offset', 'rowcount'),
+              comment=(
+                  'Unlike the runs endpoints, where `offset` is a 0-based '
+                  'page index,',
+                  'the server treats this `offset` as a 1-based page number.',
+              )),
+    ('Run', 'list'):
+    Paginated('offset', 0, 'rowcount', 'runs', '_Run', total='totalRuns',
+              controlled=('offset', 'rowcount')),
+    ('Submission', 'list'):
+    Paginated('page', 1, 'pageSize', 'submissions', '_Submission',
+              controlled=('page', 'pageSize')),
+}
+"""The endpoints that get an `iter_*` variant."""
+
+
+@dataclasses.dataclass
+class _Method:
+    """The parts of a generated controller method."""
+    name: str
+    # The parameters, one per line and without indentation, including the
+    # out-of-band ones and the comments.
+    parameters: List[str]
+    returns: str
+    # The lines of the docstring summary, without indentation.
+    summary: List[str]
+    # The lines of the `Args:` section, without the header.
+    args: List[str]
+    # The lines that fill the `parameters` dictionary.
+    payload: List[str]
+    endpoint: str
+    # The decoded type, and whether the response is a list of them.
+    decoded: Optional[str]
+    is_list: bool
+    # The original return statement, for the responses that are not decoded.
+    body: List[str]
+
+
+@dataclasses.dataclass
+class _Api:
+    """The definitions of a generated `api.py`, in order."""
+    types: Dict[str, str] = dataclasses.field(default_factory=dict)
+    aliases: Dict[str, str] = dataclasses.field(default_factory=dict)
+    controllers: Dict[str, str] = dataclasses.field(default_factory=dict)
+    order: List[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def definitions(self) -> Dict[str, str]:
+        """All the definitions, by name."""
+        return {**self.types, **self.aliases, **self.controllers}
+
+
+def _module_name(controller: str) -> str:
+    """Returns the name of the module of a controller."""
+    return '_' + re.sub(r'(?<!^)([A-Z])', r'_\1', controller).lower()
+
+
+def _names(text: str) -> Set[str]:
+    """Returns the identifiers that appear in some source code."""
+    return set(re.findall(r'\b[A-Za-z_]\w*\b', text))
+
+
+def _query_call(function: str, endpoint: str, indent: int,
+                extra: Sequence[str] = ()) -> List[str]:
+    """Returns the lines of a call to `Client.query` and friends."""
+    head = f'self._client.{function}({endpoint!r},'
+    pad = ' ' * (indent + len(f'self._client.{function}('))
+    arguments = list(extra) + [
+        'payload=parameters', 'files_=files_', 'timeout_=timeout_',
+        'check_=check_'
+    ]
+    lines = [' ' * indent + head]
+    for i, argument in enumerate(arguments):
+        lines.append(pad + argument + (')' if i == len(arguments) - 1 else ','))
+    return lines
+
+
+def _signature(name: str, parameters: Sequence[str],
+               returns: str) -> List[str]:
+    """Returns the lines of the signature of a method, the way yapf does."""
+    last = f'            {parameters[-1]}) -> {returns}:'
+    if len(last) <= _MAX_LINE_LENGTH:
+        indent = ' ' * 12
+        return ([f'    def {name}(', f'{indent}self,', f'{indent}*,']
+                + [f'{indent}{p}' for p in parameters[:-1]] + [last])
+    # yapf only dedents the parameters when the closing line would overflow
+    # by more than a few columns.
+    indent = ' ' * (12 if len(last) <= _MAX_LINE_LENGTH + 4 else 8)
+    return ([f'    def {name}(', f'{indent}self,', f'{indent}*,']
+            + [f'{indent}{p}' for p in parameters] + [f'    ) -> {returns}:'])
+
+
+def _docstring(summary: Sequence[str], variant: Sequence[str],
+               args: Sequence[str], section: str,
+               result: Sequence[str]) -> List[str]:
+    """Returns the lines of the docstring of a method."""
+    lines = [f'        r"""{summary[0] if summary else ""}']
+    lines += [f'        {line}' if line else '' for line in summary[1:]]
+    lines.append('')
+    if variant:
+        lines += [f'        {line}' for line in variant] + ['']
+    if args:
+        lines += ['        Args:'] + [f'            {line}' for line in args]
+        lines.append('')
+    lines += [f'        {section}:'] + [f'            {line}' for line in result]
+    lines.append('        """')
+    return lines
+
+
+def _parse_method(node: ast.FunctionDef, lines: Sequence[str]) -> _Method:
+    """Extracts the parts of a generated controller method."""
+    source = lines[node.lineno - 1:node.end_lineno]
+    header_end = next(i for i, line in enumerate(source)
+                      if line.rstrip().endswith(':') and '->' in line)
+    parameters = []
+    for line in source[1:header_end + 1]:
+        line = line.strip()
+        if line in ('self,', '*,'):
+            continue
+        if '->' in line:
+            line = line[:line.index('->')].rstrip()
+            if line == ')':
+                continue
+            line = line[:-1]
+        parameters.append(line)
+    returns = source[header_end].rsplit('->', 1)[1].strip()[:-1]
+
+    docstring = ast.get_docstring(node, clean=False) or ''
+    # The lines of the docstring, relative to the indentation of the body.
+    doc_lines = [
+        line[8:] if line.startswith(' ' * 8) else line.strip()
+        for line in docstring.split('\n')
+    ]
+    section = next(i for i, line in enumerate(doc_lines)
+                   if line in ('Args:', 'Returns:'))
+    summary = doc_lines[:section]
+    while summary and not summary[-1]:
+        summary.pop()
+    args: List[str] = []
+    if doc_lines[section] == 'Args:':
+        for line in doc_lines[section + 1:]:
+            if not line:
+                break
+            args.append(line[4:])
+
+    body = node.body[1:]
+    payload_start = body[0].lineno
+    statement = body[-1]
+    payload = list(lines[payload_start - 1:statement.lineno - 1])
+    endpoint = ''
+    for call in ast.walk(statement):
+        if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                and call.func.attr == 'query'):
+            endpoint = _string(call.args[0])
+    decoded: Optional[str] = None
+    is_list = False
+    value = statement.value if isinstance(statement, ast.Return) else None
+    if (isinstance(value, ast.Call) and isinstance(value.func, ast.Name)
+            and value.keywords and value.keywords[0].arg is None):
+        decoded = value.func.id
+    elif (isinstance(value, ast.ListComp)
+          and isinstance(value.elt, ast.Call)
+          and isinstance(value.elt.func, ast.Name)):
+        decoded = value.elt.func.id
+        is_list = True
+    return _Method(name=node.name,
+                   parameters=parameters,
+                   returns=returns,
+                   summary=summary,
+                   args=args,
+                   payload=payload,
+                   endpoint=endpoint,
+                   decoded=decoded,
+                   is_list=is_list,
+                   body=list(lines[statement.lineno - 1:statement.end_lineno]))
+
+
+def _string(node: ast.expr) -> str:
+    """Returns the value of a string literal."""
+    if not isinstance(node, ast.Constant) or not isinstance(node.value, str):
+        raise ValueError(f'Expected a string literal: {ast.dump(node)}')
+    return node.value
+
+
+def _render_method(method: _Method) -> List[str]:
+    """Returns the lines of a controller method that decodes its response."""
+    lines = _signature(method.name, method.parameters, method.returns)
+    lines += _docstring(method.summary, (), method.args, 'Returns',
+                        ('The API result object.', ))
+    lines += method.payload
+    if method.decoded is None:
+        return lines + method.body
+    if method.is_list:
+        lines += ['        return list(', '            _decoder.decode_each(',
+                  f'                {method.decoded},']
+        lines += _query_call('query', method.endpoint, 16)
+        lines[-1] += ','
+        lines.append('                timestamps=self._client.timestamps))')
+        return lines
+    lines += ['        return _decoder.decode(', f'            {method.decoded},']
+    lines += _query_call('query', method.endpoint, 12)
+    lines[-1] += ','
+    lines.append('            timestamps=self._client.timestamps)')
+    return lines
+
+
+def _render_stream(method: _Method, key: str, item_type: str) -> List[str]:
+    """Returns the lines of the `stream_*` variant of a method."""
+    lines = _signature(f'stream_{method.name}', method.parameters,
+                       f'Iterator[{item_type}]')
+    lines += _docstring(method.summary,
+                        (f'Streaming variant of `{method.name}()` that '
+                         'parses the response', 'incrementally.'),
+                        method.args, 'Yields',
+                        (f'The {key}, decoded one at a time as the response '
+                         'is received.', ))
+    lines += method.payload
+    lines += ['        return _decoder.decode_stream(', f'            {item_type},']
+    lines += _query_call('query_stream', method.endpoint, 12, (repr(key), ))
+    lines[-1] += ','
+    lines.append('            timestamps=self._client.timestamps)')
+    return lines
+
+
+def _render_paginated(method: _Method, spec: Paginated) -> List[str]:
+    """Returns the lines of the `iter_*` variant of a method."""
+    out_of_band = method.parameters.index('# Out-of-band parameters:')
+    parameters = [
+        p for p in method.parameters[:out_of_band]
+        if p.split(':')[0] not in spec.controlled
+    ]
+    names = [p.split(':')[0] for p in parameters]
+    parameters += [
+        '# Out-of-band parameters:',
+        'page_size_: int = _paginate.DEFAULT_PAGE_SIZE,',
+        'prefetch_: bool = True',
+    ]
+    parameters[-1] += ','
+    parameters += method.parameters[out_of_band + 1:]
+    lines = _signature(f'iter_{method.name}', parameters,
+                       f'Iterator[{spec.item_type}]')
+    args = [
+        arg for arg in method.args if arg.split(':')[0] not in spec.controlled
+    ]
+    lines += _docstring(
+        method.summary,
+        (f'Paginated variant of `{method.name}()` that requests '
+         '`page_size_` items',
+         'at a time until all of them have been returned. Unless',
+         '`prefetch_` is False, the next page is requested in the',
+         'background while the current one is being consumed.'), args,
+        'Yields', ('The items of every page, in order.', ))
+    arguments = [f'{name}={name}' for name in names]
+    arguments += ['files_=files_', 'check_=check_', 'timeout_=timeout_']
+    pad = ' ' * len('        fetch = functools.partial(')
+    lines.append(f'        fetch = functools.partial(self.{method.name},')
+    for i, argument in enumerate(arguments):
+        lines.append(pad + argument
+                     + (')' if i == len(arguments) - 1 else ','))
+    lines += [f'        # {line}' for line in spec.comment]
+    pad = ' ' * len('        return _paginate.items(')
+    lines += [
+        '        return _paginate.items(fetch,',
+        f'{pad}items={spec.items!r},',
+        f'{pad}page={spec.page!r},',
+        f'{pad}page_size={spec.page_size!r},',
+        f'{pad}first_page={spec.first_page},',
+        f'{pad}size=page_size_,',
+    ]
+    if spec.total is not None:
+        lines.append(f'{pad}total={spec.total!r},')
+    lines.append(f'{pad}prefetch=prefetch_)')
+    return lines
+
+
+def _render_controller(node: ast.ClassDef, lines: Sequence[str]) -> str:
+    """Returns the source of a controller class."""
+    methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
+    result = list(lines[node.lineno - 1:methods[0].end_lineno])
+    for method_node in methods[1:]:
+        method = _parse_method(method_node, lines)
+        result.append('')
+        result += _render_method(method)
+        if (node.name, method.name) in STREAMS:
+            key, item_type = STREAMS[node.name, method.name]
+            result.append('')
+            result += _render_stream(method, key, item_type)
+        if (node.name, method.name) in PAGINATED:
+            result.append('')
+            result += _render_paginated(method,
+                                        PAGINATED[node.name, method.name])
+    return '\n'.join(result)
+
+
+def _parse(source: str) -> _Api:
+    """Extracts the definitions of a generated `api.py`."""
+    lines = source.split('\n')
+    body = ast.parse(source).body
+    api = _Api()
+    i = 0
+    while i < len(body):
+        node = body[i]
+        if isinstance(node, ast.ClassDef) and node.name != 'Client':
+            start = (node.decorator_list[0].lineno
+                     if node.decorator_list else node.lineno)
+            if node.name.startswith('_'):
+                api.types[node.name] = '\n'.join(
+                    lines[start - 1:node.end_lineno])
+            else:
+                api.controllers[node.name] = _render_controller(node, lines)
+            api.order.append(node.name)
+        elif (isinstance(node, ast.Assign)
+              and isinstance(node.targets[0], ast.Name)
+              and node.targets[0].id.endswith('Response')):
+            # The alias is followed by its docstring.
+            i += 1
+            api.aliases[node.targets[0].id] = '\n'.join(
+                lines[node.lineno - 1:body[i].end_lineno])
+            api.order.append(node.targets[0].id)
+        i += 1
+    return api
+
+
+def _placement(api: _Api) -> Dict[str, str]:
+    """Returns the module of every definition."""
+    known = set(api.types) | set(api.aliases)
+    dependencies = {
+        name: (_names(text) & known) - {name}
+        for name, text in api.definitions.items()
+    }
+    users: DefaultDict[str, Set[str]] = collections.defaultdict(set)
+    for controller in api.controllers:
+        pending = [controller]
+        seen: Set[str] = set()
+        while pending:
+            for dependency in dependencies[pending.pop()]:
+                if dependency not in seen:
+                    seen.add(dependency)
+                    pending.append(dependency)
+        for dependency in seen:
+            users[dependency].add(controller)
+    placement = {
+        controller: _module_name(controller)
+        for controller in api.controllers
+    }
+    for name in api.aliases:
+        if len(users[name]) != 1:
+            raise ValueError(f'{name} is not used by a single controller')
+        placement[name] = _module_name(next(iter(users[name])))
+    for name in api.types:
+        if len(users[name]) == 1:
+            placement[name] = _module_name(next(iter(users[name])))
+        else:
+            placement[name] = '_types' if users[name] else '_payloads'
+    return placement
+
+
+def _render_module(api: _Api, placement: Dict[str, str], module: str,
+                   members: Sequence[str]) -> str:
+    """Returns the source of one of the modules of the package."""
+    definitions = api.definitions
+    code = definitions[members[0]]
+    for previous, member in zip(members, members[1:]):
+        if previous in api.aliases and member in api.aliases:
+            code += '\n\n'
+        else:
+            code += '\n\n\n'
+        code += definitions[member]
+    used = _names(code)
+    known = set(api.types) | set(api.aliases)
+    imports: DefaultDict[str, Set[str]] = collections.defaultdict(set)
+    for name in used & known:
+        if placement[name] != module:
+            imports[placement[name]].add(name)
+    is_controller = any(member in api.controllers for member in members)
+
+    if module == '_types':
+        docstring = ('Response types shared by several of the omegaUp API '
+                     'controllers.')
+    elif module == '_payloads':
+        docstring = ('Types of the omegaUp page payloads that are not '
+                     'returned by any API.')
+    else:
+        controller = next(m for m in members if m in api.controllers)
+        docstring = f'The omegaUp {controller} API and its response types.'
+    sections = [f'"""{docstring}"""']
+    standard = [
+        f'import {name}' for name in ('dataclasses', 'datetime', 'functools')
+        if name in used
+    ]
+    if standard:
+        sections.append('\n'.join(standard))
+    typing_names = [
+        name for name in _TYPING_NAMES
+        if name in used or (name == 'TYPE_CHECKING' and is_controller)
+    ]
+    sections.append('from typing import ' + ', '.join(typing_names))
+    local = []
+    omegaup_modules = [m for m in ('_decoder', '_paginate') if m in used]
+    if omegaup_modules:
+        local.append('from omegaup import ' + ', '.join(omegaup_modules))
+    if '_DEFAULT_TIMEOUT' in used:
+        local.append('from omegaup.api._base import _DEFAULT_TIMEOUT')
+    for name in sorted(imports):
+        names = sorted(imports[name])
+        if len(names) == 1:
+            local.append(f'from omegaup.api.{name} import {names[0]}')
+        else:
+            local.append(f'from omegaup.api.{name} import (\n'
+                         + ''.join(f'    {n},\n' for n in names) + ')')
+    if local:
+        sections.append('\n'.join(local))
+    if is_controller:
+        sections.append('if TYPE_CHECKING:\n    from omegaup.api import Client')
+    return '\n\n'.join(sections) + '\n\n\n' + code + '\n'
+
+
+def _replace(text: str, start: str, end: str, replacement: str) -> str:
+    """Replaces the text between two anchors, keeping the anchors."""
+    begin = text.index(start) + len(start)
+    return text[:begin] + replacement + text[text.index(end, begin):]
+
+
+def _render_init(text: str, api: _Api, placement: Dict[str, str]) -> str:
+    """Rewrites the generated parts of `__init__.py`."""
+    modules: DefaultDict[str, List[str]] = collections.defaultdict(list)
+    for name in sorted(placement):
+        modules[placement[name]].append(name)
+    reexports = ''.join(
+        f'    from omegaup.api.{module} import (  # noqa: F401\n'
+        + ''.join(f'        {name} as {name},\n' for name in names) + '    )\n'
+        for module, names in sorted(modules.items()))
+    lazy = ''.join(f'    {name!r}: {placement[name]!r},\n'
+                   for name in sorted(placement))
+    text = _replace(text, 'if TYPE_CHECKING:\n', '\n_LAZY_ATTRIBUTES',
+                    reexports)
+    text = _replace(text, '_LAZY_ATTRIBUTES: Dict[str, str] = {\n', '}\n',
+                    lazy)
+
+    attributes = [(name[0].lower() + name[1:], name)
+                  for name in sorted(api.controllers)]
+    slots = ''.join(f'        self._{attribute}: Optional[{name}] = None\n'
+                    for attribute, name in attributes)
+    text = _replace(text, '                                             })'
+                    "['auth_token']\n", '\n    def _post(', slots)
+    properties = []
+    for attribute, name in attributes:
+        module = placement[name]
+        assignment = (f'            self._{attribute} = '
+                      f'{module}.{name}(self)')
+        properties.append('\n'.join([
+            '',
+            '    @property',
+            f"    def {attribute}(self) -> '{name}':",
+            f'        """Returns the {name} API."""',
+            f'        if self._{attribute} is None:',
+            f'            from omegaup.api import {module}',
+            assignment,
+            f'        return self._{attribute}',
+        ]))
+    begin = text.index('\n    @property\n')
+    return text[:begin] + '\n'.join(properties) + '\n'
+
+
+def generate(source: str, output: str) -> List[str]:
+    """Writes the package for a generated `api.py`.
+
+    Args:
+        source: The contents of the generated `api.py`.
+        output: The directory of the package.
+
+    Returns:
+        The paths of the files that were written.
+    """
+    api = _parse(source)
+    placement = _placement(api)
+    modules: DefaultDict[str, List[str]] = collections.defaultdict(list)
+    for name in api.order:
+        modules[placement[name]].append(name)
+    written = []
+    for module, members in sorted(modules.items()):
+        path = os.path.join(output, f'{module}.py')
+        with open(path, 'w') as f:
+            f.write(_render_module(api, placement, module, members))
+        written.append(path)
+    path = os.path.join(output, '__init__.py')
+    with open(path) as f:
+        text = f.read()
+    with open(path, 'w') as f:
+        f.write(_render_init(text, api, placement))
+    written.append(path)
+    return written
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('source',
+                        help='The api.py emitted by the omegaUp generator')
+    parser.add_argument('--output',
+                        default=_API_DIR,
+                        help='The directory of the omegaup.api package')
+    args = parser.parse_args()
+    with open(args.source) as f:
+        source = f.read()
+    for path in generate(source, args.output):
+        print(path)
+
+
+if __name__ == '__main__':
+    _main()